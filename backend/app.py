@@ -2,7 +2,10 @@ from backend.logging_config import setup_logging
 
 setup_logging()
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -57,8 +60,35 @@ from backend.routers import (
     users,
     zone_actions,
 )
+from backend.services import chat_ai_service, memory_index
+from backend.services.cycle_resolution_service import CycleResolutionService
+from backend.services.email_service import EmailService
+from backend.services.embedding_service import EmbeddingService
+from backend.services.external.openrouter import close_transport
+from backend.services.game_mechanics_service import refresh_dirty_metrics_periodically
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run periodic maintenance; finish in-process background work before the worker exits."""
+    metrics_refresher = None
+    if app_settings.game_metrics_refresh_interval > 0:
+        metrics_refresher = asyncio.create_task(
+            refresh_dirty_metrics_periodically(app_settings.game_metrics_refresh_interval),
+        )
+    yield
+    if metrics_refresher is not None:
+        metrics_refresher.cancel()
+    await CycleResolutionService.drain()
+    await chat_ai_service.drain()  # Replies still streaming from disconnected clients
+    await EmailService.close()  # After the jobs: their notifications are queued here
+    await memory_index.flush()
+    await EmbeddingService.close()
+    await close_transport()
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Velgarien Platform API",
     version="2.0.0",
     docs_url="/api/docs",
@@ -163,7 +193,7 @@ if _static_dir.is_dir():
             return FileResponse(file_path)
         # For crawlers: serve prerendered HTML or enriched meta tags
         if is_crawler(request.headers.get("user-agent", "")):
-            redirect_path = get_crawler_redirect(request.url.path)
+            redirect_path = await get_crawler_redirect(request.url.path)
             if redirect_path:
                 return RedirectResponse(url=redirect_path, status_code=301)
             # Check for prerendered static HTML first
@@ -10,12 +10,19 @@ class Settings(BaseSettings):
     supabase_anon_key: str = ""
     supabase_service_role_key: str = Field(default="", alias="SUPABASE_SERVICE_ROLE_KEY")
     supabase_jwt_secret: str = ""
+    db_max_concurrency: int = 32  # Worker threads for blocking supabase-py calls
+    bot_max_concurrency: int = 4  # Bots executed in parallel per epoch cycle
+    game_metrics_refresh_interval: float = 30  # Seconds between dirty game metrics drains (0 = off)
 
     # AI
     openrouter_api_key: str = ""
     replicate_api_token: str = ""
     tavily_api_key: str = ""
     forge_mock_mode: bool = False
+    llm_model_concurrency: int = 8  # In-flight OpenRouter requests per model
+    llm_rate_per_second: float = 5  # Token bucket refill rate per API key (0 = unlimited)
+    llm_burst: int = 10  # Token bucket capacity per API key
+    llm_max_attempts: int = 3  # Per request, for 429/5xx/connection failures
 
     # Translation
     translation_backend: str = "claude"  # "claude" or "deepl"
@@ -30,6 +37,12 @@ class Settings(BaseSettings):
     smtp_user: str = ""
     smtp_password: str = ""
     smtp_from: str = "metaverse.center <info@metaverse.center>"
+    smtp_security: str = "ssl"  # "ssl" (implicit TLS) | "starttls" | "none" (local sink only)
+    smtp_pool_size: int = 2  # Persistent SMTP connections (delivery workers)
+    smtp_queue_size: int = 1000  # Queued messages before submitters wait
+    smtp_rate_per_second: float = 10  # Token bucket refill rate (0 = unlimited)
+    smtp_burst: int = 20  # Token bucket capacity
+    smtp_max_attempts: int = 4  # Per message, for transient (4xx/connection) failures
 
     # Email (legacy — Resend API, deprecated)
     resend_api_key: str = ""
@@ -1,16 +1,17 @@
 import logging
-import time
 from typing import Annotated
 from uuid import UUID
 
 import jwt as pyjwt
 from fastapi import Depends, Header, HTTPException, Path, Query, status
-from jwt import PyJWKClient
-from supabase_auth.errors import AuthApiError
 
 from backend.config import settings
 from backend.models.common import CurrentUser
-from supabase import Client, create_client
+from backend.services import membership_cache
+from backend.utils import jwt_verifier
+from backend.utils.db import run_query
+from backend.utils.supabase_pool import get_admin_client, get_anon_client, get_user_client
+from supabase import Client
 
 logger = logging.getLogger(__name__)
 
@@ -27,52 +28,6 @@ ROLE_HIERARCHY: dict[str, int] = {
     "owner": 3,
 }
 
-# Cached JWKS client and TTL
-_jwks_client: PyJWKClient | None = None
-_jwks_fetched_at: float = 0
-_JWKS_TTL = 3600  # Re-fetch JWKS keys after 1 hour
-
-
-def _get_jwks_client() -> PyJWKClient:
-    """Get or create a JWKS client with TTL-based cache invalidation."""
-    global _jwks_client, _jwks_fetched_at  # noqa: PLW0603
-    now = time.monotonic()
-    if _jwks_client is None or (now - _jwks_fetched_at) >= _JWKS_TTL:
-        url = f"{settings.supabase_url}/auth/v1/.well-known/jwks.json"
-        _jwks_client = PyJWKClient(url, headers={"apikey": settings.supabase_anon_key})
-        _jwks_fetched_at = now
-        logger.info("Initialized JWKS client from %s", url)
-    return _jwks_client
-
-
-def _decode_jwt(token: str) -> dict:
-    """Decode a JWT using JWKS (ES256) or shared secret (HS256)."""
-    header = pyjwt.get_unverified_header(token)
-    alg = header.get("alg", "HS256")
-
-    if alg == "HS256":
-        return pyjwt.decode(
-            token,
-            settings.supabase_jwt_secret,
-            algorithms=["HS256"],
-            audience="authenticated",
-        )
-
-    # For ES256+, look up the signing key from JWKS
-    try:
-        jwks_client = _get_jwks_client()
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
-    except pyjwt.PyJWKClientError as e:
-        raise pyjwt.InvalidTokenError(f"No matching JWKS key found: {e}") from e
-
-    return pyjwt.decode(
-        token,
-        signing_key.key,
-        algorithms=[alg],
-        audience="authenticated",
-    )
-
-
 async def get_current_user(
     authorization: Annotated[str, Header()],
 ) -> CurrentUser:
@@ -86,7 +41,7 @@ async def get_current_user(
     token = authorization.removeprefix("Bearer ").strip()
 
     try:
-        payload = _decode_jwt(token)
+        payload = jwt_verifier.verify_token(token)
     except pyjwt.PyJWTError as e:
         logger.warning("JWT decode failed: %s", e)
         raise HTTPException(
@@ -109,35 +64,28 @@ async def get_current_user(
 async def get_supabase(
     user: CurrentUser = Depends(get_current_user),
 ) -> Client:
-    """Create a Supabase client authenticated with the user's JWT.
+    """Return a Supabase client authenticated with the user's JWT.
 
-    This ensures RLS policies are applied for the current user.
+    This ensures RLS policies are applied for the current user. The client is
+    a lightweight view over the process-wide connection pool.
     """
-    client = create_client(settings.supabase_url, settings.supabase_anon_key)
-    try:
-        client.auth.set_session(user.access_token, "")
-    except AuthApiError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Session expired or invalid.",
-        ) from e
-    return client
+    return get_user_client(user.access_token)
 
 
 async def get_anon_supabase() -> Client:
-    """Create a Supabase client with the anon key only (no JWT).
+    """Return the shared Supabase client with the anon key only (no JWT).
 
     Applies anon RLS policies — used for public read-only endpoints.
     """
-    return create_client(settings.supabase_url, settings.supabase_anon_key)
+    return get_anon_client()
 
 
 async def get_admin_supabase() -> Client:
-    """Create a Supabase client with the service role key.
+    """Return the shared Supabase client with the service role key.
 
     Use sparingly -- bypasses RLS. Only for admin operations.
     """
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+    return get_admin_client()
 
 
 def require_role(required_role: str):
@@ -159,28 +107,14 @@ def require_role(required_role: str):
         supabase: Client = Depends(get_supabase),
     ) -> str:
         """Verify the user has the required role for this simulation."""
-        response = (
-            supabase.table("simulation_members")
-            .select("member_role")
-            .eq("simulation_id", str(simulation_id))
-            .eq("user_id", str(user.id))
-            .limit(1)
-            .execute()
-        )
+        actual_role = await membership_cache.get_member_role(supabase, simulation_id, user.id)
 
-        member = (
-            response.data[0]
-            if response and response.data and isinstance(response.data, list)
-            else (response.data if response and response.data else None)
-        )
-
-        if not member:
+        if not actual_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You are not a member of this simulation.",
             )
 
-        actual_role = member["member_role"]
         required_level = ROLE_HIERARCHY.get(required_role, 0)
         actual_level = ROLE_HIERARCHY.get(actual_role, 0)
 
@@ -206,12 +140,11 @@ def require_epoch_creator():
         user: CurrentUser = Depends(get_current_user),
         supabase: Client = Depends(get_supabase),
     ) -> None:
-        response = (
+        response = await run_query(
             supabase.table("game_epochs")
             .select("created_by_id")
             .eq("id", str(epoch_id))
             .single()
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -260,34 +193,21 @@ def require_owner_or_platform_admin():
             return user, True
 
         # Otherwise must be an owner member
-        response = (
-            supabase.table("simulation_members")
-            .select("member_role")
-            .eq("simulation_id", str(simulation_id))
-            .eq("user_id", str(user.id))
-            .limit(1)
-            .execute()
-        )
+        actual_role = await membership_cache.get_member_role(supabase, simulation_id, user.id)
 
-        member = (
-            response.data[0]
-            if response and response.data and isinstance(response.data, list)
-            else (response.data if response and response.data else None)
-        )
-
-        if not member:
+        if not actual_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You are not a member of this simulation.",
             )
 
-        actual_level = ROLE_HIERARCHY.get(member["member_role"], 0)
+        actual_level = ROLE_HIERARCHY.get(actual_role, 0)
         owner_level = ROLE_HIERARCHY.get("owner", 3)
 
         if actual_level < owner_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Requires 'owner' role. You have '{member['member_role']}'.",
+                detail=f"Requires 'owner' role. You have '{actual_role}'.",
             )
 
         return user, False
@@ -308,12 +228,11 @@ def require_architect():
         if user.email in PLATFORM_ADMIN_EMAILS:
             return user
 
-        wallet_resp = (
+        wallet_resp = await run_query(
             admin_supabase.table("user_wallets")
             .select("is_architect")
             .eq("user_id", str(user.id))
             .maybe_single()
-            .execute()
         )
         if not wallet_resp.data or not wallet_resp.data.get("is_architect"):
             raise HTTPException(
@@ -338,21 +257,13 @@ def require_epoch_participant():
         user: CurrentUser = Depends(get_current_user),
         supabase: Client = Depends(get_supabase),
     ) -> dict:
-        resp = (
-            supabase.table("epoch_participants")
-            .select("id, simulation_id, user_id, current_rp")
-            .eq("epoch_id", str(epoch_id))
-            .eq("simulation_id", str(simulation_id))
-            .eq("user_id", str(user.id))
-            .limit(1)
-            .execute()
-        )
-        if not resp.data:
+        participant = await membership_cache.get_epoch_participant(supabase, epoch_id, simulation_id, user.id)
+        if not participant:
             raise HTTPException(
                 status.HTTP_403_FORBIDDEN,
                 "You are not a participant in this epoch with this simulation.",
             )
-        return resp.data[0]
+        return participant
 
     return _check
 
@@ -370,26 +281,18 @@ def require_simulation_member(role: str = "viewer", *, param_name: str = "simula
         user: CurrentUser = Depends(get_current_user),
         supabase: Client = Depends(get_supabase),
     ) -> str:
-        response = (
-            supabase.table("simulation_members")
-            .select("member_role")
-            .eq("simulation_id", str(simulation_id))
-            .eq("user_id", str(user.id))
-            .limit(1)
-            .execute()
-        )
-        member = response.data[0] if response.data else None
-        if not member:
+        actual_role = await membership_cache.get_member_role(supabase, simulation_id, user.id)
+        if not actual_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You are not a member of this simulation.",
             )
-        actual_level = ROLE_HIERARCHY.get(member["member_role"], 0)
+        actual_level = ROLE_HIERARCHY.get(actual_role, 0)
         if actual_level < required_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Requires '{role}' role in this simulation. You have '{member['member_role']}'.",
+                detail=f"Requires '{role}' role in this simulation. You have '{actual_role}'.",
             )
-        return member["member_role"]
+        return actual_role
 
     return _check_member
@@ -11,6 +11,9 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from backend.services import membership_cache
+from backend.utils import jwt_verifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +27,7 @@ class LoggingContextMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next) -> Response:
         # Prevent stale context from a previous request
         structlog.contextvars.clear_contextvars()
+        membership_cache.begin_request()
 
         request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
         user_id = self._extract_user_id(request)
@@ -49,11 +53,18 @@ class LoggingContextMiddleware(BaseHTTPMiddleware):
 
     @staticmethod
     def _extract_user_id(request: Request) -> str | None:
-        """Best-effort user_id from JWT payload. Decode only, no validation."""
+        """Best-effort user_id from JWT payload. Decode only, no validation.
+
+        Claims already verified for this token (see ``jwt_verifier``) are
+        reused, so the payload is only parsed here on a cache miss.
+        """
         auth = request.headers.get("authorization", "")
         if not auth.startswith("Bearer "):
             return None
         token = auth[7:]
+        claims = jwt_verifier.peek_claims(token)
+        if claims is not None:
+            return claims.get("sub")
         try:
             # Decode JWT payload (second segment) without verification
             payload_b64 = token.split(".")[1]
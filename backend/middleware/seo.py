@@ -4,22 +4,12 @@ from pathlib import Path
 
 from cachetools import TTLCache
 
-from backend.config import settings
 from backend.services.cache_config import get_ttl
-from supabase import Client, create_client
+from backend.utils.db import run_query
+from backend.utils.supabase_pool import get_anon_client
 
 logger = logging.getLogger(__name__)
 
-_anon_client: Client | None = None
-
-
-def _get_anon_client() -> Client:
-    """Get a cached anonymous Supabase client for SEO middleware."""
-    global _anon_client  # noqa: PLW0603
-    if _anon_client is None:
-        _anon_client = create_client(settings.supabase_url, settings.supabase_anon_key)
-    return _anon_client
-
 
 _CRAWLER_RE = re.compile(
     r"Googlebot|bingbot|Twitterbot|facebookexternalhit|LinkedInBot|Slackbot"
@@ -57,7 +47,7 @@ def is_crawler(user_agent: str) -> bool:
     return bool(_CRAWLER_RE.search(user_agent))
 
 
-def get_crawler_redirect(url_path: str) -> str | None:
+async def get_crawler_redirect(url_path: str) -> str | None:
     """If a crawler hits a UUID-based simulation URL, return the slug-based redirect URL.
 
     Returns the 301 redirect target, or None if no redirect is needed.
@@ -70,13 +60,12 @@ def get_crawler_redirect(url_path: str) -> str | None:
     view = match.group(2)
 
     try:
-        client = _get_anon_client()
-        response = (
+        client = get_anon_client()
+        response = await run_query(
             client.table("simulations")
             .select("slug")
             .eq("id", simulation_id)
             .limit(1)
-            .execute()
         )
         if response.data and response.data[0].get("slug"):
             slug = response.data[0]["slug"]
@@ -152,13 +141,13 @@ async def enrich_html_for_crawler(index_path: Path, url_path: str) -> str | None
     sim = _sim_meta_cache.get(cache_key)
     if sim is None:
         try:
-            client = _get_anon_client()
+            client = get_anon_client()
             query = client.table("simulations").select("slug,name,description,banner_url")
             if is_uuid:
                 query = query.eq("id", id_or_slug)
             else:
                 query = query.eq("slug", id_or_slug)
-            response = query.limit(1).execute()
+            response = await run_query(query.limit(1))
             if not response.data:
                 return None
             sim = response.data[0]
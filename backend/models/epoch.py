@@ -85,6 +85,33 @@ class EpochResponse(BaseModel):
     team_count: int | None = None
 
 
+class CycleResolutionStage(BaseModel):
+    """One stage of a cycle resolution job, with its timing."""
+
+    name: str
+    status: Literal["pending", "running", "succeeded", "failed", "skipped"]
+    started_at: datetime | None = None
+    duration_ms: float | None = None
+    error: str | None = None
+
+
+class CycleResolutionJobResponse(BaseModel):
+    """Background cycle resolution job (``cycle_number`` is the cycle being resolved)."""
+
+    id: UUID
+    epoch_id: UUID
+    cycle_number: int
+    status: Literal["queued", "running", "succeeded", "failed"]
+    stage: str | None = None
+    stages: list[CycleResolutionStage] = Field(default_factory=list)
+    error: str | None = None
+    attempts: int = 1
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    updated_at: datetime
+
+
 # ── Epoch Participants ───────────────────────────────────────────
 
 
@@ -181,6 +208,18 @@ class MissionResponse(BaseModel):
     agent: dict | None = None
 
 
+class ProbabilityPreviewEntry(BaseModel):
+    """Success probability of one agent against one target (nothing is deployed)."""
+
+    agent_id: UUID
+    agent_name: str | None = None
+    operative_type: str
+    target_simulation_id: UUID | None = None
+    embassy_id: UUID | None = None
+    aptitude: int
+    success_probability: float
+
+
 # ── Scores ───────────────────────────────────────────────────────
 
 
@@ -226,6 +265,7 @@ BattleLogEventType = Literal[
     "infiltration", "alliance_formed", "alliance_dissolved", "betrayal",
     "phase_change", "epoch_start", "epoch_end", "rp_allocated",
     "building_damaged", "agent_wounded", "counter_intel", "zone_fortified",
+    "fortification_expired",
 ]
 
 
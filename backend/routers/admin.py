@@ -13,12 +13,15 @@ from backend.dependencies import get_admin_supabase, require_platform_admin
 from backend.models.cleanup import CleanupExecuteRequest, CleanupPreviewRequest
 from backend.models.common import CurrentUser
 from backend.models.settings import is_sensitive_key
+from backend.services import ai_config_cache, membership_cache, public_cache
 from backend.services.admin_user_service import AdminUserService
-from backend.services.cache_config import invalidate as invalidate_cache_config
+from backend.services.cache_config import load_ttls_from_db
 from backend.services.cleanup_service import CleanupService
+from backend.services.external import openrouter
 from backend.services.platform_api_keys import invalidate as invalidate_api_key_cache
 from backend.services.platform_settings_service import PlatformSettingsService
 from backend.services.simulation_service import SimulationService
+from backend.utils import jwt_verifier, single_flight
 from backend.utils.encryption import encrypt as encrypt_value
 from supabase import Client
 
@@ -77,8 +80,9 @@ async def update_setting(
 
     data = await PlatformSettingsService.update(admin_supabase, key, value, user.id)
 
-    # Invalidate relevant caches when cache TTLs change
+    # Reload TTLs, then invalidate relevant caches when cache TTLs change
     if key.startswith("cache_"):
+        await load_ttls_from_db()
         _invalidate_caches(key)
 
     # Invalidate API key cache when sensitive keys change
@@ -88,6 +92,54 @@ async def update_setting(
     return {"success": True, "data": data}
 
 
+@router.get("/cache/membership")
+async def get_membership_cache_stats(
+    _user: CurrentUser = Depends(require_platform_admin()),
+) -> dict:
+    """Hit/miss counters for the role/participant lookup cache."""
+    return {"success": True, "data": membership_cache.get_stats()}
+
+
+@router.get("/cache/ai-config")
+async def get_ai_config_cache_stats(
+    _user: CurrentUser = Depends(require_platform_admin()),
+) -> dict:
+    """Hit/miss counters for the resolved prompt and AI settings cache."""
+    return {"success": True, "data": ai_config_cache.get_stats()}
+
+
+@router.get("/cache/auth")
+async def get_auth_cache_stats(
+    _user: CurrentUser = Depends(require_platform_admin()),
+) -> dict:
+    """Verified-claims cache and JWKS refresh counters."""
+    return {"success": True, "data": jwt_verifier.get_stats()}
+
+
+@router.get("/cache/public")
+async def get_public_cache_stats(
+    _user: CurrentUser = Depends(require_platform_admin()),
+) -> dict:
+    """Hit/miss/304 counters for the public response cache."""
+    return {"success": True, "data": public_cache.get_stats()}
+
+
+@router.get("/cache/aggregates")
+async def get_aggregate_cache_stats(
+    _user: CurrentUser = Depends(require_platform_admin()),
+) -> dict:
+    """Single-flight counters for map data, health, battle feed and gazette."""
+    return {"success": True, "data": single_flight.get_all_stats()}
+
+
+@router.get("/llm/metrics")
+async def get_llm_metrics(
+    _user: CurrentUser = Depends(require_platform_admin()),
+) -> dict:
+    """Per-model OpenRouter request, retry, token and latency counters."""
+    return {"success": True, "data": openrouter.transport_stats()}
+
+
 # --- User Management Endpoints ---
 
 
@@ -281,13 +333,16 @@ async def admin_delete_simulation(
 
 
 def _invalidate_caches(key: str) -> None:
-    """Clear relevant in-process caches when settings change."""
-    # Invalidate the global TTL config so next access reads fresh values
-    invalidate_cache_config()
-
+    """Clear relevant in-process caches when settings change (after the TTLs were reloaded)."""
     if key == "cache_map_data_ttl":
         from backend.services.echo_service import ConnectionService
-        ConnectionService._map_data_cache.clear()
+        ConnectionService._map_data_flight.clear()
     elif key == "cache_seo_metadata_ttl":
         from backend.middleware.seo import _sim_meta_cache
         _sim_meta_cache.clear()
+    elif key == "cache_membership_ttl":
+        membership_cache.clear()
+    elif key == "cache_ai_config_ttl":
+        ai_config_cache.clear()
+    elif key in ("cache_public_simulations_ttl", "cache_public_entities_ttl"):
+        public_cache.clear()
@@ -16,6 +16,7 @@ from backend.services.agent_service import AgentService
 from backend.services.audit_service import AuditService
 from backend.services.event_service import EventService
 from backend.services.translation_service import null_de_fields_for_update, schedule_auto_translation
+from backend.utils.db import run_query
 from supabase import Client
 
 router = APIRouter(
@@ -84,7 +85,9 @@ async def create_agent(
     )
     await AuditService.log_action(supabase, simulation_id, user.id, "agents", agent["id"], "create")
     # Auto-translate in background (best-effort)
-    sim = supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single().execute()
+    sim = await run_query(
+        supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single()
+    )
     if sim.data:
         schedule_auto_translation(
             supabase, "agents", agent["id"], agent,
@@ -117,7 +120,9 @@ async def update_agent(
     await AuditService.log_action(supabase, simulation_id, user.id, "agents", agent_id, "update")
     # Re-translate in background (best-effort)
     if de_nulls:
-        sim = supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single().execute()
+        sim = await run_query(
+        supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single()
+    )
         if sim.data:
             schedule_auto_translation(
                 supabase, "agents", agent["id"], agent,
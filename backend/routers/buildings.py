@@ -15,6 +15,7 @@ from backend.models.common import (
 from backend.services.audit_service import AuditService
 from backend.services.building_service import BuildingService
 from backend.services.translation_service import null_de_fields_for_update, schedule_auto_translation
+from backend.utils.db import run_query
 from supabase import Client
 
 router = APIRouter(
@@ -84,7 +85,9 @@ async def create_building(
         supabase, simulation_id, user.id, body.model_dump(exclude_none=True)
     )
     await AuditService.log_action(supabase, simulation_id, user.id, "buildings", building["id"], "create")
-    sim = supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single().execute()
+    sim = await run_query(
+        supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single()
+    )
     if sim.data:
         schedule_auto_translation(
             supabase, "buildings", building["id"], building,
@@ -115,7 +118,9 @@ async def update_building(
     )
     await AuditService.log_action(supabase, simulation_id, user.id, "buildings", building_id, "update")
     if de_nulls:
-        sim = supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single().execute()
+        sim = await run_query(
+        supabase.table("simulations").select("name, theme").eq("id", str(simulation_id)).maybe_single()
+    )
         if sim.data:
             schedule_auto_translation(
                 supabase, "buildings", building["id"], building,
@@ -1,8 +1,10 @@
 """Chat endpoints — with optional AI response generation and group chat support."""
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.sse import EventSourceResponse
 
 from backend.dependencies import get_current_user, get_supabase, require_role
 from backend.middleware.rate_limit import RATE_LIMIT_AI_CHAT, limiter
@@ -18,7 +20,9 @@ from backend.models.chat import (
 from backend.models.common import CurrentUser, SuccessResponse
 from backend.services.chat_ai_service import ChatAIService
 from backend.services.chat_service import ChatService
+from backend.services.external.openrouter import OpenRouterError
 from backend.services.external_service_resolver import ExternalServiceResolver
+from backend.utils.sse import sse_response
 from supabase import Client
 
 router = APIRouter(
@@ -124,6 +128,51 @@ async def send_message(
     return {"success": True, "data": all_messages}
 
 
+@router.post("/conversations/{conversation_id}/messages/stream", response_class=EventSourceResponse)
+@limiter.limit(RATE_LIMIT_AI_CHAT)
+async def stream_message(
+    request: Request,
+    simulation_id: UUID,
+    conversation_id: UUID,
+    body: MessageCreate,
+    user: CurrentUser = Depends(get_current_user),
+    _role_check: str = Depends(require_role("editor")),
+    supabase: Client = Depends(get_supabase),
+) -> EventSourceResponse:
+    """Send a message and stream the agents' responses as server-sent events.
+
+    Events: ``message`` (the stored user message, then each stored agent
+    response), ``delta`` (``{agent_id, content}`` as tokens arrive), and a
+    final ``done`` or ``error`` (``{status, detail}``).
+    """
+    user_message = await _service.send_message(
+        supabase, conversation_id, body.content, body.sender_role, body.metadata,
+    )
+
+    resolver = ExternalServiceResolver(supabase, simulation_id)
+    ai_config = await resolver.get_ai_provider_config()
+    chat_ai = ChatAIService(
+        supabase, simulation_id,
+        openrouter_api_key=ai_config.openrouter_api_key,
+    )
+    agents = await ChatService._load_conversation_agents(supabase, str(conversation_id))
+
+    async def events() -> AsyncIterator[tuple[str, dict]]:
+        yield "message", user_message
+        if len(agents) > 1:
+            responses = chat_ai.stream_group_response(conversation_id, body.content)
+        else:
+            responses = chat_ai.stream_response(conversation_id, body.content)
+        async for item in responses:
+            yield item
+
+    return sse_response(
+        events(),
+        failure_detail="Chat response failed. Please try again.",
+        unavailable=(OpenRouterError,),
+    )
+
+
 @router.post(
     "/conversations/{conversation_id}/agents",
     response_model=SuccessResponse[dict],
@@ -20,6 +20,7 @@ from backend.services.external.openrouter import OpenRouterError
 from backend.services.external_service_resolver import ExternalServiceResolver
 from backend.services.game_mechanics_service import GameMechanicsService
 from backend.services.generation_service import GenerationService
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -105,13 +106,12 @@ async def trigger_echo(
     than using the raw user-provided strength directly.
     """
     # Fetch the source event
-    event_resp = (
+    event_resp = await run_query(
         supabase.table("events")
         .select("*")
         .eq("id", str(body.source_event_id))
         .eq("simulation_id", str(simulation_id))
         .single()
-        .execute()
     )
     if not event_resp.data:
         raise HTTPException(
@@ -18,6 +18,7 @@ from backend.models.common import CurrentUser, PaginatedResponse, PaginationMeta
 from backend.models.epoch import (
     BattleLogEntry,
     BattleSummaryResponse,
+    CycleResolutionJobResponse,
     EpochCreate,
     EpochResponse,
     EpochUpdate,
@@ -31,6 +32,7 @@ from backend.models.epoch_chat import ReadySignal
 from backend.services.audit_service import AuditService
 from backend.services.battle_log_service import BattleLogService
 from backend.services.cycle_notification_service import CycleNotificationService
+from backend.services.cycle_resolution_service import CycleResolutionService
 from backend.services.epoch_chat_service import EpochChatService
 from backend.services.epoch_service import EpochService
 from backend.services.game_instance_service import GameInstanceService
@@ -297,7 +299,11 @@ async def get_battle_log(
     }
 
 
-@router.post("/{epoch_id}/resolve-cycle", response_model=SuccessResponse[EpochResponse])
+@router.post(
+    "/{epoch_id}/resolve-cycle",
+    response_model=SuccessResponse[CycleResolutionJobResponse],
+    status_code=202,
+)
 async def resolve_cycle(
     epoch_id: UUID,
     user: CurrentUser = Depends(get_current_user),
@@ -305,13 +311,34 @@ async def resolve_cycle(
     supabase: Client = Depends(get_supabase),
     admin_supabase: Client = Depends(get_admin_supabase),
 ) -> dict:
-    """Resolve the current cycle (allocate RP, execute bot turns, advance cycle counter). Creator only."""
-    data = await EpochService.resolve_cycle_full(supabase, epoch_id, admin_supabase)
+    """Start resolving the current cycle in the background. Creator only.
 
-    await AuditService.safe_log(
-        supabase, None, user.id, "game_epochs", epoch_id, "update",
-        details={"action": "resolve_cycle", "cycle": data.get("current_cycle")},
-    )
+    Returns the resolution job at once; poll
+    ``GET /{epoch_id}/cycles/{cycle_number}/resolution`` for progress.
+    Triggering a cycle that is already being resolved returns its job.
+    """
+    job = await CycleResolutionService.start(supabase, epoch_id, admin_supabase)
+
+    if job.get("claimed"):
+        await AuditService.safe_log(
+            supabase, None, user.id, "game_epochs", epoch_id, "update",
+            details={"action": "resolve_cycle", "cycle": job["cycle_number"] + 1, "job_id": job["id"]},
+        )
+    return {"success": True, "data": job}
+
+
+@router.get(
+    "/{epoch_id}/cycles/{cycle_number}/resolution",
+    response_model=SuccessResponse[CycleResolutionJobResponse],
+)
+async def get_cycle_resolution(
+    epoch_id: UUID,
+    cycle_number: int,
+    user: CurrentUser = Depends(get_current_user),
+    admin_supabase: Client = Depends(get_admin_supabase),
+) -> dict:
+    """Status, current stage and stage timings of a cycle's resolution job."""
+    data = await CycleResolutionService.get_job(admin_supabase, epoch_id, cycle_number)
     return {"success": True, "data": data}
 
 
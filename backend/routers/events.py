@@ -26,6 +26,7 @@ from backend.services.audit_service import AuditService
 from backend.services.event_service import EventService
 from backend.services.external_service_resolver import ExternalServiceResolver
 from backend.services.generation_service import GenerationService
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -356,12 +357,11 @@ async def get_event_zone_links(
     supabase: Client = Depends(get_supabase),
 ) -> dict:
     """Get zone links for an event (auto-assigned + manual)."""
-    response = (
+    response = await run_query(
         supabase.table("event_zone_links")
         .select("*, zones(name, zone_type)")
         .eq("event_id", str(event_id))
         .order("affinity_weight", desc=True)
-        .execute()
     )
     # Flatten zone name/type into link objects
     links = []
@@ -162,10 +162,10 @@ async def refresh_metrics(
     _role_check: str = Depends(require_role("admin")),
     admin_supabase: Client = Depends(get_admin_supabase),
 ) -> dict:
-    """Trigger a full refresh of all game mechanics materialized views.
+    """Recompute the game metrics of one simulation.
 
-    Admin-only — materialized views normally refresh via triggers,
-    but this allows a manual refresh if needed.
+    Admin-only — metrics are normally refreshed by the services that
+    change their inputs, but this allows a manual refresh if needed.
     """
-    await GameMechanicsService.refresh_metrics(admin_supabase)
+    await GameMechanicsService.refresh_metrics(admin_supabase, [simulation_id])
     return {"success": True, "data": {"message": "Game metrics refresh triggered."}}
@@ -4,6 +4,7 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.sse import EventSourceResponse
 from pydantic import BaseModel, Field
 
 from backend.dependencies import get_current_user, get_supabase, require_role
@@ -14,6 +15,8 @@ from backend.services.external_service_resolver import ExternalServiceResolver
 from backend.services.game_mechanics_service import GameMechanicsService
 from backend.services.generation_service import GenerationService
 from backend.services.image_service import ImageService
+from backend.utils.db import run_query
+from backend.utils.sse import sse_response
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -247,6 +250,88 @@ async def generate_event(
         ) from e
 
 
+# --- Streaming variants (server-sent events) ---
+#
+# Same inputs as the endpoints above. Events: ``delta`` ({content}) as tokens
+# arrive, ``result`` (the usual response data), then ``done`` or ``error``
+# ({status, detail}).
+
+
+@router.post("/agent/stream", response_class=EventSourceResponse)
+@limiter.limit(RATE_LIMIT_AI_GENERATION)
+async def stream_agent(
+    request: Request,
+    simulation_id: UUID,
+    body: GenerateAgentRequest,
+    user: CurrentUser = Depends(get_current_user),
+    _role_check: str = Depends(require_role("editor")),
+    supabase: Client = Depends(get_supabase),
+) -> EventSourceResponse:
+    """Generate an agent description using AI, streaming the output."""
+    service = await _get_generation_service(simulation_id, supabase)
+    return sse_response(
+        service.stream(lambda: service.generate_agent_full(
+            agent_name=body.name,
+            agent_system=body.system,
+            agent_gender=body.gender,
+            locale=body.locale,
+        )),
+        failure_detail="Agent generation failed. Please try again.",
+        unavailable=(OpenRouterError,),
+    )
+
+
+@router.post("/building/stream", response_class=EventSourceResponse)
+@limiter.limit(RATE_LIMIT_AI_GENERATION)
+async def stream_building(
+    request: Request,
+    simulation_id: UUID,
+    body: GenerateBuildingRequest,
+    user: CurrentUser = Depends(get_current_user),
+    _role_check: str = Depends(require_role("editor")),
+    supabase: Client = Depends(get_supabase),
+) -> EventSourceResponse:
+    """Generate a building description using AI, streaming the output."""
+    service = await _get_generation_service(simulation_id, supabase)
+    return sse_response(
+        service.stream(lambda: service.generate_building(
+            building_type=body.building_type,
+            building_name=body.name,
+            building_style=body.style,
+            building_condition=body.condition,
+            locale=body.locale,
+        )),
+        failure_detail="Building generation failed. Please try again.",
+        unavailable=(OpenRouterError,),
+    )
+
+
+@router.post("/event/stream", response_class=EventSourceResponse)
+@limiter.limit(RATE_LIMIT_AI_GENERATION)
+async def stream_event(
+    request: Request,
+    simulation_id: UUID,
+    body: GenerateEventRequest,
+    user: CurrentUser = Depends(get_current_user),
+    _role_check: str = Depends(require_role("editor")),
+    supabase: Client = Depends(get_supabase),
+) -> EventSourceResponse:
+    """Generate an event description using AI, streaming the output."""
+    service = await _get_generation_service(simulation_id, supabase)
+    game_context = await GameMechanicsService.build_generation_context(
+        supabase, simulation_id,
+    )
+    return sse_response(
+        service.stream(lambda: service.generate_event(
+            event_type=body.event_type,
+            locale=body.locale,
+            game_context=game_context,
+        )),
+        failure_detail="Event generation failed. Please try again.",
+        unavailable=(OpenRouterError,),
+    )
+
+
 @router.post("/relationships", response_model=SuccessResponse[list])
 @limiter.limit(RATE_LIMIT_AI_GENERATION)
 async def generate_relationships(
@@ -260,13 +345,12 @@ async def generate_relationships(
     """Generate relationship suggestions for an agent using AI."""
     try:
         # Get agent data
-        agent_resp = (
+        agent_resp = await run_query(
             supabase.table("agents")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(body.agent_id))
             .single()
-            .execute()
         )
         if not agent_resp.data:
             raise HTTPException(
@@ -275,14 +359,13 @@ async def generate_relationships(
             )
 
         # Get other agents in the simulation
-        others_resp = (
+        others_resp = await run_query(
             supabase.table("agents")
             .select("id, name, system, character, background")
             .eq("simulation_id", str(simulation_id))
             .neq("id", str(body.agent_id))
             .is_("deleted_at", "null")
             .limit(20)
-            .execute()
         )
 
         service = await _get_generation_service(simulation_id, supabase)
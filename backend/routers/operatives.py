@@ -13,7 +13,7 @@ from backend.dependencies import (
     require_epoch_participant,
 )
 from backend.models.common import CurrentUser, PaginatedResponse, PaginationMeta, SuccessResponse
-from backend.models.epoch import MissionResponse, OperativeDeploy
+from backend.models.epoch import MissionResponse, OperativeDeploy, OperativeType, ProbabilityPreviewEntry
 from backend.services.audit_service import AuditService
 from backend.services.battle_log_service import BattleLogService
 from backend.services.epoch_service import EpochService
@@ -86,6 +86,23 @@ async def list_threats(
     return {"success": True, "data": data}
 
 
+@router.get("/preview", response_model=SuccessResponse[list[ProbabilityPreviewEntry]])
+async def preview_probabilities(
+    epoch_id: UUID,
+    simulation_id: UUID = Query(..., description="Your simulation ID"),
+    operative_type: OperativeType = Query(...),
+    target_simulation_id: list[UUID] | None = Query(default=None, description="Limit to these targets"),
+    user: CurrentUser = Depends(get_current_user),
+    _participant: dict = Depends(require_epoch_participant()),
+    supabase: Client = Depends(get_supabase),
+) -> dict:
+    """Success probability for each of your agents against each target. Nothing is deployed."""
+    data = await OperativeService.preview_probabilities(
+        supabase, epoch_id, simulation_id, operative_type, target_simulation_id,
+    )
+    return {"success": True, "data": data}
+
+
 # ── Resolve ─────────────────────────────────────────────
 
 
@@ -103,8 +120,8 @@ async def resolve_missions(
     # Log results to battle log
     epoch = await EpochService.get(supabase, epoch_id)
     cycle = epoch.get("current_cycle", 1)
+    await BattleLogService.log_mission_results(supabase, epoch_id, cycle, results)
     for mission in results:
-        await BattleLogService.log_mission_result(supabase, epoch_id, cycle, mission)
         try:
             await AuditService.log_action(
                 supabase, None, user.id, "operative_missions", mission.get("id"), "update",
@@ -3,6 +3,8 @@
 Serves anonymous users via anon RLS policies.
 Only GET endpoints for active simulation data.
 Delegates to existing service layer where possible (keeps query logic in sync).
+Simulation, agent, building, event and lore reads are served through
+``public_cache`` (server-side TTL cache + ETag/304 + request coalescing).
 """
 
 from uuid import UUID
@@ -12,28 +14,30 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response,
 from backend.dependencies import get_anon_supabase
 from backend.middleware.rate_limit import RATE_LIMIT_STANDARD, limiter
 from backend.models.common import PaginatedResponse, PaginationMeta, SuccessResponse
-from backend.services.agent_service import AgentService
-from backend.services.bleed_gazette_service import BleedGazetteService
+from backend.services import public_cache
 from backend.services.agent_memory_service import AgentMemoryService
-from backend.services.chronicle_service import ChronicleService
+from backend.services.agent_service import AgentService
 from backend.services.aptitude_service import AptitudeService
 from backend.services.battle_log_service import BattleLogService
+from backend.services.bleed_gazette_service import BleedGazetteService
 from backend.services.building_service import BuildingService
 from backend.services.cache_config import get_ttl
 from backend.services.campaign_service import CampaignService
+from backend.services.chronicle_service import ChronicleService
 from backend.services.echo_service import ConnectionService, EchoService
 from backend.services.embassy_service import EmbassyService
 from backend.services.epoch_invitation_service import EpochInvitationService
 from backend.services.epoch_service import EpochService
 from backend.services.event_service import EventService
-from backend.services.resonance_service import ResonanceService
 from backend.services.game_mechanics_service import GameMechanicsService
 from backend.services.location_service import LocationService
 from backend.services.relationship_service import RelationshipService
+from backend.services.resonance_service import ResonanceService
 from backend.services.scoring_service import ScoringService
 from backend.services.settings_service import SettingsService
 from backend.services.social_media_service import SocialMediaService
 from backend.services.social_trends_service import SocialTrendsService
+from backend.utils.db import run_query
 from supabase import Client
 
 router = APIRouter(prefix="/api/v1/public", tags=["Public"])
@@ -56,16 +60,15 @@ def _paginated(data: list[dict], total: int, limit: int, offset: int) -> dict:
 # ── Simulations ──────────────────────────────────────────────────────────
 
 
-def _enrich_with_counts(supabase: Client, simulations: list[dict]) -> None:
+async def _enrich_with_counts(supabase: Client, simulations: list[dict]) -> None:
     """Enrich simulation dicts with counts from the simulation_dashboard view."""
     if not simulations:
         return
     ids = [s["id"] for s in simulations]
-    count_response = (
+    count_response = await run_query(
         supabase.table("simulation_dashboard")
         .select("simulation_id, agent_count, building_count, event_count, member_count")
         .in_("simulation_id", ids)
-        .execute()
     )
     counts_map = {row["simulation_id"]: row for row in (count_response.data or [])}
     for sim in simulations:
@@ -78,6 +81,7 @@ def _enrich_with_counts(supabase: Client, simulations: list[dict]) -> None:
 
 @router.get("/simulations", response_model=PaginatedResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_simulations_ttl", index=True)
 async def list_simulations(
     request: Request,
     http_response: Response,
@@ -88,64 +92,63 @@ async def list_simulations(
     """List all active template simulations (public). Excludes game instances."""
     max_age = get_ttl("cache_http_simulations_max_age")
     http_response.headers["Cache-Control"] = f"public, max-age={max_age}, stale-while-revalidate={max_age * 5}"
-    response = (
+    response = await run_query(
         supabase.table("simulations")
         .select("*", count="exact")
         .eq("status", "active")
         .eq("simulation_type", "template")
         .order("created_at", desc=True)
         .range(offset, offset + limit - 1)
-        .execute()
     )
     data = response.data or []
     total = response.count if response.count is not None else len(data)
-    _enrich_with_counts(supabase, data)
+    await _enrich_with_counts(supabase, data)
     return _paginated(data, total, limit, offset)
 
 
 @router.get("/simulations/by-slug/{slug}", response_model=SuccessResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_simulations_ttl", index=True)
 async def get_simulation_by_slug(
     request: Request,
     slug: str,
     supabase: Client = Depends(get_anon_supabase),
 ) -> dict:
     """Get a single active simulation by its slug (public)."""
-    response = (
+    response = await run_query(
         supabase.table("simulations")
         .select("*")
         .eq("slug", slug)
         .eq("status", "active")
         .limit(1)
-        .execute()
     )
     if not response.data:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Simulation not found.")
     data = response.data
-    _enrich_with_counts(supabase, data)
+    await _enrich_with_counts(supabase, data)
     return {"success": True, "data": data[0]}
 
 
 @router.get("/simulations/{simulation_id}", response_model=SuccessResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_simulations_ttl")
 async def get_simulation(
     request: Request,
     simulation_id: UUID,
     supabase: Client = Depends(get_anon_supabase),
 ) -> dict:
     """Get a single active simulation (public)."""
-    response = (
+    response = await run_query(
         supabase.table("simulations")
         .select("*")
         .eq("id", str(simulation_id))
         .eq("status", "active")
         .limit(1)
-        .execute()
     )
     if not response.data:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Simulation not found.")
     data = response.data
-    _enrich_with_counts(supabase, data)
+    await _enrich_with_counts(supabase, data)
     return {"success": True, "data": data[0]}
 
 
@@ -154,6 +157,7 @@ async def get_simulation(
 
 @router.get("/simulations/{simulation_id}/agents", response_model=PaginatedResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_entities_ttl")
 async def list_agents(
     request: Request,
     simulation_id: UUID,
@@ -171,6 +175,7 @@ async def list_agents(
 
 @router.get("/simulations/{simulation_id}/agents/{agent_id}", response_model=SuccessResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_entities_ttl")
 async def get_agent(
     request: Request,
     simulation_id: UUID,
@@ -187,6 +192,7 @@ async def get_agent(
 
 @router.get("/simulations/{simulation_id}/buildings", response_model=PaginatedResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_entities_ttl")
 async def list_buildings(
     request: Request,
     simulation_id: UUID,
@@ -204,6 +210,7 @@ async def list_buildings(
 
 @router.get("/simulations/{simulation_id}/buildings/{building_id}", response_model=SuccessResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_entities_ttl")
 async def get_building(
     request: Request,
     simulation_id: UUID,
@@ -220,6 +227,7 @@ async def get_building(
 
 @router.get("/simulations/{simulation_id}/events", response_model=PaginatedResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_entities_ttl")
 async def list_events(
     request: Request,
     simulation_id: UUID,
@@ -237,6 +245,7 @@ async def list_events(
 
 @router.get("/simulations/{simulation_id}/events/{event_id}", response_model=SuccessResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_entities_ttl")
 async def get_event(
     request: Request,
     simulation_id: UUID,
@@ -253,18 +262,18 @@ async def get_event(
 
 @router.get("/simulations/{simulation_id}/lore", response_model=SuccessResponse)
 @limiter.limit(RATE_LIMIT_PUBLIC)
+@public_cache.cached("cache_public_entities_ttl")
 async def list_simulation_lore(
     request: Request,
     simulation_id: UUID,
     supabase: Client = Depends(get_anon_supabase),
 ) -> dict:
     """Get lore sections for a simulation (public)."""
-    resp = (
+    resp = await run_query(
         supabase.table("simulation_lore")
         .select("*")
         .eq("simulation_id", str(simulation_id))
         .order("sort_order")
-        .execute()
     )
     return {"success": True, "data": resp.data or []}
 
@@ -405,12 +414,11 @@ async def list_conversations(
     supabase: Client = Depends(get_anon_supabase),
 ) -> dict:
     """List chat conversations (public, read-only)."""
-    response = (
+    response = await run_query(
         supabase.table("chat_conversations")
         .select("*")
         .eq("simulation_id", str(simulation_id))
         .order("last_message_at", desc=True)
-        .execute()
     )
     return {"success": True, "data": response.data or []}
 
@@ -429,13 +437,12 @@ async def list_messages(
     offset: int = Query(default=0, ge=0),
 ) -> dict:
     """List messages in a conversation (public, read-only)."""
-    response = (
+    response = await run_query(
         supabase.table("chat_messages")
         .select("*", count="exact")
         .eq("conversation_id", str(conversation_id))
         .order("created_at", desc=False)
         .range(offset, offset + limit - 1)
-        .execute()
     )
     data = response.data or []
     total = response.count if response.count is not None else len(data)
@@ -466,7 +473,7 @@ async def list_taxonomies(
     )
     if taxonomy_type:
         query = query.eq("taxonomy_type", taxonomy_type)
-    response = query.execute()
+    response = await run_query(query)
     data = response.data or []
     total = response.count if response.count is not None else len(data)
     return _paginated(data, total, limit, offset)
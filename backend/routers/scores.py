@@ -5,7 +5,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 
-from backend.dependencies import get_current_user, get_supabase, require_epoch_creator
+from backend.dependencies import get_admin_supabase, get_current_user, get_supabase, require_epoch_creator
 from backend.models.common import CurrentUser, SuccessResponse
 from backend.models.epoch import LeaderboardEntry, ScoreResponse
 from backend.services.audit_service import AuditService
@@ -70,6 +70,7 @@ async def compute_scores(
     user: CurrentUser = Depends(get_current_user),
     _creator_check: None = Depends(require_epoch_creator()),
     supabase: Client = Depends(get_supabase),
+    admin_supabase: Client = Depends(get_admin_supabase),
     cycle: int | None = Query(default=None, description="Cycle number (default: current)"),
 ) -> dict:
     """Compute and store scores for the current or specified cycle. Creator only."""
@@ -77,7 +78,7 @@ async def compute_scores(
 
     epoch = await EpochService.get(supabase, epoch_id)
     cycle_number = cycle or epoch.get("current_cycle", 1)
-    data = await ScoringService.compute_cycle_scores(supabase, epoch_id, cycle_number)
+    data = await ScoringService.compute_cycle_scores(supabase, epoch_id, cycle_number, replay_db=admin_supabase)
     try:
         await AuditService.log_action(
             supabase, None, user.id, "epoch_scores", None, "create",
@@ -6,6 +6,7 @@ from fastapi.responses import PlainTextResponse
 
 from backend.config import settings
 from backend.dependencies import get_anon_supabase
+from backend.utils.db import run_query
 from supabase import Client
 
 router = APIRouter(tags=["seo"])
@@ -36,7 +37,7 @@ async def robots_txt() -> PlainTextResponse:
 
 @router.get("/sitemap.xml")
 async def sitemap_xml(supabase: Client = Depends(get_anon_supabase)) -> Response:
-    response = supabase.table("simulations").select("slug,updated_at").eq("status", "active").execute()
+    response = await run_query(supabase.table("simulations").select("slug,updated_at").eq("status", "active"))
     simulations = response.data or []
 
     urlset = Element("urlset")
@@ -5,6 +5,7 @@ from backend.models.common import CurrentUser, SuccessResponse
 from backend.models.notification import NotificationPreferencesResponse, NotificationPreferencesUpdate
 from backend.models.user import MembershipInfo, UserWithMemberships
 from backend.services.member_service import MemberService
+from backend.utils.db import run_query
 from supabase import Client
 
 router = APIRouter(prefix="/api/v1/users", tags=["users"])
@@ -51,12 +52,11 @@ async def get_notification_preferences(
 
     Returns defaults if no preferences have been saved yet.
     """
-    resp = (
+    resp = await run_query(
         supabase.table("notification_preferences")
         .select("cycle_resolved, phase_changed, epoch_completed, email_locale")
         .eq("user_id", str(user.id))
         .maybe_single()
-        .execute()
     )
 
     if resp.data:
@@ -91,10 +91,9 @@ async def update_notification_preferences(
         "email_locale": body.email_locale,
     }
 
-    resp = (
+    resp = await run_query(
         supabase.table("notification_preferences")
         .upsert(data, on_conflict="user_id")
-        .execute()
     )
 
     result = resp.data[0] if resp.data else data
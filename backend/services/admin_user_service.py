@@ -14,6 +14,8 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services import membership_cache
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -31,10 +33,10 @@ class AdminUserService:
         per_page: int = 50,
     ) -> dict:
         """List all auth users with pagination via RPC."""
-        response = admin_supabase.rpc(
+        response = await run_query(admin_supabase.rpc(
             "admin_list_users",
             {"p_page": page, "p_per_page": per_page},
-        ).execute()
+        ))
         return response.data or {"users": [], "total": 0}
 
     @classmethod
@@ -45,10 +47,10 @@ class AdminUserService:
     ) -> dict:
         """Get a single user with all their simulation memberships."""
         # Fetch user via RPC
-        user_resp = admin_supabase.rpc(
+        user_resp = await run_query(admin_supabase.rpc(
             "admin_get_user",
             {"p_user_id": str(user_id)},
-        ).execute()
+        ))
 
         if not user_resp.data:
             raise HTTPException(
@@ -59,22 +61,20 @@ class AdminUserService:
         user_data = user_resp.data
 
         # Fetch memberships via PostgREST
-        memberships_resp = (
+        memberships_resp = await run_query(
             admin_supabase.table("simulation_members")
             .select("*, simulations(id, name, slug)")
             .eq("user_id", str(user_id))
-            .execute()
         )
 
         user_data["memberships"] = memberships_resp.data or []
 
         # Fetch wallet
-        wallet_resp = (
+        wallet_resp = await run_query(
             admin_supabase.table("user_wallets")
             .select("*")
             .eq("user_id", str(user_id))
             .single()
-            .execute()
         )
         user_data["wallet"] = wallet_resp.data if wallet_resp.data else None
 
@@ -98,14 +98,13 @@ class AdminUserService:
         if not update_data:
             raise HTTPException(status_code=400, detail="No update data provided.")
 
-        response = (
+        response = await run_query(
             admin_supabase.table("user_wallets")
             .upsert({
                 "user_id": str(user_id),
                 **update_data,
                 "updated_at": datetime.now(UTC).isoformat(),
             })
-            .execute()
         )
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to update wallet.")
@@ -115,10 +114,10 @@ class AdminUserService:
     async def delete_user(cls, admin_supabase: Client, user_id: UUID) -> None:
         """Delete a user via RPC (cascades membership via FK)."""
         try:
-            admin_supabase.rpc(
+            await run_query(admin_supabase.rpc(
                 "admin_delete_user",
                 {"p_user_id": str(user_id)},
-            ).execute()
+            ))
         except Exception as e:
             logger.warning("User deletion failed", extra={"user_id": str(user_id)}, exc_info=True)
             raise HTTPException(
@@ -135,14 +134,13 @@ class AdminUserService:
         role: str,
     ) -> dict:
         """Add a user to a simulation with a specific role."""
-        response = (
+        response = await run_query(
             admin_supabase.table("simulation_members")
             .insert({
                 "user_id": str(user_id),
                 "simulation_id": str(simulation_id),
                 "member_role": role,
             })
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -160,7 +158,7 @@ class AdminUserService:
         role: str,
     ) -> dict:
         """Change a user's role in a simulation."""
-        response = (
+        response = await run_query(
             admin_supabase.table("simulation_members")
             .update({
                 "member_role": role,
@@ -168,13 +166,13 @@ class AdminUserService:
             })
             .eq("user_id", str(user_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Membership not found.",
             )
+        membership_cache.invalidate_member(simulation_id, user_id)
         return response.data[0]
 
     @classmethod
@@ -185,16 +183,16 @@ class AdminUserService:
         simulation_id: UUID,
     ) -> dict:
         """Remove a user from a simulation."""
-        response = (
+        response = await run_query(
             admin_supabase.table("simulation_members")
             .delete()
             .eq("user_id", str(user_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Membership not found.",
             )
+        membership_cache.invalidate_member(simulation_id, user_id)
         return response.data[0]
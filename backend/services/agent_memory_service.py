@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from uuid import UUID
 
 from backend.config import settings
+from backend.services import memory_index
 from backend.services.embedding_service import EmbeddingService
 from backend.services.generation_service import GenerationService
 from backend.services.translation_service import schedule_auto_translation
-from supabase import Client, create_client
+from backend.utils.db import run_query
+from backend.utils.supabase_pool import get_admin_client
+from supabase import Client
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +28,8 @@ MOCK_REFLECTIONS = [
 
 
 def _admin_client() -> Client:
-    """Create a service-role Supabase client for memory writes."""
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+    """Shared service-role Supabase client for memory writes."""
+    return get_admin_client()
 
 
 class AgentMemoryService:
@@ -47,39 +51,73 @@ class AgentMemoryService:
         api_key: str | None = None,
     ) -> dict:
         """Store a memory with its embedding vector."""
-        embedding = await EmbeddingService.embed(content, api_key=api_key)
-
-        record = {
-            "agent_id": str(agent_id),
-            "simulation_id": str(simulation_id),
-            "memory_type": memory_type,
-            "content": content,
-            "importance": max(1, min(10, importance)),
-            "source_type": source_type,
-            "source_id": str(source_id) if source_id else None,
-            "embedding": str(embedding),
-        }
-        resp = supabase.table("agent_memories").insert(record).execute()
-        saved = resp.data[0]
+        saved = await cls.record_observations(
+            supabase, agent_id, simulation_id,
+            [{"content": content, "importance": importance}],
+            source_type=source_type, source_id=source_id,
+            memory_type=memory_type, api_key=api_key,
+        )
+        return saved[0]
+
+    @classmethod
+    async def record_observations(
+        cls,
+        supabase: Client,
+        agent_id: UUID,
+        simulation_id: UUID,
+        items: list[dict],
+        source_type: str = "chat",
+        source_id: UUID | None = None,
+        memory_type: str = "observation",
+        default_importance: int = 5,
+        api_key: str | None = None,
+    ) -> list[dict]:
+        """Store several memories ({content, importance}) with one embedding batch and one insert.
+
+        Items without content are skipped.
+        """
+        items = [item for item in items if item.get("content")]
+        if not items:
+            return []
+
+        embeddings = await EmbeddingService.embed_many([item["content"] for item in items], api_key=api_key)
+
+        records = [
+            {
+                "agent_id": str(agent_id),
+                "simulation_id": str(simulation_id),
+                "memory_type": memory_type,
+                "content": item["content"],
+                "importance": max(1, min(10, item.get("importance", default_importance))),
+                "source_type": source_type,
+                "source_id": str(source_id) if source_id else None,
+                "embedding": str(embedding),
+            }
+            for item, embedding in zip(items, embeddings, strict=True)
+        ]
+        resp = await run_query(supabase.table("agent_memories").insert(records))
+        saved = resp.data or []
+        if len(saved) == len(embeddings):
+            memory_index.add_memories(simulation_id, agent_id, saved, embeddings)
 
         # Get simulation info for translation
-        sim_resp = (
+        sim_resp = await run_query(
             supabase.table("simulations")
             .select("name, theme")
             .eq("id", str(simulation_id))
             .limit(1)
-            .execute()
         )
         if sim_resp.data:
-            schedule_auto_translation(
-                supabase,
-                "agent_memories",
-                saved["id"],
-                {"content": content},
-                sim_resp.data[0]["name"],
-                sim_resp.data[0].get("theme", "dystopian"),
-                entity_type="agent_memory",
-            )
+            for row in saved:
+                schedule_auto_translation(
+                    supabase,
+                    "agent_memories",
+                    row["id"],
+                    {"content": row["content"]},
+                    sim_resp.data[0]["name"],
+                    sim_resp.data[0].get("theme", "dystopian"),
+                    entity_type="agent_memory",
+                )
 
         return saved
 
@@ -103,33 +141,26 @@ class AgentMemoryService:
 
         if settings.forge_mock_mode:
             logger.info("MOCK_MODE: returning template observations")
-            saved = []
-            for obs in MOCK_OBSERVATIONS:
-                record = await cls.record_observation(
-                    admin, agent_id, simulation_id,
-                    obs["content"], obs["importance"],
-                    source_type="chat", api_key=api_key,
-                )
-                saved.append(record)
-            return saved
+            return await cls.record_observations(
+                admin, agent_id, simulation_id, MOCK_OBSERVATIONS,
+                source_type="chat", api_key=api_key,
+            )
 
         # Get simulation name (reads are fine with any client)
-        sim_resp = (
+        sim_resp = await run_query(
             supabase.table("simulations")
             .select("name")
             .eq("id", str(simulation_id))
             .limit(1)
-            .execute()
         )
         sim_name = sim_resp.data[0]["name"] if sim_resp.data else "Unknown"
 
         # Get agent name
-        agent_resp = (
+        agent_resp = await run_query(
             supabase.table("agents")
             .select("name")
             .eq("id", str(agent_id))
             .limit(1)
-            .execute()
         )
         agent_name = agent_resp.data[0]["name"] if agent_resp.data else "Agent"
 
@@ -149,20 +180,10 @@ class AgentMemoryService:
         parsed = GenerationService._parse_json_content(result.get("content", ""))
         observations = parsed.get("observations", []) if parsed else []
 
-        saved = []
-        for obs in observations:
-            if not obs.get("content"):
-                continue
-            record = await cls.record_observation(
-                admin, agent_id, simulation_id,
-                obs["content"],
-                obs.get("importance", 5),
-                source_type="chat",
-                api_key=api_key,
-            )
-            saved.append(record)
-
-        return saved
+        return await cls.record_observations(
+            admin, agent_id, simulation_id, observations,
+            source_type="chat", api_key=api_key,
+        )
 
     # ── Retrieve (Stanford formula) ──────────────────────────────────
 
@@ -176,28 +197,23 @@ class AgentMemoryService:
         top_k: int = 10,
         api_key: str | None = None,
     ) -> list[dict]:
-        """Retrieve memories ranked by semantic similarity + importance + recency."""
+        """Retrieve memories ranked by semantic similarity + importance + recency.
+
+        Scores the agent's warm in-process index (``memory_index``); the
+        ``last_accessed_at`` update is written behind.
+        """
         embedding = None
         if query_text:
-            embedding = await EmbeddingService.embed(query_text, api_key=api_key)
-
-        params: dict = {
-            "p_agent_id": str(agent_id),
-            "p_top_k": top_k,
-        }
-        if embedding:
-            params["p_query_embedding"] = str(embedding)
-
-        response = supabase.rpc("retrieve_agent_memories", params).execute()
-        memories = response.data or []
+            embedding, index = await asyncio.gather(
+                EmbeddingService.embed(query_text, api_key=api_key),
+                memory_index.get_index(supabase, simulation_id, agent_id),
+            )
+        else:
+            index = await memory_index.get_index(supabase, simulation_id, agent_id)
 
-        # Update last_accessed_at for retrieved memories
-        if memories:
-            memory_ids = [m["id"] for m in memories]
-            supabase.table("agent_memories").update(
-                {"last_accessed_at": "now()"}
-            ).in_("id", memory_ids).execute()
+        memories = index.search(embedding, top_k)
 
+        memory_index.touch([m["id"] for m in memories])
         return memories
 
     # ── Reflect ──────────────────────────────────────────────────────
@@ -213,7 +229,7 @@ class AgentMemoryService:
     ) -> list[dict]:
         """Synthesize higher-level reflections from recent observations."""
         # Fetch recent observations
-        obs_resp = (
+        obs_resp = await run_query(
             supabase.table("agent_memories")
             .select("content, importance, created_at")
             .eq("agent_id", str(agent_id))
@@ -221,7 +237,6 @@ class AgentMemoryService:
             .eq("memory_type", "observation")
             .order("created_at", desc=True)
             .limit(20)
-            .execute()
         )
         observations = obs_resp.data or []
 
@@ -230,33 +245,26 @@ class AgentMemoryService:
 
         if settings.forge_mock_mode:
             logger.info("MOCK_MODE: returning template reflections")
-            saved = []
-            for ref in MOCK_REFLECTIONS:
-                record = await cls.record_observation(
-                    supabase, agent_id, simulation_id,
-                    ref["content"], ref["importance"],
-                    source_type="reflection", memory_type="reflection",
-                    api_key=api_key,
-                )
-                saved.append(record)
-            return saved
+            return await cls.record_observations(
+                supabase, agent_id, simulation_id, MOCK_REFLECTIONS,
+                source_type="reflection", memory_type="reflection",
+                api_key=api_key,
+            )
 
         # Get names
-        sim_resp = (
+        sim_resp = await run_query(
             supabase.table("simulations")
             .select("name")
             .eq("id", str(simulation_id))
             .limit(1)
-            .execute()
         )
         sim_name = sim_resp.data[0]["name"] if sim_resp.data else "Unknown"
 
-        agent_resp = (
+        agent_resp = await run_query(
             supabase.table("agents")
             .select("name")
             .eq("id", str(agent_id))
             .limit(1)
-            .execute()
         )
         agent_name = agent_resp.data[0]["name"] if agent_resp.data else "Agent"
 
@@ -280,21 +288,11 @@ class AgentMemoryService:
         parsed = GenerationService._parse_json_content(result.get("content", ""))
         reflections = parsed.get("reflections", []) if parsed else []
 
-        saved = []
-        for ref in reflections:
-            if not ref.get("content"):
-                continue
-            record = await cls.record_observation(
-                supabase, agent_id, simulation_id,
-                ref["content"],
-                ref.get("importance", 7),
-                source_type="reflection",
-                memory_type="reflection",
-                api_key=api_key,
-            )
-            saved.append(record)
-
-        return saved
+        return await cls.record_observations(
+            supabase, agent_id, simulation_id, reflections,
+            source_type="reflection", memory_type="reflection",
+            default_importance=7, api_key=api_key,
+        )
 
     # ── List (paginated) ─────────────────────────────────────────────
 
@@ -322,7 +320,7 @@ class AgentMemoryService:
         if memory_type:
             query = query.eq("memory_type", memory_type)
 
-        response = query.execute()
+        response = await run_query(query)
         data = response.data or []
         total = response.count if response.count is not None else len(data)
         return data, total
@@ -8,6 +8,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.services.base_service import BaseService
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -26,14 +27,13 @@ class AgentProfessionService(BaseService):
         agent_id: UUID,
     ) -> list[dict]:
         """List all professions for an agent, primary first."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("agent_id", str(agent_id))
             .order("is_primary", desc=True)
             .order("qualification_level", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -82,7 +82,7 @@ class AgentProfessionService(BaseService):
             for key, value in extra_filters.items():
                 query = query.eq(key, str(value))
 
-        response = query.execute()
+        response = await run_query(query)
 
         if not response.data:
             raise HTTPException(
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from uuid import UUID
 
 from backend.services.base_service import BaseService
+from backend.utils.db import run_query
 from backend.utils.search import apply_search_filter
 from supabase import Client
 
@@ -18,6 +20,7 @@ class AgentService(BaseService):
 
     table_name = "agents"
     view_name = "active_agents"
+    public_cached = True
 
     @classmethod
     async def list(
@@ -52,11 +55,11 @@ class AgentService(BaseService):
             query = apply_search_filter(query, search)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         agents = response.data or []
-        cls._enrich_ambassador_flag(supabase, simulation_id, agents)
+        await cls._enrich_ambassador_flag(supabase, simulation_id, agents)
         return agents, total
 
     @classmethod
@@ -79,7 +82,7 @@ class AgentService(BaseService):
             query = query.in_("id", agent_ids)
         else:
             query = query.limit(limit)
-        return (query.execute()).data or []
+        return (await run_query(query)).data or []
 
     @classmethod
     async def get_reactions(
@@ -89,13 +92,12 @@ class AgentService(BaseService):
         agent_id: UUID,
     ) -> list[dict]:
         """Get all event reactions for an agent."""
-        response = (
+        response = await run_query(
             supabase.table("event_reactions")
             .select("*, events(id, title)")
             .eq("simulation_id", str(simulation_id))
             .eq("agent_id", str(agent_id))
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -107,13 +109,12 @@ class AgentService(BaseService):
         agent_id: UUID,
     ) -> list[dict]:
         """Get all professions for an agent."""
-        response = (
+        response = await run_query(
             supabase.table("agent_professions")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("agent_id", str(agent_id))
             .order("is_primary", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -125,12 +126,11 @@ class AgentService(BaseService):
         agent_id: UUID,
     ) -> list[dict]:
         """Get all building relations for an agent."""
-        response = (
+        response = await run_query(
             supabase.table("building_agent_relations")
             .select("*, buildings(id, name, building_type)")
             .eq("simulation_id", str(simulation_id))
             .eq("agent_id", str(agent_id))
-            .execute()
         )
         return response.data or []
 
@@ -143,14 +143,20 @@ class AgentService(BaseService):
     ) -> dict:
         """Get an agent with professions, reactions, and building relations."""
         agent = await cls.get(supabase, simulation_id, agent_id)
-        agent["professions"] = await cls.get_professions(supabase, simulation_id, agent_id)
-        agent["reactions"] = await cls.get_reactions(supabase, simulation_id, agent_id)
-        agent["building_relations"] = await cls.get_building_relations(supabase, simulation_id, agent_id)
-        cls._enrich_ambassador_flag(supabase, simulation_id, [agent])
+        # Independent lookups — overlap the round-trips
+        professions, reactions, building_relations, _ = await asyncio.gather(
+            cls.get_professions(supabase, simulation_id, agent_id),
+            cls.get_reactions(supabase, simulation_id, agent_id),
+            cls.get_building_relations(supabase, simulation_id, agent_id),
+            cls._enrich_ambassador_flag(supabase, simulation_id, [agent]),
+        )
+        agent["professions"] = professions
+        agent["reactions"] = reactions
+        agent["building_relations"] = building_relations
         return agent
 
     @classmethod
-    def _enrich_ambassador_flag(
+    async def _enrich_ambassador_flag(
         cls,
         supabase: Client,
         simulation_id: UUID,
@@ -166,12 +172,11 @@ class AgentService(BaseService):
 
         sim_str = str(simulation_id)
         try:
-            response = (
+            response = await run_query(
                 supabase.table("embassies")
                 .select("simulation_a_id, simulation_b_id, embassy_metadata")
                 .eq("status", "active")
                 .or_(f"simulation_a_id.eq.{sim_str},simulation_b_id.eq.{sim_str}")
-                .execute()
             )
         except Exception:
             logger.warning("Failed to query embassies for ambassador enrichment", exc_info=True)
@@ -0,0 +1,101 @@
+"""Process-wide cache for resolved prompt templates and simulation AI settings.
+
+Every AI call resolves a prompt (up to four ``prompt_templates`` lookups along
+the fallback chain, plus the simulation's ``general.content_locale``) and a
+model (the simulation's ``ai`` settings) before doing any work. The results
+change only when an editor saves a template or a setting, so they are kept
+here across requests:
+
+- entries are keyed by ``(kind, simulation_id, version, *key)`` and live for
+  ``cache_ai_config_ttl`` seconds (re-read on every store, so admin changes
+  apply to new entries);
+- ``invalidate_simulation()`` — called by ``PromptTemplateService``,
+  ``SettingsService`` and the Forge theme writer — bumps the simulation's
+  version, so its entries and any load still in flight under the old version
+  are never served again. Other workers converge within the TTL.
+
+Platform-default templates (``simulation_id IS NULL``) only change through
+migrations and are picked up when entries expire.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+from cachetools import LRUCache
+
+from backend.services.cache_config import get_ttl
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# (kind, simulation_id, generation, version, *key) → (value, expires_at)
+_entries: LRUCache = LRUCache(maxsize=8192)
+# simulation_id → version (bumped on every template/settings write)
+_versions: dict[str, int] = {}
+_generation = 0  # Bumped by clear()
+
+_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "invalidations": 0,
+}
+
+
+async def get_or_load(
+    kind: str,
+    simulation_id: UUID | str | None,
+    key: tuple,
+    loader: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Return the cached value for ``(kind, simulation_id, *key)``, calling ``loader`` on a miss.
+
+    ``None`` results are cached too (an absent setting stays absent until a
+    write invalidates the simulation).
+    """
+    sim = str(simulation_id) if simulation_id else ""
+    cache_key = (kind, sim, _generation, _versions.get(sim, 0), *key)
+    cached = _entries.get(cache_key, _MISSING)
+    if cached is not _MISSING and cached[1] > time.monotonic():
+        _stats["hits"] += 1
+        return cached[0]
+
+    _stats["misses"] += 1
+    value = await loader()
+    _entries[cache_key] = (value, time.monotonic() + get_ttl("cache_ai_config_ttl"))
+    return value
+
+
+def invalidate_simulation(simulation_id: UUID | str) -> None:
+    """Drop every cached prompt, locale and AI setting of a simulation."""
+    _stats["invalidations"] += 1
+    sim = str(simulation_id)
+    _versions[sim] = _versions.get(sim, 0) + 1
+    for key in [k for k in list(_entries.keys()) if k[1] == sim]:
+        _entries.pop(key, None)
+
+
+def get_stats() -> dict:
+    """Hit/miss counters and current entry count."""
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        **_stats,
+        "hit_rate": round(_stats["hits"] / lookups, 4) if lookups else 0.0,
+        "entries": len(_entries),
+        "versioned_simulations": len(_versions),
+    }
+
+
+def clear() -> None:
+    """Empty the cache and reset counters (admin TTL change, tests)."""
+    global _generation  # noqa: PLW0603
+    _generation += 1  # Loads still in flight must not repopulate the cache
+    _entries.clear()
+    _versions.clear()
+    for key in _stats:
+        _stats[key] = 0
@@ -7,6 +7,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.models.aptitude import OPERATIVE_TYPES, AptitudeSet
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -18,13 +19,12 @@ class AptitudeService:
         cls, supabase: Client, simulation_id: UUID, agent_id: UUID
     ) -> list[dict]:
         """Get all aptitude rows for an agent."""
-        resp = (
+        resp = await run_query(
             supabase.table("agent_aptitudes")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("agent_id", str(agent_id))
             .order("operative_type")
-            .execute()
         )
         return resp.data or []
 
@@ -33,12 +33,11 @@ class AptitudeService:
         cls, supabase: Client, simulation_id: UUID
     ) -> list[dict]:
         """Get all aptitude rows for all agents in a simulation."""
-        resp = (
+        resp = await run_query(
             supabase.table("agent_aptitudes")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .order("agent_id")
-            .execute()
         )
         return resp.data or []
 
@@ -55,12 +54,11 @@ class AptitudeService:
         Budget validation (sum=36, each 3-9) is handled by the Pydantic model.
         """
         # Verify agent belongs to simulation
-        agent_resp = (
+        agent_resp = await run_query(
             supabase.table("agents")
             .select("id")
             .eq("id", str(agent_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if not agent_resp.data:
             raise HTTPException(
@@ -79,10 +77,9 @@ class AptitudeService:
                 "aptitude_level": level,
             })
 
-        resp = (
+        resp = await run_query(
             supabase.table("agent_aptitudes")
             .upsert(rows, on_conflict="agent_id,operative_type")
-            .execute()
         )
         if not resp.data:
             raise HTTPException(
@@ -102,12 +99,11 @@ class AptitudeService:
 
         Returns the default (6) if no aptitude row exists.
         """
-        resp = (
+        resp = await run_query(
             supabase.table("agent_aptitudes")
             .select("aptitude_level")
             .eq("agent_id", str(agent_id))
             .eq("operative_type", operative_type)
-            .execute()
         )
         if resp.data:
             return resp.data[0]["aptitude_level"]
@@ -3,6 +3,7 @@
 import logging
 from uuid import UUID
 
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -60,4 +61,4 @@ class AuditService:
             entry["simulation_id"] = str(simulation_id)
         if entity_id is not None:
             entry["entity_id"] = str(entity_id)
-        supabase.table("audit_log").insert(entry).execute()
+        await run_query(supabase.table("audit_log").insert(entry))
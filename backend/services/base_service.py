@@ -8,6 +8,8 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services import public_cache
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,13 @@ class BaseService:
     table_name: str
     view_name: str | None = None  # e.g. "active_agents" — used for list/get queries
     supports_created_by: bool = True  # Override to False for tables without created_by_id
+    public_cached: bool = False  # True if /api/v1/public serves this entity via public_cache
+
+    @classmethod
+    def _invalidate_public(cls, simulation_id: UUID) -> None:
+        """Drop cached public responses after a write (no-op unless ``public_cached``)."""
+        if cls.public_cached:
+            public_cache.invalidate_simulation(simulation_id)
 
     @classmethod
     def _read_table(cls, include_deleted: bool = False) -> str:
@@ -77,7 +86,7 @@ class BaseService:
                     query = query.eq(key, value)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -94,13 +103,12 @@ class BaseService:
     ) -> dict:
         """Get a single entity by ID within a simulation."""
         table = cls._read_table(include_deleted)
-        response = (
+        response = await run_query(
             supabase.table(table)
             .select(select)
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(entity_id))
             .limit(1)
-            .execute()
         )
 
         data = (
@@ -135,10 +143,9 @@ class BaseService:
         if cls.supports_created_by and "created_by_id" not in insert_data:
             insert_data.setdefault("created_by_id", str(user_id))
 
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .insert(insert_data)
-            .execute()
         )
 
         if not response.data:
@@ -148,6 +155,7 @@ class BaseService:
                 detail=f"Failed to create {cls.table_name} record.",
             )
 
+        cls._invalidate_public(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -194,7 +202,7 @@ class BaseService:
         if if_updated_at is not None:
             query = query.eq("updated_at", if_updated_at)
 
-        response = query.execute()
+        response = await run_query(query)
 
         if not response.data:
             # Distinguish "not found" from "conflict" when optimistic locking is active.
@@ -209,7 +217,7 @@ class BaseService:
                 )
                 if cls.view_name is not None:
                     exists_query = exists_query.is_("deleted_at", "null")
-                exists = exists_query.execute()
+                exists = await run_query(exists_query)
                 if exists and exists.data:
                     logger.warning(
                         "Optimistic lock conflict",
@@ -236,6 +244,7 @@ class BaseService:
                 detail=f"{cls.table_name} '{entity_id}' not found.",
             )
 
+        cls._invalidate_public(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -259,7 +268,7 @@ class BaseService:
             for key, value in extra_filters.items():
                 query = query.eq(key, str(value))
 
-        response = query.execute()
+        response = await run_query(query)
 
         if not response.data:
             logger.warning(
@@ -271,6 +280,7 @@ class BaseService:
                 detail=f"{cls.table_name} '{entity_id}' not found.",
             )
 
+        cls._invalidate_public(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -281,13 +291,12 @@ class BaseService:
         entity_id: UUID,
     ) -> dict:
         """Soft-delete an entity by setting deleted_at."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .update({"deleted_at": datetime.now(UTC).isoformat()})
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(entity_id))
             .is_("deleted_at", "null")
-            .execute()
         )
 
         if not response.data:
@@ -300,4 +309,5 @@ class BaseService:
                 detail=f"{cls.table_name} '{entity_id}' not found or already deleted.",
             )
 
+        cls._invalidate_public(simulation_id)
         return response.data[0]
@@ -3,10 +3,16 @@
 import logging
 from uuid import UUID
 
+from backend.services.cache_config import get_ttl
+from backend.utils.db import run_query
+from backend.utils.single_flight import SingleFlight
 from supabase import Client
 
 logger = logging.getLogger(__name__)
 
+# Global public feed, keyed by limit — polled by every open map during epochs
+_feed_flight = SingleFlight("battle_feed", ttl=lambda: get_ttl("cache_http_battle_feed_max_age"), stale_factor=3)
+
 
 class BattleLogService:
     """Service for recording and querying competitive event narratives."""
@@ -29,6 +35,42 @@ class BattleLogService:
         metadata: dict | None = None,
     ) -> dict:
         """Record a battle log entry."""
+        data = cls.build_entry(
+            epoch_id,
+            cycle_number,
+            event_type,
+            narrative,
+            source_simulation_id=source_simulation_id,
+            target_simulation_id=target_simulation_id,
+            mission_id=mission_id,
+            is_public=is_public,
+            metadata=metadata,
+        )
+
+        try:
+            resp = await run_query(supabase.table("battle_log").insert(data))
+            return resp.data[0] if resp.data else data
+        except Exception:
+            logger.error(
+                "Battle log insert failed for event_type=%s: %s",
+                event_type, data.get("narrative", "")[:100], exc_info=True,
+            )
+            return data
+
+    @staticmethod
+    def build_entry(
+        epoch_id: UUID,
+        cycle_number: int,
+        event_type: str,
+        narrative: str,
+        *,
+        source_simulation_id: UUID | None = None,
+        target_simulation_id: UUID | None = None,
+        mission_id: UUID | None = None,
+        is_public: bool = False,
+        metadata: dict | None = None,
+    ) -> dict:
+        """Build a battle_log row without writing it (see ``log_entries``)."""
         data = {
             "epoch_id": str(epoch_id),
             "cycle_number": cycle_number,
@@ -44,16 +86,22 @@ class BattleLogService:
             data["target_simulation_id"] = str(target_simulation_id)
         if mission_id:
             data["mission_id"] = str(mission_id)
+        return data
 
+    @classmethod
+    async def log_entries(cls, supabase: Client, entries: list[dict]) -> list[dict]:
+        """Record many ``build_entry`` rows in one insert."""
+        if not entries:
+            return []
         try:
-            resp = supabase.table("battle_log").insert(data).execute()
-            return resp.data[0] if resp.data else data
+            resp = await run_query(supabase.table("battle_log").insert(entries))
+            return resp.data or entries
         except Exception:
             logger.error(
-                "Battle log insert failed for event_type=%s: %s",
-                event_type, data.get("narrative", "")[:100], exc_info=True,
+                "Battle log batch insert failed for %d entries (%s)",
+                len(entries), ", ".join(sorted({e["event_type"] for e in entries})), exc_info=True,
             )
-            return data
+            return entries
 
     # ── Convenience Loggers ───────────────────────────────
 
@@ -93,6 +141,24 @@ class BattleLogService:
         mission: dict,
     ) -> dict:
         """Log a mission resolution (success/failure/detection)."""
+        return await cls.log_event(supabase, epoch_id, cycle_number, **cls._mission_result_fields(mission))
+
+    @classmethod
+    async def log_mission_results(
+        cls,
+        supabase: Client,
+        epoch_id: UUID,
+        cycle_number: int,
+        missions: list[dict],
+    ) -> list[dict]:
+        """Log many mission resolutions in one insert."""
+        return await cls.log_entries(supabase, [
+            cls.build_entry(epoch_id, cycle_number, **cls._mission_result_fields(mission))
+            for mission in missions
+        ])
+
+    @staticmethod
+    def _mission_result_fields(mission: dict) -> dict:
         result = mission.get("mission_result", {})
         outcome = result.get("outcome", "unknown")
         narrative = result.get("narrative", f"Mission {outcome}.")
@@ -105,22 +171,46 @@ class BattleLogService:
             "captured": "captured",
         }
 
-        return await cls.log_event(
-            supabase,
-            epoch_id,
-            cycle_number,
-            event_type_map.get(outcome, "mission_failed"),
-            narrative,
-            source_simulation_id=UUID(mission["source_simulation_id"]),
-            target_simulation_id=(
+        return {
+            "event_type": event_type_map.get(outcome, "mission_failed"),
+            "narrative": narrative,
+            "source_simulation_id": UUID(mission["source_simulation_id"]),
+            "target_simulation_id": (
                 UUID(mission["target_simulation_id"])
                 if mission.get("target_simulation_id")
                 else None
             ),
-            mission_id=UUID(mission["id"]),
-            is_public=is_public,
-            metadata={"operative_type": mission["operative_type"], "outcome": outcome},
-        )
+            "mission_id": UUID(mission["id"]),
+            "is_public": is_public,
+            "metadata": {"operative_type": mission["operative_type"], "outcome": outcome},
+        }
+
+    @classmethod
+    async def log_fortifications_expired(
+        cls,
+        supabase: Client,
+        epoch_id: UUID,
+        cycle_number: int,
+        expired: list[dict],
+    ) -> list[dict]:
+        """Record one hidden entry per expired fortification (``OperativeService.expire_fortifications``)."""
+        return await cls.log_entries(supabase, [
+            cls.build_entry(
+                epoch_id,
+                cycle_number,
+                "fortification_expired",
+                f"Fortification of zone '{fort.get('zone_name') or '?'}' has expired.",
+                source_simulation_id=fort["source_simulation_id"],
+                is_public=False,
+                metadata={
+                    "zone_id": fort["zone_id"],
+                    "zone_name": fort.get("zone_name"),
+                    "old_level": fort.get("old_level"),
+                    "new_level": fort.get("new_level"),
+                },
+            )
+            for fort in expired
+        ])
 
     @classmethod
     async def log_phase_change(
@@ -177,22 +267,32 @@ class BattleLogService:
         detected: bool,
     ) -> dict:
         """Log a betrayal event."""
+        return await cls.log_event(
+            supabase, epoch_id, cycle_number, **cls._betrayal_fields(betrayer_id, victim_id, detected),
+        )
+
+    @classmethod
+    def betrayal_entry(
+        cls, epoch_id: UUID, cycle_number: int, betrayer_id: UUID, victim_id: UUID, detected: bool,
+    ) -> dict:
+        """Build (without writing) the row ``log_betrayal`` would record."""
+        return cls.build_entry(epoch_id, cycle_number, **cls._betrayal_fields(betrayer_id, victim_id, detected))
+
+    @staticmethod
+    def _betrayal_fields(betrayer_id: UUID, victim_id: UUID, detected: bool) -> dict:
         narrative = (
             "An allied simulation has been caught attacking from within!"
             if detected
             else "A covert attack from within an alliance went unnoticed."
         )
-        return await cls.log_event(
-            supabase,
-            epoch_id,
-            cycle_number,
-            "betrayal",
-            narrative,
-            source_simulation_id=betrayer_id,
-            target_simulation_id=victim_id,
-            is_public=detected,
-            metadata={"detected": detected},
-        )
+        return {
+            "event_type": "betrayal",
+            "narrative": narrative,
+            "source_simulation_id": betrayer_id,
+            "target_simulation_id": victim_id,
+            "is_public": detected,
+            "metadata": {"detected": detected},
+        }
 
     @classmethod
     async def log_rp_allocated(
@@ -223,17 +323,24 @@ class BattleLogService:
         *,
         limit: int = 20,
     ) -> list[dict]:
-        """Get recent public battle log entries across all active epochs."""
-        resp = (
-            supabase.table("battle_log")
-            .select("*, game_epochs!inner(status)")
-            .eq("is_public", True)
-            .in_("game_epochs.status", ["foundation", "competition", "reckoning"])
-            .order("created_at", desc=True)
-            .limit(limit)
-            .execute()
-        )
-        return resp.data or []
+        """Get recent public battle log entries across all active epochs.
+
+        Shared across concurrent callers and served stale while refreshing
+        (see ``_feed_flight``).
+        """
+
+        async def _load() -> list[dict]:
+            resp = await run_query(
+                supabase.table("battle_log")
+                .select("*, game_epochs!inner(status)")
+                .eq("is_public", True)
+                .in_("game_epochs.status", ["foundation", "competition", "reckoning"])
+                .order("created_at", desc=True)
+                .limit(limit)
+            )
+            return resp.data or []
+
+        return await _feed_flight.get(limit, _load)
 
     @classmethod
     async def list_entries(
@@ -268,7 +375,7 @@ class BattleLogService:
             query = query.eq("event_type", event_type)
 
         query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
-        resp = query.execute()
+        resp = await run_query(query)
         return resp.data or [], resp.count or 0
 
     @classmethod
@@ -5,15 +5,16 @@ a public feed styled as Bureau of Impossible Geography dispatches.
 """
 
 import logging
-import time
 
+from backend.utils.db import run_query
+from backend.utils.single_flight import SingleFlight
 from supabase import Client
 
 logger = logging.getLogger(__name__)
 
-# In-process cache: (data, timestamp)
-_gazette_cache: tuple[list[dict], float] = ([], 0.0)
 _CACHE_TTL = 60  # seconds
+# Keyed by limit; shared across concurrent callers and served stale while refreshing
+_gazette_flight = SingleFlight("bleed_gazette", ttl=_CACHE_TTL, stale_factor=3)
 
 
 class BleedGazetteService:
@@ -28,19 +29,14 @@ class BleedGazetteService:
     ) -> list[dict]:
         """Get Bleed Gazette entries from Postgres aggregation function.
 
-        Uses a 60s in-process cache since multiverse updates are not realtime.
+        Uses a 60s in-process single-flight cache (served stale while one
+        refresh runs) since multiverse updates are not realtime.
         """
-        global _gazette_cache
 
-        now = time.monotonic()
-        cached_data, cached_at = _gazette_cache
-        if cached_data and (now - cached_at) < _CACHE_TTL:
-            return cached_data[:limit]
+        async def _load() -> list[dict]:
+            response = await run_query(supabase.rpc("get_bleed_gazette_feed", {
+                "p_limit": limit,
+            }))
+            return response.data or []
 
-        response = supabase.rpc("get_bleed_gazette_feed", {
-            "p_limit": limit,
-        }).execute()
-
-        entries = response.data or []
-        _gazette_cache = (entries, now)
-        return entries
+        return await _gazette_flight.get(limit, _load)
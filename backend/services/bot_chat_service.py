@@ -13,6 +13,7 @@ import secrets
 from backend.services.bot_game_state import BotGameState
 from backend.services.external.openrouter import OpenRouterService
 from backend.services.model_resolver import ModelResolver
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -267,12 +268,11 @@ class BotChatService:
 
         # Insert via admin client (bot is a system actor)
         # Use epoch creator's user_id as sender_id (bots don't have auth accounts)
-        epoch_resp = (
+        epoch_resp = await run_query(
             admin_supabase.table("game_epochs")
             .select("created_by_id")
             .eq("id", epoch_id)
             .single()
-            .execute()
         )
         creator_id = epoch_resp.data.get("created_by_id") if epoch_resp.data else None
         if not creator_id:
@@ -286,20 +286,19 @@ class BotChatService:
             "content": content,
             "sender_type": "bot",
         }
-        resp = admin_supabase.table("epoch_chat_messages").insert(message).execute()
+        resp = await run_query(admin_supabase.table("epoch_chat_messages").insert(message))
         return resp.data[0] if resp.data else None
 
     @classmethod
     async def _get_chat_mode(cls, supabase: Client, simulation_id: str) -> str:
         """Get bot_chat_mode from simulation AI settings."""
-        resp = (
+        resp = await run_query(
             supabase.table("simulation_settings")
             .select("setting_value")
             .eq("simulation_id", simulation_id)
             .eq("category", "ai")
             .eq("setting_key", "bot_chat_mode")
             .maybe_single()
-            .execute()
         )
         return resp.data.get("setting_value", "template") if resp.data else "template"
 
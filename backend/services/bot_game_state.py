@@ -2,13 +2,20 @@
 
 Queries ONLY data that a human player would see through the UI.
 No privileged access — uses the same data visibility rules as the frontend.
+
+Public data (epoch status, battle log, scores, teams, participants, active
+resonances) is identical for every bot in a cycle, so it is loaded once into
+a ``PublicSnapshot`` and shared; only the bot's own and detected-intel data is
+loaded per bot.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 
+from backend.utils.db import gather_queries, run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -43,6 +50,72 @@ def _derive_resonance_affinities(
     return sorted(aligned - overlap), sorted(opposed - overlap)
 
 
+@dataclass(frozen=True)
+class PublicSnapshot:
+    """Per-cycle public data every bot sees — loaded once, shared read-only."""
+
+    epoch_status: str = "competition"
+    battle_log: list[dict] = field(default_factory=list)
+    scores: list[dict] = field(default_factory=list)
+    teams: list[dict] = field(default_factory=list)
+    participants: list[dict] = field(default_factory=list)
+    active_resonances: list[dict] = field(default_factory=list)
+
+    @classmethod
+    async def load(cls, supabase: Client, epoch_id: str) -> PublicSnapshot:
+        """Load the public view of an epoch in one concurrent round."""
+        epoch_resp, blog_resp, scores_resp, teams_resp, parts_resp = await gather_queries(
+            supabase.table("game_epochs")
+            .select("status")
+            .eq("id", epoch_id)
+            .single(),
+            # Public battle log
+            supabase.table("battle_log")
+            .select("*")
+            .eq("epoch_id", epoch_id)
+            .eq("is_public", True)
+            .order("created_at", desc=True)
+            .limit(50),
+            # Current scores/standings
+            supabase.table("epoch_scores")
+            .select("*")
+            .eq("epoch_id", epoch_id)
+            .order("composite_score", desc=True),
+            # Teams/alliances
+            supabase.table("epoch_teams")
+            .select("*")
+            .eq("epoch_id", epoch_id)
+            .is_("dissolved_at", "null"),
+            # Participants (sim names, not strategies)
+            supabase.table("epoch_participants")
+            .select("id, simulation_id, team_id, is_bot, simulations(name, slug)")
+            .eq("epoch_id", epoch_id),
+        )
+
+        # Active resonances (public — all players can see these)
+        active_resonances: list[dict] = []
+        try:
+            resonance_resp = await run_query(
+                supabase.table("active_resonances")
+                .select("id, archetype, resonance_signature, magnitude, status")
+                .in_("status", ["detected", "impacting"])
+                .order("magnitude", desc=True)
+                .limit(5)
+            )
+            active_resonances = resonance_resp.data or []
+        except Exception:
+            logger.debug("Active resonances load failed", exc_info=True)
+
+        return cls(
+            epoch_status=(epoch_resp.data or {}).get("status", "competition"),
+            battle_log=blog_resp.data or [],
+            scores=scores_resp.data or [],
+            teams=teams_resp.data or [],
+            participants=parts_resp.data or [],
+            active_resonances=active_resonances,
+        )
+
+
 @dataclass
 class BotGameState:
     """A fog-of-war compliant view of the game state for a bot participant."""
@@ -99,11 +172,19 @@ class BotGameState:
         participant: dict,
         cycle_number: int,
         config: dict,
+        snapshot: PublicSnapshot | None = None,
     ) -> BotGameState:
-        """Build game state using same data access a human player has."""
+        """Build game state using same data access a human player has.
+
+        ``snapshot`` is the cycle's shared public data; it is loaded here
+        when not supplied (single-bot callers).
+        """
         sim_id = participant["simulation_id"]
         bot_player = participant.get("bot_player") or {}
 
+        if snapshot is None:
+            snapshot = await PublicSnapshot.load(supabase, epoch_id)
+
         state = cls(
             participant_id=participant["id"],
             simulation_id=sim_id,
@@ -114,154 +195,99 @@ class BotGameState:
             rp_cap=config.get("rp_cap", 40),
             rp_per_cycle=config.get("rp_per_cycle", 12),
             current_cycle=cycle_number,
-            epoch_phase=config.get("_epoch_status", "competition"),
+            epoch_phase=config.get("_epoch_status", snapshot.epoch_status),
             own_team_id=participant.get("team_id"),
         )
 
-        # Parallel-safe sequential queries (supabase-py is sync under the hood)
-        await state._load_own_data(supabase, epoch_id, sim_id)
-        await state._load_detected_intel(supabase, epoch_id, sim_id)
-        await state._load_public_data(supabase, epoch_id)
-        await state._load_world_state(supabase, sim_id)
+        await asyncio.gather(
+            state._load_own_data(supabase, epoch_id, sim_id),
+            state._load_detected_intel(supabase, epoch_id, sim_id),
+            state._load_world_state(supabase, sim_id),
+        )
+        state._apply_public_snapshot(snapshot)
         state._derive_allies()
 
         return state
 
     async def _load_own_data(self, supabase: Client, epoch_id: str, sim_id: str) -> None:
         """Load data the bot has full visibility over (own simulation)."""
-        # Own missions (all statuses)
-        missions_resp = (
+        missions_resp, zones_resp, agents_resp, aptitudes_resp, embassies_resp = await gather_queries(
+            # Own missions (all statuses)
             supabase.table("operative_missions")
             .select("*")
             .eq("epoch_id", epoch_id)
-            .eq("source_simulation_id", sim_id)
-            .execute()
-        )
-        self.own_missions = missions_resp.data or []
-        self.own_guardians = sum(
-            1 for m in self.own_missions
-            if m["operative_type"] == "guardian" and m["status"] == "active"
-        )
-
-        # Own zones (security levels)
-        zones_resp = (
+            .eq("source_simulation_id", sim_id),
+            # Own zones (security levels)
             supabase.table("zones")
             .select("id, name, security_level")
-            .eq("simulation_id", sim_id)
-            .execute()
-        )
-        self.own_zones = zones_resp.data or []
-
-        # Own agents (available for deployment) with aptitudes
-        agents_resp = (
+            .eq("simulation_id", sim_id),
+            # Own agents (available for deployment) with aptitudes
             supabase.table("agents")
             .select("id, name, simulation_id, ambassador_blocked_until")
             .eq("simulation_id", sim_id)
-            .is_("deleted_at", "null")
-            .execute()
-        )
-        self.own_agents = agents_resp.data or []
-
-        # Load aptitudes for own agents (keyed by agent_id)
-        if self.own_agents:
-            aptitudes_resp = (
-                supabase.table("agent_aptitudes")
-                .select("agent_id, operative_type, aptitude_level")
-                .eq("simulation_id", sim_id)
-                .execute()
-            )
-            apt_map: dict[str, dict[str, int]] = {}
-            for row in aptitudes_resp.data or []:
-                aid = row["agent_id"]
-                if aid not in apt_map:
-                    apt_map[aid] = {}
-                apt_map[aid][row["operative_type"]] = row["aptitude_level"]
-            # Attach aptitudes dict to each agent
-            for agent in self.own_agents:
-                agent["aptitudes"] = apt_map.get(agent["id"], {})
-
-        # Own embassies (for offensive operations)
-        # Embassies use simulation_a_id/simulation_b_id (bidirectional)
-        embassies_resp = (
+            .is_("deleted_at", "null"),
+            supabase.table("agent_aptitudes")
+            .select("agent_id, operative_type, aptitude_level")
+            .eq("simulation_id", sim_id),
+            # Own embassies (for offensive operations)
+            # Embassies use simulation_a_id/simulation_b_id (bidirectional)
             supabase.table("embassies")
             .select(
                 "id, simulation_a_id, simulation_b_id, status,"
                 " infiltration_penalty, infiltration_penalty_expires_at"
             )
             .eq("status", "active")
-            .or_(f"simulation_a_id.eq.{sim_id},simulation_b_id.eq.{sim_id}")
-            .execute()
+            .or_(f"simulation_a_id.eq.{sim_id},simulation_b_id.eq.{sim_id}"),
         )
+
+        self.own_missions = missions_resp.data or []
+        self.own_guardians = sum(
+            1 for m in self.own_missions
+            if m["operative_type"] == "guardian" and m["status"] == "active"
+        )
+        self.own_zones = zones_resp.data or []
+        self.own_agents = agents_resp.data or []
+
+        # Attach aptitudes dict to each agent (keyed by agent_id)
+        apt_map: dict[str, dict[str, int]] = {}
+        for row in aptitudes_resp.data or []:
+            apt_map.setdefault(row["agent_id"], {})[row["operative_type"]] = row["aptitude_level"]
+        for agent in self.own_agents:
+            agent["aptitudes"] = apt_map.get(agent["id"], {})
+
         self.own_embassies = embassies_resp.data or []
 
     async def _load_detected_intel(self, supabase: Client, epoch_id: str, sim_id: str) -> None:
         """Load intel from detection mechanics (detected inbound ops + spy reports)."""
-        # Detected enemy operations targeting us
-        detected_resp = (
+        detected_resp, intel_resp = await gather_queries(
+            # Detected enemy operations targeting us
             supabase.table("operative_missions")
             .select("*")
             .eq("epoch_id", epoch_id)
             .eq("target_simulation_id", sim_id)
-            .in_("status", ["detected", "captured"])
-            .execute()
-        )
-        self.detected_enemy_ops = detected_resp.data or []
-
-        # Spy intel from our successful spy missions (stored in battle_log)
-        intel_resp = (
+            .in_("status", ["detected", "captured"]),
+            # Spy intel from our successful spy missions (stored in battle_log)
             supabase.table("battle_log")
             .select("*")
             .eq("epoch_id", epoch_id)
             .eq("source_simulation_id", sim_id)
             .eq("event_type", "intel_report")
             .order("created_at", desc=True)
-            .limit(10)
-            .execute()
+            .limit(10),
         )
+        self.detected_enemy_ops = detected_resp.data or []
         self.spy_intel_reports = intel_resp.data or []
 
-    async def _load_public_data(self, supabase: Client, epoch_id: str) -> None:
-        """Load publicly visible data (all players see this)."""
-        # Public battle log
-        blog_resp = (
-            supabase.table("battle_log")
-            .select("*")
-            .eq("epoch_id", epoch_id)
-            .eq("is_public", True)
-            .order("created_at", desc=True)
-            .limit(50)
-            .execute()
-        )
-        self.battle_log = blog_resp.data or []
-
-        # Current scores/standings
-        scores_resp = (
-            supabase.table("epoch_scores")
-            .select("*")
-            .eq("epoch_id", epoch_id)
-            .order("composite_score", desc=True)
-            .execute()
-        )
-        self.scores = scores_resp.data or []
-
-        # Teams/alliances
-        teams_resp = (
-            supabase.table("epoch_teams")
-            .select("*")
-            .eq("epoch_id", epoch_id)
-            .is_("dissolved_at", "null")
-            .execute()
-        )
-        self.teams = teams_resp.data or []
-
-        # Participants (sim names, not strategies)
-        parts_resp = (
-            supabase.table("epoch_participants")
-            .select("id, simulation_id, team_id, is_bot, simulations(name, slug)")
-            .eq("epoch_id", epoch_id)
-            .execute()
+    def _apply_public_snapshot(self, snapshot: PublicSnapshot) -> None:
+        """Attach the cycle's shared public data (all players see this)."""
+        self.battle_log = snapshot.battle_log
+        self.scores = snapshot.scores
+        self.teams = snapshot.teams
+        self.participants = snapshot.participants
+        self.active_resonances = snapshot.active_resonances
+        self.resonance_aligned_types, self.resonance_opposed_types = (
+            _derive_resonance_affinities(self.active_resonances)
         )
-        self.participants = parts_resp.data or []
 
     def _derive_allies(self) -> None:
         """Compute allied simulation IDs from team membership."""
@@ -275,14 +301,12 @@ class BotGameState:
         ]
 
     async def _load_world_state(self, supabase: Client, sim_id: str) -> None:
-        """Load zone stability and active resonances (publicly visible data)."""
-        # Zone stability for own simulation
+        """Load zone stability for the bot's own simulation (publicly visible data)."""
         try:
-            stability_resp = (
+            stability_resp = await run_query(
                 supabase.table("mv_zone_stability")
                 .select("zone_id, zone_name, stability, total_pressure")
                 .eq("simulation_id", sim_id)
-                .execute()
             )
             self.own_zone_stability = stability_resp.data or []
             if self.own_zone_stability:
@@ -292,23 +316,6 @@ class BotGameState:
         except Exception:
             logger.debug("Zone stability load failed", exc_info=True)
 
-        # Active resonances (public — all players can see these)
-        try:
-            resonance_resp = (
-                supabase.table("active_resonances")
-                .select("id, archetype, resonance_signature, magnitude, status")
-                .in_("status", ["detected", "impacting"])
-                .order("magnitude", desc=True)
-                .limit(5)
-                .execute()
-            )
-            self.active_resonances = resonance_resp.data or []
-            self.resonance_aligned_types, self.resonance_opposed_types = (
-                _derive_resonance_affinities(self.active_resonances)
-            )
-        except Exception:
-            logger.debug("Active resonances load failed", exc_info=True)
-
     # ── Query helpers for personality logic ──────────────────
 
     def get_available_agents(self) -> list[dict]:
@@ -363,7 +370,7 @@ class BotGameState:
 
     def get_target_zone_security(self, target_sim_id: str) -> float:
         """Get average zone security for target sim from spy intel."""
-        from backend.services.operative_service import SECURITY_LEVEL_MAP
+        from backend.services.mission_probability import SECURITY_LEVEL_MAP
 
         for report in self.spy_intel_reports:
             meta = report.get("metadata", {})
@@ -422,7 +429,7 @@ class BotGameState:
             return None
 
         # Check spy intel for zone security data (lower = more vulnerable)
-        from backend.services.operative_service import SECURITY_LEVEL_MAP
+        from backend.services.mission_probability import SECURITY_LEVEL_MAP
 
         best_target: str | None = None
         lowest_security = 10.0
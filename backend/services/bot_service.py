@@ -12,15 +12,18 @@ Called from EpochService.resolve_cycle(). For each bot participant:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from uuid import UUID
 
+from backend.config import settings
 from backend.models.epoch import OperativeDeploy
 from backend.services.bot_chat_service import BotChatService
-from backend.services.bot_game_state import BotGameState
+from backend.services.bot_game_state import BotGameState, PublicSnapshot
 from backend.services.bot_personality import create_personality
 from backend.services.epoch_service import EpochService
 from backend.services.operative_service import OperativeService
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -50,29 +53,37 @@ class BotService:
         Returns:
             List of decision summaries per bot.
         """
-        bot_participants = await cls._get_bot_participants(admin_supabase, epoch_id)
+        bot_participants, snapshot = await asyncio.gather(
+            cls._get_bot_participants(admin_supabase, epoch_id),
+            PublicSnapshot.load(admin_supabase, epoch_id),
+        )
         if not bot_participants:
             return []
 
-        results = []
-        for bot_p in bot_participants:
-            try:
-                result = await cls._execute_single_bot(
-                    supabase, admin_supabase, epoch_id, bot_p, cycle_number, config
-                )
-                results.append(result)
-            except Exception:
-                logger.exception(
-                    "Bot execution failed",
-                    extra={"participant_id": bot_p["id"], "epoch_id": epoch_id},
-                )
-                results.append({
-                    "participant_id": bot_p["id"],
-                    "success": False,
-                    "error": "Bot execution failed",
-                })
+        config_with_status = {**config, "_epoch_status": snapshot.epoch_status}
+        semaphore = asyncio.Semaphore(max(1, settings.bot_max_concurrency))
+        # Team creation/joins look teams up by name — serialize them across bots
+        alliance_lock = asyncio.Lock()
+
+        async def run(bot_p: dict) -> dict:
+            async with semaphore:
+                try:
+                    return await cls._execute_single_bot(
+                        supabase, admin_supabase, epoch_id, bot_p, cycle_number,
+                        config_with_status, snapshot, alliance_lock,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Bot execution failed",
+                        extra={"participant_id": bot_p["id"], "epoch_id": epoch_id},
+                    )
+                    return {
+                        "participant_id": bot_p["id"],
+                        "success": False,
+                        "error": "Bot execution failed",
+                    }
 
-        return results
+        return list(await asyncio.gather(*(run(bot_p) for bot_p in bot_participants)))
 
     @classmethod
     async def _execute_single_bot(
@@ -83,37 +94,20 @@ class BotService:
         participant: dict,
         cycle_number: int,
         config: dict,
+        snapshot: PublicSnapshot,
+        alliance_lock: asyncio.Lock,
     ) -> dict:
-        """Execute decisions for a single bot participant."""
-        # Re-fetch participant to get fresh RP (after grant)
-        fresh_p = (
-            admin_supabase.table("epoch_participants")
-            .select("*, bot_players(*)")
-            .eq("id", participant["id"])
-            .single()
-            .execute()
-        )
-        if not fresh_p.data:
-            return {"participant_id": participant["id"], "success": False, "error": "Not found"}
+        """Execute decisions for a single bot participant.
 
-        participant = fresh_p.data
+        ``participant`` is read at the start of the cycle (after the RP
+        grant); ``config`` already carries ``_epoch_status`` from the snapshot.
+        """
         bot_player = participant.get("bot_players") or participant.get("bot_player") or {}
-        participant["bot_player"] = bot_player
-
-        # Add epoch status to config for state builder
-        epoch_resp = (
-            admin_supabase.table("game_epochs")
-            .select("status")
-            .eq("id", epoch_id)
-            .single()
-            .execute()
-        )
-        epoch_status = epoch_resp.data.get("status", "competition") if epoch_resp.data else "competition"
-        config_with_status = {**config, "_epoch_status": epoch_status}
+        participant = {**participant, "bot_player": bot_player}
 
         # 1. Build fog-of-war game state
         game_state = await BotGameState.build(
-            admin_supabase, epoch_id, participant, cycle_number, config_with_status
+            admin_supabase, epoch_id, participant, cycle_number, config, snapshot
         )
 
         # 2. Create personality and make decisions
@@ -171,9 +165,10 @@ class BotService:
                 )
 
         # 4. Execute alliance actions
-        alliance_results = await cls._execute_alliances(
-            admin_supabase, epoch_id, participant, decisions.alliances
-        )
+        async with alliance_lock:
+            alliance_results = await cls._execute_alliances(
+                admin_supabase, epoch_id, participant, decisions.alliances
+            )
 
         # 5. Log decisions for transparency
         await cls._log_decisions(
@@ -189,9 +184,9 @@ class BotService:
             logger.debug("Bot chat generation failed for %s", participant["id"], exc_info=True)
 
         # 7. Set cycle_ready
-        admin_supabase.table("epoch_participants").update(
+        await run_query(admin_supabase.table("epoch_participants").update(
             {"cycle_ready": True}
-        ).eq("id", participant["id"]).execute()
+        ).eq("id", participant["id"]))
 
         return {
             "participant_id": participant["id"],
@@ -205,12 +200,11 @@ class BotService:
     @classmethod
     async def _get_bot_participants(cls, supabase: Client, epoch_id: str) -> list[dict]:
         """Get all bot participants in an epoch."""
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .select("*, bot_players(*)")
             .eq("epoch_id", epoch_id)
             .eq("is_bot", True)
-            .execute()
         )
         return resp.data or []
 
@@ -295,6 +289,6 @@ class BotService:
             },
         }
         try:
-            admin_supabase.table("bot_decision_log").insert(log_entry).execute()
+            await run_query(admin_supabase.table("bot_decision_log").insert(log_entry))
         except Exception:
             logger.debug("Failed to log bot decision", exc_info=True)
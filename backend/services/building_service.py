@@ -7,6 +7,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.services.base_service import BaseService
+from backend.utils.db import run_query
 from backend.utils.search import apply_search_filter
 from supabase import Client
 
@@ -17,6 +18,7 @@ class BuildingService(BaseService):
     table_name = "buildings"
     view_name = "active_buildings"
     supports_created_by = False
+    public_cached = True
 
     @classmethod
     async def list(
@@ -54,7 +56,7 @@ class BuildingService(BaseService):
             query = apply_search_filter(query, search)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -67,12 +69,11 @@ class BuildingService(BaseService):
         building_id: UUID,
     ) -> list[dict]:
         """Get all agents assigned to a building."""
-        response = (
+        response = await run_query(
             supabase.table("building_agent_relations")
             .select("*, agents(id, name, primary_profession, portrait_image_url)")
             .eq("simulation_id", str(simulation_id))
             .eq("building_id", str(building_id))
-            .execute()
         )
         return response.data or []
 
@@ -86,7 +87,7 @@ class BuildingService(BaseService):
         relation_type: str = "works",
     ) -> dict:
         """Assign an agent to a building."""
-        response = (
+        response = await run_query(
             supabase.table("building_agent_relations")
             .insert({
                 "simulation_id": str(simulation_id),
@@ -94,7 +95,6 @@ class BuildingService(BaseService):
                 "agent_id": str(agent_id),
                 "relation_type": relation_type,
             })
-            .execute()
         )
 
         if not response.data:
@@ -114,13 +114,12 @@ class BuildingService(BaseService):
         agent_id: UUID,
     ) -> None:
         """Remove an agent from a building."""
-        response = (
+        response = await run_query(
             supabase.table("building_agent_relations")
             .delete()
             .eq("simulation_id", str(simulation_id))
             .eq("building_id", str(building_id))
             .eq("agent_id", str(agent_id))
-            .execute()
         )
 
         if not response.data:
@@ -137,13 +136,12 @@ class BuildingService(BaseService):
         building_id: UUID,
     ) -> list[dict]:
         """Get profession requirements for a building."""
-        response = (
+        response = await run_query(
             supabase.table("building_profession_requirements")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("building_id", str(building_id))
             .order("is_mandatory", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -162,10 +160,9 @@ class BuildingService(BaseService):
             "building_id": str(building_id),
         }
 
-        response = (
+        response = await run_query(
             supabase.table("building_profession_requirements")
             .upsert(insert_data, on_conflict="building_id,profession")
-            .execute()
         )
 
         if not response.data:
@@ -184,12 +181,11 @@ class BuildingService(BaseService):
         zone_id: UUID,
     ) -> list[dict]:
         """Get all buildings in a zone."""
-        response = (
+        response = await run_query(
             supabase.table(cls._read_table())
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("zone_id", str(zone_id))
             .order("name")
-            .execute()
         )
         return response.data or []
@@ -27,13 +27,10 @@ async def load_ttls_from_db() -> None:
     """Load cache TTLs from platform_settings via admin client."""
     global _cache_ttls  # noqa: PLW0603
     try:
-        from backend.config import settings
-        from supabase import create_client
-
-        admin_client = create_client(settings.supabase_url, settings.supabase_service_role_key)
         from backend.services.platform_settings_service import PlatformSettingsService
+        from backend.utils.supabase_pool import get_admin_client
 
-        _cache_ttls = await PlatformSettingsService.get_cache_ttls(admin_client)
+        _cache_ttls = await PlatformSettingsService.get_cache_ttls(get_admin_client())
         logger.debug("Loaded cache TTLs from platform_settings")
     except Exception:
         logger.warning("Failed to load cache TTLs from DB, using defaults")
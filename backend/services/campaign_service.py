@@ -7,6 +7,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.services.base_service import BaseService
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -50,13 +51,12 @@ class CampaignService(BaseService):
         campaign_id: UUID,
     ) -> list[dict]:
         """Get all events linked to a campaign."""
-        response = (
+        response = await run_query(
             supabase.table("campaign_events")
             .select("*, events(id, title, event_type, occurred_at)")
             .eq("simulation_id", str(simulation_id))
             .eq("campaign_id", str(campaign_id))
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -70,7 +70,7 @@ class CampaignService(BaseService):
         integration_type: str = "manual",
     ) -> dict:
         """Link an event to a campaign."""
-        response = (
+        response = await run_query(
             supabase.table("campaign_events")
             .insert({
                 "simulation_id": str(simulation_id),
@@ -78,7 +78,6 @@ class CampaignService(BaseService):
                 "event_id": str(event_id),
                 "integration_type": integration_type,
             })
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -95,10 +94,10 @@ class CampaignService(BaseService):
         campaign_id: UUID,
     ) -> dict:
         """Aggregated campaign analytics from Postgres function."""
-        response = supabase.rpc("get_campaign_analytics", {
+        response = await run_query(supabase.rpc("get_campaign_analytics", {
             "p_simulation_id": str(simulation_id),
             "p_campaign_id": str(campaign_id),
-        }).execute()
+        }))
         return response.data if response.data else {
             "event_count": 0,
             "events_by_type": {},
@@ -115,12 +114,11 @@ class CampaignService(BaseService):
         campaign_id: UUID,
     ) -> list[dict]:
         """Get metrics for a campaign."""
-        response = (
+        response = await run_query(
             supabase.table("campaign_metrics")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("campaign_id", str(campaign_id))
             .order("measured_at", desc=True)
-            .execute()
         )
         return response.data or []
@@ -1,21 +1,70 @@
-"""Chat AI service with conversation memory and group chat support."""
+"""Chat AI service with conversation memory, group chat support and streamed responses."""
 
 from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator, Coroutine
 from uuid import UUID
 
 from backend.services.agent_memory_service import AgentMemoryService
 from backend.services.external.openrouter import OpenRouterService
-from backend.services.model_resolver import ModelResolver
-from backend.services.prompt_service import LOCALE_NAMES, PromptResolver
+from backend.services.model_resolver import ModelResolver, ResolvedModel
+from backend.services.prompt_service import LOCALE_NAMES, PromptResolver, get_content_locale
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
 
 MAX_MEMORY_MESSAGES = 50
 
+_background: set[asyncio.Task] = set()
+
+
+def _spawn(coro: Coroutine) -> None:
+    """Run ``coro`` after the response without awaiting it (keeps a reference until done)."""
+    task = asyncio.create_task(coro)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+async def drain() -> None:
+    """Wait for detached responses and memory extraction (graceful shutdown, tests)."""
+    while _background:
+        await asyncio.gather(*list(_background), return_exceptions=True)
+
+
+async def _detached(events: AsyncIterator[tuple[str, dict]]) -> AsyncIterator[tuple[str, dict]]:
+    """Relay ``events`` from a background task that runs to completion on its own.
+
+    The reply is stored (and memory extraction spawned) after the last token;
+    if the client disconnects mid-stream only this relay stops, so the
+    agent's reply is still saved.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    end = object()
+    listening = True
+
+    async def pump() -> None:
+        try:
+            async for item in events:
+                queue.put_nowait(item)
+        except Exception as exc:
+            if not listening:
+                logger.warning("Detached chat response failed", exc_info=True)
+            queue.put_nowait(exc)
+        else:
+            queue.put_nowait(end)
+
+    _spawn(pump())
+    try:
+        while (item := await queue.get()) is not end:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        listening = False
+
 
 class ChatAIService:
     """Generates AI responses for chat conversations.
@@ -45,6 +94,63 @@ class ChatAIService:
 
         Returns the generated response text.
         """
+        parts = [
+            data["content"]
+            async for event, data in self._respond(conversation_id, user_message, stream=False)
+            if event == "delta"
+        ]
+        return "".join(parts)
+
+    async def stream_response(
+        self,
+        conversation_id: UUID,
+        user_message: str,
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Stream an AI response for a single-agent conversation.
+
+        Yields ``("delta", {"agent_id", "content"})`` as tokens arrive, then
+        ``("message", saved_message)`` once the full response is stored. The
+        response keeps generating and is stored even if the consumer stops.
+        """
+        async for item in _detached(self._respond(conversation_id, user_message, stream=True)):
+            yield item
+
+    async def generate_group_response(
+        self,
+        conversation_id: UUID,
+        user_message: str,
+    ) -> list[dict]:
+        """Generate AI responses for all agents in a group conversation.
+
+        Each agent responds sequentially, seeing previous agents' responses.
+        Returns list of saved message dicts.
+        """
+        return [
+            data
+            async for event, data in self._respond_group(conversation_id, user_message, stream=False)
+            if event == "message"
+        ]
+
+    async def stream_group_response(
+        self,
+        conversation_id: UUID,
+        user_message: str,
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Stream the group responses: each agent's deltas, then its saved message.
+
+        Like ``stream_response``, every agent's reply is generated and stored
+        even if the consumer stops.
+        """
+        async for item in _detached(self._respond_group(conversation_id, user_message, stream=True)):
+            yield item
+
+    async def _respond(
+        self,
+        conversation_id: UUID,
+        user_message: str,
+        *,
+        stream: bool,
+    ) -> AsyncIterator[tuple[str, dict]]:
         conversation = await self._load_conversation(conversation_id)
         agent = await self._load_agent(conversation["agent_id"])
         simulation = await self._load_simulation()
@@ -71,15 +177,14 @@ class ChatAIService:
         messages.append({"role": "user", "content": user_message})
 
         model = await self._model_resolver.resolve_text_model("chat_response")
-        response_text = await self._openrouter.generate(
-            model=model.model_id,
-            messages=messages,
-            temperature=model.temperature,
-            max_tokens=model.max_tokens,
-        )
+        parts: list[str] = []
+        async for delta in self._complete(model, messages, stream=stream):
+            parts.append(delta)
+            yield "delta", {"agent_id": conversation.get("agent_id"), "content": delta}
+        response_text = "".join(parts)
 
         # Save with agent_id attribution
-        self._supabase.table("chat_messages").insert({
+        save_resp = await run_query(self._supabase.table("chat_messages").insert({
             "conversation_id": str(conversation_id),
             "content": response_text,
             "sender_role": "assistant",
@@ -88,26 +193,24 @@ class ChatAIService:
                 "model": model.model_id,
                 "source": model.source,
             },
-        }).execute()
+        }))
 
         # Fire-and-forget: extract memorable observations from this exchange
-        asyncio.create_task(AgentMemoryService.extract_from_chat(
+        _spawn(AgentMemoryService.extract_from_chat(
             self._supabase, self._simulation_id, UUID(agent["id"]),
             user_message, response_text,
         ))
 
-        return response_text
+        if save_resp.data:
+            yield "message", save_resp.data[0]
 
-    async def generate_group_response(
+    async def _respond_group(
         self,
         conversation_id: UUID,
         user_message: str,
-    ) -> list[dict]:
-        """Generate AI responses for all agents in a group conversation.
-
-        Each agent responds sequentially, seeing previous agents' responses.
-        Returns list of saved message dicts.
-        """
+        *,
+        stream: bool,
+    ) -> AsyncIterator[tuple[str, dict]]:
         # Load context
         agents = await self._load_conversation_agents(conversation_id)
         event_refs = await self._load_event_references(conversation_id)
@@ -171,15 +274,14 @@ class ChatAIService:
                 messages.append({"role": "assistant", "content": f"{prefix}{prev_msg['content']}"})
 
             # Generate
-            response_text = await self._openrouter.generate(
-                model=model.model_id,
-                messages=messages,
-                temperature=model.temperature,
-                max_tokens=model.max_tokens,
-            )
+            parts: list[str] = []
+            async for delta in self._complete(model, messages, stream=stream):
+                parts.append(delta)
+                yield "delta", {"agent_id": str(agent["id"]), "content": delta}
+            response_text = "".join(parts)
 
             # Save with agent attribution
-            save_resp = self._supabase.table("chat_messages").insert({
+            save_resp = await run_query(self._supabase.table("chat_messages").insert({
                 "conversation_id": str(conversation_id),
                 "content": response_text,
                 "sender_role": "assistant",
@@ -189,12 +291,35 @@ class ChatAIService:
                     "source": model.source,
                     "group_turn_index": idx,
                 },
-            }).execute()
+            }))
 
             if save_resp.data:
                 saved_messages.append(save_resp.data[0])
+                yield "message", save_resp.data[0]
 
-        return saved_messages
+    async def _complete(
+        self,
+        model: ResolvedModel,
+        messages: list[dict[str, str]],
+        *,
+        stream: bool,
+    ) -> AsyncIterator[str]:
+        """The response as deltas (streamed) or as one piece (``stream=False``)."""
+        if stream:
+            async for delta in self._openrouter.stream(
+                model=model.model_id,
+                messages=messages,
+                temperature=model.temperature,
+                max_tokens=model.max_tokens,
+            ):
+                yield delta
+        else:
+            yield await self._openrouter.generate(
+                model=model.model_id,
+                messages=messages,
+                temperature=model.temperature,
+                max_tokens=model.max_tokens,
+            )
 
     @staticmethod
     def _build_agent_variables(agent: dict, simulation: dict, locale: str) -> dict[str, str]:
@@ -275,23 +400,21 @@ class ChatAIService:
         """Load reactions from event_reactions for the referenced events and agents."""
         if not event_ids or not agent_ids:
             return []
-        response = (
+        response = await run_query(
             self._supabase.table("event_reactions")
             .select("agent_name, reaction_text, emotion, event_id, agent_id")
             .in_("event_id", event_ids)
             .in_("agent_id", agent_ids)
-            .execute()
         )
         return response.data or []
 
     async def _load_conversation(self, conversation_id: UUID) -> dict:
         """Load conversation details."""
-        response = (
+        response = await run_query(
             self._supabase.table("chat_conversations")
             .select("*")
             .eq("id", str(conversation_id))
             .limit(1)
-            .execute()
         )
         if not response or not response.data:
             msg = f"Conversation {conversation_id} not found"
@@ -300,18 +423,17 @@ class ChatAIService:
 
     async def _load_agent(self, agent_id: str) -> dict:
         """Load agent profile."""
-        response = (
+        response = await run_query(
             self._supabase.table("agents")
             .select("id, name, character, background, system, gender, primary_profession")
             .eq("id", agent_id)
             .limit(1)
-            .execute()
         )
         return response.data[0] if response and response.data else {}
 
     async def _load_conversation_agents(self, conversation_id: UUID) -> list[dict]:
         """Load all agents for a conversation via junction table with full profiles."""
-        response = (
+        response = await run_query(
             self._supabase.table("chat_conversation_agents")
             .select(
                 "agent_id, agents(id, name, character, background, system, gender,"
@@ -319,7 +441,6 @@ class ChatAIService:
             )
             .eq("conversation_id", str(conversation_id))
             .order("added_at")
-            .execute()
         )
         agents = []
         for row in response.data or []:
@@ -330,48 +451,35 @@ class ChatAIService:
 
     async def _load_event_references(self, conversation_id: UUID) -> list[dict]:
         """Load event references for a conversation."""
-        response = (
+        response = await run_query(
             self._supabase.table("chat_event_references")
             .select("id, event_id, events(title, event_type, description, occurred_at, impact_level)")
             .eq("conversation_id", str(conversation_id))
             .order("referenced_at")
-            .execute()
         )
         return response.data or []
 
     async def _load_simulation(self) -> dict:
         """Load simulation details."""
-        response = (
+        response = await run_query(
             self._supabase.table("simulations")
             .select("name, description")
             .eq("id", str(self._simulation_id))
             .limit(1)
-            .execute()
         )
         return response.data[0] if response and response.data else {}
 
     async def _load_history(self, conversation_id: UUID) -> list[dict]:
         """Load the last N messages from conversation history."""
-        response = (
+        response = await run_query(
             self._supabase.table("chat_messages")
             .select("content, sender_role, agent_id, created_at")
             .eq("conversation_id", str(conversation_id))
             .order("created_at", desc=False)
             .limit(MAX_MEMORY_MESSAGES)
-            .execute()
         )
         return response.data or []
 
     async def _get_locale(self) -> str:
         """Get the simulation's content locale."""
-        response = (
-            self._supabase.table("simulation_settings")
-            .select("setting_value")
-            .eq("simulation_id", str(self._simulation_id))
-            .eq("setting_key", "general.content_locale")
-            .limit(1)
-            .execute()
-        )
-        if response and response.data:
-            return str(response.data[0].get("setting_value", "de"))
-        return "de"
+        return await get_content_locale(self._supabase, self._simulation_id) or "de"
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -18,13 +19,12 @@ class ChatService:
         user_id: UUID,
     ) -> list[dict]:
         """List all conversations for the current user in a simulation."""
-        response = (
+        response = await run_query(
             supabase.table("chat_conversations")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("user_id", str(user_id))
             .order("last_message_at", desc=True)
-            .execute()
         )
         conversations = response.data or []
 
@@ -46,12 +46,11 @@ class ChatService:
         conversation_id: str,
     ) -> list[dict]:
         """Load agents for a conversation via junction table."""
-        response = (
+        response = await run_query(
             supabase.table("chat_conversation_agents")
             .select("agent_id, agents(id, name, portrait_image_url)")
             .eq("conversation_id", conversation_id)
             .order("added_at")
-            .execute()
         )
         agents = []
         for row in response.data or []:
@@ -66,12 +65,11 @@ class ChatService:
         conversation_id: str,
     ) -> list[dict]:
         """Load event references for a conversation."""
-        response = (
+        response = await run_query(
             supabase.table("chat_event_references")
             .select("id, event_id, referenced_at, events(title, event_type, description, occurred_at, impact_level)")
             .eq("conversation_id", conversation_id)
             .order("referenced_at")
-            .execute()
         )
         refs = []
         for row in response.data or []:
@@ -98,7 +96,7 @@ class ChatService:
     ) -> dict:
         """Create a new conversation with one or more agents."""
         # Create the conversation (agent_id set to first agent for backwards compat)
-        response = (
+        response = await run_query(
             supabase.table("chat_conversations")
             .insert({
                 "simulation_id": str(simulation_id),
@@ -106,7 +104,6 @@ class ChatService:
                 "agent_id": str(agent_ids[0]),
                 "title": title,
             })
-            .execute()
         )
 
         if not response.data:
@@ -125,7 +122,7 @@ class ChatService:
             }
             for aid in agent_ids
         ]
-        supabase.table("chat_conversation_agents").insert(junction_rows).execute()
+        await run_query(supabase.table("chat_conversation_agents").insert(junction_rows))
 
         # Load agents for response
         conversation["agents"] = await ChatService._load_conversation_agents(
@@ -155,7 +152,7 @@ class ChatService:
         if before:
             query = query.lt("created_at", before)
 
-        response = query.execute()
+        response = await run_query(query)
         data = response.data or []
 
         # Flatten agent join into agent field
@@ -187,10 +184,9 @@ class ChatService:
         if agent_id:
             insert_data["agent_id"] = str(agent_id)
 
-        response = (
+        response = await run_query(
             supabase.table("chat_messages")
             .insert(insert_data)
-            .execute()
         )
 
         if not response.data:
@@ -200,9 +196,9 @@ class ChatService:
             )
 
         # Also update last_message_at on the conversation
-        supabase.table("chat_conversations").update({
+        await run_query(supabase.table("chat_conversations").update({
             "last_message_at": datetime.now(UTC).isoformat(),
-        }).eq("id", str(conversation_id)).execute()
+        }).eq("id", str(conversation_id)))
 
         return response.data[0]
 
@@ -213,13 +209,12 @@ class ChatService:
         agent_id: UUID,
     ) -> dict:
         """Add an agent to a conversation."""
-        response = (
+        response = await run_query(
             supabase.table("chat_conversation_agents")
             .insert({
                 "conversation_id": str(conversation_id),
                 "agent_id": str(agent_id),
             })
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -236,11 +231,10 @@ class ChatService:
     ) -> None:
         """Remove an agent from a conversation (at least 1 must remain)."""
         # Check count
-        count_resp = (
+        count_resp = await run_query(
             supabase.table("chat_conversation_agents")
             .select("id", count="exact")
             .eq("conversation_id", str(conversation_id))
-            .execute()
         )
         if count_resp.count is not None and count_resp.count <= 1:
             raise HTTPException(
@@ -248,9 +242,9 @@ class ChatService:
                 detail="Cannot remove last agent from conversation.",
             )
 
-        supabase.table("chat_conversation_agents").delete().eq(
+        await run_query(supabase.table("chat_conversation_agents").delete().eq(
             "conversation_id", str(conversation_id),
-        ).eq("agent_id", str(agent_id)).execute()
+        ).eq("agent_id", str(agent_id)))
 
     @staticmethod
     async def add_event_reference(
@@ -260,14 +254,13 @@ class ChatService:
         user_id: UUID,
     ) -> dict:
         """Add an event reference to a conversation."""
-        response = (
+        response = await run_query(
             supabase.table("chat_event_references")
             .insert({
                 "conversation_id": str(conversation_id),
                 "event_id": str(event_id),
                 "referenced_by": str(user_id),
             })
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -277,12 +270,11 @@ class ChatService:
 
         # Load the event details for the response
         ref = response.data[0]
-        event_resp = (
+        event_resp = await run_query(
             supabase.table("events")
             .select("title, event_type, description, occurred_at, impact_level")
             .eq("id", str(event_id))
             .limit(1)
-            .execute()
         )
         event_data = event_resp.data[0] if event_resp.data else {}
 
@@ -304,9 +296,9 @@ class ChatService:
         event_id: UUID,
     ) -> None:
         """Remove an event reference from a conversation."""
-        supabase.table("chat_event_references").delete().eq(
+        await run_query(supabase.table("chat_event_references").delete().eq(
             "conversation_id", str(conversation_id),
-        ).eq("event_id", str(event_id)).execute()
+        ).eq("event_id", str(event_id)))
 
     @staticmethod
     async def get_event_references(
@@ -322,11 +314,10 @@ class ChatService:
         conversation_id: UUID,
     ) -> dict:
         """Archive a conversation."""
-        response = (
+        response = await run_query(
             supabase.table("chat_conversations")
             .update({"status": "archived", "updated_at": datetime.now(UTC).isoformat()})
             .eq("id", str(conversation_id))
-            .execute()
         )
 
         if not response.data:
@@ -344,11 +335,10 @@ class ChatService:
     ) -> dict:
         """Permanently delete a conversation and all its messages (CASCADE)."""
         # Fetch conversation first to return it
-        fetch = (
+        fetch = await run_query(
             supabase.table("chat_conversations")
             .select("*")
             .eq("id", str(conversation_id))
-            .execute()
         )
 
         if not fetch.data:
@@ -360,8 +350,8 @@ class ChatService:
         conversation = fetch.data[0]
 
         # Delete (messages cascade automatically)
-        supabase.table("chat_conversations").delete().eq(
+        await run_query(supabase.table("chat_conversations").delete().eq(
             "id", str(conversation_id),
-        ).execute()
+        ))
 
         return conversation
@@ -10,6 +10,7 @@ from uuid import UUID
 from backend.config import settings
 from backend.services.generation_service import GenerationService
 from backend.services.translation_service import schedule_auto_translation
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -41,14 +42,14 @@ class ChronicleService:
         period_end: datetime,
     ) -> dict:
         """Fetch aggregated chronicle source data via Postgres function."""
-        response = supabase.rpc(
+        response = await run_query(supabase.rpc(
             "get_chronicle_source_data",
             {
                 "p_simulation_id": str(simulation_id),
                 "p_period_start": period_start.isoformat(),
                 "p_period_end": period_end.isoformat(),
             },
-        ).execute()
+        ))
         return response.data if response.data else {
             "events": [],
             "echoes": [],
@@ -69,13 +70,12 @@ class ChronicleService:
     ) -> dict:
         """Generate a new chronicle edition."""
         # Get next edition number
-        max_resp = (
+        max_resp = await run_query(
             supabase.table("simulation_chronicles")
             .select("edition_number")
             .eq("simulation_id", str(simulation_id))
             .order("edition_number", desc=True)
             .limit(1)
-            .execute()
         )
         next_edition = (max_resp.data[0]["edition_number"] + 1) if max_resp.data else 1
 
@@ -93,19 +93,18 @@ class ChronicleService:
                 "content": MOCK_CHRONICLE["content"],
                 "model_used": "mock",
             }
-            resp = supabase.table("simulation_chronicles").insert(record).execute()
+            resp = await run_query(supabase.table("simulation_chronicles").insert(record))
             return resp.data[0]
 
         # Fetch source data
         source = await cls.get_source_data(supabase, simulation_id, period_start, period_end)
 
         # Get simulation name for prompt
-        sim_resp = (
+        sim_resp = await run_query(
             supabase.table("simulations")
             .select("name, theme")
             .eq("id", str(simulation_id))
             .limit(1)
-            .execute()
         )
         sim_name = sim_resp.data[0]["name"] if sim_resp.data else "Unknown"
         sim_theme = sim_resp.data[0].get("theme", "dystopian") if sim_resp.data else "dystopian"
@@ -146,7 +145,7 @@ class ChronicleService:
             "content": content,
             "model_used": result.get("model_used"),
         }
-        resp = supabase.table("simulation_chronicles").insert(record).execute()
+        resp = await run_query(supabase.table("simulation_chronicles").insert(record))
         saved = resp.data[0]
 
         # Fire-and-forget translation
@@ -171,13 +170,12 @@ class ChronicleService:
         offset: int = 0,
     ) -> tuple[list, int]:
         """List chronicle editions, paginated."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_chronicles")
             .select("*", count="exact")
             .eq("simulation_id", str(simulation_id))
             .order("edition_number", desc=True)
             .range(offset, offset + limit - 1)
-            .execute()
         )
         data = response.data or []
         total = response.count if response.count is not None else len(data)
@@ -191,13 +189,12 @@ class ChronicleService:
         chronicle_id: UUID,
     ) -> dict:
         """Get a single chronicle edition."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_chronicles")
             .select("*")
             .eq("id", str(chronicle_id))
             .eq("simulation_id", str(simulation_id))
             .limit(1)
-            .execute()
         )
         if not response.data:
             from fastapi import HTTPException, status
@@ -18,6 +18,7 @@ from backend.models.cleanup import (
     CleanupStats,
     CleanupType,
 )
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -110,7 +111,7 @@ class CleanupService:
 
         # Best-effort audit log entry
         try:
-            admin_supabase.table("audit_log").insert({
+            await run_query(admin_supabase.table("audit_log").insert({
                 "entity_type": "cleanup",
                 "entity_id": None,
                 "action": "delete",
@@ -121,7 +122,7 @@ class CleanupService:
                     "deleted_count": result.deleted_count,
                     "cascade_counts": result.cascade_counts,
                 },
-            }).execute()
+            }))
         except Exception:
             logger.warning("Failed to audit cleanup operation", exc_info=True)
 
@@ -142,12 +143,11 @@ class CleanupService:
         cls, admin_supabase: Client, status: str, cutoff: datetime,
     ) -> list[str]:
         """Get epoch IDs matching status + age cutoff."""
-        resp = (
+        resp = await run_query(
             admin_supabase.table("game_epochs")
             .select("id")
             .eq("status", status)
             .lt("updated_at", cutoff.isoformat())
-            .execute()
         )
         return [row["id"] for row in (resp.data or [])]
 
@@ -161,25 +161,23 @@ class CleanupService:
 
         cascade_counts: dict[str, int] = {}
         for table in _EPOCH_CASCADE_TABLES:
-            resp = (
+            resp = await run_query(
                 admin_supabase.table(table)
                 .select("id", count="exact")
                 .in_("epoch_id", epoch_ids)
                 .limit(0)
-                .execute()
             )
             count = resp.count or 0
             if count > 0:
                 cascade_counts[table] = count
 
         # Game instance simulations
-        resp = (
+        resp = await run_query(
             admin_supabase.table("simulations")
             .select("id", count="exact")
             .in_("epoch_id", epoch_ids)
             .in_("simulation_type", ["game_instance", "archived"])
             .limit(0)
-            .execute()
         )
         instance_count = resp.count or 0
         if instance_count > 0:
@@ -227,14 +225,14 @@ class CleanupService:
         cascade_counts = await cls._count_cascade_targets(admin_supabase, epoch_ids)
 
         # Step 1: Delete game instance simulations first (ON DELETE SET NULL on epoch_id)
-        admin_supabase.table("simulations").delete().in_(
+        await run_query(admin_supabase.table("simulations").delete().in_(
             "epoch_id", epoch_ids,
         ).in_(
             "simulation_type", ["game_instance", "archived"],
-        ).execute()
+        ))
 
         # Step 2: Delete epoch rows — child tables cascade automatically
-        admin_supabase.table("game_epochs").delete().in_("id", epoch_ids).execute()
+        await run_query(admin_supabase.table("game_epochs").delete().in_("id", epoch_ids))
 
         logger.info(
             "Cleanup completed",
@@ -254,13 +252,12 @@ class CleanupService:
     async def _preview_archived_instances(
         cls, admin_supabase: Client, cutoff: datetime, min_age_days: int,
     ) -> CleanupPreviewResult:
-        resp = (
+        resp = await run_query(
             admin_supabase.table("simulations")
             .select("id", count="exact")
             .eq("simulation_type", "archived")
             .lt("updated_at", cutoff.isoformat())
             .limit(0)
-            .execute()
         )
         return CleanupPreviewResult(
             cleanup_type="archived_instances",
@@ -272,19 +269,18 @@ class CleanupService:
     async def _execute_archived_instances(
         cls, admin_supabase: Client, cutoff: datetime, min_age_days: int,
     ) -> CleanupExecuteResult:
-        resp = (
+        resp = await run_query(
             admin_supabase.table("simulations")
             .select("id", count="exact")
             .eq("simulation_type", "archived")
             .lt("updated_at", cutoff.isoformat())
-            .execute()
         )
         deleted = len(resp.data or [])
 
         if deleted > 0:
-            admin_supabase.table("simulations").delete().eq(
+            await run_query(admin_supabase.table("simulations").delete().eq(
                 "simulation_type", "archived",
-            ).lt("updated_at", cutoff.isoformat()).execute()
+            ).lt("updated_at", cutoff.isoformat()))
 
         return CleanupExecuteResult(
             cleanup_type="archived_instances",
@@ -304,12 +300,11 @@ class CleanupService:
         cleanup_type: CleanupType,
         min_age_days: int,
     ) -> CleanupPreviewResult:
-        resp = (
+        resp = await run_query(
             admin_supabase.table(table)
             .select("id", count="exact")
             .lt(date_column, cutoff.isoformat())
             .limit(0)
-            .execute()
         )
         return CleanupPreviewResult(
             cleanup_type=cleanup_type,
@@ -327,18 +322,17 @@ class CleanupService:
         cleanup_type: CleanupType,
         min_age_days: int,
     ) -> CleanupExecuteResult:
-        resp = (
+        resp = await run_query(
             admin_supabase.table(table)
             .select("id", count="exact")
             .lt(date_column, cutoff.isoformat())
-            .execute()
         )
         count = len(resp.data or [])
 
         if count > 0:
-            admin_supabase.table(table).delete().lt(
+            await run_query(admin_supabase.table(table).delete().lt(
                 date_column, cutoff.isoformat(),
-            ).execute()
+            ))
 
         return CleanupExecuteResult(
             cleanup_type=cleanup_type,
@@ -352,13 +346,12 @@ class CleanupService:
     async def _count_epochs(
         cls, admin_supabase: Client, status: str,
     ) -> CleanupCategoryStats:
-        resp = (
+        resp = await run_query(
             admin_supabase.table("game_epochs")
             .select("id,updated_at", count="exact")
             .eq("status", status)
             .order("updated_at", desc=False)
             .limit(1)
-            .execute()
         )
         count = resp.count or 0
         oldest = resp.data[0]["updated_at"] if resp.data else None
@@ -368,13 +361,12 @@ class CleanupService:
     async def _count_archived_instances(
         cls, admin_supabase: Client,
     ) -> CleanupCategoryStats:
-        resp = (
+        resp = await run_query(
             admin_supabase.table("simulations")
             .select("id,updated_at", count="exact")
             .eq("simulation_type", "archived")
             .order("updated_at", desc=False)
             .limit(1)
-            .execute()
         )
         count = resp.count or 0
         oldest = resp.data[0]["updated_at"] if resp.data else None
@@ -384,12 +376,11 @@ class CleanupService:
     async def _count_table(
         cls, admin_supabase: Client, table: str, date_column: str,
     ) -> CleanupCategoryStats:
-        resp = (
+        resp = await run_query(
             admin_supabase.table(table)
             .select("id," + date_column, count="exact")
             .order(date_column, desc=False)
             .limit(1)
-            .execute()
         )
         count = resp.count or 0
         oldest = resp.data[0][date_column] if resp.data else None
@@ -2,12 +2,15 @@
 
 Sends tactical briefing emails to human players when cycles resolve,
 phases change, or epochs complete. Respects fog-of-war and notification
-preferences. Uses SMTP for delivery. Supports single-language rendering
-via email_locale and per-simulation accent colors.
+preferences. Messages are queued on the shared SMTP delivery queue
+(``EmailService.submit``) while the next one is built. Supports
+single-language rendering via email_locale and per-simulation accent colors.
 """
 
 import asyncio
 import logging
+from collections import defaultdict
+from dataclasses import dataclass
 
 from backend.services.email_service import EmailService
 from backend.services.email_templates import (
@@ -16,12 +19,191 @@ from backend.services.email_templates import (
     render_epoch_completed,
     render_phase_change,
 )
+from backend.utils.db import fetch_all, gather_queries, run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
 
-# Sequential send delay between emails (ms)
-_SEND_DELAY_MS = 200
+_DIMENSIONS = ("stability", "influence", "sovereignty", "diplomatic", "military")
+_RESOLVED_STATUSES = ("success", "failed", "detected", "captured")
+
+
+@dataclass
+class BriefingSnapshot:
+    """Epoch-wide data for one cycle's briefing emails, loaded once.
+
+    ``player_briefing`` derives each recipient's fog-of-war view in memory:
+    their own scores and rank, their own missions, inbound operations that
+    were detected, intel they earned, and their alliance.
+    """
+
+    cycle_number: int
+    current_scores: list[dict]  # composite desc
+    prev_scores: list[dict]  # composite desc
+    missions: list[dict]
+    participants: dict[str, dict]  # simulation_id → {current_rp, team_id, simulations}
+    team_names: dict[str, str]  # active (undissolved) teams
+    sim_names: dict[str, str]
+    intel_reports: list[dict]  # newest first
+    public_events: list[dict]
+
+    def player_briefing(
+        self,
+        simulation_id: str,
+        epoch_name: str,
+        epoch_status: str,
+        *,
+        epoch_config: dict | None = None,
+        command_center_url: str = "https://metaverse.center/epoch",
+        simulation_slug: str = "",
+    ) -> dict:
+        """Fog-of-war compliant briefing data for a single player.
+
+        Returns dict with: rank, composite, delta, dimensions, operatives, rp, public_events,
+        threats, spy_intel, missions, rank_gap, alliance info, next cycle preview
+        """
+        config = epoch_config or {}
+        accent = get_sim_accent(simulation_slug)
+        current_scores = self.current_scores
+
+        # Find this player's score and rank (current and previous cycle)
+        player_rank, player_score = next(
+            ((idx, s) for idx, s in enumerate(current_scores, start=1) if s["simulation_id"] == simulation_id),
+            (0, None),
+        )
+        prev_rank, prev_score = next(
+            ((idx, s) for idx, s in enumerate(self.prev_scores, start=1) if s["simulation_id"] == simulation_id),
+            (0, {}),
+        )
+
+        dim_data = []
+        if player_score:
+            for dim in _DIMENSIONS:
+                col = f"{dim}_score"
+                current_val = float(player_score.get(col, 0))
+                prev_val = float(prev_score.get(col, 0)) if prev_score else 0
+                dim_data.append({
+                    "name": dim,
+                    "value": round(current_val, 1),
+                    "delta": round(current_val - prev_val, 1),
+                })
+
+        composite = float(player_score["composite_score"]) if player_score else 0
+        prev_composite = float(prev_score.get("composite_score", 0)) if prev_score else 0
+
+        # ── Operative missions with per-mission detail (B7) ──
+        ops = [m for m in self.missions if m.get("source_simulation_id") == simulation_id]
+        active_ops = sum(1 for o in ops if o["status"] == "active")
+        resolved_ops = [o for o in ops if o["status"] in _RESOLVED_STATUSES]
+        success_ops = sum(1 for o in resolved_ops if o["status"] == "success")
+        detected_ops = sum(1 for o in resolved_ops if o["status"] in ("detected", "captured"))
+        guardians = sum(1 for o in ops if o["operative_type"] == "guardian" and o["status"] == "active")
+        counter_intel = sum(1 for o in ops if o["operative_type"] == "counter_intel" and o["status"] == "active")
+
+        mission_details = [
+            {
+                "type": o["operative_type"],
+                "target_name": self.sim_names.get(o.get("target_simulation_id") or "", "?"),
+                "status": o["status"],
+            }
+            for o in ops
+            # Defensive ops shown in summary, not mission log
+            if o["operative_type"] not in ("guardian", "counter_intel")
+        ]
+
+        # ── RP balance ──
+        participant = self.participants.get(simulation_id) or {}
+        rp_balance = participant.get("current_rp", 0)
+        player_team_id = participant.get("team_id")
+
+        # ── Threat assessment (B1) — detected inbound ops ──
+        threats = [
+            {
+                "type": m["operative_type"],
+                "status": m["status"],
+                "source_name": self.sim_names.get(m["source_simulation_id"], "Unknown"),
+            }
+            for m in self.missions
+            if m.get("target_simulation_id") == simulation_id and m["status"] in ("detected", "captured")
+        ]
+
+        # ── Spy intel digest (B2) — earned intelligence this cycle ──
+        spy_intel = [
+            {
+                "narrative": e["narrative"],
+                "metadata": e.get("metadata") or {},
+                "target_name": self.sim_names.get(e.get("target_simulation_id") or "", ""),
+            }
+            for e in self.intel_reports
+            if e.get("source_simulation_id") == simulation_id
+        ][:5]
+
+        # ── Alliance status (B6) ──
+        alliance_name = self.team_names.get(player_team_id) if player_team_id else None
+        ally_names: list[str] = []
+        if alliance_name:
+            ally_names = [
+                (p.get("simulations") or {}).get("name", "?")
+                for sim_id, p in self.participants.items()
+                if p.get("team_id") == player_team_id and sim_id != simulation_id
+            ]
+
+        # ── Rank gap (B3) ──
+        rank_gap = None
+        if player_rank == 1 and len(current_scores) > 1:
+            gap = round(composite - float(current_scores[1]["composite_score"]), 1)
+            rank_gap = {
+                "en": f"Leading by {gap} points",
+                "de": f"F\u00fchrt mit {gap} Punkten Vorsprung",
+            }
+        elif player_rank > 1 and current_scores:
+            gap = round(float(current_scores[player_rank - 2]["composite_score"]) - composite, 1)
+            ahead_rank = player_rank - 1
+            rank_gap = {
+                "en": f"{gap} points behind #{ahead_rank}",
+                "de": f"{gap} Punkte hinter #{ahead_rank}",
+            }
+
+        # ── Next cycle preview (B4) ──
+        rp_per_cycle = config.get("rp_per_cycle", 12)
+        rp_cap = config.get("rp_cap", 40)
+        projected_rp = min(rp_balance + rp_per_cycle, rp_cap)
+        rp_projection = f"+{rp_per_cycle} \u2192 {projected_rp} / {rp_cap}"
+
+        return {
+            "epoch_name": epoch_name,
+            "epoch_status": epoch_status,
+            "cycle_number": self.cycle_number,
+            "rank": player_rank,
+            "prev_rank": prev_rank,
+            "total_players": len(current_scores),
+            "composite": round(composite, 1),
+            "composite_delta": round(composite - prev_composite, 1),
+            "dimensions": dim_data,
+            "rp_balance": rp_balance,
+            "rp_cap": rp_cap,
+            "active_ops": active_ops,
+            "resolved_ops": len(resolved_ops),
+            "success_ops": success_ops,
+            "detected_ops": detected_ops,
+            "guardians": guardians,
+            "counter_intel": counter_intel,
+            "public_events": self.public_events,
+            "command_center_url": command_center_url,
+            # Enrichment data
+            "accent_color": accent,
+            "simulation_slug": simulation_slug,
+            "missions": mission_details,
+            "threats": threats,
+            "has_threat_data": True,
+            "spy_intel": spy_intel,
+            "rank_gap": rank_gap,
+            "alliance_name": alliance_name,
+            "ally_names": ally_names,
+            "alliance_bonus_active": alliance_name is not None,
+            "next_cycle_missions": active_ops,
+            "next_cycle_rp_projection": rp_projection,
+        }
 
 
 class CycleNotificationService:
@@ -44,12 +226,11 @@ class CycleNotificationService:
         Returns list of dicts: {user_id, email, simulation_id, simulation_name, simulation_slug, email_locale}
         """
         # 1. Get human participants (not bots) with simulation info
-        participants_resp = (
+        participants_resp = await run_query(
             admin_supabase.table("epoch_participants")
             .select("simulation_id, is_bot, simulations(name, slug, source_template_id)")
             .eq("epoch_id", epoch_id)
             .eq("is_bot", False)
-            .execute()
         )
         participants = participants_resp.data or []
         if not participants:
@@ -70,12 +251,11 @@ class CycleNotificationService:
         template_ids = list(template_to_participant.keys())
 
         # Batch fetch members (editors+) for all template simulations
-        members_resp = (
+        members_resp = await run_query(
             admin_supabase.table("simulation_members")
             .select("user_id, simulation_id")
             .in_("simulation_id", template_ids)
             .in_("member_role", ["editor", "admin", "owner"])
-            .execute()
         )
         members = members_resp.data or []
         if not members:
@@ -83,19 +263,18 @@ class CycleNotificationService:
 
         # 3. Get email addresses via SECURITY DEFINER RPC
         user_ids = list({m["user_id"] for m in members})
-        email_resp = admin_supabase.rpc(
+        email_resp = await run_query(admin_supabase.rpc(
             "get_user_emails_batch", {"user_ids": user_ids}
-        ).execute()
+        ))
         email_map: dict[str, str] = {
             row["id"]: row["email"] for row in (email_resp.data or [])
         }
 
         # 4. Get notification preferences (batch)
-        prefs_resp = (
+        prefs_resp = await run_query(
             admin_supabase.table("notification_preferences")
             .select("user_id, cycle_resolved, phase_changed, epoch_completed, email_locale")
             .in_("user_id", user_ids)
-            .execute()
         )
         prefs_map: dict[str, dict] = {
             row["user_id"]: row for row in (prefs_resp.data or [])
@@ -105,11 +284,10 @@ class CycleNotificationService:
         # The game instance slug may not be the right one — get the template slug
         template_slugs: dict[str, str] = {}
         if template_ids:
-            slug_resp = (
+            slug_resp = await run_query(
                 admin_supabase.table("simulations")
                 .select("id, slug")
                 .in_("id", template_ids)
-                .execute()
             )
             template_slugs = {s["id"]: s.get("slug", "") for s in (slug_resp.data or [])}
 
@@ -143,342 +321,122 @@ class CycleNotificationService:
     # ── Player Briefing Data ───────────────────────────────
 
     @classmethod
-    async def _build_player_briefing(
+    async def _load_briefing_snapshot(
         cls,
         admin_supabase: Client,
         epoch_id: str,
-        simulation_id: str,
         cycle_number: int,
-        epoch_name: str,
-        epoch_status: str,
-        *,
-        epoch_config: dict | None = None,
-        command_center_url: str = "https://metaverse.center/epoch",
-        simulation_slug: str = "",
-    ) -> dict:
-        """Gather fog-of-war compliant briefing data for a single player.
-
-        Returns dict with: rank, composite, delta, dimensions, operatives, rp, public_events,
-        threats, spy_intel, missions, rank_gap, alliance info, next cycle preview
-        """
-        config = epoch_config or {}
-        accent = get_sim_accent(simulation_slug)
-
-        # Current cycle scores
-        current_resp = (
+    ) -> BriefingSnapshot:
+        """Load everything the cycle's briefings need in a constant number of queries."""
+        prev_cycle = cycle_number - 1
+        queries = [
+            # Current cycle scores
             admin_supabase.table("epoch_scores")
             .select("*")
             .eq("epoch_id", epoch_id)
             .eq("cycle_number", cycle_number)
-            .order("composite_score", desc=True)
-            .execute()
-        )
-        current_scores = current_resp.data or []
-
-        # Previous cycle scores (for deltas)
-        prev_cycle = cycle_number - 1
-        prev_scores_map: dict[str, dict] = {}
-        if prev_cycle >= 1:
-            prev_resp = (
-                admin_supabase.table("epoch_scores")
-                .select(
-                "simulation_id, composite_score,"
-                " stability_score, influence_score, sovereignty_score,"
-                " diplomatic_score, military_score"
-            )
-                .eq("epoch_id", epoch_id)
-                .eq("cycle_number", prev_cycle)
-                .execute()
-            )
-            prev_scores_map = {s["simulation_id"]: s for s in (prev_resp.data or [])}
-
-        # Find this player's score and rank
-        player_score = None
-        player_rank = 0
-        total_players = len(current_scores)
-        prev_rank = 0
-
-        for idx, s in enumerate(current_scores, start=1):
-            if s["simulation_id"] == simulation_id:
-                player_score = s
-                player_rank = idx
-
-        # Compute previous rank
-        if prev_cycle >= 1:
-            prev_all = (
-                admin_supabase.table("epoch_scores")
-                .select("simulation_id, composite_score")
-                .eq("epoch_id", epoch_id)
-                .eq("cycle_number", prev_cycle)
-                .order("composite_score", desc=True)
-                .execute()
-            )
-            for idx, s in enumerate(prev_all.data or [], start=1):
-                if s["simulation_id"] == simulation_id:
-                    prev_rank = idx
-
-        prev_score = prev_scores_map.get(simulation_id, {})
-        dimensions = ["stability", "influence", "sovereignty", "diplomatic", "military"]
-
-        dim_data = []
-        if player_score:
-            for dim in dimensions:
-                col = f"{dim}_score"
-                current_val = float(player_score.get(col, 0))
-                prev_val = float(prev_score.get(col, 0)) if prev_score else 0
-                dim_data.append({
-                    "name": dim,
-                    "value": round(current_val, 1),
-                    "delta": round(current_val - prev_val, 1),
-                })
-
-        composite = float(player_score["composite_score"]) if player_score else 0
-        prev_composite = float(prev_score.get("composite_score", 0)) if prev_score else 0
-
-        # ── Operative missions with per-mission detail (B7) ──
-        ops_resp = (
-            admin_supabase.table("operative_missions")
-            .select("operative_type, status, target_simulation_id, resolves_at")
-            .eq("epoch_id", epoch_id)
-            .eq("source_simulation_id", simulation_id)
-            .execute()
-        )
-        ops = ops_resp.data or []
-        active_ops = sum(1 for o in ops if o["status"] == "active")
-        resolved_ops = [o for o in ops if o["status"] in ("success", "failed", "detected", "captured")]
-        success_ops = sum(1 for o in resolved_ops if o["status"] == "success")
-        detected_ops = sum(1 for o in resolved_ops if o["status"] in ("detected", "captured"))
-        guardians = sum(1 for o in ops if o["operative_type"] == "guardian" and o["status"] == "active")
-        counter_intel = sum(1 for o in ops if o["operative_type"] == "counter_intel" and o["status"] == "active")
-
-        # Build sim name lookup for missions
-        target_sim_ids = list({o.get("target_simulation_id") for o in ops if o.get("target_simulation_id")})
-        sim_name_map: dict[str, str] = {}
-        if target_sim_ids:
-            names_resp = (
-                admin_supabase.table("simulations")
-                .select("id, name")
-                .in_("id", target_sim_ids)
-                .execute()
-            )
-            sim_name_map = {s["id"]: s["name"] for s in (names_resp.data or [])}
-
-        # Per-mission detail list
-        mission_details = []
-        for o in ops:
-            if o["operative_type"] in ("guardian", "counter_intel"):
-                continue  # Defensive ops shown in summary, not mission log
-            target_name = sim_name_map.get(o.get("target_simulation_id", ""), "?")
-            mission_details.append({
-                "type": o["operative_type"],
-                "target_name": target_name,
-                "status": o["status"],
-            })
-
-        # ── RP balance ──
-        rp_resp = (
+            .order("composite_score", desc=True),
+            # RP, team and name of every participant
             admin_supabase.table("epoch_participants")
-            .select("current_rp, team_id")
-            .eq("epoch_id", epoch_id)
-            .eq("simulation_id", simulation_id)
-            .maybe_single()
-            .execute()
-        )
-        rp_balance = rp_resp.data.get("current_rp", 0) if rp_resp.data else 0
-        player_team_id = rp_resp.data.get("team_id") if rp_resp.data else None
-
-        # ── Threat assessment (B1) — detected inbound ops ──
-        threat_resp = (
-            admin_supabase.table("operative_missions")
-            .select("operative_type, status, source_simulation_id")
+            .select("simulation_id, current_rp, team_id, simulations(name)")
+            .eq("epoch_id", epoch_id),
+            # Active alliances
+            admin_supabase.table("epoch_teams")
+            .select("id, name")
             .eq("epoch_id", epoch_id)
-            .eq("target_simulation_id", simulation_id)
-            .in_("status", ["detected", "captured"])
-            .execute()
-        )
-        threats_raw = threat_resp.data or []
-        # Resolve source names
-        threat_source_ids = list({t["source_simulation_id"] for t in threats_raw})
-        if threat_source_ids:
-            threat_names_resp = (
-                admin_supabase.table("simulations")
-                .select("id, name")
-                .in_("id", threat_source_ids)
-                .execute()
-            )
-            threat_name_map = {s["id"]: s["name"] for s in (threat_names_resp.data or [])}
-        else:
-            threat_name_map = {}
-
-        threats = [
-            {
-                "type": t["operative_type"],
-                "status": t["status"],
-                "source_name": threat_name_map.get(t["source_simulation_id"], "Unknown"),
-            }
-            for t in threats_raw
-        ]
-
-        # ── Spy intel digest (B2) — earned intelligence this cycle ──
-        intel_resp = (
+            .is_("dissolved_at", "null"),
+            # Intel reports earned this cycle (newest first)
             admin_supabase.table("battle_log")
-            .select("narrative, event_type, metadata, target_simulation_id")
+            .select("narrative, event_type, metadata, source_simulation_id, target_simulation_id")
             .eq("epoch_id", epoch_id)
-            .eq("source_simulation_id", simulation_id)
             .eq("event_type", "intel_report")
             .eq("cycle_number", cycle_number)
-            .order("created_at", desc=True)
-            .limit(5)
-            .execute()
-        )
-        # Resolve target sim names for intel reports
-        intel_target_ids = list({
-            e["target_simulation_id"]
-            for e in (intel_resp.data or [])
-            if e.get("target_simulation_id")
-        })
-        if intel_target_ids:
-            intel_names_resp = (
-                admin_supabase.table("simulations")
-                .select("id, name")
-                .in_("id", intel_target_ids)
-                .execute()
-            )
-            intel_name_map = {s["id"]: s["name"] for s in (intel_names_resp.data or [])}
-        else:
-            intel_name_map = {}
-        spy_intel = [
-            {
-                "narrative": e["narrative"],
-                "metadata": e.get("metadata") or {},
-                "target_name": intel_name_map.get(e.get("target_simulation_id", ""), ""),
-            }
-            for e in (intel_resp.data or [])
-        ]
-
-        # ── Alliance status (B6) ──
-        alliance_name = None
-        ally_names: list[str] = []
-        alliance_bonus_active = False
-        if player_team_id:
-            team_resp = (
-                admin_supabase.table("epoch_teams")
-                .select("name")
-                .eq("id", player_team_id)
-                .is_("dissolved_at", "null")
-                .maybe_single()
-                .execute()
-            )
-            if team_resp.data:
-                alliance_name = team_resp.data["name"]
-                alliance_bonus_active = True
-                # Get ally names
-                ally_resp = (
-                    admin_supabase.table("epoch_participants")
-                    .select("simulation_id, simulations(name)")
-                    .eq("epoch_id", epoch_id)
-                    .eq("team_id", player_team_id)
-                    .execute()
-                )
-                ally_names = [
-                    (p.get("simulations") or {}).get("name", "?")
-                    for p in (ally_resp.data or [])
-                    if p["simulation_id"] != simulation_id
-                ]
-
-        # ── Rank gap (B3) ──
-        rank_gap = None
-        if player_rank == 1 and len(current_scores) > 1:
-            gap = round(composite - float(current_scores[1]["composite_score"]), 1)
-            rank_gap = {
-                "en": f"Leading by {gap} points",
-                "de": f"F\u00fchrt mit {gap} Punkten Vorsprung",
-            }
-        elif player_rank > 1 and current_scores:
-            gap = round(float(current_scores[player_rank - 2]["composite_score"]) - composite, 1)
-            ahead_rank = player_rank - 1
-            rank_gap = {
-                "en": f"{gap} points behind #{ahead_rank}",
-                "de": f"{gap} Punkte hinter #{ahead_rank}",
-            }
-
-        # ── Next cycle preview (B4) ──
-        pending_missions = sum(1 for o in ops if o["status"] == "active")
-        rp_per_cycle = config.get("rp_per_cycle", 12)
-        rp_cap = config.get("rp_cap", 40)
-        projected_rp = min(rp_balance + rp_per_cycle, rp_cap)
-        rp_projection = f"+{rp_per_cycle} \u2192 {projected_rp} / {rp_cap}"
-
-        # Public battle log events from this cycle
-        log_resp = (
+            .order("created_at", desc=True),
+            # Public battle log events from this cycle
             admin_supabase.table("battle_log")
             .select("narrative, event_type")
             .eq("epoch_id", epoch_id)
             .eq("cycle_number", cycle_number)
             .eq("is_public", True)
             .order("created_at", desc=True)
-            .limit(5)
-            .execute()
-        )
-        public_events = [
-            {"narrative": e["narrative"], "event_type": e["event_type"]}
-            for e in (log_resp.data or [])
+            .limit(5),
         ]
-
-        return {
-            "epoch_name": epoch_name,
-            "epoch_status": epoch_status,
-            "cycle_number": cycle_number,
-            "rank": player_rank,
-            "prev_rank": prev_rank,
-            "total_players": total_players,
-            "composite": round(composite, 1),
-            "composite_delta": round(composite - prev_composite, 1),
-            "dimensions": dim_data,
-            "rp_balance": rp_balance,
-            "rp_cap": rp_cap,
-            "active_ops": active_ops,
-            "resolved_ops": len(resolved_ops),
-            "success_ops": success_ops,
-            "detected_ops": detected_ops,
-            "guardians": guardians,
-            "counter_intel": counter_intel,
-            "public_events": public_events,
-            "command_center_url": command_center_url,
-            # New enrichment data
-            "accent_color": accent,
-            "simulation_slug": simulation_slug,
-            "missions": mission_details,
-            "threats": threats,
-            "has_threat_data": True,
-            "spy_intel": spy_intel,
-            "rank_gap": rank_gap,
-            "alliance_name": alliance_name,
-            "ally_names": ally_names,
-            "alliance_bonus_active": alliance_bonus_active,
-            "next_cycle_missions": pending_missions,
-            "next_cycle_rp_projection": rp_projection,
+        if prev_cycle >= 1:
+            # Previous cycle scores (for deltas and previous rank)
+            queries.append(
+                admin_supabase.table("epoch_scores")
+                .select(
+                    "simulation_id, composite_score,"
+                    " stability_score, influence_score, sovereignty_score,"
+                    " diplomatic_score, military_score"
+                )
+                .eq("epoch_id", epoch_id)
+                .eq("cycle_number", prev_cycle)
+                .order("composite_score", desc=True)
+            )
+        responses, missions = await asyncio.gather(
+            gather_queries(*queries),
+            fetch_all(lambda: (
+                admin_supabase.table("operative_missions")
+                .select("id, operative_type, status, source_simulation_id, target_simulation_id")
+                .eq("epoch_id", epoch_id)
+                .order("id")
+            )),
+        )
+        current_resp, participants_resp, teams_resp, intel_resp, log_resp, *prev = responses
+
+        participants = {p["simulation_id"]: p for p in (participants_resp.data or [])}
+        sim_names = {sim_id: (p.get("simulations") or {}).get("name", "?") for sim_id, p in participants.items()}
+        intel_reports = intel_resp.data or []
+
+        # Mission and intel counterparts are normally participants; name any that are not
+        referenced = {
+            sim_id
+            for row in (*missions, *intel_reports)
+            for sim_id in (row.get("source_simulation_id"), row.get("target_simulation_id"))
+            if sim_id
         }
+        unknown = sorted(referenced - sim_names.keys())
+        if unknown:
+            names_resp = await run_query(
+                admin_supabase.table("simulations")
+                .select("id, name")
+                .in_("id", unknown)
+            )
+            sim_names.update({s["id"]: s["name"] for s in (names_resp.data or [])})
+
+        return BriefingSnapshot(
+            cycle_number=cycle_number,
+            current_scores=current_resp.data or [],
+            prev_scores=(prev[0].data or []) if prev else [],
+            missions=missions,
+            participants=participants,
+            team_names={t["id"]: t["name"] for t in (teams_resp.data or [])},
+            sim_names=sim_names,
+            intel_reports=intel_reports,
+            public_events=[
+                {"narrative": e["narrative"], "event_type": e["event_type"]}
+                for e in (log_resp.data or [])
+            ],
+        )
 
     # ── Standing snapshot for phase change (C1) ───────────
 
-    @classmethod
-    async def _build_standing_snapshot(
-        cls,
-        admin_supabase: Client,
-        epoch_id: str,
-        simulation_id: str,
-    ) -> dict | None:
-        """Build a lightweight standing snapshot for phase change emails."""
-        scores_resp = (
+    @staticmethod
+    async def _load_standings(admin_supabase: Client, epoch_id: str) -> list[dict]:
+        """Top epoch scores, shared by every phase-change email."""
+        scores_resp = await run_query(
             admin_supabase.table("epoch_scores")
             .select("simulation_id, composite_score")
             .eq("epoch_id", epoch_id)
             .order("composite_score", desc=True)
             .limit(50)
-            .execute()
         )
-        scores = scores_resp.data or []
+        return scores_resp.data or []
+
+    @staticmethod
+    def _build_standing_snapshot(scores: list[dict], simulation_id: str) -> dict | None:
+        """Build a lightweight standing snapshot for phase change emails."""
         if not scores:
             return None
 
@@ -502,23 +460,23 @@ class CycleNotificationService:
 
     # ── Campaign statistics for completed email (D1) ──────
 
-    @classmethod
-    async def _build_campaign_stats(
-        cls,
-        admin_supabase: Client,
-        epoch_id: str,
-        simulation_id: str,
-    ) -> dict:
-        """Build campaign statistics for epoch completed email."""
-        ops_resp = (
+    @staticmethod
+    async def _load_missions_by_source(admin_supabase: Client, epoch_id: str) -> dict[str, list[dict]]:
+        """Every mission of the epoch grouped by source simulation (one paged read)."""
+        missions = await fetch_all(lambda: (
             admin_supabase.table("operative_missions")
-            .select("operative_type, status")
+            .select("id, operative_type, status, source_simulation_id")
             .eq("epoch_id", epoch_id)
-            .eq("source_simulation_id", simulation_id)
-            .execute()
-        )
-        ops = ops_resp.data or []
-
+            .order("id")
+        ))
+        by_source: dict[str, list[dict]] = defaultdict(list)
+        for m in missions:
+            by_source[m["source_simulation_id"]].append(m)
+        return by_source
+
+    @staticmethod
+    def _build_campaign_stats(ops: list[dict]) -> dict:
+        """Build campaign statistics for epoch completed email."""
         total = len(ops)
         resolved = [o for o in ops if o["status"] in ("success", "failed", "detected", "captured")]
         successes = sum(1 for o in resolved if o["status"] == "success")
@@ -549,12 +507,11 @@ class CycleNotificationService:
         Returns the number of emails successfully sent.
         """
         # Fetch epoch info
-        epoch_resp = (
+        epoch_resp = await run_query(
             admin_supabase.table("game_epochs")
             .select("name, status, config")
             .eq("id", epoch_id)
             .single()
-            .execute()
         )
         if not epoch_resp.data:
             logger.warning("Epoch %s not found for cycle notifications", epoch_id)
@@ -572,15 +529,15 @@ class CycleNotificationService:
             logger.info("No recipients for cycle %d notifications (epoch %s)", cycle_number, epoch_id)
             return 0
 
-        sent_count = 0
+        # One epoch-wide read; each briefing is derived from it in memory
+        snapshot = await cls._load_briefing_snapshot(admin_supabase, epoch_id, cycle_number)
+        cta_url = f"https://metaverse.center/epoch/{epoch_id}"
+
+        pending = []
         for recipient in recipients:
             try:
-                cta_url = f"https://metaverse.center/epoch/{epoch_id}"
-                briefing = await cls._build_player_briefing(
-                    admin_supabase,
-                    epoch_id,
+                briefing = snapshot.player_briefing(
                     recipient["simulation_id"],
-                    cycle_number,
                     epoch_name,
                     epoch_status,
                     epoch_config=epoch_config,
@@ -593,11 +550,8 @@ class CycleNotificationService:
                 html_body = render_cycle_briefing(briefing, email_locale=email_locale)
                 subject = f"CLASSIFIED // SITREP \u2014 {epoch_name} \u2014 Cycle {cycle_number}"
 
-                if await EmailService.send(recipient["email"], subject, html_body):
-                    sent_count += 1
-
-                # Rate limit: 200ms between sends
-                await asyncio.sleep(_SEND_DELAY_MS / 1000)
+                # Queued — the next briefing is built while this one is sent
+                pending.append(await EmailService.submit(recipient["email"], subject, html_body))
 
             except Exception:
                 logger.warning(
@@ -606,6 +560,7 @@ class CycleNotificationService:
                     exc_info=True,
                 )
 
+        sent_count = sum(await asyncio.gather(*pending))
         logger.info(
             "Cycle notifications sent",
             extra={
@@ -624,12 +579,11 @@ class CycleNotificationService:
         new_phase: str,
     ) -> int:
         """Send phase-change emails to all human participants (per-player with standing)."""
-        epoch_resp = (
+        epoch_resp = await run_query(
             admin_supabase.table("game_epochs")
             .select("name, current_cycle")
             .eq("id", epoch_id)
             .single()
-            .execute()
         )
         if not epoch_resp.data:
             return 0
@@ -653,13 +607,13 @@ class CycleNotificationService:
         else:
             subject = f"CLASSIFIED // PHASE TRANSITION \u2014 {epoch_name}"
 
-        sent_count = 0
+        standings = await cls._load_standings(admin_supabase, epoch_id)
+
+        pending = []
         for recipient in recipients:
             try:
                 # Per-player standing data (C1)
-                standing = await cls._build_standing_snapshot(
-                    admin_supabase, epoch_id, recipient["simulation_id"],
-                )
+                standing = cls._build_standing_snapshot(standings, recipient["simulation_id"])
                 accent = get_sim_accent(recipient.get("simulation_slug"))
                 email_locale = recipient.get("email_locale")
 
@@ -674,9 +628,7 @@ class CycleNotificationService:
                     standing_data=standing,
                 )
 
-                if await EmailService.send(recipient["email"], subject, html_body):
-                    sent_count += 1
-                await asyncio.sleep(_SEND_DELAY_MS / 1000)
+                pending.append(await EmailService.submit(recipient["email"], subject, html_body))
             except Exception:
                 logger.warning(
                     "Failed to send phase change notification",
@@ -684,6 +636,7 @@ class CycleNotificationService:
                     exc_info=True,
                 )
 
+        sent_count = sum(await asyncio.gather(*pending))
         logger.info(
             "Phase change notifications sent",
             extra={
@@ -700,12 +653,11 @@ class CycleNotificationService:
         epoch_id: str,
     ) -> int:
         """Send epoch-completed emails with final leaderboard + campaign stats."""
-        epoch_resp = (
+        epoch_resp = await run_query(
             admin_supabase.table("game_epochs")
             .select("name, current_cycle")
             .eq("id", epoch_id)
             .single()
-            .execute()
         )
         if not epoch_resp.data:
             return 0
@@ -722,17 +674,18 @@ class CycleNotificationService:
         # Get final leaderboard
         from backend.services.scoring_service import ScoringService
 
-        leaderboard = await ScoringService.get_final_standings(admin_supabase, epoch_id)
+        leaderboard, missions_by_source = await asyncio.gather(
+            ScoringService.get_final_standings(admin_supabase, epoch_id),
+            cls._load_missions_by_source(admin_supabase, epoch_id),
+        )
 
         cta_url = f"https://metaverse.center/epoch/{epoch_id}"
 
-        sent_count = 0
+        pending = []
         for recipient in recipients:
             try:
                 # Per-player campaign statistics (D1)
-                campaign_stats = await cls._build_campaign_stats(
-                    admin_supabase, epoch_id, recipient["simulation_id"],
-                )
+                campaign_stats = cls._build_campaign_stats(missions_by_source.get(recipient["simulation_id"], []))
                 accent = get_sim_accent(recipient.get("simulation_slug"))
                 email_locale = recipient.get("email_locale")
 
@@ -748,9 +701,7 @@ class CycleNotificationService:
                 )
                 subject = f"CLASSIFIED // OPERATION COMPLETE \u2014 {epoch_name}"
 
-                if await EmailService.send(recipient["email"], subject, html_body):
-                    sent_count += 1
-                await asyncio.sleep(_SEND_DELAY_MS / 1000)
+                pending.append(await EmailService.submit(recipient["email"], subject, html_body))
             except Exception:
                 logger.warning(
                     "Failed to send epoch completed notification",
@@ -758,6 +709,7 @@ class CycleNotificationService:
                     exc_info=True,
                 )
 
+        sent_count = sum(await asyncio.gather(*pending))
         logger.info(
             "Epoch completed notifications sent",
             extra={"sent_count": sent_count, "total_recipients": len(recipients), "epoch_id": epoch_id},
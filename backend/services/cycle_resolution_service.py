@@ -0,0 +1,342 @@
+"""Background cycle resolution — staged, idempotent, pollable.
+
+Resolving a cycle runs six stages in order:
+
+    resolve → missions → fortifications → bots → scoring → notifications
+
+Bots and notifications alone can take seconds (LLM calls, one SMTP send per
+recipient), so the resolve-cycle endpoint no longer waits for them:
+``CycleResolutionService.start`` validates the epoch, claims the job for
+(epoch, cycle being resolved) in ``cycle_resolution_jobs`` (migration 086)
+and runs the stages in a background task. A second trigger for the same
+cycle — a double click, or a manual resolve racing the all-ready
+auto-resolve — gets the existing job back instead of advancing the epoch
+twice.
+
+Progress is written to the job row after every stage transition (and every
+``HEARTBEAT_INTERVAL`` while a long stage runs), with per-stage timings;
+clients poll it through ``GET /epochs/{id}/cycles/{n}/resolution``. Only the
+``resolve`` stage is fatal: if it fails the job fails and the cycle can be
+triggered again. The later stages stay best-effort as before — a failed stage
+is recorded with its error and the pipeline moves on.
+
+A job that stops reporting progress for ``STALE_AFTER`` (a worker that died
+mid-run) is taken over by the next trigger, including one that arrives after
+the epoch already advanced: the new runner treats ``resolve`` as done when the
+epoch sits exactly one cycle past the job and resumes at the first stage that
+did not succeed. The app lifespan drains running jobs on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from backend.services.epoch_service import EpochService
+from backend.utils.db import run_query
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("resolve", "missions", "fortifications", "bots", "scoring", "notifications")
+STALE_AFTER = timedelta(minutes=15)
+HEARTBEAT_INTERVAL = 60  # Seconds between progress writes while one stage runs
+ACTIVE_STATUSES = ("foundation", "competition", "reckoning")
+
+# Running jobs — held so the event loop does not garbage-collect them mid-run.
+_tasks: set[asyncio.Task] = set()
+
+
+class CycleAlreadyResolvedError(RuntimeError):
+    """The epoch moved past the job's cycle before its ``resolve`` stage ran."""
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+class _Run:
+    """State threaded through the stages of one job."""
+
+    def __init__(self, db: Client, job: dict) -> None:
+        self.db = db
+        self.job = job
+        self.epoch_id = job["epoch_id"]
+        self.epoch: dict = {}
+        self.reclaimed = job.get("attempts", 1) > 1
+
+    @property
+    def cycle_number(self) -> int:
+        """The epoch's cycle after resolution — what the later stages act on."""
+        return self.epoch.get("current_cycle", self.job["cycle_number"] + 1)
+
+
+class CycleResolutionService:
+    """Starts, runs and reports background cycle resolution jobs."""
+
+    # ── Trigger & status ──────────────────────────────────
+
+    @classmethod
+    async def start(cls, supabase: Client, epoch_id: UUID, admin_supabase: Client) -> dict:
+        """Claim and schedule resolution of the epoch's current cycle; returns the job.
+
+        Raises 400 synchronously when the epoch is not in an active phase. If
+        a job for this cycle is already queued, running or done, it is
+        returned unchanged (``claimed`` is False) and nothing new is started.
+        While the previous cycle's job is still queued or running (its
+        ``resolve`` stage has advanced the epoch, the later stages have not
+        finished) that job is claimed instead, so the epoch is not advanced
+        again and a job whose worker died is resumed.
+        """
+        epoch = await EpochService.get(supabase, epoch_id)
+        if epoch["status"] not in ACTIVE_STATUSES:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                f"Cannot resolve cycle for epoch with status '{epoch['status']}'.",
+            )
+
+        cycle_number = epoch["current_cycle"]
+        previous = await cls._find_job(admin_supabase, epoch_id, cycle_number - 1)
+        if previous and previous["status"] in ("queued", "running"):
+            cycle_number -= 1
+
+        resp = await run_query(admin_supabase.rpc("fn_claim_cycle_resolution", {
+            "p_epoch_id": str(epoch_id),
+            "p_cycle_number": cycle_number,
+            "p_stages": [{"name": name, "status": "pending"} for name in STAGES],
+            "p_stale_after": f"{int(STALE_AFTER.total_seconds())} seconds",
+        }))
+        job = resp.data
+        if job.get("claimed"):
+            cls.schedule(admin_supabase, job)
+        else:
+            logger.info(
+                "Cycle resolution already claimed",
+                extra={"epoch_id": str(epoch_id), "cycle_number": job["cycle_number"], "status": job["status"]},
+            )
+        return job
+
+    @classmethod
+    async def get_job(cls, admin_supabase: Client, epoch_id: UUID, cycle_number: int) -> dict:
+        """The resolution job for ``cycle_number`` (the cycle that was resolved)."""
+        job = await cls._find_job(admin_supabase, epoch_id, cycle_number)
+        if not job:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "No resolution job for this cycle.")
+        return job
+
+    @staticmethod
+    async def _find_job(admin_supabase: Client, epoch_id: UUID, cycle_number: int) -> dict | None:
+        resp = await run_query(
+            admin_supabase.table("cycle_resolution_jobs")
+            .select("*")
+            .eq("epoch_id", str(epoch_id))
+            .eq("cycle_number", cycle_number)
+            .maybe_single()
+        )
+        return resp.data if resp else None
+
+    # ── Runner ────────────────────────────────────────────
+
+    @classmethod
+    def schedule(cls, db: Client, job: dict) -> asyncio.Task:
+        """Run ``job`` in a background task on the current event loop."""
+        task = asyncio.create_task(cls.run(db, job))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+        return task
+
+    @staticmethod
+    async def drain() -> None:
+        """Wait for every job started in this process (tests, graceful shutdown)."""
+        while _tasks:
+            await asyncio.gather(*list(_tasks), return_exceptions=True)
+
+    @classmethod
+    async def run(cls, db: Client, job: dict) -> dict:
+        """Run every stage of ``job``, persisting progress and timings as it goes.
+
+        Uses the service-role client throughout — the triggering user's JWT
+        may expire before the job finishes. A reclaimed job keeps the stages
+        that already succeeded and runs the rest; ``resolve`` always runs
+        (it reloads the epoch, or recognizes that it was already advanced).
+        """
+        run = _Run(db, job)
+        job["status"] = "running"
+        job["started_at"] = _now()
+        previous = {entry.get("name"): entry for entry in job.get("stages") or []}
+        job["stages"] = [
+            previous[name]
+            if name != "resolve" and previous.get(name, {}).get("status") == "succeeded"
+            else {"name": name, "status": "pending"}
+            for name in STAGES
+        ]
+        await cls._save(run)
+
+        failed = False
+        for entry in job["stages"]:
+            if entry["status"] == "succeeded":
+                continue
+            if failed:
+                entry["status"] = "skipped"
+                continue
+            job["stage"] = entry["name"]
+            entry["status"] = "running"
+            entry["started_at"] = _now()
+            await cls._save(run)
+
+            started = time.perf_counter()
+            heartbeat = asyncio.create_task(cls._heartbeat(run))
+            try:
+                await _STAGE_FNS[entry["name"]](run)
+                entry["status"] = "succeeded"
+            except Exception as exc:
+                entry["status"] = "failed"
+                entry["error"] = str(exc.detail if isinstance(exc, HTTPException) else exc) or type(exc).__name__
+                if entry["name"] == "resolve":
+                    failed = True
+                    job["error"] = entry["error"]
+                    logger.exception(
+                        "Cycle resolution failed",
+                        extra={"epoch_id": str(run.epoch_id), "cycle_number": job["cycle_number"]},
+                    )
+                else:
+                    logger.warning(
+                        "Cycle resolution stage failed",
+                        extra={
+                            "epoch_id": str(run.epoch_id),
+                            "cycle_number": run.cycle_number,
+                            "stage": entry["name"],
+                        },
+                        exc_info=True,
+                    )
+            finally:
+                heartbeat.cancel()
+            entry["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        job["status"] = "failed" if failed else "succeeded"
+        job["stage"] = None
+        job["finished_at"] = _now()
+        await cls._save(run)
+        logger.info(
+            "Cycle resolution finished",
+            extra={
+                "epoch_id": str(run.epoch_id),
+                "cycle_number": job["cycle_number"],
+                "status": job["status"],
+                "stage_ms": {e["name"]: e.get("duration_ms") for e in job["stages"]},
+            },
+        )
+        return job
+
+    @classmethod
+    async def _heartbeat(cls, run: _Run) -> None:
+        """Re-save progress periodically so a long stage is not mistaken for a dead worker."""
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            await cls._save(run)
+
+    @staticmethod
+    async def _save(run: _Run) -> None:
+        """Write the job's progress (best-effort — never fails the pipeline)."""
+        job = run.job
+        try:
+            await run_query(
+                run.db.table("cycle_resolution_jobs")
+                .update({
+                    "status": job["status"],
+                    "stage": job.get("stage"),
+                    "stages": job["stages"],
+                    "error": job.get("error"),
+                    "started_at": job.get("started_at"),
+                    "finished_at": job.get("finished_at"),
+                    "updated_at": _now(),
+                })
+                .eq("id", job["id"])
+            )
+        except Exception:
+            logger.warning("Resolution job progress write failed", extra={"job_id": job["id"]}, exc_info=True)
+
+
+# ── Stages ────────────────────────────────────────────────
+
+
+async def _resolve(run: _Run) -> None:
+    """Allocate RP and advance the cycle counter (``EpochService.resolve_cycle``).
+
+    On a reclaimed job whose previous attempt already advanced the epoch by
+    exactly one cycle, the stage counts as done and only reloads the epoch.
+    """
+    epoch = await EpochService.get(run.db, run.epoch_id)
+    if run.reclaimed and epoch["current_cycle"] == run.job["cycle_number"] + 1:
+        logger.info(
+            "Resuming cycle resolution after the epoch advanced",
+            extra={"epoch_id": str(run.epoch_id), "cycle_number": run.job["cycle_number"]},
+        )
+        run.epoch = epoch
+        return
+    if epoch["current_cycle"] != run.job["cycle_number"]:
+        raise CycleAlreadyResolvedError(
+            f"Cycle {run.job['cycle_number']} was already resolved (epoch is at cycle {epoch['current_cycle']})."
+        )
+    run.epoch = await EpochService.resolve_cycle(run.db, run.epoch_id, admin_supabase=run.db)
+
+
+async def _missions(run: _Run) -> None:
+    """Resolve missions past their resolves_at and log the results to the battle log."""
+    from backend.services.battle_log_service import BattleLogService
+    from backend.services.operative_service import OperativeService
+
+    resolved = await OperativeService.resolve_pending_missions(run.db, run.epoch_id)
+    await BattleLogService.log_mission_results(run.db, run.epoch_id, run.cycle_number, resolved)
+
+
+async def _fortifications(run: _Run) -> None:
+    """Expire zone fortifications that have passed their expiry cycle."""
+    from backend.services.battle_log_service import BattleLogService
+    from backend.services.operative_service import OperativeService
+
+    expired = await OperativeService.expire_fortifications(run.db, run.epoch_id, run.cycle_number)
+    await BattleLogService.log_fortifications_expired(run.db, run.epoch_id, run.cycle_number, expired)
+
+
+async def _bots(run: _Run) -> None:
+    """Execute bot decisions for the new cycle."""
+    from backend.services.bot_service import BotService
+
+    await BotService.execute_bot_cycle(
+        supabase=run.db,
+        admin_supabase=run.db,
+        epoch_id=str(run.epoch_id),
+        cycle_number=run.cycle_number,
+        config=run.epoch.get("config", {}),
+    )
+
+
+async def _scoring(run: _Run) -> None:
+    """Compute and store the cycle's scores."""
+    from backend.services.scoring_service import ScoringService
+
+    await ScoringService.compute_cycle_scores(run.db, run.epoch_id, run.cycle_number, replay_db=run.db)
+
+
+async def _notifications(run: _Run) -> None:
+    """Send the cycle briefing emails."""
+    from backend.services.cycle_notification_service import CycleNotificationService
+
+    await CycleNotificationService.send_cycle_notifications(run.db, str(run.epoch_id), run.cycle_number)
+
+
+_STAGE_FNS: dict[str, Callable[[_Run], Awaitable[None]]] = {
+    "resolve": _resolve,
+    "missions": _missions,
+    "fortifications": _fortifications,
+    "bots": _bots,
+    "scoring": _scoring,
+    "notifications": _notifications,
+}
@@ -10,12 +10,13 @@ import random
 from datetime import UTC, datetime
 from uuid import UUID
 
-from cachetools import TTLCache
 from fastapi import HTTPException, status
 
 from backend.services.base_service import serialize_for_json
 from backend.services.cache_config import get_ttl
 from backend.services.game_mechanics_service import GameMechanicsService
+from backend.utils.db import run_query
+from backend.utils.single_flight import SingleFlight
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -64,7 +65,7 @@ class EchoService:
             query = query.eq("status", status_filter)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
 
@@ -75,12 +76,11 @@ class EchoService:
         event_id: UUID,
     ) -> list[dict]:
         """List all echoes originating from a specific event."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select("*")
             .eq("source_event_id", str(event_id))
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -91,12 +91,11 @@ class EchoService:
         echo_id: UUID,
     ) -> dict:
         """Get a single echo by ID."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select("*")
             .eq("id", str(echo_id))
             .single()
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -171,7 +170,7 @@ class EchoService:
             return []
 
         # Get source sim bleed settings
-        settings_resp = (
+        settings_resp = await run_query(
             supabase.table("simulation_settings")
             .select("setting_key, setting_value")
             .eq("simulation_id", sim_str)
@@ -180,7 +179,6 @@ class EchoService:
                 "bleed_enabled", "bleed_min_impact", "bleed_max_depth",
                 "bleed_strength_decay",
             ])
-            .execute()
         )
         settings = {s["setting_key"]: s["setting_value"] for s in (settings_resp.data or [])}
 
@@ -208,14 +206,13 @@ class EchoService:
             return []
 
         # Get active connections from this simulation
-        conn_resp = (
+        conn_resp = await run_query(
             supabase.table("simulation_connections")
             .select("*")
             .eq("is_active", True)
             .or_(
                 f"simulation_a_id.eq.{sim_str},simulation_b_id.eq.{sim_str}"
             )
-            .execute()
         )
         if not conn_resp.data:
             return []
@@ -344,10 +341,9 @@ class EchoService:
             },
         })
 
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .insert(insert_data)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -376,11 +372,10 @@ class EchoService:
         if metadata_update:
             update_data["bleed_metadata"] = metadata_update
 
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .update(update_data)
             .eq("id", str(echo_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -462,12 +457,11 @@ class EchoService:
 
         try:
             # 2. Fetch source event
-            source_event_resp = (
+            source_event_resp = await run_query(
                 supabase.table("events")
                 .select("*")
                 .eq("id", source_event_id)
                 .single()
-                .execute()
             )
             if not source_event_resp.data:
                 raise HTTPException(
@@ -477,12 +471,11 @@ class EchoService:
             source_event = source_event_resp.data
 
             # Fetch target simulation info
-            target_sim_resp = (
+            target_sim_resp = await run_query(
                 supabase.table("simulations")
                 .select("name, description")
                 .eq("id", target_sim_id)
                 .single()
-                .execute()
             )
             target_sim = target_sim_resp.data or {}
 
@@ -525,10 +518,9 @@ class EchoService:
                 },
             })
 
-            event_resp = (
+            event_resp = await run_query(
                 admin_supabase.table("events")
                 .insert(target_event_data)
-                .execute()
             )
             if not event_resp.data:
                 raise HTTPException(
@@ -610,13 +602,12 @@ class EchoService:
                 emb_eff = max(emb_eff, float(emb.get("effectiveness", 0.0)))
 
         # Get strength decay
-        settings_resp = (
+        settings_resp = await run_query(
             supabase.table("simulation_settings")
             .select("setting_value")
             .eq("simulation_id", sim_str)
             .eq("category", "world")
             .eq("setting_key", "bleed_strength_decay")
-            .execute()
         )
         strength_decay = 0.6
         if settings_resp.data:
@@ -639,8 +630,8 @@ class ConnectionService:
 
     table_name = "simulation_connections"
 
-    # In-process TTL cache for get_map_data
-    _map_data_cache: TTLCache = TTLCache(maxsize=1, ttl=get_ttl("cache_map_data_ttl"))
+    # Single-flight + stale-while-revalidate cache for get_map_data
+    _map_data_flight = SingleFlight("map_data", ttl=lambda: get_ttl("cache_map_data_ttl"), stale_factor=4)
 
     @classmethod
     async def list_all(
@@ -661,7 +652,7 @@ class ConnectionService:
         if active_only:
             query = query.eq("is_active", True)
 
-        response = query.execute()
+        response = await run_query(query)
         return response.data or []
 
     @classmethod
@@ -673,12 +664,15 @@ class ConnectionService:
 
         Includes game instances (simulation_type, epoch_id, source_template_id)
         and epoch status for live map rendering. Excludes archived instances.
-        Results are cached in-process for 15 seconds.
+        Concurrent callers share one computation; results are fresh for
+        ``cache_map_data_ttl`` seconds and served stale (while one background
+        refresh runs) for up to 4x that.
         """
-        cached = cls._map_data_cache.get("map_data")
-        if cached is not None:
-            return cached
+        return await cls._map_data_flight.get("map_data", lambda: cls._build_map_data(supabase))
 
+    @classmethod
+    async def _build_map_data(cls, supabase: Client) -> dict:
+        """Run the map-data fan-out queries (see ``get_map_data``)."""
         simulations = await cls._fetch_map_simulations(supabase)
         all_connections = await cls.list_all(supabase, active_only=True)
 
@@ -723,13 +717,12 @@ class ConnectionService:
             "sparklines": sparklines,
         }
 
-        cls._map_data_cache["map_data"] = result
         return result
 
     @classmethod
     async def _fetch_map_simulations(cls, supabase: Client) -> list[dict]:
         """Fetch simulations with epoch status and dashboard counts."""
-        sims_resp = (
+        sims_resp = await run_query(
             supabase.table("simulations")
             .select(
                 "id, name, slug, theme, description, banner_url, status,"
@@ -739,7 +732,6 @@ class ConnectionService:
             .neq("simulation_type", "archived")
             .is_("deleted_at", "null")
             .order("created_at", desc=False)
-            .execute()
         )
         simulations = sims_resp.data or []
 
@@ -747,11 +739,10 @@ class ConnectionService:
         epoch_ids = {s["epoch_id"] for s in simulations if s.get("epoch_id")}
         epoch_status_map: dict[str, str] = {}
         if epoch_ids:
-            epoch_resp = (
+            epoch_resp = await run_query(
                 supabase.table("game_epochs")
                 .select("id, status")
                 .in_("id", list(epoch_ids))
-                .execute()
             )
             for ep in epoch_resp.data or []:
                 epoch_status_map[ep["id"]] = ep["status"]
@@ -759,10 +750,9 @@ class ConnectionService:
             sim["epoch_status"] = epoch_status_map.get(sim.get("epoch_id"), None)
 
         # Enrich with dashboard counts
-        dash_resp = (
+        dash_resp = await run_query(
             supabase.table("simulation_dashboard")
             .select("simulation_id, agent_count, building_count, event_count")
-            .execute()
         )
         counts_map = {d["simulation_id"]: d for d in (dash_resp.data or [])}
         for sim in simulations:
@@ -790,11 +780,10 @@ class ConnectionService:
     @classmethod
     async def _fetch_echo_counts(cls, supabase: Client) -> dict[str, int]:
         """Fetch incoming completed echo counts per simulation."""
-        echo_resp = (
+        echo_resp = await run_query(
             supabase.table("event_echoes")
             .select("target_simulation_id", count="exact")
             .eq("status", "completed")
-            .execute()
         )
         counts: dict[str, int] = {}
         for row in echo_resp.data or []:
@@ -807,11 +796,10 @@ class ConnectionService:
         """Fetch active operative flow between simulations."""
         flow: dict[str, dict] = {}
         try:
-            op_resp = (
+            op_resp = await run_query(
                 supabase.table("operative_missions")
                 .select("source_simulation_id, target_simulation_id, operative_type")
                 .in_("status", ["deployed", "active", "en_route"])
-                .execute()
             )
             for op in op_resp.data or []:
                 src = op.get("source_simulation_id")
@@ -835,7 +823,7 @@ class ConnectionService:
             return {}
         dimensions: dict[str, dict] = {}
         try:
-            score_resp = (
+            score_resp = await run_query(
                 supabase.table("epoch_scores")
                 .select(
                     "simulation_id, stability_score, influence_score,"
@@ -844,7 +832,6 @@ class ConnectionService:
                 )
                 .in_("simulation_id", instance_ids)
                 .order("cycle_number", desc=True)
-                .execute()
             )
             seen: set[str] = set()
             for row in score_resp.data or []:
@@ -870,7 +857,7 @@ class ConnectionService:
             return {}
         sparklines: dict[str, list[float]] = {}
         try:
-            spark_resp = (
+            spark_resp = await run_query(
                 supabase.table("epoch_scores")
                 .select(
                     "simulation_id, composite_score, cycle_number,"
@@ -878,7 +865,6 @@ class ConnectionService:
                 )
                 .order("cycle_number", desc=True)
                 .limit(200)
-                .execute()
             )
             template_scores: dict[str, list[float]] = {}
             for row in spark_resp.data or []:
@@ -904,10 +890,9 @@ class ConnectionService:
         data: dict,
     ) -> dict:
         """Create a simulation connection (admin only)."""
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .insert(serialize_for_json(data))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -925,11 +910,10 @@ class ConnectionService:
     ) -> dict:
         """Update a simulation connection (admin only)."""
         update_data = {**serialize_for_json(data), "updated_at": datetime.now(UTC).isoformat()}
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .update(update_data)
             .eq("id", str(connection_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -945,11 +929,10 @@ class ConnectionService:
         connection_id: UUID,
     ) -> dict:
         """Delete a simulation connection (admin only)."""
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .delete()
             .eq("id", str(connection_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -0,0 +1,238 @@
+"""SMTP delivery: persistent connections, a bounded queue, rate control, retry.
+
+``EmailDeliveryQueue`` owns a small pool of workers, each holding one
+authenticated ``SmtpConnection`` that stays open across messages (reconnecting
+transparently when the server has dropped an idle session, and closing it
+after ``idle_timeout`` without work). Sends are paced by a shared
+``TokenBucket`` instead of fixed sleeps, so a burst of notifications goes out
+as fast as the provider allows. Transient failures — 4xx replies, dropped
+connections, timeouts — are retried with exponential backoff; permanent ones
+(5xx, bad credentials) fail at once.
+
+``submit()`` waits only while the queue is full and returns a future that
+resolves to True/False once the message is delivered or given up on, so
+callers can build the next message while earlier ones are in flight.
+
+The SMTP settings are passed in by ``EmailService``; this module does not
+read configuration itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import smtplib
+import ssl
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from backend.utils.token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class SmtpConnection:
+    """One persistent, authenticated SMTP session (blocking — call from a worker thread).
+
+    ``security`` is ``"ssl"`` (implicit TLS, port 465), ``"starttls"`` or
+    ``"none"`` (plain — local sinks only).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str = "",
+        password: str = "",
+        *,
+        security: str = "ssl",
+        timeout: float = 15,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.security = security
+        self.timeout = timeout
+        self.connects = 0
+        self._server: smtplib.SMTP | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._server is not None
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.security == "ssl":
+            server: smtplib.SMTP = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.security == "starttls":
+                server.starttls(context=ssl.create_default_context())
+        try:
+            if self.user:
+                server.login(self.user, self.password)
+        except BaseException:
+            server.close()
+            raise
+        self._server = server
+        self.connects += 1
+        return server
+
+    def send(self, sender: str, recipient: str, message: str) -> None:
+        """Send one message, opening (or reopening a dropped) session as needed."""
+        reused = self._server is not None
+        server = self._server or self._connect()
+        try:
+            server.sendmail(sender, [recipient], message)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            if not reused:
+                raise
+            # The server closed the idle session since the last send — retry once on a fresh one.
+            self._connect().sendmail(sender, [recipient], message)
+        except smtplib.SMTPRecipientsRefused:
+            raise
+        except smtplib.SMTPResponseException as exc:
+            if exc.smtp_code == 421:  # service closing the channel
+                self.close()
+            raise
+        except (smtplib.SMTPException, OSError):
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """QUIT (best-effort) and drop the session."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether a failed send is worth retrying (4xx replies, lost connections, timeouts)."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    return isinstance(exc, smtplib.SMTPServerDisconnected | OSError)
+
+
+@dataclass
+class _Envelope:
+    recipient: str
+    subject: str
+    message: str
+    future: asyncio.Future
+
+
+class EmailDeliveryQueue:
+    """Bounded queue of outgoing messages drained by ``workers`` persistent connections."""
+
+    def __init__(
+        self,
+        connect: Callable[[], SmtpConnection],
+        *,
+        sender: str,
+        workers: int = 2,
+        maxsize: int = 1000,
+        rate: float = 10,
+        burst: int = 20,
+        max_attempts: int = 4,
+        backoff: float = 1.0,
+        idle_timeout: float = 30,
+    ) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._connect = connect
+        self._sender = sender
+        self._worker_count = max(1, workers)
+        self._queue: asyncio.Queue[_Envelope] = asyncio.Queue(maxsize)
+        self._bucket = TokenBucket(rate, burst)
+        self._max_attempts = max(1, max_attempts)
+        self._backoff = backoff
+        self._idle_timeout = idle_timeout
+        self._workers: list[asyncio.Task] = []
+        self._connections: list[SmtpConnection] = []
+        self._stats = {"sent": 0, "failed": 0, "retries": 0}
+
+    def stats(self) -> dict:
+        """Delivery counters, queue depth and the number of SMTP sessions opened."""
+        return {
+            **self._stats,
+            "queued": self._queue.qsize(),
+            "connects": sum(c.connects for c in self._connections),
+        }
+
+    async def submit(self, recipient: str, subject: str, message: str) -> asyncio.Future:
+        """Enqueue a message (waiting while the queue is full); the future resolves to True/False."""
+        future = self.loop.create_future()
+        await self._queue.put(_Envelope(recipient, subject, message, future))
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self._worker_count)]
+        return future
+
+    async def send(self, recipient: str, subject: str, message: str) -> bool:
+        """Enqueue a message and wait for its delivery result."""
+        return await (await self.submit(recipient, subject, message))
+
+    async def close(self) -> None:
+        """Deliver everything queued, then stop the workers and close their sessions."""
+        if self._workers:
+            await self._queue.join()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for conn in self._connections:
+            await asyncio.to_thread(conn.close)
+
+    async def _worker(self) -> None:
+        conn = self._connect()
+        self._connections.append(conn)
+        while True:
+            try:
+                envelope = await asyncio.wait_for(self._queue.get(), self._idle_timeout)
+            except TimeoutError:
+                if conn.is_open:
+                    await asyncio.to_thread(conn.close)
+                continue
+            try:
+                await self._deliver(conn, envelope)
+            except Exception:
+                logger.exception("Email worker error", extra={"recipient": envelope.recipient})
+                if not envelope.future.done():
+                    envelope.future.set_result(False)
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, conn: SmtpConnection, envelope: _Envelope) -> None:
+        for attempt in range(1, self._max_attempts + 1):
+            await self._bucket.acquire()
+            try:
+                await asyncio.to_thread(conn.send, self._sender, envelope.recipient, envelope.message)
+            except Exception as exc:
+                if attempt < self._max_attempts and is_transient(exc):
+                    self._stats["retries"] += 1
+                    logger.warning(
+                        "Email send failed, retrying",
+                        extra={"recipient": envelope.recipient, "attempt": attempt, "error": str(exc)},
+                    )
+                    jitter = random.uniform(0.8, 1.2)  # noqa: S311 — backoff jitter, not security
+                    await asyncio.sleep(self._backoff * 2 ** (attempt - 1) * jitter)
+                    continue
+                self._stats["failed"] += 1
+                logger.exception(
+                    "Email delivery failed", extra={"recipient": envelope.recipient, "attempts": attempt}
+                )
+                envelope.future.set_result(False)
+                return
+            self._stats["sent"] += 1
+            logger.info(
+                "Email sent",
+                extra={"recipient": envelope.recipient, "subject_preview": envelope.subject[:60], "attempts": attempt},
+            )
+            envelope.future.set_result(True)
+            return
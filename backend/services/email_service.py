@@ -1,57 +1,93 @@
-"""Shared email service — sends HTML emails via SMTP SSL.
+"""Shared email service — sends HTML emails via SMTP.
 
-Wraps smtplib.SMTP_SSL in asyncio.to_thread() for async compatibility.
+Messages go through a process-wide ``EmailDeliveryQueue`` (see
+``email_delivery``): persistent authenticated connections, token-bucket
+pacing (``SMTP_RATE_PER_SECOND``/``SMTP_BURST``) and retry with backoff.
 Falls back gracefully if SMTP config is missing (logs warning, returns False).
 """
 
 import asyncio
 import logging
-import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 from backend.config import settings
+from backend.services.email_delivery import EmailDeliveryQueue, SmtpConnection
 
 logger = logging.getLogger(__name__)
 
+_queue: EmailDeliveryQueue | None = None
+
 
 class EmailService:
-    """Sends HTML emails via SMTP SSL (port 465)."""
+    """Sends HTML emails via SMTP (SSL on port 465 by default)."""
 
     @staticmethod
     def _is_configured() -> bool:
         return bool(settings.smtp_host and settings.smtp_user and settings.smtp_password)
 
     @staticmethod
-    def _send_sync(to: str, subject: str, html_body: str) -> bool:
-        """Synchronous SMTP SSL send."""
+    def _build_message(to: str, subject: str, html_body: str) -> str:
         msg = MIMEMultipart("alternative")
         msg["From"] = settings.smtp_from
         msg["To"] = to
         msg["Subject"] = subject
         msg.attach(MIMEText(html_body, "html", "utf-8"))
+        return msg.as_string()
 
-        try:
-            with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=15) as server:
-                server.login(settings.smtp_user, settings.smtp_password)
-                server.sendmail(settings.smtp_from, [to], msg.as_string())
-            logger.info("Email sent", extra={"recipient": to, "subject_preview": subject[:60]})
-            return True
-        except smtplib.SMTPException:
-            logger.exception("SMTP error sending email", extra={"recipient": to})
-            return False
-        except (TimeoutError, OSError):
-            logger.exception("Email connection error", extra={"recipient": to})
-            return False
+    @staticmethod
+    def _connect() -> SmtpConnection:
+        return SmtpConnection(
+            settings.smtp_host,
+            settings.smtp_port,
+            settings.smtp_user,
+            settings.smtp_password,
+            security=settings.smtp_security,
+        )
 
     @classmethod
-    async def send(cls, to: str, subject: str, html_body: str) -> bool:
-        """Send an HTML email asynchronously via SMTP SSL.
+    def queue(cls) -> EmailDeliveryQueue:
+        """The delivery queue of the running event loop (created on first use)."""
+        global _queue
+        if _queue is None or _queue.loop is not asyncio.get_running_loop():
+            _queue = EmailDeliveryQueue(
+                cls._connect,
+                sender=settings.smtp_from,
+                workers=settings.smtp_pool_size,
+                maxsize=settings.smtp_queue_size,
+                rate=settings.smtp_rate_per_second,
+                burst=settings.smtp_burst,
+                max_attempts=settings.smtp_max_attempts,
+            )
+        return _queue
 
-        Returns True on success, False on failure or missing config.
+    @classmethod
+    async def submit(cls, to: str, subject: str, html_body: str) -> asyncio.Future:
+        """Queue an HTML email; the returned future resolves to True once delivered.
+
+        Lets callers render the next message while earlier ones are sent.
+        Resolves to False on failure or missing config.
         """
         if not cls._is_configured():
             logger.warning("SMTP not configured, skipping email", extra={"recipient": to})
-            return False
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(False)
+            return future
+
+        return await cls.queue().submit(to, subject, cls._build_message(to, subject, html_body))
 
-        return await asyncio.to_thread(cls._send_sync, to, subject, html_body)
+    @classmethod
+    async def send(cls, to: str, subject: str, html_body: str) -> bool:
+        """Send an HTML email and wait for delivery.
+
+        Returns True on success, False on failure or missing config.
+        """
+        return await (await cls.submit(to, subject, html_body))
+
+    @classmethod
+    async def close(cls) -> None:
+        """Flush the queue and close the SMTP connections (shutdown, tests)."""
+        global _queue
+        queue, _queue = _queue, None
+        if queue is not None and queue.loop is asyncio.get_running_loop():
+            await queue.close()
@@ -10,6 +10,7 @@ Per-simulation accent colors thread through all templates via accent_color param
 from __future__ import annotations
 
 from collections import Counter
+from functools import lru_cache
 
 # ── Per-simulation accent colors ──────────────────────────────────────────
 
@@ -313,6 +314,11 @@ def _rank_arrow(current: int, previous: int) -> str:
 def _score_bar(value: float, max_val: float = 100.0, accent: str = _AMBER) -> str:
     """Render a 10-cell ASCII-style score bar as HTML table cells."""
     filled = min(10, max(0, round(value / max_val * 10))) if max_val > 0 else 0
+    return _score_cells(filled, accent)
+
+
+@lru_cache(maxsize=256)
+def _score_cells(filled: int, accent: str) -> str:
     cells = ""
     for i in range(10):
         bg = accent if i < filled else "#1a1a1a"
@@ -346,6 +352,7 @@ def _email_shell(title: str, content: str) -> str:
 </html>"""
 
 
+@lru_cache(maxsize=256)
 def _section_header(label: str) -> str:
     """Render a dossier section header row."""
     return f"""\
@@ -358,6 +365,7 @@ def _section_header(label: str) -> str:
           </tr>"""
 
 
+@lru_cache(maxsize=256)
 def _cta_button(url: str, label: str, *, accent: str = _AMBER) -> str:
     """Render the CTA button row with per-simulation accent color."""
     return f"""\
@@ -371,6 +379,7 @@ def _cta_button(url: str, label: str, *, accent: str = _AMBER) -> str:
           </tr>"""
 
 
+@lru_cache(maxsize=256)
 def _language_divider() -> str:
     """Render the EN/DE language divider."""
     return f"""\
@@ -389,6 +398,7 @@ def _language_divider() -> str:
           </tr>"""
 
 
+@lru_cache(maxsize=256)
 def _footer_row(email_locale: str | None = None) -> str:
     """Render the standard footer with notification management link."""
     if email_locale == "de":
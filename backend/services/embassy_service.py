@@ -13,6 +13,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.services.base_service import serialize_for_json
+from backend.utils.db import gather_queries, run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -57,7 +58,7 @@ class EmbassyService:
             query = query.eq("status", status_filter)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
 
@@ -69,12 +70,11 @@ class EmbassyService:
     ) -> list[dict]:
         """List embassies for a specific building."""
         bid = str(building_id)
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select(_EMBASSY_SELECT)
             .or_(f"building_a_id.eq.{bid},building_b_id.eq.{bid}")
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -85,12 +85,11 @@ class EmbassyService:
         embassy_id: UUID,
     ) -> dict:
         """Get a single embassy by ID."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select(_EMBASSY_SELECT)
             .eq("id", str(embassy_id))
             .single()
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -107,12 +106,11 @@ class EmbassyService:
     ) -> dict | None:
         """Get the embassy for a specific building, or None."""
         bid = str(building_id)
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select(_EMBASSY_SELECT)
             .or_(f"building_a_id.eq.{bid},building_b_id.eq.{bid}")
             .limit(1)
-            .execute()
         )
         return response.data[0] if response.data else None
 
@@ -161,10 +159,9 @@ class EmbassyService:
             "created_by_id": str(created_by_id) if created_by_id else None,
         })
 
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .insert(insert_data)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -201,11 +198,10 @@ class EmbassyService:
 
         update_data = {**serialize_for_json(data), "updated_at": datetime.now(UTC).isoformat()}
 
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .update(update_data)
             .eq("id", str(embassy_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -252,12 +248,11 @@ class EmbassyService:
         supabase: Client,
     ) -> list[dict]:
         """List all active embassies (for map data)."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select(_EMBASSY_SELECT)
             .eq("status", "active")
             .order("created_at", desc=False)
-            .execute()
         )
         return response.data or []
 
@@ -271,12 +266,14 @@ class EmbassyService:
         eid = embassy["id"]
 
         # Get partner building names
-        ba_resp = admin_supabase.table("buildings").select("name").eq("id", embassy["building_a_id"]).single().execute()
-        bb_resp = admin_supabase.table("buildings").select("name").eq("id", embassy["building_b_id"]).single().execute()
+        ba_resp, bb_resp = await gather_queries(
+            admin_supabase.table("buildings").select("name").eq("id", embassy["building_a_id"]).single(),
+            admin_supabase.table("buildings").select("name").eq("id", embassy["building_b_id"]).single(),
+        )
 
         if ba_resp.data and bb_resp.data:
             # Update building A
-            admin_supabase.table("buildings").update({
+            await run_query(admin_supabase.table("buildings").update({
                 "special_type": "embassy",
                 "special_attributes": serialize_for_json({
                     "embassy_id": eid,
@@ -284,10 +281,10 @@ class EmbassyService:
                     "partner_simulation_id": embassy["simulation_b_id"],
                     "partner_building_name": bb_resp.data["name"],
                 }),
-            }).eq("id", embassy["building_a_id"]).execute()
+            }).eq("id", embassy["building_a_id"]))
 
             # Update building B
-            admin_supabase.table("buildings").update({
+            await run_query(admin_supabase.table("buildings").update({
                 "special_type": "embassy",
                 "special_attributes": serialize_for_json({
                     "embassy_id": eid,
@@ -295,7 +292,7 @@ class EmbassyService:
                     "partner_simulation_id": embassy["simulation_a_id"],
                     "partner_building_name": ba_resp.data["name"],
                 }),
-            }).eq("id", embassy["building_b_id"]).execute()
+            }).eq("id", embassy["building_b_id"]))
 
     @classmethod
     async def _clear_building_special_attrs(
@@ -305,7 +302,7 @@ class EmbassyService:
     ) -> None:
         """Clear special_type and special_attributes on dissolved embassy buildings."""
         for bid in [embassy["building_a_id"], embassy["building_b_id"]]:
-            admin_supabase.table("buildings").update({
+            await run_query(admin_supabase.table("buildings").update({
                 "special_type": None,
                 "special_attributes": {},
-            }).eq("id", bid).execute()
+            }).eq("id", bid))
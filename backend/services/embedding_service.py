@@ -1,12 +1,32 @@
-"""Lightweight embedding service using OpenRouter / OpenAI-compatible endpoint."""
+"""Embedding service using OpenRouter / OpenAI-compatible endpoint.
+
+Embeddings are content-addressed — keyed by ``content_hash(text)`` (SHA-256 of
+model + truncated text) — and looked up in three tiers:
+
+- an in-process LRU (``EMBEDDING_CACHE_SIZE`` vectors);
+- the ``embedding_cache`` table (migration 089), shared by all workers;
+- one ``/embeddings`` request carrying every remaining input
+  (``MAX_BATCH_SIZE`` per request) on a persistent keep-alive client.
+
+``embed()`` calls are coalesced: texts submitted within ``BATCH_WINDOW``
+seconds of each other go out as one ``embed_many()`` batch, so concurrent
+callers share a round-trip. Zero vectors (mock mode, missing key, failed
+request) are returned but never cached.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 
 import httpx
+from cachetools import LRUCache
 
 from backend.config import settings
+from backend.utils.db import run_query
+from backend.utils.supabase_pool import get_admin_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +34,67 @@ EMBEDDING_MODEL = "openai/text-embedding-3-small"
 EMBEDDING_DIMS = 1536
 ZERO_VECTOR = [0.0] * EMBEDDING_DIMS
 
+EMBEDDINGS_URL = "https://openrouter.ai/api/v1/embeddings"
+MAX_INPUT_CHARS = 8000  # Truncate to avoid token limits
+MAX_BATCH_SIZE = 128  # Inputs per /embeddings request
+BATCH_WINDOW = 0.01  # Seconds embed() waits for other callers to join its batch
+EMBEDDING_CACHE_SIZE = 4096
+TIMEOUT_SECONDS = 30.0
+
+# content_hash → vector
+_cache: LRUCache = LRUCache(maxsize=EMBEDDING_CACHE_SIZE)
+_stats: dict[str, int] = {"memory_hits": 0, "table_hits": 0, "fetched": 0, "requests": 0, "coalesced": 0}
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_batcher: EmbeddingBatcher | None = None
+
+
+def content_hash(text: str) -> str:
+    """Cache key of ``text`` under the current embedding model."""
+    return hashlib.sha256(f"{EMBEDDING_MODEL}\n{text[:MAX_INPUT_CHARS]}".encode()).hexdigest()
+
+
+class EmbeddingBatcher:
+    """Collects ``embed()`` calls for ``window`` seconds and flushes them as one batch per API key."""
+
+    def __init__(self, window: float = BATCH_WINDOW, max_batch: int = MAX_BATCH_SIZE) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[str | None, list[tuple[str, asyncio.Future]]] = {}
+        self._flushes: set[asyncio.Task] = set()
+
+    async def embed(self, text: str, api_key: str | None) -> list[float]:
+        future = self.loop.create_future()
+        pending = self._pending.setdefault(api_key, [])
+        pending.append((text, future))
+        if len(pending) == 1:
+            self.loop.call_later(self._window, self._flush, api_key)
+        elif len(pending) >= self._max_batch:
+            self._flush(api_key)
+        return await future
+
+    def _flush(self, api_key: str | None) -> None:
+        batch = self._pending.pop(api_key, None)
+        if not batch:
+            return
+        task = self.loop.create_task(self._resolve(batch, api_key))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    @staticmethod
+    async def _resolve(batch: list[tuple[str, asyncio.Future]], api_key: str | None) -> None:
+        _stats["coalesced"] += len(batch) - 1
+        try:
+            vectors = await EmbeddingService.embed_many([text for text, _ in batch], api_key=api_key)
+        except Exception:
+            logger.exception("Embedding batch failed — returning zero vectors")
+            vectors = [ZERO_VECTOR] * len(batch)
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
+
 
 class EmbeddingService:
     """Generate text embeddings via OpenRouter."""
@@ -22,32 +103,162 @@ class EmbeddingService:
     async def embed(cls, text: str, api_key: str | None = None) -> list[float]:
         """Return a 1536-dim embedding vector for the given text.
 
+        Joins the current micro-batch unless the vector is already cached.
         Returns zero vector in mock mode or on failure.
         """
         if settings.forge_mock_mode:
             return ZERO_VECTOR
+        cached = _cache.get(content_hash(text))
+        if cached is not None:
+            _stats["memory_hits"] += 1
+            return cached
+        return await cls._batcher().embed(text, api_key)
+
+    @classmethod
+    async def embed_many(cls, texts: list[str], api_key: str | None = None) -> list[list[float]]:
+        """Return one embedding per text (in order), fetching only uncached ones.
+
+        Duplicate texts are embedded once. Returns zero vectors in mock mode,
+        without an API key, or for inputs whose request failed.
+        """
+        if not texts:
+            return []
+        if settings.forge_mock_mode:
+            return [ZERO_VECTOR] * len(texts)
 
         key = api_key or settings.openrouter_api_key
         if not key:
-            logger.warning("No API key for embeddings — returning zero vector")
-            return ZERO_VECTOR
+            logger.warning("No API key for embeddings — returning zero vectors")
+            return [ZERO_VECTOR] * len(texts)
+
+        hashes = [content_hash(text) for text in texts]
+        found: dict[str, list[float]] = {}
+        for h in dict.fromkeys(hashes):
+            cached = _cache.get(h)
+            if cached is not None:
+                found[h] = cached
+                _stats["memory_hits"] += 1
+
+        missing = [h for h in dict.fromkeys(hashes) if h not in found]
+        if missing:
+            from_table = await cls._load_cached(missing)
+            _stats["table_hits"] += len(from_table)
+            found.update(from_table)
+
+        to_fetch = {h: text for h, text in zip(hashes, texts, strict=True) if h not in found}
+        if to_fetch:
+            fetched = await cls._fetch(list(to_fetch.values()), key)
+            new = {h: vector for h, vector in zip(to_fetch, fetched, strict=True) if vector is not None}
+            _stats["fetched"] += len(new)
+            found.update(new)
+            await cls._store_cached(new)
+
+        for h, vector in found.items():
+            _cache[h] = vector
+        return [found.get(h, ZERO_VECTOR) for h in hashes]
+
+    @staticmethod
+    def stats() -> dict:
+        """Cache hit counters, fetched vectors and API requests since start."""
+        return {**_stats, "cached": len(_cache)}
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the in-process tier (tests; the table tier is keyed by model)."""
+        _cache.clear()
+
+    @staticmethod
+    async def close() -> None:
+        """Close the pooled HTTP client (shutdown, tests)."""
+        global _client, _batcher  # noqa: PLW0603
+        client, _client, _batcher = _client, None, None
+        if client is not None and _client_loop is asyncio.get_running_loop():
+            await client.aclose()
+
+    # ── Internals ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _batcher() -> EmbeddingBatcher:
+        """The micro-batcher of the running event loop (created on first use)."""
+        global _batcher  # noqa: PLW0603
+        if _batcher is None or _batcher.loop is not asyncio.get_running_loop():
+            _batcher = EmbeddingBatcher()
+        return _batcher
+
+    @staticmethod
+    def _http_client() -> httpx.AsyncClient:
+        """The keep-alive client of the running event loop (created on first use)."""
+        global _client, _client_loop  # noqa: PLW0603
+        loop = asyncio.get_running_loop()
+        if _client is None or _client_loop is not loop:
+            _client = httpx.AsyncClient(
+                timeout=TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            )
+            _client_loop = loop
+        return _client
 
+    @classmethod
+    async def _fetch(cls, texts: list[str], key: str) -> list[list[float] | None]:
+        """Embed ``texts`` in ``MAX_BATCH_SIZE`` chunks; None for inputs of a failed chunk."""
+        chunks = [texts[i:i + MAX_BATCH_SIZE] for i in range(0, len(texts), MAX_BATCH_SIZE)]
+        results = await asyncio.gather(*(cls._fetch_chunk(chunk, key) for chunk in chunks))
+        return [vector for chunk in results for vector in chunk]
+
+    @classmethod
+    async def _fetch_chunk(cls, texts: list[str], key: str) -> list[list[float] | None]:
+        _stats["requests"] += 1
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    "https://openrouter.ai/api/v1/embeddings",
-                    headers={
-                        "Authorization": f"Bearer {key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": EMBEDDING_MODEL,
-                        "input": text[:8000],  # Truncate to avoid token limits
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                return data["data"][0]["embedding"]
+            resp = await cls._http_client().post(
+                EMBEDDINGS_URL,
+                headers={
+                    "Authorization": f"Bearer {key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": EMBEDDING_MODEL,
+                    "input": [text[:MAX_INPUT_CHARS] for text in texts],
+                },
+            )
+            resp.raise_for_status()
+            items = sorted(resp.json()["data"], key=lambda item: item["index"])
+            if len(items) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(items)}")
+            return [item["embedding"] for item in items]
         except Exception:
-            logger.exception("Embedding request failed — returning zero vector")
-            return ZERO_VECTOR
+            logger.exception("Embedding request failed — returning zero vectors", extra={"inputs": len(texts)})
+            return [None] * len(texts)
+
+    @staticmethod
+    async def _load_cached(hashes: list[str]) -> dict[str, list[float]]:
+        """Vectors of ``hashes`` found in the embedding_cache table."""
+        try:
+            resp = await run_query(
+                get_admin_client().table("embedding_cache")
+                .select("content_hash, embedding")
+                .in_("content_hash", hashes)
+            )
+        except Exception:
+            logger.warning("Embedding cache lookup failed", exc_info=True)
+            return {}
+        return {
+            row["content_hash"]: json.loads(row["embedding"]) if isinstance(row["embedding"], str) else row["embedding"]
+            for row in resp.data or []
+        }
+
+    @staticmethod
+    async def _store_cached(vectors: dict[str, list[float]]) -> None:
+        """Write fetched vectors to the embedding_cache table (best effort)."""
+        if not vectors:
+            return
+        rows = [
+            {"content_hash": h, "model": EMBEDDING_MODEL, "embedding": str(vector)}
+            for h, vector in vectors.items()
+        ]
+        try:
+            await run_query(
+                get_admin_client().table("embedding_cache")
+                .upsert(rows, on_conflict="content_hash", ignore_duplicates=True)
+            )
+        except Exception:
+            logger.warning("Embedding cache write failed", exc_info=True)
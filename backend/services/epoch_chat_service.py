@@ -5,6 +5,7 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -30,12 +31,11 @@ class EpochChatService:
         - For team messages, the sender's participant has matching team_id
         """
         # Validate epoch is active
-        epoch_resp = (
+        epoch_resp = await run_query(
             supabase.table("game_epochs")
             .select("id, status")
             .eq("id", str(epoch_id))
             .limit(1)
-            .execute()
         )
         if not epoch_resp.data:
             raise HTTPException(
@@ -56,13 +56,12 @@ class EpochChatService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="team_id is required for team messages.",
                 )
-            participant_resp = (
+            participant_resp = await run_query(
                 supabase.table("epoch_participants")
                 .select("id, team_id")
                 .eq("epoch_id", str(epoch_id))
                 .eq("simulation_id", str(sender_simulation_id))
                 .limit(1)
-                .execute()
             )
             if not participant_resp.data:
                 raise HTTPException(
@@ -86,10 +85,9 @@ class EpochChatService:
         if team_id and channel_type == "team":
             insert_data["team_id"] = str(team_id)
 
-        response = (
+        response = await run_query(
             supabase.table("epoch_chat_messages")
             .insert(insert_data)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -129,7 +127,7 @@ class EpochChatService:
             query = query.lt("created_at", before)
 
         query = query.order("created_at", desc=True).limit(limit)
-        response = query.execute()
+        response = await run_query(query)
 
         messages = response.data or []
         total = response.count or 0
@@ -137,11 +135,10 @@ class EpochChatService:
         # Enrich with sender names (batch)
         if messages:
             sim_ids = list({m["sender_simulation_id"] for m in messages})
-            sim_resp = (
+            sim_resp = await run_query(
                 supabase.table("simulations")
                 .select("id, name")
                 .in_("id", sim_ids)
-                .execute()
             )
             name_map = {s["id"]: s["name"] for s in (sim_resp.data or [])}
             for m in messages:
@@ -162,18 +159,19 @@ class EpochChatService:
         """Toggle cycle_ready for a participant.
 
         When a human sets ready=True and all non-bot participants are ready,
-        automatically resolves the cycle (bots, scoring, notifications).
-        Returns the participant row with optional `auto_resolved` and `new_cycle` fields.
+        automatically starts resolving the cycle (bots, scoring, notifications)
+        in the background. Returns the participant row with optional
+        `auto_resolved`, `new_cycle` and `resolution_cycle` fields — poll the
+        resolution job of `resolution_cycle` for completion.
         """
-        from backend.services.epoch_service import EpochService
+        from backend.services.cycle_resolution_service import CycleResolutionService
 
         # Validate epoch is in an active phase
-        epoch_resp = (
+        epoch_resp = await run_query(
             supabase.table("game_epochs")
             .select("id, status")
             .eq("id", str(epoch_id))
             .limit(1)
-            .execute()
         )
         if not epoch_resp.data:
             raise HTTPException(
@@ -186,12 +184,11 @@ class EpochChatService:
                 detail="Ready signals are only available during active epoch phases.",
             )
 
-        response = (
+        response = await run_query(
             supabase.table("epoch_participants")
             .update({"cycle_ready": ready})
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -204,11 +201,10 @@ class EpochChatService:
         # Auto-resolve: if signalling ready, check if all humans are now ready
         if ready and admin_supabase:
             # Use admin client for consistent participant data regardless of RLS
-            all_participants = (
+            all_participants = await run_query(
                 admin_supabase.table("epoch_participants")
                 .select("id, cycle_ready, is_bot")
                 .eq("epoch_id", str(epoch_id))
-                .execute()
             )
             humans = [p for p in (all_participants.data or []) if not p.get("is_bot")]
             all_humans_ready = len(humans) > 0 and all(p["cycle_ready"] for p in humans)
@@ -225,11 +221,10 @@ class EpochChatService:
 
             if all_humans_ready:
                 try:
-                    epoch_data = await EpochService.resolve_cycle_full(
-                        supabase, epoch_id, admin_supabase
-                    )
+                    job = await CycleResolutionService.start(supabase, epoch_id, admin_supabase)
                     result["auto_resolved"] = True
-                    result["new_cycle"] = epoch_data.get("current_cycle", 1)
+                    result["resolution_cycle"] = job["cycle_number"]
+                    result["new_cycle"] = job["cycle_number"] + 1
                 except Exception:
                     logger.exception("Auto-resolve failed", extra={"epoch_id": str(epoch_id)})
 
@@ -238,12 +233,11 @@ class EpochChatService:
     @staticmethod
     async def _enrich_sender_name(supabase: Client, message: dict) -> dict:
         """Add sender_name from simulations table."""
-        sim_resp = (
+        sim_resp = await run_query(
             supabase.table("simulations")
             .select("name")
             .eq("id", message["sender_simulation_id"])
             .limit(1)
-            .execute()
         )
         message["sender_name"] = (
             sim_resp.data[0]["name"] if sim_resp.data else None
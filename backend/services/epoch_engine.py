@@ -0,0 +1,1021 @@
+"""Headless epoch engine — the epoch rules over in-memory state, no database.
+
+Plays a whole epoch in-process: deployment validation and the RP economy
+(``EpochService``), success probability (``mission_probability``), mission
+resolution and effects (``OperativeService``), zone fortifications, phase
+advancement and the five scoring dimensions (``scoring_engine``). Balance
+scripts use it to run Monte Carlo batteries without a backend; parity tests
+(``tests/unit/test_epoch_engine.py``) run the real services over the same
+state and compare the results.
+
+State is kept as lists of row dicts named after the tables they mirror
+(``operative_missions``, ``zones``, ``embassies``, ...), so a game can be
+seeded from exported simulation data (``WorldSeed``) and compared
+row-for-row with the database.
+
+Time is a game clock advanced by ``cycle_hours`` per resolved cycle — the
+same arithmetic ``EpochService.resolve_cycle`` applies to ``resolves_at``.
+Effect expiries (infiltration, ambassador blocks) use the same clock.
+
+Zone stability follows ``mv_zone_stability``: exported infrastructure and
+base pressure per zone, the security weight of the zone's *current* level,
+and ambient pressure from events created during the game. Embassy
+effectiveness is taken from the export (``mv_embassy_effectiveness``).
+
+Mission rolls come from the same seeded per-pass stream as the service
+(``epoch_rng``); row ids are drawn from the seed as well, so a game is
+reproducible from its seed. With ``record_replay=True`` the engine keeps the
+same replay log the service writes (``epoch_replay``).
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+from backend.services import epoch_replay
+from backend.services.epoch_rng import RollRecorder, new_epoch_seed, rng_for, roll_outcome
+from backend.services.epoch_service import DEFAULT_CONFIG, OPERATIVE_RP_COSTS, next_phase_status, phase_boundaries
+from backend.services.mission_probability import build_contexts, infiltration_penalty_expired, success_probability
+from backend.services.operative_service import (
+    BUILDING_CONDITION_DOWNGRADE,
+    DEPLOY_CYCLES,
+    FORTIFICATION_DURATION_CYCLES,
+    FORTIFICATION_RP_COST,
+    MISSION_DURATION_CYCLES,
+    SECURITY_DOWNGRADE,
+    SECURITY_TIER_ORDER,
+)
+from backend.services.scoring_engine import EpochScoringData, composite_scores, compute_raw_scores
+
+GAME_START = datetime(2026, 1, 1, tzinfo=UTC)
+
+COUNTER_INTEL_RP_COST = 4
+EFFECT_DURATION_CYCLES = 3  # Infiltration penalty and ambassador block
+INFILTRATION_PENALTY = 0.65
+BETRAYAL_PENALTY = 0.25
+
+# game_weight_fallback('security_level', ...) — used when a simulation has no taxonomy weight
+SECURITY_WEIGHT_FALLBACK: dict[str, float] = {"restricted": 1.0, "high": 0.85, "medium": 0.55, "low": 0.3}
+DEFAULT_SECURITY_WEIGHT = 0.5
+EVENT_SPILL_FACTOR = 0.3  # pressure_spill_factor default — game events have no zone links
+EVENT_PRESSURE_DIVISOR = 15.0
+
+
+class EngineError(Exception):
+    """A rule violation — the engine's equivalent of the services' ``HTTPException``."""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+# ── World seed ────────────────────────────────────────────
+
+
+@dataclass
+class WorldSeed:
+    """Exported simulation data a game starts from, one list of rows per table.
+
+    ``simulations`` rows may carry ``security_weights`` ({level: weight}, the
+    simulation's security_level taxonomy) and the resonance inputs
+    ``zone_pressure``, ``resonance_modifiers`` ({operative_type: value}) and
+    ``attacker_pressure_penalty``. ``zones`` rows carry
+    ``infrastructure_score`` and ``total_pressure`` from ``mv_zone_stability``;
+    ``embassies`` rows carry ``effectiveness`` from ``mv_embassy_effectiveness``.
+    """
+
+    simulations: list[dict] = field(default_factory=list)
+    agents: list[dict] = field(default_factory=list)
+    agent_aptitudes: list[dict] = field(default_factory=list)
+    zones: list[dict] = field(default_factory=list)
+    buildings: list[dict] = field(default_factory=list)
+    embassies: list[dict] = field(default_factory=list)
+    agent_relationships: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def from_export(cls, data: dict) -> WorldSeed:
+        return cls(**{f.name: list(data.get(f.name) or []) for f in fields(cls)})
+
+    @classmethod
+    def load(cls, path: str | Path) -> WorldSeed:
+        return cls.from_export(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def to_export(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def subset(self, simulation_ids: list[str]) -> WorldSeed:
+        """Only the given simulations (and embassies/relationships between them)."""
+        sims = set(simulation_ids)
+        agent_ids = {a["id"] for a in self.agents if a["simulation_id"] in sims}
+        return WorldSeed(
+            simulations=[s for s in self.simulations if s["id"] in sims],
+            agents=[a for a in self.agents if a["simulation_id"] in sims],
+            agent_aptitudes=[a for a in self.agent_aptitudes if a["agent_id"] in agent_ids],
+            zones=[z for z in self.zones if z["simulation_id"] in sims],
+            buildings=[b for b in self.buildings if b["simulation_id"] in sims],
+            embassies=[
+                e for e in self.embassies
+                if e["simulation_a_id"] in sims and e["simulation_b_id"] in sims
+            ],
+            agent_relationships=[
+                r for r in self.agent_relationships
+                if r["source_agent_id"] in agent_ids or r["target_agent_id"] in agent_ids
+            ],
+        )
+
+
+def _copy_rows(rows: list[dict]) -> list[dict]:
+    return [dict(r) for r in rows]
+
+
+def _iso(ts: datetime) -> str:
+    return ts.isoformat()
+
+
+# ── Engine ────────────────────────────────────────────────
+
+
+class EpochEngine:
+    """One epoch played in memory. Methods mirror the service operations they replace."""
+
+    def __init__(
+        self,
+        world: WorldSeed,
+        config: dict | None = None,
+        *,
+        participants: list[str] | None = None,
+        seed: int | None = None,
+        rng: random.Random | None = None,
+        record_replay: bool = False,
+    ) -> None:
+        # Resolution passes draw from the seeded per-pass stream, like the service;
+        # an explicit ``rng`` replaces it for every pass.
+        self.rng = rng
+        self.rng_seed = seed if seed is not None else new_epoch_seed()
+        self.pass_rng: RollRecorder | None = None
+        self.record_replay = record_replay
+        # Row ids feed the resolution stream, so they come from the seed too
+        self._id_rng = random.Random(self.rng_seed)  # noqa: S311 — simulation, not security
+        self.config = {**DEFAULT_CONFIG, **(config or {})}
+        self.clock_hours = 0
+        self.epoch = {
+            "id": self._new_id(),
+            "status": "lobby",
+            "current_cycle": 0,
+            "config": self.config,
+        }
+
+        self.simulations = {s["id"]: dict(s) for s in world.simulations}
+        self.agents = {a["id"]: dict(a) for a in world.agents}
+        self.agent_aptitudes = _copy_rows(world.agent_aptitudes)
+        self.zones = _copy_rows(world.zones)
+        self.buildings = {b["id"]: dict(b) for b in world.buildings}
+        self.embassies = {e["id"]: dict(e) for e in world.embassies}
+        self.agent_relationships = _copy_rows(world.agent_relationships)
+
+        self.zones_by_sim: dict[str, list[dict]] = defaultdict(list)
+        for z in self.zones:
+            self.zones_by_sim[z["simulation_id"]].append(z)
+
+        self.participants: dict[str, dict] = {}
+        self.teams: list[dict] = []
+        self.operative_missions: list[dict] = []
+        self.zone_fortifications: list[dict] = []
+        self.events: list[dict] = []
+        self.battle_log: list[dict] = []
+        self.epoch_scores: list[dict] = []
+        self.epoch_cycle_replays: list[dict] = []
+
+        for sim_id in participants if participants is not None else list(self.simulations):
+            self.join(sim_id)
+
+    def _new_id(self) -> str:
+        return str(UUID(int=self._id_rng.getrandbits(128), version=4))
+
+    # ── Clock / lifecycle ─────────────────────────────────
+
+    @property
+    def now(self) -> datetime:
+        return GAME_START + timedelta(hours=self.clock_hours)
+
+    @property
+    def status(self) -> str:
+        return self.epoch["status"]
+
+    @property
+    def current_cycle(self) -> int:
+        return self.epoch["current_cycle"]
+
+    def join(self, simulation_id: str) -> dict:
+        participant = {
+            "id": self._new_id(),
+            "epoch_id": self.epoch["id"],
+            "simulation_id": simulation_id,
+            "current_rp": 0,
+            "team_id": None,
+            "betrayal_penalty": 0,
+            "cycle_ready": False,
+        }
+        self.participants[simulation_id] = participant
+        return participant
+
+    def start(self) -> dict:
+        """lobby → foundation, cycle 1, foundation RP bonus (``EpochService.start_epoch``)."""
+        if self.status != "lobby":
+            raise EngineError(400, f"Cannot start epoch with status '{self.status}'.")
+        if len(self.participants) < 2:
+            raise EngineError(400, "Need at least 2 participants to start an epoch.")
+        self.epoch.update(status="foundation", current_cycle=1)
+        self._grant_rp_batch(int(self.config["rp_per_cycle"] * 1.5))
+        return self.epoch
+
+    def advance_phase(self) -> dict:
+        next_status = {"foundation": "competition", "competition": "reckoning", "reckoning": "completed"}
+        if self.status not in next_status:
+            raise EngineError(400, f"Cannot advance from '{self.status}'.")
+        self.epoch["status"] = next_status[self.status]
+        return self.epoch
+
+    # ── RP economy ────────────────────────────────────────
+
+    def _participant(self, simulation_id: str) -> dict:
+        participant = self.participants.get(simulation_id)
+        if participant is None:
+            raise EngineError(404, "Not a participant.")
+        return participant
+
+    def _grant_rp_batch(self, amount: int) -> None:
+        cap = self.config["rp_cap"]
+        for p in self.participants.values():
+            p["current_rp"] = min(p["current_rp"] + amount, cap)
+
+    def spend_rp(self, simulation_id: str, amount: int) -> int:
+        participant = self._participant(simulation_id)
+        if participant["current_rp"] < amount:
+            raise EngineError(400, f"Insufficient RP: have {participant['current_rp']}, need {amount}.")
+        participant["current_rp"] -= amount
+        return participant["current_rp"]
+
+    def grant_rp(self, simulation_id: str, amount: int) -> int:
+        participant = self._participant(simulation_id)
+        participant["current_rp"] = min(participant["current_rp"] + amount, self.config["rp_cap"])
+        return participant["current_rp"]
+
+    # ── Teams ─────────────────────────────────────────────
+
+    def create_team(self, simulation_id: str, name: str) -> dict:
+        if self.status not in ("lobby", "foundation"):
+            raise EngineError(400, "Alliances can only be formed during lobby or foundation phase.")
+        team = {
+            "id": self._new_id(),
+            "epoch_id": self.epoch["id"],
+            "name": name,
+            "created_by_simulation_id": simulation_id,
+            "dissolved_at": None,
+        }
+        self.teams.append(team)
+        self._participant(simulation_id)["team_id"] = team["id"]
+        return team
+
+    def join_team(self, team_id: str, simulation_id: str) -> dict:
+        if self.status not in ("lobby", "foundation"):
+            raise EngineError(400, "Alliances can only be joined during lobby or foundation phase.")
+        members = [p for p in self.participants.values() if p["team_id"] == team_id]
+        if len(members) >= self.config["max_team_size"]:
+            raise EngineError(400, f"Team is full (max {self.config['max_team_size']} members).")
+        participant = self._participant(simulation_id)
+        participant["team_id"] = team_id
+        return participant
+
+    def leave_team(self, simulation_id: str) -> dict:
+        participant = self._participant(simulation_id)
+        participant["team_id"] = None
+        return participant
+
+    # ── Deploy ────────────────────────────────────────────
+
+    def busy_agent_ids(self) -> set[str]:
+        return {
+            m["agent_id"] for m in self.operative_missions
+            if m["status"] in ("deploying", "active", "returning")
+        }
+
+    def guardian_count(self, simulation_id: str) -> int:
+        return sum(
+            1 for m in self.operative_missions
+            if m["operative_type"] == "guardian"
+            and m["source_simulation_id"] == simulation_id
+            and m["status"] == "active"
+        )
+
+    def active_embassy(self, source_simulation_id: str, target_simulation_id: str) -> dict | None:
+        """First active embassy linking two simulations (``fn_deployment_context`` order)."""
+        for e in self.embassies.values():
+            if e.get("status") == "active" and {e["simulation_a_id"], e["simulation_b_id"]} == {
+                source_simulation_id, target_simulation_id,
+            }:
+                return e
+        return None
+
+    @staticmethod
+    def _embassy_payload(embassy: dict | None) -> dict | None:
+        if not embassy:
+            return None
+        return {
+            "id": embassy["id"],
+            "infiltration_penalty": embassy.get("infiltration_penalty") or 0,
+            "infiltration_penalty_expires_at": embassy.get("infiltration_penalty_expires_at"),
+        }
+
+    def deployment_payload(
+        self,
+        source_simulation_id: str,
+        operative_types: list[str],
+        target_simulation_ids: list[str],
+        agent_ids: list[str] | None = None,
+        target_zone_id: str | None = None,
+        embassy_id: str | None = None,
+    ) -> dict:
+        """The ``fn_deployment_context`` payload, built from engine state."""
+        source = self.simulations.get(source_simulation_id) or {}
+        wanted_agents = set(agent_ids) if agent_ids is not None else None
+        zone = next((z for z in self.zones if z["id"] == target_zone_id), None) if target_zone_id else None
+        targets = []
+        for target_id in target_simulation_ids:
+            target = self.simulations.get(target_id) or {}
+            modifiers = target.get("resonance_modifiers") or {}
+            targets.append({
+                "simulation_id": target_id,
+                "guardian_count": self.guardian_count(target_id),
+                "zone_pressure": target.get("zone_pressure", 0),
+                "resonance_modifiers": {op: modifiers.get(op, 0) for op in operative_types},
+                "embassy": None if embassy_id else self._embassy_payload(
+                    self.active_embassy(source_simulation_id, target_id)
+                ),
+            })
+        return {
+            "attacker_pressure_penalty": source.get("attacker_pressure_penalty", 0),
+            "aptitudes": [
+                a for a in self.agent_aptitudes
+                if a["operative_type"] in operative_types
+                and (
+                    a["agent_id"] in wanted_agents if wanted_agents is not None
+                    else a.get("simulation_id") == source_simulation_id
+                )
+            ],
+            "zone_security_level": zone["security_level"] if zone else None,
+            "embassy": self._embassy_payload(self.embassies.get(embassy_id)) if embassy_id else None,
+            "targets": targets,
+        }
+
+    def deploy(
+        self,
+        simulation_id: str,
+        agent_id: str,
+        operative_type: str,
+        *,
+        target_simulation_id: str | None = None,
+        embassy_id: str | None = None,
+        target_entity_id: str | None = None,
+        target_entity_type: str | None = None,
+        target_zone_id: str | None = None,
+    ) -> dict:
+        """Deploy an operative (``OperativeService.deploy``)."""
+        if self.status not in ("foundation", "competition", "reckoning"):
+            raise EngineError(400, "Operatives can only be deployed during active epoch phases.")
+        if self.status == "foundation" and operative_type not in ("guardian", "spy"):
+            raise EngineError(400, "Only guardian and spy operatives can be deployed during foundation phase.")
+        if operative_type == "guardian" and target_simulation_id is not None:
+            raise EngineError(400, "Guardians can only be deployed to your own simulation.")
+
+        if operative_type != "guardian":
+            if not target_simulation_id:
+                raise EngineError(400, "Offensive operatives require a target simulation.")
+            if not embassy_id:
+                raise EngineError(400, "Operatives must deploy through an embassy.")
+            embassy = self.embassies.get(embassy_id)
+            if not embassy or embassy.get("status") != "active":
+                raise EngineError(400, "Embassy must be active to deploy operatives.")
+
+            source_team = (self.participants.get(simulation_id) or {}).get("team_id")
+            target_team = (self.participants.get(target_simulation_id) or {}).get("team_id")
+            if source_team and target_team and source_team == target_team:
+                if not self.config.get("allow_betrayal", True):
+                    raise EngineError(400, "Betrayal is disabled in this epoch.")
+
+        agent = self.agents.get(agent_id)
+        if not agent or agent["simulation_id"] != simulation_id:
+            raise EngineError(404, "Agent not found in this simulation.")
+        if agent_id in self.busy_agent_ids():
+            raise EngineError(409, "This agent is already on an active mission.")
+
+        cost = OPERATIVE_RP_COSTS.get(operative_type, 5)
+        self.spend_rp(simulation_id, cost)
+
+        payload = self.deployment_payload(
+            simulation_id,
+            [operative_type],
+            [target_simulation_id] if target_simulation_id else [],
+            agent_ids=[agent_id],
+            target_zone_id=target_zone_id,
+            embassy_id=embassy_id,
+        )
+        ctx = build_contexts(payload, [agent_id], operative_type, [target_simulation_id])[
+            (agent_id, target_simulation_id)
+        ]
+        probability = success_probability(ctx, self.now)
+
+        deploy_cycles = DEPLOY_CYCLES.get(operative_type, 1)
+        total_hours = (deploy_cycles + MISSION_DURATION_CYCLES.get(operative_type, 1)) * self.config["cycle_hours"]
+        resolves_at = self.now + (timedelta(days=365) if operative_type == "guardian" else timedelta(hours=total_hours))
+
+        mission = {
+            "id": self._new_id(),
+            "epoch_id": self.epoch["id"],
+            "agent_id": agent_id,
+            "operative_type": operative_type,
+            "source_simulation_id": simulation_id,
+            "target_simulation_id": target_simulation_id,
+            "embassy_id": embassy_id,
+            "target_entity_id": target_entity_id,
+            "target_entity_type": target_entity_type,
+            "target_zone_id": target_zone_id,
+            "status": "active" if deploy_cycles == 0 else "deploying",
+            "cost_rp": cost,
+            "success_probability": float(probability),
+            "resolves_at": _iso(resolves_at),
+            "resolved_at": None,
+            "mission_result": None,
+        }
+        self.operative_missions.append(mission)
+
+        if infiltration_penalty_expired(ctx, self.now) and ctx.embassy_id in self.embassies:
+            self.embassies[ctx.embassy_id].update(infiltration_penalty=0, infiltration_penalty_expires_at=None)
+
+        self._log(
+            "operative_deployed",
+            f"{'An' if operative_type[0] in 'aeiou' else 'A'} {operative_type} has been deployed.",
+            source_simulation_id=simulation_id,
+            target_simulation_id=target_simulation_id,
+            mission_id=mission["id"],
+            is_public=operative_type == "guardian",
+        )
+        return mission
+
+    def recall(self, mission_id: str, simulation_id: str | None = None) -> dict:
+        """Recall an operative: status ``returning``, 50% RP refund (``OperativeService.recall``)."""
+        mission = next((m for m in self.operative_missions if m["id"] == mission_id), None)
+        if mission is None:
+            raise EngineError(404, "Mission not found.")
+        if simulation_id and mission["source_simulation_id"] != simulation_id:
+            raise EngineError(403, "You can only recall operatives from your own simulation.")
+        if mission["status"] not in ("deploying", "active"):
+            raise EngineError(400, f"Cannot recall mission with status '{mission['status']}'.")
+        refund = OPERATIVE_RP_COSTS.get(mission["operative_type"], 5) // 2
+        if refund > 0:
+            self.grant_rp(mission["source_simulation_id"], refund)
+        mission.update(status="returning", resolved_at=_iso(self.now))
+        return mission
+
+    def counter_intel_sweep(self, simulation_id: str) -> list[dict]:
+        """Reveal (detect) every enemy operative targeting ``simulation_id``; costs 4 RP."""
+        self.spend_rp(simulation_id, COUNTER_INTEL_RP_COST)
+        detected = []
+        for m in self.operative_missions:
+            if m["target_simulation_id"] == simulation_id and m["status"] in ("deploying", "active"):
+                m["status"] = "detected"
+                detected.append(m)
+        return detected
+
+    def fortify_zone(self, simulation_id: str, zone_id: str) -> dict:
+        """Foundation only: +1 security tier for ``FORTIFICATION_DURATION_CYCLES`` after foundation, 2 RP."""
+        if self.status != "foundation":
+            raise EngineError(400, "Zone fortification is only available during foundation phase.")
+        zone = next((z for z in self.zones if z["id"] == zone_id), None)
+        if not zone or zone["simulation_id"] != simulation_id:
+            raise EngineError(400, "Zone does not belong to your simulation.")
+        if any(f["zone_id"] == zone_id for f in self.zone_fortifications):
+            raise EngineError(400, "This zone is already fortified.")
+
+        self.spend_rp(simulation_id, FORTIFICATION_RP_COST)
+        foundation_cycles, _, _ = phase_boundaries(self.config)
+        old_level = zone["security_level"]
+        zone["security_level"] = _upgrade(old_level, 1)
+        fortification = {
+            "id": self._new_id(),
+            "epoch_id": self.epoch["id"],
+            "zone_id": zone_id,
+            "source_simulation_id": simulation_id,
+            "security_bonus": 1,
+            "expires_at_cycle": foundation_cycles + FORTIFICATION_DURATION_CYCLES,
+        }
+        self.zone_fortifications.append(fortification)
+        return fortification
+
+    # ── Mission resolution ────────────────────────────────
+
+    def resolve_pending_missions(self) -> list[dict]:
+        """Resolve every due mission (``OperativeService.resolve_pending_missions``).
+
+        Same stream and draw order as the service: missions in id order, all
+        outcome rolls first, then effects per operative type in order of
+        first success. Each pass is appended to the replay log.
+        """
+        now_iso = _iso(self.now)
+        due = [
+            m for m in self.operative_missions
+            if m["status"] in ("deploying", "active")
+            and m["operative_type"] != "guardian"
+            and m["resolves_at"] <= now_iso
+        ]
+        active = sorted((m for m in due if m["status"] == "active"), key=lambda m: m["id"])
+        for m in due:
+            if m["status"] == "deploying":
+                m["status"] = "active"
+        if not active:
+            return []
+
+        self.pass_rng = (
+            RollRecorder(self.rng) if self.rng is not None
+            else rng_for(self.rng_seed, self.current_cycle, [m["id"] for m in active])
+        )
+        outcomes = {m["id"]: roll_outcome(float(m.get("success_probability", 0.5)), self.pass_rng) for m in active}
+
+        results: dict[str, dict] = {}
+        successes: dict[str, list[dict]] = {}
+        for m in active:
+            outcome = outcomes[m["id"]]
+            if outcome == "success":
+                successes.setdefault(m["operative_type"], []).append(m)
+            elif outcome == "detected":
+                results[m["id"]] = {"outcome": "detected", "narrative": "The operative was detected."}
+            else:
+                results[m["id"]] = {"outcome": "failed", "narrative": "The mission failed quietly."}
+
+        handlers = {
+            "spy": self._apply_spy_effects,
+            "saboteur": self._apply_saboteur_effects,
+            "propagandist": self._apply_propagandist_effects,
+            "assassin": self._apply_assassin_effects,
+            "infiltrator": self._apply_infiltrator_effects,
+        }
+        for operative_type, group in successes.items():
+            handler = handlers.get(operative_type)
+            if handler:
+                results.update(handler(group))
+            else:
+                results.update({m["id"]: {"outcome": "success", "narrative": "Mission completed."} for m in group})
+
+        for m in active:
+            m.update(
+                status=outcomes[m["id"]],
+                resolved_at=now_iso,
+                mission_result={**results[m["id"]], "outcome": outcomes[m["id"]]},
+            )
+
+        self._check_betrayals(active, outcomes)
+        for m in active:
+            self._log(
+                "mission_" + m["status"],
+                (m["mission_result"] or {}).get("narrative", ""),
+                source_simulation_id=m["source_simulation_id"],
+                target_simulation_id=m["target_simulation_id"],
+                mission_id=m["id"],
+                is_public=m["status"] != "failed",
+            )
+        if self.record_replay:
+            self._record("resolution", epoch_replay.resolution_record(active, outcomes, self.pass_rng.rolls))
+        return [dict(m) for m in active]
+
+    def _apply_spy_effects(self, missions: list[dict]) -> dict[str, dict]:
+        results = {}
+        for mission in missions:
+            target = mission.get("target_simulation_id")
+            intel: dict = {}
+            if target:
+                zones = self.zones_by_sim.get(target, [])
+                intel = {
+                    "zone_security": [z["security_level"] for z in zones],
+                    "guardian_count": self.guardian_count(target),
+                }
+                names = {z["id"]: z.get("name") for z in zones}
+                forts = [f for f in self.zone_fortifications if f["source_simulation_id"] == target]
+                if forts:
+                    intel["fortifications"] = [
+                        {
+                            "zone_id": f["zone_id"],
+                            "zone_name": names.get(f["zone_id"]) or "Unknown",
+                            "security_bonus": f["security_bonus"],
+                            "expires_at_cycle": f["expires_at_cycle"],
+                        }
+                        for f in forts
+                    ]
+                self._log(
+                    "intel_report",
+                    f"Spy intel: {intel['guardian_count']} guardians, zones: {', '.join(intel['zone_security'])}",
+                    source_simulation_id=mission["source_simulation_id"],
+                    target_simulation_id=target,
+                    mission_id=mission["id"],
+                    metadata=intel,
+                )
+            results[mission["id"]] = {
+                "outcome": "success",
+                "narrative": "Intelligence gathered successfully.",
+                "intel_gathered": True,
+                "intel": intel,
+            }
+        return results
+
+    def _apply_saboteur_effects(self, missions: list[dict]) -> dict[str, dict]:
+        results: dict[str, dict] = {}
+        for mission in missions:
+            result: dict = {"outcome": "success"}
+            building = self.buildings.get(mission.get("target_entity_id"))
+            if building:
+                old_cond = building["building_condition"]
+                building["building_condition"] = BUILDING_CONDITION_DOWNGRADE.get(old_cond, old_cond)
+                result["damage_dealt"] = {
+                    "building_id": building["id"],
+                    "old_condition": old_cond,
+                    "new_condition": building["building_condition"],
+                }
+            zones = self.zones_by_sim.get(mission.get("target_simulation_id"), [])
+            if zones:
+                zone = self.pass_rng.choice(zones)
+                old_level = zone["security_level"]
+                zone["security_level"] = SECURITY_DOWNGRADE.get(old_level, old_level)
+                result["zone_downgraded"] = {
+                    "zone_id": zone["id"],
+                    "old_level": old_level,
+                    "new_level": zone["security_level"],
+                }
+            results[mission["id"]] = result
+
+        # Crisis events with diminishing impact; 3+ active sabotage events saturate a simulation
+        existing = Counter(
+            e["simulation_id"] for e in self.events
+            if e["data_source"] == "sabotage" and e.get("event_status") == "active"
+        )
+        for mission in missions:
+            target = mission.get("target_simulation_id")
+            if not target:
+                continue
+            result = results[mission["id"]]
+            if existing[target] >= 3:
+                result["event_saturated"] = True
+                continue
+            impact_level = max(1, 3 - existing[target])
+            existing[target] += 1
+            self._create_event(target, "sabotage", "crisis", impact_level, mission)
+            result["event_created"] = True
+
+        for result in results.values():
+            parts = ["Sabotage successful."]
+            if "damage_dealt" in result:
+                d = result["damage_dealt"]
+                parts.append(f"Building degraded: {d['old_condition']} → {d['new_condition']}.")
+            if "zone_downgraded" in result:
+                z = result["zone_downgraded"]
+                parts.append(f"Zone security compromised: {z['old_level']} → {z['new_level']}.")
+            result["narrative"] = " ".join(parts)
+        return results
+
+    def _apply_propagandist_effects(self, missions: list[dict]) -> dict[str, dict]:
+        for mission in missions:
+            self._create_event(
+                mission["target_simulation_id"], "propagandist", "social", self.pass_rng.randint(3, 5), mission,
+            )
+        return {
+            m["id"]: {
+                "outcome": "success",
+                "narrative": "Propaganda campaign succeeded. Target population's morale undermined.",
+                "score_awarded": True,
+                "event_created": True,
+            }
+            for m in missions
+        }
+
+    def _apply_assassin_effects(self, missions: list[dict]) -> dict[str, dict]:
+        blocked_until = _iso(self.now + timedelta(hours=EFFECT_DURATION_CYCLES * self.config["cycle_hours"]))
+        results = {}
+        for mission in missions:
+            agent_id = mission.get("target_entity_id")
+            if not agent_id:
+                results[mission["id"]] = {"outcome": "success", "narrative": "Mission completed."}
+                continue
+            touched = [
+                r for r in self.agent_relationships
+                if agent_id in (r.get("source_agent_id"), r.get("target_agent_id"))
+            ]
+            for rel in touched:
+                rel["intensity"] = max(1, rel["intensity"] - 2)
+            if agent_id in self.agents:
+                self.agents[agent_id]["ambassador_blocked_until"] = blocked_until
+            results[mission["id"]] = {
+                "outcome": "success",
+                "narrative": (
+                    "Assassination successful. Target agent's influence "
+                    "diminished and ambassador status suspended."
+                ),
+                "relationships_weakened": len(touched),
+                "ambassador_blocked_until": blocked_until,
+            }
+        return results
+
+    def _apply_infiltrator_effects(self, missions: list[dict]) -> dict[str, dict]:
+        expires_at = _iso(self.now + timedelta(hours=EFFECT_DURATION_CYCLES * self.config["cycle_hours"]))
+        results = {}
+        for mission in missions:
+            embassy_id = mission.get("target_entity_id")
+            if not embassy_id:
+                results[mission["id"]] = {"outcome": "success", "narrative": "Mission completed."}
+                continue
+            if embassy_id in self.embassies:
+                self.embassies[embassy_id].update(
+                    infiltration_penalty=INFILTRATION_PENALTY, infiltration_penalty_expires_at=expires_at,
+                )
+            results[mission["id"]] = {
+                "outcome": "success",
+                "narrative": "Embassy infiltrated. Diplomatic effectiveness severely compromised.",
+                "intel_gathered": True,
+                "target_embassy_id": embassy_id,
+                "effectiveness_reduced": True,
+            }
+        return results
+
+    def _check_betrayals(self, missions: list[dict], outcomes: dict[str, str]) -> None:
+        teams = {sim: p["team_id"] for sim, p in self.participants.items()}
+        for mission in missions:
+            if not mission.get("target_simulation_id"):
+                continue
+            source_team = teams.get(mission["source_simulation_id"])
+            target_team = teams.get(mission["target_simulation_id"])
+            if not (source_team and target_team and source_team == target_team):
+                continue
+            detected = outcomes[mission["id"]] in ("detected", "captured")
+            self._log(
+                "betrayal",
+                "An alliance has been betrayed!" if detected else "Covert action against an ally.",
+                source_simulation_id=mission["source_simulation_id"],
+                target_simulation_id=mission["target_simulation_id"],
+                is_public=detected,
+                metadata={"detected": detected},
+            )
+            if detected:
+                teams = {sim: (None if team == source_team else team) for sim, team in teams.items()}
+                for p in self.participants.values():
+                    if p["team_id"] == source_team:
+                        p["team_id"] = None
+                self.participants[mission["source_simulation_id"]]["betrayal_penalty"] = BETRAYAL_PENALTY
+
+    def _create_event(self, simulation_id: str, data_source: str, event_type: str, impact: int, mission: dict) -> None:
+        self.events.append({
+            "id": self._new_id(),
+            "simulation_id": simulation_id,
+            "event_type": event_type,
+            "impact_level": impact,
+            "event_status": "active",
+            "data_source": data_source,
+            "metadata": {
+                "mission_id": mission["id"],
+                "source_simulation_id": mission["source_simulation_id"],
+            },
+        })
+
+    def _log(
+        self,
+        event_type: str,
+        narrative: str,
+        *,
+        source_simulation_id: str | None = None,
+        target_simulation_id: str | None = None,
+        mission_id: str | None = None,
+        is_public: bool = False,
+        metadata: dict | None = None,
+    ) -> None:
+        self.battle_log.append({
+            "epoch_id": self.epoch["id"],
+            "cycle_number": self.current_cycle,
+            "event_type": event_type,
+            "narrative": narrative,
+            "source_simulation_id": source_simulation_id,
+            "target_simulation_id": target_simulation_id,
+            "mission_id": mission_id,
+            "is_public": is_public,
+            "metadata": metadata or {},
+        })
+
+    # ── Cycle resolution ──────────────────────────────────
+
+    def resolve_cycle(self) -> dict:
+        """RP grant, mission timers, cycle counter and phase auto-advance (``EpochService.resolve_cycle``)."""
+        if self.status not in ("foundation", "competition", "reckoning"):
+            raise EngineError(400, f"Cannot resolve cycle for epoch with status '{self.status}'.")
+        amount = self.config["rp_per_cycle"]
+        if self.status == "foundation":
+            amount = int(amount * 1.5)  # Foundation bonus
+        self._grant_rp_batch(amount)
+        for p in self.participants.values():
+            p["cycle_ready"] = False
+
+        self.clock_hours += self.config["cycle_hours"]
+        new_cycle = self.current_cycle + 1
+        self.epoch.update(current_cycle=new_cycle, status=next_phase_status(self.status, new_cycle, self.config))
+        return self.epoch
+
+    def expedite_missions(self) -> int:
+        """Make every in-flight non-guardian mission due now (the HTTP battery's ``force_expire``)."""
+        due = _iso(self.now - timedelta(hours=1))
+        count = 0
+        for m in self.operative_missions:
+            if m["status"] in ("deploying", "active") and m["operative_type"] != "guardian":
+                m["resolves_at"] = due
+                count += 1
+        return count
+
+    def expire_fortifications(self) -> list[dict]:
+        """Remove fortifications whose expiry cycle has been reached, reverting the zone tier."""
+        cycle = self.current_cycle
+        expired = [f for f in self.zone_fortifications if f["expires_at_cycle"] <= cycle]
+        zones = {z["id"]: z for z in self.zones}
+        for fort in expired:
+            zone = zones.get(fort["zone_id"])
+            if zone:
+                zone["security_level"] = _upgrade(zone["security_level"], -fort["security_bonus"])
+        self.zone_fortifications = [f for f in self.zone_fortifications if f["expires_at_cycle"] > cycle]
+        return expired
+
+    def resolve_cycle_full(self) -> dict:
+        """resolve → missions → fortifications → scoring (the ``CycleResolutionService`` stages).
+
+        Bot/strategy actions are the caller's job, between cycles.
+        """
+        epoch = self.resolve_cycle()
+        resolved = self.resolve_pending_missions()
+        self.expire_fortifications()
+        scores = self.compute_cycle_scores(self.current_cycle)
+        return {"epoch": epoch, "resolved": resolved, "scores": scores}
+
+    # ── Scoring ───────────────────────────────────────────
+
+    def security_weight(self, simulation_id: str, level: str) -> float:
+        weights = (self.simulations.get(simulation_id) or {}).get("security_weights") or {}
+        if level in weights:
+            return float(weights[level])
+        return SECURITY_WEIGHT_FALLBACK.get((level or "").strip().lower(), DEFAULT_SECURITY_WEIGHT)
+
+    def zone_stability(self) -> list[dict]:
+        """``mv_zone_stability`` rows: infra×0.5 + security×0.3 − pressure×0.25, clamped to [0, 1]."""
+        ambient: dict[str, float] = defaultdict(float)
+        for e in self.events:
+            if e.get("event_status") == "active":
+                ambient[e["simulation_id"]] += (
+                    (e["impact_level"] / 10.0) ** 1.5 * EVENT_SPILL_FACTOR / EVENT_PRESSURE_DIVISOR
+                )
+        rows = []
+        for z in self.zones:
+            pressure = max(0.0, float(z.get("total_pressure") or 0) + ambient[z["simulation_id"]])
+            stability = (
+                float(z.get("infrastructure_score") or 0) * 0.5
+                + self.security_weight(z["simulation_id"], z["security_level"]) * 0.3
+                - pressure * 0.25
+            )
+            rows.append({
+                "zone_id": z["id"],
+                "simulation_id": z["simulation_id"],
+                "total_pressure": pressure,
+                "stability": min(1.0, max(0.0, stability)),
+            })
+        return rows
+
+    def scoring_data(self) -> EpochScoringData:
+        """The ``ScoringService._load_scoring_data`` inputs, from engine state."""
+        sims = set(self.participants)
+        embassies = [
+            e for e in self.embassies.values()
+            if e["simulation_a_id"] in sims or e["simulation_b_id"] in sims
+        ]
+        return EpochScoringData(
+            missions=[
+                m for m in self.operative_missions
+                if m["status"] in ("success", "failed", "detected", "captured", "active")
+            ],
+            zone_stability=[z for z in self.zone_stability() if z["simulation_id"] in sims],
+            propaganda_events=[
+                e for e in self.events if e["data_source"] == "propagandist" and e["simulation_id"] in sims
+            ],
+            echoes=[],
+            embassy_effectiveness=[
+                {
+                    "simulation_a_id": e["simulation_a_id"],
+                    "simulation_b_id": e["simulation_b_id"],
+                    "effectiveness": float(e.get("effectiveness") or 0) if e.get("status") == "active" else 0.0,
+                }
+                for e in embassies
+            ],
+            active_embassies=[e for e in embassies if e.get("status") == "active"],
+            participants=list(self.participants.values()),
+        )
+
+    def compute_cycle_scores(self, cycle_number: int) -> list[dict]:
+        """Score every participant for a cycle (``ScoringService.compute_cycle_scores``)."""
+        sim_ids = list(self.participants)
+        data = self.scoring_data()
+        raw = compute_raw_scores(sim_ids, data)
+        rows = [
+            {
+                "epoch_id": self.epoch["id"],
+                "simulation_id": sim_id,
+                "cycle_number": cycle_number,
+                **{f"{dim}_score": value for dim, value in raw[sim_id].items()},
+            }
+            for sim_id in sim_ids
+        ]
+        for row, composite in zip(rows, composite_scores(rows, self.config.get("score_weights", {})), strict=True):
+            row["composite_score"] = composite
+        if self.record_replay:
+            self._record("scoring", epoch_replay.scoring_record(data, rows, self.config.get("score_weights", {})))
+
+        self.epoch_scores = [s for s in self.epoch_scores if s["cycle_number"] != cycle_number] + rows
+        return rows
+
+    def leaderboard(self, cycle_number: int | None = None) -> list[dict]:
+        """Ranked scores for a cycle (latest scored by default), shaped like ``get_leaderboard``."""
+        if cycle_number is None:
+            if not self.epoch_scores:
+                return []
+            cycle_number = max(s["cycle_number"] for s in self.epoch_scores)
+        scores = sorted(
+            (s for s in self.epoch_scores if s["cycle_number"] == cycle_number),
+            key=lambda s: s["composite_score"],
+            reverse=True,
+        )
+        team_names = {t["id"]: t["name"] for t in self.teams}
+        return [
+            {
+                "rank": rank,
+                "simulation_id": s["simulation_id"],
+                "simulation_name": (self.simulations.get(s["simulation_id"]) or {}).get("name", "Unknown"),
+                "team_name": team_names.get(self.participants[s["simulation_id"]]["team_id"]),
+                "stability": float(s["stability_score"]),
+                "influence": float(s["influence_score"]),
+                "sovereignty": float(s["sovereignty_score"]),
+                "diplomatic": float(s["diplomatic_score"]),
+                "military": float(s["military_score"]),
+                "composite": float(s["composite_score"]),
+            }
+            for rank, s in enumerate(scores, start=1)
+        ]
+
+    # ── Replay log ────────────────────────────────────────
+
+    def _record(self, kind: str, payload: dict) -> None:
+        self.epoch_cycle_replays.append({
+            "id": len(self.epoch_cycle_replays) + 1,
+            "epoch_id": self.epoch["id"],
+            "cycle_number": self.current_cycle,
+            "kind": kind,
+            "payload": payload,
+        })
+
+    def replay_log(self) -> dict:
+        """The epoch's replay log in ``epoch_replay.fetch_log`` format (``record_replay=True``)."""
+        return {"epoch_id": self.epoch["id"], "rng_seed": self.rng_seed, "records": self.epoch_cycle_replays}
+
+    def tables(self) -> dict[str, list[dict]]:
+        """Current state as table rows (for parity checks and exports)."""
+        return {
+            "game_epochs": [self.epoch],
+            "epoch_participants": list(self.participants.values()),
+            "epoch_teams": self.teams,
+            "simulations": list(self.simulations.values()),
+            "agents": list(self.agents.values()),
+            "agent_aptitudes": self.agent_aptitudes,
+            "agent_relationships": self.agent_relationships,
+            "zones": self.zones,
+            "buildings": list(self.buildings.values()),
+            "embassies": list(self.embassies.values()),
+            "operative_missions": self.operative_missions,
+            "zone_fortifications": self.zone_fortifications,
+            "events": self.events,
+            "battle_log": self.battle_log,
+            "epoch_scores": self.epoch_scores,
+            "epoch_rng_seeds": [{"epoch_id": self.epoch["id"], "rng_seed": self.rng_seed}],
+            "epoch_cycle_replays": self.epoch_cycle_replays,
+        }
+
+
+def _upgrade(level: str, tiers: int) -> str:
+    """Move a security level ``tiers`` steps along ``SECURITY_TIER_ORDER`` (unknown levels unchanged)."""
+    try:
+        idx = SECURITY_TIER_ORDER.index(level)
+    except ValueError:
+        return level
+    return SECURITY_TIER_ORDER[max(0, min(len(SECURITY_TIER_ORDER) - 1, idx + tiers))]
@@ -11,6 +11,7 @@ from backend.services.email_service import EmailService
 from backend.services.email_templates import epoch_invitation_subject, render_epoch_invitation
 from backend.services.external.openrouter import OpenRouterService
 from backend.services.prompt_service import PromptResolver
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,7 @@ class EpochInvitationService:
         token = secrets.token_urlsafe(32)
         expires_at = datetime.now(UTC) + timedelta(hours=expires_in_hours)
 
-        response = (
+        response = await run_query(
             supabase.table("epoch_invitations")
             .insert({
                 "epoch_id": str(epoch_id),
@@ -40,7 +41,6 @@ class EpochInvitationService:
                 "invited_by_id": str(invited_by_id),
                 "expires_at": expires_at.isoformat(),
             })
-            .execute()
         )
 
         if not response.data:
@@ -70,12 +70,11 @@ class EpochInvitationService:
         invite_url = f"{base_url}/epoch/join?token={invitation['invite_token']}"
 
         # Fetch epoch name for email subject
-        epoch_response = (
+        epoch_response = await run_query(
             supabase.table("game_epochs")
             .select("name")
             .eq("id", str(epoch_id))
             .single()
-            .execute()
         )
         epoch_name = epoch_response.data["name"] if epoch_response.data else "Unknown"
 
@@ -93,24 +92,22 @@ class EpochInvitationService:
     @staticmethod
     async def list_invitations(supabase: Client, epoch_id: UUID) -> list[dict]:
         """List all invitations for an epoch, ordered by creation date."""
-        response = (
+        response = await run_query(
             supabase.table("epoch_invitations")
             .select("*")
             .eq("epoch_id", str(epoch_id))
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
     @staticmethod
     async def get_by_token(supabase: Client, token: str) -> dict:
         """Validate and return invitation + epoch info by token."""
-        response = (
+        response = await run_query(
             supabase.table("epoch_invitations")
             .select("*, game_epochs(name, description, status, config)")
             .eq("invite_token", token)
             .limit(1)
-            .execute()
         )
 
         if not response or not response.data:
@@ -151,11 +148,10 @@ class EpochInvitationService:
         supabase: Client, invitation_id: UUID,
     ) -> dict:
         """Revoke an invitation by setting status to 'revoked'."""
-        response = (
+        response = await run_query(
             supabase.table("epoch_invitations")
             .update({"status": "revoked"})
             .eq("id", str(invitation_id))
-            .execute()
         )
 
         if not response.data:
@@ -172,13 +168,12 @@ class EpochInvitationService:
     ) -> dict:
         """Mark an invitation as accepted."""
         # Fetch the invitation first
-        inv_response = (
+        inv_response = await run_query(
             supabase.table("epoch_invitations")
             .select("*")
             .eq("invite_token", token)
             .eq("status", "pending")
             .limit(1)
-            .execute()
         )
 
         if not inv_response or not inv_response.data:
@@ -200,7 +195,7 @@ class EpochInvitationService:
             )
 
         # Mark accepted
-        update_response = (
+        update_response = await run_query(
             supabase.table("epoch_invitations")
             .update({
                 "status": "accepted",
@@ -208,7 +203,6 @@ class EpochInvitationService:
                 "accepted_by_id": str(user_id),
             })
             .eq("id", invitation["id"])
-            .execute()
         )
 
         if not update_response.data:
@@ -226,12 +220,11 @@ class EpochInvitationService:
     async def generate_lore(supabase: Client, epoch_id: UUID) -> str:
         """Generate invitation lore via OpenRouter. Caches in game_epochs.config.invitation_lore."""
         # Fetch epoch
-        epoch_response = (
+        epoch_response = await run_query(
             supabase.table("game_epochs")
             .select("name, description, config")
             .eq("id", str(epoch_id))
             .single()
-            .execute()
         )
 
         if not epoch_response.data:
@@ -249,11 +242,10 @@ class EpochInvitationService:
             return cached_lore
 
         # Fetch participant names
-        participants_response = (
+        participants_response = await run_query(
             supabase.table("epoch_participants")
             .select("simulation_id, simulations(name)")
             .eq("epoch_id", str(epoch_id))
-            .execute()
         )
         participant_names = ", ".join(
             p.get("simulations", {}).get("name", "Unknown")
@@ -285,9 +277,9 @@ class EpochInvitationService:
 
         # Cache in config
         config["invitation_lore"] = lore_text
-        supabase.table("game_epochs").update({"config": config}).eq(
+        await run_query(supabase.table("game_epochs").update({"config": config}).eq(
             "id", str(epoch_id)
-        ).execute()
+        ))
 
         return lore_text
 
@@ -295,19 +287,18 @@ class EpochInvitationService:
     async def regenerate_lore(supabase: Client, epoch_id: UUID) -> str:
         """Force-regenerate lore by clearing cache first."""
         # Clear cached lore
-        epoch_response = (
+        epoch_response = await run_query(
             supabase.table("game_epochs")
             .select("config")
             .eq("id", str(epoch_id))
             .single()
-            .execute()
         )
         if epoch_response.data:
             config = epoch_response.data.get("config") or {}
             config.pop("invitation_lore", None)
-            supabase.table("game_epochs").update({"config": config}).eq(
+            await run_query(supabase.table("game_epochs").update({"config": config}).eq(
                 "id", str(epoch_id)
-            ).execute()
+            ))
 
         return await EpochInvitationService.generate_lore(supabase, epoch_id)
 
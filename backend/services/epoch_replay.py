@@ -0,0 +1,208 @@
+"""Per-cycle replay log for epoch resolution, and the offline replay.
+
+Two kinds of record go to ``epoch_cycle_replays`` (migration 085):
+
+- ``resolution`` — one per ``resolve_pending_missions`` pass: the missions
+  rolled, in roll order, with their success probabilities, the outcomes, and
+  every draw the pass made (``RollRecorder.rolls``).
+- ``scoring`` — one per ``compute_cycle_scores``: the scoring inputs
+  (``EpochScoringData``, reduced to what ``compute_raw_scores`` reads), the
+  composite weights and the score rows written.
+
+``replay_epoch`` re-runs a whole epoch from these records: it re-derives
+each pass's stream from the epoch seed, re-rolls every mission from its
+logged probability, substitutes the replayed outcomes into the logged
+scoring inputs and re-scores every cycle. With the production resolver the
+result is identical to what the epoch recorded; with another ``roll``
+function it shows how that resolver would have changed a real game.
+Effects of changed outcomes on zone stability and events are not
+re-simulated — those inputs come from the log.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from backend.services.epoch_rng import RollRecorder, resolution_rng, roll_outcome
+from backend.services.scoring_engine import DIMENSIONS, EpochScoringData, composite_scores, compute_raw_scores
+from backend.utils.db import fetch_all, run_query
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+ROLLED_STATUSES = ("success", "failed", "detected")
+
+
+# ── Records ───────────────────────────────────────────────
+
+
+def resolution_record(missions: list[dict], outcomes: dict[str, str], rolls: list) -> dict:
+    """Payload of a ``resolution`` record; ``missions`` in roll order."""
+    return {
+        "missions": [
+            [
+                m["id"], m["operative_type"], m.get("source_simulation_id"), m.get("target_simulation_id"),
+                float(m.get("success_probability", 0.5)),
+            ]
+            for m in missions
+        ],
+        "outcomes": [outcomes[m["id"]] for m in missions],
+        "rolls": rolls,
+    }
+
+
+def scoring_record(data: EpochScoringData, rows: list[dict], weights: dict) -> dict:
+    """Payload of a ``scoring`` record: compact scoring inputs and the scores they produced."""
+    echo_sum: dict[str, float] = defaultdict(float)
+    for e in data.echoes:
+        echo_sum[e["source_simulation_id"]] += e.get("echo_strength", 0)
+    return {
+        "missions": [
+            [m["id"], m.get("source_simulation_id"), m.get("target_simulation_id"), m["operative_type"], m["status"]]
+            for m in data.missions
+        ],
+        "zone_stability": [[z["simulation_id"], float(z["stability"])] for z in data.zone_stability],
+        "propaganda": dict(Counter(e["simulation_id"] for e in data.propaganda_events)),
+        "echoes": dict(echo_sum),
+        "embassy_effectiveness": [
+            [e.get("simulation_a_id"), e.get("simulation_b_id"), float(e.get("effectiveness", 0))]
+            for e in data.embassy_effectiveness
+        ],
+        "active_embassies": [[e.get("simulation_a_id"), e.get("simulation_b_id")] for e in data.active_embassies],
+        "participants": [
+            [p["simulation_id"], p.get("team_id"), float(p.get("betrayal_penalty") or 0)] for p in data.participants
+        ],
+        "weights": weights or {},
+        "scores": [
+            [row["simulation_id"], *(row[f"{dim}_score"] for dim in DIMENSIONS), row["composite_score"]]
+            for row in rows
+        ],
+    }
+
+
+def _scoring_data(payload: dict, outcomes: dict[str, str]) -> EpochScoringData:
+    """Rebuild ``EpochScoringData`` from a scoring record, with replayed outcomes substituted."""
+    missions = []
+    for mission_id, source, target, operative_type, status in payload["missions"]:
+        if status in ROLLED_STATUSES and mission_id in outcomes:
+            status = outcomes[mission_id]
+        missions.append({
+            "id": mission_id,
+            "source_simulation_id": source,
+            "target_simulation_id": target,
+            "operative_type": operative_type,
+            "status": status,
+        })
+    return EpochScoringData(
+        missions=missions,
+        zone_stability=[{"simulation_id": sim, "stability": s} for sim, s in payload["zone_stability"]],
+        propaganda_events=[
+            {"simulation_id": sim} for sim, count in payload["propaganda"].items() for _ in range(count)
+        ],
+        echoes=[{"source_simulation_id": sim, "echo_strength": total} for sim, total in payload["echoes"].items()],
+        embassy_effectiveness=[
+            {"simulation_a_id": a, "simulation_b_id": b, "effectiveness": eff}
+            for a, b, eff in payload["embassy_effectiveness"]
+        ],
+        active_embassies=[{"simulation_a_id": a, "simulation_b_id": b} for a, b in payload["active_embassies"]],
+        participants=[
+            {"simulation_id": sim, "team_id": team, "betrayal_penalty": penalty}
+            for sim, team, penalty in payload["participants"]
+        ],
+    )
+
+
+async def record(supabase: Client, epoch_id: UUID | str, cycle_number: int, kind: str, payload: dict) -> None:
+    """Append a replay record (best-effort — a failed write never fails the cycle)."""
+    try:
+        await run_query(supabase.table("epoch_cycle_replays").insert({
+            "epoch_id": str(epoch_id),
+            "cycle_number": cycle_number,
+            "kind": kind,
+            "payload": payload,
+        }))
+    except Exception:
+        logger.warning(
+            "Replay log write failed",
+            extra={"epoch_id": str(epoch_id), "cycle_number": cycle_number, "kind": kind},
+            exc_info=True,
+        )
+
+
+async def fetch_log(supabase: Client, epoch_id: UUID | str) -> dict:
+    """An epoch's seed and replay records in write order (service-role client)."""
+    seed_resp = await run_query(
+        supabase.table("epoch_rng_seeds").select("rng_seed").eq("epoch_id", str(epoch_id)).maybe_single()
+    )
+    records = await fetch_all(lambda: (
+        supabase.table("epoch_cycle_replays")
+        .select("id, cycle_number, kind, payload")
+        .eq("epoch_id", str(epoch_id))
+        .order("id")
+    ))
+    seed_row = seed_resp.data if seed_resp else None  # maybe_single() returns None for no row
+    return {"epoch_id": str(epoch_id), "rng_seed": (seed_row or {}).get("rng_seed"), "records": records}
+
+
+# ── Replay ────────────────────────────────────────────────
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of ``replay_epoch``: what differed from the recorded epoch."""
+
+    resolutions: int = 0
+    missions: int = 0
+    cycles_scored: int = 0
+    roll_mismatches: list[tuple[int, str]] = field(default_factory=list)  # (cycle, mission_id)
+    outcome_mismatches: list[tuple[int, str, str, str]] = field(default_factory=list)  # (cycle, id, logged, replayed)
+    score_mismatches: list[tuple[int, str, list, list]] = field(default_factory=list)  # (cycle, sim, logged, replayed)
+    final_scores: dict[str, list] = field(default_factory=dict)
+
+    @property
+    def identical(self) -> bool:
+        return not (self.roll_mismatches or self.outcome_mismatches or self.score_mismatches)
+
+
+def replay_epoch(log: dict, roll: Callable[[float, RollRecorder], str] = roll_outcome) -> ReplayReport:
+    """Re-run every resolution and scoring record of ``log`` (see ``fetch_log``)."""
+    seed = log.get("rng_seed")
+    if seed is None:
+        raise ValueError("Epoch has no RNG seed — it was resolved before seeded resolution and cannot be replayed.")
+
+    report = ReplayReport()
+    outcomes: dict[str, str] = {}
+    for rec in log["records"]:
+        cycle, payload = rec["cycle_number"], rec["payload"]
+        if rec["kind"] == "resolution":
+            missions = payload["missions"]
+            rng = RollRecorder(resolution_rng(seed, cycle, [m[0] for m in missions]))
+            for (mission_id, *_, probability), logged in zip(missions, payload["outcomes"], strict=True):
+                drawn = len(rng.rolls)
+                replayed = roll(probability, rng)
+                if rng.rolls[drawn:] != payload["rolls"][drawn:len(rng.rolls)]:
+                    report.roll_mismatches.append((cycle, mission_id))
+                if replayed != logged:
+                    report.outcome_mismatches.append((cycle, mission_id, logged, replayed))
+                outcomes[mission_id] = replayed
+            report.resolutions += 1
+            report.missions += len(missions)
+        elif rec["kind"] == "scoring":
+            data = _scoring_data(payload, outcomes)
+            sim_ids = [row[0] for row in payload["scores"]]
+            raw = compute_raw_scores(sim_ids, data)
+            rows = [
+                {"simulation_id": sim, **{f"{dim}_score": raw[sim][dim] for dim in DIMENSIONS}} for sim in sim_ids
+            ]
+            composites = composite_scores(rows, payload["weights"])
+            for logged, row, composite in zip(payload["scores"], rows, composites, strict=True):
+                replayed = [row["simulation_id"], *(row[f"{dim}_score"] for dim in DIMENSIONS), composite]
+                if replayed != logged:
+                    report.score_mismatches.append((cycle, row["simulation_id"], logged, replayed))
+                report.final_scores[row["simulation_id"]] = replayed
+            report.cycles_scored += 1
+    return report
@@ -0,0 +1,87 @@
+"""Seeded randomness for epoch mission resolution.
+
+Every epoch has a secret seed (``epoch_rng_seeds``, migration 085). A
+resolution pass draws from a stream derived from that seed, the cycle and
+the ids of the missions it resolves, so the same missions resolved in the
+same cycle of the same epoch always see the same rolls — in the service, in
+``EpochEngine`` and in the offline replay (``scripts/replay_epoch.py``).
+Epochs without a seed (created before 085) fall back to ``SystemRandom``.
+
+The stream constructor is pluggable (``set_rng_provider``) so tests and
+benchmarks can substitute their own generator. Draws go through
+``RollRecorder``, which keeps a compact record of every roll for the
+replay log.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import secrets
+from collections.abc import Callable, Sequence
+from typing import Any
+
+RngProvider = Callable[[int | None, int, Sequence[str]], random.Random]
+
+
+def new_epoch_seed() -> int:
+    """A fresh 62-bit seed (the range ``epoch_rng_seeds`` draws from)."""
+    return secrets.randbits(62)
+
+
+def resolution_rng(seed: int | None, cycle: int, mission_ids: Sequence[str]) -> random.Random:
+    """Deterministic stream for one resolution pass; ``SystemRandom`` without a seed."""
+    if seed is None:
+        return secrets.SystemRandom()
+    digest = hashlib.sha256(",".join(sorted(mission_ids)).encode()).hexdigest()
+    return random.Random(f"{seed}:{cycle}:{digest}")  # noqa: S311 — reproducible game rolls, not security
+
+
+_provider: RngProvider = resolution_rng
+
+
+def set_rng_provider(provider: RngProvider | None) -> RngProvider:
+    """Install a stream constructor (``None`` restores the default); returns the previous one."""
+    global _provider
+    previous = _provider
+    _provider = provider or resolution_rng
+    return previous
+
+
+class RollRecorder:
+    """The subset of ``random.Random`` the resolver uses, recording each draw.
+
+    ``rolls`` holds one compact entry per draw: the float for ``random()``,
+    ``[index, len]`` for ``choice()`` and the value for ``randint()``.
+    """
+
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+        self.rolls: list[Any] = []
+
+    def random(self) -> float:
+        value = self._rng.random()
+        self.rolls.append(value)
+        return value
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        index = self._rng.randrange(len(seq))
+        self.rolls.append([index, len(seq)])
+        return seq[index]
+
+    def randint(self, a: int, b: int) -> int:
+        value = self._rng.randint(a, b)
+        self.rolls.append(value)
+        return value
+
+
+def roll_outcome(probability: float, rng: random.Random | RollRecorder) -> str:
+    """Roll a mission: success, else detected (second roll above p) or failed."""
+    if rng.random() <= probability:
+        return "success"
+    return "detected" if rng.random() > probability else "failed"
+
+
+def rng_for(seed: int | None, cycle: int, mission_ids: Sequence[str]) -> RollRecorder:
+    """Recording stream for one resolution pass from the installed provider."""
+    return RollRecorder(_provider(seed, cycle, mission_ids))
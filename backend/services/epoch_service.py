@@ -8,7 +8,9 @@ from fastapi import HTTPException, status
 
 from backend.dependencies import get_admin_supabase
 from backend.models.epoch import EpochConfig
+from backend.services import membership_cache
 from backend.services.game_instance_service import GameInstanceService
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,37 @@ OPERATIVE_RP_COSTS: dict[str, int] = {
 }
 
 
+def phase_boundaries(config: dict) -> tuple[int, int, int]:
+    """Return ``(foundation_end, reckoning_start, total_cycles)`` for an epoch config.
+
+    Supports both absolute cycle counts and legacy percentage-based configs.
+    """
+    total_cycles = (config.get("duration_days", 14) * 24) // config.get("cycle_hours", 8)
+    if "foundation_cycles" in config:
+        foundation_end = config["foundation_cycles"]
+    else:
+        foundation_end = round(total_cycles * config.get("foundation_pct", 10) / 100)
+
+    if "reckoning_cycles" in config:
+        reckoning_start = total_cycles - config["reckoning_cycles"]
+    else:
+        reckoning_cycles = round(total_cycles * config.get("reckoning_pct", 15) / 100)
+        reckoning_start = total_cycles - reckoning_cycles
+    return foundation_end, reckoning_start, total_cycles
+
+
+def next_phase_status(current_status: str, new_cycle: int, config: dict) -> str:
+    """Phase after advancing to ``new_cycle`` (auto-advance at phase boundaries)."""
+    foundation_end, reckoning_start, total_cycles = phase_boundaries(config)
+    if current_status == "foundation" and new_cycle > foundation_end:
+        return "competition"
+    if current_status == "competition" and new_cycle > reckoning_start:
+        return "reckoning"
+    if current_status == "reckoning" and new_cycle >= total_cycles:
+        return "completed"
+    return current_status
+
+
 class EpochService:
     """Service for epoch CRUD and lifecycle management."""
 
@@ -46,18 +79,17 @@ class EpochService:
         if status_filter:
             query = query.eq("status", status_filter)
         query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
-        resp = query.execute()
+        resp = await run_query(query)
         return resp.data or [], resp.count or 0
 
     @classmethod
     async def get(cls, supabase: Client, epoch_id: UUID) -> dict:
         """Get a single epoch by ID."""
-        resp = (
+        resp = await run_query(
             supabase.table("game_epochs")
             .select("*")
             .eq("id", str(epoch_id))
             .single()
-            .execute()
         )
         if not resp.data:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Epoch not found.")
@@ -66,12 +98,11 @@ class EpochService:
     @classmethod
     async def get_active_epochs(cls, supabase: Client) -> list[dict]:
         """Get all active epochs (lobby/foundation/competition/reckoning)."""
-        resp = (
+        resp = await run_query(
             supabase.table("game_epochs")
             .select("*")
             .in_("status", ["lobby", "foundation", "competition", "reckoning"])
             .order("created_at", desc=True)
-            .execute()
         )
         return resp.data or []
 
@@ -95,7 +126,7 @@ class EpochService:
             "created_by_id": str(user_id),
             "config": merged_config,
         }
-        resp = supabase.table("game_epochs").insert(data).execute()
+        resp = await run_query(supabase.table("game_epochs").insert(data))
         if not resp.data:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to create epoch.")
         return resp.data[0]
@@ -114,11 +145,10 @@ class EpochService:
                 status.HTTP_400_BAD_REQUEST,
                 "Can only edit epoch configuration during lobby phase.",
             )
-        resp = (
+        resp = await run_query(
             supabase.table("game_epochs")
             .update(updates)
             .eq("id", str(epoch_id))
-            .execute()
         )
         if not resp.data:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to update epoch.")
@@ -153,11 +183,10 @@ class EpochService:
 
         # Verify creator has joined the epoch with a simulation
         creator_id = str(epoch["created_by_id"])
-        member_resp = (
+        member_resp = await run_query(
             supabase.table("simulation_members")
             .select("simulation_id")
             .eq("user_id", creator_id)
-            .execute()
         )
         creator_sim_ids = {m["simulation_id"] for m in (member_resp.data or [])}
         human_participant_sims = {
@@ -177,21 +206,20 @@ class EpochService:
         max_agents = config.get("max_agents_per_player", 6)
         for p in participants:
             if not p.get("drafted_agent_ids"):
-                agent_resp = (
+                agent_resp = await run_query(
                     admin.table("agents")
                     .select("id")
                     .eq("simulation_id", str(p["simulation_id"]))
                     .is_("deleted_at", "null")
                     .order("created_at")
                     .limit(max_agents)
-                    .execute()
                 )
                 auto_ids = [a["id"] for a in (agent_resp.data or [])]
                 if auto_ids:
-                    admin.table("epoch_participants").update({
+                    await run_query(admin.table("epoch_participants").update({
                         "drafted_agent_ids": auto_ids,
                         "draft_completed_at": datetime.now(UTC).isoformat(),
-                    }).eq("id", str(p["id"])).execute()
+                    }).eq("id", str(p["id"])))
 
         # Clone simulations into game instances (atomic batch operation)
         epoch_number = await GameInstanceService.get_epoch_number(supabase)
@@ -215,7 +243,7 @@ class EpochService:
         duration = timedelta(days=config["duration_days"])
         now = datetime.now(UTC)
 
-        resp = (
+        resp = await run_query(
             supabase.table("game_epochs")
             .update({
                 "status": "foundation",
@@ -228,7 +256,6 @@ class EpochService:
                 },
             })
             .eq("id", str(epoch_id))
-            .execute()
         )
 
         # Grant initial RP to all participants (foundation bonus)
@@ -258,11 +285,10 @@ class EpochService:
                 f"Cannot advance from '{epoch['status']}'.",
             )
 
-        resp = (
+        resp = await run_query(
             supabase.table("game_epochs")
             .update({"status": next_status})
             .eq("id", str(epoch_id))
-            .execute()
         )
 
         # Archive game instances when epoch completes
@@ -287,11 +313,10 @@ class EpochService:
                 f"Cannot cancel epoch with status '{epoch['status']}'.",
             )
 
-        resp = (
+        resp = await run_query(
             supabase.table("game_epochs")
             .update({"status": "cancelled"})
             .eq("id", str(epoch_id))
-            .execute()
         )
 
         # Delete game instances (only exist if epoch was started)
@@ -329,10 +354,10 @@ class EpochService:
             "epoch_teams",
             "epoch_invitations",
         ]:
-            supabase.table(table).delete().eq("epoch_id", eid).execute()
+            await run_query(supabase.table(table).delete().eq("epoch_id", eid))
 
         # Delete the epoch row itself
-        resp = supabase.table("game_epochs").delete().eq("id", eid).execute()
+        resp = await run_query(supabase.table("game_epochs").delete().eq("id", eid))
         if not resp.data:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to delete epoch.")
         return resp.data[0]
@@ -346,7 +371,7 @@ class EpochService:
         epoch_id: UUID,
     ) -> list[dict]:
         """List all participants in an epoch."""
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .select(
                 "*, simulations(name, slug, simulation_type, source_template_id),"
@@ -354,7 +379,6 @@ class EpochService:
             )
             .eq("epoch_id", str(epoch_id))
             .order("joined_at")
-            .execute()
         )
         return resp.data or []
 
@@ -379,12 +403,11 @@ class EpochService:
             )
 
         # Check simulation is a template (not game instance/archived)
-        sim_resp = (
+        sim_resp = await run_query(
             supabase.table("simulations")
             .select("simulation_type")
             .eq("id", str(simulation_id))
             .limit(1)
-            .execute()
         )
         if not sim_resp.data:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Simulation not found.")
@@ -396,12 +419,11 @@ class EpochService:
             )
 
         # Check simulation not already in epoch
-        existing = (
+        existing = await run_query(
             supabase.table("epoch_participants")
             .select("id")
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if existing.data:
             raise HTTPException(
@@ -411,12 +433,11 @@ class EpochService:
 
         # Check user not already in epoch (with different sim)
         if user_id:
-            existing_user = (
+            existing_user = await run_query(
                 supabase.table("epoch_participants")
                 .select("id")
                 .eq("epoch_id", str(epoch_id))
                 .eq("user_id", str(user_id))
-                .execute()
             )
             if existing_user.data:
                 raise HTTPException(
@@ -424,14 +445,13 @@ class EpochService:
                     "You are already in this epoch.",
                 )
 
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .insert({
                 "epoch_id": str(epoch_id),
                 "simulation_id": str(simulation_id),
                 **({"user_id": str(user_id)} if user_id else {}),
             })
-            .execute()
         )
         return resp.data[0] if resp.data else {}
 
@@ -450,9 +470,10 @@ class EpochService:
                 "Can only leave epochs in lobby phase.",
             )
 
-        supabase.table("epoch_participants").delete().eq(
+        await run_query(supabase.table("epoch_participants").delete().eq(
             "epoch_id", str(epoch_id)
-        ).eq("simulation_id", str(simulation_id)).execute()
+        ).eq("simulation_id", str(simulation_id)))
+        membership_cache.invalidate_epoch_participant(epoch_id)
 
     # ── Draft ────────────────────────────────────────────────
 
@@ -483,13 +504,12 @@ class EpochService:
 
         # Verify all agents belong to the participant's simulation
         for aid in agent_ids:
-            agent_resp = (
+            agent_resp = await run_query(
                 supabase.table("agents")
                 .select("id")
                 .eq("id", str(aid))
                 .eq("simulation_id", str(simulation_id))
                 .is_("deleted_at", "null")
-                .execute()
             )
             if not agent_resp.data:
                 raise HTTPException(
@@ -498,7 +518,7 @@ class EpochService:
                 )
 
         # Update participant row
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .update({
                 "drafted_agent_ids": [str(a) for a in agent_ids],
@@ -506,7 +526,6 @@ class EpochService:
             })
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if not resp.data:
             raise HTTPException(
@@ -520,12 +539,11 @@ class EpochService:
     @classmethod
     async def list_teams(cls, supabase: Client, epoch_id: UUID) -> list[dict]:
         """List all teams in an epoch."""
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_teams")
             .select("*")
             .eq("epoch_id", str(epoch_id))
             .order("created_at")
-            .execute()
         )
         return resp.data or []
 
@@ -545,24 +563,23 @@ class EpochService:
                 "Alliances can only be formed during lobby or foundation phase.",
             )
 
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_teams")
             .insert({
                 "epoch_id": str(epoch_id),
                 "name": name,
                 "created_by_simulation_id": str(simulation_id),
             })
-            .execute()
         )
         team = resp.data[0] if resp.data else {}
 
         # Auto-join creator to team
         if team:
-            supabase.table("epoch_participants").update(
+            await run_query(supabase.table("epoch_participants").update(
                 {"team_id": team["id"]}
             ).eq("epoch_id", str(epoch_id)).eq(
                 "simulation_id", str(simulation_id)
-            ).execute()
+            ))
 
         return team
 
@@ -585,12 +602,11 @@ class EpochService:
             )
 
         # Check team size limit
-        members = (
+        members = await run_query(
             supabase.table("epoch_participants")
             .select("id")
             .eq("epoch_id", str(epoch_id))
             .eq("team_id", str(team_id))
-            .execute()
         )
         if len(members.data or []) >= config["max_team_size"]:
             raise HTTPException(
@@ -598,12 +614,11 @@ class EpochService:
                 f"Team is full (max {config['max_team_size']} members).",
             )
 
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .update({"team_id": str(team_id)})
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         return resp.data[0] if resp.data else {}
 
@@ -615,12 +630,11 @@ class EpochService:
         simulation_id: UUID,
     ) -> dict:
         """Leave current team."""
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .update({"team_id": None})
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         return resp.data[0] if resp.data else {}
 
@@ -643,23 +657,21 @@ class EpochService:
             )
 
         # Verify bot exists
-        bot_resp = (
+        bot_resp = await run_query(
             supabase.table("bot_players")
             .select("id, name, personality")
             .eq("id", str(bot_player_id))
             .single()
-            .execute()
         )
         if not bot_resp.data:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Bot player not found.")
 
         # Check simulation not already in epoch
-        existing = (
+        existing = await run_query(
             supabase.table("epoch_participants")
             .select("id")
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if existing.data:
             raise HTTPException(
@@ -677,22 +689,20 @@ class EpochService:
         max_agents = config.get("max_agents_per_player", 6)
 
         # Load agents with aptitudes for draft selection
-        agents_resp = (
+        agents_resp = await run_query(
             admin.table("agents")
             .select("id, name")
             .eq("simulation_id", str(simulation_id))
             .is_("deleted_at", "null")
             .order("created_at")
-            .execute()
         )
         agents = agents_resp.data or []
 
         # Load aptitudes for all agents in this sim
-        aptitudes_resp = (
+        aptitudes_resp = await run_query(
             admin.table("agent_aptitudes")
             .select("agent_id, operative_type, aptitude_level")
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         apt_map: dict[str, dict[str, int]] = {}
         for row in aptitudes_resp.data or []:
@@ -707,7 +717,7 @@ class EpochService:
             bot_resp.data["personality"], agents, max_agents
         )
 
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .insert({
                 "epoch_id": str(epoch_id),
@@ -717,7 +727,6 @@ class EpochService:
                 "drafted_agent_ids": drafted_ids,
                 "draft_completed_at": datetime.now(UTC).isoformat(),
             })
-            .execute()
         )
         if not resp.data:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to add bot.")
@@ -738,20 +747,19 @@ class EpochService:
                 "Can only remove bots during lobby phase.",
             )
 
-        p_resp = (
+        p_resp = await run_query(
             supabase.table("epoch_participants")
             .select("id, is_bot")
             .eq("id", str(participant_id))
             .eq("epoch_id", str(epoch_id))
             .single()
-            .execute()
         )
         if not p_resp.data:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Participant not found.")
         if not p_resp.data.get("is_bot"):
             raise HTTPException(status.HTTP_400_BAD_REQUEST, "This participant is not a bot.")
 
-        supabase.table("epoch_participants").delete().eq("id", str(participant_id)).execute()
+        await run_query(supabase.table("epoch_participants").delete().eq("id", str(participant_id)))
 
     # ── RP Management ────────────────────────────────────────
 
@@ -770,11 +778,10 @@ class EpochService:
         """
         now = datetime.now(UTC).isoformat()
         # Fetch all participants with current RP in a single query
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .select("id, current_rp")
             .eq("epoch_id", str(epoch_id))
-            .execute()
         )
         participants = resp.data or []
 
@@ -786,10 +793,10 @@ class EpochService:
             rp_groups.setdefault(new_rp, []).append(p["id"])
 
         for new_rp, ids in rp_groups.items():
-            supabase.table("epoch_participants").update({
+            await run_query(supabase.table("epoch_participants").update({
                 "current_rp": new_rp,
                 "last_rp_grant_at": now,
-            }).in_("id", ids).execute()
+            }).in_("id", ids))
 
     @classmethod
     async def spend_rp(
@@ -806,13 +813,12 @@ class EpochService:
         the first to write succeeds, the second fails because current_rp
         no longer matches.
         """
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .select("id, current_rp")
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
             .single()
-            .execute()
         )
         if not resp.data:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Not a participant.")
@@ -825,12 +831,11 @@ class EpochService:
             )
 
         new_rp = current - amount
-        update_resp = (
+        update_resp = await run_query(
             supabase.table("epoch_participants")
             .update({"current_rp": new_rp})
             .eq("id", resp.data["id"])
-            .eq("current_rp", current)  # optimistic lock
-            .execute()
+            .eq("current_rp", current)
         )
 
         if not update_resp.data:
@@ -850,24 +855,22 @@ class EpochService:
         amount: int,
     ) -> int:
         """Grant RP to a single participant, respecting the cap. Returns new balance."""
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_participants")
             .select("id, current_rp")
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
             .single()
-            .execute()
         )
         if not resp.data:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Not a participant.")
 
         # Read epoch config for rp_cap
-        epoch_resp = (
+        epoch_resp = await run_query(
             supabase.table("game_epochs")
             .select("config")
             .eq("id", str(epoch_id))
             .single()
-            .execute()
         )
         config = {**DEFAULT_CONFIG, **(epoch_resp.data or {}).get("config", {})}
         rp_cap = config["rp_cap"]
@@ -875,122 +878,14 @@ class EpochService:
         current = resp.data["current_rp"]
         new_rp = min(current + amount, rp_cap)
 
-        supabase.table("epoch_participants").update(
+        await run_query(supabase.table("epoch_participants").update(
             {"current_rp": new_rp}
-        ).eq("id", resp.data["id"]).execute()
+        ).eq("id", resp.data["id"]))
 
         return new_rp
 
     # ── Cycle Resolution ─────────────────────────────────────
 
-    @classmethod
-    async def resolve_cycle_full(
-        cls,
-        supabase: Client,
-        epoch_id: UUID,
-        admin_supabase: Client,
-    ) -> dict:
-        """Full cycle resolution pipeline: resolve → missions → bots → scoring → notifications.
-
-        Extracts the multi-step resolve pipeline so it can be called from both
-        the manual resolve endpoint and the auto-resolve trigger (all humans ready).
-        Returns updated epoch data.
-        """
-        from backend.services.battle_log_service import BattleLogService
-        from backend.services.bot_service import BotService
-        from backend.services.cycle_notification_service import CycleNotificationService
-        from backend.services.operative_service import OperativeService
-        from backend.services.scoring_service import ScoringService
-
-        data = await cls.resolve_cycle(supabase, epoch_id, admin_supabase=admin_supabase)
-        config = data.get("config", {})
-        cycle_number = data.get("current_cycle", 1)
-
-        # Resolve missions that have passed their resolves_at time
-        # (after timer advancement in resolve_cycle, before bots act)
-        db = admin_supabase or supabase
-        try:
-            resolved = await OperativeService.resolve_pending_missions(db, epoch_id)
-            # Log mission results to battle log
-            for mission in resolved:
-                try:
-                    await BattleLogService.log_mission_result(
-                        db, epoch_id, cycle_number, mission
-                    )
-                except Exception:
-                    logger.debug("Battle log write failed for mission result", exc_info=True)
-        except Exception:
-            logger.warning("Mission resolution failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-
-        # Expire zone fortifications that have passed their expiry cycle
-        try:
-            from backend.services.operative_service import SECURITY_TIER_ORDER
-
-            expired_forts = (
-                db.table("zone_fortifications")
-                .select("id, zone_id, security_bonus")
-                .eq("epoch_id", str(epoch_id))
-                .lte("expires_at_cycle", cycle_number)
-                .execute()
-            )
-            for fort in expired_forts.data or []:
-                # Downgrade zone security back by the bonus amount
-                zone_resp = (
-                    db.table("zones")
-                    .select("id, security_level")
-                    .eq("id", fort["zone_id"])
-                    .single()
-                    .execute()
-                )
-                if zone_resp.data:
-                    current_level = zone_resp.data["security_level"]
-                    try:
-                        idx = SECURITY_TIER_ORDER.index(current_level)
-                        new_idx = max(0, idx - fort["security_bonus"])
-                        new_level = SECURITY_TIER_ORDER[new_idx]
-                    except ValueError:
-                        new_level = current_level
-                    if new_level != current_level:
-                        db.table("zones").update(
-                            {"security_level": new_level}
-                        ).eq("id", fort["zone_id"]).execute()
-                # Delete expired fortification
-                db.table("zone_fortifications").delete().eq("id", fort["id"]).execute()
-        except Exception:
-            logger.warning("Fortification expiry failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-
-        # Execute bot decisions (after RP grant + mission resolution, before next cycle)
-        try:
-            await BotService.execute_bot_cycle(
-                supabase=supabase,
-                admin_supabase=admin_supabase,
-                epoch_id=str(epoch_id),
-                cycle_number=cycle_number,
-                config=config,
-            )
-        except Exception:
-            logger.warning("Bot cycle execution failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-
-        # Compute scores after missions resolve (best-effort)
-        try:
-            await ScoringService.compute_cycle_scores(supabase, epoch_id, cycle_number)
-        except Exception:
-            logger.warning(
-                "Scoring failed", extra={"epoch_id": str(epoch_id), "cycle_number": cycle_number}, exc_info=True
-            )
-
-        # Send cycle notification emails (best-effort, non-blocking)
-        try:
-            await CycleNotificationService.send_cycle_notifications(
-                admin_supabase,
-                str(epoch_id),
-                cycle_number,
-            )
-        except Exception:
-            logger.warning("Cycle notification failed", extra={"epoch_id": str(epoch_id)}, exc_info=True)
-
-        return data
-
     @classmethod
     async def resolve_cycle(
         cls,
@@ -1025,21 +920,20 @@ class EpochService:
         await cls._grant_rp_batch(db, epoch_id, rp_amount, config["rp_cap"])
 
         # Reset all cycle_ready flags before advancing
-        db.table("epoch_participants").update(
+        await run_query(db.table("epoch_participants").update(
             {"cycle_ready": False}
-        ).eq("epoch_id", str(epoch_id)).execute()
+        ).eq("epoch_id", str(epoch_id)))
 
         # Advance mission timers by one cycle interval so operatives resolve
         # in sync with admin-triggered cycle resolution (not wall-clock time).
         # Subtract cycle_hours from resolves_at for all non-guardian missions.
         cycle_hours = config.get("cycle_hours", 8)
-        active_missions = (
+        active_missions = await run_query(
             db.table("operative_missions")
             .select("id, resolves_at, operative_type")
             .eq("epoch_id", str(epoch_id))
             .in_("status", ["deploying", "active"])
             .neq("operative_type", "guardian")
-            .execute()
         )
         # Batch: group by resolves_at, compute new value, update per-group
         from collections import defaultdict
@@ -1049,16 +943,15 @@ class EpochService:
             new_resolves = old_resolves - timedelta(hours=cycle_hours)
             by_new_resolve[new_resolves.isoformat()].append(m["id"])
         for new_ts, ids in by_new_resolve.items():
-            db.table("operative_missions").update(
+            await run_query(db.table("operative_missions").update(
                 {"resolves_at": new_ts}
-            ).in_("id", ids).execute()
+            ).in_("id", ids))
 
         # Increment cycle
-        resp = (
+        resp = await run_query(
             db.table("game_epochs")
             .update({"current_cycle": new_cycle})
             .eq("id", str(epoch_id))
-            .execute()
         )
 
         if not resp.data:
@@ -1066,19 +959,7 @@ class EpochService:
 
         # Auto-advance phase if cycle crosses a boundary
         current_status = epoch["status"]
-        total_cycles = (config["duration_days"] * 24) // config["cycle_hours"]
-
-        # Support both new absolute cycles and legacy percentage-based configs
-        if "foundation_cycles" in config:
-            foundation_end = config["foundation_cycles"]
-        else:
-            foundation_end = round(total_cycles * config.get("foundation_pct", 10) / 100)
-
-        if "reckoning_cycles" in config:
-            reckoning_start = total_cycles - config["reckoning_cycles"]
-        else:
-            reckoning_cycles = round(total_cycles * config.get("reckoning_pct", 15) / 100)
-            reckoning_start = total_cycles - reckoning_cycles
+        foundation_end, reckoning_start, _ = phase_boundaries(config)
 
         # Validate phases don't overlap
         if reckoning_start <= foundation_end:
@@ -1087,13 +968,7 @@ class EpochService:
                 extra={"epoch_id": str(epoch_id), "foundation_end": foundation_end, "reckoning_start": reckoning_start},
             )
 
-        new_status = current_status
-        if current_status == "foundation" and new_cycle > foundation_end:
-            new_status = "competition"
-        elif current_status == "competition" and new_cycle > reckoning_start:
-            new_status = "reckoning"
-        elif current_status == "reckoning" and new_cycle >= total_cycles:
-            new_status = "completed"
+        new_status = next_phase_status(current_status, new_cycle, config)
 
         if new_status != current_status:
             logger.info(
@@ -1103,11 +978,10 @@ class EpochService:
                     "new_status": new_status, "cycle_number": new_cycle,
                 },
             )
-            phase_resp = (
+            phase_resp = await run_query(
                 db.table("game_epochs")
                 .update({"status": new_status})
                 .eq("id", str(epoch_id))
-                .execute()
             )
             if phase_resp.data:
                 resp = phase_resp
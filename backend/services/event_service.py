@@ -11,6 +11,7 @@ from fastapi import HTTPException, status
 from backend.services.agent_service import AgentService
 from backend.services.base_service import BaseService
 from backend.services.game_mechanics_service import GameMechanicsService
+from backend.utils.db import run_query
 from backend.utils.search import apply_search_filter
 from supabase import Client
 
@@ -23,6 +24,7 @@ class EventService(BaseService):
     table_name = "events"
     view_name = "active_events"
     supports_created_by = False
+    public_cached = True
 
     @classmethod
     async def list(
@@ -63,7 +65,7 @@ class EventService(BaseService):
             query = apply_search_filter(query, search, "search_vector", "title")
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -76,13 +78,12 @@ class EventService(BaseService):
         event_id: UUID,
     ) -> list[dict]:
         """Get all reactions for an event."""
-        response = (
+        response = await run_query(
             supabase.table("event_reactions")
             .select("*, agents(id, name, portrait_image_url)")
             .eq("simulation_id", str(simulation_id))
             .eq("event_id", str(event_id))
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -101,10 +102,9 @@ class EventService(BaseService):
             "event_id": str(event_id),
         }
 
-        response = (
+        response = await run_query(
             supabase.table("event_reactions")
             .insert(insert_data)
-            .execute()
         )
 
         if not response.data:
@@ -123,11 +123,10 @@ class EventService(BaseService):
         data: dict,
     ) -> dict:
         """Update an existing event reaction."""
-        response = (
+        response = await run_query(
             supabase.table("event_reactions")
             .update(data)
             .eq("id", str(reaction_id))
-            .execute()
         )
 
         if not response.data:
@@ -146,12 +145,11 @@ class EventService(BaseService):
         reaction_id: UUID,
     ) -> dict:
         """Delete a single event reaction."""
-        response = (
+        response = await run_query(
             supabase.table("event_reactions")
             .delete()
             .eq("id", str(reaction_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
 
         if not response.data:
@@ -170,13 +168,12 @@ class EventService(BaseService):
         tags: list[str],
     ) -> list[dict]:
         """Get events that contain any of the specified tags."""
-        response = (
+        response = await run_query(
             supabase.table(cls._read_table())
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .overlaps("tags", tags)
             .order("occurred_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -208,13 +205,12 @@ class EventService(BaseService):
         event_id: UUID,
     ) -> list[dict]:
         """Get all chain links for an event (as parent or child)."""
-        response = (
+        response = await run_query(
             supabase.table("event_chains")
             .select("*, parent:events!parent_event_id(id, title, event_status), child:events!child_event_id(id, title, event_status)")
             .eq("simulation_id", str(simulation_id))
             .or_(f"parent_event_id.eq.{event_id},child_event_id.eq.{event_id}")
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -230,10 +226,9 @@ class EventService(BaseService):
             **data,
             "simulation_id": str(simulation_id),
         }
-        response = (
+        response = await run_query(
             supabase.table("event_chains")
             .insert(insert_data)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -250,12 +245,11 @@ class EventService(BaseService):
         chain_id: UUID,
     ) -> dict:
         """Remove an event chain link."""
-        response = (
+        response = await run_query(
             supabase.table("event_chains")
             .delete()
             .eq("id", str(chain_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -354,17 +348,17 @@ class EventService(BaseService):
 
         Returns list of cascade events created (empty if none).
         """
-        await GameMechanicsService.refresh_metrics(supabase)
+        await GameMechanicsService.refresh_metrics(supabase, [simulation_id])
 
-        result = supabase.rpc(
+        result = await run_query(supabase.rpc(
             "process_cascade_events",
             {"p_simulation_id": str(simulation_id)},
-        ).execute()
+        ))
 
         cascades = result.data or []
         if cascades:
-            # Re-refresh so cascade events are reflected in MVs
-            await GameMechanicsService.refresh_metrics(supabase)
+            # Re-refresh so cascade events are reflected in the metrics
+            await GameMechanicsService.refresh_metrics(supabase, [simulation_id])
             logger.info(
                 "Cascade events created",
                 extra={
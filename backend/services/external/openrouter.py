@@ -1,22 +1,57 @@
-"""Async OpenRouter service for LLM text generation."""
+"""Async OpenRouter service for LLM text generation.
+
+Every ``OpenRouterService`` shares one ``OpenRouterTransport`` per event loop:
+
+- a persistent HTTP/2 keep-alive client, so a burst of generations reuses a
+  handful of TLS connections instead of opening one per attempt;
+- a governor — at most ``LLM_MODEL_CONCURRENCY`` requests in flight per
+  model, paced per API key by a ``TokenBucket`` (``LLM_RATE_PER_SECOND``/
+  ``LLM_BURST``);
+- retries (``LLM_MAX_ATTEMPTS``) of 429, transient 5xx and connection
+  failures with jittered exponential backoff. A 429 honors ``Retry-After``
+  (up to ``MAX_RETRY_AFTER`` seconds) and holds back every other request on
+  the same key for that long; 503 is not retried so callers fall back to
+  another model at once;
+- per-model latency, time-to-first-token, retry and token counters
+  (``transport_stats()``).
+
+``OpenRouterService.stream()`` consumes the SSE variant of the endpoint and
+yields content deltas as they arrive; retries only happen before the first
+byte of a stream.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
+from cachetools import LRUCache
 
 from backend.config import settings
+from backend.utils.token_bucket import TokenBucket
 
 logger = logging.getLogger(__name__)
 
-# Retry config
-MAX_RETRIES = 1
 TIMEOUT_SECONDS = 60
+BACKOFF_SECONDS = 0.5  # First retry delay (doubles per attempt, ±20% jitter)
+MAX_RETRY_AFTER = 20.0  # Longer Retry-After values surface as RateLimitError instead of waiting
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 504})
+LATENCY_SAMPLES = 512  # Recent latencies per model kept for percentiles
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+_transport: OpenRouterTransport | None = None
+_metrics: dict[str, ModelMetrics] = {}
+
 
 class OpenRouterError(Exception):
     """Base error for OpenRouter API issues."""
@@ -30,6 +65,273 @@ class ModelUnavailableError(OpenRouterError):
     """Raised when the requested model is unavailable (503)."""
 
 
+class ModelMetrics:
+    """Request, retry, latency and token counters of one model."""
+
+    def __init__(self) -> None:
+        self.counters = {
+            "requests": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        }
+        self.in_flight = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._first_tokens: deque[float] = deque(maxlen=LATENCY_SAMPLES)  # Streamed requests only
+
+    def record_success(self, latency: float, usage: dict | None, *, first_token: float | None = None) -> None:
+        self.counters["succeeded"] += 1
+        self._latencies.append(latency)
+        if first_token is not None:
+            self._first_tokens.append(first_token)
+        if usage:
+            self.counters["prompt_tokens"] += usage.get("prompt_tokens") or 0
+            self.counters["completion_tokens"] += usage.get("completion_tokens") or 0
+
+    def snapshot(self) -> dict:
+        def percentile(samples: deque[float], p: float) -> float | None:
+            if not samples:
+                return None
+            ordered = sorted(samples)
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 1)
+
+        return {
+            **self.counters,
+            "in_flight": self.in_flight,
+            "latency_p50_ms": percentile(self._latencies, 0.5),
+            "latency_p95_ms": percentile(self._latencies, 0.95),
+            "first_token_p50_ms": percentile(self._first_tokens, 0.5),
+            "first_token_p95_ms": percentile(self._first_tokens, 0.95),
+        }
+
+
+def _metrics_for(model: str) -> ModelMetrics:
+    metrics = _metrics.get(model)
+    if metrics is None:
+        metrics = _metrics[model] = ModelMetrics()
+    return metrics
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date), None if absent."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class OpenRouterTransport:
+    """Pooled, governed ``/chat/completions`` client for one event loop."""
+
+    def __init__(
+        self,
+        *,
+        model_concurrency: int = 8,
+        rate: float = 5,
+        burst: int = 10,
+        max_attempts: int = 3,
+        backoff: float = BACKOFF_SECONDS,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._model_concurrency = max(1, model_concurrency)
+        self._rate = rate
+        self._burst = burst
+        self._max_attempts = max(1, max_attempts)
+        self._backoff = backoff
+        self._client = client or httpx.AsyncClient(
+            base_url=OPENROUTER_BASE_URL,
+            timeout=TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+            http2=True,
+        )
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._buckets: LRUCache = LRUCache(maxsize=256)  # api_key → TokenBucket
+
+    def _slot(self, model: str) -> asyncio.Semaphore:
+        slot = self._slots.get(model)
+        if slot is None:
+            slot = self._slots[model] = asyncio.Semaphore(self._model_concurrency)
+        return slot
+
+    def _bucket(self, api_key: str) -> TokenBucket:
+        bucket = self._buckets.get(api_key)
+        if bucket is None:
+            bucket = self._buckets[api_key] = TokenBucket(self._rate, self._burst)
+        return bucket
+
+    def _delay(self, attempt: int) -> float:
+        jitter = random.uniform(0.8, 1.2)  # noqa: S311 — backoff jitter, not security
+        return self._backoff * 2 ** (attempt - 1) * jitter
+
+    @asynccontextmanager
+    async def _open(
+        self, api_key: str, payload: dict[str, Any], *, stream: bool = False,
+    ) -> AsyncIterator[tuple[httpx.Response, float]]:
+        """Send ``payload`` with governor and retries; yield the 200 response and its start time.
+
+        The model slot stays held while the caller reads the response (for the
+        whole stream when ``stream`` is set). Failed attempts are retried as
+        described in the module docstring.
+
+        Raises:
+            RateLimitError: 429 after the last attempt, or a Retry-After above ``MAX_RETRY_AFTER``
+            ModelUnavailableError: On 503 responses
+            OpenRouterError: On other API or connection errors
+        """
+        model = payload["model"]
+        metrics = _metrics_for(model)
+        bucket = self._bucket(api_key)
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "HTTP-Referer": "https://velgarien.app",
+            "X-Title": "Velgarien Platform",
+        }
+
+        for attempt in range(1, self._max_attempts + 1):
+            last = attempt == self._max_attempts
+            if attempt > 1:
+                metrics.counters["retries"] += 1
+            await bucket.acquire()
+            async with self._slot(model):
+                metrics.counters["requests"] += 1
+                metrics.in_flight += 1
+                started = time.monotonic()
+                try:
+                    request = self._client.build_request("POST", "/chat/completions", json=payload, headers=headers)
+                    try:
+                        response = await self._client.send(request, stream=stream)
+                    except httpx.TransportError as exc:
+                        response, error = None, exc
+                    if response is not None and response.status_code == 200:
+                        try:
+                            yield response, started
+                        finally:
+                            await response.aclose()
+                        return
+                    if response is not None:
+                        await response.aread()  # Error body of a streamed request
+                        await response.aclose()
+                finally:
+                    metrics.in_flight -= 1
+
+            if response is None:
+                if last:
+                    metrics.counters["failed"] += 1
+                    raise OpenRouterError(f"Connection failed after {attempt} attempts") from error
+                logger.warning(
+                    "OpenRouter connection error, retrying",
+                    extra={"model": model, "attempt": attempt, "error": str(error)},
+                )
+                await asyncio.sleep(self._delay(attempt))
+                continue
+
+            status = response.status_code
+            retry_after = _retry_after(response)
+            delay = retry_after if retry_after is not None else self._delay(attempt)
+            if status == 429:
+                metrics.counters["rate_limited"] += 1
+                bucket.defer(delay)  # Hold back the other requests on this key too
+            if status == 503:
+                metrics.counters["failed"] += 1
+                raise ModelUnavailableError(f"Model '{model}' is currently unavailable")
+            if status not in RETRYABLE_STATUS or last or delay > MAX_RETRY_AFTER:
+                metrics.counters["failed"] += 1
+                if status == 429:
+                    raise RateLimitError(f"Rate limited by OpenRouter (model: {model})")
+                raise OpenRouterError(f"API error {status}: {response.text[:200]}")
+
+            logger.warning(
+                "OpenRouter %d, retrying",
+                status,
+                extra={"model": model, "attempt": attempt, "delay": round(delay, 2)},
+            )
+            await asyncio.sleep(delay)
+
+        raise OpenRouterError("All retry attempts exhausted")
+
+    async def complete(self, api_key: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST ``payload`` to ``/chat/completions`` and return the decoded response."""
+        async with self._open(api_key, payload) as (response, started):
+            data = response.json()
+        _metrics_for(payload["model"]).record_success(time.monotonic() - started, data.get("usage"))
+        return data
+
+    async def stream(self, api_key: str, payload: dict[str, Any]) -> AsyncIterator[str]:
+        """POST ``payload`` with ``stream: true`` and yield content deltas as they arrive.
+
+        Retries happen only before the first byte; an error event or a dropped
+        connection mid-stream raises ``OpenRouterError``.
+        """
+        metrics = _metrics_for(payload["model"])
+        usage: dict | None = None
+        first_token: float | None = None
+        async with self._open(api_key, {**payload, "stream": True}, stream=True) as (response, started):
+            try:
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue  # Blank separators and ": OPENROUTER PROCESSING" keep-alives
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    if chunk.get("error"):
+                        raise OpenRouterError(f"Stream error: {str(chunk['error'].get('message', ''))[:200]}")
+                    usage = chunk.get("usage") or usage
+                    for choice in chunk.get("choices") or []:
+                        delta = (choice.get("delta") or {}).get("content")
+                        if delta:
+                            if first_token is None:
+                                first_token = time.monotonic() - started
+                            yield delta
+            except (httpx.TransportError, json.JSONDecodeError) as exc:
+                metrics.counters["failed"] += 1
+                raise OpenRouterError("Stream interrupted") from exc
+            except OpenRouterError:
+                metrics.counters["failed"] += 1
+                raise
+        metrics.record_success(time.monotonic() - started, usage, first_token=first_token)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def get_transport() -> OpenRouterTransport:
+    """The shared transport of the running event loop (created on first use)."""
+    global _transport  # noqa: PLW0603
+    if _transport is None or _transport.loop is not asyncio.get_running_loop():
+        _transport = OpenRouterTransport(
+            model_concurrency=settings.llm_model_concurrency,
+            rate=settings.llm_rate_per_second,
+            burst=settings.llm_burst,
+            max_attempts=settings.llm_max_attempts,
+        )
+    return _transport
+
+
+async def close_transport() -> None:
+    """Close the pooled HTTP client (shutdown, tests)."""
+    global _transport  # noqa: PLW0603
+    transport, _transport = _transport, None
+    if transport is not None and transport.loop is asyncio.get_running_loop():
+        await transport.close()
+
+
+def transport_stats() -> dict[str, dict]:
+    """Per-model request, retry, token and latency counters since start."""
+    return {model: metrics.snapshot() for model, metrics in _metrics.items()}
+
+
 class OpenRouterService:
     """Async client for OpenRouter LLM API."""
 
@@ -46,9 +348,6 @@ class OpenRouterService:
     ) -> str:
         """Generate text using the specified model.
 
-        Raises:
-            OpenRouterError: If no API key is configured.
-
         Args:
             model: OpenRouter model ID (e.g. "deepseek/deepseek-chat-v3-0324")
             messages: Chat messages in OpenAI format [{"role": "...", "content": "..."}]
@@ -59,85 +358,51 @@ class OpenRouterService:
             Generated text content.
 
         Raises:
-            RateLimitError: On 429 responses
+            RateLimitError: On 429 responses (after retries)
             ModelUnavailableError: On 503 responses
-            OpenRouterError: On other API errors
+            OpenRouterError: On a missing API key or other API errors
+        """
+        payload = self._payload(model, messages, temperature, max_tokens)
+        data = await get_transport().complete(self.api_key, payload)
+        return _extract_content(data)
+
+    async def stream(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str]:
+        """Generate text like ``generate()``, yielding content deltas as they arrive.
+
+        Raises the same errors as ``generate()`` — rate limits and unavailable
+        models before the first delta, ``OpenRouterError`` if the stream breaks
+        off or ends without content.
         """
+        payload = self._payload(model, messages, temperature, max_tokens)
+        empty = True
+        async for delta in get_transport().stream(self.api_key, payload):
+            empty = False
+            yield delta
+        if empty:
+            raise OpenRouterError("Empty content in response")
+
+    def _payload(
+        self, model: str, messages: list[dict[str, str]], temperature: float, max_tokens: int,
+    ) -> dict[str, Any]:
         if not self.api_key:
             raise OpenRouterError(
                 "OpenRouter API key is not configured. "
                 "Set OPENROUTER_API_KEY in .env or in simulation settings."
             )
-
-        payload = {
+        return {
             "model": model,
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://velgarien.app",
-            "X-Title": "Velgarien Platform",
-        }
-        last_error: Exception | None = None
-
-        for attempt in range(MAX_RETRIES + 1):
-            try:
-                async with httpx.AsyncClient(timeout=TIMEOUT_SECONDS) as client:
-                    response = await client.post(
-                        f"{OPENROUTER_BASE_URL}/chat/completions",
-                        json=payload,
-                        headers=headers,
-                    )
-
-                if response.status_code == 429:
-                    raise RateLimitError(
-                        f"Rate limited by OpenRouter (model: {model})"
-                    )
-
-                if response.status_code == 503:
-                    raise ModelUnavailableError(
-                        f"Model '{model}' is currently unavailable"
-                    )
-
-                if response.status_code != 200:
-                    error_body = response.text
-                    if attempt < MAX_RETRIES:
-                        logger.warning(
-                            "OpenRouter %d error (attempt %d/%d): %s",
-                            response.status_code,
-                            attempt + 1,
-                            MAX_RETRIES + 1,
-                            error_body[:200],
-                        )
-                        last_error = OpenRouterError(
-                            f"API error {response.status_code}: {error_body[:200]}"
-                        )
-                        continue
-                    raise OpenRouterError(
-                        f"API error {response.status_code}: {error_body[:200]}"
-                    )
-
-                data = response.json()
-                return _extract_content(data)
-
-            except (httpx.TimeoutException, httpx.ConnectError) as e:
-                if attempt < MAX_RETRIES:
-                    logger.warning(
-                        "OpenRouter connection error (attempt %d/%d): %s",
-                        attempt + 1,
-                        MAX_RETRIES + 1,
-                        str(e),
-                    )
-                    last_error = e
-                    continue
-                raise OpenRouterError(f"Connection failed after {MAX_RETRIES + 1} attempts") from e
-
-        raise OpenRouterError("All retry attempts exhausted") from last_error
-
     async def generate_with_system(
         self,
         model: str,
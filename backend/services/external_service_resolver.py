@@ -8,6 +8,7 @@ from uuid import UUID
 
 from backend.config import settings as platform_settings
 from backend.services.platform_api_keys import get_platform_api_key
+from backend.utils.db import run_query
 from backend.utils.encryption import decrypt
 from supabase import Client
 
@@ -65,12 +66,9 @@ class ExternalServiceResolver:
         if self._admin_supabase:
             return self._admin_supabase
         try:
-            from supabase import create_client
+            from backend.utils.supabase_pool import get_admin_client
 
-            self._admin_supabase = create_client(
-                platform_settings.supabase_url,
-                platform_settings.supabase_service_role_key,
-            )
+            self._admin_supabase = get_admin_client()
             return self._admin_supabase
         except Exception:
             logger.debug("Could not create admin client for platform key lookup")
@@ -81,12 +79,11 @@ class ExternalServiceResolver:
         if self._cache is not None:
             return self._cache
 
-        response = (
+        response = await run_query(
             self._supabase.table("simulation_settings")
             .select("setting_key, setting_value")
             .eq("simulation_id", str(self._simulation_id))
             .eq("category", "integration")
-            .execute()
         )
 
         self._cache = {}
@@ -9,6 +9,7 @@ from fastapi import HTTPException, status
 
 from backend.dependencies import get_admin_supabase
 from backend.models.forge import ForgeDraftCreate, ForgeDraftUpdate
+from backend.utils.db import run_query
 from backend.utils.encryption import encrypt
 from supabase import Client
 
@@ -26,13 +27,12 @@ class ForgeDraftService:
         offset: int = 0,
     ) -> tuple[list[dict], int]:
         """List forge drafts for a user."""
-        response = (
+        response = await run_query(
             supabase.table("forge_drafts")
             .select("*", count="exact")
             .eq("user_id", str(user_id))
             .order("updated_at", desc=True)
             .range(offset, offset + limit - 1)
-            .execute()
         )
         return response.data or [], response.count or 0
 
@@ -43,13 +43,12 @@ class ForgeDraftService:
         draft_id: UUID,
     ) -> dict:
         """Get a single draft by ID."""
-        response = (
+        response = await run_query(
             supabase.table("forge_drafts")
             .select("*")
             .eq("id", str(draft_id))
             .eq("user_id", str(user_id))
             .single()
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -75,10 +74,9 @@ class ForgeDraftService:
             "current_phase": "astrolabe",
             "status": "draft",
         }
-        response = (
+        response = await run_query(
             supabase.table("forge_drafts")
             .insert(insert_data)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -99,12 +97,11 @@ class ForgeDraftService:
         if not update_data:
             return await ForgeDraftService.get_draft(supabase, user_id, draft_id)
 
-        response = (
+        response = await run_query(
             supabase.table("forge_drafts")
             .update(update_data)
             .eq("id", str(draft_id))
             .eq("user_id", str(user_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -120,12 +117,11 @@ class ForgeDraftService:
         draft_id: UUID,
     ) -> dict:
         """Permanently delete a forge draft."""
-        response = (
+        response = await run_query(
             supabase.table("forge_drafts")
             .delete()
             .eq("id", str(draft_id))
             .eq("user_id", str(user_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -157,11 +153,10 @@ class ForgeDraftService:
 
         admin_client = await get_admin_supabase()
 
-        response = (
+        response = await run_query(
             admin_client.table("user_wallets")
             .update(update_data)
             .eq("user_id", str(user_id))
-            .execute()
         )
 
         if not response.data:
@@ -172,38 +167,34 @@ class ForgeDraftService:
     @staticmethod
     async def get_wallet(supabase: Client, user_id: UUID) -> dict:
         """Get the current user's forge wallet."""
-        response = (
+        response = await run_query(
             supabase.table("user_wallets")
             .select("forge_tokens, is_architect")
             .eq("user_id", str(user_id))
             .single()
-            .execute()
         )
         return response.data or {"forge_tokens": 0, "is_architect": False}
 
     @staticmethod
     async def get_admin_stats(admin_supabase: Client) -> dict:
         """Get global forge statistics (admin only)."""
-        drafts_resp = (
+        drafts_resp = await run_query(
             admin_supabase.table("forge_drafts")
             .select("id", count="exact")
             .in_("status", ["draft", "processing"])
-            .execute()
         )
         active_drafts = drafts_resp.count or 0
 
-        tokens_resp = (
+        tokens_resp = await run_query(
             admin_supabase.table("user_wallets")
             .select("forge_tokens")
-            .execute()
         )
         total_tokens = sum(row["forge_tokens"] for row in (tokens_resp.data or []))
 
-        materialized_resp = (
+        materialized_resp = await run_query(
             admin_supabase.table("forge_drafts")
             .select("id", count="exact")
             .eq("status", "completed")
-            .execute()
         )
         total_materialized = materialized_resp.count or 0
 
@@ -218,11 +209,10 @@ class ForgeDraftService:
         admin_supabase: Client, cutoff_iso: str
     ) -> int:
         """Purge stale drafts older than the given cutoff date."""
-        response = (
+        response = await run_query(
             admin_supabase.table("forge_drafts")
             .delete()
             .in_("status", ["draft", "failed"])
             .lt("updated_at", cutoff_iso)
-            .execute()
         )
         return len(response.data) if response.data else 0
@@ -10,6 +10,7 @@ from pydantic_ai import Agent
 
 from backend.models.forge import ForgeEntityTranslationOutput
 from backend.services.ai_utils import get_openrouter_model
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -127,9 +128,9 @@ class ForgeEntityTranslationService:
 
         # Update simulation description_de
         if translations.simulation.description_de:
-            supabase.table("simulations").update(
+            await run_query(supabase.table("simulations").update(
                 {"description_de": translations.simulation.description_de}
-            ).eq("id", sim_id).execute()
+            ).eq("id", sim_id))
             logger.debug("Updated simulation description_de", extra={"simulation_id": sim_id})
 
         # Update agents by name match
@@ -142,9 +143,9 @@ class ForgeEntityTranslationService:
             if at.primary_profession_de:
                 update_data["primary_profession_de"] = at.primary_profession_de
             if update_data:
-                supabase.table("agents").update(update_data).eq(
+                await run_query(supabase.table("agents").update(update_data).eq(
                     "simulation_id", sim_id
-                ).eq("name", at.name).execute()
+                ).eq("name", at.name))
 
         logger.debug(
             "Updated agent translations",
@@ -161,9 +162,9 @@ class ForgeEntityTranslationService:
             if bt.building_condition_de:
                 update_data["building_condition_de"] = bt.building_condition_de
             if update_data:
-                supabase.table("buildings").update(update_data).eq(
+                await run_query(supabase.table("buildings").update(update_data).eq(
                     "simulation_id", sim_id
-                ).eq("name", bt.name).execute()
+                ).eq("name", bt.name))
 
         logger.debug(
             "Updated building translations",
@@ -178,9 +179,9 @@ class ForgeEntityTranslationService:
             if zt.zone_type_de:
                 update_data["zone_type_de"] = zt.zone_type_de
             if update_data:
-                supabase.table("zones").update(update_data).eq(
+                await run_query(supabase.table("zones").update(update_data).eq(
                     "simulation_id", sim_id
-                ).eq("name", zt.name).execute()
+                ).eq("name", zt.name))
 
         logger.debug(
             "Updated zone translations",
@@ -193,9 +194,9 @@ class ForgeEntityTranslationService:
             if st.street_type_de:
                 update_data["street_type_de"] = st.street_type_de
             if update_data:
-                supabase.table("city_streets").update(update_data).eq(
+                await run_query(supabase.table("city_streets").update(update_data).eq(
                     "simulation_id", sim_id
-                ).eq("name", st.name).execute()
+                ).eq("name", st.name))
 
         logger.debug(
             "Updated street translations",
@@ -10,6 +10,7 @@ from pydantic_ai import Agent
 
 from backend.models.forge import ForgeLoreOutput, ForgeLoreTranslatedOutput
 from backend.services.ai_utils import get_openrouter_model
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -180,5 +181,5 @@ class ForgeLoreService:
             "Persisting lore sections",
             extra={"section_count": len(rows), "simulation_id": str(simulation_id)},
         )
-        supabase.table("simulation_lore").insert(rows).execute()
+        await run_query(supabase.table("simulation_lore").insert(rows))
         logger.debug("Lore persisted", extra={"simulation_id": str(simulation_id)})
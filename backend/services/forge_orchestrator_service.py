@@ -24,6 +24,7 @@ from backend.services.forge_lore_service import ForgeLoreService
 from backend.services.forge_theme_service import ForgeThemeService
 from backend.services.image_service import ImageService
 from backend.services.research_service import ResearchService
+from backend.utils.db import gather_queries, run_query
 from backend.utils.encryption import decrypt
 from supabase import Client
 
@@ -152,12 +153,11 @@ class ForgeOrchestratorService:
     async def _get_user_keys(supabase: Client, user_id: UUID) -> tuple[str | None, str | None]:
         """Fetch and decrypt a user's BYOK API keys."""
         logger.debug("Fetching BYOK keys for user %s", user_id)
-        resp = (
+        resp = await run_query(
             supabase.table("user_wallets")
             .select("encrypted_openrouter_key, encrypted_replicate_key")
             .eq("user_id", str(user_id))
             .maybe_single()
-            .execute()
         )
         data = resp.data or {}
 
@@ -327,7 +327,7 @@ class ForgeOrchestratorService:
 
         try:
             try:
-                response = supabase.rpc("fn_materialize_shard", {"p_draft_id": str(draft_id)}).execute()
+                response = await run_query(supabase.rpc("fn_materialize_shard", {"p_draft_id": str(draft_id)}))
             except Exception as rpc_err:
                 # Parse PostgreSQL RAISE EXCEPTION into semantic HTTP codes
                 err_msg = str(rpc_err)
@@ -348,12 +348,11 @@ class ForgeOrchestratorService:
             sim_id = response.data
 
             # Resolve slug for frontend navigation
-            slug_resp = (
+            slug_resp = await run_query(
                 supabase.table("simulations")
                 .select("slug")
                 .eq("id", str(sim_id))
                 .single()
-                .execute()
             )
             slug = slug_resp.data["slug"] if slug_resp.data else None
 
@@ -391,30 +390,24 @@ class ForgeOrchestratorService:
 
                 # Mock entity translations
                 try:
-                    mat_agents = (
+                    agents_resp, buildings_resp, zones_resp, streets_resp = await gather_queries(
                         write_client.table("agents")
                         .select("name, character, background, primary_profession")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
-                    mat_buildings = (
+                        .eq("simulation_id", str(sim_id)),
                         write_client.table("buildings")
                         .select("name, description, building_type, building_condition")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
-                    mat_zones = (
+                        .eq("simulation_id", str(sim_id)),
                         write_client.table("zones")
                         .select("name, description, zone_type")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
-                    mat_streets = (
+                        .eq("simulation_id", str(sim_id)),
                         write_client.table("city_streets")
                         .select("name, street_type")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
+                        .eq("simulation_id", str(sim_id)),
+                    )
+                    mat_agents = agents_resp.data or []
+                    mat_buildings = buildings_resp.data or []
+                    mat_zones = zones_resp.data or []
+                    mat_streets = streets_resp.data or []
 
                     sim_desc = geography.get("description", "") or seed
                     mock_trans = mock.mock_entity_translations(
@@ -454,30 +447,24 @@ class ForgeOrchestratorService:
 
                 # Translate entity fields (agents, buildings, zones, streets, sim description)
                 try:
-                    mat_agents = (
+                    agents_resp, buildings_resp, zones_resp, streets_resp = await gather_queries(
                         write_client.table("agents")
                         .select("name, character, background, primary_profession")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
-                    mat_buildings = (
+                        .eq("simulation_id", str(sim_id)),
                         write_client.table("buildings")
                         .select("name, description, building_type, building_condition")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
-                    mat_zones = (
+                        .eq("simulation_id", str(sim_id)),
                         write_client.table("zones")
                         .select("name, description, zone_type")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
-                    mat_streets = (
+                        .eq("simulation_id", str(sim_id)),
                         write_client.table("city_streets")
                         .select("name, street_type")
-                        .eq("simulation_id", str(sim_id))
-                        .execute()
-                    ).data or []
+                        .eq("simulation_id", str(sim_id)),
+                    )
+                    mat_agents = agents_resp.data or []
+                    mat_buildings = buildings_resp.data or []
+                    mat_zones = zones_resp.data or []
+                    mat_streets = streets_resp.data or []
 
                     sim_desc = geography.get("description", "") or seed
 
@@ -574,12 +561,11 @@ class ForgeOrchestratorService:
         )
 
         # 1. Banner image (most visible on dashboard)
-        sim_resp = (
+        sim_resp = await run_query(
             supabase.table("simulations")
             .select("name, description, slug")
             .eq("id", str(simulation_id))
             .single()
-            .execute()
         )
         sim_data = sim_resp.data or {}
 
@@ -593,11 +579,10 @@ class ForgeOrchestratorService:
             logger.exception("Banner generation failed", extra={"simulation_id": str(simulation_id)})
 
         # 2. Agent portraits
-        agents = (
+        agents = await run_query(
             supabase.table("agents")
             .select("id, name, character, background")
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         for agent in agents.data or []:
             try:
@@ -613,11 +598,10 @@ class ForgeOrchestratorService:
                 )
 
         # 3. Building images
-        buildings = (
+        buildings = await run_query(
             supabase.table("buildings")
             .select("id, name, description, building_type")
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
         for building in buildings.data or []:
             try:
@@ -635,13 +619,12 @@ class ForgeOrchestratorService:
 
         # 4. Lore images (sections with image_slug)
         sim_slug = sim_data.get("slug", str(simulation_id))
-        lore_sections = (
+        lore_sections = await run_query(
             supabase.table("simulation_lore")
             .select("id, title, body, image_slug")
             .eq("simulation_id", str(simulation_id))
             .not_.is_("image_slug", "null")
             .order("sort_order")
-            .execute()
         )
         for section in lore_sections.data or []:
             try:
@@ -9,7 +9,9 @@ from uuid import UUID
 from pydantic_ai import Agent
 
 from backend.models.forge import ForgeThemeOutput
+from backend.services import ai_config_cache
 from backend.services.ai_utils import get_openrouter_model
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -143,9 +145,10 @@ class ForgeThemeService:
 
         logger.info("Applying %d theme settings for simulation %s", len(rows), simulation_id)
 
-        supabase.table("simulation_settings").upsert(
+        await run_query(supabase.table("simulation_settings").upsert(
             rows,
             on_conflict="simulation_id,category,setting_key",
-        ).execute()
+        ))
+        ai_config_cache.invalidate_simulation(simulation_id)
 
         logger.info("Theme settings applied for simulation %s", simulation_id)
@@ -5,6 +5,8 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services.game_mechanics_service import GameMechanicsService
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -41,14 +43,14 @@ class GameInstanceService:
         Returns:
             List of {template_id, instance_id, slug, name} mappings
         """
-        resp = admin_supabase.rpc(
+        resp = await run_query(admin_supabase.rpc(
             "clone_simulations_for_epoch",
             {
                 "p_epoch_id": str(epoch_id),
                 "p_created_by_id": str(created_by_id),
                 "p_epoch_number": epoch_number,
             },
-        ).execute()
+        ))
 
         if not resp.data:
             raise HTTPException(
@@ -68,8 +70,8 @@ class GameInstanceService:
             extra={"instance_count": len(mapping), "epoch_id": str(epoch_id)},
         )
 
-        # Refresh materialized views so scoring picks up new instances
-        await cls._refresh_game_metrics(admin_supabase)
+        # Compute the new instances' metrics so scoring picks them up
+        await cls._refresh_game_metrics(admin_supabase, [m["instance_id"] for m in mapping])
 
         return mapping
 
@@ -80,10 +82,10 @@ class GameInstanceService:
         epoch_id: UUID,
     ) -> None:
         """Mark all game instances as archived after epoch completion."""
-        admin_supabase.rpc(
+        await run_query(admin_supabase.rpc(
             "archive_epoch_instances",
             {"p_epoch_id": str(epoch_id)},
-        ).execute()
+        ))
 
         logger.info("Archived instances for epoch", extra={"epoch_id": str(epoch_id)})
 
@@ -94,10 +96,10 @@ class GameInstanceService:
         epoch_id: UUID,
     ) -> None:
         """Delete all game instances for a cancelled epoch."""
-        admin_supabase.rpc(
+        await run_query(admin_supabase.rpc(
             "delete_epoch_instances",
             {"p_epoch_id": str(epoch_id)},
-        ).execute()
+        ))
 
         logger.info("Deleted instances for epoch", extra={"epoch_id": str(epoch_id)})
 
@@ -108,13 +110,12 @@ class GameInstanceService:
         epoch_id: UUID,
     ) -> list[dict]:
         """List all game instances for an epoch."""
-        resp = (
+        resp = await run_query(
             supabase.table("simulations")
             .select("id, name, slug, theme, simulation_type, source_template_id, icon_url, banner_url")
             .eq("epoch_id", str(epoch_id))
             .in_("simulation_type", ["game_instance", "archived"])
             .order("name")
-            .execute()
         )
         return resp.data or []
 
@@ -126,29 +127,27 @@ class GameInstanceService:
         template_id: UUID,
     ) -> dict | None:
         """Get the game instance created from a specific template in an epoch."""
-        resp = (
+        resp = await run_query(
             supabase.table("simulations")
             .select("*")
             .eq("epoch_id", str(epoch_id))
             .eq("source_template_id", str(template_id))
             .in_("simulation_type", ["game_instance", "archived"])
             .maybe_single()
-            .execute()
         )
         return resp.data
 
     @classmethod
-    async def _refresh_game_metrics(cls, admin_supabase: Client) -> None:
-        """Refresh all game materialized views after cloning."""
-        admin_supabase.rpc("refresh_all_game_metrics", {}).execute()
-        logger.debug("Refreshed game materialized views")
+    async def _refresh_game_metrics(cls, admin_supabase: Client, instance_ids: list[str]) -> None:
+        """Compute the game metrics of freshly cloned instances."""
+        await GameMechanicsService.refresh_metrics(admin_supabase, instance_ids)
+        logger.debug("Refreshed game metrics", extra={"instance_count": len(instance_ids)})
 
     @classmethod
     async def get_epoch_number(cls, supabase: Client) -> int:
         """Get the next epoch number (count of all epochs + 1)."""
-        resp = (
+        resp = await run_query(
             supabase.table("game_epochs")
             .select("id", count="exact")
-            .execute()
         )
         return (resp.count or 0) + 1
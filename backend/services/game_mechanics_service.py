@@ -1,22 +1,33 @@
-"""Service for reading game mechanics materialized views.
+"""Service for reading the game mechanics metric tables (``mv_*``).
 
-Does NOT extend BaseService — materialized views are read-only and
-not simulation-scoped in the usual CRUD sense. Uses admin client
-for reads (materialized views don't have per-row RLS) and filters
+Does NOT extend BaseService — the metric tables are read-only for
+clients and maintained per simulation by ``refresh_game_metrics``.
+Uses admin client for reads (they don't have per-row RLS) and filters
 by simulation_id in the query.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services.cache_config import get_ttl
+from backend.utils.db import run_query
+from backend.utils.single_flight import SingleFlight
+from backend.utils.supabase_pool import get_admin_client
 from supabase import Client
 
+logger = logging.getLogger(__name__)
+
+# Polled by every open map; shared + served stale while refreshing
+_health_flight = SingleFlight("simulation_health", ttl=lambda: get_ttl("cache_map_data_ttl"), stale_factor=4)
+
 
 class GameMechanicsService:
-    """Read-only service for game mechanics materialized views."""
+    """Read-only service for the game mechanics metric tables."""
 
     @staticmethod
     async def get_simulation_health(
@@ -24,12 +35,11 @@ class GameMechanicsService:
         simulation_id: UUID,
     ) -> dict | None:
         """Get top-level health metrics for a simulation."""
-        response = (
+        response = await run_query(
             supabase.table("mv_simulation_health")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .limit(1)
-            .execute()
         )
         return response.data[0] if response.data else None
 
@@ -38,13 +48,16 @@ class GameMechanicsService:
         supabase: Client,
     ) -> list[dict]:
         """Get health metrics for all simulations (for map/dashboard)."""
-        response = (
-            supabase.table("mv_simulation_health")
-            .select("*")
-            .order("overall_health", desc=True)
-            .execute()
-        )
-        return response.data or []
+
+        async def _load() -> list[dict]:
+            response = await run_query(
+                supabase.table("mv_simulation_health")
+                .select("*")
+                .order("overall_health", desc=True)
+            )
+            return response.data or []
+
+        return await _health_flight.get("all", _load)
 
     @staticmethod
     async def get_building_readiness(
@@ -53,13 +66,12 @@ class GameMechanicsService:
         building_id: UUID,
     ) -> dict:
         """Get readiness metrics for a single building."""
-        response = (
+        response = await run_query(
             supabase.table("mv_building_readiness")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("building_id", str(building_id))
             .limit(1)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -91,7 +103,7 @@ class GameMechanicsService:
             query = query.eq("zone_id", str(zone_id))
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
 
@@ -102,13 +114,12 @@ class GameMechanicsService:
         zone_id: UUID,
     ) -> dict:
         """Get stability metrics for a single zone."""
-        response = (
+        response = await run_query(
             supabase.table("mv_zone_stability")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("zone_id", str(zone_id))
             .limit(1)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -123,12 +134,11 @@ class GameMechanicsService:
         simulation_id: UUID,
     ) -> list[dict]:
         """List zone stability for all zones in a simulation."""
-        response = (
+        response = await run_query(
             supabase.table("mv_zone_stability")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .order("stability", desc=False)
-            .execute()
         )
         return response.data or []
 
@@ -138,7 +148,7 @@ class GameMechanicsService:
         simulation_id: UUID,
     ) -> list[dict]:
         """List embassy effectiveness for embassies involving a simulation."""
-        response = (
+        response = await run_query(
             supabase.table("mv_embassy_effectiveness")
             .select("*")
             .or_(
@@ -146,7 +156,6 @@ class GameMechanicsService:
                 f"simulation_b_id.eq.{simulation_id}"
             )
             .order("effectiveness", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -180,14 +189,13 @@ class GameMechanicsService:
         )
 
         # Recent high-impact events (last 30 days, impact >= 7)
-        events_response = (
+        events_response = await run_query(
             supabase.table("active_events")
             .select("id, title, impact_level, location, occurred_at, event_type, tags")
             .eq("simulation_id", str(simulation_id))
             .gte("impact_level", 7)
             .order("occurred_at", desc=True)
             .limit(10)
-            .execute()
         )
         recent_events = events_response.data or []
 
@@ -210,7 +218,7 @@ class GameMechanicsService:
 
         Fetches simulation health and optionally zone stability, then
         constructs a context dict with narrative guidance derived from
-        the metrics. This is cheap (reads materialized views) and safe
+        the metrics. This is cheap (reads the metric tables) and safe
         to call before every generation request.
         """
         ctx: dict = {}
@@ -240,7 +248,7 @@ class GameMechanicsService:
                 ctx["zone_security"] = zone.get("security_level", "moderate")
                 ctx["event_pressure"] = zone.get("event_pressure", 0)
             except HTTPException:
-                pass  # Zone not in materialized view yet
+                pass  # Zone not in the metric tables yet
 
         # Derive narrative guidance from metrics
         ctx["narrative_guidance"] = (
@@ -302,9 +310,40 @@ class GameMechanicsService:
         return " ".join(parts) if parts else "The simulation is functional."
 
     @staticmethod
-    async def refresh_metrics(supabase: Client) -> None:
-        """Trigger a full refresh of all game mechanics materialized views.
-
-        Uses a Postgres RPC call to the refresh function.
+    async def refresh_metrics(
+        supabase: Client,
+        simulation_ids: list[UUID] | list[str] | None = None,
+    ) -> list[str]:
+        """Recompute the game metrics of the given simulations.
+
+        Only their rows (and their embassy partners' health) are rebuilt.
+        Without ``simulation_ids``, refreshes every simulation whose inputs
+        changed since its last refresh (the ``game_metrics_dirty`` set).
+        Returns the ids of the refreshed simulations.
         """
-        supabase.rpc("refresh_all_game_metrics", {}).execute()
+        if simulation_ids is None:
+            response = await run_query(supabase.rpc("refresh_dirty_game_metrics", {}))
+        else:
+            response = await run_query(supabase.rpc(
+                "refresh_game_metrics",
+                {"p_simulation_ids": [str(sim_id) for sim_id in simulation_ids]},
+            ))
+        return response.data or []
+
+
+async def refresh_dirty_metrics_periodically(interval: float) -> None:
+    """Drain the ``game_metrics_dirty`` set every ``interval`` seconds (runs for the app's lifetime).
+
+    Scoring, events and zone actions refresh their simulations directly; agent,
+    building, embassy and taxonomy edits only mark theirs dirty (migration 088
+    triggers) and are picked up here.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            refreshed = await GameMechanicsService.refresh_metrics(get_admin_client())
+        except Exception:
+            logger.warning("Dirty game metrics refresh failed", exc_info=True)
+        else:
+            if refreshed:
+                logger.debug("Refreshed dirty game metrics", extra={"simulations": len(refreshed)})
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
 from uuid import UUID
 
 from backend.services.embassy_prompts import (
@@ -19,10 +22,13 @@ from backend.services.external.openrouter import (
 from backend.services.external.output_repair import repair_json_output
 from backend.services.model_resolver import ModelResolver, ResolvedModel
 from backend.services.prompt_service import LOCALE_NAMES, PromptResolver
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class GenerationService:
     """Orchestrates AI text generation using PromptResolver + ModelResolver + OpenRouter."""
@@ -38,6 +44,26 @@ class GenerationService:
         self._prompt_resolver = PromptResolver(supabase, simulation_id)
         self._model_resolver = ModelResolver(supabase, simulation_id)
         self._openrouter = OpenRouterService(api_key=openrouter_api_key)
+        self._on_delta: Callable[[str], None] | None = None
+
+    async def stream(self, run: Callable[[], Awaitable[T]]) -> AsyncIterator[tuple[str, Any]]:
+        """Run one ``generate_*`` call, streaming its LLM output.
+
+        Yields ``("delta", {"content": text})`` as tokens arrive, then
+        ``("result", value)`` with the call's usual (parsed) return value.
+        Usage: ``service.stream(lambda: service.generate_event(...))``.
+        """
+        deltas: asyncio.Queue[str | None] = asyncio.Queue()
+        self._on_delta = deltas.put_nowait
+        task = asyncio.create_task(run())
+        task.add_done_callback(lambda _: deltas.put_nowait(None))
+        try:
+            while (delta := await deltas.get()) is not None:
+                yield "delta", {"content": delta}
+            yield "result", task.result()
+        finally:
+            self._on_delta = None
+            task.cancel()
 
     async def generate_agent_full(
         self,
@@ -689,24 +715,18 @@ class GenerationService:
     ) -> str:
         """Call LLM with automatic fallback on rate limit or model unavailability."""
         try:
-            return await self._openrouter.generate_with_system(
-                model=model.model_id,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                temperature=model.temperature,
-                max_tokens=model.max_tokens,
+            return await self._call(
+                model.model_id, system_prompt, user_prompt,
+                temperature=model.temperature, max_tokens=model.max_tokens,
             )
         except RateLimitError:
             logger.warning(
                 "Rate limited on %s, falling back", model.model_id,
             )
             fallback = await self._model_resolver.resolve_text_model("fallback")
-            return await self._openrouter.generate_with_system(
-                model=fallback.model_id,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                temperature=fallback.temperature,
-                max_tokens=fallback.max_tokens,
+            return await self._call(
+                fallback.model_id, system_prompt, user_prompt,
+                temperature=fallback.temperature, max_tokens=fallback.max_tokens,
             )
         except ModelUnavailableError:
             logger.warning(
@@ -716,11 +736,41 @@ class GenerationService:
             from backend.services.model_resolver import PLATFORM_DEFAULT_MODELS
 
             default_model = PLATFORM_DEFAULT_MODELS["default"]
+            return await self._call(default_model, system_prompt, user_prompt)
+
+    async def _call(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+    ) -> str:
+        """One LLM call — streamed to the ``stream()`` consumer when one is attached.
+
+        Rate limits and unavailable models are raised before the first delta,
+        so the fallbacks above never follow a partially streamed response.
+        """
+        if self._on_delta is None:
             return await self._openrouter.generate_with_system(
-                model=default_model,
+                model=model_id,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
             )
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        parts: list[str] = []
+        async for delta in self._openrouter.stream(
+            model_id, messages, temperature=temperature, max_tokens=max_tokens,
+        ):
+            parts.append(delta)
+            self._on_delta(delta)
+        return "".join(parts)
 
     @staticmethod
     def _format_game_context(ctx: dict) -> str:
@@ -771,12 +821,11 @@ class GenerationService:
 
     async def _get_simulation_name(self) -> str:
         """Get the simulation name from the database."""
-        response = (
+        response = await run_query(
             self._supabase.table("simulations")
             .select("name")
             .eq("id", str(self._simulation_id))
             .limit(1)
-            .execute()
         )
         if response and response.data:
             return response.data[0].get("name", "Unknown Simulation")
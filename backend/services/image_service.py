@@ -9,6 +9,7 @@ from uuid import UUID, uuid4
 from backend.services.external.replicate import ReplicateService
 from backend.services.generation_service import GenerationService
 from backend.services.model_resolver import ModelResolver
+from backend.utils.db import run_blocking, run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -91,9 +92,9 @@ class ImageService:
         )
 
         # 5. Update agent record
-        self._supabase.table("agents").update(
+        await run_query(self._supabase.table("agents").update(
             {"portrait_image_url": url},
-        ).eq("id", str(agent_id)).execute()
+        ).eq("id", str(agent_id)))
 
         logger.info("Portrait uploaded", extra={"entity_type": "agent", "entity_id": str(agent_id), "path": url})
         return url
@@ -157,9 +158,9 @@ class ImageService:
         )
 
         # 5. Update building record
-        self._supabase.table("buildings").update(
+        await run_query(self._supabase.table("buildings").update(
             {"image_url": url},
-        ).eq("id", str(building_id)).execute()
+        ).eq("id", str(building_id)))
 
         logger.info("Image uploaded", extra={"entity_type": "building", "entity_id": str(building_id), "path": url})
         return url
@@ -201,9 +202,9 @@ class ImageService:
             raw_bytes=raw_bytes,
         )
 
-        self._supabase.table("simulations").update(
+        await run_query(self._supabase.table("simulations").update(
             {"banner_url": url},
-        ).eq("id", str(self._simulation_id)).execute()
+        ).eq("id", str(self._simulation_id)))
 
         logger.info(
             "Banner uploaded",
@@ -280,12 +281,11 @@ class ImageService:
             )
 
         # Fetch embassy record
-        embassy_resp = (
+        embassy_resp = await run_query(
             self._supabase.table("embassies")
             .select("*")
             .eq("id", str(embassy_id))
             .limit(1)
-            .execute()
         )
         if not embassy_resp.data:
             logger.warning("Embassy %s not found — falling back to standard", embassy_id)
@@ -310,25 +310,23 @@ class ImageService:
                 partner_sim_id = embassy["simulation_a_id"]
 
         # Fetch partner simulation name
-        partner_resp = (
+        partner_resp = await run_query(
             self._supabase.table("simulations")
             .select("name")
             .eq("id", str(partner_sim_id))
             .limit(1)
-            .execute()
         )
         partner_name = (
             partner_resp.data[0]["name"] if partner_resp.data else "Unknown"
         )
 
         # Fetch partner style prompt
-        partner_style_resp = (
+        partner_style_resp = await run_query(
             self._supabase.table("simulation_settings")
             .select("setting_value")
             .eq("simulation_id", str(partner_sim_id))
             .eq("setting_key", "ai.image_style_prompt_building")
             .limit(1)
-            .execute()
         )
         partner_theme = (
             partner_style_resp.data[0]["setting_value"]
@@ -336,13 +334,12 @@ class ImageService:
         )
 
         # Fetch our own style prompt for the template
-        own_style_resp = (
+        own_style_resp = await run_query(
             self._supabase.table("simulation_settings")
             .select("setting_value")
             .eq("simulation_id", str(self._simulation_id))
             .eq("setting_key", "ai.image_style_prompt_building")
             .limit(1)
-            .execute()
         )
         own_theme = (
             own_style_resp.data[0]["setting_value"]
@@ -366,7 +363,7 @@ class ImageService:
         """Fetch embassy context and generate an ambassador portrait description."""
         # Find the first embassy this agent is associated with via embassy_metadata
         # Ambassadors are named in embassy_metadata.ambassador_a/b.name
-        embassy_resp = (
+        embassy_resp = await run_query(
             self._supabase.table("embassies")
             .select("*")
             .or_(
@@ -375,7 +372,6 @@ class ImageService:
             )
             .eq("status", "active")
             .limit(1)
-            .execute()
         )
 
         if not embassy_resp.data:
@@ -398,25 +394,23 @@ class ImageService:
             partner_sim_id = embassy["simulation_a_id"]
 
         # Fetch partner simulation name
-        partner_resp = (
+        partner_resp = await run_query(
             self._supabase.table("simulations")
             .select("name")
             .eq("id", str(partner_sim_id))
             .limit(1)
-            .execute()
         )
         partner_name = (
             partner_resp.data[0]["name"] if partner_resp.data else "Unknown"
         )
 
         # Fetch partner style prompt (portrait)
-        partner_style_resp = (
+        partner_style_resp = await run_query(
             self._supabase.table("simulation_settings")
             .select("setting_value")
             .eq("simulation_id", str(partner_sim_id))
             .eq("setting_key", "ai.image_style_prompt_portrait")
             .limit(1)
-            .execute()
         )
         partner_theme = (
             partner_style_resp.data[0]["setting_value"]
@@ -424,13 +418,12 @@ class ImageService:
         )
 
         # Fetch our own style prompt
-        own_style_resp = (
+        own_style_resp = await run_query(
             self._supabase.table("simulation_settings")
             .select("setting_value")
             .eq("simulation_id", str(self._simulation_id))
             .eq("setting_key", "ai.image_style_prompt_portrait")
             .limit(1)
-            .execute()
         )
         own_theme = (
             own_style_resp.data[0]["setting_value"]
@@ -481,13 +474,10 @@ class ImageService:
         data: bytes,
     ) -> str:
         """Upload file to Supabase Storage and return the public URL."""
-        self._supabase.storage.from_(bucket).upload(
-            path,
-            data,
-            {"content-type": "image/avif"},
-        )
+        storage = self._supabase.storage.from_(bucket)
+        await run_blocking(storage.upload, path, data, {"content-type": "image/avif"})
 
-        result = self._supabase.storage.from_(bucket).get_public_url(path)
+        result = await run_blocking(storage.get_public_url, path)
         return result
 
 
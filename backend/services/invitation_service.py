@@ -7,6 +7,7 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,7 @@ class InvitationService:
         token = secrets.token_urlsafe(32)
         expires_at = datetime.now(UTC) + timedelta(hours=expires_in_hours)
 
-        response = (
+        response = await run_query(
             supabase.table("simulation_invitations")
             .insert({
                 "simulation_id": str(simulation_id),
@@ -39,7 +40,6 @@ class InvitationService:
                 "invited_by_id": str(invited_by_id),
                 "expires_at": expires_at.isoformat(),
             })
-            .execute()
         )
 
         if not response.data:
@@ -53,12 +53,11 @@ class InvitationService:
     @staticmethod
     async def get_by_token(supabase: Client, token: str) -> dict:
         """Validate and return an invitation by token."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_invitations")
             .select("*, simulations(name)")
             .eq("invite_token", token)
             .limit(1)
-            .execute()
         )
 
         if not response or not response.data:
@@ -76,13 +75,12 @@ class InvitationService:
     ) -> dict:
         """Accept an invitation — creates a member and marks invitation as accepted."""
         # Fetch invitation
-        inv_response = (
+        inv_response = await run_query(
             supabase.table("simulation_invitations")
             .select("*")
             .eq("invite_token", token)
             .is_("accepted_at", "null")
             .limit(1)
-            .execute()
         )
 
         if not inv_response or not inv_response.data:
@@ -103,7 +101,7 @@ class InvitationService:
             )
 
         # Create member
-        member_response = (
+        member_response = await run_query(
             supabase.table("simulation_members")
             .insert({
                 "simulation_id": invitation["simulation_id"],
@@ -111,7 +109,6 @@ class InvitationService:
                 "member_role": invitation["invited_role"],
                 "invited_by_id": invitation["invited_by_id"],
             })
-            .execute()
         )
 
         if not member_response.data:
@@ -121,9 +118,9 @@ class InvitationService:
             )
 
         # Mark invitation as accepted
-        supabase.table("simulation_invitations").update({
+        await run_query(supabase.table("simulation_invitations").update({
             "accepted_at": datetime.now(UTC).isoformat(),
-        }).eq("id", invitation["id"]).execute()
+        }).eq("id", invitation["id"]))
 
         logger.info(
             "Invitation accepted",
@@ -137,11 +134,10 @@ class InvitationService:
         simulation_id: UUID,
     ) -> list[dict]:
         """List all invitations for a simulation."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_invitations")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
@@ -8,7 +8,9 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services import public_cache
 from backend.services.translation_service import null_de_fields_for_update, schedule_auto_translation
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -29,13 +31,12 @@ class LoreService:
         sim_id = str(simulation_id)
 
         # Get next sort_order
-        existing = (
+        existing = await run_query(
             supabase.table(TABLE)
             .select("sort_order")
             .eq("simulation_id", sim_id)
             .order("sort_order", desc=True)
             .limit(1)
-            .execute()
         )
         next_order = (existing.data[0]["sort_order"] + 1) if existing.data else 0
 
@@ -45,7 +46,7 @@ class LoreService:
             "sort_order": next_order,
         }
 
-        response = supabase.table(TABLE).insert(insert_data).execute()
+        response = await run_query(supabase.table(TABLE).insert(insert_data))
 
         if not response.data:
             raise HTTPException(
@@ -54,14 +55,14 @@ class LoreService:
             )
 
         section = response.data[0]
+        public_cache.invalidate_simulation(simulation_id)
 
         # Auto-translate in background
-        sim = (
+        sim = await run_query(
             supabase.table("simulations")
             .select("name, theme")
             .eq("id", sim_id)
             .maybe_single()
-            .execute()
         )
         if sim.data:
             schedule_auto_translation(
@@ -98,12 +99,11 @@ class LoreService:
         if de_nulls:
             update_data.update(de_nulls)
 
-        response = (
+        response = await run_query(
             supabase.table(TABLE)
             .update(update_data)
             .eq("simulation_id", sim_id)
             .eq("id", str(section_id))
-            .execute()
         )
 
         if not response.data:
@@ -113,15 +113,15 @@ class LoreService:
             )
 
         section = response.data[0]
+        public_cache.invalidate_simulation(simulation_id)
 
         # Re-translate in background if EN fields changed
         if de_nulls:
-            sim = (
+            sim = await run_query(
                 supabase.table("simulations")
                 .select("name, theme")
                 .eq("id", sim_id)
                 .maybe_single()
-                .execute()
             )
             if sim.data:
                 schedule_auto_translation(
@@ -145,12 +145,11 @@ class LoreService:
         """Delete a lore section and re-sort remaining sections."""
         sim_id = str(simulation_id)
 
-        response = (
+        response = await run_query(
             supabase.table(TABLE)
             .delete()
             .eq("simulation_id", sim_id)
             .eq("id", str(section_id))
-            .execute()
         )
 
         if not response.data:
@@ -160,16 +159,16 @@ class LoreService:
             )
 
         # Re-sort remaining sections
-        remaining = (
+        remaining = await run_query(
             supabase.table(TABLE)
             .select("id")
             .eq("simulation_id", sim_id)
             .order("sort_order")
-            .execute()
         )
         for i, row in enumerate(remaining.data or []):
-            supabase.table(TABLE).update({"sort_order": i}).eq("id", row["id"]).execute()
+            await run_query(supabase.table(TABLE).update({"sort_order": i}).eq("id", row["id"]))
 
+        public_cache.invalidate_simulation(simulation_id)
         return response.data[0]
 
     @staticmethod
@@ -182,16 +181,16 @@ class LoreService:
         sim_id = str(simulation_id)
 
         for i, sid in enumerate(section_ids):
-            supabase.table(TABLE).update({"sort_order": i}).eq(
+            await run_query(supabase.table(TABLE).update({"sort_order": i}).eq(
                 "simulation_id", sim_id
-            ).eq("id", str(sid)).execute()
+            ).eq("id", str(sid)))
+        public_cache.invalidate_simulation(simulation_id)
 
         # Return updated list
-        response = (
+        response = await run_query(
             supabase.table(TABLE)
             .select("*")
             .eq("simulation_id", sim_id)
             .order("sort_order")
-            .execute()
         )
         return response.data or []
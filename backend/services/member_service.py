@@ -8,6 +8,8 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services import membership_cache
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -38,11 +40,10 @@ class MemberService:
         user_id: UUID,
     ) -> list[dict]:
         """Get all simulation memberships for a user, including simulation names."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select("simulation_id, member_role, simulations(name, slug)")
             .eq("user_id", str(user_id))
-            .execute()
         )
         return response.data or []
 
@@ -53,12 +54,11 @@ class MemberService:
         simulation_id: UUID,
     ) -> list[dict]:
         """List all members of a simulation, owners first."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .order("member_role", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -72,7 +72,7 @@ class MemberService:
         invited_by_id: UUID,
     ) -> dict:
         """Add a new member to a simulation."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .insert({
                 "simulation_id": str(simulation_id),
@@ -80,7 +80,6 @@ class MemberService:
                 "member_role": member_role,
                 "invited_by_id": str(invited_by_id),
             })
-            .execute()
         )
 
         if not response.data:
@@ -107,7 +106,7 @@ class MemberService:
         Raises ``LastOwnerError`` if the DB trigger prevents the change.
         """
         try:
-            response = (
+            response = await run_query(
                 supabase.table(cls.table_name)
                 .update({
                     "member_role": member_role,
@@ -115,7 +114,6 @@ class MemberService:
                 })
                 .eq("simulation_id", str(simulation_id))
                 .eq("id", str(member_id))
-                .execute()
             )
         except Exception as e:
             try:
@@ -133,6 +131,7 @@ class MemberService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Member '{member_id}' not found.",
             )
+        membership_cache.invalidate_simulation(simulation_id)
         logger.info(
             "Member role changed",
             extra={"member_id": str(member_id), "simulation_id": str(simulation_id), "new_role": member_role},
@@ -151,12 +150,11 @@ class MemberService:
         Raises ``LastOwnerError`` if the DB trigger prevents removal.
         """
         try:
-            response = (
+            response = await run_query(
                 supabase.table(cls.table_name)
                 .delete()
                 .eq("simulation_id", str(simulation_id))
                 .eq("id", str(member_id))
-                .execute()
             )
         except Exception as e:
             try:
@@ -174,4 +172,5 @@ class MemberService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Member '{member_id}' not found.",
             )
+        membership_cache.invalidate_simulation(simulation_id)
         logger.info("Member removed", extra={"member_id": str(member_id), "simulation_id": str(simulation_id)})
@@ -0,0 +1,195 @@
+"""In-process cache for simulation membership and epoch participation lookups.
+
+Role checks (``require_role``, ``require_simulation_member``,
+``require_owner_or_platform_admin``) and ``require_epoch_participant`` are the
+most frequent queries the platform runs, and many endpoints stack two of them.
+
+Two tiers:
+- Per-request memo (ContextVar, reset by ``LoggingContextMiddleware``) — a
+  second check in the same request never hits the DB, including misses.
+- Cross-request TTL cache keyed by (user_id, simulation_id) — positive results
+  only, so a freshly added member is never rejected by a stale miss.
+
+Writes that revoke or change access (MemberService, AdminUserService,
+EpochService.leave_epoch) call the ``invalidate_*`` helpers. Other workers
+converge within ``cache_membership_ttl`` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextvars import ContextVar
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from backend.services.cache_config import get_ttl
+from backend.utils.db import run_query
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Per-request memo: key → role / participant row / None (miss)
+_request_memo: ContextVar[dict | None] = ContextVar("membership_request_memo", default=None)
+
+# (user_id, simulation_id) → member_role
+_roles: TTLCache = TTLCache(maxsize=4096, ttl=get_ttl("cache_membership_ttl"))
+# (user_id, epoch_id, simulation_id) → participant row
+_participants: TTLCache = TTLCache(maxsize=4096, ttl=get_ttl("cache_membership_ttl"))
+
+_stats: dict[str, int] = {
+    "request_hits": 0,
+    "hits": 0,
+    "misses": 0,
+    "invalidations": 0,
+}
+
+
+def begin_request() -> None:
+    """Start a fresh per-request memo (called once per HTTP request)."""
+    _request_memo.set({})
+
+
+def _memo() -> dict:
+    memo = _request_memo.get()
+    if memo is None:
+        memo = {}
+        _request_memo.set(memo)
+    return memo
+
+
+async def get_member_role(
+    supabase: Client,
+    simulation_id: UUID | str,
+    user_id: UUID | str,
+) -> str | None:
+    """Return the user's ``member_role`` in a simulation, or None if not a member."""
+    key = ("role", str(user_id), str(simulation_id))
+    memo = _memo()
+    cached = memo.get(key, _MISSING)
+    if cached is not _MISSING:
+        _stats["request_hits"] += 1
+        return cached
+
+    role = _roles.get(key[1:])
+    if role is not None:
+        _stats["hits"] += 1
+        memo[key] = role
+        return role
+
+    _stats["misses"] += 1
+    response = await run_query(
+        supabase.table("simulation_members")
+        .select("member_role")
+        .eq("simulation_id", str(simulation_id))
+        .eq("user_id", str(user_id))
+        .limit(1)
+    )
+    rows = response.data if response and response.data else None
+    member = rows[0] if isinstance(rows, list) else rows
+    role = member["member_role"] if member else None
+
+    memo[key] = role
+    if role is not None:
+        _roles[key[1:]] = role
+    return role
+
+
+async def get_epoch_participant(
+    supabase: Client,
+    epoch_id: UUID | str,
+    simulation_id: UUID | str,
+    user_id: UUID | str,
+) -> dict | None:
+    """Return the user's participant row for (epoch, simulation), or None.
+
+    The cached row's ``current_rp`` may lag by up to the TTL — read RP fresh
+    before spending it.
+    """
+    key = ("participant", str(user_id), str(epoch_id), str(simulation_id))
+    memo = _memo()
+    cached = memo.get(key, _MISSING)
+    if cached is not _MISSING:
+        _stats["request_hits"] += 1
+        return cached
+
+    row = _participants.get(key[1:])
+    if row is not None:
+        _stats["hits"] += 1
+        memo[key] = row
+        return row
+
+    _stats["misses"] += 1
+    response = await run_query(
+        supabase.table("epoch_participants")
+        .select("id, simulation_id, user_id, current_rp")
+        .eq("epoch_id", str(epoch_id))
+        .eq("simulation_id", str(simulation_id))
+        .eq("user_id", str(user_id))
+        .limit(1)
+    )
+    row = response.data[0] if response.data else None
+
+    memo[key] = row
+    if row is not None:
+        _participants[key[1:]] = row
+    return row
+
+
+def invalidate_member(simulation_id: UUID | str, user_id: UUID | str) -> None:
+    """Drop one user's cached role in a simulation."""
+    _stats["invalidations"] += 1
+    _roles.pop((str(user_id), str(simulation_id)), None)
+    _drop_from_memo(lambda k: k[0] == "role" and k[1] == str(user_id) and k[2] == str(simulation_id))
+
+
+def invalidate_simulation(simulation_id: UUID | str) -> None:
+    """Drop every cached role for a simulation (member_id-based writes)."""
+    _stats["invalidations"] += 1
+    sim = str(simulation_id)
+    for key in [k for k in list(_roles.keys()) if k[1] == sim]:
+        _roles.pop(key, None)
+    _drop_from_memo(lambda k: k[0] == "role" and k[2] == sim)
+
+
+def invalidate_epoch_participant(epoch_id: UUID | str, user_id: UUID | str | None = None) -> None:
+    """Drop cached participant rows for an epoch (optionally one user only)."""
+    _stats["invalidations"] += 1
+    epoch = str(epoch_id)
+    user = str(user_id) if user_id is not None else None
+    for key in [k for k in list(_participants.keys()) if k[1] == epoch and (user is None or k[0] == user)]:
+        _participants.pop(key, None)
+    _drop_from_memo(lambda k: k[0] == "participant" and k[2] == epoch and (user is None or k[1] == user))
+
+
+def _drop_from_memo(predicate) -> None:
+    memo = _request_memo.get()
+    if memo:
+        for key in [k for k in memo if predicate(k)]:
+            del memo[key]
+
+
+def get_stats() -> dict:
+    """Hit/miss counters and current cache sizes."""
+    lookups = _stats["request_hits"] + _stats["hits"] + _stats["misses"]
+    return {
+        **_stats,
+        "hit_rate": round((_stats["request_hits"] + _stats["hits"]) / lookups, 4) if lookups else 0.0,
+        "cached_roles": len(_roles),
+        "cached_participants": len(_participants),
+    }
+
+
+def clear() -> None:
+    """Empty both tiers and reset counters (admin TTL change, tests).
+
+    The TTL caches are rebuilt so a changed ``cache_membership_ttl`` applies.
+    """
+    global _roles, _participants  # noqa: PLW0603
+    _roles = TTLCache(maxsize=4096, ttl=get_ttl("cache_membership_ttl"))
+    _participants = TTLCache(maxsize=4096, ttl=get_ttl("cache_membership_ttl"))
+    _request_memo.set(None)
+    for key in _stats:
+        _stats[key] = 0
@@ -0,0 +1,207 @@
+"""In-process retrieval index for agent memories.
+
+``AgentMemoryService.retrieve`` runs on every chat turn. Instead of the
+``retrieve_agent_memories`` RPC plus a synchronous ``last_accessed_at``
+update, it scores memories against an index kept warm in memory:
+
+- ``get_index()`` loads an agent's memories (embeddings as a float32 matrix
+  of unit rows) once and shares the load between concurrent callers; the
+  index is served for ``INDEX_TTL`` seconds and refreshed in the background
+  after that (picks up writes from other workers).
+- ``add_memories()`` appends freshly stored memories to a warm index.
+- ``MemoryIndex.search()`` computes the same score as migration 067 —
+  0.4 × cosine similarity + 0.4 × importance/10 + 0.2 × recency decay —
+  vectorized over all of the agent's memories. Agents hold tens to hundreds
+  of memories, so one exact matrix-vector product is cheaper than
+  maintaining an approximate (HNSW/IVF) structure.
+- ``touch()`` queues retrieved ids; one ``last_accessed_at`` update per
+  ``FLUSH_DELAY`` seconds writes them behind the chat response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from uuid import UUID
+
+import numpy as np
+
+from backend.services.embedding_service import EMBEDDING_DIMS
+from backend.utils.db import fetch_all, run_query
+from backend.utils.single_flight import SingleFlight
+from backend.utils.supabase_pool import get_admin_client
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+INDEX_TTL = 300  # Seconds before a warm index is refreshed in the background
+INDEX_MAXSIZE = 512  # Agents kept warm
+LOAD_PAGE_SIZE = 200  # Rows per page (each carries a 1536-dim embedding)
+FLUSH_DELAY = 2.0  # Seconds touched ids are collected before one write
+FLUSH_CHUNK = 500  # Ids per last_accessed_at update
+
+SIMILARITY_WEIGHT = 0.4
+IMPORTANCE_WEIGHT = 0.4
+RECENCY_WEIGHT = 0.2
+
+RESULT_FIELDS = ("id", "memory_type", "content", "content_de", "importance", "source_type", "created_at")
+
+_index_flight = SingleFlight("agent_memory_index", ttl=INDEX_TTL, stale_factor=12, maxsize=INDEX_MAXSIZE)
+_writer: AccessWriter | None = None
+
+
+def _unit_vector(values: Sequence[float] | str | None, dims: int = EMBEDDING_DIMS) -> np.ndarray | None:
+    """float32 unit vector of an embedding (pgvector text or list); None if absent, zero or mis-sized."""
+    if values is None:
+        return None
+    if isinstance(values, str):
+        values = json.loads(values)
+    vector = np.asarray(values, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if vector.shape != (dims,) or norm == 0:
+        return None
+    return vector / norm
+
+
+def _timestamp(value: str | datetime) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+class MemoryIndex:
+    """One agent's memories: result rows plus a unit-vector matrix, importances and creation times."""
+
+    def __init__(self, dims: int = EMBEDDING_DIMS) -> None:
+        self.dims = dims
+        self._rows: list[dict] = []
+        self._vectors = np.zeros((0, dims), dtype=np.float32)  # Zero rows for memories without embedding
+        self._importance = np.zeros(0, dtype=np.float32)
+        self._created = np.zeros(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add_many(self, rows: list[dict], embeddings: Sequence[Sequence[float] | str | None]) -> None:
+        if not rows:
+            return
+        vectors = np.zeros((len(rows), self.dims), dtype=np.float32)
+        for i, embedding in enumerate(embeddings):
+            unit = _unit_vector(embedding, self.dims)
+            if unit is not None:
+                vectors[i] = unit
+        self._rows.extend({field: row.get(field) for field in RESULT_FIELDS} for row in rows)
+        self._vectors = np.vstack((self._vectors, vectors))
+        self._importance = np.concatenate((self._importance, [row["importance"] for row in rows]))
+        self._created = np.concatenate((self._created, [_timestamp(row["created_at"]) for row in rows]))
+
+    def search(self, query: Sequence[float] | None, top_k: int = 10, now: float | None = None) -> list[dict]:
+        """The ``top_k`` memories by retrieval score (same shape as the retrieve_agent_memories RPC)."""
+        if not self._rows or top_k <= 0:
+            return []
+        now = time.time() if now is None else now
+        scores = (
+            IMPORTANCE_WEIGHT * (self._importance / 10.0)
+            + RECENCY_WEIGHT / (1.0 + (now - self._created) / 86400.0)
+        )
+        unit_query = _unit_vector(query, self.dims)
+        if unit_query is not None:
+            scores = scores + SIMILARITY_WEIGHT * (self._vectors @ unit_query)
+
+        k = min(top_k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [{**self._rows[i], "retrieval_score": float(scores[i])} for i in best]
+
+
+async def get_index(supabase: Client, simulation_id: UUID | str, agent_id: UUID | str) -> MemoryIndex:
+    """The agent's warm index, loading it on first use."""
+
+    async def _load() -> MemoryIndex:
+        rows = await fetch_all(
+            lambda: supabase.table("agent_memories")
+            .select(", ".join((*RESULT_FIELDS, "embedding")))
+            .eq("agent_id", str(agent_id))
+            .eq("simulation_id", str(simulation_id))
+            .order("id"),
+            page_size=LOAD_PAGE_SIZE,
+        )
+        index = MemoryIndex()
+        index.add_many(rows, [row.get("embedding") for row in rows])
+        return index
+
+    return await _index_flight.get((str(simulation_id), str(agent_id)), _load)
+
+
+def add_memories(
+    simulation_id: UUID | str,
+    agent_id: UUID | str,
+    rows: list[dict],
+    embeddings: list[Sequence[float]],
+) -> None:
+    """Append stored memories to the agent's index if it is warm (otherwise the next load sees them)."""
+    index = _index_flight.peek((str(simulation_id), str(agent_id)))
+    if index is not None:
+        index.add_many(rows, embeddings)
+
+
+class AccessWriter:
+    """Write-behind buffer for ``last_accessed_at``: one update per flush for all touched ids."""
+
+    def __init__(self, delay: float = FLUSH_DELAY) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._delay = delay
+        self._pending: set[str] = set()
+        self._scheduled = False
+        self._flushes: set[asyncio.Task] = set()
+
+    def touch(self, memory_ids: list[str]) -> None:
+        self._pending.update(memory_ids)
+        if self._pending and not self._scheduled:
+            self._scheduled = True
+            self.loop.call_later(self._delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        task = self.loop.create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self) -> None:
+        """Write every pending id now."""
+        self._scheduled = False
+        ids, self._pending = sorted(self._pending), set()
+        accessed_at = datetime.now(UTC).isoformat()
+        for start in range(0, len(ids), FLUSH_CHUNK):
+            chunk = ids[start:start + FLUSH_CHUNK]
+            try:
+                await run_query(
+                    get_admin_client().table("agent_memories")
+                    .update({"last_accessed_at": accessed_at})
+                    .in_("id", chunk)
+                )
+            except Exception:
+                logger.warning("Failed to record memory access", extra={"memories": len(chunk)}, exc_info=True)
+
+
+def _access_writer() -> AccessWriter:
+    """The write-behind buffer of the running event loop (created on first use)."""
+    global _writer  # noqa: PLW0603
+    if _writer is None or _writer.loop is not asyncio.get_running_loop():
+        _writer = AccessWriter()
+    return _writer
+
+
+def touch(memory_ids: list[str]) -> None:
+    """Queue ``last_accessed_at`` updates for retrieved memories."""
+    if memory_ids:
+        _access_writer().touch(memory_ids)
+
+
+async def flush() -> None:
+    """Write queued ``last_accessed_at`` updates now (shutdown, tests)."""
+    if _writer is not None and _writer.loop is asyncio.get_running_loop():
+        await _writer.flush()
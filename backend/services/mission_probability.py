@@ -0,0 +1,194 @@
+"""Mission success probability — pure formula plus the deployment-context loader.
+
+``fn_deployment_context`` (migration 083) returns every input of the formula
+in one round-trip: aptitudes, target zone security, guardian counts, embassy
+infiltration state and the three resonance modifiers. ``build_contexts`` turns
+that payload into ``DeploymentContext`` values, and ``success_probability`` is
+a side-effect-free function over a context, shared by ``OperativeService.deploy``,
+the probability preview endpoint and offline tooling.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from backend.utils.db import run_query
+from supabase import Client
+
+# Security level → numeric value for success probability
+SECURITY_LEVEL_MAP: dict[str, float] = {
+    "fortress": 10.0,
+    "maximum": 10.0,
+    "high": 8.5,
+    "guarded": 7.0,
+    "moderate": 5.5,
+    "medium": 5.5,
+    "low": 4.0,
+    "lawless": 2.0,
+    "contested": 3.0,
+}
+
+BASE_PROBABILITY = 0.55
+DEFAULT_APTITUDE = 6
+DEFAULT_ZONE_SECURITY = 5.0  # No target zone (or unknown level)
+NO_EMBASSY_EFFECTIVENESS = 0.5
+EMBASSY_EFFECTIVENESS = 0.6
+GUARDIAN_PENALTY_EACH = 0.06
+GUARDIAN_PENALTY_CAP = 0.15
+MIN_PROBABILITY = 0.05
+MAX_PROBABILITY = 0.95
+
+
+@dataclass(frozen=True)
+class DeploymentContext:
+    """Every input of the success formula for one agent → target deployment."""
+
+    aptitude: int = DEFAULT_APTITUDE
+    zone_security_level: str | None = None
+    guardian_count: int = 0
+    has_embassy: bool = False
+    infiltration_penalty: float = 0.0
+    infiltration_penalty_expires_at: datetime | None = None
+    zone_pressure: float = 0.0
+    resonance_modifier: float = 0.0
+    attacker_pressure_penalty: float = 0.0
+    embassy_id: str | None = None
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+
+
+def infiltration_penalty_expired(ctx: DeploymentContext, now: datetime | None = None) -> bool:
+    """True if the embassy carries an infiltration penalty whose window has passed."""
+    if ctx.infiltration_penalty <= 0 or ctx.infiltration_penalty_expires_at is None:
+        return False
+    return ctx.infiltration_penalty_expires_at <= (now or datetime.now(UTC))
+
+
+def embassy_effectiveness(ctx: DeploymentContext, now: datetime | None = None) -> float:
+    """0.6 through an embassy (reduced by an active infiltration penalty), 0.5 without one."""
+    if not ctx.has_embassy:
+        return NO_EMBASSY_EFFECTIVENESS
+    if ctx.infiltration_penalty > 0 and ctx.infiltration_penalty_expires_at is not None:
+        if not infiltration_penalty_expired(ctx, now):
+            return EMBASSY_EFFECTIVENESS * (1.0 - ctx.infiltration_penalty)
+    return EMBASSY_EFFECTIVENESS
+
+
+def success_probability(ctx: DeploymentContext, now: datetime | None = None) -> float:
+    """Calculate mission success probability.
+
+    Formula:
+      base = 0.55
+      + agent_aptitude × 0.03
+      - target_zone_security × 0.05
+      - min(0.15, guardian_count × 0.06)
+      + embassy_effectiveness × 0.15
+      + resonance_pressure (0.00 to +0.04)
+      + resonance_operative_mod (-0.04 to +0.04)
+      + attacker_pressure_penalty (-0.04 to 0.00)
+      Clamped to [0.05, 0.95]
+
+    Aptitude range 3-9 → contribution +0.09 to +0.27 (18pp swing).
+    """
+    zone_security = (
+        SECURITY_LEVEL_MAP.get(ctx.zone_security_level, DEFAULT_ZONE_SECURITY)
+        if ctx.zone_security_level
+        else DEFAULT_ZONE_SECURITY
+    )
+    guardian_penalty = min(GUARDIAN_PENALTY_CAP, ctx.guardian_count * GUARDIAN_PENALTY_EACH)
+
+    probability = (
+        BASE_PROBABILITY
+        + ctx.aptitude * 0.03
+        - zone_security * 0.05
+        - guardian_penalty
+        + embassy_effectiveness(ctx, now) * 0.15
+        + ctx.zone_pressure
+        + ctx.resonance_modifier
+        + ctx.attacker_pressure_penalty
+    )
+    return max(MIN_PROBABILITY, min(MAX_PROBABILITY, probability))
+
+
+# ── Loader ────────────────────────────────────────────────
+
+
+async def fetch_deployment_context(
+    admin: Client,
+    source_simulation_id: UUID | str,
+    operative_types: list[str],
+    *,
+    target_simulation_ids: list[UUID | str] | None = None,
+    agent_ids: list[UUID | str] | None = None,
+    target_zone_id: UUID | str | None = None,
+    embassy_id: UUID | str | None = None,
+) -> dict:
+    """Call ``fn_deployment_context`` and return its raw JSON payload.
+
+    Uses the admin client: target zones, guardians and embassies may live in
+    a game instance the user's JWT cannot read through RLS.
+    """
+    resp = await run_query(admin.rpc("fn_deployment_context", {
+        "p_source_simulation_id": str(source_simulation_id),
+        "p_target_simulation_ids": [str(s) for s in target_simulation_ids or []],
+        "p_operative_types": list(operative_types),
+        "p_agent_ids": [str(a) for a in agent_ids] if agent_ids is not None else None,
+        "p_target_zone_id": str(target_zone_id) if target_zone_id else None,
+        "p_embassy_id": str(embassy_id) if embassy_id else None,
+    }))
+    return resp.data or {}
+
+
+def build_contexts(
+    payload: dict,
+    agent_ids: list[str],
+    operative_type: str,
+    target_simulation_ids: list[str | None],
+) -> dict[tuple[str, str | None], DeploymentContext]:
+    """Expand a ``fn_deployment_context`` payload into one context per (agent, target).
+
+    A ``None`` target (guardian self-deploy) gets no guardian or resonance
+    terms, matching the single-deploy rules. An embassy pinned by
+    ``embassy_id`` applies to every target.
+    """
+    aptitudes = {
+        str(row["agent_id"]): int(row["aptitude_level"])
+        for row in payload.get("aptitudes") or []
+        if row.get("operative_type") == operative_type
+    }
+    targets = {str(t["simulation_id"]): t for t in payload.get("targets") or []}
+    zone_security_level = payload.get("zone_security_level")
+    attacker_penalty = float(payload.get("attacker_pressure_penalty") or 0)
+
+    pinned_embassy = payload.get("embassy")
+
+    contexts: dict[tuple[str, str | None], DeploymentContext] = {}
+    for target_id in target_simulation_ids:
+        target = targets.get(str(target_id)) if target_id else None
+        embassy = pinned_embassy or (target or {}).get("embassy") or {}
+        shared = {
+            "has_embassy": bool(embassy),
+            "embassy_id": str(embassy["id"]) if embassy.get("id") else None,
+            "infiltration_penalty": float(embassy.get("infiltration_penalty") or 0),
+            "infiltration_penalty_expires_at": _parse_ts(embassy.get("infiltration_penalty_expires_at")),
+        }
+        if target_id:
+            shared |= {
+                "guardian_count": int(target.get("guardian_count") or 0) if target else 0,
+                "zone_pressure": float(target.get("zone_pressure") or 0) if target else 0.0,
+                "resonance_modifier": float(
+                    ((target or {}).get("resonance_modifiers") or {}).get(operative_type) or 0
+                ),
+                "attacker_pressure_penalty": attacker_penalty,
+            }
+        for agent_id in agent_ids:
+            contexts[(str(agent_id), str(target_id) if target_id else None)] = DeploymentContext(
+                aptitude=aptitudes.get(str(agent_id), DEFAULT_APTITUDE),
+                zone_security_level=zone_security_level,
+                **shared,
+            )
+    return contexts
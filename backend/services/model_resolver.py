@@ -6,6 +6,8 @@ import logging
 from dataclasses import dataclass
 from uuid import UUID
 
+from backend.services import ai_config_cache
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -172,33 +174,36 @@ class ModelResolver:
         self._settings_cache: dict[str, str] | None = None
 
     async def _load_settings(self) -> dict[str, str]:
-        """Load all AI-related settings for this simulation."""
-        if self._settings_cache is not None:
-            return self._settings_cache
+        """Load all AI-related settings for this simulation (cached process-wide)."""
+        if self._settings_cache is None:
+            self._settings_cache = await ai_config_cache.get_or_load(
+                "ai_settings", self._simulation_id, (), self._query_settings,
+            )
+        return self._settings_cache
 
-        response = (
+    async def _query_settings(self) -> dict[str, str]:
+        response = await run_query(
             self._supabase.table("simulation_settings")
             .select("setting_key, setting_value")
             .eq("simulation_id", str(self._simulation_id))
             .eq("category", "ai")
-            .execute()
         )
 
-        self._settings_cache = {}
+        ai_settings: dict[str, str] = {}
         for row in response.data or []:
             key = row["setting_key"]
             value = row["setting_value"]
             # Strip surrounding quotes from JSON string values
             if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
-                self._settings_cache[key] = value[1:-1]
+                ai_settings[key] = value[1:-1]
             elif isinstance(value, str):
-                self._settings_cache[key] = value
+                ai_settings[key] = value
             elif isinstance(value, dict | list):
-                self._settings_cache[key] = str(value)
+                ai_settings[key] = str(value)
             else:
-                self._settings_cache[key] = str(value) if value is not None else ""
+                ai_settings[key] = str(value) if value is not None else ""
 
-        return self._settings_cache
+        return ai_settings
 
     async def resolve_text_model(self, purpose: str) -> ResolvedModel:
         """Resolve the best text model for the given purpose.
@@ -1,7 +1,9 @@
 """Operative deployment, resolution, and recall logic."""
 
+import asyncio
 import logging
-import secrets
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -9,25 +11,23 @@ from fastapi import HTTPException, status
 
 from backend.dependencies import get_admin_supabase
 from backend.models.epoch import OperativeDeploy
+from backend.services import epoch_replay
 from backend.services.battle_log_service import BattleLogService
-from backend.services.epoch_service import OPERATIVE_RP_COSTS, EpochService
+from backend.services.epoch_rng import RollRecorder, rng_for, roll_outcome
+from backend.services.epoch_service import OPERATIVE_RP_COSTS, EpochService, phase_boundaries
+from backend.services.mission_probability import (
+    SECURITY_LEVEL_MAP,  # noqa: F401 — re-exported for existing importers
+    DeploymentContext,
+    build_contexts,
+    fetch_deployment_context,
+    infiltration_penalty_expired,
+    success_probability,
+)
+from backend.utils.db import gather_queries, run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
 
-# Security level → numeric value for success probability
-SECURITY_LEVEL_MAP: dict[str, float] = {
-    "fortress": 10.0,
-    "maximum": 10.0,
-    "high": 8.5,
-    "guarded": 7.0,
-    "moderate": 5.5,
-    "medium": 5.5,
-    "low": 4.0,
-    "lawless": 2.0,
-    "contested": 3.0,
-}
-
 # Deploy time in cycles per operative type
 DEPLOY_CYCLES: dict[str, int] = {
     "spy": 0,
@@ -74,6 +74,14 @@ SECURITY_DOWNGRADE: dict[str, str] = {
 }
 
 
+# Building condition downgrade map (saboteur effect)
+BUILDING_CONDITION_DOWNGRADE: dict[str, str] = {
+    "good": "moderate",
+    "moderate": "poor",
+    "poor": "ruined",
+}
+
+
 def _downgrade_security(level: str) -> str:
     """Downgrade a security level by one tier (e.g., high → guarded)."""
     return SECURITY_DOWNGRADE.get(level, level)
@@ -100,6 +108,27 @@ def _upgrade_security(level: str) -> str:
     return level
 
 
+def _group_changes(before: dict, after: dict) -> dict:
+    """Group keys whose value changed by their new value: {new_value: [key, ...]}."""
+    groups: dict = defaultdict(list)
+    for key, value in after.items():
+        if before.get(key) != value:
+            groups[value].append(key)
+    return dict(groups)
+
+
+@dataclass
+class _ResolutionBatch:
+    """Epoch state shared by one set-based mission resolution pass."""
+
+    epoch_id: str
+    cycle: int
+    cycle_hours: int
+    now: datetime
+    rng: RollRecorder = field(default_factory=lambda: rng_for(None, 0, []))
+    log_entries: list[dict] = field(default_factory=list)
+
+
 class OperativeService:
     """Service for deploying, resolving, and recalling operatives."""
 
@@ -150,12 +179,11 @@ class OperativeService:
                     "Operatives must deploy through an embassy.",
                 )
             # Validate embassy exists and is active
-            embassy = (
+            embassy = await run_query(
                 supabase.table("embassies")
                 .select("id, status")
                 .eq("id", str(body.embassy_id))
                 .single()
-                .execute()
             )
             if not embassy.data or embassy.data.get("status") != "active":
                 raise HTTPException(
@@ -165,21 +193,17 @@ class OperativeService:
 
         # Check for betrayal (attacking an ally)
         if body.operative_type != "guardian" and body.target_simulation_id:
-            source_p = (
+            source_p, target_p = await gather_queries(
                 supabase.table("epoch_participants")
                 .select("team_id")
                 .eq("epoch_id", str(epoch_id))
                 .eq("simulation_id", str(simulation_id))
-                .maybe_single()
-                .execute()
-            )
-            target_p = (
+                .maybe_single(),
                 supabase.table("epoch_participants")
                 .select("team_id")
                 .eq("epoch_id", str(epoch_id))
                 .eq("simulation_id", str(body.target_simulation_id))
-                .maybe_single()
-                .execute()
+                .maybe_single(),
             )
             source_team = source_p.data.get("team_id") if source_p.data else None
             target_team = target_p.data.get("team_id") if target_p.data else None
@@ -192,30 +216,24 @@ class OperativeService:
                         "Betrayal is disabled in this epoch.",
                     )
 
-        # Validate agent belongs to simulation
-        agent = (
+        # Validate agent belongs to simulation and isn't already deployed
+        agent, existing = await gather_queries(
             supabase.table("agents")
             .select("id, simulation_id, name")
             .eq("id", str(body.agent_id))
             .eq("simulation_id", str(simulation_id))
-            .single()
-            .execute()
+            .single(),
+            supabase.table("operative_missions")
+            .select("id")
+            .eq("agent_id", str(body.agent_id))
+            .eq("epoch_id", str(epoch_id))
+            .in_("status", ["deploying", "active", "returning"]),
         )
         if not agent.data:
             raise HTTPException(
                 status.HTTP_404_NOT_FOUND,
                 "Agent not found in this simulation.",
             )
-
-        # Check agent isn't already deployed
-        existing = (
-            supabase.table("operative_missions")
-            .select("id")
-            .eq("agent_id", str(body.agent_id))
-            .eq("epoch_id", str(epoch_id))
-            .in_("status", ["deploying", "active", "returning"])
-            .execute()
-        )
         if existing.data:
             raise HTTPException(
                 status.HTTP_409_CONFLICT,
@@ -226,12 +244,9 @@ class OperativeService:
         cost = OPERATIVE_RP_COSTS.get(body.operative_type, 5)
         await EpochService.spend_rp(supabase, epoch_id, simulation_id, cost)
 
-        # Calculate success probability
-        success_prob = await cls._calculate_success_probability(
-            supabase,
-            body,
-            simulation_id,
-        )
+        # Calculate success probability (all inputs in one round-trip)
+        ctx = await cls._load_deployment_context(body, simulation_id)
+        success_prob = success_probability(ctx)
 
         # Calculate resolve time
         config = epoch.get("config", {})
@@ -261,7 +276,7 @@ class OperativeService:
             "resolves_at": resolves_at.isoformat(),
         }
 
-        resp = supabase.table("operative_missions").insert(mission_data).execute()
+        resp = await run_query(supabase.table("operative_missions").insert(mission_data))
         if not resp.data:
             raise HTTPException(
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -270,6 +285,9 @@ class OperativeService:
 
         mission = resp.data[0]
 
+        if infiltration_penalty_expired(ctx):
+            await cls._clear_infiltration_penalty(ctx.embassy_id)
+
         # Log deployment to battle log (both human and bot paths)
         try:
             await BattleLogService.log_operative_deployed(
@@ -283,180 +301,129 @@ class OperativeService:
     # ── Success Probability ───────────────────────────────
 
     @classmethod
-    async def _calculate_success_probability(
+    async def _load_deployment_context(
         cls,
-        supabase: Client,
         body: OperativeDeploy,
         source_simulation_id: UUID,
-    ) -> float:
-        """Calculate mission success probability.
-
-        Formula:
-          base = 0.55
-          + agent_aptitude × 0.03
-          - target_zone_security × 0.05
-          - min(0.15, guardian_count × 0.06)
-          + embassy_effectiveness × 0.15
-          + resonance_pressure (0.00 to +0.04)
-          + resonance_operative_mod (-0.04 to +0.04)
-          + attacker_pressure_penalty (-0.04 to 0.00)
-          Clamped to [0.05, 0.95]
-
-        Aptitude range 3-9 → contribution +0.09 to +0.27 (18pp swing).
-        """
-        from backend.services.aptitude_service import AptitudeService
-
-        base = 0.55
-
-        # Agent aptitude for this operative type (replaces qualification)
-        aptitude = await AptitudeService.get_aptitude_for_operative(
-            supabase, body.agent_id, body.operative_type
-        )
-
+    ) -> DeploymentContext:
+        """Load every success-probability input for one deployment in a single RPC."""
         # Admin client for cross-sim reads (target zones/guardians/embassies
         # may be in a game instance the user's JWT can't access via RLS)
         admin = await get_admin_supabase()
-
-        # Target zone security
-        zone_security = 5.0  # default moderate
-        if body.target_zone_id:
-            zone_resp = (
-                admin.table("zones")
-                .select("security_level")
-                .eq("id", str(body.target_zone_id))
-                .maybe_single()
-                .execute()
-            )
-            if zone_resp.data:
-                sec_level = zone_resp.data.get("security_level", "moderate")
-                zone_security = SECURITY_LEVEL_MAP.get(sec_level, 5.0)
-
-        # Guardian count in target simulation (guardians defend their own sim)
-        guardian_count = 0
-        if body.target_simulation_id:
-            guardians_resp = (
-                admin.table("operative_missions")
-                .select("id")
-                .eq("operative_type", "guardian")
-                .eq("source_simulation_id", str(body.target_simulation_id))
-                .in_("status", ["active"])
-                .execute()
-            )
-            guardian_count = len(guardians_resp.data or [])
-
-        # Embassy effectiveness — check for active infiltration penalty
-        embassy_eff = 0.5
-        if body.embassy_id:
-            emb_resp = (
-                admin.table("embassies")
-                .select("id, infiltration_penalty, infiltration_penalty_expires_at")
-                .eq("id", str(body.embassy_id))
-                .maybe_single()
-                .execute()
-            )
-            if emb_resp.data:
-                base_eff = 0.6
-                penalty = float(emb_resp.data.get("infiltration_penalty") or 0)
-                expires_at = emb_resp.data.get("infiltration_penalty_expires_at")
-                if penalty > 0 and expires_at:
-                    if datetime.fromisoformat(expires_at.replace("Z", "+00:00")) > datetime.now(UTC):
-                        base_eff *= (1.0 - penalty)
-                    else:
-                        # Penalty expired — clear it lazily
-                        admin.table("embassies").update({
-                            "infiltration_penalty": 0,
-                            "infiltration_penalty_expires_at": None,
-                        }).eq("id", str(body.embassy_id)).execute()
-                embassy_eff = base_eff
-
-        # Guardian penalty: -0.06 per guardian, capped at -0.15
-        guardian_penalty = min(0.15, guardian_count * 0.06)
-
-        # Resonance modifiers: zone pressure + archetype alignment + attacker penalty
-        resonance_pressure = 0.0
-        resonance_operative_mod = 0.0
-        attacker_pressure_penalty = 0.0
-        if body.target_simulation_id:
-            resonance_pressure = await cls._get_target_zone_pressure(
-                admin, str(body.target_simulation_id), body.target_zone_id
-            )
-            resonance_operative_mod = await cls._get_resonance_operative_modifier(
-                admin, str(body.target_simulation_id), body.operative_type
-            )
-            # Attacker's own instability reduces mission effectiveness
-            attacker_pressure_penalty = await cls._get_attacker_pressure_penalty(
-                admin, str(source_simulation_id)
-            )
-
-        probability = (
-            base
-            + aptitude * 0.03
-            - zone_security * 0.05
-            - guardian_penalty
-            + embassy_eff * 0.15
-            + resonance_pressure
-            + resonance_operative_mod
-            + attacker_pressure_penalty
+        target_id = str(body.target_simulation_id) if body.target_simulation_id else None
+        payload = await fetch_deployment_context(
+            admin,
+            source_simulation_id,
+            [body.operative_type],
+            target_simulation_ids=[target_id] if target_id else [],
+            agent_ids=[body.agent_id],
+            target_zone_id=body.target_zone_id,
+            embassy_id=body.embassy_id,
         )
+        return build_contexts(payload, [str(body.agent_id)], body.operative_type, [target_id])[
+            (str(body.agent_id), target_id)
+        ]
 
-        return max(0.05, min(0.95, probability))
-
-    # ── Resonance Helpers ─────────────────────────────────
-
-    @staticmethod
-    async def _get_target_zone_pressure(
-        admin: Client, target_sim_id: str, target_zone_id: UUID | None = None
+    @classmethod
+    async def _calculate_success_probability(
+        cls,
+        body: OperativeDeploy,
+        source_simulation_id: UUID,
     ) -> float:
-        """Get zone pressure modifier: pressured zones are easier to infiltrate.
+        """Calculate mission success probability (see ``mission_probability.success_probability``)."""
+        return success_probability(await cls._load_deployment_context(body, source_simulation_id))
 
-        Returns +0.00 to +0.04 (pressure * cap).
-        """
+    @staticmethod
+    async def _clear_infiltration_penalty(embassy_id: str | None) -> None:
+        """Clear an expired embassy infiltration penalty (lazy cleanup after deploy)."""
+        if not embassy_id:
+            return
         try:
-            result = admin.rpc(
-                "fn_target_zone_pressure",
-                {"p_simulation_id": target_sim_id, "p_zone_id": str(target_zone_id) if target_zone_id else None},
-            ).execute()
-            return float(result.data) if result.data is not None else 0.0
+            admin = await get_admin_supabase()
+            await run_query(admin.table("embassies").update({
+                "infiltration_penalty": 0,
+                "infiltration_penalty_expires_at": None,
+            }).eq("id", embassy_id))
         except Exception:
-            logger.debug("Zone pressure lookup failed, defaulting to 0.0", exc_info=True)
-            return 0.0
+            logger.debug("Failed to clear expired infiltration penalty", exc_info=True)
 
-    @staticmethod
-    async def _get_resonance_operative_modifier(
-        admin: Client, target_sim_id: str, operative_type: str
-    ) -> float:
-        """Get net resonance archetype modifier for an operative type.
+    # ── Probability Preview ───────────────────────────────
 
-        Returns clamped [-0.04, +0.04] based on active resonances.
-        Subsiding resonances apply at 50% strength.
+    @classmethod
+    async def preview_probabilities(
+        cls,
+        supabase: Client,
+        epoch_id: UUID,
+        simulation_id: UUID,
+        operative_type: str,
+        target_simulation_ids: list[UUID] | None = None,
+    ) -> list[dict]:
+        """Success probability for every agent of ``simulation_id`` × every target.
+
+        Targets default to the other epoch participants (guardians: the own
+        simulation); any other requested target is rejected. Zone security
+        uses the default (no zone picked) and the embassy is the active one
+        linking source and target. The target's guardians are left out — the
+        free preview must not reveal what only a spy mission may — so the
+        deployed odds can be lower. Read-only — no RP is spent and nothing is
+        written.
         """
-        try:
-            result = admin.rpc(
-                "fn_resonance_operative_modifier",
-                {"p_simulation_id": target_sim_id, "p_operative_type": operative_type},
-            ).execute()
-            return float(result.data) if result.data is not None else 0.0
-        except Exception:
-            logger.debug("Resonance operative modifier lookup failed, defaulting to 0.0", exc_info=True)
-            return 0.0
+        agents_resp, participants = await asyncio.gather(
+            run_query(
+                supabase.table("agents")
+                .select("id, name")
+                .eq("simulation_id", str(simulation_id))
+                .is_("deleted_at", "null")
+                .order("name")
+            ),
+            EpochService.list_participants(supabase, epoch_id),
+        )
+        agents = agents_resp.data or []
+
+        opponents = [
+            str(p["simulation_id"]) for p in participants
+            if str(p["simulation_id"]) != str(simulation_id)
+        ]
+        if operative_type == "guardian":
+            targets: list[str | None] = [None]
+        elif target_simulation_ids:
+            targets = [str(t) for t in target_simulation_ids]
+            if not set(targets) <= set(opponents):
+                raise HTTPException(
+                    status.HTTP_400_BAD_REQUEST,
+                    "Targets must be other participants of this epoch.",
+                )
+        else:
+            targets = list(opponents)
+        if not agents or not targets:
+            return []
 
-    @staticmethod
-    async def _get_attacker_pressure_penalty(
-        admin: Client, source_sim_id: str
-    ) -> float:
-        """Get attacker's own pressure penalty: own instability hurts outbound ops.
+        admin = await get_admin_supabase()
+        payload = await fetch_deployment_context(
+            admin,
+            simulation_id,
+            [operative_type],
+            target_simulation_ids=[t for t in targets if t],
+        )
+        agent_ids = [str(a["id"]) for a in agents]
+        contexts = {
+            key: replace(ctx, guardian_count=0)
+            for key, ctx in build_contexts(payload, agent_ids, operative_type, targets).items()
+        }
 
-        Returns -0.04 to 0.00 (defender compensation).
-        """
-        try:
-            result = admin.rpc(
-                "fn_attacker_pressure_penalty",
-                {"p_simulation_id": source_sim_id},
-            ).execute()
-            return float(result.data) if result.data is not None else 0.0
-        except Exception:
-            logger.debug("Attacker pressure penalty lookup failed, defaulting to 0.0", exc_info=True)
-            return 0.0
+        return [
+            {
+                "agent_id": agent["id"],
+                "agent_name": agent.get("name"),
+                "operative_type": operative_type,
+                "target_simulation_id": target_id,
+                "embassy_id": contexts[(str(agent["id"]), target_id)].embassy_id,
+                "aptitude": contexts[(str(agent["id"]), target_id)].aptitude,
+                "success_probability": round(success_probability(contexts[(str(agent["id"]), target_id)]), 4),
+            }
+            for agent in agents
+            for target_id in targets
+        ]
 
     # ── List / Get ────────────────────────────────────────
 
@@ -486,7 +453,7 @@ class OperativeService:
         if status_filter:
             query = query.eq("status", status_filter)
         query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
-        resp = query.execute()
+        resp = await run_query(query)
         return resp.data or [], resp.count or 0
 
     @classmethod
@@ -496,12 +463,11 @@ class OperativeService:
             "*, agents(name, portrait_image_url),"
             " target_sim:simulations!target_simulation_id(name)"
         )
-        resp = (
+        resp = await run_query(
             supabase.table("operative_missions")
             .select(select_fields)
             .eq("id", str(mission_id))
             .single()
-            .execute()
         )
         if not resp.data:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Mission not found.")
@@ -515,14 +481,13 @@ class OperativeService:
         target_simulation_id: UUID,
     ) -> list[dict]:
         """List detected incoming operative threats for a simulation."""
-        resp = (
+        resp = await run_query(
             supabase.table("operative_missions")
             .select("*")
             .eq("epoch_id", str(epoch_id))
             .eq("target_simulation_id", str(target_simulation_id))
             .in_("status", ["detected", "captured"])
             .order("created_at", desc=True)
-            .execute()
         )
         return resp.data or []
 
@@ -534,465 +499,536 @@ class OperativeService:
         supabase: Client,
         epoch_id: UUID,
     ) -> list[dict]:
-        """Resolve all missions that have passed their resolves_at time."""
-        now = datetime.now(UTC).isoformat()
+        """Resolve all missions that have passed their resolves_at time.
+
+        Set-based: one bulk ``deploying → active`` transition, all rolls in
+        one pass, success effects applied per operative type with bulk
+        reads/writes, every mission result written by one
+        ``fn_apply_mission_results`` call, and intel/betrayal battle-log
+        entries recorded in one insert.
+
+        Rolls come from the epoch's seeded stream (``epoch_rng``) over the
+        missions in id order, and the pass is written to the replay log.
+        ``supabase`` must be the service-role client (the seed is not
+        readable otherwise).
+        """
+        now = datetime.now(UTC)
 
         # Find missions ready to resolve
-        resp = (
+        resp, epoch_resp, seed_resp = await gather_queries(
             supabase.table("operative_missions")
             .select("*")
             .eq("epoch_id", str(epoch_id))
             .in_("status", ["deploying", "active"])
-            .lte("resolves_at", now)
-            .execute()
+            .lte("resolves_at", now.isoformat())
+            .order("id"),
+            supabase.table("game_epochs")
+            .select("current_cycle, config")
+            .eq("id", str(epoch_id))
+            .single(),
+            supabase.table("epoch_rng_seeds")
+            .select("rng_seed")
+            .eq("epoch_id", str(epoch_id))
+            .maybe_single(),
         )
 
-        results = []
-        for mission in resp.data or []:
-            # Skip guardians (permanent)
-            if mission["operative_type"] == "guardian":
-                continue
-
-            # Advance deploying → active
-            if mission["status"] == "deploying":
-                supabase.table("operative_missions").update(
-                    {"status": "active"}
-                ).eq("id", mission["id"]).execute()
-                continue
-
-            # Resolve active missions
-            result = await cls._resolve_mission(supabase, mission)
-            results.append(result)
+        # Guardians are permanent
+        missions = [m for m in resp.data or [] if m["operative_type"] != "guardian"]
+
+        deploying_ids = [m["id"] for m in missions if m["status"] == "deploying"]
+        if deploying_ids:
+            await run_query(supabase.table("operative_missions").update(
+                {"status": "active"}
+            ).in_("id", deploying_ids))
+
+        active = [m for m in missions if m["status"] == "active"]
+        if not active:
+            return []
+
+        epoch = epoch_resp.data or {}
+        seed_row = seed_resp.data if seed_resp else None  # maybe_single() returns None for no row
+        batch = _ResolutionBatch(
+            epoch_id=str(epoch_id),
+            cycle=epoch.get("current_cycle", 1),
+            cycle_hours=(epoch.get("config") or {}).get("cycle_hours", 8),
+            now=now,
+            rng=rng_for(
+                (seed_row or {}).get("rng_seed"),
+                epoch.get("current_cycle", 1),
+                [m["id"] for m in active],
+            ),
+        )
 
-        return results
+        outcomes = {m["id"]: roll_outcome(float(m.get("success_probability", 0.5)), batch.rng) for m in active}
 
-    @classmethod
-    async def _resolve_mission(cls, supabase: Client, mission: dict) -> dict:
-        """Resolve a single mission — roll for success/failure."""
-        success_prob = float(mission.get("success_probability", 0.5))
-        roll = secrets.SystemRandom().random()
-
-        if roll <= success_prob:
-            # Success
-            outcome = "success"
-            final_status = "success"
-            mission_result = await cls._apply_success_effect(supabase, mission)
-        else:
-            # Failure — check for detection
-            detection_roll = secrets.SystemRandom().random()
-            if detection_roll > success_prob:
-                outcome = "detected"
-                final_status = "detected"
-                mission_result = {"outcome": "detected", "narrative": "The operative was detected."}
+        mission_results: dict[str, dict] = {}
+        successes: dict[str, list[dict]] = {}
+        for m in active:
+            outcome = outcomes[m["id"]]
+            if outcome == "success":
+                successes.setdefault(m["operative_type"], []).append(m)
+            elif outcome == "detected":
+                mission_results[m["id"]] = {"outcome": "detected", "narrative": "The operative was detected."}
             else:
-                outcome = "failed"
-                final_status = "failed"
-                mission_result = {"outcome": "failed", "narrative": "The mission failed quietly."}
-
-        # Update mission
-        update_data = {
-            "status": final_status,
-            "resolved_at": datetime.now(UTC).isoformat(),
-            "mission_result": {**mission_result, "outcome": outcome},
-        }
-        resp = (
-            supabase.table("operative_missions")
-            .update(update_data)
-            .eq("id", mission["id"])
-            .execute()
-        )
+                mission_results[m["id"]] = {"outcome": "failed", "narrative": "The mission failed quietly."}
+
+        for operative_type, group in successes.items():
+            mission_results.update(await cls._apply_success_effects(supabase, operative_type, group, batch))
+
+        updates = [
+            {
+                "id": m["id"],
+                "status": outcomes[m["id"]],
+                "resolved_at": now.isoformat(),
+                "mission_result": {**mission_results[m["id"]], "outcome": outcomes[m["id"]]},
+            }
+            for m in active
+        ]
+        updated = await run_query(supabase.rpc("fn_apply_mission_results", {"p_results": updates}))
+        updated_by_id = {row["id"]: row for row in updated.data or []}
 
         # Check for betrayal (same-team attack)
-        await cls._check_betrayal(supabase, mission, outcome)
+        await cls._check_betrayals(supabase, active, outcomes, batch)
+
+        await BattleLogService.log_entries(supabase, batch.log_entries)
+        await epoch_replay.record(
+            supabase, epoch_id, batch.cycle, "resolution",
+            epoch_replay.resolution_record(active, outcomes, batch.rng.rolls),
+        )
 
-        return resp.data[0] if resp.data else {**mission, **update_data}
+        return [
+            updated_by_id.get(m["id"]) or {**m, **update}
+            for m, update in zip(active, updates, strict=True)
+        ]
 
     @classmethod
-    async def _check_betrayal(
-        cls, supabase: Client, mission: dict, outcome: str
+    async def _check_betrayals(
+        cls,
+        supabase: Client,
+        missions: list[dict],
+        outcomes: dict[str, str],
+        batch: _ResolutionBatch,
     ) -> None:
         """Detect betrayal when a mission targets an ally. On detection,
         dissolve the alliance and apply a -25% diplomatic penalty."""
-        if not mission.get("target_simulation_id"):
+        targeted = [m for m in missions if m.get("target_simulation_id")]
+        if not targeted:
             return
 
-        source_p = (
+        participants = await run_query(
             supabase.table("epoch_participants")
-            .select("team_id")
-            .eq("epoch_id", mission["epoch_id"])
-            .eq("simulation_id", mission["source_simulation_id"])
-            .maybe_single()
-            .execute()
+            .select("simulation_id, team_id")
+            .eq("epoch_id", batch.epoch_id)
         )
-        target_p = (
-            supabase.table("epoch_participants")
-            .select("team_id")
-            .eq("epoch_id", mission["epoch_id"])
-            .eq("simulation_id", mission["target_simulation_id"])
-            .maybe_single()
-            .execute()
-        )
-
-        source_team = source_p.data.get("team_id") if source_p.data else None
-        target_team = target_p.data.get("team_id") if target_p.data else None
-
-        if not (source_team and target_team and source_team == target_team):
-            return
-
-        is_detected = outcome in ("detected", "captured")
+        teams = {p["simulation_id"]: p.get("team_id") for p in participants.data or []}
+
+        dissolved_teams: list[str] = []
+        betrayers: list[str] = []
+        for mission in targeted:
+            source_team = teams.get(mission["source_simulation_id"])
+            target_team = teams.get(mission["target_simulation_id"])
+            if not (source_team and target_team and source_team == target_team):
+                continue
 
-        # Fetch epoch for cycle number
-        epoch_resp = (
-            supabase.table("game_epochs")
-            .select("current_cycle")
-            .eq("id", mission["epoch_id"])
-            .single()
-            .execute()
-        )
-        cycle = epoch_resp.data.get("current_cycle", 1) if epoch_resp.data else 1
-
-        await BattleLogService.log_betrayal(
-            supabase,
-            UUID(mission["epoch_id"]),
-            cycle,
-            UUID(mission["source_simulation_id"]),
-            UUID(mission["target_simulation_id"]),
-            is_detected,
-        )
+            is_detected = outcomes[mission["id"]] in ("detected", "captured")
+            batch.log_entries.append(BattleLogService.betrayal_entry(
+                UUID(batch.epoch_id),
+                batch.cycle,
+                UUID(mission["source_simulation_id"]),
+                UUID(mission["target_simulation_id"]),
+                is_detected,
+            ))
+
+            if is_detected:
+                # Alliance dissolves immediately — later missions in this
+                # batch between former allies are no longer betrayals.
+                dissolved_teams.append(source_team)
+                betrayers.append(mission["source_simulation_id"])
+                teams = {sim: (None if team == source_team else team) for sim, team in teams.items()}
+                logger.info(
+                    "Betrayal detected — alliance dissolved, penalty applied",
+                    extra={
+                        "source_simulation_id": mission["source_simulation_id"],
+                        "target_simulation_id": mission["target_simulation_id"],
+                    },
+                )
 
-        if is_detected:
-            # Dissolve alliance — remove all members from team
-            supabase.table("epoch_participants").update(
+        if dissolved_teams:
+            # Dissolve alliances — remove all members from the teams
+            await run_query(supabase.table("epoch_participants").update(
                 {"team_id": None}
-            ).eq("team_id", source_team).execute()
+            ).in_("team_id", dissolved_teams))
 
-            # Apply -25% diplomatic penalty to betrayer
-            supabase.table("epoch_participants").update(
+            # Apply -25% diplomatic penalty to betrayers
+            await run_query(supabase.table("epoch_participants").update(
                 {"betrayal_penalty": 0.25}
-            ).eq("epoch_id", mission["epoch_id"]).eq(
-                "simulation_id", mission["source_simulation_id"]
-            ).execute()
-
-            logger.info(
-                "Betrayal detected — alliance dissolved, penalty applied",
-                extra={
-                    "source_simulation_id": mission["source_simulation_id"],
-                    "target_simulation_id": mission["target_simulation_id"],
-                },
-            )
+            ).eq("epoch_id", batch.epoch_id).in_("simulation_id", betrayers))
 
     # ── Per-type success effect handlers ─────────────────
+    # Each handler takes every successful mission of its type in this cycle
+    # and returns {mission_id: mission_result}. Missions are applied in order
+    # against in-memory state, so two saboteurs hitting the same building
+    # degrade it twice, exactly as sequential resolution did.
 
     _EFFECT_DISPATCH: dict[str, str] = {
-        "spy": "_apply_spy_effect",
-        "saboteur": "_apply_saboteur_effect",
-        "propagandist": "_apply_propagandist_effect",
-        "assassin": "_apply_assassin_effect",
-        "infiltrator": "_apply_infiltrator_effect",
+        "spy": "_apply_spy_effects",
+        "saboteur": "_apply_saboteur_effects",
+        "propagandist": "_apply_propagandist_effects",
+        "assassin": "_apply_assassin_effects",
+        "infiltrator": "_apply_infiltrator_effects",
     }
 
     @classmethod
-    async def _apply_success_effect(cls, supabase: Client, mission: dict) -> dict:
-        """Apply the mechanical effect of a successful mission.
-
-        Dispatches to per-operative-type handler methods.
-        """
-        handler_name = cls._EFFECT_DISPATCH.get(mission["operative_type"])
+    async def _apply_success_effects(
+        cls, supabase: Client, operative_type: str, missions: list[dict], batch: _ResolutionBatch,
+    ) -> dict[str, dict]:
+        """Apply the mechanical effects of successful missions of one operative type."""
+        handler_name = cls._EFFECT_DISPATCH.get(operative_type)
         if handler_name:
             handler = getattr(cls, handler_name)
-            return await handler(supabase, mission)
-        return {"outcome": "success", "narrative": "Mission completed."}
+            return await handler(supabase, missions, batch)
+        return {m["id"]: {"outcome": "success", "narrative": "Mission completed."} for m in missions}
 
     @classmethod
-    async def _apply_spy_effect(cls, supabase: Client, mission: dict) -> dict:
+    async def _apply_spy_effects(
+        cls, supabase: Client, missions: list[dict], batch: _ResolutionBatch,
+    ) -> dict[str, dict]:
         """Spy: gather intel on target simulation (zone security + guardian count)."""
-        target_sim_id = mission.get("target_simulation_id")
-        intel = {}
-        if target_sim_id:
-            zones_resp = (
+        targets = sorted({m["target_simulation_id"] for m in missions if m.get("target_simulation_id")})
+        zones_by_sim: dict[str, list[dict]] = defaultdict(list)
+        guardians: Counter = Counter()
+        forts_by_sim: dict[str, list[dict]] = defaultdict(list)
+        if targets:
+            zones_resp, guardian_resp, fort_resp = await gather_queries(
                 supabase.table("zones")
-                .select("security_level")
-                .eq("simulation_id", target_sim_id)
-                .execute()
-            )
-            guardian_resp = (
+                .select("id, name, simulation_id, security_level")
+                .in_("simulation_id", targets),
                 supabase.table("operative_missions")
-                .select("id", count="exact")
+                .select("source_simulation_id")
                 .eq("operative_type", "guardian")
-                .eq("source_simulation_id", target_sim_id)
-                .eq("status", "active")
-                .execute()
-            )
-            zone_levels = [z["security_level"] for z in (zones_resp.data or [])]
-            guardian_count = guardian_resp.count or 0
-            intel: dict = {"zone_security": zone_levels, "guardian_count": guardian_count}
-
-            # Check for zone fortifications in target simulation
-            fort_resp = (
+                .in_("source_simulation_id", targets)
+                .eq("status", "active"),
+                # Zone fortifications in target simulations
                 supabase.table("zone_fortifications")
-                .select("zone_id, security_bonus, expires_at_cycle")
-                .eq("epoch_id", mission["epoch_id"])
-                .eq("source_simulation_id", target_sim_id)
-                .execute()
-            )
-            if fort_resp.data:
-                # Enrich with zone names
-                fort_zone_ids = [f["zone_id"] for f in fort_resp.data]
-                zone_names_resp = (
-                    supabase.table("zones")
-                    .select("id, name")
-                    .in_("id", fort_zone_ids)
-                    .execute()
-                )
-                zone_name_map = {z["id"]: z["name"] for z in (zone_names_resp.data or [])}
-                intel["fortifications"] = [
-                    {
-                        "zone_id": f["zone_id"],
-                        "zone_name": zone_name_map.get(f["zone_id"], "Unknown"),
-                        "security_bonus": f["security_bonus"],
-                        "expires_at_cycle": f["expires_at_cycle"],
-                    }
-                    for f in fort_resp.data
-                ]
-
-            epoch_resp = (
-                supabase.table("game_epochs")
-                .select("current_cycle")
-                .eq("id", mission["epoch_id"])
-                .single()
-                .execute()
-            )
-            cycle = epoch_resp.data.get("current_cycle", 1) if epoch_resp.data else 1
-
-            await BattleLogService.log_event(
-                supabase,
-                UUID(mission["epoch_id"]),
-                cycle,
-                "intel_report",
-                f"Spy intel: {guardian_count} guardians, zones: {', '.join(zone_levels)}",
-                source_simulation_id=UUID(mission["source_simulation_id"]),
-                target_simulation_id=UUID(target_sim_id),
-                mission_id=UUID(mission["id"]),
-                is_public=False,
-                metadata=intel,
+                .select("zone_id, source_simulation_id, security_bonus, expires_at_cycle")
+                .eq("epoch_id", batch.epoch_id)
+                .in_("source_simulation_id", targets),
             )
-
-        return {
-            "outcome": "success",
-            "narrative": "Intelligence gathered successfully.",
-            "intel_gathered": True,
-            "intel": intel,
-        }
+            for z in zones_resp.data or []:
+                zones_by_sim[z["simulation_id"]].append(z)
+            guardians = Counter(g["source_simulation_id"] for g in guardian_resp.data or [])
+            for f in fort_resp.data or []:
+                forts_by_sim[f["source_simulation_id"]].append(f)
+
+        results: dict[str, dict] = {}
+        for mission in missions:
+            target_sim_id = mission.get("target_simulation_id")
+            intel: dict = {}
+            if target_sim_id:
+                zones = zones_by_sim[target_sim_id]
+                zone_levels = [z["security_level"] for z in zones]
+                guardian_count = guardians[target_sim_id]
+                intel = {"zone_security": zone_levels, "guardian_count": guardian_count}
+
+                if forts_by_sim[target_sim_id]:
+                    # Enrich with zone names
+                    zone_name_map = {z["id"]: z.get("name") for z in zones}
+                    intel["fortifications"] = [
+                        {
+                            "zone_id": f["zone_id"],
+                            "zone_name": zone_name_map.get(f["zone_id"]) or "Unknown",
+                            "security_bonus": f["security_bonus"],
+                            "expires_at_cycle": f["expires_at_cycle"],
+                        }
+                        for f in forts_by_sim[target_sim_id]
+                    ]
+
+                batch.log_entries.append(BattleLogService.build_entry(
+                    UUID(batch.epoch_id),
+                    batch.cycle,
+                    "intel_report",
+                    f"Spy intel: {guardian_count} guardians, zones: {', '.join(zone_levels)}",
+                    source_simulation_id=UUID(mission["source_simulation_id"]),
+                    target_simulation_id=UUID(target_sim_id),
+                    mission_id=UUID(mission["id"]),
+                    is_public=False,
+                    metadata=intel,
+                ))
+
+            results[mission["id"]] = {
+                "outcome": "success",
+                "narrative": "Intelligence gathered successfully.",
+                "intel_gathered": True,
+                "intel": intel,
+            }
+        return results
 
     @classmethod
-    async def _apply_saboteur_effect(cls, supabase: Client, mission: dict) -> dict:
+    async def _apply_saboteur_effects(
+        cls, supabase: Client, missions: list[dict], batch: _ResolutionBatch,
+    ) -> dict[str, dict]:
         """Saboteur: degrade building condition + downgrade random zone security."""
-        result: dict = {"outcome": "success"}
-
-        if mission.get("target_entity_id"):
-            building_resp = (
+        building_ids = sorted({m["target_entity_id"] for m in missions if m.get("target_entity_id")})
+        targets = sorted({m["target_simulation_id"] for m in missions if m.get("target_simulation_id")})
+
+        conditions: dict[str, str] = {}
+        zones_by_sim: dict[str, list[dict]] = defaultdict(list)
+        lookups = []
+        if building_ids:
+            lookups.append(
                 supabase.table("buildings")
                 .select("id, building_condition")
-                .eq("id", mission["target_entity_id"])
-                .single()
-                .execute()
+                .in_("id", building_ids)
             )
-            if building_resp.data:
-                condition_map = {"good": "moderate", "moderate": "poor", "poor": "ruined"}
-                old_cond = building_resp.data["building_condition"]
-                new_cond = condition_map.get(old_cond, old_cond)
-                if old_cond != new_cond:
-                    supabase.table("buildings").update(
-                        {"building_condition": new_cond}
-                    ).eq("id", mission["target_entity_id"]).execute()
+        if targets:
+            lookups.append(
+                supabase.table("zones")
+                .select("id, name, simulation_id, security_level")
+                .in_("simulation_id", targets)
+            )
+        responses = list(await gather_queries(*lookups))
+        if building_ids:
+            conditions = {b["id"]: b["building_condition"] for b in responses.pop(0).data or []}
+        if targets:
+            for z in responses.pop(0).data or []:
+                zones_by_sim[z["simulation_id"]].append(z)
+
+        old_conditions = dict(conditions)
+        levels = {z["id"]: z["security_level"] for zones in zones_by_sim.values() for z in zones}
+        old_levels = dict(levels)
+
+        results: dict[str, dict] = {}
+        for mission in missions:
+            result: dict = {"outcome": "success"}
+            building_id = mission.get("target_entity_id")
+            if building_id in conditions:
+                old_cond = conditions[building_id]
+                new_cond = BUILDING_CONDITION_DOWNGRADE.get(old_cond, old_cond)
+                conditions[building_id] = new_cond
                 result["damage_dealt"] = {
-                    "building_id": mission["target_entity_id"],
+                    "building_id": building_id,
                     "old_condition": old_cond,
                     "new_condition": new_cond,
                 }
 
-        target_sim_id = mission.get("target_simulation_id")
-        if target_sim_id:
-            zones_resp = (
-                supabase.table("zones")
-                .select("id, name, security_level")
-                .eq("simulation_id", target_sim_id)
-                .execute()
-            )
-            if zones_resp.data:
-                target_zone = secrets.SystemRandom().choice(zones_resp.data)
-                old_level = target_zone["security_level"]
+            zones = zones_by_sim.get(mission.get("target_simulation_id"), [])
+            if zones:
+                target_zone = batch.rng.choice(zones)
+                old_level = levels[target_zone["id"]]
                 new_level = _downgrade_security(old_level)
-                if old_level != new_level:
-                    supabase.table("zones").update(
-                        {"security_level": new_level}
-                    ).eq("id", target_zone["id"]).execute()
+                levels[target_zone["id"]] = new_level
                 result["zone_downgraded"] = {
                     "zone_id": target_zone["id"],
                     "old_level": old_level,
                     "new_level": new_level,
                 }
+            results[mission["id"]] = result
+
+        # One UPDATE per distinct final value
+        writes = [
+            supabase.table("buildings").update({"building_condition": cond}).in_("id", ids)
+            for cond, ids in _group_changes(old_conditions, conditions).items()
+        ] + [
+            supabase.table("zones").update({"security_level": level}).in_("id", ids)
+            for level, ids in _group_changes(old_levels, levels).items()
+        ]
+        if writes:
+            await gather_queries(*writes)
+
+        if targets:
+            await cls._create_sabotage_events(missions, results, zones_by_sim)
+
+        for result in results.values():
+            narrative_parts = ["Sabotage successful."]
+            if "damage_dealt" in result:
+                d = result["damage_dealt"]
+                narrative_parts.append(f"Building degraded: {d['old_condition']} → {d['new_condition']}.")
+            if "zone_downgraded" in result:
+                z = result["zone_downgraded"]
+                narrative_parts.append(f"Zone security compromised: {z['old_level']} → {z['new_level']}.")
+            result["narrative"] = " ".join(narrative_parts)
+        return results
 
-        # Generate crisis event from sabotage (feeds event→pressure→cascade pipeline)
-        # Diminishing returns: impact decreases with existing active sabotage events
-        if target_sim_id:
-            try:
-                admin = await get_admin_supabase()
-
-                # Check existing active sabotage crisis events for this simulation
-                existing_resp = (
-                    admin.table("events")
-                    .select("id", count="exact")
-                    .eq("simulation_id", target_sim_id)
-                    .eq("data_source", "sabotage")
-                    .eq("event_status", "active")
-                    .execute()
-                )
-                existing_count = existing_resp.count or 0
-
-                # Skip event creation if 3+ active sabotage events (saturation)
-                if existing_count < 3:
-                    zone_name_label = "Unknown District"
-                    sabotaged_zone = result.get("zone_downgraded", {})
-                    if sabotaged_zone.get("zone_id") and zones_resp.data:
-                        for z in zones_resp.data:
-                            if z["id"] == sabotaged_zone["zone_id"]:
-                                zone_name_label = z.get("name", zone_name_label)
-                                break
-
-                    # Diminishing impact: 3 → 2 → 1 as more events stack
-                    impact_level = max(1, 3 - existing_count)
-
-                    event_data = {
-                        "simulation_id": target_sim_id,
-                        "title": f"Infrastructure Sabotage — {zone_name_label}",
-                        "event_type": "crisis",
-                        "impact_level": impact_level,
-                        "event_status": "active",
-                        "data_source": "sabotage",
-                        "metadata": {
-                            "mission_id": str(mission["id"]),
-                            "source_simulation_id": str(mission["source_simulation_id"]),
-                        },
-                    }
-                    admin.table("events").insert(event_data).execute()
-                    result["event_created"] = True
-                else:
+    @staticmethod
+    async def _create_sabotage_events(
+        missions: list[dict], results: dict[str, dict], zones_by_sim: dict[str, list[dict]],
+    ) -> None:
+        """Generate crisis events from sabotage (feeds event→pressure→cascade pipeline).
+
+        Diminishing returns: impact decreases with existing active sabotage
+        events, and a simulation with 3+ active ones is saturated.
+        """
+        targets = sorted({m["target_simulation_id"] for m in missions if m.get("target_simulation_id")})
+        try:
+            admin = await get_admin_supabase()
+
+            # Existing active sabotage crisis events per target simulation
+            existing_resp = await run_query(
+                admin.table("events")
+                .select("simulation_id")
+                .in_("simulation_id", targets)
+                .eq("data_source", "sabotage")
+                .eq("event_status", "active")
+            )
+            existing = Counter(e["simulation_id"] for e in existing_resp.data or [])
+
+            events = []
+            for mission in missions:
+                target_sim_id = mission.get("target_simulation_id")
+                if not target_sim_id:
+                    continue
+                result = results[mission["id"]]
+                if existing[target_sim_id] >= 3:
                     result["event_saturated"] = True
-            except Exception:
-                logger.debug("Sabotage crisis event creation failed", exc_info=True)
-
-        narrative_parts = ["Sabotage successful."]
-        if "damage_dealt" in result:
-            d = result["damage_dealt"]
-            narrative_parts.append(f"Building degraded: {d['old_condition']} → {d['new_condition']}.")
-        if "zone_downgraded" in result:
-            z = result["zone_downgraded"]
-            narrative_parts.append(f"Zone security compromised: {z['old_level']} → {z['new_level']}.")
-        result["narrative"] = " ".join(narrative_parts)
-        return result
+                    continue
+
+                zone_name_label = "Unknown District"
+                sabotaged_zone_id = result.get("zone_downgraded", {}).get("zone_id")
+                for z in zones_by_sim.get(target_sim_id, []):
+                    if z["id"] == sabotaged_zone_id:
+                        zone_name_label = z.get("name", zone_name_label)
+                        break
+
+                # Diminishing impact: 3 → 2 → 1 as more events stack
+                impact_level = max(1, 3 - existing[target_sim_id])
+                existing[target_sim_id] += 1
+
+                events.append({
+                    "simulation_id": target_sim_id,
+                    "title": f"Infrastructure Sabotage — {zone_name_label}",
+                    "event_type": "crisis",
+                    "impact_level": impact_level,
+                    "event_status": "active",
+                    "data_source": "sabotage",
+                    "metadata": {
+                        "mission_id": str(mission["id"]),
+                        "source_simulation_id": str(mission["source_simulation_id"]),
+                    },
+                })
+                result["event_created"] = True
+
+            if events:
+                await run_query(admin.table("events").insert(events))
+        except Exception:
+            logger.debug("Sabotage crisis event creation failed", exc_info=True)
 
     @classmethod
-    async def _apply_propagandist_effect(cls, supabase: Client, mission: dict) -> dict:
+    async def _apply_propagandist_effects(
+        cls, supabase: Client, missions: list[dict], batch: _ResolutionBatch,
+    ) -> dict[str, dict]:
         """Propagandist: create destabilizing event in target simulation."""
         admin = await get_admin_supabase()
-        target_sim = mission["target_simulation_id"]
-        event_data = {
-            "simulation_id": target_sim,
-            "title": "Propaganda Campaign — Foreign Influence Detected",
-            "description": "Morale undermined by external propaganda operations.",
-            "event_type": "social",
-            "impact_level": secrets.SystemRandom().randint(3, 5),
-            "data_source": "propagandist",
-            "metadata": {
-                "mission_id": str(mission["id"]),
-                "source_simulation_id": str(mission["source_simulation_id"]),
-                "operative_type": "propagandist",
-            },
-        }
-        admin.table("events").insert(event_data).execute()
+        events = [
+            {
+                "simulation_id": mission["target_simulation_id"],
+                "title": "Propaganda Campaign — Foreign Influence Detected",
+                "description": "Morale undermined by external propaganda operations.",
+                "event_type": "social",
+                "impact_level": batch.rng.randint(3, 5),
+                "data_source": "propagandist",
+                "metadata": {
+                    "mission_id": str(mission["id"]),
+                    "source_simulation_id": str(mission["source_simulation_id"]),
+                    "operative_type": "propagandist",
+                },
+            }
+            for mission in missions
+        ]
+        await run_query(admin.table("events").insert(events))
 
         return {
-            "outcome": "success",
-            "narrative": "Propaganda campaign succeeded. Target population's morale undermined.",
-            "score_awarded": True,
-            "event_created": True,
+            mission["id"]: {
+                "outcome": "success",
+                "narrative": "Propaganda campaign succeeded. Target population's morale undermined.",
+                "score_awarded": True,
+                "event_created": True,
+            }
+            for mission in missions
         }
 
     @classmethod
-    async def _apply_assassin_effect(cls, supabase: Client, mission: dict) -> dict:
+    async def _apply_assassin_effects(
+        cls, supabase: Client, missions: list[dict], batch: _ResolutionBatch,
+    ) -> dict[str, dict]:
         """Assassin: weaken agent relationships + block ambassador status for 3 cycles."""
-        if not mission.get("target_entity_id"):
-            return {"outcome": "success", "narrative": "Mission completed."}
+        results = {
+            m["id"]: {"outcome": "success", "narrative": "Mission completed."}
+            for m in missions if not m.get("target_entity_id")
+        }
+        targeted = [m for m in missions if m.get("target_entity_id")]
+        if not targeted:
+            return results
 
-        rel_resp = (
+        agent_ids = sorted({m["target_entity_id"] for m in targeted})
+        agents_csv = ",".join(agent_ids)
+        rel_resp = await run_query(
             supabase.table("agent_relationships")
-            .select("id, intensity")
-            .or_(
-                f"source_agent_id.eq.{mission['target_entity_id']},"
-                f"target_agent_id.eq.{mission['target_entity_id']}"
-            )
-            .execute()
+            .select("id, source_agent_id, target_agent_id, intensity")
+            .or_(f"source_agent_id.in.({agents_csv}),target_agent_id.in.({agents_csv})")
         )
-        for rel in rel_resp.data or []:
-            new_intensity = max(1, rel["intensity"] - 2)
-            supabase.table("agent_relationships").update(
-                {"intensity": new_intensity}
-            ).eq("id", rel["id"]).execute()
-
-        epoch_resp = (
-            supabase.table("game_epochs")
-            .select("config")
-            .eq("id", mission["epoch_id"])
-            .single()
-            .execute()
-        )
-        config = (epoch_resp.data or {}).get("config", {})
-        cycle_hours = config.get("cycle_hours", 8)
-        blocked_until = datetime.now(UTC) + timedelta(hours=3 * cycle_hours)
-        supabase.table("agents").update(
-            {"ambassador_blocked_until": blocked_until.isoformat()}
-        ).eq("id", mission["target_entity_id"]).execute()
-
-        return {
-            "outcome": "success",
-            "narrative": (
-                "Assassination successful. Target agent's influence "
-                "diminished and ambassador status suspended."
+        relationships = rel_resp.data or []
+        intensity = {rel["id"]: rel["intensity"] for rel in relationships}
+        old_intensity = dict(intensity)
+
+        blocked_until = batch.now + timedelta(hours=3 * batch.cycle_hours)
+        for mission in targeted:
+            agent_id = mission["target_entity_id"]
+            touched = [
+                rel["id"] for rel in relationships
+                if agent_id in (rel.get("source_agent_id"), rel.get("target_agent_id"))
+            ]
+            for rel_id in touched:
+                intensity[rel_id] = max(1, intensity[rel_id] - 2)
+            results[mission["id"]] = {
+                "outcome": "success",
+                "narrative": (
+                    "Assassination successful. Target agent's influence "
+                    "diminished and ambassador status suspended."
+                ),
+                "relationships_weakened": len(touched),
+                "ambassador_blocked_until": blocked_until.isoformat(),
+            }
+
+        await gather_queries(
+            *(
+                supabase.table("agent_relationships").update({"intensity": value}).in_("id", ids)
+                for value, ids in _group_changes(old_intensity, intensity).items()
             ),
-            "relationships_weakened": len(rel_resp.data or []),
-            "ambassador_blocked_until": blocked_until.isoformat(),
-        }
+            supabase.table("agents").update(
+                {"ambassador_blocked_until": blocked_until.isoformat()}
+            ).in_("id", agent_ids),
+        )
+        return results
 
     @classmethod
-    async def _apply_infiltrator_effect(cls, supabase: Client, mission: dict) -> dict:
+    async def _apply_infiltrator_effects(
+        cls, supabase: Client, missions: list[dict], batch: _ResolutionBatch,
+    ) -> dict[str, dict]:
         """Infiltrator: reduce embassy effectiveness by 65% for 3 cycles."""
-        if not mission.get("target_entity_id"):
-            return {"outcome": "success", "narrative": "Mission completed."}
-
-        epoch_resp = (
-            supabase.table("game_epochs")
-            .select("config")
-            .eq("id", mission["epoch_id"])
-            .single()
-            .execute()
-        )
-        config = (epoch_resp.data or {}).get("config", {})
-        cycle_hours = config.get("cycle_hours", 8)
-        expires_at = datetime.now(UTC) + timedelta(hours=3 * cycle_hours)
+        results = {
+            m["id"]: {"outcome": "success", "narrative": "Mission completed."}
+            for m in missions if not m.get("target_entity_id")
+        }
+        embassy_ids = sorted({m["target_entity_id"] for m in missions if m.get("target_entity_id")})
+        if not embassy_ids:
+            return results
 
-        supabase.table("embassies").update({
+        expires_at = batch.now + timedelta(hours=3 * batch.cycle_hours)
+        await run_query(supabase.table("embassies").update({
             "infiltration_penalty": 0.65,
             "infiltration_penalty_expires_at": expires_at.isoformat(),
-        }).eq("id", mission["target_entity_id"]).execute()
-
-        return {
-            "outcome": "success",
-            "narrative": "Embassy infiltrated. Diplomatic effectiveness severely compromised.",
-            "intel_gathered": True,
-            "target_embassy_id": mission["target_entity_id"],
-            "effectiveness_reduced": True,
-        }
+        }).in_("id", embassy_ids))
+
+        for mission in missions:
+            if mission.get("target_entity_id"):
+                results[mission["id"]] = {
+                    "outcome": "success",
+                    "narrative": "Embassy infiltrated. Diplomatic effectiveness severely compromised.",
+                    "intel_gathered": True,
+                    "target_embassy_id": mission["target_entity_id"],
+                    "effectiveness_reduced": True,
+                }
+        return results
 
     # ── Recall ────────────────────────────────────────────
 
@@ -1024,14 +1060,13 @@ class OperativeService:
             source_sim_id = UUID(mission["source_simulation_id"])
             await EpochService.grant_rp(supabase, epoch_id, source_sim_id, refund)
 
-        resp = (
+        resp = await run_query(
             supabase.table("operative_missions")
             .update({
                 "status": "returning",
                 "resolved_at": datetime.now(UTC).isoformat(),
             })
             .eq("id", str(mission_id))
-            .execute()
         )
         return resp.data[0] if resp.data else mission
 
@@ -1052,21 +1087,20 @@ class OperativeService:
         await EpochService.spend_rp(supabase, epoch_id, simulation_id, 4)
 
         # Find active enemy missions targeting this simulation
-        resp = (
+        resp = await run_query(
             supabase.table("operative_missions")
             .select("*, agents(name)")
             .eq("epoch_id", str(epoch_id))
             .eq("target_simulation_id", str(simulation_id))
             .in_("status", ["deploying", "active"])
-            .execute()
         )
 
         detected = []
         for mission in resp.data or []:
             # Each detected mission updates to 'detected' status
-            supabase.table("operative_missions").update(
+            await run_query(supabase.table("operative_missions").update(
                 {"status": "detected"}
-            ).eq("id", mission["id"]).execute()
+            ).eq("id", mission["id"]))
             detected.append(mission)
 
         return detected
@@ -1097,12 +1131,11 @@ class OperativeService:
             )
 
         # Verify zone belongs to this simulation
-        zone_resp = (
+        zone_resp = await run_query(
             supabase.table("zones")
             .select("id, name, security_level, simulation_id")
             .eq("id", str(zone_id))
             .single()
-            .execute()
         )
         if not zone_resp.data or zone_resp.data["simulation_id"] != str(simulation_id):
             raise HTTPException(
@@ -1111,12 +1144,11 @@ class OperativeService:
             )
 
         # Duplicate check (UNIQUE constraint would also catch this)
-        existing = (
+        existing = await run_query(
             supabase.table("zone_fortifications")
             .select("id")
             .eq("epoch_id", str(epoch_id))
             .eq("zone_id", str(zone_id))
-            .execute()
         )
         if existing.data:
             raise HTTPException(
@@ -1128,21 +1160,16 @@ class OperativeService:
         await EpochService.spend_rp(supabase, epoch_id, simulation_id, FORTIFICATION_RP_COST)
 
         # Compute expiry cycle
-        config = {**epoch.get("config", {})}
-        if "foundation_cycles" in config:
-            foundation_cycles = config["foundation_cycles"]
-        else:
-            total_cycles = (config.get("duration_days", 14) * 24) // config.get("cycle_hours", 8)
-            foundation_cycles = round(total_cycles * config.get("foundation_pct", 10) / 100)
+        foundation_cycles, _, _ = phase_boundaries(epoch.get("config", {}))
         expires_at_cycle = foundation_cycles + FORTIFICATION_DURATION_CYCLES
 
         # Upgrade zone security by 1 tier
         old_level = zone_resp.data["security_level"]
         new_level = _upgrade_security(old_level)
         if old_level != new_level:
-            supabase.table("zones").update(
+            await run_query(supabase.table("zones").update(
                 {"security_level": new_level}
-            ).eq("id", str(zone_id)).execute()
+            ).eq("id", str(zone_id)))
 
         # Insert fortification record
         fort_data = {
@@ -1152,7 +1179,7 @@ class OperativeService:
             "security_bonus": 1,
             "expires_at_cycle": expires_at_cycle,
         }
-        fort_resp = supabase.table("zone_fortifications").insert(fort_data).execute()
+        fort_resp = await run_query(supabase.table("zone_fortifications").insert(fort_data))
 
         # Log hidden battle_log event
         cycle = epoch.get("current_cycle", 1)
@@ -1177,3 +1204,18 @@ class OperativeService:
             logger.debug("Battle log write failed for zone fortification", exc_info=True)
 
         return fort_resp.data[0] if fort_resp.data else fort_data
+
+    @staticmethod
+    async def expire_fortifications(supabase: Client, epoch_id: UUID, cycle_number: int) -> list[dict]:
+        """Expire every fortification due by ``cycle_number`` and revert its zone's security.
+
+        One ``fn_expire_fortifications`` call (migration 087) deletes the rows and
+        moves each zone back down ``SECURITY_TIER_ORDER`` atomically. Returns one
+        summary per expired fortification (zone_name, source_simulation_id,
+        old_level, new_level).
+        """
+        resp = await run_query(supabase.rpc(
+            "fn_expire_fortifications",
+            {"p_epoch_id": str(epoch_id), "p_cycle_number": cycle_number},
+        ))
+        return resp.data or []
@@ -13,6 +13,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.models.settings import is_sensitive_key
+from backend.utils.db import run_query
 from backend.utils.encryption import decrypt, mask
 from supabase import Client
 
@@ -26,6 +27,10 @@ DEFAULT_SETTINGS: dict[str, int] = {
     "cache_http_map_data_max_age": 15,
     "cache_http_battle_feed_max_age": 10,
     "cache_http_connections_max_age": 60,
+    "cache_membership_ttl": 30,
+    "cache_ai_config_ttl": 300,
+    "cache_public_simulations_ttl": 30,
+    "cache_public_entities_ttl": 30,
 }
 
 
@@ -42,11 +47,10 @@ class PlatformSettingsService:
 
         When mask_sensitive=True, sensitive keys show masked values (for admin UI).
         """
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .select("*")
             .order("setting_key")
-            .execute()
         )
         rows = response.data or []
         if not mask_sensitive:
@@ -74,12 +78,11 @@ class PlatformSettingsService:
     @classmethod
     async def get(cls, admin_supabase: Client, key: str) -> dict:
         """Fetch a single platform setting by key."""
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .select("*")
             .eq("setting_key", key)
             .limit(1)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -97,7 +100,7 @@ class PlatformSettingsService:
         user_id: UUID,
     ) -> dict:
         """Update a platform setting value."""
-        response = (
+        response = await run_query(
             admin_supabase.table(cls.table_name)
             .update({
                 "setting_value": str(value),
@@ -105,7 +108,6 @@ class PlatformSettingsService:
                 "updated_at": datetime.now(UTC).isoformat(),
             })
             .eq("setting_key", key)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
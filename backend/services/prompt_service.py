@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from uuid import UUID
 
+from backend.services import ai_config_cache
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -149,28 +153,8 @@ class PromptResolver:
 
     async def _get_simulation_locale(self) -> str:
         """Get the simulation's default content locale."""
-        if self._sim_locale is not None:
-            return self._sim_locale
-
-        if not self._simulation_id:
-            self._sim_locale = "en"
-            return "en"
-
-        response = (
-            self._supabase.table("simulation_settings")
-            .select("setting_value")
-            .eq("simulation_id", str(self._simulation_id))
-            .eq("setting_key", "general.content_locale")
-            .limit(1)
-            .execute()
-        )
-
-        if response and response.data:
-            row = response.data[0] if isinstance(response.data, list) else response.data
-            self._sim_locale = str(row.get("setting_value", "en"))
-        else:
-            self._sim_locale = "en"
-
+        if self._sim_locale is None:
+            self._sim_locale = await get_content_locale(self._supabase, self._simulation_id) or "en"
         return self._sim_locale
 
     async def resolve(
@@ -178,10 +162,21 @@ class PromptResolver:
         template_type: str,
         locale: str | None = None,
     ) -> ResolvedPrompt:
-        """Resolve a prompt template using the 5-level fallback chain."""
+        """Resolve a prompt template using the 5-level fallback chain.
+
+        Results are cached process-wide per (simulation, type, locale) until
+        the simulation's templates or settings change.
+        """
         if locale is None:
             locale = await self._get_simulation_locale()
+        return await ai_config_cache.get_or_load(
+            "prompt",
+            self._simulation_id,
+            (template_type, locale),
+            lambda: self._resolve_uncached(template_type, locale),
+        )
 
+    async def _resolve_uncached(self, template_type: str, locale: str) -> ResolvedPrompt:
         # 1. Simulation + requested locale
         if self._simulation_id:
             template = await self._find_template(self._simulation_id, template_type, locale)
@@ -250,7 +245,7 @@ class PromptResolver:
         else:
             query = query.is_("simulation_id", "null")
 
-        response = query.limit(1).execute()
+        response = await run_query(query.limit(1))
         if response and response.data:
             return response.data[0] if isinstance(response.data, list) else response.data
         return None
@@ -291,12 +286,49 @@ class PromptResolver:
             return _safe_format(template.prompt_content, variables)
 
 
-def _safe_format(template: str, variables: dict[str, str]) -> str:
-    """Format a string, leaving unknown variables as {name}."""
-    import re
+async def get_content_locale(supabase: Client, simulation_id: UUID | str | None) -> str | None:
+    """The simulation's ``general.content_locale`` setting (None if unset), cached process-wide."""
+    if not simulation_id:
+        return None
+
+    async def _load() -> str | None:
+        response = await run_query(
+            supabase.table("simulation_settings")
+            .select("setting_value")
+            .eq("simulation_id", str(simulation_id))
+            .eq("setting_key", "general.content_locale")
+            .limit(1)
+        )
+        if response and response.data:
+            row = response.data[0] if isinstance(response.data, list) else response.data
+            value = row.get("setting_value")
+            return str(value) if value is not None else None
+        return None
+
+    return await ai_config_cache.get_or_load("content_locale", simulation_id, (), _load)
+
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
 
-    def replace(match: re.Match) -> str:
-        key = match.group(1)
-        return variables.get(key, match.group(0))
 
-    return re.sub(r"\{(\w+)\}", replace, template)
+@lru_cache(maxsize=512)
+def _compile(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a template into (literal, placeholder name | None) parts."""
+    parts: list[tuple[str, str | None]] = []
+    pos = 0
+    for match in _PLACEHOLDER.finditer(template):
+        parts.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((template[pos:], None))
+    return tuple(parts)
+
+
+def _safe_format(template: str, variables: dict[str, str]) -> str:
+    """Format a string, leaving unknown variables as {name}."""
+    out: list[str] = []
+    for literal, name in _compile(template):
+        out.append(literal)
+        if name is not None:
+            value = variables.get(name)
+            out.append("{" + name + "}" if value is None else str(value))
+    return "".join(out)
@@ -6,6 +6,8 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services import ai_config_cache
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -44,7 +46,7 @@ class PromptTemplateService:
             query = query.eq("prompt_category", prompt_category)
 
         query = query.range(offset, offset + limit - 1)
-        sim_response = query.execute()
+        sim_response = await run_query(query)
 
         templates = sim_response.data or []
         total = sim_response.count or len(templates)
@@ -62,7 +64,7 @@ class PromptTemplateService:
             if prompt_category:
                 platform_query = platform_query.eq("prompt_category", prompt_category)
 
-            platform_response = platform_query.execute()
+            platform_response = await run_query(platform_query)
             platform_templates = platform_response.data or []
 
             # Only include platform templates not overridden by simulation
@@ -81,12 +83,11 @@ class PromptTemplateService:
         template_id: UUID,
     ) -> dict:
         """Get a single prompt template by ID."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select("*")
             .eq("id", str(template_id))
             .limit(1)
-            .execute()
         )
         if not response or not response.data:
             raise HTTPException(
@@ -110,10 +111,9 @@ class PromptTemplateService:
             "created_by_id": str(user_id),
         }
 
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .insert(insert_data)
-            .execute()
         )
 
         if not response.data:
@@ -121,6 +121,7 @@ class PromptTemplateService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create prompt template.",
             )
+        ai_config_cache.invalidate_simulation(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -138,12 +139,11 @@ class PromptTemplateService:
                 detail="No fields to update.",
             )
 
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .update(data)
             .eq("id", str(template_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
 
         if not response.data:
@@ -151,6 +151,7 @@ class PromptTemplateService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Template '{template_id}' not found in simulation.",
             )
+        ai_config_cache.invalidate_simulation(simulation_id)
         return response.data[0]
 
     @classmethod
@@ -161,12 +162,11 @@ class PromptTemplateService:
         template_id: UUID,
     ) -> dict:
         """Soft-delete a prompt template by setting is_active=False."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .update({"is_active": False})
             .eq("id", str(template_id))
             .eq("simulation_id", str(simulation_id))
-            .execute()
         )
 
         if not response.data:
@@ -174,4 +174,5 @@ class PromptTemplateService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Template '{template_id}' not found.",
             )
+        ai_config_cache.invalidate_simulation(simulation_id)
         return response.data[0]
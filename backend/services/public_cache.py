@@ -0,0 +1,268 @@
+"""Server-side response cache for anonymous ``/api/v1/public`` GET endpoints.
+
+Anonymous browsing is the bulk of our traffic and every public request used to
+reach PostgREST (often twice — list + ``_enrich_with_counts``). Endpoints
+decorated with ``@cached("<ttl setting>")`` instead:
+
+- serve the serialized JSON body from the cache for the route's TTL
+  (``cache_config.get_ttl``, re-read on every store so admin changes apply);
+- answer ``If-None-Match`` with ``304 Not Modified`` using a content ETag;
+- coalesce concurrent misses for the same URL onto one backend call.
+
+Entries are tagged with the simulation they belong to (and ``index=True``
+routes with the simulation index). Write services call
+``invalidate_simulation()`` after mutating agents, buildings, events, lore or
+the simulation itself. Invalidation is local to this worker; other workers
+converge within the route TTL.
+
+The store is pluggable via ``set_backend()`` — anything implementing
+``CacheBackend`` (e.g. a Redis adapter) can replace the in-memory default.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from cachetools import TLRUCache
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+from backend.services.cache_config import get_ttl
+
+logger = logging.getLogger(__name__)
+
+INDEX_TAG = "simulations-index"
+enabled = True  # Set False to bypass the cache entirely (benchmarks, debugging)
+_DEFAULT_CACHE_CONTROL = "public, no-cache"  # Clients revalidate via ETag → cheap 304s
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized 200 response plus the metadata needed to replay it."""
+
+    body: bytes
+    etag: str
+    expires_at: float
+    headers: dict[str, str] = field(default_factory=dict)
+    tags: frozenset[str] = frozenset()
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached public responses."""
+
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def set(self, key: str, entry: CachedResponse) -> None: ...
+
+    def invalidate_tags(self, tags: set[str]) -> int: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryBackend:
+    """In-process store; each entry expires at its own ``expires_at``."""
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        self._cache: TLRUCache = TLRUCache(
+            maxsize=maxsize,
+            ttu=lambda _key, entry, _now: entry.expires_at,
+            timer=time.monotonic,
+        )
+
+    def get(self, key: str) -> CachedResponse | None:
+        return self._cache.get(key)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self._cache[key] = entry
+
+    def invalidate_tags(self, tags: set[str]) -> int:
+        stale = [key for key, entry in list(self._cache.items()) if entry.tags & tags]
+        for key in stale:
+            self._cache.pop(key, None)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_backend: CacheBackend = MemoryBackend()
+_inflight: dict[str, asyncio.Future] = {}
+_generation = 0  # Bumped on every invalidation; a miss started before one is not stored
+
+_stats: dict[str, int] = {
+    "hits": 0,
+    "misses": 0,
+    "coalesced": 0,
+    "not_modified": 0,
+    "invalidations": 0,
+}
+
+
+def set_backend(backend: CacheBackend) -> None:
+    """Swap the storage backend (e.g. for a shared Redis-backed store)."""
+    global _backend  # noqa: PLW0603
+    _backend = backend
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────
+
+
+def _cache_key(request: Request) -> str:
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def _serialize(request: Request, result) -> bytes:
+    """Render ``result`` the way FastAPI would for the matched route."""
+    model = getattr(request.scope.get("route"), "response_model", None)
+    if isinstance(model, type) and issubclass(model, BaseModel) and not isinstance(result, BaseModel):
+        result = model.model_validate(result)
+    return JSONResponse(content=jsonable_encoder(result)).body
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _respond(request: Request, entry: CachedResponse, cache_status: str) -> Response:
+    headers = {**entry.headers, "ETag": entry.etag, "X-Cache": cache_status}
+    if _etag_matches(request, entry.etag):
+        _stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+async def _build_entry(request: Request, func, args, kwargs, ttl_key: str, tags: frozenset[str]) -> CachedResponse:
+    result = await func(*args, **kwargs)
+    body = _serialize(request, result)
+
+    headers = {"Cache-Control": _DEFAULT_CACHE_CONTROL}
+    for value in kwargs.values():
+        # Keep headers the endpoint set on its injected Response (Cache-Control etc.)
+        if isinstance(value, Response) and "cache-control" in value.headers:
+            headers["Cache-Control"] = value.headers["cache-control"]
+
+    return CachedResponse(
+        body=body,
+        etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        expires_at=time.monotonic() + get_ttl(ttl_key),
+        headers=headers,
+        tags=tags,
+    )
+
+
+# ── Decorator ───────────────────────────────────────────────────────────
+
+
+def cached(ttl_key: str, *, index: bool = False):
+    """Cache a public GET endpoint's response for ``get_ttl(ttl_key)`` seconds.
+
+    Apply below ``@limiter.limit`` so rate limiting still counts cache hits.
+    The endpoint must take ``request: Request``; a ``simulation_id`` argument
+    tags the entry for ``invalidate_simulation()``. ``index=True`` marks
+    routes that list or summarize many simulations.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not enabled:
+                return await func(*args, **kwargs)
+            request: Request = kwargs["request"]
+            key = _cache_key(request)
+
+            entry = _backend.get(key)
+            if entry is not None:
+                _stats["hits"] += 1
+                return _respond(request, entry, "HIT")
+
+            inflight = _inflight.get(key)
+            if inflight is not None:
+                _stats["coalesced"] += 1
+                try:
+                    entry = await asyncio.shield(inflight)
+                    return _respond(request, entry, "HIT")
+                except asyncio.CancelledError:
+                    if not inflight.cancelled():
+                        raise
+                    # The leader's client went away — compute it ourselves below.
+
+            _stats["misses"] += 1
+            tags = {str(kwargs["simulation_id"])} if kwargs.get("simulation_id") else set()
+            if index:
+                tags.add(INDEX_TAG)
+
+            generation = _generation
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+            try:
+                entry = await _build_entry(request, func, args, kwargs, ttl_key, frozenset(tags))
+            except Exception as exc:
+                future.set_exception(exc)
+                future.exception()  # Mark retrieved — waiters (if any) re-raise it themselves
+                raise
+            else:
+                future.set_result(entry)
+                if generation == _generation:
+                    _backend.set(key, entry)
+            finally:
+                if not future.done():
+                    future.cancel()
+                if _inflight.get(key) is future:
+                    del _inflight[key]
+
+            return _respond(request, entry, "MISS")
+
+        return wrapper
+
+    return decorator
+
+
+# ── Invalidation & stats ────────────────────────────────────────────────
+
+
+def invalidate_simulation(simulation_id) -> None:
+    """Drop cached public responses for a simulation and the simulation index."""
+    global _generation  # noqa: PLW0603
+    _generation += 1
+    _stats["invalidations"] += 1
+    dropped = _backend.invalidate_tags({str(simulation_id), INDEX_TAG})
+    if dropped:
+        logger.debug("Invalidated public cache entries", extra={"simulation_id": str(simulation_id), "count": dropped})
+
+
+def get_stats() -> dict:
+    """Hit/miss counters and current entry count."""
+    lookups = _stats["hits"] + _stats["coalesced"] + _stats["misses"]
+    return {
+        **_stats,
+        "hit_rate": round((_stats["hits"] + _stats["coalesced"]) / lookups, 4) if lookups else 0.0,
+        "entries": len(_backend),
+    }
+
+
+def clear() -> None:
+    """Empty the cache and reset counters (admin TTL change, tests)."""
+    global _generation  # noqa: PLW0603
+    _generation += 1
+    _backend.clear()
+    for key in _stats:
+        _stats[key] = 0
@@ -8,6 +8,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.services.base_service import BaseService
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -35,23 +36,21 @@ class RelationshipService(BaseService):
         sim_str = str(simulation_id)
 
         # Fetch where agent is source
-        r1 = (
+        r1 = await run_query(
             supabase.table(cls.table_name)
             .select(cls._agent_select)
             .eq("simulation_id", sim_str)
             .eq("source_agent_id", agent_str)
             .order("intensity", desc=True)
-            .execute()
         )
 
         # Fetch where agent is target
-        r2 = (
+        r2 = await run_query(
             supabase.table(cls.table_name)
             .select(cls._agent_select)
             .eq("simulation_id", sim_str)
             .eq("target_agent_id", agent_str)
             .order("intensity", desc=True)
-            .execute()
         )
 
         return (r1.data or []) + (r2.data or [])
@@ -66,13 +65,12 @@ class RelationshipService(BaseService):
         offset: int = 0,
     ) -> tuple[list[dict], int]:
         """List all relationships in a simulation."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .select(cls._agent_select, count="exact")
             .eq("simulation_id", str(simulation_id))
             .order("intensity", desc=True)
             .range(offset, offset + limit - 1)
-            .execute()
         )
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -93,10 +91,9 @@ class RelationshipService(BaseService):
             "target_agent_id": str(data["target_agent_id"]),
         }
 
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .insert(insert_data)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -122,12 +119,11 @@ class RelationshipService(BaseService):
 
         update_data = {**data, "updated_at": datetime.now(UTC).isoformat()}
 
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .update(update_data)
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(relationship_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -7,13 +7,14 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from supabase import Client
 
 from backend.models.resonance import ARCHETYPE_DESCRIPTIONS
 from backend.services.base_service import BaseService, serialize_for_json
 from backend.services.event_service import EventService
 from backend.services.external_service_resolver import ExternalServiceResolver
 from backend.services.generation_service import GenerationService
+from backend.utils.db import run_query
+from supabase import Client
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +53,7 @@ class ResonanceService(BaseService):
 
         query = query.order("detected_at", desc=True)
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
 
@@ -63,12 +64,11 @@ class ResonanceService(BaseService):
         resonance_id: UUID,
     ) -> dict:
         """Get a single resonance by ID."""
-        response = (
+        response = await run_query(
             supabase.table(cls.view_name)
             .select("*")
             .eq("id", str(resonance_id))
             .limit(1)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -89,10 +89,9 @@ class ResonanceService(BaseService):
             **data,
             "created_by_id": str(user_id),
         })
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .insert(insert_data)
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -110,11 +109,10 @@ class ResonanceService(BaseService):
     ) -> dict:
         """Update a resonance."""
         update_data = serialize_for_json(data)
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .update(update_data)
             .eq("id", str(resonance_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -149,11 +147,10 @@ class ResonanceService(BaseService):
         resonance_id: UUID,
     ) -> dict:
         """Restore a soft-deleted resonance."""
-        response = (
+        response = await run_query(
             supabase.table(cls.table_name)
             .update({"deleted_at": None})
             .eq("id", str(resonance_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -171,12 +168,11 @@ class ResonanceService(BaseService):
         resonance_id: UUID,
     ) -> list[dict]:
         """List all impacts for a resonance, including simulation names."""
-        response = (
+        response = await run_query(
             supabase.table("resonance_impacts")
             .select("*, simulations(name)")
             .eq("resonance_id", str(resonance_id))
             .order("created_at", desc=True)
-            .execute()
         )
         # Flatten simulation name into each impact record
         for impact in response.data or []:
@@ -212,20 +208,18 @@ class ResonanceService(BaseService):
 
         # Get target simulations
         if simulation_ids:
-            sim_query = (
+            sim_query = await run_query(
                 supabase.table("simulations")
                 .select("id, name, slug, description")
                 .in_("id", [str(sid) for sid in simulation_ids])
                 .eq("status", "active")
-                .execute()
             )
         else:
-            sim_query = (
+            sim_query = await run_query(
                 supabase.table("simulations")
                 .select("id, name, slug, description")
                 .eq("status", "active")
                 .eq("simulation_type", "template")
-                .execute()
             )
         simulations = sim_query.data or []
 
@@ -262,10 +256,9 @@ class ResonanceService(BaseService):
                     "status": "failed",
                 })
                 try:
-                    resp = (
+                    resp = await run_query(
                         supabase.table("resonance_impacts")
                         .upsert(fail_data, on_conflict="resonance_id,simulation_id")
-                        .execute()
                     )
                     if resp.data:
                         impacts.append(resp.data[0])
@@ -291,17 +284,17 @@ class ResonanceService(BaseService):
         resonance_id = resonance["id"]
 
         # Get susceptibility via Postgres function
-        susc_resp = supabase.rpc(
+        susc_resp = await run_query(supabase.rpc(
             "fn_get_resonance_susceptibility",
             {"p_simulation_id": sim_id, "p_signature": signature},
-        ).execute()
+        ))
         susceptibility = float(susc_resp.data) if susc_resp.data is not None else 1.0
 
         # Get event types via Postgres function
-        types_resp = supabase.rpc(
+        types_resp = await run_query(supabase.rpc(
             "fn_get_resonance_event_types",
             {"p_simulation_id": sim_id, "p_signature": signature},
-        ).execute()
+        ))
         event_types = types_resp.data if types_resp.data else []
 
         # Create impact record (effective_magnitude computed by DB trigger)
@@ -312,10 +305,9 @@ class ResonanceService(BaseService):
             "effective_magnitude": 0,  # will be overwritten by trigger
             "status": "generating",
         })
-        impact_resp = (
+        impact_resp = await run_query(
             supabase.table("resonance_impacts")
             .upsert(impact_data, on_conflict="resonance_id,simulation_id")
-            .execute()
         )
         if not impact_resp.data:
             raise HTTPException(
@@ -370,11 +362,10 @@ class ResonanceService(BaseService):
             "spawned_event_ids": spawned_ids,
             "status": "completed" if spawned_ids else "failed",
         })
-        update_resp = (
+        update_resp = await run_query(
             supabase.table("resonance_impacts")
             .update(update_data)
             .eq("id", str(impact["id"]))
-            .execute()
         )
 
         # Trigger post-event-mutation pipeline for this simulation
@@ -471,6 +462,6 @@ class ResonanceService(BaseService):
         new_status: str,
     ) -> None:
         """Update a resonance impact status."""
-        supabase.table("resonance_impacts").update(
+        await run_query(supabase.table("resonance_impacts").update(
             {"status": new_status}
-        ).eq("id", impact_id).execute()
+        ).eq("id", impact_id))
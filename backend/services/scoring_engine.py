@@ -0,0 +1,205 @@
+"""Pure epoch scoring formulas — no I/O.
+
+``ScoringService`` loads the epoch's missions, echoes, zone stability,
+embassies and participants in a handful of bulk queries and hands them to
+``compute_raw_scores``, which scores every participant in one pass. The
+headless ``epoch_engine`` scores through the same functions.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+DIMENSIONS = ("stability", "influence", "sovereignty", "diplomatic", "military")
+
+# Default composite weights (sum to 100 for percentage-based composition)
+DEFAULT_SCORE_WEIGHTS: dict[str, float] = {
+    "stability": 25,
+    "influence": 20,
+    "sovereignty": 20,
+    "diplomatic": 15,
+    "military": 20,
+}
+
+# Sovereignty penalty per successful inbound mission, by operative type
+SOVEREIGNTY_PENALTIES: dict[str, float] = {
+    "spy": 2,
+    "propagandist": 6,
+    "infiltrator": 8,
+    "saboteur": 8,
+    "assassin": 12,
+}
+
+
+# ── Dimension formulas ───────────────────────────────────
+
+
+def stability_score(
+    zone_stabilities: list[float],
+    propaganda_count: int,
+    saboteur_count: int,
+    assassin_count: int,
+) -> float:
+    """avg(zone_stability) × 100 - propaganda×3 - saboteur×6 - assassin×5 (50 base without zones)."""
+    if zone_stabilities:
+        base_stability = (sum(zone_stabilities) / len(zone_stabilities)) * 100
+    else:
+        base_stability = 50.0
+    return max(0.0, base_stability - (propaganda_count * 3) - (saboteur_count * 6) - (assassin_count * 5))
+
+
+def influence_score(propagandist_wins: int, spy_wins: int, infiltrator_wins: int, echo_sum: float) -> float:
+    """(propagandist × 5) + (spy × 2) + (infiltrator × 3) + echo_strength_sum."""
+    return (propagandist_wins * 5) + (spy_wins * 2) + (infiltrator_wins * 3) + echo_sum
+
+
+def sovereignty_score(inbound: list[dict], guardian_count: int) -> float:
+    """100 - type penalties (successful inbound) + 3 per detected/captured + 4 per guardian, in [0, 100]."""
+    penalty_total = 0.0
+    detected_count = 0
+    for m in inbound:
+        if m["status"] == "success":
+            penalty_total += SOVEREIGNTY_PENALTIES.get(m["operative_type"], 5)
+        elif m["status"] in ("detected", "captured"):
+            detected_count += 1
+    return max(0.0, min(100.0, 100.0 - penalty_total + (detected_count * 3) + (guardian_count * 4)))
+
+
+def diplomatic_score(
+    total_effectiveness: float,
+    embassy_count: int,
+    spy_bonus: int,
+    ally_count: int,
+    betrayal_penalty: float,
+) -> float:
+    """(sum(embassy_eff) × 10 + spy_bonus) × (1 + 0.15 × allies) × (1 - betrayal_penalty).
+
+    Falls back to 0.5 per active embassy when the materialized view has no data.
+    """
+    if total_effectiveness == 0:
+        total_effectiveness = embassy_count * 0.5
+    base_score = total_effectiveness * 10
+    alliance_multiplier = 1.0 + (0.15 * ally_count)
+    betrayal_multiplier = 1.0 - betrayal_penalty
+    return (base_score + spy_bonus) * alliance_multiplier * betrayal_multiplier
+
+
+def military_score(outbound: list[dict]) -> float:
+    """sum(mission_value) - detection penalties, floored at 0."""
+    from backend.services.operative_service import DETECTION_PENALTY, MISSION_SCORE_VALUES
+
+    score = 0.0
+    for mission in outbound:
+        if mission["status"] == "success":
+            score += MISSION_SCORE_VALUES.get(mission["operative_type"], 2)
+        elif mission["status"] in ("detected", "captured"):
+            score -= DETECTION_PENALTY
+    # Military is an achievement score, not a debt score
+    return max(score, 0.0)
+
+
+# ── Batch scoring ─────────────────────────────────────────
+
+
+@dataclass
+class EpochScoringData:
+    """Everything needed to score all participants of one epoch cycle."""
+
+    missions: list[dict] = field(default_factory=list)  # source/target_simulation_id, operative_type, status
+    zone_stability: list[dict] = field(default_factory=list)  # simulation_id, stability
+    propaganda_events: list[dict] = field(default_factory=list)  # simulation_id
+    echoes: list[dict] = field(default_factory=list)  # source_simulation_id, echo_strength (completed only)
+    embassy_effectiveness: list[dict] = field(default_factory=list)  # simulation_a_id, simulation_b_id, effectiveness
+    active_embassies: list[dict] = field(default_factory=list)  # simulation_a_id, simulation_b_id
+    participants: list[dict] = field(default_factory=list)  # simulation_id, team_id, betrayal_penalty
+
+
+def compute_raw_scores(simulation_ids: list[str], data: EpochScoringData) -> dict[str, dict[str, float]]:
+    """Raw (un-normalized) scores for every simulation, in one pass over each input."""
+    wanted = set(simulation_ids)
+
+    zones: dict[str, list[float]] = defaultdict(list)
+    for row in data.zone_stability:
+        zones[row["simulation_id"]].append(float(row["stability"]))
+
+    propaganda = Counter(row["simulation_id"] for row in data.propaganda_events)
+
+    echo_sum: dict[str, float] = defaultdict(float)
+    for e in data.echoes:
+        echo_sum[e["source_simulation_id"]] += e.get("echo_strength", 0)
+
+    inbound: dict[str, list[dict]] = defaultdict(list)
+    outbound: dict[str, list[dict]] = defaultdict(list)
+    for m in data.missions:
+        if m.get("target_simulation_id") in wanted:
+            inbound[m["target_simulation_id"]].append(m)
+        if m.get("source_simulation_id") in wanted:
+            outbound[m["source_simulation_id"]].append(m)
+
+    effectiveness: dict[str, float] = defaultdict(float)
+    for row in data.embassy_effectiveness:
+        for sim in {row.get("simulation_a_id"), row.get("simulation_b_id")}:
+            effectiveness[sim] += float(row.get("effectiveness", 0))
+
+    embassies = Counter()
+    for row in data.active_embassies:
+        for sim in {row.get("simulation_a_id"), row.get("simulation_b_id")}:
+            embassies[sim] += 1
+
+    participant_by_sim = {p["simulation_id"]: p for p in data.participants}
+    team_sizes = Counter(p["team_id"] for p in data.participants if p.get("team_id"))
+
+    results: dict[str, dict[str, float]] = {}
+    for sim in simulation_ids:
+        ins = inbound[sim]
+        outs = outbound[sim]
+        inbound_success = Counter(m["operative_type"] for m in ins if m["status"] == "success")
+        outbound_success = Counter(m["operative_type"] for m in outs if m["status"] == "success")
+        guardians = sum(1 for m in outs if m["operative_type"] == "guardian" and m["status"] == "active")
+
+        participant = participant_by_sim.get(sim) or {}
+        team_id = participant.get("team_id")
+        allies = max(0, team_sizes[team_id] - 1) if team_id else 0
+
+        results[sim] = {
+            "stability": stability_score(
+                zones[sim], propaganda[sim], inbound_success["saboteur"], inbound_success["assassin"],
+            ),
+            "influence": influence_score(
+                outbound_success["propagandist"], outbound_success["spy"], outbound_success["infiltrator"],
+                echo_sum[sim],
+            ),
+            "sovereignty": sovereignty_score(
+                [m for m in ins if m["status"] in ("success", "detected", "captured")], guardians,
+            ),
+            "diplomatic": diplomatic_score(
+                effectiveness[sim], embassies[sim], outbound_success["spy"], allies,
+                float(participant.get("betrayal_penalty") or 0),
+            ),
+            "military": military_score(
+                [m for m in outs if m["status"] in ("success", "failed", "detected", "captured")],
+            ),
+        }
+    return results
+
+
+def composite_scores(rows: list[dict], weights: dict | None = None) -> list[float]:
+    """Max-normalize each ``<dim>_score`` column to 0-100 and return weighted composites.
+
+    Each dimension is scaled so the best performer scores 100; a floor of 1.0
+    on the max avoids division by zero when everyone scores 0. Composites are
+    ``sum(normalized[dim] × weight[dim] / 100)`` rounded to 2 decimals.
+    """
+    weights = weights or {}
+    w = {dim: weights.get(dim, DEFAULT_SCORE_WEIGHTS[dim]) for dim in DIMENSIONS}
+
+    maxes = {}
+    for dim in DIMENSIONS:
+        values = [row[f"{dim}_score"] for row in rows]
+        maxes[dim] = max(values) if values and max(values) > 0 else 1.0
+
+    return [
+        round(sum((row[f"{dim}_score"] / maxes[dim]) * 100 * w[dim] / 100 for dim in DIMENSIONS), 2)
+        for row in rows
+    ]
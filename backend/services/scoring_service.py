@@ -1,11 +1,16 @@
 """Epoch scoring — 5-dimension scoring, normalization, and compositing."""
 
+import asyncio
 import logging
 from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.services import epoch_replay
 from backend.services.epoch_service import DEFAULT_CONFIG, EpochService
+from backend.services.game_mechanics_service import GameMechanicsService
+from backend.services.scoring_engine import EpochScoringData, composite_scores, compute_raw_scores
+from backend.utils.db import fetch_all, gather_queries, run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -22,432 +27,129 @@ class ScoringService:
         supabase: Client,
         epoch_id: UUID,
         cycle_number: int,
+        replay_db: Client | None = None,
     ) -> list[dict]:
-        """Compute and store scores for all participants in the current cycle."""
+        """Compute and store scores for all participants in the current cycle.
+
+        Loads the epoch's scoring inputs in a few bulk queries, scores every
+        participant in memory (``scoring_engine``), normalizes, and writes all
+        rows — composites included — in one upsert. With ``replay_db`` (a
+        service-role client) the inputs and scores go to the replay log.
+        """
         logger.info("Computing cycle scores", extra={"epoch_id": str(epoch_id), "cycle_number": cycle_number})
-        # Refresh materialized views so freshly cloned game instances have data
+        epoch, participants = await asyncio.gather(
+            EpochService.get(supabase, epoch_id),
+            EpochService.list_participants(supabase, epoch_id),
+        )
+        if not participants:
+            return []
+
+        sim_ids = [p["simulation_id"] for p in participants]
+        # Recompute this epoch's game metrics only — other simulations are untouched
         try:
-            supabase.rpc("refresh_all_game_metrics").execute()
+            await GameMechanicsService.refresh_metrics(supabase, sim_ids)
         except Exception:
-            logger.warning("Failed to refresh materialized views before scoring")
-
-        epoch = await EpochService.get(supabase, epoch_id)
-        participants = await EpochService.list_participants(supabase, epoch_id)
+            logger.warning("Failed to refresh game metrics before scoring", extra={"epoch_id": str(epoch_id)})
+        data = await cls._load_scoring_data(supabase, epoch_id, sim_ids, participants)
+        raw_by_sim = compute_raw_scores(sim_ids, data)
 
-        scores = []
-        for p in participants:
-            sim_id = p["simulation_id"]
-            raw = await cls._compute_raw_scores(supabase, epoch_id, sim_id, epoch)
-
-            score_data = {
+        rows = [
+            {
                 "epoch_id": str(epoch_id),
                 "simulation_id": sim_id,
                 "cycle_number": cycle_number,
-                "stability_score": raw["stability"],
-                "influence_score": raw["influence"],
-                "sovereignty_score": raw["sovereignty"],
-                "diplomatic_score": raw["diplomatic"],
-                "military_score": raw["military"],
-                "composite_score": 0,  # computed after normalization
+                "stability_score": raw_by_sim[sim_id]["stability"],
+                "influence_score": raw_by_sim[sim_id]["influence"],
+                "sovereignty_score": raw_by_sim[sim_id]["sovereignty"],
+                "diplomatic_score": raw_by_sim[sim_id]["diplomatic"],
+                "military_score": raw_by_sim[sim_id]["military"],
             }
+            for sim_id in sim_ids
+        ]
+        config = {**DEFAULT_CONFIG, **epoch.get("config", {})}
+        for row, composite in zip(rows, composite_scores(rows, config.get("score_weights", {})), strict=True):
+            row["composite_score"] = composite
 
-            resp = (
-                supabase.table("epoch_scores")
-                .upsert(score_data, on_conflict="epoch_id,simulation_id,cycle_number")
-                .execute()
+        if replay_db is not None:
+            await epoch_replay.record(
+                replay_db, epoch_id, cycle_number, "scoring",
+                epoch_replay.scoring_record(data, rows, config.get("score_weights", {})),
             )
-            if resp.data:
-                scores.append(resp.data[0])
-            else:
+
+        resp = await run_query(
+            supabase.table("epoch_scores")
+            .upsert(rows, on_conflict="epoch_id,simulation_id,cycle_number")
+        )
+        scores = resp.data or []
+
+        stored = {row.get("simulation_id") for row in scores}
+        for sim_id in sim_ids:
+            if sim_id not in stored:
                 logger.warning(
                     "Score upsert returned no data",
                     extra={"simulation_id": sim_id, "epoch_id": str(epoch_id), "cycle_number": cycle_number},
                 )
 
-        # Normalize and compute composites
-        if scores:
-            scores = await cls._normalize_and_composite(supabase, epoch_id, cycle_number, epoch)
-
         return scores
 
     @classmethod
-    async def _compute_raw_scores(
+    async def _load_scoring_data(
         cls,
         supabase: Client,
         epoch_id: UUID,
-        simulation_id: str,
-        epoch: dict,
-    ) -> dict:
-        """Compute raw (un-normalized) scores for a simulation."""
-        stability = await cls._compute_stability(supabase, epoch_id, simulation_id)
-        influence = await cls._compute_influence(supabase, epoch_id, simulation_id)
-        sovereignty = await cls._compute_sovereignty(supabase, epoch_id, simulation_id)
-        diplomatic = await cls._compute_diplomatic(supabase, epoch_id, simulation_id)
-        military = await cls._compute_military(supabase, epoch_id, simulation_id)
-
-        return {
-            "stability": stability,
-            "influence": influence,
-            "sovereignty": sovereignty,
-            "diplomatic": diplomatic,
-            "military": military,
-        }
-
-    @classmethod
-    async def _compute_stability(
-        cls, supabase: Client, epoch_id: UUID, simulation_id: str
-    ) -> float:
-        """Stability = avg(zone_stability) × 100 - propaganda×3 - saboteur×6 - assassin×5.
-
-        Rewards keeping infrastructure healthy.
-        Penalized by inbound propaganda events, sabotage, and assassinations.
-        """
-        resp = (
-            supabase.table("mv_zone_stability")
-            .select("stability")
-            .eq("simulation_id", simulation_id)
-            .execute()
-        )
-        if not resp.data:
-            base_stability = 50.0
-        else:
-            stabilities = [float(row["stability"]) for row in resp.data]
-            base_stability = (sum(stabilities) / len(stabilities)) * 100
-
-        # Count inbound propaganda events (created by propagandist operatives)
-        propaganda_resp = (
-            supabase.table("events")
-            .select("id", count="exact")
-            .eq("simulation_id", simulation_id)
-            .eq("data_source", "propagandist")
-            .execute()
-        )
-        propaganda_count = propaganda_resp.count or 0
-
-        # Count successful inbound saboteur and assassin missions
-        inbound_resp = (
-            supabase.table("operative_missions")
-            .select("operative_type")
-            .eq("epoch_id", str(epoch_id))
-            .eq("target_simulation_id", simulation_id)
-            .eq("status", "success")
-            .in_("operative_type", ["saboteur", "assassin"])
-            .execute()
-        )
-        saboteur_count = sum(
-            1 for m in (inbound_resp.data or []) if m["operative_type"] == "saboteur"
-        )
-        assassin_count = sum(
-            1 for m in (inbound_resp.data or []) if m["operative_type"] == "assassin"
-        )
-
-        return max(0.0, base_stability - (propaganda_count * 3) - (saboteur_count * 6) - (assassin_count * 5))
-
-    @classmethod
-    async def _compute_influence(
-        cls, supabase: Client, epoch_id: UUID, simulation_id: str
-    ) -> float:
-        """Influence = (propagandist × 5) + (spy × 2) + (infiltrator × 3) + echo_strength_sum.
-
-        Rewards projecting cultural and intelligence power.
-        """
-        # Successful outbound propaganda, spy, and infiltrator missions
-        missions_resp = (
-            supabase.table("operative_missions")
-            .select("operative_type")
-            .eq("epoch_id", str(epoch_id))
-            .eq("source_simulation_id", simulation_id)
-            .eq("status", "success")
-            .in_("operative_type", ["propagandist", "spy", "infiltrator"])
-            .execute()
-        )
-        propagandist_wins = sum(
-            1 for m in (missions_resp.data or []) if m["operative_type"] == "propagandist"
-        )
-        spy_wins = sum(
-            1 for m in (missions_resp.data or []) if m["operative_type"] == "spy"
-        )
-        infiltrator_wins = sum(
-            1 for m in (missions_resp.data or []) if m["operative_type"] == "infiltrator"
-        )
-
-        # Echo strength (bleed system — may be 0 in competitive play)
-        echo_resp = (
-            supabase.table("event_echoes")
-            .select("echo_strength")
-            .eq("source_simulation_id", simulation_id)
-            .eq("status", "completed")
-            .execute()
-        )
-        echo_sum = sum(e.get("echo_strength", 0) for e in echo_resp.data or [])
-
-        return (propagandist_wins * 5) + (spy_wins * 2) + (infiltrator_wins * 3) + echo_sum
-
-    @classmethod
-    async def _compute_sovereignty(
-        cls, supabase: Client, epoch_id: UUID, simulation_id: str
-    ) -> float:
-        """Sovereignty = 100 - type_penalties + detected_bonus + guardian_bonus.
-
-        Penalties per successful inbound mission type:
-          spy: -2, propagandist: -6, infiltrator: -8, saboteur: -8, assassin: -12
-        Bonuses:
-          +3 per detected inbound mission
-          +4 per active guardian
-
-        Rewards defending your simulation from foreign operatives.
-        Clamped to [0, 100].
-        """
-        type_penalties = {
-            "spy": 2,
-            "propagandist": 6,
-            "infiltrator": 8,
-            "saboteur": 8,
-            "assassin": 12,
-        }
-
-        # Successful inbound missions (attacks against this sim)
-        inbound_resp = (
-            supabase.table("operative_missions")
-            .select("operative_type, status")
-            .eq("epoch_id", str(epoch_id))
-            .eq("target_simulation_id", simulation_id)
-            .in_("status", ["success", "detected", "captured"])
-            .execute()
-        )
-
-        penalty_total = 0.0
-        detected_count = 0
-        for m in inbound_resp.data or []:
-            if m["status"] == "success":
-                penalty_total += type_penalties.get(m["operative_type"], 5)
-            elif m["status"] in ("detected", "captured"):
-                detected_count += 1
-
-        # Active guardians defending this sim
-        guardian_resp = (
-            supabase.table("operative_missions")
-            .select("id")
-            .eq("epoch_id", str(epoch_id))
-            .eq("operative_type", "guardian")
-            .eq("source_simulation_id", simulation_id)
-            .eq("status", "active")
-            .execute()
-        )
-        guardian_count = len(guardian_resp.data or [])
-
-        return max(0.0, min(100.0,
-            100.0 - penalty_total + (detected_count * 3) + (guardian_count * 4)
-        ))
-
-    @classmethod
-    async def _compute_diplomatic(
-        cls, supabase: Client, epoch_id: UUID, simulation_id: str
-    ) -> float:
-        """Diplomatic = (sum(embassy_eff) × 10 + spy_bonus) × (1 + 0.15 × allies) × (1 - betrayal_penalty).
-
-        Rewards building and maintaining diplomatic networks.
-        Alliance bonus (+15% per ally) rewards cooperation; betrayal penalty (-25%) punishes treachery.
-        Spy intel bonus (+1 per successful spy mission) adds diplomatic leverage.
-        """
-        # Embassy effectiveness from materialized view
-        # MV has simulation_a_id and simulation_b_id, not simulation_id
-        resp = (
-            supabase.table("mv_embassy_effectiveness")
-            .select("effectiveness")
-            .or_(
-                f"simulation_a_id.eq.{simulation_id},"
-                f"simulation_b_id.eq.{simulation_id}"
-            )
-            .execute()
-        )
-        total_effectiveness = sum(float(e.get("effectiveness", 0)) for e in resp.data or [])
-
-        # Count active embassies as base diplomatic score
-        embassy_resp = (
-            supabase.table("embassies")
-            .select("id")
-            .eq("status", "active")
-            .or_(
-                f"simulation_a_id.eq.{simulation_id},"
-                f"simulation_b_id.eq.{simulation_id}"
-            )
-            .execute()
-        )
-        embassy_count = len(embassy_resp.data or [])
-
-        # Fallback: if no materialized view data, use embassy count
-        if total_effectiveness == 0:
-            total_effectiveness = embassy_count * 0.5
-
-        base_score = total_effectiveness * 10  # scale up for scoring
-
-        # A4: Alliance bonus — +15% per active ally
-        active_alliance_count = 0
-        participant_resp = (
-            supabase.table("epoch_participants")
-            .select("team_id, betrayal_penalty")
-            .eq("epoch_id", str(epoch_id))
-            .eq("simulation_id", simulation_id)
-            .maybe_single()
-            .execute()
-        )
-        betrayal_penalty = 0.0
-        if participant_resp.data:
-            team_id = participant_resp.data.get("team_id")
-            betrayal_penalty = float(participant_resp.data.get("betrayal_penalty") or 0)
-            if team_id:
-                allies_resp = (
-                    supabase.table("epoch_participants")
-                    .select("id")
-                    .eq("team_id", team_id)
-                    .execute()
-                )
-                active_alliance_count = max(0, len(allies_resp.data or []) - 1)
-
-        alliance_multiplier = 1.0 + (0.15 * active_alliance_count)
-
-        # A5: Betrayal penalty — -25% diplomatic on detected betrayal
-        betrayal_multiplier = 1.0 - betrayal_penalty
-
-        # Spy diplomatic bonus: +1 per successful outbound spy mission
-        spy_resp = (
-            supabase.table("operative_missions")
-            .select("id", count="exact")
-            .eq("epoch_id", str(epoch_id))
-            .eq("source_simulation_id", simulation_id)
-            .eq("operative_type", "spy")
-            .eq("status", "success")
-            .execute()
+        sim_ids: list[str],
+        participants: list[dict],
+    ) -> EpochScoringData:
+        """Bulk-load every scoring input for the epoch (all participants at once)."""
+        sims_csv = ",".join(sim_ids)
+
+        missions, propaganda, echoes, (zone_resp, eff_resp, embassy_resp) = await asyncio.gather(
+            fetch_all(lambda: (
+                supabase.table("operative_missions")
+                .select("id, source_simulation_id, target_simulation_id, operative_type, status")
+                .eq("epoch_id", str(epoch_id))
+                .in_("status", ["success", "failed", "detected", "captured", "active"])
+                .order("id")
+            )),
+            fetch_all(lambda: (
+                supabase.table("events")
+                .select("id, simulation_id")
+                .in_("simulation_id", sim_ids)
+                .eq("data_source", "propagandist")
+                .order("id")
+            )),
+            fetch_all(lambda: (
+                supabase.table("event_echoes")
+                .select("id, source_simulation_id, echo_strength")
+                .in_("source_simulation_id", sim_ids)
+                .eq("status", "completed")
+                .order("id")
+            )),
+            gather_queries(
+                supabase.table("mv_zone_stability")
+                .select("simulation_id, stability")
+                .in_("simulation_id", sim_ids),
+                # MV has simulation_a_id and simulation_b_id, not simulation_id
+                supabase.table("mv_embassy_effectiveness")
+                .select("simulation_a_id, simulation_b_id, effectiveness")
+                .or_(f"simulation_a_id.in.({sims_csv}),simulation_b_id.in.({sims_csv})"),
+                supabase.table("embassies")
+                .select("simulation_a_id, simulation_b_id")
+                .eq("status", "active")
+                .or_(f"simulation_a_id.in.({sims_csv}),simulation_b_id.in.({sims_csv})"),
+            ),
         )
-        spy_bonus = spy_resp.count or 0
-
-        return (base_score + spy_bonus) * alliance_multiplier * betrayal_multiplier
 
-    @classmethod
-    async def _compute_military(
-        cls, supabase: Client, epoch_id: UUID, simulation_id: str
-    ) -> float:
-        """Military = sum(mission_value) - sum(failure_penalty).
-
-        Rewards successful covert operations.
-        """
-        from backend.services.operative_service import DETECTION_PENALTY, MISSION_SCORE_VALUES
-
-        resp = (
-            supabase.table("operative_missions")
-            .select("operative_type, status")
-            .eq("epoch_id", str(epoch_id))
-            .eq("source_simulation_id", simulation_id)
-            .in_("status", ["success", "failed", "detected", "captured"])
-            .execute()
+        return EpochScoringData(
+            missions=missions,
+            zone_stability=zone_resp.data or [],
+            propaganda_events=propaganda,
+            echoes=echoes,
+            embassy_effectiveness=eff_resp.data or [],
+            active_embassies=embassy_resp.data or [],
+            participants=participants,
         )
 
-        score = 0.0
-        for mission in resp.data or []:
-            if mission["status"] == "success":
-                score += MISSION_SCORE_VALUES.get(mission["operative_type"], 2)
-            elif mission["status"] in ("detected", "captured"):
-                score -= DETECTION_PENALTY
-
-        # Floor at 0 — military is an achievement score, not a debt score.
-        # Without this floor, a player who attempts many failed missions
-        # ends up with unbounded negative composite that dominates all other
-        # dimensions (e.g., -6000 normalized from 20 detections).
-        return max(score, 0.0)
-
-    # ── Normalization ─────────────────────────────────────
-
-    @classmethod
-    async def _normalize_and_composite(
-        cls,
-        supabase: Client,
-        epoch_id: UUID,
-        cycle_number: int,
-        epoch: dict,
-    ) -> list[dict]:
-        """Normalize raw scores across participants and compute weighted composites.
-
-        Normalization algorithm (two-pass):
-
-        Pass 1 — Max-normalize per dimension:
-            For each of the 5 scoring dimensions (stability, influence,
-            sovereignty, diplomatic, military), find the maximum raw value
-            among all participants in this cycle. Each participant's raw
-            score is then scaled to 0-100 relative to that maximum:
-                normalized[dim] = (raw / max_raw) * 100
-            This ensures fair comparison regardless of absolute magnitude
-            differences between dimensions (e.g. stability ~0-100 vs
-            military ~0-20). If a dimension's max is 0, all values stay 0.
-
-        Pass 2 — Weighted composite:
-            The 5 normalized scores are combined into a single composite
-            using configurable weights (from epoch.config.score_weights,
-            defaulting to stability=25, influence=20, sovereignty=20,
-            diplomatic=15, military=20, summing to 100):
-                composite = sum(normalized[dim] * weight[dim] / 100)
-            Result is rounded to 2 decimal places and persisted.
-
-        Each participant's composite_score is upserted back to the
-        epoch_scores table.
-        """
-        config = {**DEFAULT_CONFIG, **epoch.get("config", {})}
-        weights = config.get("score_weights", {})
-
-        # Fetch raw scores for this cycle
-        resp = (
-            supabase.table("epoch_scores")
-            .select("*")
-            .eq("epoch_id", str(epoch_id))
-            .eq("cycle_number", cycle_number)
-            .execute()
-        )
-        scores = resp.data or []
-        if not scores:
-            return []
-
-        # Pass 1: Find max in each dimension for normalization.
-        # Each dimension is independently scaled so that the best performer
-        # scores 100 and others are proportional. A floor of 1.0 prevents
-        # division by zero when all participants score 0 in a dimension.
-        dimensions = ["stability", "influence", "sovereignty", "diplomatic", "military"]
-        maxes = {}
-        for dim in dimensions:
-            col = f"{dim}_score"
-            values = [s[col] for s in scores]
-            maxes[dim] = max(values) if values and max(values) > 0 else 1.0
-
-        # Default weights (sum to 100 for percentage-based composition)
-        w = {
-            "stability": weights.get("stability", 25),
-            "influence": weights.get("influence", 20),
-            "sovereignty": weights.get("sovereignty", 20),
-            "diplomatic": weights.get("diplomatic", 15),
-            "military": weights.get("military", 20),
-        }
-
-        # Pass 2: Normalize each participant and compute weighted composite
-        updated = []
-        for s in scores:
-            normalized = {}
-            for dim in dimensions:
-                col = f"{dim}_score"
-                raw = s[col]
-                normalized[dim] = (raw / maxes[dim]) * 100 if maxes[dim] > 0 else 0
-
-            composite = sum(
-                normalized[dim] * w[dim] / 100 for dim in dimensions
-            )
-
-            supabase.table("epoch_scores").update(
-                {"composite_score": round(composite, 2)}
-            ).eq("id", s["id"]).execute()
-
-            s["composite_score"] = round(composite, 2)
-            updated.append(s)
-
-        return updated
-
     # ── Leaderboard ───────────────────────────────────────
 
     @classmethod
@@ -469,26 +171,24 @@ class ScoringService:
         # points one past the last resolved cycle, so querying it directly
         # returns empty for completed epochs.
         if cycle_number is None:
-            max_resp = (
+            max_resp = await run_query(
                 supabase.table("epoch_scores")
                 .select("cycle_number")
                 .eq("epoch_id", str(epoch_id))
                 .order("cycle_number", desc=True)
                 .limit(1)
-                .execute()
             )
             if max_resp.data:
                 cycle_number = max_resp.data[0]["cycle_number"]
             else:
                 cycle_number = epoch.get("current_cycle", 1)
 
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_scores")
             .select("*, simulations(name, slug)")
             .eq("epoch_id", str(epoch_id))
             .eq("cycle_number", cycle_number)
             .order("composite_score", desc=True)
-            .execute()
         )
 
         scores = resp.data or []
@@ -496,11 +196,10 @@ class ScoringService:
             return []
 
         # Batch-fetch all participant team assignments for this epoch
-        participants_resp = (
+        participants_resp = await run_query(
             supabase.table("epoch_participants")
             .select("simulation_id, team_id, epoch_teams(name)")
             .eq("epoch_id", str(epoch_id))
-            .execute()
         )
         team_by_sim: dict[str, str | None] = {}
         for p in participants_resp.data or []:
@@ -534,13 +233,12 @@ class ScoringService:
         simulation_id: UUID,
     ) -> list[dict]:
         """Get all cycle scores for a simulation in an epoch."""
-        resp = (
+        resp = await run_query(
             supabase.table("epoch_scores")
             .select("*")
             .eq("epoch_id", str(epoch_id))
             .eq("simulation_id", str(simulation_id))
             .order("cycle_number")
-            .execute()
         )
         return resp.data or []
 
@@ -7,6 +7,8 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.models.settings import is_sensitive_key
+from backend.services import ai_config_cache
+from backend.utils.db import run_query
 from backend.utils.encryption import decrypt, encrypt, mask
 from supabase import Client
 
@@ -34,7 +36,7 @@ class SettingsService:
         if category:
             query = query.eq("category", category)
 
-        response = query.execute()
+        response = await run_query(query)
         return [_mask_if_encrypted(s) for s in (response.data or [])]
 
     @staticmethod
@@ -44,13 +46,12 @@ class SettingsService:
         setting_id: UUID,
     ) -> dict:
         """Get a single setting by ID."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_settings")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(setting_id))
             .limit(1)
-            .execute()
         )
         if not response or not response.data:
             raise HTTPException(
@@ -83,10 +84,9 @@ class SettingsService:
             "updated_at": datetime.now(UTC).isoformat(),
         }
 
-        response = (
+        response = await run_query(
             supabase.table("simulation_settings")
             .upsert(insert_data, on_conflict="simulation_id,category,setting_key")
-            .execute()
         )
 
         if not response.data:
@@ -95,6 +95,7 @@ class SettingsService:
                 detail="Failed to save setting.",
             )
 
+        ai_config_cache.invalidate_simulation(simulation_id)
         return _mask_if_encrypted(response.data[0])
 
     @staticmethod
@@ -104,18 +105,18 @@ class SettingsService:
         setting_id: UUID,
     ) -> dict:
         """Delete a setting."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_settings")
             .delete()
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(setting_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Setting '{setting_id}' not found.",
             )
+        ai_config_cache.invalidate_simulation(simulation_id)
         return response.data[0]
 
 
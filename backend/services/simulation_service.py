@@ -6,6 +6,8 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.models.simulation import SimulationCreate, SimulationUpdate
+from backend.services import public_cache
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -38,12 +40,11 @@ class SimulationService:
         # Get simulation IDs the user is a member of (templates only).
         # Filter at join level to avoid URI-too-long errors when the user has
         # many game instance / archived memberships (PostgREST URI limit).
-        membership_response = (
+        membership_response = await run_query(
             supabase.table("simulation_members")
             .select("simulation_id, simulations!inner(simulation_type)")
             .eq("user_id", str(user_id))
             .eq("simulations.simulation_type", "template")
-            .execute()
         )
 
         sim_ids = [m["simulation_id"] for m in (membership_response.data or [])]
@@ -65,7 +66,7 @@ class SimulationService:
             query = query.eq("status", status_filter)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         data = response.data or []
@@ -73,11 +74,10 @@ class SimulationService:
         # Enrich with counts from the simulation_dashboard view
         if data:
             ids = [s["id"] for s in data]
-            count_response = (
+            count_response = await run_query(
                 supabase.table("simulation_dashboard")
                 .select("simulation_id, agent_count, building_count, event_count, member_count")
                 .in_("simulation_id", ids)
-                .execute()
             )
             counts_map = {
                 row["simulation_id"]: row
@@ -102,12 +102,11 @@ class SimulationService:
         slug = data.slug if data.slug else _slugify(data.name)
 
         # Check slug uniqueness
-        existing = (
+        existing = await run_query(
             supabase.table("simulations")
             .select("id")
             .eq("slug", slug)
             .limit(1)
-            .execute()
         )
 
         if existing and existing.data:
@@ -127,10 +126,9 @@ class SimulationService:
             "owner_id": str(user_id),
         }
 
-        sim_response = (
+        sim_response = await run_query(
             supabase.table("simulations")
             .insert(sim_data)
-            .execute()
         )
 
         if not sim_response.data:
@@ -146,11 +144,11 @@ class SimulationService:
         )
 
         # Add creator as owner member
-        supabase.table("simulation_members").insert({
+        await run_query(supabase.table("simulation_members").insert({
             "simulation_id": simulation["id"],
             "user_id": str(user_id),
             "member_role": "owner",
-        }).execute()
+        }))
 
         return simulation
 
@@ -160,12 +158,11 @@ class SimulationService:
         simulation_id: UUID,
     ) -> dict:
         """Get a single simulation from the simulation_dashboard view."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_dashboard")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .limit(1)
-            .execute()
         )
 
         if not response or not response.data:
@@ -193,12 +190,11 @@ class SimulationService:
 
         update_data["updated_at"] = datetime.now(UTC).isoformat()
 
-        response = (
+        response = await run_query(
             supabase.table("simulations")
             .update(update_data)
             .eq("id", str(simulation_id))
             .is_("deleted_at", "null")
-            .execute()
         )
 
         if not response.data:
@@ -207,6 +203,7 @@ class SimulationService:
                 detail=f"Simulation '{simulation_id}' not found.",
             )
 
+        public_cache.invalidate_simulation(simulation_id)
         return response.data[0]
 
     @staticmethod
@@ -215,7 +212,7 @@ class SimulationService:
         simulation_id: UUID,
     ) -> dict:
         """Soft-delete a simulation by setting deleted_at."""
-        response = (
+        response = await run_query(
             supabase.table("simulations")
             .update({
                 "deleted_at": datetime.now(UTC).isoformat(),
@@ -223,7 +220,6 @@ class SimulationService:
             })
             .eq("id", str(simulation_id))
             .is_("deleted_at", "null")
-            .execute()
         )
 
         if not response.data:
@@ -233,6 +229,7 @@ class SimulationService:
             )
 
         logger.info("Simulation soft-deleted", extra={"simulation_id": str(simulation_id)})
+        public_cache.invalidate_simulation(simulation_id)
         return response.data[0]
 
     @staticmethod
@@ -245,12 +242,11 @@ class SimulationService:
         Uses admin (service_role) client to bypass RLS.
         FK CASCADE handles dependent rows (members, agents, buildings, etc.).
         """
-        fetch = (
+        fetch = await run_query(
             supabase.table("simulations")
             .select("id, name, slug")
             .eq("id", str(simulation_id))
             .maybe_single()
-            .execute()
         )
         if not fetch.data:
             raise HTTPException(
@@ -267,7 +263,8 @@ class SimulationService:
                 "slug": sim_info.get("slug"),
             },
         )
-        supabase.table("simulations").delete().eq("id", str(simulation_id)).execute()
+        await run_query(supabase.table("simulations").delete().eq("id", str(simulation_id)))
+        public_cache.invalidate_simulation(simulation_id)
         return sim_info
 
     @staticmethod
@@ -289,7 +286,7 @@ class SimulationService:
             query = query.is_("deleted_at", "null")
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -309,7 +306,7 @@ class SimulationService:
             .order("deleted_at", desc=True)
             .range(offset, offset + limit - 1)
         )
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -320,7 +317,7 @@ class SimulationService:
         simulation_id: UUID,
     ) -> dict:
         """Restore a soft-deleted simulation."""
-        response = (
+        response = await run_query(
             supabase.table("simulations")
             .update({
                 "deleted_at": None,
@@ -328,7 +325,6 @@ class SimulationService:
             })
             .eq("id", str(simulation_id))
             .not_.is_("deleted_at", "null")
-            .execute()
         )
 
         if not response.data:
@@ -338,4 +334,5 @@ class SimulationService:
             )
 
         logger.info("Simulation restored", extra={"simulation_id": str(simulation_id)})
+        public_cache.invalidate_simulation(simulation_id)
         return response.data[0]
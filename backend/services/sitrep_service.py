@@ -5,6 +5,7 @@ import logging
 
 from backend.config import settings
 from backend.services.generation_service import GenerationService
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -38,7 +39,7 @@ class SitrepService:
         }
         if simulation_id:
             params["p_simulation_id"] = simulation_id
-        response = supabase.rpc("get_cycle_battle_summary", params).execute()
+        response = await run_query(supabase.rpc("get_cycle_battle_summary", params))
         return response.data if response.data else {
             "cycle_number": cycle_number,
             "missions_deployed": 0,
@@ -74,14 +75,13 @@ class SitrepService:
         # Resolve simulation_id for GenerationService (use first participant if not specified)
         gen_sim_id = simulation_id
         if not gen_sim_id:
-            epoch = supabase.table("game_epochs").select("id").eq("id", epoch_id).limit(1).execute()
+            epoch = await run_query(supabase.table("game_epochs").select("id").eq("id", epoch_id).limit(1))
             if epoch.data:
-                parts = (
+                parts = await run_query(
                     supabase.table("epoch_participants")
                     .select("simulation_id")
                     .eq("epoch_id", epoch_id)
                     .limit(1)
-                    .execute()
                 )
                 if parts.data:
                     gen_sim_id = parts.data[0]["simulation_id"]
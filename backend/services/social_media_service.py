@@ -5,6 +5,7 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -37,7 +38,7 @@ class SocialMediaService:
             query = query.is_("transformed_content", "null")
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -45,13 +46,12 @@ class SocialMediaService:
     @staticmethod
     async def get_post(supabase: Client, simulation_id: UUID, post_id: UUID) -> dict:
         """Get a single post."""
-        response = (
+        response = await run_query(
             supabase.table("social_media_posts")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(post_id))
             .limit(1)
-            .execute()
         )
         if not response or not response.data:
             raise HTTPException(
@@ -79,10 +79,9 @@ class SocialMediaService:
                 "last_synced_at": datetime.now(UTC).isoformat(),
             })
 
-        response = (
+        response = await run_query(
             supabase.table("social_media_posts")
             .upsert(rows, on_conflict="simulation_id,platform,platform_id")
-            .execute()
         )
         return response.data or []
 
@@ -95,12 +94,11 @@ class SocialMediaService:
     ) -> dict:
         """Update a post (e.g., after transformation or sentiment analysis)."""
         data["updated_at"] = datetime.now(UTC).isoformat()
-        response = (
+        response = await run_query(
             supabase.table("social_media_posts")
             .update(data)
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(post_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -117,14 +115,13 @@ class SocialMediaService:
         data: dict,
     ) -> dict:
         """Store a single comment for a post."""
-        response = (
+        response = await run_query(
             supabase.table("social_media_comments")
             .insert({
                 **data,
                 "simulation_id": str(simulation_id),
                 "post_id": str(post_id),
             })
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -140,13 +137,12 @@ class SocialMediaService:
         post_id: UUID,
     ) -> list[dict]:
         """Get all comments for a post."""
-        response = (
+        response = await run_query(
             supabase.table("social_media_comments")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("post_id", str(post_id))
             .order("source_created_at", desc=True)
-            .execute()
         )
         return response.data or []
 
@@ -157,10 +153,9 @@ class SocialMediaService:
         data: dict,
     ) -> dict:
         """Store an agent reaction to a post or comment."""
-        response = (
+        response = await run_query(
             supabase.table("social_media_agent_reactions")
             .insert({**data, "simulation_id": str(simulation_id)})
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -176,12 +171,11 @@ class SocialMediaService:
         post_id: UUID,
     ) -> list[dict]:
         """Get all agent reactions for a post."""
-        response = (
+        response = await run_query(
             supabase.table("social_media_agent_reactions")
             .select("*, agents(id, name, system)")
             .eq("simulation_id", str(simulation_id))
             .eq("post_id", str(post_id))
             .order("created_at", desc=True)
-            .execute()
         )
         return response.data or []
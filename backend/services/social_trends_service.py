@@ -5,6 +5,7 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -38,7 +39,7 @@ class SocialTrendsService:
             query = query.eq("is_processed", is_processed)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await run_query(query)
 
         total = response.count if response.count is not None else len(response.data or [])
         return response.data or [], total
@@ -46,13 +47,12 @@ class SocialTrendsService:
     @staticmethod
     async def get_trend(supabase: Client, simulation_id: UUID, trend_id: UUID) -> dict:
         """Get a single trend."""
-        response = (
+        response = await run_query(
             supabase.table("social_trends")
             .select("*")
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(trend_id))
             .limit(1)
-            .execute()
         )
         if not response or not response.data:
             raise HTTPException(
@@ -64,10 +64,9 @@ class SocialTrendsService:
     @staticmethod
     async def create_trend(supabase: Client, simulation_id: UUID, data: dict) -> dict:
         """Create a trend manually."""
-        response = (
+        response = await run_query(
             supabase.table("social_trends")
             .insert({**data, "simulation_id": str(simulation_id)})
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -94,7 +93,7 @@ class SocialTrendsService:
                 "fetched_at": datetime.now(UTC).isoformat(),
             })
 
-        response = supabase.table("social_trends").insert(rows).execute()
+        response = await run_query(supabase.table("social_trends").insert(rows))
         return response.data or []
 
     @staticmethod
@@ -104,7 +103,7 @@ class SocialTrendsService:
         trend_id: UUID,
     ) -> dict:
         """Mark a trend as processed."""
-        response = (
+        response = await run_query(
             supabase.table("social_trends")
             .update({
                 "is_processed": True,
@@ -112,7 +111,6 @@ class SocialTrendsService:
             })
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(trend_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
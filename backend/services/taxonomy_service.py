@@ -5,6 +5,7 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from backend.utils.db import run_query
 from supabase import Client
 
 
@@ -32,16 +33,15 @@ class TaxonomyService:
         if active_only:
             query = query.eq("is_active", True)
 
-        response = query.execute()
+        response = await run_query(query)
         return response.data or []
 
     @staticmethod
     async def create_taxonomy(supabase: Client, simulation_id: UUID, data: dict) -> dict:
         """Create a new taxonomy value."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_taxonomies")
             .insert({**data, "simulation_id": str(simulation_id)})
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -61,12 +61,11 @@ class TaxonomyService:
         if not data:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update.")
         data["updated_at"] = datetime.now(UTC).isoformat()
-        response = (
+        response = await run_query(
             supabase.table("simulation_taxonomies")
             .update(data)
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(taxonomy_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -82,12 +81,11 @@ class TaxonomyService:
         taxonomy_id: UUID,
     ) -> dict:
         """Soft-delete a taxonomy by setting is_active=False."""
-        response = (
+        response = await run_query(
             supabase.table("simulation_taxonomies")
             .update({"is_active": False, "updated_at": datetime.now(UTC).isoformat()})
             .eq("simulation_id", str(simulation_id))
             .eq("id", str(taxonomy_id))
-            .execute()
         )
         if not response.data:
             raise HTTPException(
@@ -11,6 +11,7 @@ from pydantic_ai import Agent
 from backend.config import settings
 from backend.models.translation import TranslationContext, TranslationResult
 from backend.services.ai_utils import get_openrouter_model
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -298,7 +299,7 @@ async def _run_auto_translate(
         return
 
     try:
-        supabase.table(table).update(update_data).eq("id", entity_id).execute()
+        await run_query(supabase.table(table).update(update_data).eq("id", entity_id))
         logger.info(
             "Auto-translated fields",
             extra={"entity_type": table, "entity_id": entity_id, "entity_count": len(update_data)},
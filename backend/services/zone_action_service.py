@@ -9,6 +9,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from backend.services.game_mechanics_service import GameMechanicsService
+from backend.utils.db import run_query
 from supabase import Client
 
 logger = logging.getLogger(__name__)
@@ -58,7 +59,7 @@ class ZoneActionService:
         now = datetime.now(UTC)
 
         # Check for active action on this zone
-        active_check = (
+        active_check = await run_query(
             supabase.table("zone_actions")
             .select("id, action_type, expires_at")
             .eq("zone_id", str(zone_id))
@@ -66,7 +67,6 @@ class ZoneActionService:
             .is_("deleted_at", "null")
             .gt("expires_at", now.isoformat())
             .limit(1)
-            .execute()
         )
         if active_check.data:
             raise HTTPException(
@@ -75,7 +75,7 @@ class ZoneActionService:
             )
 
         # Check cooldown — find most recent expired action of this type
-        cooldown_check = (
+        cooldown_check = await run_query(
             supabase.table("zone_actions")
             .select("cooldown_until")
             .eq("zone_id", str(zone_id))
@@ -83,7 +83,6 @@ class ZoneActionService:
             .eq("action_type", action_type)
             .order("created_at", desc=True)
             .limit(1)
-            .execute()
         )
         if cooldown_check.data:
             cooldown_until = datetime.fromisoformat(
@@ -99,7 +98,7 @@ class ZoneActionService:
         expires_at = now + timedelta(days=config["duration_days"])
         cooldown_until = expires_at + timedelta(days=config["cooldown_days"])
 
-        response = (
+        response = await run_query(
             supabase.table("zone_actions")
             .insert({
                 "zone_id": str(zone_id),
@@ -110,7 +109,6 @@ class ZoneActionService:
                 "expires_at": expires_at.isoformat(),
                 "cooldown_until": cooldown_until.isoformat(),
             })
-            .execute()
         )
 
         if not response.data:
@@ -119,7 +117,7 @@ class ZoneActionService:
                 detail="Failed to create zone action.",
             )
 
-        await GameMechanicsService.refresh_metrics(supabase)
+        await GameMechanicsService.refresh_metrics(supabase, [simulation_id])
         return response.data[0]
 
     @staticmethod
@@ -130,14 +128,13 @@ class ZoneActionService:
         action_id: UUID,
     ) -> dict:
         """Cancel an active zone action by setting deleted_at."""
-        response = (
+        response = await run_query(
             supabase.table("zone_actions")
             .update({"deleted_at": datetime.now(UTC).isoformat()})
             .eq("id", str(action_id))
             .eq("zone_id", str(zone_id))
             .eq("simulation_id", str(simulation_id))
             .is_("deleted_at", "null")
-            .execute()
         )
 
         if not response.data:
@@ -146,7 +143,7 @@ class ZoneActionService:
                 detail="Zone action not found or already cancelled.",
             )
 
-        await GameMechanicsService.refresh_metrics(supabase)
+        await GameMechanicsService.refresh_metrics(supabase, [simulation_id])
         return response.data[0]
 
     @staticmethod
@@ -156,13 +153,12 @@ class ZoneActionService:
         zone_id: UUID,
     ) -> list[dict]:
         """List active + recently expired actions for a zone."""
-        response = (
+        response = await run_query(
             supabase.table("zone_actions")
             .select("*")
             .eq("zone_id", str(zone_id))
             .eq("simulation_id", str(simulation_id))
             .order("created_at", desc=True)
             .limit(10)
-            .execute()
         )
         return response.data or []
@@ -12,6 +12,25 @@ MOCK_USER_ID = UUID("11111111-1111-1111-1111-111111111111")
 MOCK_USER_EMAIL = "test@velgarien.dev"
 
 
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    """Verified tokens, role lookups and cached responses must not leak between tests."""
+    from backend.services import ai_config_cache, membership_cache, public_cache
+    from backend.utils import jwt_verifier, single_flight
+
+    ai_config_cache.clear()
+    membership_cache.clear()
+    jwt_verifier.clear()
+    public_cache.clear()
+    single_flight.clear_all()
+    yield
+    ai_config_cache.clear()
+    membership_cache.clear()
+    jwt_verifier.clear()
+    public_cache.clear()
+    single_flight.clear_all()
+
+
 @pytest.fixture()
 def test_app():
     """FastAPI TestClient instance."""
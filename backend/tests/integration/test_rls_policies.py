@@ -9,7 +9,7 @@ Markers:
     integration: Requires app instantiation but not external services.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -102,6 +102,19 @@ def mock_supabase_client():
     return _mock_supabase()
 
 
+@pytest.fixture()
+def cold_supabase_pool(monkeypatch):
+    """Start and finish with an empty process-wide client pool."""
+    from backend.config import settings
+    from backend.utils import supabase_pool
+
+    if not settings.supabase_service_role_key:
+        monkeypatch.setattr(settings, "supabase_service_role_key", "test-service-role-key")
+    supabase_pool.reset()
+    yield supabase_pool
+    supabase_pool.reset()
+
+
 # ---------------------------------------------------------------------------
 # Helper: create a role-check override that returns a fixed role
 # ---------------------------------------------------------------------------
@@ -474,27 +487,47 @@ class TestDataIsolation:
         assert "b" in clients_by_user
         assert clients_by_user["a"] is not clients_by_user["b"]
 
-    def test_supabase_client_uses_user_jwt(self, user_a):
-        """The Supabase client should be initialized with the requesting user's JWT."""
-        # We patch the actual create_client to verify it receives the right token.
-        with patch("backend.dependencies.create_client") as mock_create:
-            mock_client = MagicMock()
-            mock_create.return_value = mock_client
+    def test_supabase_client_uses_user_jwt(self, user_a, cold_supabase_pool):
+        """The Supabase client should send the requesting user's JWT to PostgREST."""
+        import asyncio
 
-            import asyncio
+        from backend.dependencies import get_supabase
 
-            from backend.dependencies import get_supabase
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(get_supabase(user=user_a))
+        finally:
+            loop.close()
 
-            loop = asyncio.new_event_loop()
-            try:
-                loop.run_until_complete(get_supabase(user=user_a))
-            finally:
-                loop.close()
+        assert client.options.headers["Authorization"] == f"Bearer {user_a.access_token}"
+        assert client.postgrest.headers["Authorization"] == f"Bearer {user_a.access_token}"
 
-            # Verify the client had set_session called with user_a's token
-            mock_client.auth.set_session.assert_called_once_with(
-                user_a.access_token, ""
-            )
+    def test_shared_clients_build_on_cold_pool(self, cold_supabase_pool):
+        """Anon and admin getters must not deadlock when the transport is not yet created."""
+        anon = cold_supabase_pool.get_anon_client()
+        admin = cold_supabase_pool.get_admin_client()
+
+        assert anon is cold_supabase_pool.get_anon_client()
+        assert admin is cold_supabase_pool.get_admin_client()
+        assert anon is not admin
+        assert anon.postgrest.session is admin.postgrest.session
+
+    def test_user_client_builds_on_cold_pool(self, user_a, cold_supabase_pool):
+        """A user-scoped client on a cold pool creates the shared transport."""
+        client = cold_supabase_pool.get_user_client(user_a.access_token)
+
+        assert client.postgrest.session is cold_supabase_pool.get_anon_client().postgrest.session
+
+    def test_user_clients_share_connection_pool(self, user_a, user_b, cold_supabase_pool):
+        """Per-request clients must reuse the process-wide HTTP transport."""
+        anon = cold_supabase_pool.get_anon_client()
+        client_a = cold_supabase_pool.get_user_client(user_a.access_token)
+        client_b = cold_supabase_pool.get_user_client(user_b.access_token)
+
+        assert client_a is not client_b
+        assert client_a.postgrest.session is client_b.postgrest.session
+        assert client_a.postgrest.session is anon.postgrest.session
+        assert client_b.postgrest.headers["Authorization"] == f"Bearer {user_b.access_token}"
 
     def test_require_role_queries_correct_simulation(self, user_a, mock_supabase_client):
         """require_role should query simulation_members for the given simulation_id."""
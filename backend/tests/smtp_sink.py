@@ -0,0 +1,115 @@
+"""Local stand-in SMTP server for tests.
+
+``SmtpSink`` runs a minimal plain-text SMTP server on 127.0.0.1 in a
+background thread, accepts any AUTH, and records every message it receives.
+Point the email settings at it with ``security="none"``::
+
+    with SmtpSink() as sink:
+        conn = SmtpConnection(sink.host, sink.port, "user", "pass", security="none")
+        ...
+        assert sink.messages[0].recipients == ["to@example.com"]
+
+``fail_next(*codes)`` makes the next MAIL commands fail: an SMTP code
+(e.g. 451, 550) is returned as the reply, ``0`` drops the connection.
+"""
+
+from __future__ import annotations
+
+import socketserver
+import threading
+from dataclasses import dataclass, field
+from email import message_from_string
+from email.message import Message
+
+
+@dataclass
+class SinkMessage:
+    sender: str
+    recipients: list[str]
+    data: str
+
+    @property
+    def parsed(self) -> Message:
+        return message_from_string(self.data)
+
+
+@dataclass
+class SmtpSink:
+    host: str = "127.0.0.1"
+    port: int = 0
+    messages: list[SinkMessage] = field(default_factory=list)
+    connections: int = 0
+    logins: int = 0
+    _failures: list[int] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _server: socketserver.ThreadingTCPServer | None = None
+
+    def fail_next(self, *codes: int) -> None:
+        with self._lock:
+            self._failures.extend(codes)
+
+    def _next_failure(self) -> int | None:
+        with self._lock:
+            return self._failures.pop(0) if self._failures else None
+
+    def __enter__(self) -> SmtpSink:
+        sink = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str) -> None:
+                self.wfile.write(f"{line}\r\n".encode())
+
+            def handle(self) -> None:
+                with sink._lock:
+                    sink.connections += 1
+                self.reply("220 sink ESMTP")
+                sender, recipients = "", []
+                while line := self.rfile.readline():
+                    command = line.decode().rstrip("\r\n")
+                    verb = command[:4].upper()
+                    if verb == "EHLO":
+                        self.reply("250-sink")
+                        self.reply("250-AUTH PLAIN LOGIN")
+                        self.reply("250 8BITMIME")
+                    elif verb == "AUTH":
+                        with sink._lock:
+                            sink.logins += 1
+                        self.reply("235 ok")
+                    elif verb == "MAIL":
+                        failure = sink._next_failure()
+                        if failure == 0:
+                            return
+                        if failure:
+                            self.reply(f"{failure} sink failure")
+                            continue
+                        sender, recipients = command.split(":", 1)[1].strip(" <>").split(">")[0], []
+                        self.reply("250 ok")
+                    elif verb == "RCPT":
+                        recipients.append(command.split(":", 1)[1].strip(" <>"))
+                        self.reply("250 ok")
+                    elif verb == "DATA":
+                        self.reply("354 go ahead")
+                        lines = []
+                        while (data := self.rfile.readline()) not in (b".\r\n", b""):
+                            lines.append(data.decode()[1:] if data.startswith(b"..") else data.decode())
+                        with sink._lock:
+                            sink.messages.append(SinkMessage(sender, recipients, "".join(lines)))
+                        self.reply("250 queued")
+                    elif verb == "QUIT":
+                        self.reply("221 bye")
+                        return
+                    elif verb in ("HELO", "RSET", "NOOP"):
+                        self.reply("250 ok")
+                    else:
+                        self.reply("502 not implemented")
+
+        self._server = socketserver.ThreadingTCPServer((self.host, 0), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
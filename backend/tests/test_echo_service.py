@@ -606,10 +606,10 @@ class TestConnectionListAll:
 class TestConnectionGetMapData:
     @pytest.fixture(autouse=True)
     def _clear_cache(self):
-        """Clear the map data TTL cache between tests."""
-        ConnectionService._map_data_cache.clear()
+        """Clear the map data cache between tests."""
+        ConnectionService._map_data_flight.clear()
         yield
-        ConnectionService._map_data_cache.clear()
+        ConnectionService._map_data_flight.clear()
 
     @pytest.mark.asyncio
     async def test_returns_aggregated_data(self):
@@ -0,0 +1,122 @@
+"""Unit tests for ai_config_cache — process-wide prompt and AI settings caching."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from backend.services import ai_config_cache
+from backend.services.model_resolver import ModelResolver
+from backend.services.prompt_service import PromptResolver, _safe_format
+from backend.services.prompt_template_service import PromptTemplateService
+from backend.services.settings_service import SettingsService
+
+SIM_ID = uuid4()
+
+
+def _template(content: str = "Hello {agent_name}") -> dict:
+    return {"template_type": "chat_system_prompt", "prompt_content": content, "temperature": 0.5, "max_tokens": 512}
+
+
+class TestGetOrLoad:
+    async def test_second_lookup_is_a_hit(self):
+        loader = AsyncMock(return_value="value")
+
+        first = await ai_config_cache.get_or_load("kind", SIM_ID, ("a",), loader)
+        second = await ai_config_cache.get_or_load("kind", SIM_ID, ("a",), loader)
+
+        assert first == second == "value"
+        loader.assert_awaited_once()
+        assert ai_config_cache.get_stats()["hits"] == 1
+
+    async def test_none_is_cached(self):
+        loader = AsyncMock(return_value=None)
+
+        await ai_config_cache.get_or_load("kind", SIM_ID, (), loader)
+        await ai_config_cache.get_or_load("kind", SIM_ID, (), loader)
+
+        loader.assert_awaited_once()
+
+    async def test_invalidation_only_drops_that_simulation(self):
+        other = uuid4()
+        await ai_config_cache.get_or_load("kind", SIM_ID, (), AsyncMock(return_value="old"))
+        await ai_config_cache.get_or_load("kind", other, (), AsyncMock(return_value="kept"))
+
+        ai_config_cache.invalidate_simulation(SIM_ID)
+
+        assert await ai_config_cache.get_or_load("kind", SIM_ID, (), AsyncMock(return_value="new")) == "new"
+        assert await ai_config_cache.get_or_load("kind", other, (), AsyncMock(return_value="x")) == "kept"
+
+    async def test_load_in_flight_during_invalidation_is_not_served(self):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_load() -> str:
+            started.set()
+            await release.wait()
+            return "stale"
+
+        task = asyncio.create_task(ai_config_cache.get_or_load("kind", SIM_ID, (), slow_load))
+        await started.wait()
+        ai_config_cache.invalidate_simulation(SIM_ID)
+        release.set()
+        assert await task == "stale"
+
+        assert await ai_config_cache.get_or_load("kind", SIM_ID, (), AsyncMock(return_value="fresh")) == "fresh"
+
+    async def test_expired_entries_reload(self):
+        with patch.object(ai_config_cache, "get_ttl", return_value=0):
+            await ai_config_cache.get_or_load("kind", SIM_ID, (), AsyncMock(return_value="old"))
+
+        assert await ai_config_cache.get_or_load("kind", SIM_ID, (), AsyncMock(return_value="new")) == "new"
+
+
+class TestResolvers:
+    async def test_prompt_resolution_is_shared_across_resolvers(self):
+        query = AsyncMock(return_value=MagicMock(data=[_template()]))
+        with patch("backend.services.prompt_service.run_query", query):
+            first = await PromptResolver(MagicMock(), SIM_ID).resolve("chat_system_prompt", "en")
+            second = await PromptResolver(MagicMock(), SIM_ID).resolve("chat_system_prompt", "en")
+
+        assert first is second
+        assert first.source == "simulation+locale"
+        query.assert_awaited_once()
+
+    async def test_template_write_invalidates_resolved_prompt(self):
+        query = AsyncMock(return_value=MagicMock(data=[_template("v1")]))
+        with patch("backend.services.prompt_service.run_query", query):
+            assert (await PromptResolver(MagicMock(), SIM_ID).resolve("chat_system_prompt", "en")).prompt_content == "v1"
+
+        with patch("backend.services.prompt_template_service.run_query", AsyncMock(return_value=MagicMock(data=[{}]))):
+            await PromptTemplateService.update(MagicMock(), SIM_ID, uuid4(), {"prompt_content": "v2"})
+
+        query.return_value = MagicMock(data=[_template("v2")])
+        with patch("backend.services.prompt_service.run_query", query):
+            assert (await PromptResolver(MagicMock(), SIM_ID).resolve("chat_system_prompt", "en")).prompt_content == "v2"
+
+    async def test_ai_settings_are_shared_and_invalidated_by_settings_writes(self):
+        query = AsyncMock(return_value=MagicMock(data=[{"setting_key": "model_chat_response", "setting_value": '"a/model"'}]))
+        with patch("backend.services.model_resolver.run_query", query):
+            first = await ModelResolver(MagicMock(), SIM_ID).resolve_text_model("chat_response")
+            await ModelResolver(MagicMock(), SIM_ID).resolve_text_model("chat_response")
+
+        assert first.model_id == "a/model"
+        query.assert_awaited_once()
+
+        saved = {"setting_key": "model_chat_response", "setting_value": "b/model"}
+        with patch("backend.services.settings_service.run_query", AsyncMock(return_value=MagicMock(data=[saved]))):
+            await SettingsService.upsert_setting(MagicMock(), SIM_ID, uuid4(), {**saved, "category": "ai"})
+
+        query.return_value = MagicMock(data=[saved])
+        with patch("backend.services.model_resolver.run_query", query):
+            assert (await ModelResolver(MagicMock(), SIM_ID).resolve_text_model("chat_response")).model_id == "b/model"
+
+
+class TestSafeFormat:
+    def test_leaves_unknown_placeholders(self):
+        assert _safe_format("{a} and {b} in {c}", {"a": "x", "c": 3}) == "x and {b} in 3"
+
+    def test_ignores_escaped_json_braces(self):
+        template = 'Return JSON: {"title": "..."} for {name}'
+
+        assert _safe_format(template, {"name": "Ada"}) == 'Return JSON: {"title": "..."} for Ada'
@@ -0,0 +1,34 @@
+"""Unit tests for the app lifespan — background work is flushed on shutdown."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.app import app, lifespan
+
+
+async def test_shutdown_drains_jobs_then_flushes_and_closes_clients():
+    calls = MagicMock()
+    with (
+        patch("backend.app.CycleResolutionService.drain", AsyncMock(side_effect=lambda: calls("drain"))),
+        patch("backend.app.chat_ai_service.drain", AsyncMock(side_effect=lambda: calls("chat"))),
+        patch("backend.app.EmailService.close", AsyncMock(side_effect=lambda: calls("email"))),
+        patch("backend.app.memory_index.flush", AsyncMock(side_effect=lambda: calls("memory"))),
+        patch("backend.app.EmbeddingService.close", AsyncMock(side_effect=lambda: calls("embeddings"))),
+        patch("backend.app.close_transport", AsyncMock(side_effect=lambda: calls("openrouter"))),
+    ):
+        async with lifespan(app):
+            calls.assert_not_called()
+
+    assert [c.args[0] for c in calls.call_args_list] == ["drain", "chat", "email", "memory", "embeddings", "openrouter"]
+
+
+async def test_shutdown_writes_buffered_memory_access():
+    from backend.services import memory_index
+
+    admin = MagicMock()
+    with patch.object(memory_index, "get_admin_client", return_value=admin):
+        async with lifespan(app):
+            memory_index.touch(["m1"])
+
+    admin.table.return_value.update.return_value.in_.assert_called_once_with("id", ["m1"])
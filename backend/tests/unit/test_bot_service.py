@@ -0,0 +1,174 @@
+"""Unit tests for BotService — concurrent bot cycle with a shared public snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services.bot_game_state import BotGameState, PublicSnapshot
+from backend.services.bot_personality import BotDecisions
+from backend.services.bot_service import BotService
+from backend.tests.conftest import make_chain_mock
+
+EPOCH_ID = str(uuid4())
+
+
+def _bot(i: int) -> dict:
+    return {
+        "id": f"p-{i}",
+        "simulation_id": str(uuid4()),
+        "current_rp": 20,
+        "team_id": None,
+        "bot_players": {"personality": "sentinel", "difficulty": "medium"},
+    }
+
+
+def _snapshot_client() -> tuple[MagicMock, dict[str, MagicMock]]:
+    sb = MagicMock()
+    chains = {
+        "game_epochs": make_chain_mock({"status": "foundation"}),
+        "battle_log": make_chain_mock([{"event_type": "intel_report"}]),
+        "epoch_scores": make_chain_mock([{"simulation_id": "s1", "composite_score": 10}]),
+        "epoch_teams": make_chain_mock([]),
+        "epoch_participants": make_chain_mock([{"id": "p-0", "simulation_id": "s1", "team_id": None}]),
+        "active_resonances": make_chain_mock([{"archetype": "The Shadow"}]),
+    }
+    sb.table.side_effect = lambda name: chains.get(name, make_chain_mock([]))
+    return sb, chains
+
+
+class TestPublicSnapshot:
+    @pytest.mark.asyncio
+    async def test_loads_public_view(self):
+        sb, _ = _snapshot_client()
+
+        snapshot = await PublicSnapshot.load(sb, EPOCH_ID)
+
+        assert snapshot.epoch_status == "foundation"
+        assert snapshot.scores[0]["composite_score"] == 10
+        assert snapshot.active_resonances[0]["archetype"] == "The Shadow"
+
+    @pytest.mark.asyncio
+    async def test_build_uses_supplied_snapshot(self):
+        sb = MagicMock()
+        sb.table.side_effect = lambda name: make_chain_mock([])
+        snapshot = PublicSnapshot(
+            epoch_status="competition",
+            scores=[{"simulation_id": "s1"}],
+            participants=[
+                {"simulation_id": "s1", "team_id": "t1"},
+                {"simulation_id": "s2", "team_id": "t1"},
+            ],
+            active_resonances=[{"archetype": "The Shadow"}],
+        )
+        participant = {"id": "p-1", "simulation_id": "s1", "team_id": "t1", "bot_player": {}}
+
+        state = await BotGameState.build(sb, EPOCH_ID, participant, 3, {}, snapshot)
+
+        assert state.scores == snapshot.scores
+        assert state.allies == ["s2"]
+        assert "assassin" in state.resonance_aligned_types
+        queried = {c.args[0] for c in sb.table.call_args_list}
+        assert not queried & {"game_epochs", "epoch_scores", "epoch_teams", "epoch_participants"}
+
+
+class TestExecuteBotCycle:
+    def _patches(self, bots: list[dict], build_delay: float = 0.0):
+        async def build(*args, **kwargs):
+            await asyncio.sleep(build_delay)
+            return MagicMock()
+
+        personality = MagicMock()
+        personality.decide.return_value = BotDecisions(reasoning="hold")
+        return (
+            patch.object(BotService, "_get_bot_participants", new_callable=AsyncMock, return_value=bots),
+            patch.object(PublicSnapshot, "load", new_callable=AsyncMock, return_value=PublicSnapshot()),
+            patch.object(BotGameState, "build", side_effect=build),
+            patch("backend.services.bot_service.create_personality", return_value=personality),
+            patch.object(BotService, "_log_decisions", new_callable=AsyncMock),
+            patch("backend.services.bot_service.BotChatService.maybe_send_message", new_callable=AsyncMock),
+        )
+
+    @pytest.mark.asyncio
+    async def test_snapshot_loaded_once_for_all_bots(self):
+        admin = MagicMock()
+        admin.table.return_value = make_chain_mock([])
+        bots = [_bot(i) for i in range(4)]
+        p_bots, p_snap, p_build, p_pers, p_log, p_chat = self._patches(bots)
+
+        with p_bots, p_snap as snap_mock, p_build as build_mock, p_pers, p_log, p_chat:
+            results = await BotService.execute_bot_cycle(MagicMock(), admin, EPOCH_ID, 3, {})
+
+        assert snap_mock.await_count == 1
+        assert build_mock.call_count == 4
+        shared = {id(c.args[5]) for c in build_mock.call_args_list}
+        assert len(shared) == 1
+        assert [r["participant_id"] for r in results] == [b["id"] for b in bots]
+        assert all(r["success"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_bots_run_concurrently_within_limit(self):
+        admin = MagicMock()
+        admin.table.return_value = make_chain_mock([])
+        bots = [_bot(i) for i in range(4)]
+        p_bots, p_snap, p_build, p_pers, p_log, p_chat = self._patches(bots, build_delay=0.1)
+
+        with (
+            p_bots, p_snap, p_build, p_pers, p_log, p_chat,
+            patch("backend.services.bot_service.settings.bot_max_concurrency", 4),
+        ):
+            start = time.perf_counter()
+            await BotService.execute_bot_cycle(MagicMock(), admin, EPOCH_ID, 3, {})
+            elapsed = time.perf_counter() - start
+
+        # Four bots take roughly as long as one
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        admin = MagicMock()
+        admin.table.return_value = make_chain_mock([])
+        in_flight = 0
+        peak = 0
+
+        async def build(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock()
+
+        bots = [_bot(i) for i in range(6)]
+        p_bots, p_snap, _, p_pers, p_log, p_chat = self._patches(bots)
+
+        with (
+            p_bots, p_snap, p_pers, p_log, p_chat,
+            patch.object(BotGameState, "build", side_effect=build),
+            patch("backend.services.bot_service.settings.bot_max_concurrency", 2),
+        ):
+            await BotService.execute_bot_cycle(MagicMock(), admin, EPOCH_ID, 3, {})
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_bot_does_not_stop_others(self):
+        admin = MagicMock()
+        admin.table.return_value = make_chain_mock([])
+        bots = [_bot(i) for i in range(3)]
+
+        async def build(supabase, epoch_id, participant, *args, **kwargs):
+            if participant["id"] == "p-1":
+                raise RuntimeError("boom")
+            return MagicMock()
+
+        p_bots, p_snap, _, p_pers, p_log, p_chat = self._patches(bots)
+
+        with p_bots, p_snap, p_pers, p_log, p_chat, patch.object(BotGameState, "build", side_effect=build):
+            results = await BotService.execute_bot_cycle(MagicMock(), admin, EPOCH_ID, 3, {})
+
+        assert [r["success"] for r in results] == [True, False, True]
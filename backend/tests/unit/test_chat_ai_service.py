@@ -1,13 +1,15 @@
-"""Tests for ChatAIService — prompt variables, event context, and template resolution."""
+"""Tests for ChatAIService — prompt variables, event context, template resolution and streaming."""
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from backend.services.chat_ai_service import ChatAIService
+from backend.services.model_resolver import ResolvedModel
 from backend.services.prompt_service import HARDCODED_FALLBACKS, ResolvedPrompt
 
 # ---------------------------------------------------------------------------
@@ -214,3 +216,94 @@ class TestHardcodedFallbacks:
     def test_template_type_has_fallback(self, template_type):
         assert template_type in HARDCODED_FALLBACKS
         assert len(HARDCODED_FALLBACKS[template_type]) > 0
+
+
+# ---------------------------------------------------------------------------
+# Streaming responses
+# ---------------------------------------------------------------------------
+
+
+async def _deltas(*parts: str):
+    for part in parts:
+        yield part
+
+
+class TestStreamResponse:
+    """Tests for ChatAIService.stream_response() / stream_group_response()."""
+
+    @pytest.fixture()
+    def streaming(self, chat_service):
+        agent_id = str(uuid4())
+        chat_service._load_conversation = AsyncMock(return_value={"agent_id": agent_id})
+        chat_service._load_agent = AsyncMock(return_value={"id": agent_id, "name": "Mira"})
+        chat_service._load_conversation_agents = AsyncMock(return_value=[{"id": agent_id, "name": "Mira"}])
+        chat_service._load_event_references = AsyncMock(return_value=[])
+        chat_service._load_simulation = AsyncMock(return_value={"name": "Sim"})
+        chat_service._get_locale = AsyncMock(return_value="en")
+        chat_service._load_history = AsyncMock(return_value=[])
+        chat_service._prompt_resolver.resolve = AsyncMock(return_value=_make_resolved_prompt("You are {{agent_name}}"))
+        chat_service._model_resolver.resolve_text_model = AsyncMock(
+            return_value=ResolvedModel(model_id="m", temperature=0.7, max_tokens=100, source="test"),
+        )
+        chat_service._openrouter.stream = MagicMock(side_effect=lambda *a, **kw: _deltas("Hel", "lo"))
+        chat_service._openrouter.generate = AsyncMock()
+        chat_service._supabase.table.return_value.insert.return_value = MagicMock()
+        saved = {"id": "msg-1", "content": "Hello", "agent_id": agent_id}
+        with (
+            patch("backend.services.chat_ai_service.AgentMemoryService.retrieve", new_callable=AsyncMock, return_value=[]),
+            patch("backend.services.chat_ai_service.AgentMemoryService.extract_from_chat", new_callable=AsyncMock) as extract,
+            patch("backend.services.chat_ai_service.run_query", new_callable=AsyncMock, return_value=MagicMock(data=[saved])),
+        ):
+            yield chat_service, agent_id, saved, extract
+
+    async def test_deltas_then_saved_message(self, streaming):
+        chat_service, agent_id, saved, extract = streaming
+
+        events = [item async for item in chat_service.stream_response(uuid4(), "Hi")]
+
+        assert events == [
+            ("delta", {"agent_id": agent_id, "content": "Hel"}),
+            ("delta", {"agent_id": agent_id, "content": "lo"}),
+            ("message", saved),
+        ]
+        chat_service._openrouter.generate.assert_not_awaited()
+        inserted = chat_service._supabase.table.return_value.insert.call_args.args[0]
+        assert inserted["content"] == "Hello"
+        await asyncio.sleep(0)
+        assert extract.await_args.args[3:] == ("Hi", "Hello")
+
+    async def test_reply_is_stored_when_the_client_disconnects(self, streaming):
+        from backend.services import chat_ai_service
+
+        chat_service, _, _, extract = streaming
+        events = chat_service.stream_response(uuid4(), "Hi")
+
+        assert (await anext(events))[1]["content"] == "Hel"
+        await events.aclose()
+        await chat_ai_service.drain()
+
+        inserted = chat_service._supabase.table.return_value.insert.call_args.args[0]
+        assert inserted["content"] == "Hello"
+        assert extract.await_args.args[3:] == ("Hi", "Hello")
+
+    async def test_stream_failure_reaches_the_consumer(self, streaming):
+        chat_service, *_ = streaming
+        chat_service._openrouter.stream = MagicMock(side_effect=RuntimeError("provider down"))
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            [item async for item in chat_service.stream_response(uuid4(), "Hi")]
+
+    async def test_group_streams_each_agent(self, streaming):
+        chat_service, agent_id, saved, _ = streaming
+
+        events = [item async for item in chat_service.stream_group_response(uuid4(), "Hi")]
+
+        assert [event for event, _ in events] == ["delta", "delta", "message"]
+        assert events[0][1]["agent_id"] == agent_id
+
+    async def test_generate_response_uses_one_completion(self, streaming):
+        chat_service, *_ = streaming
+        chat_service._openrouter.generate.return_value = "Complete answer"
+
+        assert await chat_service.generate_response(uuid4(), "Hi") == "Complete answer"
+        chat_service._openrouter.stream.assert_not_called()
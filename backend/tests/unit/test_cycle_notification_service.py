@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
-from backend.services.cycle_notification_service import CycleNotificationService
+from backend.services.cycle_notification_service import BriefingSnapshot, CycleNotificationService
 
 # ── Helpers ────────────────────────────────────────────────────
 
@@ -175,245 +176,186 @@ class TestResolveRecipients:
 
 # ── Player Briefing Data ──────────────────────────────────────
 
-
-class TestBuildPlayerBriefing:
-    @pytest.mark.asyncio
-    async def test_returns_expected_keys(self):
+SIM_C = str(uuid4())
+TEAM = str(uuid4())
+
+
+def _score(sim_id, composite, dims=50.0):
+    return {
+        "simulation_id": sim_id,
+        "composite_score": composite,
+        **{f"{d}_score": dims for d in ("stability", "influence", "sovereignty", "diplomatic", "military")},
+    }
+
+
+def _snapshot(**overrides):
+    """Three-player epoch at cycle 2: A and C allied, B spied on by A and detected spying on A."""
+    data = {
+        "cycle_number": 2,
+        "current_scores": [_score(SIM_A, 72.3, 60.0), _score(SIM_B, 65.0), _score(SIM_C, 40.0)],
+        "prev_scores": [_score(SIM_B, 66.0), _score(SIM_A, 61.0, 55.0), _score(SIM_C, 41.0)],
+        "missions": [
+            {"operative_type": "spy", "status": "active", "source_simulation_id": SIM_A, "target_simulation_id": SIM_B},
+            {"operative_type": "guardian", "status": "active", "source_simulation_id": SIM_A, "target_simulation_id": None},
+            {"operative_type": "saboteur", "status": "success", "source_simulation_id": SIM_A, "target_simulation_id": SIM_B},
+            {"operative_type": "spy", "status": "detected", "source_simulation_id": SIM_B, "target_simulation_id": SIM_A},
+            {"operative_type": "spy", "status": "detected", "source_simulation_id": SIM_B, "target_simulation_id": SIM_C},
+        ],
+        "participants": {
+            SIM_A: {"current_rp": 18, "team_id": TEAM, "simulations": {"name": "Velgarien"}},
+            SIM_B: {"current_rp": 30, "team_id": None, "simulations": {"name": "The Gaslit Reach"}},
+            SIM_C: {"current_rp": 5, "team_id": TEAM, "simulations": {"name": "Station Null"}},
+        },
+        "team_names": {TEAM: "Northern Pact"},
+        "sim_names": {SIM_A: "Velgarien", SIM_B: "The Gaslit Reach", SIM_C: "Station Null"},
+        "intel_reports": [
+            {"narrative": "B's vault is thin.", "metadata": None, "source_simulation_id": SIM_A, "target_simulation_id": SIM_B},
+            {"narrative": "A's guard rotates.", "metadata": {}, "source_simulation_id": SIM_B, "target_simulation_id": SIM_A},
+        ],
+        "public_events": [{"narrative": "An operative was detected.", "event_type": "detection"}],
+    }
+    return BriefingSnapshot(**(data | overrides))
+
+
+class TestPlayerBriefing:
+    def test_returns_expected_keys(self):
         """Briefing data should contain all expected fields."""
-        admin_sb = MagicMock()
-
-        # Current scores
-        current_chain = _make_chain()
-        current_chain.execute.return_value = MagicMock(data=[
-            {
-                "simulation_id": SIM_A,
-                "composite_score": 72.3,
-                "stability_score": 60.0,
-                "influence_score": 45.0,
-                "sovereignty_score": 88.0,
-                "diplomatic_score": 55.0,
-                "military_score": 30.0,
-            },
-        ])
-
-        # Previous scores (cycle 0 → no previous)
-        prev_chain = _make_chain()
-        prev_chain.execute.return_value = MagicMock(data=[])
-
-        # Operatives
-        ops_chain = _make_chain()
-        ops_chain.execute.return_value = MagicMock(data=[
-            {"operative_type": "spy", "status": "active", "target_simulation_id": SIM_B, "resolves_at": None},
-            {"operative_type": "guardian", "status": "active", "target_simulation_id": None, "resolves_at": None},
-            {"operative_type": "saboteur", "status": "success", "target_simulation_id": SIM_B, "resolves_at": None},
-        ])
-
-        # Target sim names
-        names_chain = _make_chain()
-        names_chain.execute.return_value = MagicMock(data=[
-            {"id": SIM_B, "name": "The Gaslit Reach"},
-        ])
-
-        # RP + team_id
-        rp_chain = _make_chain()
-        rp_chain.execute.return_value = MagicMock(data={"current_rp": 18, "team_id": None})
-
-        # Threats (B1)
-        threat_chain = _make_chain()
-        threat_chain.execute.return_value = MagicMock(data=[])
-
-        # Spy intel (B2)
-        intel_chain = _make_chain()
-        intel_chain.execute.return_value = MagicMock(data=[])
-
-        # Battle log
-        log_chain = _make_chain()
-        log_chain.execute.return_value = MagicMock(data=[
-            {"narrative": "An operative was detected.", "event_type": "detection"},
-        ])
-
-        call_count = {"scores": 0, "operative_missions": 0, "simulations": 0, "battle_log": 0}
-
-        def table_side_effect(name):
-            if name == "epoch_scores":
-                call_count["scores"] += 1
-                # First 2 calls: current scores (ordered + prev ordered)
-                # Then prev detail
-                if call_count["scores"] <= 2:
-                    return current_chain
-                return prev_chain
-            if name == "operative_missions":
-                call_count["operative_missions"] += 1
-                if call_count["operative_missions"] == 1:
-                    return ops_chain  # Own missions
-                return threat_chain  # Threat detection
-            if name == "simulations":
-                return names_chain
-            if name == "epoch_participants":
-                return rp_chain
-            if name == "battle_log":
-                call_count["battle_log"] += 1
-                if call_count["battle_log"] == 1:
-                    return intel_chain  # Spy intel
-                return log_chain  # Public events
-            if name == "epoch_teams":
-                return _make_chain()
-            return _make_chain()
-
-        admin_sb.table.side_effect = table_side_effect
-
-        briefing = await CycleNotificationService._build_player_briefing(
-            admin_sb, EPOCH_ID, SIM_A, 1, "Test Epoch", "competition",
-        )
+        briefing = _snapshot().player_briefing(SIM_A, "Test Epoch", "competition", epoch_config={"rp_cap": 40})
 
         assert briefing["epoch_name"] == "Test Epoch"
-        assert briefing["cycle_number"] == 1
+        assert briefing["cycle_number"] == 2
         assert briefing["rank"] == 1
+        assert briefing["prev_rank"] == 2
+        assert briefing["total_players"] == 3
         assert briefing["composite"] == 72.3
-        assert len(briefing["dimensions"]) == 5
+        assert briefing["composite_delta"] == 11.3
+        assert [d["delta"] for d in briefing["dimensions"]] == [5.0] * 5
         assert briefing["active_ops"] == 2  # spy + guardian
         assert briefing["success_ops"] == 1  # saboteur
         assert briefing["guardians"] == 1
         assert briefing["rp_balance"] == 18
+        assert briefing["next_cycle_rp_projection"] == "+12 → 30 / 40"
+        assert briefing["rank_gap"]["en"] == "Leading by 7.3 points"
         assert len(briefing["public_events"]) == 1
-
-        # New enrichment fields
-        assert "threats" in briefing
-        assert "spy_intel" in briefing
-        assert "missions" in briefing
-        assert "rank_gap" in briefing
-        assert "alliance_name" in briefing
-        assert "next_cycle_missions" in briefing
-        assert "next_cycle_rp_projection" in briefing
         assert "accent_color" in briefing
 
-    @pytest.mark.asyncio
-    async def test_mission_details_exclude_defensive_ops(self):
-        """B7: Guardian/counter_intel ops should not appear in per-mission log."""
-        admin_sb = MagicMock()
+    def test_player_sees_only_their_own_fog_of_war_view(self):
+        """Threats and intel are filtered to the recipient; other players' ops stay hidden."""
+        snapshot = _snapshot()
+        a = snapshot.player_briefing(SIM_A, "E", "competition")
+        c = snapshot.player_briefing(SIM_C, "E", "competition")
 
-        current_chain = _make_chain()
-        current_chain.execute.return_value = MagicMock(data=[
-            {
-                "simulation_id": SIM_A,
-                "composite_score": 50.0,
-                "stability_score": 50.0,
-                "influence_score": 50.0,
-                "sovereignty_score": 50.0,
-                "diplomatic_score": 50.0,
-                "military_score": 50.0,
-            },
-        ])
+        assert a["threats"] == [{"type": "spy", "status": "detected", "source_name": "The Gaslit Reach"}]
+        assert [i["narrative"] for i in a["spy_intel"]] == ["B's vault is thin."]
+        assert a["spy_intel"][0]["target_name"] == "The Gaslit Reach"
+        assert c["missions"] == []
+        assert c["spy_intel"] == []
+        assert c["rank_gap"]["en"] == "25.0 points behind #2"
 
-        ops_chain = _make_chain()
-        ops_chain.execute.return_value = MagicMock(data=[
-            {"operative_type": "guardian", "status": "active", "target_simulation_id": None, "resolves_at": None},
-            {"operative_type": "spy", "status": "success", "target_simulation_id": SIM_B, "resolves_at": None},
-        ])
+    def test_alliance_lists_allies_but_not_self(self):
+        briefing = _snapshot().player_briefing(SIM_A, "E", "competition")
 
-        names_chain = _make_chain()
-        names_chain.execute.return_value = MagicMock(data=[{"id": SIM_B, "name": "Target"}])
+        assert briefing["alliance_name"] == "Northern Pact"
+        assert briefing["ally_names"] == ["Station Null"]
+        assert briefing["alliance_bonus_active"] is True
 
-        rp_chain = _make_chain()
-        rp_chain.execute.return_value = MagicMock(data={"current_rp": 10, "team_id": None})
+    def test_dissolved_team_is_not_an_alliance(self):
+        briefing = _snapshot(team_names={}).player_briefing(SIM_A, "E", "competition")
 
-        empty_chain = _make_chain()
-        empty_chain.execute.return_value = MagicMock(data=[])
+        assert briefing["alliance_name"] is None
+        assert briefing["ally_names"] == []
+        assert briefing["alliance_bonus_active"] is False
 
-        call_count = {"operative_missions": 0, "battle_log": 0}
+    def test_mission_details_exclude_defensive_ops(self):
+        """B7: Guardian/counter_intel ops should not appear in per-mission log."""
+        briefing = _snapshot().player_briefing(SIM_A, "E", "competition")
 
-        def table_side_effect(name):
-            if name == "epoch_scores":
-                return current_chain
-            if name == "operative_missions":
-                call_count["operative_missions"] += 1
-                if call_count["operative_missions"] == 1:
-                    return ops_chain
-                return empty_chain
-            if name == "simulations":
-                return names_chain
-            if name == "epoch_participants":
-                return rp_chain
-            if name == "battle_log":
-                call_count["battle_log"] += 1
-                return empty_chain
-            return _make_chain()
+        assert [m["type"] for m in briefing["missions"]] == ["spy", "saboteur"]
+        assert briefing["missions"][0]["target_name"] == "The Gaslit Reach"
 
-        admin_sb.table.side_effect = table_side_effect
+    def test_first_cycle_has_no_previous_rank(self):
+        briefing = _snapshot(prev_scores=[]).player_briefing(SIM_B, "E", "competition")
+
+        assert briefing["prev_rank"] == 0
+        assert briefing["composite_delta"] == 65.0
 
-        briefing = await CycleNotificationService._build_player_briefing(
-            admin_sb, EPOCH_ID, SIM_A, 1, "Test", "competition",
-        )
 
-        # Only spy should appear in missions, not guardian
-        assert len(briefing["missions"]) == 1
-        assert briefing["missions"][0]["type"] == "spy"
+class TestLoadBriefingSnapshot:
+    @pytest.mark.asyncio
+    async def test_query_count_does_not_depend_on_player_count(self):
+        """The snapshot is read in a fixed set of queries, whatever the number of players."""
+        tables: list[str] = []
+        data = {
+            "epoch_scores": [_score(SIM_A, 70.0), _score(SIM_B, 60.0)],
+            "epoch_participants": [
+                {"simulation_id": SIM_A, "current_rp": 10, "team_id": None, "simulations": {"name": "A"}},
+                {"simulation_id": SIM_B, "current_rp": 12, "team_id": None, "simulations": {"name": "B"}},
+            ],
+            "epoch_teams": [],
+            "battle_log": [],
+            "operative_missions": [
+                {"id": "m1", "operative_type": "spy", "status": "active",
+                 "source_simulation_id": SIM_A, "target_simulation_id": SIM_C},
+            ],
+            "simulations": [{"id": SIM_C, "name": "Departed"}],
+        }
+
+        def table(name):
+            tables.append(name)
+            chain = _make_chain()
+            chain.execute.return_value = MagicMock(data=data[name])
+            return chain
+
+        admin_sb = MagicMock()
+        admin_sb.table.side_effect = table
+
+        snapshot = await CycleNotificationService._load_briefing_snapshot(admin_sb, EPOCH_ID, 3)
+
+        assert sorted(tables) == sorted([
+            "epoch_scores", "epoch_scores", "epoch_participants", "epoch_teams",
+            "battle_log", "battle_log", "operative_missions", "simulations",
+        ])
+        assert [s["simulation_id"] for s in snapshot.prev_scores] == [SIM_A, SIM_B]
+        # Mission targets outside the epoch are named with one extra lookup
+        assert snapshot.sim_names == {SIM_A: "A", SIM_B: "B", SIM_C: "Departed"}
 
 
 # ── Standing Snapshot ─────────────────────────────────────────
 
 
 class TestBuildStandingSnapshot:
-    @pytest.mark.asyncio
-    async def test_returns_standing_data(self):
+    def test_returns_standing_data(self):
         """C1: Standing snapshot returns rank and composite."""
-        admin_sb = MagicMock()
-
-        scores_chain = _make_chain()
-        scores_chain.execute.return_value = MagicMock(data=[
+        scores = [
             {"simulation_id": SIM_A, "composite_score": 80.0},
             {"simulation_id": SIM_B, "composite_score": 60.0},
-        ])
+        ]
 
-        admin_sb.table.return_value = scores_chain
-
-        result = await CycleNotificationService._build_standing_snapshot(
-            admin_sb, EPOCH_ID, SIM_A,
-        )
+        result = CycleNotificationService._build_standing_snapshot(scores, SIM_A)
 
         assert result is not None
         assert result["rank"] == 1
         assert result["total_players"] == 2
         assert result["composite"] == 80.0
 
-    @pytest.mark.asyncio
-    async def test_returns_none_when_no_scores(self):
-        admin_sb = MagicMock()
-
-        scores_chain = _make_chain()
-        scores_chain.execute.return_value = MagicMock(data=[])
-
-        admin_sb.table.return_value = scores_chain
-
-        result = await CycleNotificationService._build_standing_snapshot(
-            admin_sb, EPOCH_ID, SIM_A,
-        )
-
-        assert result is None
+    def test_returns_none_when_no_scores(self):
+        assert CycleNotificationService._build_standing_snapshot([], SIM_A) is None
 
 
 # ── Campaign Stats ────────────────────────────────────────────
 
 
 class TestBuildCampaignStats:
-    @pytest.mark.asyncio
-    async def test_computes_stats(self):
+    def test_computes_stats(self):
         """D1: Campaign stats should compute totals and success rate."""
-        admin_sb = MagicMock()
-
-        ops_chain = _make_chain()
-        ops_chain.execute.return_value = MagicMock(data=[
+        ops = [
             {"operative_type": "spy", "status": "success"},
             {"operative_type": "spy", "status": "failed"},
             {"operative_type": "saboteur", "status": "success"},
             {"operative_type": "guardian", "status": "active"},
-        ])
+        ]
 
-        admin_sb.table.return_value = ops_chain
-
-        stats = await CycleNotificationService._build_campaign_stats(
-            admin_sb, EPOCH_ID, SIM_A,
-        )
+        stats = CycleNotificationService._build_campaign_stats(ops)
 
         assert stats["total_ops"] == 4
         # 2 successes out of 3 resolved (spy success, spy failed, saboteur success)
@@ -422,6 +364,23 @@ class TestBuildCampaignStats:
         assert stats["by_type"]["saboteur"] == 1
         assert stats["by_type"]["guardian"] == 1
 
+    @pytest.mark.asyncio
+    async def test_missions_are_grouped_by_source(self):
+        chain = _make_chain()
+        chain.execute.return_value = MagicMock(data=[
+            {"id": "1", "operative_type": "spy", "status": "success", "source_simulation_id": SIM_A},
+            {"id": "2", "operative_type": "spy", "status": "failed", "source_simulation_id": SIM_B},
+            {"id": "3", "operative_type": "guardian", "status": "active", "source_simulation_id": SIM_A},
+        ])
+        admin_sb = MagicMock()
+        admin_sb.table.return_value = chain
+
+        by_source = await CycleNotificationService._load_missions_by_source(admin_sb, EPOCH_ID)
+
+        assert [m["id"] for m in by_source[SIM_A]] == ["1", "3"]
+        assert [m["id"] for m in by_source[SIM_B]] == ["2"]
+        assert by_source[SIM_C] == []
+
 
 # ── Send Methods ──────────────────────────────────────────────
 
@@ -448,15 +407,57 @@ class TestSendCycleNotifications:
         """Should return True when SMTP send succeeds."""
         from backend.services.email_service import EmailService
 
-        with patch.object(EmailService, "_send_sync", return_value=True) as mock_sync:
-            with patch("backend.services.email_service.settings") as mock_settings:
-                mock_settings.smtp_host = "mail.example.com"
-                mock_settings.smtp_user = "user"
-                mock_settings.smtp_password = "pass"
+        with patch.object(EmailService, "queue") as mock_queue, \
+                patch("backend.services.email_service.settings") as mock_settings:
+            mock_settings.smtp_host = "mail.example.com"
+            mock_settings.smtp_user = "user"
+            mock_settings.smtp_password = "pass"
+            mock_settings.smtp_from = "Test <test@example.com>"
+            delivered = asyncio.get_running_loop().create_future()
+            delivered.set_result(True)
+            mock_queue.return_value.submit = AsyncMock(return_value=delivered)
+
+            result = await EmailService.send(
+                "test@example.com", "Test Subject", "<p>Test</p>"
+            )
+
+            assert result is True
+            mock_queue.return_value.submit.assert_awaited_once()
 
-                result = await EmailService.send(
-                    "test@example.com", "Test Subject", "<p>Test</p>"
-                )
+    @pytest.mark.asyncio
+    async def test_cycle_notifications_are_queued_then_awaited_together(self):
+        """Every briefing is submitted before any delivery result is awaited."""
+        from backend.services.email_service import EmailService
 
-                assert result is True
-                mock_sync.assert_called_once()
+        loop = asyncio.get_running_loop()
+        results = [loop.create_future(), loop.create_future()]
+        submitted = []
+
+        async def fake_submit(to, subject, html_body):
+            submitted.append(to)
+            if len(submitted) == len(results):
+                results[0].set_result(True)
+                results[1].set_result(False)
+            return results[len(submitted) - 1]
+
+        sb = MagicMock()
+        chain = MagicMock()
+        chain.select.return_value = chain
+        chain.eq.return_value = chain
+        chain.single.return_value = chain
+        chain.execute.return_value = MagicMock(data={"name": "Op", "status": "competition", "config": {}})
+        sb.table.return_value = chain
+        recipients = [
+            {"email": f"{sim}@example.com", "simulation_id": sim, "simulation_name": sim} for sim in (SIM_A, SIM_B)
+        ]
+
+        with (
+            patch.object(CycleNotificationService, "_resolve_recipients", AsyncMock(return_value=recipients)),
+            patch.object(CycleNotificationService, "_load_briefing_snapshot", AsyncMock(return_value=_snapshot())),
+            patch("backend.services.cycle_notification_service.render_cycle_briefing", return_value="<p>x</p>"),
+            patch.object(EmailService, "submit", side_effect=fake_submit),
+        ):
+            sent = await CycleNotificationService.send_cycle_notifications(sb, EPOCH_ID, 3)
+
+        assert submitted == [f"{SIM_A}@example.com", f"{SIM_B}@example.com"]
+        assert sent == 1
@@ -0,0 +1,254 @@
+"""Unit tests for CycleResolutionService — claim, staged run, progress and timings."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from backend.services import cycle_resolution_service
+from backend.services.cycle_resolution_service import STAGES, CycleResolutionService
+
+EPOCH_ID = uuid4()
+
+
+def _db():
+    """Admin client mock whose job-row updates record the written payloads."""
+    db = MagicMock()
+    chain = MagicMock()
+    chain.update.return_value = chain
+    chain.eq.return_value = chain
+    db.table.return_value = chain
+    return db, chain
+
+
+def _job(cycle=3):
+    return {"id": "job-1", "epoch_id": str(EPOCH_ID), "cycle_number": cycle, "status": "queued", "stages": []}
+
+
+def _stages(**overrides):
+    """Stage table where every stage records its name; overrides replace single stages."""
+    calls: list[str] = []
+
+    def _stage(name):
+        async def fn(run):
+            calls.append(name)
+            if name == "resolve":
+                run.epoch = {"current_cycle": run.job["cycle_number"] + 1, "config": {}}
+        return fn
+
+    fns = {name: overrides.get(name) or _stage(name) for name in STAGES}
+    return fns, calls
+
+
+class TestStart:
+    @pytest.mark.asyncio
+    async def test_rejects_inactive_epoch_without_claiming(self):
+        admin = MagicMock()
+        with (
+            patch.object(cycle_resolution_service.EpochService, "get", AsyncMock(
+                return_value={"status": "lobby", "current_cycle": 1},
+            )),
+            pytest.raises(HTTPException) as exc,
+        ):
+            await CycleResolutionService.start(MagicMock(), EPOCH_ID, admin)
+        assert exc.value.status_code == 400
+        admin.rpc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_claimed_job_is_scheduled(self):
+        admin = MagicMock()
+        admin.rpc.return_value.execute.return_value = MagicMock(data={**_job(), "claimed": True})
+        with (
+            patch.object(cycle_resolution_service.EpochService, "get", AsyncMock(
+                return_value={"status": "competition", "current_cycle": 3},
+            )),
+            patch.object(CycleResolutionService, "schedule") as schedule,
+        ):
+            job = await CycleResolutionService.start(MagicMock(), EPOCH_ID, admin)
+
+        params = admin.rpc.call_args[0][1]
+        assert params["p_cycle_number"] == 3
+        assert [s["name"] for s in params["p_stages"]] == list(STAGES)
+        schedule.assert_called_once_with(admin, job)
+
+    @pytest.mark.asyncio
+    async def test_unfinished_previous_job_is_claimed_instead_of_advancing_again(self):
+        admin = MagicMock()
+        previous = {**_job(cycle=2), "status": "running"}
+        admin.table.return_value.select.return_value.eq.return_value.eq.return_value.maybe_single.return_value \
+            .execute.return_value = MagicMock(data=previous)
+        admin.rpc.return_value.execute.return_value = MagicMock(data={**previous, "claimed": False})
+        with (
+            patch.object(cycle_resolution_service.EpochService, "get", AsyncMock(
+                return_value={"status": "competition", "current_cycle": 3},
+            )),
+            patch.object(CycleResolutionService, "schedule") as schedule,
+        ):
+            job = await CycleResolutionService.start(MagicMock(), EPOCH_ID, admin)
+
+        assert admin.rpc.call_args[0][1]["p_cycle_number"] == 2
+        assert job["cycle_number"] == 2
+        schedule.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_existing_job_is_returned_without_rescheduling(self):
+        admin = MagicMock()
+        existing = {**_job(), "status": "running", "claimed": False}
+        admin.rpc.return_value.execute.return_value = MagicMock(data=existing)
+        with (
+            patch.object(cycle_resolution_service.EpochService, "get", AsyncMock(
+                return_value={"status": "competition", "current_cycle": 3},
+            )),
+            patch.object(CycleResolutionService, "schedule") as schedule,
+        ):
+            job = await CycleResolutionService.start(MagicMock(), EPOCH_ID, admin)
+
+        assert job is existing
+        schedule.assert_not_called()
+
+
+class TestRun:
+    @pytest.mark.asyncio
+    async def test_runs_stages_in_order_with_timings(self):
+        db, chain = _db()
+        fns, calls = _stages()
+        with patch.dict(cycle_resolution_service._STAGE_FNS, fns):
+            job = await CycleResolutionService.run(db, _job())
+
+        assert calls == list(STAGES)
+        assert job["status"] == "succeeded"
+        assert job["stage"] is None and job["finished_at"]
+        assert all(s["status"] == "succeeded" and s["duration_ms"] >= 0 for s in job["stages"])
+        # Progress is persisted at start, before every stage and at the end
+        assert chain.update.call_count == len(STAGES) + 2
+        assert chain.update.call_args[0][0]["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_later_stage_failure_is_recorded_and_pipeline_continues(self):
+        db, _ = _db()
+        fns, calls = _stages(bots=AsyncMock(side_effect=RuntimeError("LLM down")))
+        with patch.dict(cycle_resolution_service._STAGE_FNS, fns):
+            job = await CycleResolutionService.run(db, _job())
+
+        by_name = {s["name"]: s for s in job["stages"]}
+        assert job["status"] == "succeeded"
+        assert by_name["bots"]["status"] == "failed"
+        assert by_name["bots"]["error"] == "LLM down"
+        assert calls == ["resolve", "missions", "fortifications", "scoring", "notifications"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_failure_fails_job_and_skips_the_rest(self):
+        db, _ = _db()
+        fns, calls = _stages(resolve=AsyncMock(side_effect=HTTPException(400, "Epoch not active.")))
+        with patch.dict(cycle_resolution_service._STAGE_FNS, fns):
+            job = await CycleResolutionService.run(db, _job())
+
+        assert job["status"] == "failed"
+        assert job["error"] == "Epoch not active."
+        assert [s["status"] for s in job["stages"]] == ["failed"] + ["skipped"] * (len(STAGES) - 1)
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_progress_write_failure_does_not_stop_the_job(self):
+        db, chain = _db()
+        chain.execute.side_effect = RuntimeError("db down")
+        fns, calls = _stages()
+        with patch.dict(cycle_resolution_service._STAGE_FNS, fns):
+            job = await CycleResolutionService.run(db, _job())
+
+        assert job["status"] == "succeeded"
+        assert calls == list(STAGES)
+
+    @pytest.mark.asyncio
+    async def test_resolve_stage_refuses_an_already_advanced_epoch(self):
+        db, _ = _db()
+        resolve_cycle = AsyncMock()
+        with (
+            patch.object(cycle_resolution_service.EpochService, "get", AsyncMock(
+                return_value={"status": "competition", "current_cycle": 4},
+            )),
+            patch.object(cycle_resolution_service.EpochService, "resolve_cycle", resolve_cycle),
+            patch.dict(cycle_resolution_service._STAGE_FNS, {n: AsyncMock() for n in STAGES[1:]}),
+        ):
+            job = await CycleResolutionService.run(db, _job(cycle=3))
+
+        assert job["status"] == "failed"
+        assert "already resolved" in job["error"]
+        resolve_cycle.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_job_resumes_after_the_epoch_advanced(self):
+        db, _ = _db()
+        epoch = {"status": "competition", "current_cycle": 4, "config": {}}
+        done = {"name": "missions", "status": "succeeded", "duration_ms": 12.0}
+        reclaimed = {**_job(cycle=3), "attempts": 2, "stages": [
+            {"name": "resolve", "status": "succeeded"}, done, {"name": "fortifications", "status": "running"},
+        ]}
+        later = {n: AsyncMock() for n in STAGES[1:]}
+        resolve_cycle = AsyncMock()
+        with (
+            patch.object(cycle_resolution_service.EpochService, "get", AsyncMock(return_value=epoch)),
+            patch.object(cycle_resolution_service.EpochService, "resolve_cycle", resolve_cycle),
+            patch.dict(cycle_resolution_service._STAGE_FNS, later),
+        ):
+            job = await CycleResolutionService.run(db, reclaimed)
+
+        assert job["status"] == "succeeded"
+        assert all(s["status"] == "succeeded" for s in job["stages"])
+        assert job["stages"][1] is done
+        resolve_cycle.assert_not_called()
+        later["missions"].assert_not_called()
+        for name in STAGES[2:]:
+            later[name].assert_awaited_once()
+        assert later["bots"].call_args[0][0].cycle_number == 4
+
+    @pytest.mark.asyncio
+    async def test_long_stage_keeps_the_job_fresh(self):
+        db, chain = _db()
+
+        async def slow_bots(run):
+            await asyncio.sleep(0.05)
+
+        fns, _ = _stages(bots=slow_bots)
+        with (
+            patch.object(cycle_resolution_service, "HEARTBEAT_INTERVAL", 0.01),
+            patch.dict(cycle_resolution_service._STAGE_FNS, fns),
+        ):
+            await CycleResolutionService.run(db, _job())
+
+        assert chain.update.call_count > len(STAGES) + 2
+
+
+    @pytest.mark.asyncio
+    async def test_fortification_stage_expires_in_bulk_and_logs_each(self):
+        from backend.services.battle_log_service import BattleLogService
+        from backend.services.operative_service import OperativeService
+
+        db, _ = _db()
+        expired = [{"id": "f1", "zone_id": "z1", "source_simulation_id": "s1"}]
+        run = cycle_resolution_service._Run(db, _job(cycle=6))
+        run.epoch = {"current_cycle": 7}
+        with (
+            patch.object(OperativeService, "expire_fortifications", AsyncMock(return_value=expired)) as expire,
+            patch.object(BattleLogService, "log_fortifications_expired", AsyncMock()) as log,
+        ):
+            await cycle_resolution_service._fortifications(run)
+
+        expire.assert_awaited_once_with(db, run.epoch_id, 7)
+        log.assert_awaited_once_with(db, run.epoch_id, 7, expired)
+
+class TestSchedule:
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_scheduled_jobs(self):
+        db, _ = _db()
+        fns, calls = _stages()
+        with patch.dict(cycle_resolution_service._STAGE_FNS, fns):
+            CycleResolutionService.schedule(db, _job())
+            await CycleResolutionService.drain()
+
+        assert calls == list(STAGES)
+        assert not cycle_resolution_service._tasks
@@ -0,0 +1,138 @@
+"""Unit tests for email_delivery — token bucket, persistent connections, queue retry."""
+
+import asyncio
+import smtplib
+import time
+
+import pytest
+
+from backend.services.email_delivery import EmailDeliveryQueue, SmtpConnection, TokenBucket, is_transient
+from backend.tests.smtp_sink import SmtpSink
+
+SENDER = "Test <test@example.com>"
+
+
+def _connection(sink: SmtpSink) -> SmtpConnection:
+    return SmtpConnection(sink.host, sink.port, "user", "pass", security="none", timeout=5)
+
+
+def _queue(sink: SmtpSink, **kwargs) -> EmailDeliveryQueue:
+    options = {"workers": 1, "rate": 0, "backoff": 0.01, **kwargs}
+    return EmailDeliveryQueue(lambda: _connection(sink), sender=SENDER, **options)
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate_then_paced(self):
+        bucket = TokenBucket(rate=50, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.02
+
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - start >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket(rate=0)
+        for _ in range(100):
+            await bucket.acquire()
+
+
+class TestSmtpConnection:
+    def test_reuses_one_authenticated_session(self):
+        with SmtpSink() as sink:
+            conn = _connection(sink)
+            for i in range(5):
+                conn.send(SENDER, f"p{i}@example.com", "Subject: hi\r\n\r\nbody")
+            conn.close()
+
+        assert len(sink.messages) == 5
+        assert sink.connections == 1
+        assert sink.logins == 1
+        assert sink.messages[0].sender == "test@example.com"
+        assert sink.messages[3].recipients == ["p3@example.com"]
+
+    def test_reconnects_when_server_dropped_the_session(self):
+        with SmtpSink() as sink:
+            conn = _connection(sink)
+            conn.send(SENDER, "a@example.com", "Subject: 1\r\n\r\n1")
+            sink.fail_next(0)
+            conn.send(SENDER, "b@example.com", "Subject: 2\r\n\r\n2")
+            conn.close()
+
+        assert [m.recipients for m in sink.messages] == [["a@example.com"], ["b@example.com"]]
+        assert conn.connects == 2
+
+    def test_classifies_failures(self):
+        assert is_transient(smtplib.SMTPSenderRefused(451, b"later", "x"))
+        assert not is_transient(smtplib.SMTPSenderRefused(550, b"no", "x"))
+        assert not is_transient(smtplib.SMTPAuthenticationError(535, b"bad creds"))
+        assert is_transient(smtplib.SMTPServerDisconnected())
+        assert is_transient(TimeoutError())
+        assert not is_transient(smtplib.SMTPRecipientsRefused({"a@x": (550, b"unknown")}))
+
+
+class TestEmailDeliveryQueue:
+    @pytest.mark.asyncio
+    async def test_delivers_all_over_persistent_connections(self):
+        with SmtpSink() as sink:
+            queue = _queue(sink, workers=2)
+            futures = [await queue.submit(f"p{i}@example.com", "s", f"Subject: {i}\r\n\r\n{i}") for i in range(20)]
+            results = await asyncio.gather(*futures)
+            await queue.close()
+
+        assert results == [True] * 20
+        assert len(sink.messages) == 20
+        assert sink.connections <= 2
+        assert queue.stats()["sent"] == 20
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self):
+        with SmtpSink() as sink:
+            sink.fail_next(451, 421)
+            queue = _queue(sink)
+            ok = await queue.send("a@example.com", "s", "Subject: s\r\n\r\nbody")
+            await queue.close()
+
+        assert ok is True
+        assert len(sink.messages) == 1
+        assert queue.stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_permanent_failure_is_not_retried(self):
+        with SmtpSink() as sink:
+            sink.fail_next(550)
+            queue = _queue(sink)
+            ok = await queue.send("a@example.com", "s", "Subject: s\r\n\r\nbody")
+            await queue.close()
+
+        assert ok is False
+        assert sink.messages == []
+        assert queue.stats() | {"queued": 0} == {"sent": 0, "failed": 1, "retries": 0, "queued": 0, "connects": 1}
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        with SmtpSink() as sink:
+            sink.fail_next(451, 451, 451)
+            queue = _queue(sink, max_attempts=3)
+            ok = await queue.send("a@example.com", "s", "Subject: s\r\n\r\nbody")
+            await queue.close()
+
+        assert ok is False
+        assert queue.stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_is_closed(self):
+        with SmtpSink() as sink:
+            queue = _queue(sink, idle_timeout=0.05)
+            await queue.send("a@example.com", "s", "Subject: s\r\n\r\nbody")
+            await asyncio.sleep(0.2)
+            assert not queue._connections[0].is_open
+            await queue.send("b@example.com", "s", "Subject: s\r\n\r\nbody")
+            await queue.close()
+
+        assert sink.connections == 2
+        assert len(sink.messages) == 2
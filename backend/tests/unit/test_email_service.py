@@ -1,11 +1,13 @@
-"""Unit tests for EmailService — SMTP config validation and message construction."""
+"""Unit tests for EmailService — SMTP config validation and delivery via a local sink."""
 
 import logging
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from backend.config import settings
 from backend.services.email_service import EmailService
+from backend.tests.smtp_sink import SmtpSink
 
 
 class TestEmailServiceConfig:
@@ -31,57 +33,19 @@ class TestEmailServiceConfig:
             assert EmailService._is_configured() is True
 
 
-class TestEmailServiceSendSync:
-    @patch("backend.services.email_service.smtplib.SMTP_SSL")
-    @patch("backend.services.email_service.settings")
-    def test_successful_send(self, mock_settings, mock_smtp_class):
-        mock_settings.smtp_host = "mail.example.com"
-        mock_settings.smtp_port = 465
-        mock_settings.smtp_user = "user"
-        mock_settings.smtp_password = "pass"
-        mock_settings.smtp_from = "Test <test@example.com>"
+def _sink_settings(sink: SmtpSink):
+    return settings.model_copy(update={
+        "smtp_host": sink.host,
+        "smtp_port": sink.port,
+        "smtp_user": "user",
+        "smtp_password": "pass",
+        "smtp_from": "Test <test@example.com>",
+        "smtp_security": "none",
+        "smtp_rate_per_second": 0,
+    })
 
-        mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
 
-        result = EmailService._send_sync("to@example.com", "Test Subject", "<h1>Hi</h1>")
-        assert result is True
-        mock_server.login.assert_called_once_with("user", "pass")
-        mock_server.sendmail.assert_called_once()
-
-    @patch("backend.services.email_service.smtplib.SMTP_SSL")
-    @patch("backend.services.email_service.settings")
-    def test_smtp_error_returns_false(self, mock_settings, mock_smtp_class):
-        import smtplib
-
-        mock_settings.smtp_host = "mail.example.com"
-        mock_settings.smtp_port = 465
-        mock_settings.smtp_user = "user"
-        mock_settings.smtp_password = "pass"
-        mock_settings.smtp_from = "Test <test@example.com>"
-
-        mock_smtp_class.side_effect = smtplib.SMTPException("Auth failed")
-
-        result = EmailService._send_sync("to@example.com", "Test", "<p>Hi</p>")
-        assert result is False
-
-    @patch("backend.services.email_service.smtplib.SMTP_SSL")
-    @patch("backend.services.email_service.settings")
-    def test_timeout_returns_false(self, mock_settings, mock_smtp_class):
-        mock_settings.smtp_host = "mail.example.com"
-        mock_settings.smtp_port = 465
-        mock_settings.smtp_user = "user"
-        mock_settings.smtp_password = "pass"
-        mock_settings.smtp_from = "Test <test@example.com>"
-
-        mock_smtp_class.side_effect = TimeoutError("Connection timed out")
-
-        result = EmailService._send_sync("to@example.com", "Test", "<p>Hi</p>")
-        assert result is False
-
-
-class TestEmailServiceSendAsync:
+class TestEmailServiceSend:
     @pytest.mark.asyncio
     async def test_send_returns_false_when_not_configured(self):
         with patch("backend.services.email_service.settings") as mock_settings:
@@ -92,38 +56,61 @@ class TestEmailServiceSendAsync:
             assert result is False
 
     @pytest.mark.asyncio
-    async def test_send_delegates_to_send_sync(self):
-        with (
-            patch("backend.services.email_service.settings") as mock_settings,
-            patch.object(EmailService, "_send_sync", return_value=True) as mock_sync,
-        ):
-            mock_settings.smtp_host = "mail.example.com"
-            mock_settings.smtp_user = "user"
-            mock_settings.smtp_password = "pass"
+    async def test_successful_send(self):
+        with SmtpSink() as sink, patch("backend.services.email_service.settings", _sink_settings(sink)):
+            result = await EmailService.send("to@example.com", "Test Subject", "<h1>Hi</h1>")
+            await EmailService.close()
+
+        assert result is True
+        assert sink.logins == 1
+        message = sink.messages[0]
+        assert message.recipients == ["to@example.com"]
+        assert message.parsed["Subject"] == "Test Subject"
+        assert message.parsed["From"] == "Test <test@example.com>"
+
+    @pytest.mark.asyncio
+    async def test_consecutive_sends_share_one_connection(self):
+        with SmtpSink() as sink, patch("backend.services.email_service.settings", _sink_settings(sink)):
+            futures = [await EmailService.submit(f"p{i}@example.com", "Briefing", "<p>Hi</p>") for i in range(6)]
+            results = [await f for f in futures]
+            await EmailService.close()
 
+        assert results == [True] * 6
+        assert sink.connections <= settings.smtp_pool_size
+        assert sink.logins == sink.connections
+
+    @pytest.mark.asyncio
+    async def test_smtp_error_returns_false(self):
+        with SmtpSink() as sink, patch("backend.services.email_service.settings", _sink_settings(sink)):
+            sink.fail_next(550)
             result = await EmailService.send("to@example.com", "Test", "<p>Hi</p>")
-            assert result is True
-            mock_sync.assert_called_once_with("to@example.com", "Test", "<p>Hi</p>")
+            await EmailService.close()
 
+        assert result is False
 
-class TestEmailServiceLogging:
-    """Verify logging output for email operations."""
+    @pytest.mark.asyncio
+    async def test_connection_refused_returns_false(self):
+        with SmtpSink() as sink:
+            unreachable = _sink_settings(sink).model_copy(update={"smtp_max_attempts": 1})
+        with patch("backend.services.email_service.settings", unreachable):
+            result = await EmailService.send("to@example.com", "Test", "<p>Hi</p>")
+            await EmailService.close()
+
+        assert result is False
 
-    @patch("backend.services.email_service.smtplib.SMTP_SSL")
-    @patch("backend.services.email_service.settings")
-    def test_successful_send_logs_info(self, mock_settings, mock_smtp_class, caplog):
-        mock_settings.smtp_host = "mail.example.com"
-        mock_settings.smtp_port = 465
-        mock_settings.smtp_user = "user"
-        mock_settings.smtp_password = "pass"
-        mock_settings.smtp_from = "Test <test@example.com>"
 
-        mock_server = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+class TestEmailServiceLogging:
+    """Verify logging output for email operations."""
 
-        with caplog.at_level(logging.INFO, logger="backend.services.email_service"):
-            EmailService._send_sync("to@example.com", "Test Subject", "<h1>Hi</h1>")
+    @pytest.mark.asyncio
+    async def test_successful_send_logs_info(self, caplog):
+        with (
+            SmtpSink() as sink,
+            patch("backend.services.email_service.settings", _sink_settings(sink)),
+            caplog.at_level(logging.INFO, logger="backend.services.email_delivery"),
+        ):
+            await EmailService.send("to@example.com", "Test Subject", "<h1>Hi</h1>")
+            await EmailService.close()
 
         info_records = [r for r in caplog.records if r.levelno == logging.INFO]
         assert len(info_records) >= 1
@@ -131,21 +118,16 @@ class TestEmailServiceLogging:
         assert record.recipient == "to@example.com"
         assert "subject_preview" in record.__dict__
 
-    @patch("backend.services.email_service.smtplib.SMTP_SSL")
-    @patch("backend.services.email_service.settings")
-    def test_smtp_error_logs_exception(self, mock_settings, mock_smtp_class, caplog):
-        import smtplib
-
-        mock_settings.smtp_host = "mail.example.com"
-        mock_settings.smtp_port = 465
-        mock_settings.smtp_user = "user"
-        mock_settings.smtp_password = "pass"
-        mock_settings.smtp_from = "Test <test@example.com>"
-
-        mock_smtp_class.side_effect = smtplib.SMTPException("Auth failed")
-
-        with caplog.at_level(logging.ERROR, logger="backend.services.email_service"):
-            EmailService._send_sync("to@example.com", "Test", "<p>Hi</p>")
+    @pytest.mark.asyncio
+    async def test_smtp_error_logs_exception(self, caplog):
+        with (
+            SmtpSink() as sink,
+            patch("backend.services.email_service.settings", _sink_settings(sink)),
+            caplog.at_level(logging.ERROR, logger="backend.services.email_delivery"),
+        ):
+            sink.fail_next(550)
+            await EmailService.send("to@example.com", "Test", "<p>Hi</p>")
+            await EmailService.close()
 
         error_records = [r for r in caplog.records if r.levelno == logging.ERROR]
         assert len(error_records) >= 1
@@ -153,24 +135,7 @@ class TestEmailServiceLogging:
         # PII check: recipient should be in extra, NOT in the message string
         assert "to@example.com" not in record.message
         assert record.recipient == "to@example.com"
-
-    @patch("backend.services.email_service.smtplib.SMTP_SSL")
-    @patch("backend.services.email_service.settings")
-    def test_timeout_logs_exception(self, mock_settings, mock_smtp_class, caplog):
-        mock_settings.smtp_host = "mail.example.com"
-        mock_settings.smtp_port = 465
-        mock_settings.smtp_user = "user"
-        mock_settings.smtp_password = "pass"
-        mock_settings.smtp_from = "Test <test@example.com>"
-
-        mock_smtp_class.side_effect = TimeoutError("Connection timed out")
-
-        with caplog.at_level(logging.ERROR, logger="backend.services.email_service"):
-            EmailService._send_sync("to@example.com", "Test", "<p>Hi</p>")
-
-        error_records = [r for r in caplog.records if r.levelno == logging.ERROR]
-        assert len(error_records) >= 1
-        assert error_records[0].exc_info is not None
+        assert record.exc_info is not None
 
     @pytest.mark.asyncio
     async def test_not_configured_logs_warning(self, caplog):
@@ -0,0 +1,110 @@
+"""Unit tests for EmbeddingService — content-hash cache tiers, batching, coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from backend.services import embedding_service
+from backend.services.embedding_service import ZERO_VECTOR, EmbeddingService, content_hash
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text)), 1.0]
+
+
+class FakeEmbeddingsApi:
+    """MockTransport handler answering /embeddings with one vector per input."""
+
+    def __init__(self, status: int = 200) -> None:
+        self.status = status
+        self.requests: list[list[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        inputs = json.loads(request.content)["input"]
+        self.requests.append(inputs)
+        if self.status != 200:
+            return httpx.Response(self.status, json={"error": "down"})
+        data = [{"index": i, "embedding": _vector(text)} for i, text in enumerate(inputs)]
+        return httpx.Response(200, json={"data": list(reversed(data))})
+
+
+@pytest.fixture
+def api():
+    fake = FakeEmbeddingsApi()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    EmbeddingService.clear_cache()
+    with (
+        patch.object(EmbeddingService, "_http_client", return_value=client),
+        patch.object(EmbeddingService, "_load_cached", new_callable=AsyncMock, return_value={}) as load,
+        patch.object(EmbeddingService, "_store_cached", new_callable=AsyncMock) as store,
+        patch.object(embedding_service.settings, "forge_mock_mode", False),
+    ):
+        fake.load, fake.store = load, store
+        yield fake
+    EmbeddingService.clear_cache()
+
+
+class TestEmbedMany:
+    async def test_one_request_for_all_uncached_inputs_in_order(self, api):
+        vectors = await EmbeddingService.embed_many(["alpha", "be", "alpha"], api_key="k")
+
+        assert vectors == [_vector("alpha"), _vector("be"), _vector("alpha")]
+        assert api.requests == [["alpha", "be"]]
+        api.store.assert_awaited_once_with({content_hash("alpha"): _vector("alpha"), content_hash("be"): _vector("be")})
+
+    async def test_memory_tier_skips_table_and_api(self, api):
+        await EmbeddingService.embed_many(["alpha"], api_key="k")
+        api.load.reset_mock()
+
+        assert await EmbeddingService.embed_many(["alpha"], api_key="k") == [_vector("alpha")]
+        assert len(api.requests) == 1
+        api.load.assert_not_awaited()
+
+    async def test_table_tier_is_checked_before_api(self, api):
+        api.load.return_value = {content_hash("alpha"): [9.0, 9.0]}
+
+        vectors = await EmbeddingService.embed_many(["alpha", "be"], api_key="k")
+
+        assert vectors == [[9.0, 9.0], _vector("be")]
+        assert api.requests == [["be"]]
+
+    async def test_large_input_is_chunked(self, api):
+        texts = [f"t{i}" for i in range(embedding_service.MAX_BATCH_SIZE + 5)]
+
+        vectors = await EmbeddingService.embed_many(texts, api_key="k")
+
+        assert vectors == [_vector(t) for t in texts]
+        assert [len(r) for r in api.requests] == [embedding_service.MAX_BATCH_SIZE, 5]
+
+    async def test_failed_request_returns_zero_vectors_uncached(self, api):
+        api.status = 503
+
+        assert await EmbeddingService.embed_many(["alpha"], api_key="k") == [ZERO_VECTOR]
+        api.status = 200
+        assert await EmbeddingService.embed_many(["alpha"], api_key="k") == [_vector("alpha")]
+        assert len(api.requests) == 2
+
+    async def test_mock_mode_returns_zero_vectors(self, api):
+        with patch.object(embedding_service.settings, "forge_mock_mode", True):
+            assert await EmbeddingService.embed_many(["a", "b"], api_key="k") == [ZERO_VECTOR, ZERO_VECTOR]
+        assert api.requests == []
+
+
+class TestEmbed:
+    async def test_concurrent_calls_share_one_request(self, api):
+        vectors = await asyncio.gather(*(EmbeddingService.embed(f"text {i}", api_key="k") for i in range(5)))
+
+        assert vectors == [_vector(f"text {i}") for i in range(5)]
+        assert len(api.requests) == 1
+        assert sorted(api.requests[0]) == [f"text {i}" for i in range(5)]
+
+    async def test_cached_text_returns_without_batching(self, api):
+        await EmbeddingService.embed("alpha", api_key="k")
+
+        assert await EmbeddingService.embed("alpha", api_key="k") == _vector("alpha")
+        assert len(api.requests) == 1
@@ -309,9 +309,9 @@ class TestEpochChatLogging:
         with (
             caplog.at_level(logging.INFO, logger="backend.services.epoch_chat_service"),
             patch(
-                "backend.services.epoch_service.EpochService.resolve_cycle_full",
+                "backend.services.cycle_resolution_service.CycleResolutionService.start",
                 new_callable=AsyncMock,
-                return_value={"current_cycle": 2},
+                return_value={"id": "job-1", "cycle_number": 1, "status": "queued", "claimed": True},
             ),
         ):
             await EpochChatService.toggle_ready(
@@ -351,7 +351,7 @@ class TestEpochChatLogging:
         with (
             caplog.at_level(logging.ERROR, logger="backend.services.epoch_chat_service"),
             patch(
-                "backend.services.epoch_service.EpochService.resolve_cycle_full",
+                "backend.services.cycle_resolution_service.CycleResolutionService.start",
                 new_callable=AsyncMock,
                 side_effect=RuntimeError("Scoring failed"),
             ),
@@ -0,0 +1,461 @@
+"""Tests for the headless epoch engine, including parity runs against the real services."""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+import re
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services.epoch_engine import EngineError, EpochEngine, WorldSeed
+from backend.services.epoch_replay import fetch_log, replay_epoch
+from backend.services.epoch_service import EpochService, phase_boundaries
+from backend.services.mission_probability import build_contexts, success_probability
+from backend.services.operative_service import OperativeService
+from backend.services.scoring_service import ScoringService
+
+# ── In-memory PostgREST stand-in ───────────────────────────────
+
+
+class _Query:
+    """Enough of the PostgREST builder to run the resolver, cycle and scoring queries over lists of dicts."""
+
+    def __init__(self, db: FakeSupabase, table: str) -> None:
+        self._db = db
+        self._table = table
+        self._filters: list = []
+        self._single = self._maybe = False
+        self._write: tuple[str, object] | None = None
+        self._range: tuple[int, int] | None = None
+        self._order: list[tuple[str, bool]] = []
+
+    def select(self, _columns="*", count=None):
+        return self
+
+    def eq(self, col, value):
+        self._filters.append(lambda r: str(r.get(col)) == str(value))
+        return self
+
+    def neq(self, col, value):
+        self._filters.append(lambda r: str(r.get(col)) != str(value))
+        return self
+
+    def lte(self, col, value):
+        self._filters.append(lambda r: r.get(col) is not None and r[col] <= value)
+        return self
+
+    def in_(self, col, values):
+        wanted = {str(v) for v in values}
+        self._filters.append(lambda r: str(r.get(col)) in wanted)
+        return self
+
+    def or_(self, expr):
+        clauses = []
+        for col, op, value in re.findall(r"(\w+)\.(eq|in)\.(\([^)]*\)|[^,]+)", expr):
+            values = set(value.strip("()").split(",")) if op == "in" else {value}
+            clauses.append((col, values))
+        self._filters.append(lambda r: any(str(r.get(col)) in values for col, values in clauses))
+        return self
+
+    def order(self, col, desc=False):
+        self._order.append((col, desc))
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def single(self):
+        self._single = True
+        return self
+
+    def maybe_single(self):
+        self._single = self._maybe = True
+        return self
+
+    def insert(self, rows):
+        self._write = ("insert", rows)
+        return self
+
+    def update(self, values):
+        self._write = ("update", values)
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self._write = ("upsert", rows)
+        return self
+
+    def execute(self):
+        table = self._db.tables.setdefault(self._table, [])
+        if self._write and self._write[0] in ("insert", "upsert"):
+            rows = self._write[1] if isinstance(self._write[1], list) else [self._write[1]]
+            rows = [{"id": str(uuid4()), **r} for r in rows]
+            table.extend(rows)
+            return SimpleNamespace(data=rows, count=None)
+        rows = [r for r in table if all(f(r) for f in self._filters)]
+        if self._write:
+            for r in rows:
+                r.update(self._write[1])
+        rows = copy.deepcopy(rows)  # Responses are snapshots, not live rows
+        for col, desc in reversed(self._order):
+            rows.sort(key=lambda r, col=col: str(r.get(col)), reverse=desc)
+        if self._range:
+            rows = rows[self._range[0]:self._range[1] + 1]
+        if self._single:
+            if not rows and self._maybe:
+                return None  # postgrest-py: maybe_single() with no row returns no response
+            return SimpleNamespace(data=rows[0] if rows else None, count=None)
+        return SimpleNamespace(data=rows, count=None)
+
+
+class FakeSupabase:
+    def __init__(self, tables: dict[str, list[dict]]) -> None:
+        self.tables = tables
+
+    def table(self, name):
+        return _Query(self, name)
+
+    def rpc(self, name, params=None):
+        def execute():
+            if name == "fn_apply_mission_results":
+                by_id = {m["id"]: m for m in self.tables["operative_missions"]}
+                for r in params["p_results"]:
+                    by_id[r["id"]].update(r)
+                return SimpleNamespace(data=copy.deepcopy([by_id[r["id"]] for r in params["p_results"]]))
+            return SimpleNamespace(data=None)
+
+        return SimpleNamespace(execute=execute)
+
+
+# ── World fixture ──────────────────────────────────────────────
+
+SIMS = [str(uuid4()) for _ in range(4)]
+LEVELS = ["low", "moderate", "guarded", "high"]
+
+
+def _world() -> WorldSeed:
+    seed = WorldSeed()
+    for i, sim in enumerate(SIMS):
+        seed.simulations.append({"id": sim, "name": f"Sim {i}", "slug": f"sim-{i}"})
+        for j in range(4):
+            agent_id = str(uuid4())
+            seed.agents.append({"id": agent_id, "simulation_id": sim, "name": f"Agent {i}.{j}"})
+            for op in ("spy", "saboteur", "propagandist", "assassin", "guardian", "infiltrator"):
+                seed.agent_aptitudes.append({
+                    "agent_id": agent_id, "simulation_id": sim, "operative_type": op, "aptitude_level": 1 + (i + j) % 9,
+                })
+        for j, level in enumerate(LEVELS):
+            seed.zones.append({
+                "id": str(uuid4()), "simulation_id": sim, "name": f"Zone {i}.{j}", "security_level": level,
+                "infrastructure_score": 0.6, "total_pressure": 0.1,
+            })
+        for _ in range(3):
+            seed.buildings.append({"id": str(uuid4()), "simulation_id": sim, "building_condition": "good"})
+    for a, b in ((0, 1), (1, 2), (2, 3), (3, 0)):
+        seed.embassies.append({
+            "id": str(uuid4()), "simulation_a_id": SIMS[a], "simulation_b_id": SIMS[b],
+            "status": "active", "effectiveness": 0.5 + 0.1 * a,
+        })
+    agents = [a["id"] for a in seed.agents]
+    for k in range(0, len(agents) - 1, 2):
+        seed.agent_relationships.append({
+            "id": str(uuid4()), "source_agent_id": agents[k], "target_agent_id": agents[k + 1], "intensity": 6,
+        })
+    return seed
+
+
+def _engine(seed: int = 0, **kwargs) -> EpochEngine:
+    engine = EpochEngine(_world(), seed=seed, **kwargs)
+    engine.start()
+    return engine
+
+
+def _seed_due_missions(engine: EpochEngine, count: int, rng: random.Random) -> None:
+    """Active missions of every offensive type, already due, across all pairs (allies included)."""
+    team = engine.create_team(SIMS[0], "Pact")
+    engine.join_team(team["id"], SIMS[1])
+    ops = ["spy", "saboteur", "propagandist", "assassin", "infiltrator"]
+    for k in range(count):
+        op = ops[k % len(ops)]
+        source = SIMS[k % 4]
+        target = SIMS[(k + 1 + k // 4) % 4] if SIMS[(k + 1 + k // 4) % 4] != source else SIMS[(k + 2) % 4]
+        entity = None
+        if op == "saboteur":
+            entity = rng.choice([b["id"] for b in engine.buildings.values() if b["simulation_id"] == target])
+        elif op == "assassin":
+            entity = rng.choice([a["id"] for a in engine.agents.values() if a["simulation_id"] == target])
+        elif op == "infiltrator":
+            entity = rng.choice(list(engine.embassies))
+        engine.operative_missions.append({
+            "id": str(uuid4()), "epoch_id": engine.epoch["id"], "agent_id": str(uuid4()),
+            "operative_type": op, "source_simulation_id": source, "target_simulation_id": target,
+            "target_entity_id": entity, "status": "active" if k % 7 else "deploying",
+            "success_probability": rng.uniform(0.2, 0.9), "resolves_at": "2000-01-01T00:00:00+00:00",
+        })
+
+
+def _service_db(engine: EpochEngine) -> FakeSupabase:
+    return FakeSupabase(copy.deepcopy(engine.tables()))
+
+
+def _state(tables: dict[str, list[dict]]) -> dict:
+    """The parts of the world a resolution pass can change."""
+    return {
+        "missions": {m["id"]: (m["status"], (m.get("mission_result") or {}).get("outcome")) for m in tables["operative_missions"]},
+        "buildings": {b["id"]: b["building_condition"] for b in tables["buildings"]},
+        "zones": {z["id"]: z["security_level"] for z in tables["zones"]},
+        "events": [(e["simulation_id"], e["data_source"], e["impact_level"]) for e in tables.get("events", [])],
+        "intensity": {r["id"]: r["intensity"] for r in tables["agent_relationships"]},
+        "blocked": sorted(a["id"] for a in tables["agents"] if a.get("ambassador_blocked_until")),
+        "infiltrated": sorted(e["id"] for e in tables["embassies"] if e.get("infiltration_penalty")),
+        "teams": {p["simulation_id"]: (p["team_id"], p["betrayal_penalty"]) for p in tables["epoch_participants"]},
+        "log": sorted(e["event_type"] for e in tables.get("battle_log", []) if e["event_type"] in ("intel_report", "betrayal")),
+    }
+
+
+# ── Parity with the services ───────────────────────────────────
+
+
+class TestResolutionParity:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+    async def test_resolve_pending_missions_matches_service(self, seed):
+        engine = _engine(seed)
+        _seed_due_missions(engine, 40, random.Random(seed))  # noqa: S311
+        db = _service_db(engine)
+        # Deploy/betrayal log entries are not part of the comparison
+        engine.battle_log.clear()
+        db.tables["battle_log"] = []
+
+        with patch("backend.services.operative_service.get_admin_supabase", new_callable=AsyncMock, return_value=db):
+            service_resolved = await OperativeService.resolve_pending_missions(db, engine.epoch["id"])
+        engine_resolved = engine.resolve_pending_missions()
+
+        assert [m["id"] for m in engine_resolved] == [m["id"] for m in service_resolved]
+        assert _state(engine.tables()) == _state(db.tables)
+
+    @pytest.mark.asyncio
+    async def test_service_writes_the_engine_replay_record(self):
+        engine = _engine(3, record_replay=True)
+        _seed_due_missions(engine, 20, random.Random(3))  # noqa: S311
+        db = _service_db(engine)
+
+        with patch("backend.services.operative_service.get_admin_supabase", new_callable=AsyncMock, return_value=db):
+            await OperativeService.resolve_pending_missions(db, engine.epoch["id"])
+        engine.resolve_pending_missions()
+
+        [service_record] = db.tables["epoch_cycle_replays"]
+        [engine_record] = engine.epoch_cycle_replays
+        assert service_record["kind"] == engine_record["kind"] == "resolution"
+        assert service_record["payload"] == engine_record["payload"]
+        assert len(service_record["payload"]["rolls"]) >= len(service_record["payload"]["missions"])
+
+    @pytest.mark.asyncio
+    async def test_epoch_without_a_seed_row_still_resolves(self):
+        engine = _engine(4)
+        _seed_due_missions(engine, 10, random.Random(4))  # noqa: S311
+        db = _service_db(engine)
+        db.tables["epoch_rng_seeds"] = []  # Started before per-epoch seeds existed
+
+        with patch("backend.services.operative_service.get_admin_supabase", new_callable=AsyncMock, return_value=db):
+            resolved = await OperativeService.resolve_pending_missions(db, engine.epoch["id"])
+
+        assert resolved
+        assert (await fetch_log(db, engine.epoch["id"]))["rng_seed"] is None
+
+    @pytest.mark.asyncio
+    async def test_outcomes_cover_every_branch(self):
+        engine = _engine(7)
+        _seed_due_missions(engine, 40, random.Random(7))  # noqa: S311
+        resolved = engine.resolve_pending_missions()
+        assert {m["status"] for m in resolved} == {"success", "failed", "detected"}
+        assert any(e["data_source"] == "sabotage" for e in engine.events)
+
+
+class TestCycleParity:
+    @pytest.mark.asyncio
+    async def test_resolve_cycle_matches_service_through_the_epoch(self):
+        engine = _engine()
+        db = _service_db(engine)
+        epoch_id = engine.epoch["id"]
+        _, _, total_cycles = phase_boundaries(engine.config)
+
+        with patch("backend.services.epoch_service.GameInstanceService.archive_instances", new_callable=AsyncMock):
+            while engine.status != "completed":
+                service_epoch = await EpochService.resolve_cycle(db, epoch_id, admin_supabase=db)
+                engine.resolve_cycle()
+                assert (service_epoch["status"], service_epoch["current_cycle"]) == (engine.status, engine.current_cycle)
+                assert {p["simulation_id"]: p["current_rp"] for p in db.tables["epoch_participants"]} == {
+                    sim: p["current_rp"] for sim, p in engine.participants.items()
+                }
+        assert engine.current_cycle == total_cycles
+
+    @pytest.mark.asyncio
+    async def test_scores_match_scoring_service(self):
+        engine = _engine(3)
+        _seed_due_missions(engine, 30, random.Random(3))  # noqa: S311
+        engine.resolve_pending_missions()
+        engine_rows = engine.compute_cycle_scores(2)
+
+        tables = copy.deepcopy(engine.tables())
+        tables["mv_zone_stability"] = engine.zone_stability()
+        tables["mv_embassy_effectiveness"] = engine.scoring_data().embassy_effectiveness
+        db = FakeSupabase(tables)
+        with (
+            patch("backend.services.scoring_service.EpochService.get", new_callable=AsyncMock, return_value=engine.epoch),
+            patch(
+                "backend.services.scoring_service.EpochService.list_participants",
+                new_callable=AsyncMock,
+                return_value=list(engine.participants.values()),
+            ),
+        ):
+            service_rows = await ScoringService.compute_cycle_scores(db, engine.epoch["id"], 2)
+
+        def key(rows):
+            return {r["simulation_id"]: round(r["composite_score"], 9) for r in rows}
+
+        assert key(service_rows) == key(engine_rows)
+
+
+# ── Engine rules ───────────────────────────────────────────────
+
+
+class TestDeploy:
+    def test_foundation_allows_only_guardian_and_spy(self):
+        engine = _engine()
+        agent = next(a for a in engine.agents.values() if a["simulation_id"] == SIMS[0])
+        embassy = engine.active_embassy(SIMS[0], SIMS[1])
+
+        with pytest.raises(EngineError) as exc:
+            engine.deploy(SIMS[0], agent["id"], "saboteur", target_simulation_id=SIMS[1], embassy_id=embassy["id"])
+        assert exc.value.status_code == 400
+
+    def test_deploy_spends_rp_and_rejects_busy_agent(self):
+        engine = _engine()
+        agent = next(a for a in engine.agents.values() if a["simulation_id"] == SIMS[0])
+        embassy = engine.active_embassy(SIMS[0], SIMS[1])
+        before = engine.participants[SIMS[0]]["current_rp"]
+
+        mission = engine.deploy(SIMS[0], agent["id"], "spy", target_simulation_id=SIMS[1], embassy_id=embassy["id"])
+
+        assert engine.participants[SIMS[0]]["current_rp"] == before - 3
+        assert mission["status"] == "active"
+        assert 0.05 <= mission["success_probability"] <= 0.95
+        with pytest.raises(EngineError) as exc:
+            engine.deploy(SIMS[0], agent["id"], "guardian")
+        assert exc.value.status_code == 409
+
+    def test_guardians_lower_enemy_success(self):
+        engine = _engine()
+        attacker, defender = SIMS[0], SIMS[1]
+        agent = next(a["id"] for a in engine.agents.values() if a["simulation_id"] == attacker)
+
+        def probability():
+            payload = engine.deployment_payload(attacker, ["spy"], [defender], agent_ids=[agent])
+            return success_probability(build_contexts(payload, [agent], "spy", [defender])[(agent, defender)])
+
+        baseline = probability()
+        for guardian in [a["id"] for a in engine.agents.values() if a["simulation_id"] == defender][:2]:
+            engine.deploy(defender, guardian, "guardian")
+
+        assert engine.guardian_count(defender) == 2
+        assert probability() < baseline
+
+    def test_fortification_expires_after_foundation(self):
+        engine = _engine()
+        zone = next(z for z in engine.zones if z["simulation_id"] == SIMS[0] and z["security_level"] == "moderate")
+        engine.fortify_zone(SIMS[0], zone["id"])
+        assert zone["security_level"] == "guarded"
+
+        foundation_end, _, _ = phase_boundaries(engine.config)
+        while engine.current_cycle < foundation_end + 5:
+            engine.resolve_cycle_full()
+        assert zone["security_level"] == "moderate"
+        assert engine.zone_fortifications == []
+
+
+def _play_epoch(engine: EpochEngine, seed: int) -> EpochEngine:
+    rng = random.Random(seed)  # noqa: S311
+    while engine.status != "completed":
+        for sim in SIMS:
+            free = [a for a in engine.agents.values() if a["simulation_id"] == sim and a["id"] not in engine.busy_agent_ids()]
+            target = SIMS[(SIMS.index(sim) + 1) % 4]
+            embassy = engine.active_embassy(sim, target)
+            op = "spy" if engine.status == "foundation" else rng.choice(["spy", "saboteur", "propagandist"])
+            if free and embassy:
+                try:
+                    engine.deploy(sim, free[0]["id"], op, target_simulation_id=target, embassy_id=embassy["id"])
+                except EngineError:
+                    pass
+        engine.resolve_cycle_full()
+    return engine
+
+
+class TestFullGame:
+    @staticmethod
+    def _play(seed: int) -> list[dict]:
+        return _play_epoch(_engine(seed), seed).leaderboard()
+
+    def test_same_seed_same_result(self):
+        assert self._play(11) == self._play(11)
+
+    def test_full_epoch_runs_fast(self):
+        start = time.perf_counter()
+        board = self._play(5)
+        assert [row["rank"] for row in board] == [1, 2, 3, 4]
+        assert time.perf_counter() - start < 2.0
+
+
+class TestReplay:
+    def test_replay_reproduces_every_cycle(self):
+        engine = _play_epoch(_engine(21, record_replay=True), 21)
+        log = json.loads(json.dumps(engine.replay_log()))  # as stored: through JSON
+
+        report = replay_epoch(log)
+
+        assert report.identical
+        assert report.resolutions > 0 and report.missions > 0
+        assert report.cycles_scored == engine.current_cycle - 1  # cycle 1 is never scored
+        final = {row["simulation_id"]: row["composite"] for row in engine.leaderboard()}
+        assert {sim: scores[-1] for sim, scores in report.final_scores.items()} == final
+
+    def test_other_resolver_changes_outcomes_and_scores(self):
+        log = _play_epoch(_engine(21, record_replay=True), 21).replay_log()
+
+        report = replay_epoch(log, roll=lambda _p, rng: "success" if rng.random() < 0.99 else "failed")
+
+        assert report.outcome_mismatches and report.score_mismatches
+        assert not report.identical
+
+    def test_tampered_scores_are_reported(self):
+        log = _play_epoch(_engine(4, record_replay=True), 4).replay_log()
+        scoring = next(r for r in reversed(log["records"]) if r["kind"] == "scoring")
+        scoring["payload"]["scores"][0][-1] += 1
+
+        report = replay_epoch(log)
+
+        assert [m[:2] for m in report.score_mismatches] == [(scoring["cycle_number"], scoring["payload"]["scores"][0][0])]
+
+    def test_unseeded_epoch_cannot_be_replayed(self):
+        with pytest.raises(ValueError, match="no RNG seed"):
+            replay_epoch({"rng_seed": None, "records": []})
+
+
+class TestWorldSeed:
+    def test_subset_keeps_only_links_between_chosen_simulations(self):
+        subset = _world().subset(SIMS[:2])
+        assert {s["id"] for s in subset.simulations} == set(SIMS[:2])
+        assert len(subset.embassies) == 1
+        assert len(subset.zones) == 8
+
+    def test_round_trip(self, tmp_path):
+        world = _world()
+        path = tmp_path / "world.json"
+        path.write_text(json.dumps(world.to_export()))
+        assert WorldSeed.load(path) == world
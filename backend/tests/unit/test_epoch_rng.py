@@ -0,0 +1,60 @@
+"""Tests for the seeded resolution RNG (epoch_rng)."""
+
+from __future__ import annotations
+
+import random
+import secrets
+
+from backend.services import epoch_rng
+from backend.services.epoch_rng import RollRecorder, resolution_rng, rng_for, roll_outcome, set_rng_provider
+
+IDS = ["m-3", "m-1", "m-2"]
+
+
+class TestResolutionRng:
+    def test_same_inputs_same_stream(self):
+        a = resolution_rng(42, 5, IDS)
+        b = resolution_rng(42, 5, IDS)
+        assert [a.random() for _ in range(5)] == [b.random() for _ in range(5)]
+
+    def test_mission_order_does_not_matter(self):
+        assert resolution_rng(42, 5, IDS).random() == resolution_rng(42, 5, sorted(IDS)).random()
+
+    def test_seed_cycle_and_missions_all_change_the_stream(self):
+        base = resolution_rng(42, 5, IDS).random()
+        assert resolution_rng(43, 5, IDS).random() != base
+        assert resolution_rng(42, 6, IDS).random() != base
+        assert resolution_rng(42, 5, IDS[:2]).random() != base
+
+    def test_unseeded_epochs_use_system_random(self):
+        assert isinstance(resolution_rng(None, 5, IDS), secrets.SystemRandom)
+
+
+class TestRollRecorder:
+    def test_records_every_draw(self):
+        rng = RollRecorder(random.Random(1))  # noqa: S311
+        value = rng.random()
+        picked = rng.choice(["a", "b", "c"])
+        impact = rng.randint(3, 5)
+
+        assert rng.rolls[0] == value
+        assert rng.rolls[1][1] == 3 and ["a", "b", "c"][rng.rolls[1][0]] == picked
+        assert rng.rolls[2] == impact and 3 <= impact <= 5
+
+    def test_roll_outcome_draws_twice_only_on_failure(self):
+        assert roll_outcome(1.0, rng := RollRecorder(random.Random(1))) == "success"  # noqa: S311
+        assert len(rng.rolls) == 1
+        assert roll_outcome(0.0, rng := RollRecorder(random.Random(1))) in ("detected", "failed")  # noqa: S311
+        assert len(rng.rolls) == 2
+
+
+class TestProvider:
+    def test_provider_can_be_replaced_and_restored(self):
+        fixed = random.Random(7)  # noqa: S311
+        previous = set_rng_provider(lambda _seed, _cycle, _ids: fixed)
+        try:
+            assert rng_for(42, 1, IDS)._rng is fixed
+        finally:
+            set_rng_provider(None)
+        assert previous is resolution_rng
+        assert epoch_rng._provider is resolution_rng
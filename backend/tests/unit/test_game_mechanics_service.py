@@ -0,0 +1,59 @@
+"""Unit tests for GameMechanicsService.refresh_metrics — scoped metric refresh."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services.game_mechanics_service import GameMechanicsService
+
+SIM_ID_A = uuid4()
+SIM_ID_B = uuid4()
+
+
+def _mock_supabase(data):
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value = MagicMock(data=data)
+    return sb
+
+
+class TestRefreshMetrics:
+    @pytest.mark.asyncio
+    async def test_refreshes_given_simulations(self):
+        sb = _mock_supabase([str(SIM_ID_A), str(SIM_ID_B)])
+
+        refreshed = await GameMechanicsService.refresh_metrics(sb, [SIM_ID_A, SIM_ID_B])
+
+        sb.rpc.assert_called_once_with(
+            "refresh_game_metrics", {"p_simulation_ids": [str(SIM_ID_A), str(SIM_ID_B)]},
+        )
+        assert refreshed == [str(SIM_ID_A), str(SIM_ID_B)]
+
+    @pytest.mark.asyncio
+    async def test_without_ids_refreshes_dirty_simulations(self):
+        sb = _mock_supabase(None)
+
+        refreshed = await GameMechanicsService.refresh_metrics(sb)
+
+        sb.rpc.assert_called_once_with("refresh_dirty_game_metrics", {})
+        assert refreshed == []
+
+
+class TestPeriodicDirtyRefresh:
+    @pytest.mark.asyncio
+    async def test_drains_dirty_set_until_cancelled_and_survives_errors(self):
+        import asyncio
+
+        from backend.services import game_mechanics_service
+
+        sb = MagicMock()
+        sb.rpc.return_value.execute.side_effect = [RuntimeError("db down"), MagicMock(data=[str(SIM_ID_A)])] * 50
+        with patch.object(game_mechanics_service, "get_admin_client", return_value=sb):
+            task = asyncio.create_task(game_mechanics_service.refresh_dirty_metrics_periodically(0.005))
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        assert sb.rpc.call_count >= 2
+        sb.rpc.assert_called_with("refresh_dirty_game_metrics", {})
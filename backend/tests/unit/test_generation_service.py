@@ -7,7 +7,9 @@ from uuid import uuid4
 
 import pytest
 
+from backend.services.external.openrouter import OpenRouterError, RateLimitError
 from backend.services.generation_service import GenerationService
+from backend.services.model_resolver import ResolvedModel
 
 # ---------------------------------------------------------------------------
 # _parse_json_content (static, no mocks needed)
@@ -309,3 +311,65 @@ class TestGenerateNewsTransformation:
         assert "**Title:**" not in narrative
         assert "**Article:**" not in narrative
         assert "Some article text" in narrative
+
+
+# ---------------------------------------------------------------------------
+# stream — LLM output forwarded as it arrives
+# ---------------------------------------------------------------------------
+
+
+async def _deltas(*parts: str):
+    for part in parts:
+        yield part
+
+
+class TestStream:
+    """Tests for GenerationService.stream()."""
+
+    @pytest.fixture()
+    def streaming_service(self, generation_service):
+        prompt = MagicMock(system_prompt="sys", source="db")
+        generation_service._prompt_resolver.resolve = AsyncMock(return_value=prompt)
+        generation_service._prompt_resolver.fill_template = MagicMock(return_value="user prompt")
+        generation_service._model_resolver.resolve_text_model = AsyncMock(
+            return_value=ResolvedModel(model_id="primary"),
+        )
+        generation_service._openrouter.generate_with_system = AsyncMock()
+        with patch.object(generation_service, "_get_simulation_name", new_callable=AsyncMock, return_value="Sim"):
+            yield generation_service
+
+    async def test_deltas_then_parsed_result(self, streaming_service):
+        streaming_service._openrouter.stream = MagicMock(
+            return_value=_deltas('{"title": "Riot', ' at the docks"}'),
+        )
+
+        events = [e async for e in streaming_service.stream(lambda: streaming_service.generate_event("political"))]
+
+        assert events[:2] == [
+            ("delta", {"content": '{"title": "Riot'}),
+            ("delta", {"content": ' at the docks"}'}),
+        ]
+        event, result = events[2]
+        assert event == "result"
+        assert result["content"] == '{"title": "Riot at the docks"}'
+        assert result["model_used"] == "primary"
+        streaming_service._openrouter.generate_with_system.assert_not_awaited()
+        assert streaming_service._on_delta is None
+
+    async def test_rate_limit_falls_back_before_first_delta(self, streaming_service):
+        async def rate_limited(*_args, **_kwargs):
+            raise RateLimitError("429")
+            yield  # pragma: no cover — makes this an async generator
+
+        streaming_service._openrouter.stream = MagicMock(side_effect=[rate_limited(), _deltas("fallback text")])
+
+        events = [e async for e in streaming_service.stream(lambda: streaming_service.generate_event("political"))]
+
+        assert events[0] == ("delta", {"content": "fallback text"})
+        assert events[-1][1]["content"] == "fallback text"
+
+    async def test_failure_propagates(self, streaming_service):
+        streaming_service._openrouter.stream = MagicMock(side_effect=OpenRouterError("down"))
+
+        with pytest.raises(OpenRouterError):
+            [e async for e in streaming_service.stream(lambda: streaming_service.generate_event("political"))]
@@ -0,0 +1,122 @@
+"""Tests for jwt_verifier — claims cache, JWKS refresh-ahead, middleware sharing."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt as pyjwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt import PyJWK
+
+from backend.middleware.logging_context import LoggingContextMiddleware
+from backend.utils import jwt_verifier
+
+SECRET = "test-jwt-secret-with-enough-length-for-hs256"
+
+
+@pytest.fixture(autouse=True)
+def _jwt_secret(monkeypatch):
+    monkeypatch.setattr(jwt_verifier.settings, "supabase_jwt_secret", SECRET)
+
+
+def _hs256_token(sub: str = "user-1", exp_in: int = 600) -> str:
+    return pyjwt.encode(
+        {"sub": sub, "aud": "authenticated", "exp": int(time.time()) + exp_in},
+        SECRET,
+        algorithm="HS256",
+    )
+
+
+class TestClaimsCache:
+    def test_second_verification_is_served_from_cache(self):
+        token = _hs256_token()
+
+        with patch.object(jwt_verifier, "_decode", wraps=jwt_verifier._decode) as decode:
+            assert jwt_verifier.verify_token(token)["sub"] == "user-1"
+            assert jwt_verifier.verify_token(token)["sub"] == "user-1"
+
+        assert decode.call_count == 1
+        stats = jwt_verifier.get_stats()
+        assert stats["claims_hits"] == 1
+        assert stats["claims_misses"] == 1
+
+    def test_invalid_token_is_not_cached(self):
+        bad = pyjwt.encode({"sub": "x", "aud": "authenticated"}, "wrong-secret-with-enough-length", algorithm="HS256")
+
+        for _ in range(2):
+            with pytest.raises(pyjwt.InvalidSignatureError):
+                jwt_verifier.verify_token(bad)
+
+        assert jwt_verifier.get_stats()["cached_claims"] == 0
+
+    def test_entry_expires_with_token(self):
+        token = _hs256_token(exp_in=5)
+        jwt_verifier.verify_token(token)
+
+        jwt_verifier._claims.expire(time.time() + 10)
+
+        assert jwt_verifier.peek_claims(token) is None
+
+
+class TestJwks:
+    @pytest.fixture()
+    def signing(self):
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        public_jwk = pyjwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        return private_key, PyJWK({**public_jwk, "kid": "kid-1"})
+
+    def _es256_token(self, private_key, kid="kid-1"):
+        return pyjwt.encode(
+            {"sub": "user-es", "aud": "authenticated", "exp": int(time.time()) + 600},
+            private_key,
+            algorithm="ES256",
+            headers={"kid": kid},
+        )
+
+    def test_cold_start_fetches_inline(self, signing):
+        private_key, jwk = signing
+        with patch.object(jwt_verifier, "PyJWKClient") as client_cls:
+            client_cls.return_value.get_signing_keys.return_value = [jwk]
+            claims = jwt_verifier.verify_token(self._es256_token(private_key))
+
+        assert claims["sub"] == "user-es"
+        assert jwt_verifier.get_stats()["jwks_fetches"] == 1
+
+    def test_stale_keys_refresh_in_background(self, signing):
+        private_key, jwk = signing
+        jwt_verifier._jwks_keys = {"kid-1": jwk}
+        jwt_verifier._jwks_fetched_at = time.monotonic() - jwt_verifier._JWKS_REFRESH_AFTER - 1
+
+        with (
+            patch.object(jwt_verifier, "_fetch_jwks") as fetch,
+            patch.object(jwt_verifier.threading, "Thread") as thread_cls,
+        ):
+            claims = jwt_verifier.verify_token(self._es256_token(private_key))
+
+        # Served with the current keys; the refresh was handed to a thread.
+        assert claims["sub"] == "user-es"
+        fetch.assert_not_called()
+        thread_cls.return_value.start.assert_called_once()
+
+    def test_unknown_kid_is_rejected(self, signing):
+        private_key, jwk = signing
+        jwt_verifier._jwks_keys = {"kid-1": jwk}
+        jwt_verifier._jwks_fetched_at = time.monotonic()
+
+        with pytest.raises(pyjwt.InvalidTokenError, match="No matching JWKS key"):
+            jwt_verifier.verify_token(self._es256_token(private_key, kid="rotated"))
+
+
+class TestMiddlewareSharing:
+    def test_extract_user_id_reuses_verified_claims(self):
+        token = _hs256_token(sub="verified-user")
+        jwt_verifier.verify_token(token)
+        request = MagicMock()
+        request.headers = {"authorization": f"Bearer {token}"}
+
+        with patch("backend.middleware.logging_context.base64.urlsafe_b64decode") as b64:
+            assert LoggingContextMiddleware._extract_user_id(request) == "verified-user"
+
+        b64.assert_not_called()
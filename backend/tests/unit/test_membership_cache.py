@@ -0,0 +1,131 @@
+"""Tests for membership_cache — per-request memo, TTL tier, invalidation, stats."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from backend.services import membership_cache
+from backend.tests.conftest import make_chain_mock
+
+SIM_ID = uuid4()
+EPOCH_ID = uuid4()
+USER_ID = uuid4()
+
+
+def _mock_supabase(data):
+    sb = MagicMock()
+    sb.table.return_value = make_chain_mock(execute_data=data)
+    return sb
+
+
+class TestMemberRole:
+    async def test_first_lookup_queries_db(self):
+        sb = _mock_supabase([{"member_role": "editor"}])
+
+        role = await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+
+        assert role == "editor"
+        sb.table.assert_called_once_with("simulation_members")
+        assert membership_cache.get_stats()["misses"] == 1
+
+    async def test_same_request_is_memoized(self):
+        sb = _mock_supabase([{"member_role": "editor"}])
+
+        await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+        await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+
+        assert sb.table.return_value.execute.call_count == 1
+        assert membership_cache.get_stats()["request_hits"] == 1
+
+    async def test_cross_request_hit_from_ttl_cache(self):
+        sb = _mock_supabase([{"member_role": "admin"}])
+        await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+
+        membership_cache.begin_request()
+        role = await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+
+        assert role == "admin"
+        assert sb.table.return_value.execute.call_count == 1
+        assert membership_cache.get_stats()["hits"] == 1
+
+    async def test_miss_is_not_cached_across_requests(self):
+        """A non-member who is added afterwards must not be rejected by a stale miss."""
+        sb = _mock_supabase([])
+        assert await membership_cache.get_member_role(sb, SIM_ID, USER_ID) is None
+
+        membership_cache.begin_request()
+        sb.table.return_value.execute.return_value.data = [{"member_role": "viewer"}]
+
+        assert await membership_cache.get_member_role(sb, SIM_ID, USER_ID) == "viewer"
+
+    async def test_invalidate_simulation_forces_refetch(self):
+        sb = _mock_supabase([{"member_role": "owner"}])
+        await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+
+        membership_cache.invalidate_simulation(SIM_ID)
+        sb.table.return_value.execute.return_value.data = [{"member_role": "viewer"}]
+
+        assert await membership_cache.get_member_role(sb, SIM_ID, USER_ID) == "viewer"
+        assert membership_cache.get_stats()["invalidations"] == 1
+
+    async def test_invalidate_member_only_drops_that_user(self):
+        other_user = uuid4()
+        sb = _mock_supabase([{"member_role": "editor"}])
+        await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+        await membership_cache.get_member_role(sb, SIM_ID, other_user)
+
+        membership_cache.invalidate_member(SIM_ID, USER_ID)
+
+        assert membership_cache.get_stats()["cached_roles"] == 1
+
+
+class TestEpochParticipant:
+    async def test_participant_cached_and_invalidated_on_leave(self):
+        row = {"id": "p1", "simulation_id": str(SIM_ID), "user_id": str(USER_ID), "current_rp": 10}
+        sb = _mock_supabase([row])
+
+        assert await membership_cache.get_epoch_participant(sb, EPOCH_ID, SIM_ID, USER_ID) == row
+        membership_cache.begin_request()
+        assert await membership_cache.get_epoch_participant(sb, EPOCH_ID, SIM_ID, USER_ID) == row
+        assert sb.table.return_value.execute.call_count == 1
+
+        membership_cache.invalidate_epoch_participant(EPOCH_ID)
+        sb.table.return_value.execute.return_value.data = []
+
+        assert await membership_cache.get_epoch_participant(sb, EPOCH_ID, SIM_ID, USER_ID) is None
+
+
+class TestMemberServiceInvalidation:
+    async def test_change_role_invalidates_simulation(self):
+        from backend.services.member_service import MemberService
+
+        sb = _mock_supabase([{"member_role": "owner"}])
+        await membership_cache.get_member_role(sb, SIM_ID, USER_ID)
+        assert membership_cache.get_stats()["cached_roles"] == 1
+
+        await MemberService.change_role(sb, SIM_ID, uuid4(), "viewer")
+
+        assert membership_cache.get_stats()["cached_roles"] == 0
+
+
+class TestTtlChange:
+    def test_clear_applies_the_current_ttl(self):
+        with patch.object(membership_cache, "get_ttl", return_value=5):
+            membership_cache.clear()
+
+        assert membership_cache._roles.ttl == 5
+        assert membership_cache._participants.ttl == 5
+
+    async def test_admin_ttl_update_reloads_before_clearing(self):
+        from backend.routers import admin
+
+        calls = []
+        with (
+            patch.object(admin.PlatformSettingsService, "update", AsyncMock(return_value={})),
+            patch.object(admin, "load_ttls_from_db", AsyncMock(side_effect=lambda: calls.append("load"))),
+            patch.object(membership_cache, "clear", side_effect=lambda: calls.append("clear")),
+        ):
+            await admin.update_setting("cache_membership_ttl", MagicMock(value=10), MagicMock(), MagicMock())
+
+        assert calls == ["load", "clear"]
@@ -0,0 +1,151 @@
+"""Unit tests for memory_index — in-process agent memory scoring and write-behind access."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services import memory_index
+from backend.services.agent_memory_service import AgentMemoryService
+from backend.services.memory_index import MemoryIndex
+
+SIM_ID = uuid4()
+AGENT_ID = uuid4()
+NOW = datetime(2026, 3, 8, 12, 0, tzinfo=UTC)
+
+
+def _row(memory_id: str, importance: int, days_old: float) -> dict:
+    return {
+        "id": memory_id,
+        "memory_type": "observation",
+        "content": f"memory {memory_id}",
+        "content_de": None,
+        "importance": importance,
+        "source_type": "chat",
+        "created_at": (NOW - timedelta(days=days_old)).isoformat(),
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_index():
+    memory_index._index_flight.clear()
+    yield
+    memory_index._index_flight.clear()
+
+
+class TestMemoryIndexSearch:
+    def test_score_matches_retrieval_formula(self):
+        index = MemoryIndex(dims=2)
+        index.add_many([_row("a", 6, 1)], [[3.0, 4.0]])
+
+        [result] = index.search([6.0, 8.0], top_k=5, now=NOW.timestamp())
+
+        # 0.4 × cos + 0.4 × importance/10 + 0.2 / (1 + age_days)
+        assert result["retrieval_score"] == pytest.approx(0.4 * 1.0 + 0.4 * 0.6 + 0.2 / 2)
+        assert result["content"] == "memory a"
+        assert "embedding" not in result
+
+    def test_ranks_similarity_importance_and_recency(self):
+        index = MemoryIndex(dims=2)
+        index.add_many([_row("similar", 5, 10)], [[1.0, 0.0]])
+        index.add_many([_row("important", 10, 10)], [[0.0, 1.0]])
+        index.add_many([_row("recent", 5, 0)], [[0.0, 1.0]])
+        index.add_many([_row("opposite", 5, 10)], [[-1.0, 0.0]])
+
+        ids = [m["id"] for m in index.search([1.0, 0.0], top_k=3, now=NOW.timestamp())]
+
+        assert ids == ["similar", "important", "recent"]
+
+    def test_without_query_only_importance_and_recency_count(self):
+        index = MemoryIndex(dims=2)
+        index.add_many([_row("old", 8, 30)], [[1.0, 0.0]])
+        index.add_many([_row("new", 3, 0)], [None])
+
+        results = index.search(None, top_k=2, now=NOW.timestamp())
+
+        assert [m["id"] for m in results] == ["old", "new"]
+        assert results[1]["retrieval_score"] == pytest.approx(0.4 * 0.3 + 0.2)
+
+    def test_zero_query_vector_is_ignored(self):
+        index = MemoryIndex(dims=2)
+        index.add_many([_row("a", 5, 0)], ["[0.6, 0.8]"])
+
+        [result] = index.search([0.0, 0.0], now=NOW.timestamp())
+
+        assert not math.isnan(result["retrieval_score"])
+        assert result["retrieval_score"] == pytest.approx(0.4)
+
+
+class TestGetIndex:
+    async def test_concurrent_retrievals_share_one_load(self):
+        rows = [{**_row("a", 5, 1), "embedding": "[1, 0]"}]
+        with patch.object(memory_index, "fetch_all", new_callable=AsyncMock, return_value=rows) as load:
+            first, second = await asyncio.gather(
+                memory_index.get_index(MagicMock(), SIM_ID, AGENT_ID),
+                memory_index.get_index(MagicMock(), SIM_ID, AGENT_ID),
+            )
+
+        assert first is second
+        assert len(first) == 1
+        load.assert_awaited_once()
+
+    async def test_stored_memories_join_a_warm_index(self):
+        with patch.object(memory_index, "fetch_all", new_callable=AsyncMock, return_value=[]):
+            index = await memory_index.get_index(MagicMock(), SIM_ID, AGENT_ID)
+
+        memory_index.add_memories(SIM_ID, AGENT_ID, [_row("b", 7, 0)], [[0.0, 1.0]])
+
+        assert [m["id"] for m in index.search([0.0, 1.0])] == ["b"]
+
+    def test_add_to_cold_index_is_a_no_op(self):
+        memory_index.add_memories(SIM_ID, AGENT_ID, [_row("b", 7, 0)], [[0.0, 1.0]])
+
+        assert memory_index._index_flight.peek((str(SIM_ID), str(AGENT_ID))) is None
+
+
+class TestAccessWriter:
+    async def test_touches_are_written_in_one_update(self):
+        admin = MagicMock()
+        with patch.object(memory_index, "get_admin_client", return_value=admin):
+            writer = memory_index.AccessWriter(delay=60)
+            writer.touch(["m2", "m1"])
+            writer.touch(["m1", "m3"])
+            admin.table.assert_not_called()
+
+            await writer.flush()
+
+        admin.table.return_value.update.return_value.in_.assert_called_once_with("id", ["m1", "m2", "m3"])
+        assert admin.table.return_value.update.call_args.args[0]["last_accessed_at"]
+
+    async def test_flush_runs_after_delay(self):
+        admin = MagicMock()
+        with patch.object(memory_index, "get_admin_client", return_value=admin):
+            writer = memory_index.AccessWriter(delay=0.01)
+            writer.touch(["m1"])
+            await asyncio.sleep(0.1)
+
+        admin.table.return_value.update.return_value.in_.assert_called_once_with("id", ["m1"])
+
+
+class TestRetrieve:
+    async def test_scores_index_and_defers_access_write(self):
+        index = MemoryIndex(dims=2)
+        index.add_many([_row("a", 5, 0)], [[1.0, 0.0]])
+        sb = MagicMock()
+
+        with (
+            patch.object(memory_index, "get_index", new_callable=AsyncMock, return_value=index),
+            patch("backend.services.agent_memory_service.EmbeddingService.embed", new_callable=AsyncMock, return_value=[1.0, 0.0]),
+            patch.object(memory_index, "touch") as touch,
+        ):
+            memories = await AgentMemoryService.retrieve(sb, AGENT_ID, SIM_ID, query_text="hello", top_k=3)
+
+        assert [m["id"] for m in memories] == ["a"]
+        touch.assert_called_once_with(["a"])
+        sb.rpc.assert_not_called()
+        sb.table.assert_not_called()
@@ -0,0 +1,231 @@
+"""Unit tests for the OpenRouter transport — pooling, governor, retry and metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from backend.services.external import openrouter
+from backend.services.external.openrouter import (
+    ModelUnavailableError,
+    OpenRouterError,
+    OpenRouterService,
+    OpenRouterTransport,
+    RateLimitError,
+)
+
+MODEL = "test/model"
+
+
+def _completion(text: str = "hello") -> dict:
+    return {
+        "choices": [{"message": {"content": text}}],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 3},
+    }
+
+
+class FakeCompletionsApi:
+    """MockTransport handler replaying queued responses (then answering 200)."""
+
+    def __init__(self, *responses: httpx.Response | Exception, delay: float = 0) -> None:
+        self.responses = list(responses)
+        self.delay = delay
+        self.requests: list[dict] = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(json.loads(request.content))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return httpx.Response(200, json=_completion())
+
+
+def _sse(*chunks: dict | str) -> httpx.Response:
+    lines = [": OPENROUTER PROCESSING", ""]
+    for chunk in chunks:
+        lines += [f"data: {chunk if isinstance(chunk, str) else json.dumps(chunk)}", ""]
+    return httpx.Response(200, content="\n".join(lines).encode(), headers={"content-type": "text/event-stream"})
+
+
+def _delta(text: str) -> dict:
+    return {"choices": [{"delta": {"content": text}}]}
+
+
+def _transport(api: FakeCompletionsApi, **kwargs) -> OpenRouterTransport:
+    options = {"rate": 0, "backoff": 0, "max_attempts": 3, **kwargs}
+    client = httpx.AsyncClient(base_url=openrouter.OPENROUTER_BASE_URL, transport=httpx.MockTransport(api))
+    return OpenRouterTransport(client=client, **options)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    openrouter._metrics.clear()
+    yield
+    openrouter._metrics.clear()
+
+
+async def _generate(transport: OpenRouterTransport) -> str:
+    with patch.object(openrouter, "get_transport", return_value=transport):
+        return await OpenRouterService(api_key="k").generate(MODEL, [{"role": "user", "content": "hi"}])
+
+
+class TestComplete:
+    async def test_success_records_tokens_and_latency(self):
+        api = FakeCompletionsApi()
+
+        assert await _generate(_transport(api)) == "hello"
+
+        assert api.requests[0]["model"] == MODEL
+        stats = openrouter.transport_stats()[MODEL]
+        assert stats["succeeded"] == 1
+        assert stats["prompt_tokens"] == 12
+        assert stats["completion_tokens"] == 3
+        assert stats["latency_p50_ms"] is not None
+
+    async def test_429_honors_retry_after_then_succeeds(self):
+        api = FakeCompletionsApi(httpx.Response(429, headers={"Retry-After": "0.05"}))
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        assert await _generate(_transport(api)) == "hello"
+
+        assert loop.time() - start >= 0.05
+        stats = openrouter.transport_stats()[MODEL]
+        assert (stats["requests"], stats["retries"], stats["rate_limited"]) == (2, 1, 1)
+
+    async def test_long_retry_after_raises_rate_limit_at_once(self):
+        api = FakeCompletionsApi(httpx.Response(429, headers={"Retry-After": "3600"}))
+
+        with pytest.raises(RateLimitError):
+            await _generate(_transport(api))
+
+        assert len(api.requests) == 1
+
+    async def test_503_is_not_retried(self):
+        api = FakeCompletionsApi(httpx.Response(503))
+
+        with pytest.raises(ModelUnavailableError):
+            await _generate(_transport(api))
+
+        assert len(api.requests) == 1
+
+    async def test_client_error_is_not_retried(self):
+        api = FakeCompletionsApi(httpx.Response(400, text="bad request"))
+
+        with pytest.raises(OpenRouterError, match="API error 400"):
+            await _generate(_transport(api))
+
+        assert len(api.requests) == 1
+
+    async def test_transient_failures_retry_up_to_max_attempts(self):
+        api = FakeCompletionsApi(
+            httpx.ConnectError("refused"),
+            httpx.Response(502),
+            httpx.Response(502),
+        )
+
+        with pytest.raises(OpenRouterError, match="API error 502"):
+            await _generate(_transport(api))
+
+        assert len(api.requests) == 3
+        assert openrouter.transport_stats()[MODEL]["failed"] == 1
+
+
+async def _stream(transport: OpenRouterTransport) -> list[str]:
+    with patch.object(openrouter, "get_transport", return_value=transport):
+        return [d async for d in OpenRouterService(api_key="k").stream(MODEL, [{"role": "user", "content": "hi"}])]
+
+
+class TestStream:
+    async def test_yields_deltas_and_records_first_token(self):
+        api = FakeCompletionsApi(_sse(
+            _delta("Hel"),
+            {"choices": [{"delta": {"role": "assistant"}}]},
+            _delta("lo"),
+            {"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 2}},
+            "[DONE]",
+        ))
+
+        assert await _stream(_transport(api)) == ["Hel", "lo"]
+
+        assert api.requests[0]["stream"] is True
+        stats = openrouter.transport_stats()[MODEL]
+        assert (stats["succeeded"], stats["completion_tokens"]) == (1, 2)
+        assert stats["first_token_p50_ms"] is not None
+
+    async def test_retries_before_first_byte(self):
+        api = FakeCompletionsApi(httpx.Response(502), _sse(_delta("ok"), "[DONE]"))
+
+        assert await _stream(_transport(api)) == ["ok"]
+        assert len(api.requests) == 2
+
+    async def test_error_event_mid_stream_raises(self):
+        api = FakeCompletionsApi(_sse(_delta("par"), {"error": {"message": "provider died"}}))
+
+        with pytest.raises(OpenRouterError, match="provider died"):
+            await _stream(_transport(api))
+        assert openrouter.transport_stats()[MODEL]["failed"] == 1
+
+    async def test_empty_stream_raises(self):
+        api = FakeCompletionsApi(_sse("[DONE]"))
+
+        with pytest.raises(OpenRouterError, match="Empty content"):
+            await _stream(_transport(api))
+
+    async def test_abandoned_stream_releases_the_model_slot(self):
+        api = FakeCompletionsApi(_sse(_delta("a"), _delta("b"), "[DONE]"))
+        transport = _transport(api, model_concurrency=1)
+
+        deltas = transport.stream("k", {"model": MODEL, "messages": []})
+        assert await anext(deltas) == "a"
+        await deltas.aclose()
+
+        assert await _generate(transport) == "hello"
+
+
+class TestGovernor:
+    async def test_concurrency_is_capped_per_model(self):
+        api = FakeCompletionsApi(delay=0.02)
+        transport = _transport(api, model_concurrency=2)
+
+        await asyncio.gather(*(_generate(transport) for _ in range(6)))
+
+        assert api.peak == 2
+
+    async def test_429_holds_back_the_api_key(self):
+        api = FakeCompletionsApi(httpx.Response(429, headers={"Retry-After": "0.05"}))
+        transport = _transport(api, rate=1000, burst=10, max_attempts=1)
+        loop = asyncio.get_running_loop()
+
+        with pytest.raises(RateLimitError):
+            await _generate(transport)
+        start = loop.time()
+        await _generate(transport)
+
+        assert loop.time() - start >= 0.04
+
+
+class TestSharedTransport:
+    async def test_one_transport_per_event_loop(self):
+        try:
+            assert openrouter.get_transport() is openrouter.get_transport()
+        finally:
+            await openrouter.close_transport()
+
+    def test_missing_api_key_raises(self):
+        with patch.object(openrouter.settings, "openrouter_api_key", ""), pytest.raises(OpenRouterError):
+            asyncio.run(OpenRouterService().generate(MODEL, []))
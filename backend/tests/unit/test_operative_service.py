@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
@@ -17,7 +18,9 @@ from backend.services.operative_service import (
     SECURITY_LEVEL_MAP,
     OperativeService,
     _downgrade_security,
+    _ResolutionBatch,
 )
+from backend.tests.conftest import make_chain_mock
 
 # ── Helpers ────────────────────────────────────────────────────
 
@@ -380,392 +383,331 @@ class TestDeployDuplicatePrevention:
 # ── Success Probability ───────────────────────────────────────
 
 
+def _context_payload(
+    aptitude: int | None = None,
+    zone_security_level: str | None = None,
+    guardian_count: int = 0,
+    embassy: dict | None = None,
+    zone_pressure: float = 0.0,
+    resonance_modifier: float = 0.0,
+    attacker_pressure_penalty: float = 0.0,
+    operative_type: str = "spy",
+) -> dict:
+    """Build an fn_deployment_context payload for AGENT_ID → TARGET_SIM_ID."""
+    return {
+        "attacker_pressure_penalty": attacker_pressure_penalty,
+        "aptitudes": [] if aptitude is None else [
+            {"agent_id": str(AGENT_ID), "operative_type": operative_type, "aptitude_level": aptitude},
+        ],
+        "zone_security_level": zone_security_level,
+        "embassy": embassy,
+        "targets": [{
+            "simulation_id": str(TARGET_SIM_ID),
+            "guardian_count": guardian_count,
+            "zone_pressure": zone_pressure,
+            "resonance_modifiers": {operative_type: resonance_modifier},
+            "embassy": None,
+        }],
+    }
+
+
+async def _probability_for(body: OperativeDeploy, payload: dict) -> tuple[float, MagicMock]:
+    admin_mock = MagicMock()
+    admin_mock.rpc.return_value.execute.return_value = MagicMock(data=payload)
+    with patch(
+        "backend.services.operative_service.get_admin_supabase",
+        new_callable=AsyncMock,
+        return_value=admin_mock,
+    ):
+        prob = await OperativeService._calculate_success_probability(body, SIM_ID)
+    return prob, admin_mock
+
+
 class TestSuccessProbability:
     @pytest.mark.asyncio
     async def test_base_probability_with_no_modifiers(self):
         """Base prob with default aptitude, moderate zone, no guardians, default embassy."""
-        sb = MagicMock()
-        chain = MagicMock()
-        chain.select.return_value = chain
-        chain.eq.return_value = chain
-        chain.in_.return_value = chain
-        chain.single.return_value = chain
-        chain.maybe_single.return_value = chain
-        chain.execute.return_value = MagicMock(data=[])
-
-        sb.table.return_value = chain
-
-        admin_mock = MagicMock()
-        admin_mock.table.return_value = chain
-
         body = _make_deploy_body("spy", TARGET_SIM_ID, EMBASSY_ID)
-        with patch(
-            "backend.services.operative_service.get_admin_supabase",
-            new_callable=AsyncMock,
-            return_value=admin_mock,
-        ):
-            prob = await OperativeService._calculate_success_probability(
-                sb, body, SIM_ID
-            )
+        prob, _ = await _probability_for(body, _context_payload())
         # base=0.55, aptitude=6 (default, no rows), zone_security=5.0 default, guardian=0, embassy=0.5
         # 0.55 + 6*0.03 - 5.0*0.05 - 0 + 0.5*0.15 = 0.55 + 0.18 - 0.25 + 0.075 = 0.555
-        assert 0.05 <= prob <= 0.95
+        assert prob == pytest.approx(0.555)
 
     @pytest.mark.asyncio
     async def test_probability_clamped_to_minimum(self):
         """Extremely hostile conditions should still give at least 5% chance."""
-        sb = MagicMock()
-        chain = MagicMock()
-        chain.select.return_value = chain
-        chain.eq.return_value = chain
-        chain.in_.return_value = chain
-        chain.single.return_value = chain
-        chain.maybe_single.return_value = chain
-        # No professions
-        chain.execute.return_value = MagicMock(data=[])
-
-        sb.table.side_effect = lambda name: chain
-
-        admin_mock = MagicMock()
-        admin_mock.table.side_effect = lambda name: chain
-
-        body = _make_deploy_body(
-            "spy", TARGET_SIM_ID, EMBASSY_ID, target_zone_id=ZONE_ID,
+        body = _make_deploy_body("spy", TARGET_SIM_ID, EMBASSY_ID, target_zone_id=ZONE_ID)
+        payload = _context_payload(
+            aptitude=3, zone_security_level="fortress", guardian_count=5,
+            resonance_modifier=-0.04, attacker_pressure_penalty=-0.04,
         )
-        with patch(
-            "backend.services.operative_service.get_admin_supabase",
-            new_callable=AsyncMock,
-            return_value=admin_mock,
-        ):
-            prob = await OperativeService._calculate_success_probability(
-                sb, body, SIM_ID
-            )
-        assert prob >= 0.05
+        prob, _ = await _probability_for(body, payload)
+        assert prob == 0.05
 
     @pytest.mark.asyncio
     async def test_probability_clamped_to_maximum(self):
         """Even with all bonuses, should not exceed 95%."""
-        sb = MagicMock()
-
-        # aptitude query returns high aptitude
-        aptitude_chain = MagicMock()
-        aptitude_chain.select.return_value = aptitude_chain
-        aptitude_chain.eq.return_value = aptitude_chain
-        aptitude_chain.execute.return_value = MagicMock(
-            data=[{"aptitude_level": 9}]
+        body = _make_deploy_body("spy", TARGET_SIM_ID, EMBASSY_ID, target_zone_id=ZONE_ID)
+        payload = _context_payload(
+            aptitude=9, zone_security_level="lawless", zone_pressure=0.04, resonance_modifier=0.04,
+            embassy={"id": str(EMBASSY_ID), "infiltration_penalty": 0, "infiltration_penalty_expires_at": None},
         )
-
-        zone_chain = MagicMock()
-        zone_chain.select.return_value = zone_chain
-        zone_chain.eq.return_value = zone_chain
-        zone_chain.maybe_single.return_value = zone_chain
-        zone_chain.execute.return_value = MagicMock(
-            data={"security_level": "lawless"}
-        )
-
-        guardian_chain = MagicMock()
-        guardian_chain.select.return_value = guardian_chain
-        guardian_chain.eq.return_value = guardian_chain
-        guardian_chain.in_.return_value = guardian_chain
-        guardian_chain.execute.return_value = MagicMock(data=[])
-
-        embassy_chain = MagicMock()
-        embassy_chain.select.return_value = embassy_chain
-        embassy_chain.eq.return_value = embassy_chain
-        embassy_chain.maybe_single.return_value = embassy_chain
-        embassy_chain.execute.return_value = MagicMock(
-            data={"id": str(EMBASSY_ID), "infiltration_penalty": 0, "infiltration_penalty_expires_at": None}
-        )
-
-        # sb handles agent_aptitudes only
-        sb.table.side_effect = lambda name: aptitude_chain if name == "agent_aptitudes" else MagicMock()
-
-        # admin handles zones, guardians, embassies (cross-sim reads)
-        admin_mock = MagicMock()
-
-        def admin_router(name):
-            if name == "zones":
-                return zone_chain
-            if name == "operative_missions":
-                return guardian_chain
-            if name == "embassies":
-                return embassy_chain
-            return MagicMock()
-
-        admin_mock.table.side_effect = admin_router
-
-        body = _make_deploy_body(
-            "spy", TARGET_SIM_ID, EMBASSY_ID, target_zone_id=ZONE_ID,
-        )
-        with patch(
-            "backend.services.operative_service.get_admin_supabase",
-            new_callable=AsyncMock,
-            return_value=admin_mock,
-        ):
-            prob = await OperativeService._calculate_success_probability(
-                sb, body, SIM_ID
-            )
+        prob, _ = await _probability_for(body, payload)
         assert prob <= 0.95
 
     @pytest.mark.asyncio
     async def test_guardian_penalty_capped_at_015(self):
         """Guardian penalty should be min(0.15, count * 0.06)."""
-        sb = MagicMock()
-
-        # aptitude query — no rows (default 6)
-        aptitude_chain = MagicMock()
-        aptitude_chain.select.return_value = aptitude_chain
-        aptitude_chain.eq.return_value = aptitude_chain
-        aptitude_chain.execute.return_value = MagicMock(data=[])
-
-        # 5 guardians -> 5 * 0.06 = 0.30, but capped at 0.15
-        guardian_chain = MagicMock()
-        guardian_chain.select.return_value = guardian_chain
-        guardian_chain.eq.return_value = guardian_chain
-        guardian_chain.in_.return_value = guardian_chain
-        guardian_chain.execute.return_value = MagicMock(
-            data=[{"id": str(uuid4())} for _ in range(5)]
-        )
-
-        embassy_chain = MagicMock()
-        embassy_chain.select.return_value = embassy_chain
-        embassy_chain.eq.return_value = embassy_chain
-        embassy_chain.maybe_single.return_value = embassy_chain
-        embassy_chain.execute.return_value = MagicMock(
-            data={"id": str(EMBASSY_ID), "infiltration_penalty": 0, "infiltration_penalty_expires_at": None}
-        )
-
-        sb.table.side_effect = lambda name: aptitude_chain if name == "agent_aptitudes" else MagicMock()
-
-        admin_mock = MagicMock()
-
-        def admin_router(name):
-            if name == "operative_missions":
-                return guardian_chain
-            if name == "embassies":
-                return embassy_chain
-            return MagicMock()
-
-        admin_mock.table.side_effect = admin_router
-
         body = _make_deploy_body("spy", TARGET_SIM_ID, EMBASSY_ID)
-        with patch(
-            "backend.services.operative_service.get_admin_supabase",
-            new_callable=AsyncMock,
-            return_value=admin_mock,
-        ):
-            prob = await OperativeService._calculate_success_probability(
-                sb, body, SIM_ID
-            )
+        payload = _context_payload(
+            guardian_count=5,
+            embassy={"id": str(EMBASSY_ID), "infiltration_penalty": 0, "infiltration_penalty_expires_at": None},
+        )
+        prob, _ = await _probability_for(body, payload)
         # base=0.55 + 6*0.03 - 5.0*0.05 - 0.15 + 0.6*0.15 = 0.55 + 0.18 - 0.25 - 0.15 + 0.09 = 0.42
-        assert 0.35 <= prob <= 0.50
+        assert prob == pytest.approx(0.42)
 
     @pytest.mark.asyncio
     async def test_high_aptitude_boosts_probability(self):
         """Agent with high aptitude should increase success probability."""
-        sb = MagicMock()
-
-        # aptitude = 9 for spy
-        aptitude_chain = MagicMock()
-        aptitude_chain.select.return_value = aptitude_chain
-        aptitude_chain.eq.return_value = aptitude_chain
-        aptitude_chain.execute.return_value = MagicMock(
-            data=[{"aptitude_level": 9}]
+        body = _make_deploy_body("spy", TARGET_SIM_ID, EMBASSY_ID)
+        payload = _context_payload(
+            aptitude=9,
+            embassy={"id": str(EMBASSY_ID), "infiltration_penalty": 0, "infiltration_penalty_expires_at": None},
         )
+        prob, _ = await _probability_for(body, payload)
+        # base=0.55 + 9*0.03 - 5.0*0.05 - 0 + 0.6*0.15 = 0.55 + 0.27 - 0.25 + 0.09 = 0.66
+        assert prob == pytest.approx(0.66)
 
-        guardian_chain = MagicMock()
-        guardian_chain.select.return_value = guardian_chain
-        guardian_chain.eq.return_value = guardian_chain
-        guardian_chain.in_.return_value = guardian_chain
-        guardian_chain.execute.return_value = MagicMock(data=[])
-
-        embassy_chain = MagicMock()
-        embassy_chain.select.return_value = embassy_chain
-        embassy_chain.eq.return_value = embassy_chain
-        embassy_chain.maybe_single.return_value = embassy_chain
-        embassy_chain.execute.return_value = MagicMock(
-            data={"id": str(EMBASSY_ID), "infiltration_penalty": 0, "infiltration_penalty_expires_at": None}
+    @pytest.mark.asyncio
+    async def test_active_infiltration_penalty_reduces_embassy_effectiveness(self):
+        body = _make_deploy_body("spy", TARGET_SIM_ID, EMBASSY_ID)
+        future = (datetime.now(UTC) + timedelta(hours=4)).isoformat()
+        payload = _context_payload(
+            embassy={"id": str(EMBASSY_ID), "infiltration_penalty": 0.5, "infiltration_penalty_expires_at": future},
         )
+        prob, _ = await _probability_for(body, payload)
+        # embassy_eff = 0.6 * 0.5 = 0.3 → 0.55 + 0.18 - 0.25 + 0.045 = 0.525
+        assert prob == pytest.approx(0.525)
 
-        sb.table.side_effect = lambda name: aptitude_chain if name == "agent_aptitudes" else MagicMock()
+    @pytest.mark.asyncio
+    async def test_inputs_loaded_in_one_rpc(self):
+        body = _make_deploy_body("saboteur", TARGET_SIM_ID, EMBASSY_ID, target_zone_id=ZONE_ID)
+        _, admin_mock = await _probability_for(body, _context_payload(operative_type="saboteur"))
+
+        admin_mock.rpc.assert_called_once()
+        name, params = admin_mock.rpc.call_args.args
+        assert name == "fn_deployment_context"
+        assert params["p_target_simulation_ids"] == [str(TARGET_SIM_ID)]
+        assert params["p_agent_ids"] == [str(AGENT_ID)]
+        assert params["p_embassy_id"] == str(EMBASSY_ID)
+        admin_mock.table.assert_not_called()  # Read-only: no inline embassy update
 
-        admin_mock = MagicMock()
+    @pytest.mark.asyncio
+    async def test_guardian_skips_target_terms(self):
+        body = _make_deploy_body("guardian")
+        payload = _context_payload(operative_type="guardian", attacker_pressure_penalty=-0.04, guardian_count=3)
+        payload["targets"] = []
+        prob, admin_mock = await _probability_for(body, payload)
 
-        def admin_router(name):
-            if name == "operative_missions":
-                return guardian_chain
-            if name == "embassies":
-                return embassy_chain
-            return MagicMock()
+        assert admin_mock.rpc.call_args.args[1]["p_target_simulation_ids"] == []
+        assert prob == pytest.approx(0.555)
 
-        admin_mock.table.side_effect = admin_router
 
-        body = _make_deploy_body("spy", TARGET_SIM_ID, EMBASSY_ID)
-        with patch(
-            "backend.services.operative_service.get_admin_supabase",
-            new_callable=AsyncMock,
-            return_value=admin_mock,
+class TestProbabilityPreview:
+    @pytest.mark.asyncio
+    async def test_matrix_covers_every_agent_and_target(self):
+        other_target = str(uuid4())
+        agent_b = str(uuid4())
+        sb = MagicMock()
+        agents_chain = MagicMock()
+        for method in ("select", "eq", "is_", "order"):
+            getattr(agents_chain, method).return_value = agents_chain
+        agents_chain.execute.return_value = MagicMock(data=[
+            {"id": str(AGENT_ID), "name": "Alpha"},
+            {"id": agent_b, "name": "Beta"},
+        ])
+        sb.table.return_value = agents_chain
+
+        payload = _context_payload(aptitude=9, guardian_count=1)
+        payload["targets"].append({
+            "simulation_id": other_target,
+            "guardian_count": 0,
+            "zone_pressure": 0,
+            "resonance_modifiers": {},
+            "embassy": {"id": str(EMBASSY_ID), "infiltration_penalty": 0, "infiltration_penalty_expires_at": None},
+        })
+        admin_mock = MagicMock()
+        admin_mock.rpc.return_value.execute.return_value = MagicMock(data=payload)
+        participants = [{"simulation_id": str(SIM_ID)}, {"simulation_id": str(TARGET_SIM_ID)}, {"simulation_id": other_target}]
+
+        with (
+            patch("backend.services.operative_service.get_admin_supabase", new_callable=AsyncMock, return_value=admin_mock),
+            patch(
+                "backend.services.operative_service.EpochService.list_participants",
+                new_callable=AsyncMock,
+                return_value=participants,
+            ),
         ):
-            prob = await OperativeService._calculate_success_probability(
-                sb, body, SIM_ID
-            )
-        # base=0.55 + 9*0.03 - 5.0*0.05 - 0 + 0.6*0.15 = 0.55 + 0.27 - 0.25 + 0.09 = 0.66
-        assert 0.60 <= prob <= 0.70
-
+            rows = await OperativeService.preview_probabilities(sb, EPOCH_ID, SIM_ID, "spy")
+
+        assert len(rows) == 4
+        admin_mock.rpc.assert_called_once()
+        by_key = {(r["agent_id"], r["target_simulation_id"]): r for r in rows}
+        # Alpha (aptitude 9) vs TARGET_SIM_ID: 0.55 + 0.27 - 0.25 + 0.075 = 0.645 (its guardian is not revealed)
+        assert by_key[(str(AGENT_ID), str(TARGET_SIM_ID))]["success_probability"] == pytest.approx(0.645)
+        # Beta (default 6) vs other_target through an embassy: 0.55 + 0.18 - 0.25 + 0.09 = 0.57
+        beta = by_key[(agent_b, other_target)]
+        assert beta["success_probability"] == pytest.approx(0.57)
+        assert beta["embassy_id"] == str(EMBASSY_ID)
 
-# ── Spy Effect ─────────────────────────────────────────────────
-
-
-class TestSpyEffect:
     @pytest.mark.asyncio
-    async def test_spy_gathers_intel_on_target(self):
+    async def test_rejects_targets_outside_the_epoch(self):
         sb = MagicMock()
+        sb.table.return_value = make_chain_mock([{"id": str(AGENT_ID), "name": "Alpha"}])
+        admin_mock = MagicMock()
+        participants = [{"simulation_id": str(SIM_ID)}, {"simulation_id": str(TARGET_SIM_ID)}]
+
+        with (
+            patch("backend.services.operative_service.get_admin_supabase", new_callable=AsyncMock, return_value=admin_mock),
+            patch(
+                "backend.services.operative_service.EpochService.list_participants",
+                new_callable=AsyncMock,
+                return_value=participants,
+            ),
+        ):
+            for targets in ([uuid4()], [TARGET_SIM_ID, uuid4()], [SIM_ID]):
+                with pytest.raises(HTTPException) as exc:
+                    await OperativeService.preview_probabilities(sb, EPOCH_ID, SIM_ID, "spy", targets)
+                assert exc.value.status_code == 400
 
-        zones_chain = MagicMock()
-        zones_chain.select.return_value = zones_chain
-        zones_chain.eq.return_value = zones_chain
-        zones_chain.execute.return_value = MagicMock(
-            data=[
-                {"security_level": "high"},
-                {"security_level": "moderate"},
-            ]
-        )
+        admin_mock.rpc.assert_not_called()
 
-        guardian_chain = MagicMock()
-        guardian_chain.select.return_value = guardian_chain
-        guardian_chain.eq.return_value = guardian_chain
-        guardian_chain.execute.return_value = MagicMock(data=[], count=2)
 
-        epoch_chain = MagicMock()
-        epoch_chain.select.return_value = epoch_chain
-        epoch_chain.eq.return_value = epoch_chain
-        epoch_chain.single.return_value = epoch_chain
-        epoch_chain.execute.return_value = MagicMock(
-            data={"current_cycle": 3}
-        )
+# ── Spy Effect ─────────────────────────────────────────────────
 
-        blog_chain = MagicMock()
-        blog_chain.insert.return_value = blog_chain
-        blog_chain.execute.return_value = MagicMock(data=[{"id": "bl1"}])
 
-        def table_router(name):
-            if name == "zones":
-                return zones_chain
-            if name == "operative_missions":
-                return guardian_chain
-            if name == "game_epochs":
-                return epoch_chain
-            if name == "battle_log":
-                return blog_chain
-            return MagicMock()
+def _batch(cycle: int = 3, cycle_hours: int = 8) -> _ResolutionBatch:
+    return _ResolutionBatch(epoch_id=str(EPOCH_ID), cycle=cycle, cycle_hours=cycle_hours, now=datetime.now(UTC))
 
-        sb.table.side_effect = table_router
 
-        mission = {
-            "id": str(uuid4()),
-            "epoch_id": str(EPOCH_ID),
-            "operative_type": "spy",
-            "source_simulation_id": str(SIM_ID),
-            "target_simulation_id": str(TARGET_SIM_ID),
-        }
+def _success_mission(operative_type: str, target_entity_id: str | None = None, **extra) -> dict:
+    return {
+        "id": str(uuid4()),
+        "epoch_id": str(EPOCH_ID),
+        "operative_type": operative_type,
+        "source_simulation_id": str(SIM_ID),
+        "target_simulation_id": str(TARGET_SIM_ID),
+        "target_entity_id": target_entity_id,
+        **extra,
+    }
 
-        result = await OperativeService._apply_spy_effect(sb, mission)
 
+class TestSpyEffect:
+    @pytest.mark.asyncio
+    async def test_spy_gathers_intel_on_target(self):
+        sb = MagicMock()
+        zones_chain = make_chain_mock([
+            {"id": "z1", "name": "Harbor", "simulation_id": str(TARGET_SIM_ID), "security_level": "high"},
+            {"id": "z2", "name": "Docks", "simulation_id": str(TARGET_SIM_ID), "security_level": "moderate"},
+        ])
+        guardian_chain = make_chain_mock([
+            {"source_simulation_id": str(TARGET_SIM_ID)},
+            {"source_simulation_id": str(TARGET_SIM_ID)},
+        ])
+        fort_chain = make_chain_mock([
+            {"zone_id": "z1", "source_simulation_id": str(TARGET_SIM_ID), "security_bonus": 1, "expires_at_cycle": 6},
+        ])
+        routes = {"zones": zones_chain, "operative_missions": guardian_chain, "zone_fortifications": fort_chain}
+        sb.table.side_effect = lambda name: routes.get(name, MagicMock())
+
+        batch = _batch()
+        missions = [_success_mission("spy"), _success_mission("spy")]
+        results = await OperativeService._apply_spy_effects(sb, missions, batch)
+
+        result = results[missions[0]["id"]]
         assert result["outcome"] == "success"
         assert result["intel_gathered"] is True
-        assert "zone_security" in result["intel"]
-        assert len(result["intel"]["zone_security"]) == 2
+        assert result["intel"]["zone_security"] == ["high", "moderate"]
+        assert result["intel"]["guardian_count"] == 2
+        assert result["intel"]["fortifications"][0]["zone_name"] == "Harbor"
+        # One lookup per table for the whole group; reports queued for the batch insert
+        assert zones_chain.execute.call_count == 1
+        assert [e["event_type"] for e in batch.log_entries] == ["intel_report", "intel_report"]
+        assert batch.log_entries[0]["cycle_number"] == 3
 
 
 # ── Saboteur Effect ────────────────────────────────────────────
 
 
 class TestSaboteurEffect:
-    @pytest.mark.asyncio
-    async def test_saboteur_degrades_building_condition(self):
+    def _sb(self, buildings: list[dict], zones: list[dict]):
         sb = MagicMock()
+        building_chain = make_chain_mock(buildings)
+        zones_chain = make_chain_mock(zones)
+        routes = {"buildings": building_chain, "zones": zones_chain}
+        sb.table.side_effect = lambda name: routes.get(name, MagicMock())
+        return sb, building_chain, zones_chain
 
-        building_chain = MagicMock()
-        building_chain.select.return_value = building_chain
-        building_chain.eq.return_value = building_chain
-        building_chain.single.return_value = building_chain
-        building_chain.execute.return_value = MagicMock(
-            data={"id": str(TARGET_ENTITY_ID), "building_condition": "good"}
-        )
-        building_chain.update.return_value = building_chain
-
-        zones_chain = MagicMock()
-        zones_chain.select.return_value = zones_chain
-        zones_chain.eq.return_value = zones_chain
-        zones_chain.execute.return_value = MagicMock(data=[])
-
-        def table_router(name):
-            if name == "buildings":
-                return building_chain
-            if name == "zones":
-                return zones_chain
-            return MagicMock()
-
-        sb.table.side_effect = table_router
-
-        mission = {
-            "id": str(uuid4()),
-            "epoch_id": str(EPOCH_ID),
-            "operative_type": "saboteur",
-            "source_simulation_id": str(SIM_ID),
-            "target_simulation_id": str(TARGET_SIM_ID),
-            "target_entity_id": str(TARGET_ENTITY_ID),
-        }
+    @pytest.mark.asyncio
+    async def test_saboteur_degrades_building_condition(self):
+        sb, building_chain, _ = self._sb([{"id": str(TARGET_ENTITY_ID), "building_condition": "good"}], [])
+        mission = _success_mission("saboteur", str(TARGET_ENTITY_ID))
 
-        result = await OperativeService._apply_saboteur_effect(sb, mission)
+        with patch.object(OperativeService, "_create_sabotage_events", new_callable=AsyncMock):
+            results = await OperativeService._apply_saboteur_effects(sb, [mission], _batch())
 
+        result = results[mission["id"]]
         assert result["outcome"] == "success"
-        assert "damage_dealt" in result
         assert result["damage_dealt"]["old_condition"] == "good"
         assert result["damage_dealt"]["new_condition"] == "moderate"
+        building_chain.update.assert_called_once_with({"building_condition": "moderate"})
 
     @pytest.mark.asyncio
     async def test_saboteur_downgrades_zone_security(self):
-        sb = MagicMock()
-
-        building_chain = MagicMock()
-        building_chain.select.return_value = building_chain
-        building_chain.eq.return_value = building_chain
-        building_chain.single.return_value = building_chain
-        building_chain.execute.return_value = MagicMock(data=None)
-
-        zones_chain = MagicMock()
-        zones_chain.select.return_value = zones_chain
-        zones_chain.eq.return_value = zones_chain
-        zones_chain.update.return_value = zones_chain
-        zones_chain.execute.return_value = MagicMock(
-            data=[{"id": "z1", "security_level": "high"}]
+        sb, _, zones_chain = self._sb(
+            [], [{"id": "z1", "name": "Harbor", "simulation_id": str(TARGET_SIM_ID), "security_level": "high"}],
         )
+        mission = _success_mission("saboteur")
 
-        def table_router(name):
-            if name == "buildings":
-                return building_chain
-            if name == "zones":
-                return zones_chain
-            return MagicMock()
+        with patch.object(OperativeService, "_create_sabotage_events", new_callable=AsyncMock):
+            results = await OperativeService._apply_saboteur_effects(sb, [mission], _batch())
 
-        sb.table.side_effect = table_router
+        result = results[mission["id"]]
+        assert result["zone_downgraded"]["old_level"] == "high"
+        assert result["zone_downgraded"]["new_level"] == "guarded"
+        zones_chain.update.assert_called_once_with({"security_level": "guarded"})
 
-        mission = {
-            "id": str(uuid4()),
-            "epoch_id": str(EPOCH_ID),
-            "operative_type": "saboteur",
-            "source_simulation_id": str(SIM_ID),
-            "target_simulation_id": str(TARGET_SIM_ID),
-            "target_entity_id": None,
-        }
+    @pytest.mark.asyncio
+    async def test_two_saboteurs_on_one_building_stack(self):
+        sb, building_chain, _ = self._sb([{"id": str(TARGET_ENTITY_ID), "building_condition": "good"}], [])
+        missions = [_success_mission("saboteur", str(TARGET_ENTITY_ID)) for _ in range(2)]
 
-        result = await OperativeService._apply_saboteur_effect(sb, mission)
+        with patch.object(OperativeService, "_create_sabotage_events", new_callable=AsyncMock):
+            results = await OperativeService._apply_saboteur_effects(sb, missions, _batch())
 
-        assert result["outcome"] == "success"
-        assert "zone_downgraded" in result
-        assert result["zone_downgraded"]["old_level"] == "high"
-        assert result["zone_downgraded"]["new_level"] == "guarded"
+        assert results[missions[1]["id"]]["damage_dealt"]["old_condition"] == "moderate"
+        # Only the final state is written
+        building_chain.update.assert_called_once_with({"building_condition": "poor"})
+
+    @pytest.mark.asyncio
+    async def test_sabotage_events_diminish_and_saturate(self):
+        admin_mock = MagicMock()
+        events_chain = make_chain_mock([{"simulation_id": str(TARGET_SIM_ID)}])  # 1 active already
+        admin_mock.table.return_value = events_chain
+        missions = [_success_mission("saboteur") for _ in range(3)]
+        results = {m["id"]: {"outcome": "success"} for m in missions}
+
+        with patch(
+            "backend.services.operative_service.get_admin_supabase",
+            new_callable=AsyncMock,
+            return_value=admin_mock,
+        ):
+            await OperativeService._create_sabotage_events(missions, results, {})
+
+        inserted = events_chain.insert.call_args[0][0]
+        assert [e["impact_level"] for e in inserted] == [2, 1]
+        assert results[missions[2]["id"]]["event_saturated"] is True
 
 
 # ── Propagandist Effect ────────────────────────────────────────
@@ -775,33 +717,25 @@ class TestPropagandistEffect:
     @pytest.mark.asyncio
     async def test_propagandist_creates_event_in_target_sim(self):
         admin_mock = MagicMock()
-        events_chain = MagicMock()
-        events_chain.insert.return_value = events_chain
-        events_chain.execute.return_value = MagicMock(data=[{"id": "e1"}])
+        events_chain = make_chain_mock([{"id": "e1"}])
         admin_mock.table.return_value = events_chain
+        missions = [_success_mission("propagandist"), _success_mission("propagandist")]
 
         with patch(
             "backend.services.operative_service.get_admin_supabase",
             new_callable=AsyncMock,
             return_value=admin_mock,
         ):
-            mission = {
-                "id": str(uuid4()),
-                "epoch_id": str(EPOCH_ID),
-                "operative_type": "propagandist",
-                "source_simulation_id": str(SIM_ID),
-                "target_simulation_id": str(TARGET_SIM_ID),
-            }
+            results = await OperativeService._apply_propagandist_effects(MagicMock(), missions, _batch())
 
-            result = await OperativeService._apply_propagandist_effect(MagicMock(), mission)
+        assert all(r["event_created"] for r in results.values())
 
-        assert result["outcome"] == "success"
-        assert result["event_created"] is True
-
-        # Verify event was inserted into target sim
-        insert_call = events_chain.insert.call_args[0][0]
-        assert insert_call["simulation_id"] == str(TARGET_SIM_ID)
-        assert insert_call["data_source"] == "propagandist"
+        # One insert carrying both events, in the target sim
+        events_chain.insert.assert_called_once()
+        inserted = events_chain.insert.call_args[0][0]
+        assert len(inserted) == 2
+        assert inserted[0]["simulation_id"] == str(TARGET_SIM_ID)
+        assert inserted[0]["data_source"] == "propagandist"
 
 
 # ── Assassin Effect ────────────────────────────────────────────
@@ -811,73 +745,32 @@ class TestAssassinEffect:
     @pytest.mark.asyncio
     async def test_assassin_weakens_relationships(self):
         sb = MagicMock()
-
-        rel_chain = MagicMock()
-        rel_chain.select.return_value = rel_chain
-        rel_chain.or_.return_value = rel_chain
-        rel_chain.eq.return_value = rel_chain
-        rel_chain.update.return_value = rel_chain
-        rel_chain.execute.return_value = MagicMock(
-            data=[
-                {"id": "r1", "intensity": 5},
-                {"id": "r2", "intensity": 3},
-            ]
-        )
-
-        epoch_chain = MagicMock()
-        epoch_chain.select.return_value = epoch_chain
-        epoch_chain.eq.return_value = epoch_chain
-        epoch_chain.single.return_value = epoch_chain
-        epoch_chain.execute.return_value = MagicMock(
-            data={"config": {"cycle_hours": 8}}
-        )
-
-        agents_chain = MagicMock()
-        agents_chain.update.return_value = agents_chain
-        agents_chain.eq.return_value = agents_chain
-        agents_chain.execute.return_value = MagicMock(data=[])
-
-        def table_router(name):
-            if name == "agent_relationships":
-                return rel_chain
-            if name == "game_epochs":
-                return epoch_chain
-            if name == "agents":
-                return agents_chain
-            return MagicMock()
-
-        sb.table.side_effect = table_router
-
-        mission = {
-            "id": str(uuid4()),
-            "epoch_id": str(EPOCH_ID),
-            "operative_type": "assassin",
-            "source_simulation_id": str(SIM_ID),
-            "target_simulation_id": str(TARGET_SIM_ID),
-            "target_entity_id": str(TARGET_ENTITY_ID),
-        }
-
-        result = await OperativeService._apply_assassin_effect(sb, mission)
-
+        rel_chain = make_chain_mock([
+            {"id": "r1", "source_agent_id": str(TARGET_ENTITY_ID), "target_agent_id": "x", "intensity": 5},
+            {"id": "r2", "source_agent_id": "y", "target_agent_id": str(TARGET_ENTITY_ID), "intensity": 3},
+        ])
+        agents_chain = make_chain_mock([])
+        routes = {"agent_relationships": rel_chain, "agents": agents_chain}
+        sb.table.side_effect = lambda name: routes.get(name, MagicMock())
+
+        mission = _success_mission("assassin", str(TARGET_ENTITY_ID))
+        results = await OperativeService._apply_assassin_effects(sb, [mission], _batch())
+
+        result = results[mission["id"]]
         assert result["outcome"] == "success"
         assert result["relationships_weakened"] == 2
         assert "ambassador_blocked_until" in result
+        # 5 → 3 and 3 → 1 are written as one UPDATE per new intensity
+        assert sorted(c.args[0]["intensity"] for c in rel_chain.update.call_args_list) == [1, 3]
+        agents_chain.in_.assert_called_with("id", [str(TARGET_ENTITY_ID)])
 
     @pytest.mark.asyncio
     async def test_assassin_without_target_returns_generic_success(self):
-        sb = MagicMock()
-        mission = {
-            "id": str(uuid4()),
-            "epoch_id": str(EPOCH_ID),
-            "operative_type": "assassin",
-            "source_simulation_id": str(SIM_ID),
-            "target_entity_id": None,
-        }
+        mission = _success_mission("assassin")
+        results = await OperativeService._apply_assassin_effects(MagicMock(), [mission], _batch())
 
-        result = await OperativeService._apply_assassin_effect(sb, mission)
-
-        assert result["outcome"] == "success"
-        assert result["narrative"] == "Mission completed."
+        assert results[mission["id"]]["outcome"] == "success"
+        assert results[mission["id"]]["narrative"] == "Mission completed."
 
 
 # ── Infiltrator Effect ─────────────────────────────────────────
@@ -887,40 +780,13 @@ class TestInfiltratorEffect:
     @pytest.mark.asyncio
     async def test_infiltrator_reduces_embassy_effectiveness(self):
         sb = MagicMock()
+        embassy_chain = make_chain_mock([])
+        sb.table.side_effect = lambda name: embassy_chain if name == "embassies" else MagicMock()
 
-        epoch_chain = MagicMock()
-        epoch_chain.select.return_value = epoch_chain
-        epoch_chain.eq.return_value = epoch_chain
-        epoch_chain.single.return_value = epoch_chain
-        epoch_chain.execute.return_value = MagicMock(
-            data={"config": {"cycle_hours": 8}}
-        )
-
-        embassy_chain = MagicMock()
-        embassy_chain.update.return_value = embassy_chain
-        embassy_chain.eq.return_value = embassy_chain
-        embassy_chain.execute.return_value = MagicMock(data=[])
-
-        def table_router(name):
-            if name == "game_epochs":
-                return epoch_chain
-            if name == "embassies":
-                return embassy_chain
-            return MagicMock()
-
-        sb.table.side_effect = table_router
-
-        mission = {
-            "id": str(uuid4()),
-            "epoch_id": str(EPOCH_ID),
-            "operative_type": "infiltrator",
-            "source_simulation_id": str(SIM_ID),
-            "target_simulation_id": str(TARGET_SIM_ID),
-            "target_entity_id": str(EMBASSY_ID),
-        }
-
-        result = await OperativeService._apply_infiltrator_effect(sb, mission)
+        mission = _success_mission("infiltrator", str(EMBASSY_ID))
+        results = await OperativeService._apply_infiltrator_effects(sb, [mission], _batch())
 
+        result = results[mission["id"]]
         assert result["outcome"] == "success"
         assert result["effectiveness_reduced"] is True
         assert result["target_embassy_id"] == str(EMBASSY_ID)
@@ -931,18 +797,87 @@ class TestInfiltratorEffect:
 
     @pytest.mark.asyncio
     async def test_infiltrator_without_target_returns_generic_success(self):
+        mission = _success_mission("infiltrator")
+        results = await OperativeService._apply_infiltrator_effects(MagicMock(), [mission], _batch())
+
+        assert results[mission["id"]]["outcome"] == "success"
+
+
+# ── Set-based Resolution ───────────────────────────────────────
+
+
+class TestResolvePendingMissions:
+    def _sb(self, missions: list[dict], participants: list[dict] | None = None):
         sb = MagicMock()
-        mission = {
-            "id": str(uuid4()),
-            "epoch_id": str(EPOCH_ID),
-            "operative_type": "infiltrator",
-            "source_simulation_id": str(SIM_ID),
-            "target_entity_id": None,
+        missions_chain = make_chain_mock(missions)
+        missions_chain.lte.return_value = missions_chain
+        epoch_chain = make_chain_mock({"current_cycle": 4, "config": {"cycle_hours": 8}})
+        participants_chain = make_chain_mock(participants or [])
+        blog_chain = make_chain_mock([])
+        routes = {
+            "operative_missions": missions_chain,
+            "game_epochs": epoch_chain,
+            "epoch_rng_seeds": make_chain_mock({"rng_seed": 42}),
+            "epoch_participants": participants_chain,
+            "battle_log": blog_chain,
         }
+        sb.table.side_effect = lambda name: routes.get(name, MagicMock())
+        sb.rpc.return_value.execute.return_value = MagicMock(data=[])
+        return sb, missions_chain, participants_chain, blog_chain
+
+    @pytest.mark.asyncio
+    async def test_deploying_missions_advance_in_one_update(self):
+        missions = [
+            {**_success_mission("spy"), "status": "deploying"},
+            {**_success_mission("saboteur"), "status": "deploying"},
+            {**_success_mission("guardian"), "status": "active"},
+        ]
+        sb, missions_chain, _, _ = self._sb(missions)
 
-        result = await OperativeService._apply_infiltrator_effect(sb, mission)
+        results = await OperativeService.resolve_pending_missions(sb, EPOCH_ID)
 
-        assert result["outcome"] == "success"
+        assert results == []
+        missions_chain.update.assert_called_once_with({"status": "active"})
+        missions_chain.in_.assert_any_call("id", [missions[0]["id"], missions[1]["id"]])
+        sb.rpc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_results_written_in_one_rpc(self):
+        missions = [
+            {**_success_mission("spy"), "status": "active", "success_probability": 0.5}
+            for _ in range(5)
+        ]
+        sb, _, _, _ = self._sb(missions)
+
+        with patch("backend.services.operative_service.roll_outcome", side_effect=["failed", "detected"] * 3):
+            results = await OperativeService.resolve_pending_missions(sb, EPOCH_ID)
+
+        sb.rpc.assert_called_once()
+        name, params = sb.rpc.call_args.args
+        assert name == "fn_apply_mission_results"
+        assert [u["status"] for u in params["p_results"]] == ["failed", "detected", "failed", "detected", "failed"]
+        assert [r["mission_result"]["outcome"] for r in results] == [u["status"] for u in params["p_results"]]
+
+    @pytest.mark.asyncio
+    async def test_detected_betrayal_dissolves_team_once(self):
+        ally = str(TARGET_SIM_ID)
+        missions = [
+            {**_success_mission("spy"), "status": "active", "success_probability": 0.5},
+            {**_success_mission("spy"), "status": "active", "success_probability": 0.5},
+        ]
+        participants = [
+            {"simulation_id": str(SIM_ID), "team_id": "team-1"},
+            {"simulation_id": ally, "team_id": "team-1"},
+        ]
+        sb, _, participants_chain, blog_chain = self._sb(missions, participants)
+
+        with patch("backend.services.operative_service.roll_outcome", return_value="detected"):
+            await OperativeService.resolve_pending_missions(sb, EPOCH_ID)
+
+        # Only the first mission is a betrayal — the alliance is gone for the second
+        inserted = blog_chain.insert.call_args[0][0]
+        assert [e["event_type"] for e in inserted] == ["betrayal"]
+        assert participants_chain.update.call_count == 2  # dissolve + penalty
 
 
 # ── Recall ─────────────────────────────────────────────────────
@@ -1045,3 +980,33 @@ class TestSecurityLevelMap:
 
     def test_moderate_and_medium_are_equal(self):
         assert SECURITY_LEVEL_MAP["moderate"] == SECURITY_LEVEL_MAP["medium"]
+
+
+# ── Fortification Expiry ──────────────────────────────────────
+
+
+class TestExpireFortifications:
+    @pytest.mark.asyncio
+    async def test_expires_all_due_fortifications_in_one_rpc(self):
+        sb = MagicMock()
+        expired = [{
+            "id": str(uuid4()), "zone_id": str(ZONE_ID), "zone_name": "Harbor",
+            "source_simulation_id": str(SIM_ID), "security_bonus": 1,
+            "old_level": "guarded", "new_level": "moderate",
+        }]
+        sb.rpc.return_value.execute.return_value = MagicMock(data=expired)
+
+        result = await OperativeService.expire_fortifications(sb, EPOCH_ID, 8)
+
+        sb.rpc.assert_called_once_with(
+            "fn_expire_fortifications", {"p_epoch_id": str(EPOCH_ID), "p_cycle_number": 8},
+        )
+        sb.table.assert_not_called()
+        assert result == expired
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_returns_empty_list(self):
+        sb = MagicMock()
+        sb.rpc.return_value.execute.return_value = MagicMock(data=None)
+
+        assert await OperativeService.expire_fortifications(sb, EPOCH_ID, 2) == []
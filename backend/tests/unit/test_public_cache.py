@@ -0,0 +1,166 @@
+"""Tests for public_cache — cached public GETs, ETag/304, coalescing, invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from backend.app import app
+from backend.dependencies import get_anon_supabase
+from backend.services import public_cache
+from backend.services.agent_service import AgentService
+
+SIM_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+OTHER_SIM_ID = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+AGENTS_URL = f"/api/v1/public/simulations/{SIM_ID}/agents"
+
+MOCK_AGENTS = [{"id": "a1", "name": "Agent One", "simulation_id": str(SIM_ID)}]
+
+
+@pytest.fixture()
+def client():
+    app.dependency_overrides[get_anon_supabase] = lambda: MagicMock()
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_anon_supabase, None)
+
+
+@pytest.fixture()
+def agent_list():
+    with patch.object(AgentService, "list", new_callable=AsyncMock, return_value=(MOCK_AGENTS, 1)) as mock:
+        yield mock
+
+
+class TestCachedEndpoint:
+    def test_second_request_is_served_from_cache(self, client, agent_list):
+        first = client.get(AGENTS_URL)
+        second = client.get(AGENTS_URL)
+
+        assert first.status_code == second.status_code == 200
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == first.json()
+        assert agent_list.await_count == 1
+
+    def test_response_matches_response_model_shape(self, client, agent_list):
+        body = client.get(AGENTS_URL).json()
+
+        assert body["success"] is True
+        assert body["data"] == MOCK_AGENTS
+        assert body["meta"] == {"count": 1, "total": 1, "limit": 25, "offset": 0}
+        assert "timestamp" in body
+
+    def test_query_params_are_part_of_the_key(self, client, agent_list):
+        client.get(AGENTS_URL, params={"limit": 10})
+        client.get(AGENTS_URL, params={"limit": 20})
+
+        assert agent_list.await_count == 2
+
+    def test_if_none_match_returns_304(self, client, agent_list):
+        etag = client.get(AGENTS_URL).headers["etag"]
+
+        response = client.get(AGENTS_URL, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert public_cache.get_stats()["not_modified"] == 1
+
+    def test_errors_are_not_cached(self, client):
+        not_found = HTTPException(status_code=404, detail="agents not found")
+        with patch.object(AgentService, "get", new_callable=AsyncMock, side_effect=not_found) as mock:
+            url = f"{AGENTS_URL}/cccccccc-cccc-cccc-cccc-cccccccccccc"
+            assert client.get(url).status_code == 404
+            assert client.get(url).status_code == 404
+
+        assert mock.await_count == 2
+
+    def test_keeps_endpoint_cache_control(self, client):
+        with patch("backend.routers.public.run_query", new_callable=AsyncMock) as run_query:
+            run_query.return_value = MagicMock(data=[], count=0)
+            first = client.get("/api/v1/public/simulations")
+            second = client.get("/api/v1/public/simulations")
+
+        assert first.headers["cache-control"].startswith("public, max-age=")
+        assert second.headers["cache-control"] == first.headers["cache-control"]
+
+
+class TestInvalidation:
+    def test_write_service_invalidates_simulation(self, client, agent_list):
+        client.get(AGENTS_URL)
+        AgentService._invalidate_public(SIM_ID)
+        client.get(AGENTS_URL)
+
+        assert agent_list.await_count == 2
+
+    def test_other_simulations_stay_cached(self, client, agent_list):
+        client.get(AGENTS_URL)
+        public_cache.invalidate_simulation(OTHER_SIM_ID)
+        response = client.get(AGENTS_URL)
+
+        assert response.headers["x-cache"] == "HIT"
+
+    def test_invalidation_drops_simulation_index(self, client):
+        with patch("backend.routers.public.run_query", new_callable=AsyncMock) as run_query:
+            run_query.return_value = MagicMock(data=[], count=0)
+            client.get("/api/v1/public/simulations")
+            public_cache.invalidate_simulation(OTHER_SIM_ID)
+            response = client.get("/api/v1/public/simulations")
+
+        assert response.headers["x-cache"] == "MISS"
+
+
+class TestCoalescing:
+    async def test_concurrent_misses_share_one_backend_call(self):
+        calls = 0
+        release = asyncio.Event()
+
+        @public_cache.cached("cache_public_entities_ttl")
+        async def endpoint(request, simulation_id):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"success": True, "data": calls}
+
+        def make_request():
+            request = MagicMock()
+            request.url.path = "/api/v1/public/coalesce"
+            request.query_params.multi_items.return_value = []
+            request.headers = {}
+            request.scope = {}
+            return request
+
+        tasks = [asyncio.create_task(endpoint(request=make_request(), simulation_id=SIM_ID)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert {r.body for r in responses} == {b'{"success":true,"data":1}'}
+        assert public_cache.get_stats()["coalesced"] == 4
+
+    async def test_miss_started_before_invalidation_is_not_stored(self):
+        release = asyncio.Event()
+
+        @public_cache.cached("cache_public_entities_ttl")
+        async def endpoint(request, simulation_id):
+            await release.wait()
+            return {"success": True}
+
+        request = MagicMock()
+        request.url.path = "/api/v1/public/race"
+        request.query_params.multi_items.return_value = []
+        request.headers = {}
+        request.scope = {}
+
+        task = asyncio.create_task(endpoint(request=request, simulation_id=SIM_ID))
+        await asyncio.sleep(0)
+        public_cache.invalidate_simulation(SIM_ID)
+        release.set()
+        await task
+
+        assert public_cache.get_stats()["entries"] == 0
@@ -0,0 +1,262 @@
+"""Tests for scoring_engine and the batched ScoringService.compute_cycle_scores path."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from backend.services import scoring_engine
+from backend.services.scoring_engine import EpochScoringData, composite_scores, compute_raw_scores
+from backend.services.scoring_service import ScoringService
+
+EPOCH_ID = uuid4()
+SIMS = [str(uuid4()) for _ in range(4)]
+# Epoch tables and the raw scores the retired per-simulation queries produced for them
+SCORING_FIXTURE = Path(__file__).parents[1] / "fixtures" / "epoch_scoring.json"
+
+
+# ── In-memory PostgREST stand-in ───────────────────────────────
+
+
+class _Query:
+    """Just enough of the PostgREST builder to run the scoring queries over lists of dicts."""
+
+    def __init__(self, db: FakeSupabase, table: str) -> None:
+        self._db = db
+        self._table = table
+        self._filters: list = []
+        self._count = False
+        self._single = False
+        self._range: tuple[int, int] | None = None
+        self._upsert: list[dict] | None = None
+        self._update: dict | None = None
+
+    def select(self, _columns, count=None):
+        self._count = count == "exact"
+        return self
+
+    def eq(self, col, value):
+        self._filters.append(lambda r: str(r.get(col)) == str(value))
+        return self
+
+    def in_(self, col, values):
+        wanted = {str(v) for v in values}
+        self._filters.append(lambda r: str(r.get(col)) in wanted)
+        return self
+
+    def or_(self, expr):
+        clauses = []
+        for col, op, value in re.findall(r"(\w+)\.(eq|in)\.(\([^)]*\)|[^,]+)", expr):
+            values = set(value.strip("()").split(",")) if op == "in" else {value}
+            clauses.append((col, values))
+        self._filters.append(lambda r: any(str(r.get(col)) in values for col, values in clauses))
+        return self
+
+    def order(self, _col):
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def maybe_single(self):
+        self._single = True
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self._upsert = rows
+        return self
+
+    def update(self, values):
+        self._update = values
+        return self
+
+    def execute(self):
+        self._db.executed.append(self._table)
+        if self._upsert is not None:
+            self._db.upserts.append(self._upsert)
+            return SimpleNamespace(data=self._upsert, count=None)
+        rows = [r for r in self._db.tables.get(self._table, []) if all(f(r) for f in self._filters)]
+        if self._update is not None:
+            return SimpleNamespace(data=rows, count=None)
+        if self._range:
+            rows = rows[self._range[0]:self._range[1] + 1]
+        if self._single:
+            return SimpleNamespace(data=rows[0] if rows else None, count=None)
+        return SimpleNamespace(data=rows, count=len(rows) if self._count else None)
+
+
+class FakeSupabase:
+    def __init__(self, tables: dict[str, list[dict]]) -> None:
+        self.tables = tables
+        self.executed: list[str] = []
+        self.upserts: list[list[dict]] = []
+
+    def table(self, name):
+        return _Query(self, name)
+
+    def rpc(self, _name, *_args):
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=None))
+
+
+def _mission(source, target, operative_type, status):
+    return {
+        "id": str(uuid4()),
+        "epoch_id": str(EPOCH_ID),
+        "source_simulation_id": source,
+        "target_simulation_id": target,
+        "operative_type": operative_type,
+        "status": status,
+    }
+
+
+def _epoch_tables() -> dict[str, list[dict]]:
+    a, b, c, d = SIMS
+    return {
+        "operative_missions": [
+            _mission(a, b, "spy", "success"),
+            _mission(a, b, "saboteur", "success"),
+            _mission(a, c, "propagandist", "success"),
+            _mission(a, c, "assassin", "detected"),
+            _mission(b, a, "infiltrator", "success"),
+            _mission(b, a, "spy", "captured"),
+            _mission(b, None, "guardian", "active"),
+            _mission(c, d, "assassin", "success"),
+            _mission(c, d, "spy", "failed"),
+            _mission(d, None, "guardian", "active"),
+            _mission(d, None, "guardian", "active"),
+            _mission(d, a, "saboteur", "active"),
+        ],
+        "mv_zone_stability": [
+            {"simulation_id": a, "stability": 0.8},
+            {"simulation_id": a, "stability": 0.6},
+            {"simulation_id": b, "stability": 0.9},
+            {"simulation_id": c, "stability": 0.4},
+        ],
+        "events": [
+            {"id": str(uuid4()), "simulation_id": c, "data_source": "propagandist"},
+            {"id": str(uuid4()), "simulation_id": c, "data_source": "propagandist"},
+            {"id": str(uuid4()), "simulation_id": b, "data_source": "manual"},
+        ],
+        "event_echoes": [
+            {"id": str(uuid4()), "source_simulation_id": a, "echo_strength": 2.5, "status": "completed"},
+            {"id": str(uuid4()), "source_simulation_id": a, "echo_strength": 9.0, "status": "pending"},
+            {"id": str(uuid4()), "source_simulation_id": d, "echo_strength": 1.0, "status": "completed"},
+        ],
+        "mv_embassy_effectiveness": [
+            {"simulation_a_id": a, "simulation_b_id": b, "effectiveness": 0.7},
+            {"simulation_a_id": c, "simulation_b_id": a, "effectiveness": 0.2},
+        ],
+        "embassies": [
+            {"id": str(uuid4()), "simulation_a_id": a, "simulation_b_id": b, "status": "active"},
+            {"id": str(uuid4()), "simulation_a_id": c, "simulation_b_id": d, "status": "active"},
+            {"id": str(uuid4()), "simulation_a_id": b, "simulation_b_id": d, "status": "closed"},
+        ],
+        "epoch_participants": [
+            {"epoch_id": str(EPOCH_ID), "simulation_id": a, "team_id": "t1", "betrayal_penalty": 0},
+            {"epoch_id": str(EPOCH_ID), "simulation_id": b, "team_id": "t1", "betrayal_penalty": 0.25},
+            {"epoch_id": str(EPOCH_ID), "simulation_id": c, "team_id": None, "betrayal_penalty": 0},
+            {"epoch_id": str(EPOCH_ID), "simulation_id": d, "team_id": None, "betrayal_penalty": None},
+        ],
+    }
+
+
+async def _compute(sb: FakeSupabase, participants: list[dict], epoch_id: UUID | str = EPOCH_ID) -> list[dict]:
+    with (
+        patch(
+            "backend.services.scoring_service.EpochService.get",
+            new_callable=AsyncMock,
+            return_value={"id": str(epoch_id), "config": {}},
+        ),
+        patch(
+            "backend.services.scoring_service.EpochService.list_participants",
+            new_callable=AsyncMock,
+            return_value=participants,
+        ),
+    ):
+        return await ScoringService.compute_cycle_scores(sb, epoch_id, 2)
+
+
+# ── Pure engine ────────────────────────────────────────────────
+
+
+class TestComputeRawScores:
+    def test_empty_data_gives_baselines(self):
+        scores = compute_raw_scores(SIMS[:1], EpochScoringData())[SIMS[0]]
+        assert scores == {"stability": 50.0, "influence": 0, "sovereignty": 100.0, "diplomatic": 0.0, "military": 0.0}
+
+    def test_missions_split_into_inbound_and_outbound(self):
+        a, b = SIMS[:2]
+        data = EpochScoringData(missions=[_mission(a, b, "saboteur", "success")])
+
+        scores = compute_raw_scores([a, b], data)
+
+        assert scores[a]["military"] == 5  # MISSION_SCORE_VALUES["saboteur"]
+        assert scores[b]["stability"] == 44.0  # 50 - saboteur×6
+        assert scores[b]["sovereignty"] == 92.0  # 100 - 8
+
+    def test_simulations_outside_the_epoch_are_ignored(self):
+        a = SIMS[0]
+        data = EpochScoringData(missions=[_mission(str(uuid4()), str(uuid4()), "assassin", "success")])
+        assert compute_raw_scores([a], data)[a]["stability"] == 50.0
+
+
+class TestCompositeScores:
+    def test_best_performer_gets_full_weight(self):
+        rows = [
+            {f"{dim}_score": 10.0 for dim in scoring_engine.DIMENSIONS},
+            {f"{dim}_score": 5.0 for dim in scoring_engine.DIMENSIONS},
+        ]
+        assert composite_scores(rows) == [100.0, 50.0]
+
+    def test_all_zero_dimension_does_not_divide_by_zero(self):
+        rows = [{f"{dim}_score": 0.0 for dim in scoring_engine.DIMENSIONS}]
+        assert composite_scores(rows, {"stability": 50}) == [0.0]
+
+
+# ── Batched service path ───────────────────────────────────────
+
+
+class TestBatchedComputeCycleScores:
+    @pytest.mark.asyncio
+    async def test_matches_recorded_per_simulation_scores(self):
+        fixture = json.loads(SCORING_FIXTURE.read_text())
+        tables = fixture["tables"]
+
+        batched = await _compute(FakeSupabase(tables), tables["epoch_participants"], fixture["epoch_id"])
+
+        assert {row["simulation_id"] for row in batched} == set(fixture["raw_scores"])
+        for row in batched:
+            expected = fixture["raw_scores"][row["simulation_id"]]
+            for dim in scoring_engine.DIMENSIONS:
+                assert row[f"{dim}_score"] == pytest.approx(expected[dim]), (row["simulation_id"], dim)
+
+    @pytest.mark.asyncio
+    async def test_query_count_is_independent_of_participants(self):
+        tables = _epoch_tables()
+
+        small = FakeSupabase(tables)
+        await _compute(small, tables["epoch_participants"][:1])
+        large = FakeSupabase(tables)
+        await _compute(large, tables["epoch_participants"])
+
+        assert len(small.executed) == len(large.executed)
+        assert large.executed.count("epoch_scores") == 1
+        assert len(large.upserts) == 1 and len(large.upserts[0]) == len(SIMS)
+
+    @pytest.mark.asyncio
+    async def test_composites_written_with_the_upsert(self):
+        tables = _epoch_tables()
+        sb = FakeSupabase(tables)
+
+        rows = await _compute(sb, tables["epoch_participants"])
+
+        assert all("composite_score" in row for row in sb.upserts[0])
+        assert max(row["composite_score"] for row in rows) > 0
+        assert {row["cycle_number"] for row in rows} == {2}
@@ -9,6 +9,7 @@ from uuid import uuid4
 import pytest
 from fastapi import HTTPException
 
+from backend.services.scoring_engine import EpochScoringData, composite_scores, compute_raw_scores
 from backend.services.scoring_service import ScoringService
 
 # ── Helpers ────────────────────────────────────────────────────
@@ -40,815 +41,316 @@ def _make_chain(**kwargs):
     return c
 
 
-# ── Stability Scoring ──────────────────────────────────────────
-
+# ── Helpers (dimension scoring) ────────────────────────────────
 
-class TestComputeStability:
-    @pytest.mark.asyncio
-    async def test_base_stability_from_zone_data(self):
-        """Stability = avg(zone_stability) * 100 with no penalties."""
-        sb = MagicMock()
 
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"stability": 0.8}, {"stability": 0.6}]
-        )
+def _mission(source: str | None, target: str | None, operative_type: str, status: str = "success") -> dict:
+    return {
+        "source_simulation_id": source,
+        "target_simulation_id": target,
+        "operative_type": operative_type,
+        "status": status,
+    }
 
-        events_chain = _make_chain()
-        events_chain.execute.return_value = MagicMock(data=[], count=0)
 
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(data=[])
+def _inbound(operative_type: str, status: str = "success") -> dict:
+    """A mission from SIM_ID_B against SIM_ID_A."""
+    return _mission(SIM_ID_B, SIM_ID_A, operative_type, status)
 
-        def table_router(name):
-            if name == "mv_zone_stability":
-                return mv_chain
-            if name == "events":
-                return events_chain
-            if name == "operative_missions":
-                return missions_chain
-            return _make_chain()
 
-        sb.table.side_effect = table_router
+def _outbound(operative_type: str, status: str = "success") -> dict:
+    """A mission from SIM_ID_A against SIM_ID_B."""
+    return _mission(SIM_ID_A, SIM_ID_B, operative_type, status)
 
-        result = await ScoringService._compute_stability(sb, EPOCH_ID, SIM_ID_A)
 
-        # avg(0.8, 0.6) * 100 = 70.0
-        assert result == 70.0
+def _score(dimension: str, **data) -> float:
+    """Raw ``dimension`` score of SIM_ID_A (SIM_ID_B is the opponent)."""
+    return compute_raw_scores([SIM_ID_A, SIM_ID_B], EpochScoringData(**data))[SIM_ID_A][dimension]
 
-    @pytest.mark.asyncio
-    async def test_stability_penalized_by_propaganda(self):
-        """Each propaganda event reduces stability by 3."""
-        sb = MagicMock()
 
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"stability": 1.0}]
-        )
+def _zones(*stabilities: float) -> list[dict]:
+    return [{"simulation_id": SIM_ID_A, "stability": s} for s in stabilities]
 
-        events_chain = _make_chain()
-        events_chain.execute.return_value = MagicMock(data=[], count=4)
 
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(data=[])
+# ── Stability Scoring ──────────────────────────────────────────
 
-        def table_router(name):
-            if name == "mv_zone_stability":
-                return mv_chain
-            if name == "events":
-                return events_chain
-            if name == "operative_missions":
-                return missions_chain
-            return _make_chain()
 
-        sb.table.side_effect = table_router
+class TestComputeStability:
+    def test_base_stability_from_zone_data(self):
+        """Stability = avg(zone_stability) * 100 with no penalties."""
+        # avg(0.8, 0.6) * 100 = 70.0
+        assert _score("stability", zone_stability=_zones(0.8, 0.6)) == 70.0
 
-        result = await ScoringService._compute_stability(sb, EPOCH_ID, SIM_ID_A)
+    def test_stability_penalized_by_propaganda(self):
+        """Each propaganda event reduces stability by 3."""
+        propaganda = [{"simulation_id": SIM_ID_A}] * 4
 
         # 100.0 - 4*3 = 88.0
-        assert result == 88.0
+        assert _score("stability", zone_stability=_zones(1.0), propaganda_events=propaganda) == 88.0
 
-    @pytest.mark.asyncio
-    async def test_stability_penalized_by_saboteur_and_assassin(self):
+    def test_stability_penalized_by_saboteur_and_assassin(self):
         """Saboteur=-6, Assassin=-5 per successful inbound mission."""
-        sb = MagicMock()
-
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"stability": 1.0}]
-        )
-
-        events_chain = _make_chain()
-        events_chain.execute.return_value = MagicMock(data=[], count=0)
-
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "saboteur"},
-                {"operative_type": "saboteur"},
-                {"operative_type": "assassin"},
-            ]
-        )
-
-        def table_router(name):
-            if name == "mv_zone_stability":
-                return mv_chain
-            if name == "events":
-                return events_chain
-            if name == "operative_missions":
-                return missions_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_stability(sb, EPOCH_ID, SIM_ID_A)
+        missions = [_inbound("saboteur"), _inbound("saboteur"), _inbound("assassin"), _inbound("saboteur", "failed")]
 
         # 100.0 - 0 - 2*6 - 1*5 = 100 - 12 - 5 = 83.0
-        assert result == 83.0
+        assert _score("stability", zone_stability=_zones(1.0), missions=missions) == 83.0
 
-    @pytest.mark.asyncio
-    async def test_stability_floors_at_zero(self):
+    def test_stability_floors_at_zero(self):
         """Stability cannot go negative."""
-        sb = MagicMock()
-
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"stability": 0.1}]
-        )
-
-        events_chain = _make_chain()
-        events_chain.execute.return_value = MagicMock(data=[], count=20)
-
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(
-            data=[{"operative_type": "saboteur"}] * 10
-        )
+        propaganda = [{"simulation_id": SIM_ID_A}] * 20
+        missions = [_inbound("saboteur")] * 10
 
-        def table_router(name):
-            if name == "mv_zone_stability":
-                return mv_chain
-            if name == "events":
-                return events_chain
-            if name == "operative_missions":
-                return missions_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_stability(sb, EPOCH_ID, SIM_ID_A)
-
-        assert result == 0.0
+        assert _score("stability", zone_stability=_zones(0.1), propaganda_events=propaganda, missions=missions) == 0.0
 
-    @pytest.mark.asyncio
-    async def test_stability_defaults_to_50_when_no_zones(self):
+    def test_stability_defaults_to_50_when_no_zones(self):
         """When no zone stability data exists, use 50.0 base."""
-        sb = MagicMock()
-
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(data=[])
-
-        events_chain = _make_chain()
-        events_chain.execute.return_value = MagicMock(data=[], count=0)
-
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(data=[])
-
-        def table_router(name):
-            if name == "mv_zone_stability":
-                return mv_chain
-            if name == "events":
-                return events_chain
-            if name == "operative_missions":
-                return missions_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_stability(sb, EPOCH_ID, SIM_ID_A)
-
-        assert result == 50.0
+        assert _score("stability") == 50.0
 
 
 # ── Influence Scoring ──────────────────────────────────────────
 
 
 class TestComputeInfluence:
-    @pytest.mark.asyncio
-    async def test_influence_from_successful_missions(self):
+    def test_influence_from_successful_missions(self):
         """propagandist=5, spy=2, infiltrator=3 per successful outbound mission."""
-        sb = MagicMock()
-
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "propagandist"},
-                {"operative_type": "propagandist"},
-                {"operative_type": "spy"},
-                {"operative_type": "infiltrator"},
-            ]
-        )
-
-        echo_chain = _make_chain()
-        echo_chain.execute.return_value = MagicMock(data=[])
-
-        def table_router(name):
-            if name == "operative_missions":
-                return missions_chain
-            if name == "event_echoes":
-                return echo_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_influence(sb, EPOCH_ID, SIM_ID_A)
+        missions = [
+            _outbound("propagandist"),
+            _outbound("propagandist"),
+            _outbound("spy"),
+            _outbound("infiltrator"),
+            _outbound("spy", "failed"),
+        ]
 
         # 2*5 + 1*2 + 1*3 = 15
-        assert result == 15.0
+        assert _score("influence", missions=missions) == 15.0
 
-    @pytest.mark.asyncio
-    async def test_influence_includes_echo_strength(self):
+    def test_influence_includes_echo_strength(self):
         """Echo strength from bleed system adds to influence."""
-        sb = MagicMock()
-
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(data=[])
-
-        echo_chain = _make_chain()
-        echo_chain.execute.return_value = MagicMock(
-            data=[
-                {"echo_strength": 3},
-                {"echo_strength": 5},
-            ]
-        )
-
-        def table_router(name):
-            if name == "operative_missions":
-                return missions_chain
-            if name == "event_echoes":
-                return echo_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_influence(sb, EPOCH_ID, SIM_ID_A)
-
-        assert result == 8.0
-
-    @pytest.mark.asyncio
-    async def test_influence_zero_with_no_missions_or_echoes(self):
-        sb = MagicMock()
-
-        missions_chain = _make_chain()
-        missions_chain.execute.return_value = MagicMock(data=[])
-
-        echo_chain = _make_chain()
-        echo_chain.execute.return_value = MagicMock(data=[])
-
-        def table_router(name):
-            if name == "operative_missions":
-                return missions_chain
-            if name == "event_echoes":
-                return echo_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
+        echoes = [
+            {"source_simulation_id": SIM_ID_A, "echo_strength": 3},
+            {"source_simulation_id": SIM_ID_A, "echo_strength": 5},
+        ]
 
-        result = await ScoringService._compute_influence(sb, EPOCH_ID, SIM_ID_A)
+        assert _score("influence", echoes=echoes) == 8.0
 
-        assert result == 0.0
+    def test_influence_zero_with_no_missions_or_echoes(self):
+        assert _score("influence") == 0.0
 
 
 # ── Sovereignty Scoring ────────────────────────────────────────
 
 
 class TestComputeSovereignty:
-    @pytest.mark.asyncio
-    async def test_sovereignty_baseline_100(self):
+    def test_sovereignty_baseline_100(self):
         """No attacks → sovereignty = 100."""
-        sb = MagicMock()
+        assert _score("sovereignty") == 100.0
 
-        inbound_chain = _make_chain()
-        inbound_chain.execute.return_value = MagicMock(data=[])
-
-        guardian_chain = _make_chain()
-        guardian_chain.execute.return_value = MagicMock(data=[])
-
-        call_count = {"operative_missions": 0}
-
-        def table_router(name):
-            if name == "operative_missions":
-                call_count["operative_missions"] += 1
-                if call_count["operative_missions"] == 1:
-                    return inbound_chain  # inbound missions
-                return guardian_chain  # guardian count
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_sovereignty(sb, EPOCH_ID, SIM_ID_A)
-
-        assert result == 100.0
-
-    @pytest.mark.asyncio
-    async def test_sovereignty_penalized_by_successful_inbound(self):
+    def test_sovereignty_penalized_by_successful_inbound(self):
         """Each successful inbound spy costs -2, saboteur -8, assassin -12."""
-        sb = MagicMock()
-
-        inbound_chain = _make_chain()
-        inbound_chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "spy", "status": "success"},
-                {"operative_type": "saboteur", "status": "success"},
-                {"operative_type": "assassin", "status": "success"},
-            ]
-        )
-
-        guardian_chain = _make_chain()
-        guardian_chain.execute.return_value = MagicMock(data=[])
-
-        call_count = {"operative_missions": 0}
-
-        def table_router(name):
-            if name == "operative_missions":
-                call_count["operative_missions"] += 1
-                if call_count["operative_missions"] == 1:
-                    return inbound_chain
-                return guardian_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_sovereignty(sb, EPOCH_ID, SIM_ID_A)
+        missions = [_inbound("spy"), _inbound("saboteur"), _inbound("assassin")]
 
         # 100 - 2 - 8 - 12 = 78
-        assert result == 78.0
+        assert _score("sovereignty", missions=missions) == 78.0
 
-    @pytest.mark.asyncio
-    async def test_sovereignty_bonus_from_detected_missions(self):
+    def test_sovereignty_bonus_from_detected_missions(self):
         """+3 per detected inbound mission."""
-        sb = MagicMock()
-
-        inbound_chain = _make_chain()
-        inbound_chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "spy", "status": "detected"},
-                {"operative_type": "saboteur", "status": "detected"},
-            ]
-        )
-
-        guardian_chain = _make_chain()
-        guardian_chain.execute.return_value = MagicMock(data=[])
-
-        call_count = {"operative_missions": 0}
-
-        def table_router(name):
-            if name == "operative_missions":
-                call_count["operative_missions"] += 1
-                if call_count["operative_missions"] == 1:
-                    return inbound_chain
-                return guardian_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_sovereignty(sb, EPOCH_ID, SIM_ID_A)
+        missions = [_inbound("spy", "detected"), _inbound("saboteur", "detected")]
 
         # 100 + 2*3 = 106, clamped to 100
-        assert result == 100.0
+        assert _score("sovereignty", missions=missions) == 100.0
 
-    @pytest.mark.asyncio
-    async def test_sovereignty_bonus_from_guardians(self):
+    def test_sovereignty_bonus_from_guardians(self):
         """+4 per active guardian."""
-        sb = MagicMock()
-
-        inbound_chain = _make_chain()
-        inbound_chain.execute.return_value = MagicMock(data=[])
-
-        guardian_chain = _make_chain()
-        guardian_chain.execute.return_value = MagicMock(
-            data=[{"id": "g1"}, {"id": "g2"}, {"id": "g3"}]
-        )
-
-        call_count = {"operative_missions": 0}
-
-        def table_router(name):
-            if name == "operative_missions":
-                call_count["operative_missions"] += 1
-                if call_count["operative_missions"] == 1:
-                    return inbound_chain
-                return guardian_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_sovereignty(sb, EPOCH_ID, SIM_ID_A)
+        guardians = [_mission(SIM_ID_A, None, "guardian", "active")] * 3
 
-        # 100 + 3*4 = 112, clamped to 100
-        assert result == 100.0
+        # 100 - 12 + 3*4 = 100
+        assert _score("sovereignty", missions=[_inbound("assassin"), *guardians]) == 100.0
 
-    @pytest.mark.asyncio
-    async def test_sovereignty_clamped_to_zero(self):
+    def test_sovereignty_clamped_to_zero(self):
         """Sovereignty cannot go negative."""
-        sb = MagicMock()
-
-        inbound_chain = _make_chain()
-        inbound_chain.execute.return_value = MagicMock(
-            data=[{"operative_type": "assassin", "status": "success"}] * 10
-        )
-
-        guardian_chain = _make_chain()
-        guardian_chain.execute.return_value = MagicMock(data=[])
-
-        call_count = {"operative_missions": 0}
+        # 100 - 10*12 = -20 → clamped to 0
+        assert _score("sovereignty", missions=[_inbound("assassin")] * 10) == 0.0
 
-        def table_router(name):
-            if name == "operative_missions":
-                call_count["operative_missions"] += 1
-                if call_count["operative_missions"] == 1:
-                    return inbound_chain
-                return guardian_chain
-            return _make_chain()
 
-        sb.table.side_effect = table_router
+# ── Diplomatic Scoring ─────────────────────────────────────────
 
-        result = await ScoringService._compute_sovereignty(sb, EPOCH_ID, SIM_ID_A)
 
-        # 100 - 10*12 = -20 → clamped to 0
-        assert result == 0.0
+def _embassies(count: int) -> list[dict]:
+    return [{"simulation_a_id": SIM_ID_A, "simulation_b_id": str(uuid4())} for _ in range(count)]
 
 
-# ── Diplomatic Scoring ─────────────────────────────────────────
+def _effectiveness(*values: float) -> list[dict]:
+    return [{"simulation_a_id": str(uuid4()), "simulation_b_id": SIM_ID_A, "effectiveness": v} for v in values]
 
 
 class TestComputeDiplomatic:
-    @pytest.mark.asyncio
-    async def test_diplomatic_from_embassy_effectiveness(self):
+    def test_diplomatic_from_embassy_effectiveness(self):
         """Base diplomatic score is embassy effectiveness * 10."""
-        sb = MagicMock()
-
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"effectiveness": 0.7}, {"effectiveness": 0.5}]
+        result = _score(
+            "diplomatic",
+            embassy_effectiveness=_effectiveness(0.7, 0.5),
+            active_embassies=_embassies(2),
+            participants=[{"simulation_id": SIM_ID_A, "team_id": None, "betrayal_penalty": 0}],
         )
 
-        embassy_chain = _make_chain()
-        embassy_chain.execute.return_value = MagicMock(
-            data=[{"id": "e1"}, {"id": "e2"}]
-        )
-
-        participant_chain = _make_chain()
-        participant_chain.execute.return_value = MagicMock(
-            data={"team_id": None, "betrayal_penalty": 0}
-        )
-
-        spy_chain = _make_chain()
-        spy_chain.execute.return_value = MagicMock(data=[], count=0)
-
-        def table_router(name):
-            if name == "mv_embassy_effectiveness":
-                return mv_chain
-            if name == "embassies":
-                return embassy_chain
-            if name == "epoch_participants":
-                return participant_chain
-            if name == "operative_missions":
-                return spy_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_diplomatic(sb, EPOCH_ID, SIM_ID_A)
-
         # (0.7 + 0.5) * 10 + 0 spy bonus) * 1.0 alliance * 1.0 betrayal = 12.0
         assert result == 12.0
 
-    @pytest.mark.asyncio
-    async def test_diplomatic_alliance_bonus(self):
+    def test_diplomatic_alliance_bonus(self):
         """Alliance bonus: * (1 + 0.15 * ally_count)."""
-        sb = MagicMock()
         team_id = str(uuid4())
-
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"effectiveness": 1.0}]
-        )
-
-        embassy_chain = _make_chain()
-        embassy_chain.execute.return_value = MagicMock(
-            data=[{"id": "e1"}]
-        )
-
-        participant_chain = _make_chain()
-        # First call: own participant with team
-        participant_responses = [
-            MagicMock(data={"team_id": team_id, "betrayal_penalty": 0}),
-            # Second call: allies count
-            MagicMock(data=[{"id": "p1"}, {"id": "p2"}, {"id": "p3"}]),  # 3 members = 2 allies
+        participants = [
+            {"simulation_id": SIM_ID_A, "team_id": team_id, "betrayal_penalty": 0},
+            {"simulation_id": SIM_ID_B, "team_id": team_id, "betrayal_penalty": 0},
+            {"simulation_id": SIM_ID_C, "team_id": team_id, "betrayal_penalty": 0},  # 3 members = 2 allies
         ]
-        participant_chain.execute.side_effect = participant_responses
-
-        spy_chain = _make_chain()
-        spy_chain.execute.return_value = MagicMock(data=[], count=0)
-
-        def table_router(name):
-            if name == "mv_embassy_effectiveness":
-                return mv_chain
-            if name == "embassies":
-                return embassy_chain
-            if name == "epoch_participants":
-                return participant_chain
-            if name == "operative_missions":
-                return spy_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
 
-        result = await ScoringService._compute_diplomatic(sb, EPOCH_ID, SIM_ID_A)
+        result = _score(
+            "diplomatic",
+            embassy_effectiveness=_effectiveness(1.0),
+            active_embassies=_embassies(1),
+            participants=participants,
+        )
 
         # (1.0 * 10 + 0) * (1 + 0.15 * 2) * 1.0 = 10 * 1.30 = 13.0
-        assert result == 13.0
+        assert result == pytest.approx(13.0)
 
-    @pytest.mark.asyncio
-    async def test_diplomatic_betrayal_penalty(self):
+    def test_diplomatic_betrayal_penalty(self):
         """Betrayal penalty: * (1 - 0.25) = 0.75."""
-        sb = MagicMock()
-
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"effectiveness": 1.0}]
+        result = _score(
+            "diplomatic",
+            embassy_effectiveness=_effectiveness(1.0),
+            active_embassies=_embassies(1),
+            participants=[{"simulation_id": SIM_ID_A, "team_id": None, "betrayal_penalty": 0.25}],
         )
 
-        embassy_chain = _make_chain()
-        embassy_chain.execute.return_value = MagicMock(
-            data=[{"id": "e1"}]
-        )
-
-        participant_chain = _make_chain()
-        participant_chain.execute.return_value = MagicMock(
-            data={"team_id": None, "betrayal_penalty": 0.25}
-        )
-
-        spy_chain = _make_chain()
-        spy_chain.execute.return_value = MagicMock(data=[], count=0)
-
-        def table_router(name):
-            if name == "mv_embassy_effectiveness":
-                return mv_chain
-            if name == "embassies":
-                return embassy_chain
-            if name == "epoch_participants":
-                return participant_chain
-            if name == "operative_missions":
-                return spy_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_diplomatic(sb, EPOCH_ID, SIM_ID_A)
-
         # (1.0 * 10 + 0) * 1.0 * 0.75 = 7.5
         assert result == 7.5
 
-    @pytest.mark.asyncio
-    async def test_diplomatic_spy_bonus(self):
+    def test_diplomatic_spy_bonus(self):
         """+1 per successful outbound spy mission."""
-        sb = MagicMock()
-
-        mv_chain = _make_chain()
-        mv_chain.execute.return_value = MagicMock(
-            data=[{"effectiveness": 1.0}]
-        )
-
-        embassy_chain = _make_chain()
-        embassy_chain.execute.return_value = MagicMock(
-            data=[{"id": "e1"}]
+        result = _score(
+            "diplomatic",
+            embassy_effectiveness=_effectiveness(1.0),
+            active_embassies=_embassies(1),
+            missions=[_outbound("spy")] * 3 + [_outbound("spy", "detected")],
         )
 
-        participant_chain = _make_chain()
-        participant_chain.execute.return_value = MagicMock(
-            data={"team_id": None, "betrayal_penalty": 0}
-        )
-
-        spy_chain = _make_chain()
-        spy_chain.execute.return_value = MagicMock(data=[], count=3)
-
-        def table_router(name):
-            if name == "mv_embassy_effectiveness":
-                return mv_chain
-            if name == "embassies":
-                return embassy_chain
-            if name == "epoch_participants":
-                return participant_chain
-            if name == "operative_missions":
-                return spy_chain
-            return _make_chain()
-
-        sb.table.side_effect = table_router
-
-        result = await ScoringService._compute_diplomatic(sb, EPOCH_ID, SIM_ID_A)
-
         # (1.0 * 10 + 3) * 1.0 * 1.0 = 13.0
         assert result == 13.0
 
+    def test_diplomatic_falls_back_to_embassy_count(self):
+        """Without effectiveness data each active embassy counts 0.5."""
+        # 2 * 0.5 * 10 = 10.0
+        assert _score("diplomatic", active_embassies=_embassies(2)) == 10.0
+
 
 # ── Military Scoring ───────────────────────────────────────────
 
 
 class TestComputeMilitary:
-    @pytest.mark.asyncio
-    async def test_military_from_successful_missions(self):
+    def test_military_from_successful_missions(self):
         """Each mission type has a score value on success."""
-        sb = MagicMock()
-        chain = _make_chain()
-        chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "spy", "status": "success"},       # +3
-                {"operative_type": "saboteur", "status": "success"},  # +5
-                {"operative_type": "assassin", "status": "success"},  # +8
-            ]
-        )
-        sb.table.return_value = chain
-
-        result = await ScoringService._compute_military(sb, EPOCH_ID, SIM_ID_A)
+        missions = [
+            _outbound("spy"),       # +3
+            _outbound("saboteur"),  # +5
+            _outbound("assassin"),  # +8
+        ]
 
         # 3 + 5 + 8 = 16
-        assert result == 16.0
+        assert _score("military", missions=missions) == 16.0
 
-    @pytest.mark.asyncio
-    async def test_military_detection_penalty(self):
+    def test_military_detection_penalty(self):
         """Detected missions incur DETECTION_PENALTY (3) each."""
-        sb = MagicMock()
-        chain = _make_chain()
-        chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "spy", "status": "success"},     # +3
-                {"operative_type": "spy", "status": "detected"},    # -3
-                {"operative_type": "spy", "status": "detected"},    # -3
-            ]
-        )
-        sb.table.return_value = chain
-
-        result = await ScoringService._compute_military(sb, EPOCH_ID, SIM_ID_A)
+        missions = [
+            _outbound("spy"),              # +3
+            _outbound("spy", "detected"),  # -3
+            _outbound("spy", "detected"),  # -3
+        ]
 
         # 3 - 3 - 3 = -3 → clamped to 0
-        assert result == 0.0
+        assert _score("military", missions=missions) == 0.0
 
-    @pytest.mark.asyncio
-    async def test_military_floored_at_zero(self):
+    def test_military_floored_at_zero(self):
         """Military score cannot go negative."""
-        sb = MagicMock()
-        chain = _make_chain()
-        chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "spy", "status": "detected"},
-                {"operative_type": "spy", "status": "detected"},
-            ]
-        )
-        sb.table.return_value = chain
-
-        result = await ScoringService._compute_military(sb, EPOCH_ID, SIM_ID_A)
-
-        assert result == 0.0
-
-    @pytest.mark.asyncio
-    async def test_military_zero_with_no_missions(self):
-        sb = MagicMock()
-        chain = _make_chain()
-        chain.execute.return_value = MagicMock(data=[])
-        sb.table.return_value = chain
+        assert _score("military", missions=[_outbound("spy", "detected")] * 2) == 0.0
 
-        result = await ScoringService._compute_military(sb, EPOCH_ID, SIM_ID_A)
+    def test_military_zero_with_no_missions(self):
+        assert _score("military") == 0.0
 
-        assert result == 0.0
-
-    @pytest.mark.asyncio
-    async def test_military_failed_missions_no_penalty(self):
+    def test_military_failed_missions_no_penalty(self):
         """Failed (but not detected) missions incur no penalty."""
-        sb = MagicMock()
-        chain = _make_chain()
-        chain.execute.return_value = MagicMock(
-            data=[
-                {"operative_type": "spy", "status": "success"},  # +3
-                {"operative_type": "spy", "status": "failed"},   # 0
-            ]
-        )
-        sb.table.return_value = chain
-
-        result = await ScoringService._compute_military(sb, EPOCH_ID, SIM_ID_A)
+        missions = [
+            _outbound("spy"),            # +3
+            _outbound("spy", "failed"),  # 0
+        ]
 
-        assert result == 3.0
+        assert _score("military", missions=missions) == 3.0
 
 
 # ── Normalization & Composite ──────────────────────────────────
 
 
-class TestNormalizationAndComposite:
-    @pytest.mark.asyncio
-    async def test_normalize_single_participant(self):
-        """Single participant should get composite of 100 (max in all dimensions)."""
-        sb = MagicMock()
-        score_id = str(uuid4())
-
-        scores_chain = _make_chain()
-        scores_chain.execute.return_value = MagicMock(
-            data=[{
-                "id": score_id,
-                "simulation_id": SIM_ID_A,
-                "stability_score": 80.0,
-                "influence_score": 10.0,
-                "sovereignty_score": 90.0,
-                "diplomatic_score": 15.0,
-                "military_score": 12.0,
-                "composite_score": 0,
-            }]
-        )
-
-        update_chain = _make_chain()
-        update_chain.execute.return_value = MagicMock(data=[{}])
+def _score_row(simulation_id: str, **scores: float) -> dict:
+    return {"simulation_id": simulation_id, **{f"{dim}_score": value for dim, value in scores.items()}}
 
-        def table_router(name):
-            return scores_chain
 
-        sb.table.side_effect = table_router
-
-        epoch = {"config": {}}
-        result = await ScoringService._normalize_and_composite(
-            sb, EPOCH_ID, 1, epoch,
-        )
+class TestNormalizationAndComposite:
+    def test_normalize_single_participant(self):
+        """Single participant should get composite of 100 (max in all dimensions)."""
+        row = _score_row(SIM_ID_A, stability=80.0, influence=10.0, sovereignty=90.0, diplomatic=15.0, military=12.0)
 
-        assert len(result) == 1
         # Single participant: all normalized to 100, composite = sum(100*w/100)
         # Default weights: 25+20+20+15+20 = 100
-        assert result[0]["composite_score"] == 100.0
+        assert composite_scores([row]) == [100.0]
 
-    @pytest.mark.asyncio
-    async def test_normalize_two_participants(self):
+    def test_normalize_two_participants(self):
         """Two participants: leader gets 100 in each dimension, follower is proportional."""
-        sb = MagicMock()
-
-        scores_data = [
-            {
-                "id": str(uuid4()),
-                "simulation_id": SIM_ID_A,
-                "stability_score": 100.0,
-                "influence_score": 20.0,
-                "sovereignty_score": 100.0,
-                "diplomatic_score": 20.0,
-                "military_score": 20.0,
-                "composite_score": 0,
-            },
-            {
-                "id": str(uuid4()),
-                "simulation_id": SIM_ID_B,
-                "stability_score": 50.0,
-                "influence_score": 10.0,
-                "sovereignty_score": 50.0,
-                "diplomatic_score": 10.0,
-                "military_score": 10.0,
-                "composite_score": 0,
-            },
+        rows = [
+            _score_row(SIM_ID_A, stability=100.0, influence=20.0, sovereignty=100.0, diplomatic=20.0, military=20.0),
+            _score_row(SIM_ID_B, stability=50.0, influence=10.0, sovereignty=50.0, diplomatic=10.0, military=10.0),
         ]
 
-        scores_chain = _make_chain()
-        scores_chain.execute.return_value = MagicMock(data=scores_data)
-
-        update_chain = _make_chain()
-        update_chain.execute.return_value = MagicMock(data=[{}])
-
-        sb.table.side_effect = lambda name: scores_chain
+        # Participant A: all at max → composite = 100; B: all at 50% → composite = 50
+        assert composite_scores(rows) == [100.0, 50.0]
 
-        epoch = {"config": {}}
-        result = await ScoringService._normalize_and_composite(
-            sb, EPOCH_ID, 1, epoch,
-        )
+    def test_normalize_with_custom_weights(self):
+        """Custom score weights should affect composite calculation."""
+        row = _score_row(SIM_ID_A, stability=100.0, influence=0.0, sovereignty=0.0, diplomatic=0.0, military=0.0)
+        weights = {"stability": 80, "influence": 5, "sovereignty": 5, "diplomatic": 5, "military": 5}
 
-        assert len(result) == 2
-        # Participant A: all at max → composite = 100
-        assert result[0]["composite_score"] == 100.0
-        # Participant B: all at 50% → composite = 50
-        assert result[1]["composite_score"] == 50.0
+        # Stability=100 normalized=100, rest all 0 → composite = 100*80/100 = 80
+        assert composite_scores([row], weights) == [80.0]
 
     @pytest.mark.asyncio
-    async def test_normalize_with_custom_weights(self):
-        """Custom score weights should affect composite calculation."""
+    async def test_epoch_weights_are_applied_on_upsert(self):
+        """compute_cycle_scores writes composites using the epoch's score_weights."""
         sb = MagicMock()
-
-        scores_data = [{
-            "id": str(uuid4()),
-            "simulation_id": SIM_ID_A,
-            "stability_score": 100.0,
-            "influence_score": 0.0,
-            "sovereignty_score": 0.0,
-            "diplomatic_score": 0.0,
-            "military_score": 0.0,
-            "composite_score": 0,
-        }]
-
-        scores_chain = _make_chain()
-        scores_chain.execute.return_value = MagicMock(data=scores_data)
-
-        update_chain = _make_chain()
-        update_chain.execute.return_value = MagicMock(data=[{}])
-
-        sb.table.side_effect = lambda name: scores_chain
-
-        # Heavily weight stability
-        epoch = {
-            "config": {
-                "score_weights": {
-                    "stability": 80,
-                    "influence": 5,
-                    "sovereignty": 5,
-                    "diplomatic": 5,
-                    "military": 5,
-                },
-            },
+        upsert_chain = _make_chain()
+        upsert_chain.execute.side_effect = lambda: MagicMock(data=upsert_chain.upsert.call_args.args[0])
+        sb.table.return_value = upsert_chain
+        raw = {
+            SIM_ID_A: {"stability": 100.0, "influence": 0.0, "sovereignty": 0.0, "diplomatic": 0.0, "military": 0.0},
         }
-        result = await ScoringService._normalize_and_composite(
-            sb, EPOCH_ID, 1, epoch,
-        )
+        weights = {"stability": 80, "influence": 5, "sovereignty": 5, "diplomatic": 5, "military": 5}
+
+        with (
+            patch(
+                "backend.services.scoring_service.EpochService.get",
+                new_callable=AsyncMock,
+                return_value={"id": str(EPOCH_ID), "config": {"score_weights": weights}},
+            ),
+            patch(
+                "backend.services.scoring_service.EpochService.list_participants",
+                new_callable=AsyncMock,
+                return_value=[{"simulation_id": SIM_ID_A}],
+            ),
+            patch("backend.services.scoring_service.GameMechanicsService.refresh_metrics", new_callable=AsyncMock),
+            patch.object(ScoringService, "_load_scoring_data", new_callable=AsyncMock, return_value=EpochScoringData()),
+            patch("backend.services.scoring_service.compute_raw_scores", return_value=raw),
+        ):
+            result = await ScoringService.compute_cycle_scores(sb, EPOCH_ID, 1)
 
-        # Stability=100 normalized=100, rest all 0 → composite = 100*80/100 = 80
         assert result[0]["composite_score"] == 80.0
 
 
@@ -927,7 +429,7 @@ class TestScoringServiceLogging:
         """compute_cycle_scores should log INFO at start with epoch_id and cycle_number."""
         sb = MagicMock()
 
-        # rpc chain for refresh_all_game_metrics
+        # rpc chain for refresh_game_metrics
         rpc_chain = MagicMock()
         rpc_chain.execute.return_value = MagicMock()
         sb.rpc.return_value = rpc_chain
@@ -980,10 +482,10 @@ class TestScoringServiceLogging:
                 new_callable=AsyncMock,
                 return_value=[{"simulation_id": SIM_ID_A}],
             ),
-            patch.object(
-                ScoringService, "_compute_raw_scores",
-                new_callable=AsyncMock,
-                return_value={"stability": 50, "influence": 10, "sovereignty": 80, "diplomatic": 5, "military": 3},
+            patch.object(ScoringService, "_load_scoring_data", new_callable=AsyncMock, return_value=EpochScoringData()),
+            patch(
+                "backend.services.scoring_service.compute_raw_scores",
+                return_value={SIM_ID_A: {"stability": 50, "influence": 10, "sovereignty": 80, "diplomatic": 5, "military": 3}},
             ),
             caplog.at_level(logging.WARNING, logger="backend.services.scoring_service"),
         ):
@@ -992,3 +494,53 @@ class TestScoringServiceLogging:
         warning_records = [r for r in caplog.records if r.levelno == logging.WARNING and "upsert" in r.message.lower()]
         assert len(warning_records) >= 1
         assert warning_records[0].simulation_id == SIM_ID_A
+
+
+# ── Metrics Refresh ──────────────────────────────────────────
+
+
+class TestScoringMetricsRefresh:
+    """compute_cycle_scores recomputes only the epoch's own game metrics."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_only_participant_simulations(self):
+        sb = MagicMock()
+        sb.rpc.return_value.execute.return_value = MagicMock(data=[SIM_ID_A, SIM_ID_B])
+
+        with (
+            patch(
+                "backend.services.scoring_service.EpochService.get",
+                new_callable=AsyncMock,
+                return_value={"id": str(EPOCH_ID), "status": "competition", "config": {}},
+            ),
+            patch(
+                "backend.services.scoring_service.EpochService.list_participants",
+                new_callable=AsyncMock,
+                return_value=[{"simulation_id": SIM_ID_A}, {"simulation_id": SIM_ID_B}],
+            ),
+            patch.object(ScoringService, "_load_scoring_data", new_callable=AsyncMock, side_effect=RuntimeError("stop")),
+            pytest.raises(RuntimeError),
+        ):
+            await ScoringService.compute_cycle_scores(sb, EPOCH_ID, 2)
+
+        sb.rpc.assert_called_once_with("refresh_game_metrics", {"p_simulation_ids": [SIM_ID_A, SIM_ID_B]})
+
+    @pytest.mark.asyncio
+    async def test_no_refresh_without_participants(self):
+        sb = MagicMock()
+
+        with (
+            patch(
+                "backend.services.scoring_service.EpochService.get",
+                new_callable=AsyncMock,
+                return_value={"id": str(EPOCH_ID), "status": "competition", "config": {}},
+            ),
+            patch(
+                "backend.services.scoring_service.EpochService.list_participants",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+        ):
+            assert await ScoringService.compute_cycle_scores(sb, EPOCH_ID, 2) == []
+
+        sb.rpc.assert_not_called()
@@ -94,11 +94,9 @@ class TestEnrichHtmlForCrawler:
         import backend.middleware.seo as seo_module
         seo_module._index_html_cache = None
         seo_module._sim_meta_cache.clear()
-        seo_module._anon_client = None
         yield
         seo_module._index_html_cache = None
         seo_module._sim_meta_cache.clear()
-        seo_module._anon_client = None
 
     @pytest.mark.anyio
     async def test_returns_none_for_non_simulation_paths(self):
@@ -142,7 +140,7 @@ class TestEnrichHtmlForCrawler:
         mock_response = MagicMock()
         mock_response.data = [{"name": "Test Sim", "description": "A test simulation", "banner_url": ""}]
 
-        with patch("backend.middleware.seo.create_client") as mock_create:
+        with patch("backend.middleware.seo.get_anon_client") as mock_create:
             mock_client = MagicMock()
             mock_create.return_value = mock_client
             mock_client.table.return_value.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
@@ -178,7 +176,7 @@ class TestEnrichHtmlForCrawler:
         mock_response = MagicMock()
         mock_response.data = [{"name": '<script>alert("xss")</script>', "description": "", "banner_url": ""}]
 
-        with patch("backend.middleware.seo.create_client") as mock_create:
+        with patch("backend.middleware.seo.get_anon_client") as mock_create:
             mock_client = MagicMock()
             mock_create.return_value = mock_client
             mock_client.table.return_value.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
@@ -202,7 +200,7 @@ class TestEnrichHtmlForCrawler:
         mock_response = MagicMock()
         mock_response.data = []
 
-        with patch("backend.middleware.seo.create_client") as mock_create:
+        with patch("backend.middleware.seo.get_anon_client") as mock_create:
             mock_client = MagicMock()
             mock_create.return_value = mock_client
             mock_client.table.return_value.select.return_value.eq.return_value.limit.return_value.execute.return_value = (
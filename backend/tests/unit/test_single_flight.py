@@ -0,0 +1,125 @@
+"""Tests for SingleFlight — shared in-flight loads and stale-while-revalidate."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.services.bleed_gazette_service import BleedGazetteService
+from backend.utils.single_flight import SingleFlight
+
+
+def _counting_loader(results=None, delay: float = 0.01):
+    calls = {"n": 0}
+
+    async def loader():
+        calls["n"] += 1
+        await asyncio.sleep(delay)
+        return results[calls["n"] - 1] if results else calls["n"]
+
+    return loader, calls
+
+
+class TestSingleFlight:
+    async def test_concurrent_callers_share_one_load(self):
+        flight = SingleFlight("test", ttl=60)
+        loader, calls = _counting_loader()
+
+        results = await asyncio.gather(*[flight.get("k", loader) for _ in range(10)])
+
+        assert results == [1] * 10
+        assert calls["n"] == 1
+        assert flight.get_stats()["shared"] == 9
+
+    async def test_fresh_value_is_reused(self):
+        flight = SingleFlight("test", ttl=60)
+        loader, calls = _counting_loader()
+
+        await flight.get("k", loader)
+        await flight.get("k", loader)
+
+        assert calls["n"] == 1
+        assert flight.get_stats()["fresh_hits"] == 1
+
+    async def test_keys_are_independent(self):
+        flight = SingleFlight("test", ttl=60)
+        loader, calls = _counting_loader()
+
+        await asyncio.gather(flight.get(10, loader), flight.get(20, loader))
+
+        assert calls["n"] == 2
+
+    async def test_stale_value_served_while_refreshing(self):
+        flight = SingleFlight("test", ttl=0.05, stale_factor=100)
+        loader, calls = _counting_loader()
+        assert await flight.get("k", loader) == 1
+
+        await asyncio.sleep(0.06)
+        # Past the TTL: old value immediately, one background refresh for all callers
+        assert await asyncio.gather(*[flight.get("k", loader) for _ in range(5)]) == [1] * 5
+        await asyncio.sleep(0.03)
+
+        assert calls["n"] == 2
+        assert await flight.get("k", loader) == 2
+
+    async def test_expired_value_waits_for_reload(self):
+        flight = SingleFlight("test", ttl=0.01, stale_factor=1)
+        loader, calls = _counting_loader()
+        await flight.get("k", loader)
+        await asyncio.sleep(0.02)
+
+        assert await flight.get("k", loader) == 2
+
+    async def test_failed_refresh_keeps_last_good_value(self):
+        flight = SingleFlight("test", ttl=0.01, stale_factor=100)
+        await flight.get("k", AsyncMock(return_value="good"))
+        await asyncio.sleep(0.02)
+
+        assert await flight.get("k", AsyncMock(side_effect=RuntimeError("db down"))) == "good"
+        await asyncio.sleep(0)
+
+        assert flight.get_stats()["refresh_errors"] == 1
+        assert await flight.get("k", AsyncMock(side_effect=RuntimeError)) == "good"
+
+    async def test_load_error_propagates_to_all_waiters_and_is_not_cached(self):
+        flight = SingleFlight("test", ttl=60)
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*[flight.get("k", failing) for _ in range(3)], return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.get_stats()["keys"] == 0
+
+    async def test_ttl_callable_is_reread(self):
+        ttl = {"value": 60}
+        flight = SingleFlight("test", ttl=lambda: ttl["value"])
+        loader, calls = _counting_loader()
+        await flight.get("k", loader)
+
+        ttl["value"] = 0
+        with patch.object(flight, "_stale_factor", 0):
+            await flight.get("k", loader)
+
+        assert calls["n"] == 2
+
+
+class TestServiceIntegration:
+    async def test_bleed_gazette_keys_by_limit(self):
+        """A small first request must not truncate later, larger ones."""
+        supabase = MagicMock()
+        rows = [{"id": i} for i in range(20)]
+        supabase.rpc.return_value.execute.side_effect = [MagicMock(data=rows[:5]), MagicMock(data=rows)]
+
+        assert len(await BleedGazetteService.get_feed(supabase, limit=5)) == 5
+        assert len(await BleedGazetteService.get_feed(supabase, limit=20)) == 20
+
+    async def test_bleed_gazette_burst_hits_rpc_once(self):
+        supabase = MagicMock()
+        supabase.rpc.return_value.execute.return_value = MagicMock(data=[{"id": 1}])
+
+        await asyncio.gather(*[BleedGazetteService.get_feed(supabase, limit=20) for _ in range(8)])
+
+        assert supabase.rpc.return_value.execute.call_count == 1
@@ -0,0 +1,56 @@
+"""Unit tests for sse_response — event encoding and in-stream errors."""
+
+from __future__ import annotations
+
+import json
+
+from backend.services.external.openrouter import OpenRouterError
+from backend.utils.sse import sse_response
+
+
+async def _events(*items, fail: Exception | None = None):
+    for item in items:
+        yield item
+    if fail is not None:
+        raise fail
+
+
+async def _read(response) -> list[tuple[str, dict]]:
+    body = b"".join([chunk async for chunk in response.body_iterator]).decode()
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestSseResponse:
+    async def test_events_then_done(self):
+        response = sse_response(
+            _events(("delta", {"content": "a\nb"}), ("result", {"ok": True})),
+            failure_detail="failed",
+        )
+
+        assert response.media_type == "text/event-stream"
+        assert response.headers["cache-control"] == "no-cache"
+        assert await _read(response) == [
+            ("delta", {"content": "a\nb"}),
+            ("result", {"ok": True}),
+            ("done", {}),
+        ]
+
+    async def test_unavailable_error_becomes_503_event(self):
+        response = sse_response(
+            _events(("delta", {"content": "a"}), fail=OpenRouterError("429")),
+            failure_detail="failed",
+            unavailable=(OpenRouterError,),
+        )
+
+        assert (await _read(response))[-1] == (
+            "error", {"status": 503, "detail": "AI service temporarily unavailable."},
+        )
+
+    async def test_other_errors_become_500_event(self):
+        response = sse_response(_events(fail=ValueError("boom")), failure_detail="Generation failed.")
+
+        assert await _read(response) == [("error", {"status": 500, "detail": "Generation failed."})]
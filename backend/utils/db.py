@@ -0,0 +1,83 @@
+"""Non-blocking execution of supabase-py queries.
+
+supabase-py's PostgREST, RPC and Storage clients are synchronous: ``.execute()``
+performs the HTTP round-trip on the calling thread. Inside an ``async def``
+handler that blocks the event loop, so one slow query stalls every other
+request on the worker.
+
+Services await ``run_query(builder)`` instead of calling ``builder.execute()``.
+The request runs on a bounded worker pool (``settings.db_max_concurrency``),
+which keeps the loop free and lets independent queries overlap via
+``gather_queries``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from backend.config import settings
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide DB worker pool, creating it on first use."""
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.db_max_concurrency,
+            thread_name_prefix="db",
+        )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking callable on the DB worker pool and await its result.
+
+    The caller's contextvars (structlog request context) are copied into the
+    worker thread so log lines emitted there keep their request_id.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_executor(), call)
+
+
+async def run_query(query: Any) -> Any:
+    """Execute a PostgREST/RPC request builder without blocking the event loop.
+
+    Usage:
+        response = await run_query(
+            supabase.table("agents").select("*").eq("simulation_id", sim_id)
+        )
+    """
+    return await run_blocking(query.execute)
+
+
+async def gather_queries(*queries: Any) -> list[Any]:
+    """Execute independent request builders concurrently.
+
+    Responses are returned in argument order. Any exception propagates
+    after all queries have been started.
+    """
+    return list(await asyncio.gather(*(run_query(q) for q in queries)))
+
+
+async def fetch_all(build_query: Callable[[], Any], *, page_size: int = 1000) -> list[dict]:
+    """Fetch every row of a query, paging past PostgREST's ``max-rows`` cap.
+
+    ``build_query`` must return a fresh request builder on each call (builders
+    are mutable) with a deterministic ``.order()`` so pages do not overlap.
+    """
+    rows: list[dict] = []
+    while True:
+        response = await run_query(build_query().range(len(rows), len(rows) + page_size - 1))
+        page = response.data or []
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
@@ -0,0 +1,198 @@
+"""Local Supabase JWT verification with a background-refreshed JWKS and a claims cache.
+
+Every authenticated request used to re-verify the token signature (ES256 is
+the expensive part), and once an hour one unlucky request blocked on a
+synchronous JWKS download. Instead:
+
+- Signing keys are held in-process by ``kid``. Once they are older than
+  ``_JWKS_REFRESH_AFTER`` a daemon thread re-downloads them while requests
+  keep using the current set. A request only fetches inline on a cold start
+  or when it presents an unknown ``kid`` (key rotation), rate-limited by
+  ``_JWKS_MIN_REFETCH``.
+- Verified claims are kept in a bounded LRU keyed by the SHA-256 of the token,
+  each entry expiring at the token's own ``exp``. Failures are never cached.
+
+``peek_claims()`` is a lookup-only view used by ``LoggingContextMiddleware``
+so it can reuse claims already verified for the same token.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+
+import jwt as pyjwt
+from cachetools import TLRUCache
+from jwt import PyJWK, PyJWKClient
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_JWKS_TTL = 3600  # Keys are considered current for 1 hour
+_JWKS_REFRESH_AFTER = _JWKS_TTL * 0.8  # Start a background refresh before the TTL lapses
+_JWKS_MIN_REFETCH = 30  # Seconds between inline refetches triggered by unknown kids
+_CLAIMS_MAXSIZE = 10_000
+_CLAIMS_MAX_TTL = 3600  # Upper bound for tokens with a far-future (or missing) exp
+
+_jwks_lock = threading.Lock()
+_jwks_keys: dict[str, PyJWK] = {}
+_jwks_fetched_at: float = 0
+_jwks_refreshing = False
+
+_claims_lock = threading.Lock()
+_claims: TLRUCache = TLRUCache(
+    maxsize=_CLAIMS_MAXSIZE,
+    ttu=lambda _key, claims, now: min(claims.get("exp", now), now + _CLAIMS_MAX_TTL),
+    timer=time.time,
+)
+
+_stats: dict[str, int] = {
+    "claims_hits": 0,
+    "claims_misses": 0,
+    "jwks_fetches": 0,
+    "jwks_background_refreshes": 0,
+}
+
+
+# ── JWKS ──────────────────────────────────────────────────
+
+
+def _fetch_jwks() -> None:
+    """Download the JWKS and replace the in-process key set."""
+    global _jwks_keys, _jwks_fetched_at  # noqa: PLW0603
+    url = f"{settings.supabase_url}/auth/v1/.well-known/jwks.json"
+    client = PyJWKClient(url, cache_jwk_set=False, cache_keys=False, headers={"apikey": settings.supabase_anon_key})
+    keys = {key.key_id: key for key in client.get_signing_keys() if key.key_id}
+    _jwks_keys = keys
+    _jwks_fetched_at = time.monotonic()
+    _stats["jwks_fetches"] += 1
+    logger.info("Loaded %d JWKS signing keys from %s", len(keys), url)
+
+
+def _background_refresh() -> None:
+    global _jwks_refreshing  # noqa: PLW0603
+    try:
+        _fetch_jwks()
+        _stats["jwks_background_refreshes"] += 1
+    except Exception:  # noqa: BLE001
+        # Keep serving the current keys; the next request past the threshold retries.
+        logger.warning("Background JWKS refresh failed", exc_info=True)
+    finally:
+        _jwks_refreshing = False
+
+
+def _schedule_refresh() -> None:
+    """Start a single background JWKS refresh if none is running."""
+    global _jwks_refreshing  # noqa: PLW0603
+    with _jwks_lock:
+        if _jwks_refreshing:
+            return
+        _jwks_refreshing = True
+    threading.Thread(target=_background_refresh, name="jwks-refresh", daemon=True).start()
+
+
+def _get_signing_key(kid: str | None) -> PyJWK:
+    """Return the signing key for ``kid``, fetching inline only when unavoidable."""
+    age = time.monotonic() - _jwks_fetched_at
+    if not _jwks_keys:
+        with _jwks_lock:
+            if not _jwks_keys:
+                _fetch_jwks()
+    elif age >= _JWKS_REFRESH_AFTER:
+        _schedule_refresh()
+
+    key = _jwks_keys.get(kid) if kid else None
+    if key is None and time.monotonic() - _jwks_fetched_at >= _JWKS_MIN_REFETCH:
+        # Possibly a freshly rotated key — refetch once, then give up.
+        with _jwks_lock:
+            if kid not in _jwks_keys:
+                _fetch_jwks()
+        key = _jwks_keys.get(kid) if kid else None
+    if key is None:
+        raise pyjwt.PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+    return key
+
+
+# ── Verification ──────────────────────────────────────────
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _decode(token: str) -> dict:
+    """Verify a JWT using JWKS (ES256) or the shared secret (HS256)."""
+    header = pyjwt.get_unverified_header(token)
+    alg = header.get("alg", "HS256")
+
+    if alg == "HS256":
+        return pyjwt.decode(
+            token,
+            settings.supabase_jwt_secret,
+            algorithms=["HS256"],
+            audience="authenticated",
+        )
+
+    # For ES256+, look up the signing key from JWKS
+    try:
+        signing_key = _get_signing_key(header.get("kid"))
+    except pyjwt.PyJWKClientError as e:
+        raise pyjwt.InvalidTokenError(f"No matching JWKS key found: {e}") from e
+
+    return pyjwt.decode(
+        token,
+        signing_key.key,
+        algorithms=[alg],
+        audience="authenticated",
+    )
+
+
+def peek_claims(token: str) -> dict | None:
+    """Return already-verified claims for ``token`` without verifying anything."""
+    with _claims_lock:
+        return _claims.get(_token_key(token))
+
+
+def verify_token(token: str) -> dict:
+    """Return the verified claims for ``token``, from cache when possible.
+
+    Raises ``jwt.PyJWTError`` if the token is invalid or expired.
+    """
+    key = _token_key(token)
+    with _claims_lock:
+        claims = _claims.get(key)
+    if claims is not None:
+        _stats["claims_hits"] += 1
+        return claims
+
+    _stats["claims_misses"] += 1
+    claims = _decode(token)
+    with _claims_lock:
+        _claims[key] = claims
+    return claims
+
+
+def get_stats() -> dict:
+    """Cache counters plus current sizes and key-set age."""
+    return {
+        **_stats,
+        "cached_claims": len(_claims),
+        "jwks_keys": len(_jwks_keys),
+        "jwks_age_seconds": round(time.monotonic() - _jwks_fetched_at, 1) if _jwks_keys else None,
+    }
+
+
+def clear() -> None:
+    """Drop cached claims and keys and reset counters (tests)."""
+    global _jwks_keys, _jwks_fetched_at, _jwks_refreshing  # noqa: PLW0603
+    with _claims_lock:
+        _claims.clear()
+    with _jwks_lock:
+        _jwks_keys = {}
+        _jwks_fetched_at = 0
+        _jwks_refreshing = False
+    for key in _stats:
+        _stats[key] = 0
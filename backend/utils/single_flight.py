@@ -0,0 +1,151 @@
+"""Single-flight + stale-while-revalidate cache for expensive aggregate reads.
+
+The map, health and feed endpoints fan out to several tables and are polled
+by every open client — and all of them refresh at once when an epoch cycle
+resolves. ``SingleFlight.get(key, loader)`` guarantees:
+
+- concurrent callers for the same key share one in-flight ``loader()`` call;
+- a result younger than the TTL is returned directly;
+- a result past the TTL but within ``stale_factor`` × TTL is returned
+  immediately while one background task refreshes it;
+- only a missing (or too old) result makes callers wait on the loader.
+
+A failed background refresh keeps serving the last good value until it ages
+out of the stale window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_instances: weakref.WeakSet[SingleFlight] = weakref.WeakSet()
+
+
+class SingleFlight:
+    """Per-key shared computation with a fresh TTL and a stale-serving window."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: float | Callable[[], float],
+        stale_factor: float = 4,
+        maxsize: int = 64,
+    ) -> None:
+        self.name = name
+        self._ttl = ttl
+        self._stale_factor = stale_factor
+        self._maxsize = maxsize
+        self._values: dict[Hashable, tuple[Any, float]] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._refreshing: set[asyncio.Task] = set()
+        self._stats = {"fresh_hits": 0, "stale_hits": 0, "shared": 0, "loads": 0, "refresh_errors": 0}
+        _instances.add(self)
+
+    @property
+    def ttl(self) -> float:
+        """Fresh lifetime in seconds (callables are re-read on every lookup)."""
+        return self._ttl() if callable(self._ttl) else self._ttl
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the value for ``key``, calling ``loader`` at most once at a time."""
+        ttl = self.ttl
+        cached = self._values.get(key)
+        if cached is not None:
+            value, loaded_at = cached
+            age = time.monotonic() - loaded_at
+            if age < ttl:
+                self._stats["fresh_hits"] += 1
+                return value
+            if age < ttl * self._stale_factor:
+                self._stats["stale_hits"] += 1
+                if key not in self._inflight:
+                    future = self._begin(key)
+                    task = asyncio.create_task(self._refresh(key, future, loader))
+                    self._refreshing.add(task)
+                    task.add_done_callback(self._refreshing.discard)
+                return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats["shared"] += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The caller that started the load went away — load it ourselves.
+        return await self._run(key, self._begin(key), loader)
+
+    def _begin(self, key: Hashable) -> asyncio.Future:
+        """Register an in-flight load synchronously so no second one can start."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._stats["loads"] += 1
+        return future
+
+    async def _run(self, key: Hashable, future: asyncio.Future, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()  # Mark retrieved — waiters (if any) re-raise it themselves
+            raise
+        else:
+            future.set_result(value)
+            self._store(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _refresh(self, key: Hashable, future: asyncio.Future, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await self._run(key, future, loader)
+        except Exception:  # noqa: BLE001
+            self._stats["refresh_errors"] += 1
+            logger.warning("Background refresh failed", extra={"cache": self.name, "key": str(key)}, exc_info=True)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if key not in self._values and len(self._values) >= self._maxsize:
+            oldest = min(self._values, key=lambda k: self._values[k][1])
+            del self._values[oldest]
+        self._values[key] = (value, time.monotonic())
+
+    def peek(self, key: Hashable) -> Any | None:
+        """The cached value for ``key`` regardless of age, without loading (None if absent)."""
+        cached = self._values.get(key)
+        return cached[0] if cached is not None else None
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget one key's value (the next caller waits for a fresh load)."""
+        self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all values (in-flight loads still complete and are stored)."""
+        self._values.clear()
+
+    def get_stats(self) -> dict:
+        """Hit/load counters and the number of cached keys."""
+        return {**self._stats, "keys": len(self._values), "inflight": len(self._inflight)}
+
+
+def get_all_stats() -> dict[str, dict]:
+    """Stats for every live SingleFlight, keyed by name."""
+    return {flight.name: flight.get_stats() for flight in list(_instances)}
+
+
+def clear_all() -> None:
+    """Forget every cached value in every SingleFlight (tests)."""
+    for flight in list(_instances):
+        flight.clear()
@@ -0,0 +1,57 @@
+"""Server-sent event responses for incremental LLM output.
+
+Streaming endpoints turn a service's ``(event, data)`` async iterator into a
+``text/event-stream`` response: each item becomes one SSE event with a JSON
+``data`` line. The HTTP status is sent before the first token, so failures
+during the stream surface as a final ``error`` event (``{"status", "detail"}``)
+instead of an error response.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any
+
+from fastapi.sse import EventSourceResponse, format_sse_event
+
+logger = logging.getLogger(__name__)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx, Railway)
+}
+
+
+def sse_response(
+    events: AsyncGenerator[tuple[str, Any]],
+    *,
+    failure_detail: str,
+    unavailable: tuple[type[Exception], ...] = (),
+) -> EventSourceResponse:
+    """Stream ``events`` as SSE, ending with ``done`` or an ``error`` event.
+
+    Exceptions of an ``unavailable`` type end the stream with status 503 and
+    a generic "temporarily unavailable" detail; any other exception is logged
+    and reported with status 500 and ``failure_detail``.
+    """
+
+    async def encode() -> AsyncIterator[bytes]:
+        try:
+            async for event, data in events:
+                yield format_sse_event(event=event, data_str=json.dumps(data, default=str))
+        except unavailable as exc:
+            logger.warning("AI service unavailable during stream", extra={"error": str(exc)})
+            error = {"status": 503, "detail": "AI service temporarily unavailable."}
+        except Exception:
+            logger.exception("Streaming response failed")
+            error = {"status": 500, "detail": failure_detail}
+        else:
+            yield format_sse_event(event="done", data_str="{}")
+            return
+        finally:
+            await events.aclose()  # Client went away: stop relaying (chat replies finish detached)
+        yield format_sse_event(event="error", data_str=json.dumps(error))
+
+    return EventSourceResponse(encode(), headers=SSE_HEADERS)
@@ -0,0 +1,106 @@
+"""Process-wide Supabase clients sharing one keep-alive connection pool.
+
+``create_client()`` builds fresh httpx clients (and therefore fresh TCP/TLS
+connections) plus GoTrue session state every time it is called — roughly
+30ms of setup before the first byte of a query. Instead, every client handed
+out here is backed by a single shared ``httpx.Client``:
+
+- ``get_anon_client()``   — one shared anon-key client (public reads).
+- ``get_admin_client()``  — one shared service-role client (bypasses RLS).
+- ``get_user_client()``   — a cheap per-request view that injects the user's
+  JWT as the ``Authorization`` header so PostgREST applies their RLS policies.
+
+postgrest, storage3 and gotrue all send absolute URLs with per-request
+headers, so sharing the transport between differently-authenticated clients
+is safe. Never mutate ``options.headers`` or call ``auth.set_session`` on the
+shared anon/admin clients — that would leak into every other request.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import httpx
+from supabase.lib.client_options import DEFAULT_HEADERS, DEFAULT_POSTGREST_CLIENT_TIMEOUT, SyncClientOptions
+from supabase_auth import SyncMemoryStorage
+
+from backend.config import settings
+from supabase import Client
+
+_lock = threading.RLock()  # Re-entrant: getters hold it while _build_client() fetches the transport
+_http_client: httpx.Client | None = None
+_anon_client: Client | None = None
+_admin_client: Client | None = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared keep-alive transport, creating it on first use."""
+    global _http_client  # noqa: PLW0603
+    if _http_client is None:
+        with _lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+                    limits=httpx.Limits(
+                        max_connections=settings.db_max_concurrency * 2,
+                        max_keepalive_connections=settings.db_max_concurrency,
+                    ),
+                    follow_redirects=True,
+                    http2=True,
+                )
+    return _http_client
+
+
+def _build_client(key: str, authorization: str | None = None) -> Client:
+    """Construct a Client on the shared transport (no network I/O)."""
+    headers = dict(DEFAULT_HEADERS)
+    if authorization:
+        headers["Authorization"] = authorization
+    options = SyncClientOptions(
+        headers=headers,
+        httpx_client=_get_http_client(),
+        storage=SyncMemoryStorage(),
+        auto_refresh_token=False,
+        persist_session=False,
+    )
+    return Client(settings.supabase_url, key, options)
+
+
+def get_anon_client() -> Client:
+    """Shared anon-key client — anon RLS policies apply."""
+    global _anon_client  # noqa: PLW0603
+    if _anon_client is None:
+        with _lock:
+            if _anon_client is None:
+                _anon_client = _build_client(settings.supabase_anon_key)
+    return _anon_client
+
+
+def get_admin_client() -> Client:
+    """Shared service-role client — bypasses RLS. Use sparingly."""
+    global _admin_client  # noqa: PLW0603
+    if _admin_client is None:
+        with _lock:
+            if _admin_client is None:
+                _admin_client = _build_client(settings.supabase_service_role_key)
+    return _admin_client
+
+
+def get_user_client(access_token: str) -> Client:
+    """Per-request client scoped to the user's JWT, reusing the shared pool.
+
+    The token must already be verified (see ``get_current_user``); PostgREST
+    re-validates it on every request.
+    """
+    return _build_client(settings.supabase_anon_key, f"Bearer {access_token}")
+
+
+def reset() -> None:
+    """Drop all pooled clients (tests, or after a config change)."""
+    global _http_client, _anon_client, _admin_client  # noqa: PLW0603
+    with _lock:
+        if _http_client is not None:
+            _http_client.close()
+        _http_client = None
+        _anon_client = None
+        _admin_client = None
@@ -0,0 +1,42 @@
+"""Async token bucket shared by the outbound rate limiters (SMTP, LLM API)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, up to ``burst`` banked."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it (no-op when ``rate`` <= 0)."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def defer(self, seconds: float) -> None:
+        """Empty the bucket so the next token is handed out no sooner than ``seconds`` from now.
+
+        Used when the server asks callers to back off (``Retry-After``).
+        """
+        if self.rate <= 0 or seconds <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated) * self.rate, 1 - seconds * self.rate)
+        self._updated = now
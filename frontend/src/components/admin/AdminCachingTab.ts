@@ -46,6 +46,34 @@ function getSettingMeta(): Record<string, { label: string; description: string;
       description: msg('HTTP Cache-Control max-age for the public connections endpoint.'),
       unit: msg('seconds'),
     },
+    cache_membership_ttl: {
+      label: msg('Membership Cache TTL'),
+      description: msg(
+        'In-process TTL for simulation role and epoch participant checks. Role changes on this server apply immediately; other workers pick them up within this window.',
+      ),
+      unit: msg('seconds'),
+    },
+    cache_ai_config_ttl: {
+      label: msg('AI Config Cache TTL'),
+      description: msg(
+        'In-process TTL for resolved prompt templates, content locale and AI model settings. Template and setting edits on this server apply immediately; other workers pick them up within this window.',
+      ),
+      unit: msg('seconds'),
+    },
+    cache_public_simulations_ttl: {
+      label: msg('Public Simulations Cache TTL'),
+      description: msg(
+        'Server-side cache for the public simulation list and detail pages. Edits on this server invalidate it immediately.',
+      ),
+      unit: msg('seconds'),
+    },
+    cache_public_entities_ttl: {
+      label: msg('Public Entities Cache TTL'),
+      description: msg(
+        'Server-side cache for public agent, building, event and lore pages. Edits on this server invalidate it immediately.',
+      ),
+      unit: msg('seconds'),
+    },
   };
 }
 
@@ -57,6 +85,10 @@ const DEFAULTS: Record<string, number> = {
   cache_http_map_data_max_age: 15,
   cache_http_battle_feed_max_age: 10,
   cache_http_connections_max_age: 60,
+  cache_membership_ttl: 30,
+  cache_ai_config_ttl: 300,
+  cache_public_simulations_ttl: 30,
+  cache_public_entities_ttl: 30,
 };
 
 @localized()
@@ -95,6 +95,7 @@ export class VelgEpochBattleLog extends LitElement {
     .entry--counter_intel::before           { background: var(--color-info); }
     .entry--intel_report::before            { background: var(--color-info); }
     .entry--zone_fortified::before          { background: var(--color-warning); }
+    .entry--fortification_expired::before   { background: var(--color-gray-500); }
 
     .entry__intel-fort {
       margin-top: 4px;
@@ -354,6 +355,7 @@ export class VelgEpochBattleLog extends LitElement {
       counter_intel: msg('Counter-Intel'),
       intel_report: msg('Intel Report'),
       zone_fortified: msg('Fortified'),
+      fortification_expired: msg('Fortification Expired'),
     };
     return labels[type] || type;
   }
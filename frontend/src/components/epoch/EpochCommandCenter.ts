@@ -2360,15 +2360,22 @@ export class VelgEpochCommandCenter extends LitElement {
   private async _onResolveCycle() {
     if (!this._epoch) return;
     this._actionLoading = true;
-    const result = await epochsApi.resolveCycle(this._epoch.id);
+    const epochId = this._epoch.id;
+    const started = await epochsApi.resolveCycle(epochId);
+    if (!started.success || !started.data) {
+      this._actionLoading = false;
+      VelgToast.error(msg('Failed to resolve cycle.'));
+      return;
+    }
+    // Resolution (missions, bots, scoring, notifications) runs as a background job
+    const cycle = started.data.cycle_number;
+    const result = await epochsApi.waitForCycleResolution(epochId, cycle);
     this._actionLoading = false;
-    if (!result.success) {
+    if (!result.success || result.data?.status !== 'succeeded') {
       VelgToast.error(msg('Failed to resolve cycle.'));
       return;
     }
-    // Backend now handles bots + scoring + notifications in resolve_cycle_full()
-    const newCycle = (result.data as Epoch)?.current_cycle ?? 0;
-    realtimeService.broadcastCycleResolved(this._epoch.id, newCycle);
+    realtimeService.broadcastCycleResolved(epochId, cycle + 1);
     VelgToast.success(msg('Cycle resolved.'));
   }
 
@@ -13,6 +13,7 @@ import { effect } from '@preact/signals-core';
 import { css, html, LitElement, nothing } from 'lit';
 import { customElement, property, state } from 'lit/decorators.js';
 import { epochChatApi } from '../../services/api/EpochChatApiService.js';
+import { epochsApi } from '../../services/api/EpochsApiService.js';
 import { realtimeService } from '../../services/realtime/RealtimeService.js';
 import type { EpochParticipant } from '../../types/index.js';
 import { VelgToast } from '../shared/Toast.js';
@@ -282,7 +283,9 @@ export class VelgEpochReadyPanel extends LitElement {
       };
 
       // Handle auto-resolve: backend resolved the cycle because all humans were ready
-      const data = result.data as { auto_resolved?: boolean; new_cycle?: number } | undefined;
+      const data = result.data as
+        | { auto_resolved?: boolean; new_cycle?: number; resolution_cycle?: number }
+        | undefined;
       if (data?.auto_resolved) {
         const newCycle = data.new_cycle ?? 0;
         // Reset all ready states immediately — backend already set cycle_ready=false
@@ -291,6 +294,10 @@ export class VelgEpochReadyPanel extends LitElement {
           resetStates[p.simulation_id] = false;
         }
         realtimeService.readyStates.value = resetStates;
+        // The cycle resolves in a background job — wait for it before announcing
+        if (data.resolution_cycle !== undefined) {
+          await epochsApi.waitForCycleResolution(this.epochId, data.resolution_cycle);
+        }
         realtimeService.broadcastCycleResolved(this.epochId, newCycle);
         VelgToast.success(msg('All players ready. Cycle resolved automatically.'));
         this._triggerSweep();
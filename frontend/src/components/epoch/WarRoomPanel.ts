@@ -25,6 +25,7 @@ const EVENT_COLORS: Record<string, string> = {
   agent_wounded: 'var(--color-danger)',
   rp_allocated: 'var(--color-gray-500)',
   zone_fortified: 'var(--color-warning)',
+  fortification_expired: 'var(--color-gray-500)',
 };
 
 const PHASE_COLORS: Record<string, string> = {
@@ -1293,6 +1293,7 @@ Deshalb können die Splitter nicht einfach wieder zusammengesetzt werden. Man ka
 's6a579a70eb9cf7f1': `Gewinnraten pro Spieleranzahl, 95% Bootstrap-Konfidenzintervalle und Wettbewerbsprofil für jede Simulation. Theoretisch faire Raten: 50% (2S), 33% (3S), 25% (4S), 20% (5S).`,
 's6a682477e9b4e878': `Wettbewerb`,
 's6a853a91f8414e27': `Visuelle Identität kalibrieren`,
+'s6aba2e33afad016d': `Befestigung abgelaufen`,
 's6ad18884980fd957': `z. B. „Machen Sie diesen Charakter nihilistischer und erwähnen Sie eine geheime Besessenheit mit Uhren."`,
 's6afa0cbb4e824e55': `Signal wird erwartet`,
 's6b026dc46da528f2': `Zonengrenzen kartieren`,
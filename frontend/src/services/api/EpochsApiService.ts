@@ -6,6 +6,7 @@ import type {
   ApiResponse,
   BattleLogEntry,
   BattleSummary,
+  CycleResolutionJob,
   Epoch,
   EpochInvitation,
   EpochInvitationPublicInfo,
@@ -14,6 +15,7 @@ import type {
   EpochTeam,
   LeaderboardEntry,
   OperativeMission,
+  OperativeProbabilityPreview,
   Sitrep,
 } from '../../types/index.js';
 import { appState } from '../AppStateManager.js';
@@ -73,10 +75,32 @@ export class EpochsApiService extends BaseApiService {
     return this.delete(`/epochs/${epochId}`);
   }
 
-  resolveCycle(epochId: string): Promise<ApiResponse<Epoch>> {
+  /** Starts resolving the current cycle in the background; returns the job. */
+  resolveCycle(epochId: string): Promise<ApiResponse<CycleResolutionJob>> {
     return this.post(`/epochs/${epochId}/resolve-cycle`);
   }
 
+  getCycleResolution(epochId: string, cycleNumber: number): Promise<ApiResponse<CycleResolutionJob>> {
+    return this.get(`/epochs/${epochId}/cycles/${cycleNumber}/resolution`);
+  }
+
+  /** Polls a cycle's resolution job until it succeeds or fails (or the timeout passes). */
+  async waitForCycleResolution(
+    epochId: string,
+    cycleNumber: number,
+    { intervalMs = 1000, timeoutMs = 120_000 } = {},
+  ): Promise<ApiResponse<CycleResolutionJob>> {
+    const deadline = Date.now() + timeoutMs;
+    for (;;) {
+      const result = await this.getCycleResolution(epochId, cycleNumber);
+      const status = result.data?.status;
+      if (!result.success || status === 'succeeded' || status === 'failed' || Date.now() >= deadline) {
+        return result;
+      }
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+  }
+
   resolveOperatives(epochId: string): Promise<ApiResponse<unknown>> {
     return this.post(`/epochs/${epochId}/operatives/resolve`);
   }
@@ -164,6 +188,17 @@ export class EpochsApiService extends BaseApiService {
     return this.post(`/epochs/${epochId}/operatives?simulation_id=${simulationId}`, data);
   }
 
+  previewProbabilities(
+    epochId: string,
+    simulationId: string,
+    operativeType: string,
+  ): Promise<ApiResponse<OperativeProbabilityPreview[]>> {
+    return this.get(`/epochs/${epochId}/operatives/preview`, {
+      simulation_id: simulationId,
+      operative_type: operativeType,
+    });
+  }
+
   recallOperative(
     epochId: string,
     missionId: string,
@@ -1038,7 +1038,8 @@ export type BattleLogEventType =
   | 'agent_wounded'
   | 'counter_intel'
   | 'intel_report'
-  | 'zone_fortified';
+  | 'zone_fortified'
+  | 'fortification_expired';
 
 export interface EpochScoreWeights {
   stability: number;
@@ -1080,6 +1081,32 @@ export interface Epoch {
   updated_at: string;
 }
 
+export type CycleResolutionStatus = 'queued' | 'running' | 'succeeded' | 'failed';
+
+export interface CycleResolutionStage {
+  name: string;
+  status: 'pending' | 'running' | 'succeeded' | 'failed' | 'skipped';
+  started_at?: string;
+  duration_ms?: number;
+  error?: string;
+}
+
+/** Background cycle resolution job — `cycle_number` is the cycle being resolved. */
+export interface CycleResolutionJob {
+  id: UUID;
+  epoch_id: UUID;
+  cycle_number: number;
+  status: CycleResolutionStatus;
+  stage?: string;
+  stages: CycleResolutionStage[];
+  error?: string;
+  attempts: number;
+  created_at: string;
+  started_at?: string;
+  finished_at?: string;
+  updated_at: string;
+}
+
 export interface EpochInvitation {
   id: UUID;
   epoch_id: UUID;
@@ -1177,6 +1204,16 @@ export interface OperativeMission {
   target_sim?: { name: string };
 }
 
+export interface OperativeProbabilityPreview {
+  agent_id: UUID;
+  agent_name?: string;
+  operative_type: OperativeType;
+  target_simulation_id?: UUID;
+  embassy_id?: UUID;
+  aptitude: number;
+  success_probability: number;
+}
+
 export interface LeaderboardEntry {
   rank: number;
   simulation_id: UUID;
@@ -35,6 +35,7 @@ const BATTLE_EVENT_ICON_MAP: Record<string, IconFn> = {
   counter_intel: icons.radar,
   intel_report: icons.clipboard,
   zone_fortified: icons.operativeGuardian,
+  fortification_expired: icons.operativeGuardian,
 };
 
 /** Get SVG icon for an operative type. */
@@ -0,0 +1,163 @@
+"""
+Columnar results store for epoch simulation batteries.
+======================================================
+Turns battery results (the ``ALL_GAME_RESULTS`` format of epoch_sim_lib)
+into four flat tables and writes them as one file per table per battery:
+
+    <dataset>/games/<battery>.parquet               one row per game
+    <dataset>/participants/<battery>.parquet        one row per game × player (final standing)
+    <dataset>/participant_cycles/<battery>.parquet  one row per game × player × scored cycle
+    <dataset>/missions/<battery>.parquet            one row per deployed operative
+
+Parquet needs pyarrow; without it the same tables are written as CSV, so
+the simulation runners work on a bare interpreter. ``load_dataset`` reads
+either format back into pandas DataFrames (analysis venv).
+
+Battery runners call ``write_dataset``; epoch_statistical_analysis.py loads
+the dataset directly instead of parsing the markdown report.
+"""
+
+import csv
+import os
+from pathlib import Path
+
+TABLES = ("games", "participants", "participant_cycles", "missions")
+DIMENSIONS = ["stability", "influence", "sovereignty", "diplomatic", "military"]
+STAT_KEYS = ["deployed", "success", "detected", "failed", "guardians", "ci_sweeps", "rp_spent"]
+
+SIM_NAMES = {
+    "V": "Velgarien",
+    "GR": "The Gaslit Reach",
+    "SN": "Station Null",
+    "SP": "Speranza",
+    "NM": "Nova Meridian",
+}
+
+
+def _tag_for(entry, tags):
+    name = entry.get("simulation_name", "")
+    return next((t for t in tags if SIM_NAMES.get(t, t) in name), None)
+
+
+def build_tables(results, player_count, battery):
+    """Flatten battery results into {table: [row, ...]}."""
+    tables = {name: [] for name in TABLES}
+    for game_num, g in enumerate(results, 1):
+        tags = g.get("tags", [])
+        game_def = g.get("game_def") or {}
+        config = game_def.get("config") or {}
+        weights = config.get("score_weights") or {}
+        key = {"battery": battery, "player_count": player_count, "game_num": game_num}
+
+        board = g.get("leaderboard") or []
+        standing = {_tag_for(e, tags): e for e in board}
+        winner = _tag_for(board[0], tags) if board else None
+        runner_up = _tag_for(board[1], tags) if len(board) > 1 else None
+        alliances = game_def.get("alliances") or {}
+
+        tables["games"].append({
+            **key,
+            "name": g.get("name"),
+            "seed": g.get("seed"),
+            "players": "+".join(tags),
+            "rp_per_cycle": config.get("rp_per_cycle"),
+            "rp_cap": config.get("rp_cap"),
+            "foundation_pct": config.get("foundation_pct"),
+            "reckoning_pct": config.get("reckoning_pct"),
+            "max_team_size": config.get("max_team_size"),
+            "allow_betrayal": config.get("allow_betrayal"),
+            **{f"w_{d}": weights.get(d) for d in DIMENSIONS},
+            "alliance": "+".join(next(iter(alliances.values()), [])),
+            "foundation_cycles": game_def.get("foundation_cycles"),
+            "comp_end": game_def.get("comp_end"),
+            "reck_end": game_def.get("reck_end"),
+            "winner": winner,
+            "winner_score": board[0].get("composite") if board else None,
+            "runner_up": runner_up,
+            "runner_up_score": board[1].get("composite") if len(board) > 1 else None,
+            "margin": board[0].get("composite", 0) - board[1].get("composite", 0) if len(board) > 1 else None,
+        })
+
+        stats = g.get("stats") or {}
+        for tag in tags:
+            entry = standing.get(tag) or {}
+            tables["participants"].append({
+                **key,
+                "tag": tag,
+                "simulation": SIM_NAMES.get(tag, tag),
+                "strategy": (game_def.get("strategies") or {}).get(tag),
+                "guardian_target": (game_def.get("guardian_counts") or {}).get(tag),
+                "ci_freq": (game_def.get("ci_freq") or {}).get(tag),
+                "rank": entry.get("rank"),
+                "won": tag == winner,
+                "composite": entry.get("composite"),
+                **{d: entry.get(d) for d in DIMENSIONS},
+                **{s: (stats.get(s) or {}).get(tag, 0) for s in STAT_KEYS},
+            })
+            for cycle, scores in (g.get("scores") or {}).get(tag, []):
+                tables["participant_cycles"].append({
+                    **key,
+                    "tag": tag,
+                    "cycle": cycle,
+                    "composite": scores.get("composite"),
+                    **{d: scores.get(d) for d in DIMENSIONS},
+                })
+
+        for m in g.get("missions") or []:
+            tables["missions"].append({**key, **m})
+    return tables
+
+
+def _write_parquet(rows, path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pq.write_table(pa.Table.from_pylist(rows), path)
+
+
+def _write_csv(rows, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_dataset(results, dataset_dir, player_count, battery):
+    """Write one file per table for this battery; replaces an earlier run of the same battery."""
+    try:
+        import pyarrow as pa  # noqa: F401
+        writer, suffix = _write_parquet, ".parquet"
+    except ImportError:
+        writer, suffix = _write_csv, ".csv"
+
+    written = {}
+    for table, rows in build_tables(results, player_count, battery).items():
+        directory = Path(dataset_dir) / table
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in directory.glob(f"{battery}.*"):
+            stale.unlink()
+        if not rows:
+            continue
+        path = directory / f"{battery}{suffix}"
+        tmp = path.with_name(path.name + ".tmp")
+        writer(rows, tmp)
+        os.replace(tmp, path)
+        written[table] = path
+    print(f"Dataset written to: {dataset_dir} ({len(results)} games, {suffix[1:]})")
+    return written
+
+
+def load_dataset(dataset_dir):
+    """Load every battery in a dataset directory as {table: DataFrame}."""
+    import pandas as pd
+
+    frames = {}
+    for table in TABLES:
+        parts = []
+        for path in sorted((Path(dataset_dir) / table).glob("*")):
+            if path.suffix == ".parquet":
+                parts.append(pd.read_parquet(path))
+            elif path.suffix == ".csv":
+                parts.append(pd.read_csv(path))
+        frames[table] = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    return frames
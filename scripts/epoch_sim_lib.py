@@ -15,6 +15,7 @@ import time
 from collections import defaultdict
 
 import httpx
+from epoch_results_store import write_dataset
 
 BASE = "http://localhost:8000"
 AUTH_URL = "http://127.0.0.1:54321/auth/v1"
@@ -1016,8 +1017,10 @@ def run_parametric_game(token, game_def):
     run_competition(epoch_id, players, admin, last + 1, comp_end, strategy_fn)
     run_reckoning(epoch_id, players, admin, comp_end + 1, reck_end, strategy_fn)
 
-    return finish_game(epoch_id, admin, players, game_def["name"],
-                       game_def["desc"], tags)
+    result = finish_game(epoch_id, admin, players, game_def["name"],
+                         game_def["desc"], tags)
+    result["game_def"] = game_def
+    return result
 
 
 # ── Analysis Generation ──
@@ -1358,11 +1361,14 @@ def _load_checkpoint(md_path):
         return None
 
 
-def run_parametric_battery(title, player_count, num_games, all_tags, log_path, md_path, seed=42, batch_size=15):
+def run_parametric_battery(title, player_count, num_games, all_tags, log_path, md_path, seed=42, batch_size=15,
+                           dataset_dir=None):
     """Generate and run N parametric games in batches to avoid macOS port exhaustion.
 
     Saves a checkpoint after every game so that a crashed run can be resumed.
-    Writes incremental analysis at every batch boundary.
+    Writes incremental analysis at every batch boundary, and the columnar
+    dataset (epoch_results_store) at the end — by default to
+    ``epoch-dataset/`` next to the analysis file.
     """
     global LOG, ALL_GAME_RESULTS, _http_client
 
@@ -1456,6 +1462,8 @@ def run_parametric_battery(title, player_count, num_games, all_tags, log_path, m
         f.write("\n".join(LOG))
 
     generate_analysis(md_path, title, player_count, include_actions=False)
+    write_dataset(ALL_GAME_RESULTS, dataset_dir or os.path.join(os.path.dirname(md_path), "epoch-dataset"),
+                  player_count, os.path.basename(md_path).replace("-analysis.md", ""))
 
     # Clean up checkpoint on successful completion
     cp = _checkpoint_path(md_path)
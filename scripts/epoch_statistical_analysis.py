@@ -1,14 +1,18 @@
 """
 Epoch Statistical Analysis — Deep Dive
 =======================================
-Parses the 4 per-player-count analysis markdown files, runs statistical
+Loads the battery results dataset (epoch_results_store — falls back to
+parsing the 4 per-player-count analysis markdown files), runs statistical
 tests, computes Elo ratings, PCA, logistic regression, strategy Nash
-equilibrium, and generates publication-quality visualizations.
+equilibrium, and generates publication-quality visualizations. Elo,
+head-to-head and bootstrap tallies run on epoch_stats_engine's arrays;
+--incremental keeps them in a state file and only folds in new games.
 
-Run: scripts/.analysis-venv/bin/python scripts/epoch_statistical_analysis.py
+Run: scripts/.analysis-venv/bin/python scripts/epoch_statistical_analysis.py [--dataset DIR] [--incremental [STATE]]
 Output: /tmp/epoch-analysis/ (charts + statistical-supplement.md)
 """
 
+import argparse
 import os
 import re
 from collections import defaultdict
@@ -21,6 +25,8 @@ import nashpy as nash
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from epoch_results_store import load_dataset
+from epoch_stats_engine import StatsEngine, strategy_frame, wilson_interval
 from scipy import stats
 from sklearn.decomposition import PCA
 from sklearn.linear_model import LogisticRegression
@@ -159,8 +165,76 @@ def parse_analysis_file(filepath, player_count):
     }
 
 
-def load_all_data():
+def dataset_to_analysis_data(frames):
+    """Build the per-player-count analysis structure from the columnar dataset.
+
+    Same shape as ``parse_analysis_file`` returns, computed from the full
+    per-game and per-participant tables instead of the rounded markdown.
+    """
+    games, parts = frames["games"], frames["participants"]
+    dims = ["stability", "influence", "sovereignty", "diplomatic", "military"]
+    data = {}
+    for pc, g_pc in games.groupby("player_count"):
+        # Like the markdown summary: games need a winner and a runner-up
+        valid = g_pc[g_pc["runner_up"].notna()]
+        key = ["battery", "game_num"]
+        p_pc = parts.merge(valid[key], on=key)
+
+        game_rows = []
+        for g in valid.itertuples(index=False):
+            tags = g.players.split("+")
+            game_rows.append({
+                "battery": g.battery,
+                "game_num": int(g.game_num),
+                "player_count": int(pc),
+                "players": [SIM_TAGS.get(t, t) for t in tags],
+                "player_tags": tags,
+                **{f"w_{d}": int(getattr(g, f"w_{d}")) for d in dims},
+                "winner": SIM_TAGS.get(g.winner, g.winner),
+                "winner_score": float(g.winner_score),
+                "runner_up": SIM_TAGS.get(g.runner_up, g.runner_up),
+                "runner_up_score": float(g.runner_up_score),
+                "margin": float(g.margin),
+            })
+
+        by_strategy = p_pc.groupby("strategy")["won"].agg(["count", "sum"])
+        by_guardians = p_pc.groupby("guardians").agg(
+            games=("won", "count"), wins=("won", "sum"),
+            success=("success", "sum"), detected=("detected", "sum"), failed=("failed", "sum"),
+        )
+        ops = by_guardians["success"] + by_guardians["detected"] + by_guardians["failed"]
+        by_sim = p_pc.groupby("simulation")[["composite", *dims]].mean()
+
+        data[int(pc)] = {
+            "games": game_rows,
+            "strategies": {
+                strat: {"appearances": int(row["count"]), "wins": int(row["sum"]),
+                        "win_rate": row["sum"] / row["count"]}
+                for strat, row in by_strategy.iterrows()
+            },
+            "guardians": {
+                int(gc): {"games": int(row.games), "wins": int(row.wins), "win_rate": row.wins / row.games,
+                          "ops_success_rate": row.success / ops[gc] if ops[gc] else 0.0}
+                for gc, row in by_guardians.iterrows()
+            },
+            "dimensions": {
+                d: {"mean": p_pc[d].mean(), "std": p_pc[d].std(ddof=0),
+                    "min": p_pc[d].min(), "max": p_pc[d].max()}
+                for d in dims
+            },
+            "avg_scores": by_sim.to_dict(orient="index"),
+            "player_count": int(pc),
+        }
+    return data
+
+
+def load_all_data(dataset_dir=None):
+    """Load battery results — the columnar dataset if present, else the markdown reports."""
     base = Path("/Users/mleihs/Dev/velgarien-rebuild")
+    dataset_dir = Path(dataset_dir) if dataset_dir else base / "epoch-dataset"
+    if (dataset_dir / "games").is_dir():
+        return dataset_to_analysis_data(load_dataset(dataset_dir))
+
     data = {}
     for pc, fname in [(2, "epoch-2p-analysis.md"), (3, "epoch-3p-analysis.md"),
                        (4, "epoch-4p-analysis.md"), (5, "epoch-5p-analysis.md")]:
@@ -172,37 +246,18 @@ def load_all_data():
 # 2. ELO RATINGS
 # ═══════════════════════════════════════════════════════════════════════
 
-def compute_elo(all_data, k=32, initial=1500):
+def compute_elo(all_data, k=32, initial=1500, engine=None):
     """Compute Elo ratings from all game outcomes.
 
     For N-player games, we treat each game as (N-1) pairwise matchups:
     winner beats each loser. This gives proper credit for winning against
-    multiple opponents.
+    multiple opponents. ``engine`` carries ratings over from earlier runs
+    (``--incremental``); only games it has not seen are rated.
     """
-    elo = {name: initial for name in SIM_TAGS.values()}
-    history = {name: [initial] for name in SIM_TAGS.values()}
-    game_labels = []
-
-    for pc in [2, 3, 4, 5]:
-        for game in all_data[pc]["games"]:
-            winner = game["winner"]
-            losers = [p for p in game["players"] if p != winner]
-
-            for loser in losers:
-                # Expected scores
-                e_w = 1 / (1 + 10 ** ((elo[loser] - elo[winner]) / 400))
-                e_l = 1 - e_w
-
-                # Update (scale K by 1/num_losers to avoid inflation in multi-player)
-                k_scaled = k / len(losers)
-                elo[winner] += k_scaled * (1 - e_w)
-                elo[loser] += k_scaled * (0 - e_l)
-
-            for name in SIM_TAGS.values():
-                history[name].append(elo[name])
-            game_labels.append(f"{pc}P-G{game['game_num']}")
-
-    return elo, history, game_labels
+    if engine is None:
+        engine = StatsEngine(SIM_TAGS.values(), k=k, initial=initial)
+    engine.update(all_data)
+    return engine.elo_ratings()
 
 
 def plot_elo(elo, history, game_labels):
@@ -517,63 +572,36 @@ STRATEGY_ORDER = ["ci_defensive", "propagandist", "spy_heavy", "random_mix",
 def strategy_analysis(all_data):
     """Build strategy effectiveness matrix and compute Nash equilibrium."""
     # Aggregate strategy data across player counts
-    strat_data = defaultdict(lambda: {"appearances": 0, "wins": 0})
-    strat_by_pc = {}
-
-    for pc in [2, 3, 4, 5]:
-        strat_by_pc[pc] = {}
-        for strat, data in all_data[pc]["strategies"].items():
-            strat_data[strat]["appearances"] += data["appearances"]
-            strat_data[strat]["wins"] += data["wins"]
-            strat_by_pc[pc][strat] = data
+    counts = strategy_frame(all_data, STRATEGY_ORDER)
+    played = counts[counts["appearances"] > 0]
+    strat_data = {strat: {"appearances": int(row.appearances), "wins": int(row.wins)}
+                  for strat, row in played.iterrows()}
 
     # Strategy win rate heatmap
     fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(20, 7),
                                          gridspec_kw={"width_ratios": [2, 1.5, 1.5]})
 
     # Heatmap: strategy × player_count → win rate
-    heat_data = []
-    for strat in STRATEGY_ORDER:
-        row = {}
-        for pc in [2, 3, 4, 5]:
-            if strat in strat_by_pc[pc]:
-                row[f"{pc}P"] = strat_by_pc[pc][strat]["win_rate"] * 100
-            else:
-                row[f"{pc}P"] = np.nan
-        # Combined
-        if strat in strat_data and strat_data[strat]["appearances"] > 0:
-            row["ALL"] = strat_data[strat]["wins"] / strat_data[strat]["appearances"] * 100
-        else:
-            row["ALL"] = np.nan
-        heat_data.append(row)
-
-    heat_df = pd.DataFrame(heat_data, index=STRATEGY_ORDER)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        heat = {f"{pc}P": counts[f"wins_{pc}P"] / counts[f"apps_{pc}P"] * 100 for pc in [2, 3, 4, 5]}
+        heat["ALL"] = counts["wins"] / counts["appearances"] * 100
+    heat_df = pd.DataFrame(heat, index=STRATEGY_ORDER)
     sns.heatmap(heat_df, annot=True, fmt=".0f", cmap="RdYlGn", center=25,
                 vmin=0, vmax=100, ax=ax1, linewidths=0.5, linecolor="#30363d")
     ax1.set_title("STRATEGY WIN RATE (%) BY PLAYER COUNT", fontweight="bold")
     ax1.set_ylabel("")
 
-    # Bar chart: combined win rates with confidence intervals
-    combined = []
-    for strat in STRATEGY_ORDER:
-        if strat in strat_data:
-            n = strat_data[strat]["appearances"]
-            w = strat_data[strat]["wins"]
-            p = w / n if n > 0 else 0
-            # Wilson score interval
-            z = 1.96
-            denom = 1 + z**2 / n
-            center = (p + z**2 / (2 * n)) / denom
-            margin = z * np.sqrt((p * (1 - p) + z**2 / (4 * n)) / n) / denom
-            combined.append({
-                "strategy": strat,
-                "win_rate": p * 100,
-                "ci_low": max(0, (center - margin) * 100),
-                "ci_high": min(100, (center + margin) * 100),
-                "n": n,
-            })
+    # Bar chart: combined win rates with confidence intervals (Wilson score interval)
+    rate, low, high = wilson_interval(played["wins"], played["appearances"])
+    comb_df = pd.DataFrame({
+        "strategy": played.index,
+        "win_rate": rate * 100,
+        "ci_low": low * 100,
+        "ci_high": high * 100,
+        "n": played["appearances"].astype(int).to_numpy(),
+    })
+    combined = comb_df.to_dict(orient="records")
 
-    comb_df = pd.DataFrame(combined)
     colors = ["#27ae60" if r > 30 else "#d4a017" if r > 15 else "#c0392b"
               for r in comb_df["win_rate"]]
     bars = ax2.barh(range(len(comb_df)), comb_df["win_rate"], color=colors, alpha=0.8)
@@ -594,21 +622,10 @@ def strategy_analysis(all_data):
     # Payoff of strategy i vs strategy j = (win_rate_i - win_rate_j) / 2 + 0.5
     # This is an approximation since we don't have true pairwise matchup data.
     n_strats = len(STRATEGY_ORDER)
-    payoff = np.zeros((n_strats, n_strats))
-    win_rates = {}
-    for strat in STRATEGY_ORDER:
-        if strat in strat_data and strat_data[strat]["appearances"] > 0:
-            win_rates[strat] = strat_data[strat]["wins"] / strat_data[strat]["appearances"]
-        else:
-            win_rates[strat] = 0
-
-    for i, si in enumerate(STRATEGY_ORDER):
-        for j, sj in enumerate(STRATEGY_ORDER):
-            if i == j:
-                payoff[i, j] = 0.5  # mirror match
-            else:
-                # Higher win rate → higher expected payoff
-                payoff[i, j] = 0.5 + (win_rates[si] - win_rates[sj]) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        win_rates = np.where(counts["appearances"] > 0, counts["wins"] / counts["appearances"], 0.0)
+    # Higher win rate → higher expected payoff; mirror matches are even
+    payoff = 0.5 + (win_rates[:, None] - win_rates[None, :]) / 2
 
     game = nash.Game(payoff, 1 - payoff)
     try:
@@ -769,29 +786,13 @@ def score_distributions(all_data):
 # 9. SIMULATION HEAD-TO-HEAD MATRIX (2P data)
 # ═══════════════════════════════════════════════════════════════════════
 
-def head_to_head(all_data):
+def head_to_head(all_data, engine=None):
     """Build head-to-head matrix from 2P games."""
-    sims_2p = sorted(set(s for g in all_data[2]["games"] for s in g["players"]))
-    h2h = defaultdict(lambda: defaultdict(lambda: {"wins": 0, "games": 0}))
-
-    for game in all_data[2]["games"]:
-        a, b = game["players"]
-        h2h[a][b]["games"] += 1
-        h2h[b][a]["games"] += 1
-        winner = game["winner"]
-        loser = a if winner == b else b
-        h2h[winner][loser]["wins"] += 1
-
-    # Build matrix
-    matrix = pd.DataFrame(index=sims_2p, columns=sims_2p, dtype=float)
-    for a in sims_2p:
-        for b in sims_2p:
-            if a == b:
-                matrix.loc[a, b] = np.nan
-            elif h2h[a][b]["games"] > 0:
-                matrix.loc[a, b] = h2h[a][b]["wins"] / h2h[a][b]["games"] * 100
-            else:
-                matrix.loc[a, b] = np.nan
+    if engine is None:
+        engine = StatsEngine(SIM_TAGS.values())
+    engine.update(all_data)
+    matrix, games = engine.head_to_head()
+    sims_2p = list(matrix.index)
 
     fig, ax = plt.subplots(figsize=(8, 6))
     short_names = [s.split()[0] for s in sims_2p]
@@ -804,8 +805,8 @@ def head_to_head(all_data):
     # Add game counts as secondary annotation
     for i, a in enumerate(sims_2p):
         for j, b in enumerate(sims_2p):
-            if a != b and h2h[a][b]["games"] > 0:
-                ax.text(j + 0.5, i + 0.75, f"n={h2h[a][b]['games']}",
+            if a != b and games.loc[a, b] > 0:
+                ax.text(j + 0.5, i + 0.75, f"n={games.loc[a, b]}",
                         ha="center", va="center", fontsize=7, color="#8b949e")
 
     plt.tight_layout()
@@ -884,29 +885,12 @@ def dimension_impact(all_data):
 # 11. BOOTSTRAP CONFIDENCE INTERVALS
 # ═══════════════════════════════════════════════════════════════════════
 
-def bootstrap_ci(all_data, n_bootstrap=10000):
+def bootstrap_ci(all_data, n_bootstrap=10000, engine=None):
     """Bootstrap 95% confidence intervals for simulation win rates."""
-    # Build outcome array: for each sim, list of 1 (win) / 0 (loss) per game
-    outcomes = defaultdict(list)
-    for pc in [2, 3, 4, 5]:
-        for game in all_data[pc]["games"]:
-            for p in game["players"]:
-                outcomes[p].append(1 if p == game["winner"] else 0)
-
-    cis = {}
-    for sim, results in sorted(outcomes.items()):
-        results = np.array(results)
-        boot_means = np.array([
-            np.mean(np.random.choice(results, size=len(results), replace=True))
-            for _ in range(n_bootstrap)
-        ])
-        ci_low, ci_high = np.percentile(boot_means, [2.5, 97.5])
-        cis[sim] = {
-            "mean": np.mean(results),
-            "ci_low": ci_low,
-            "ci_high": ci_high,
-            "n": len(results),
-        }
+    if engine is None:
+        engine = StatsEngine(SIM_TAGS.values())
+    engine.update(all_data)
+    cis = engine.bootstrap_ci(n_bootstrap)
 
     # Plot
     fig, ax = plt.subplots(figsize=(10, 5))
@@ -1134,18 +1118,26 @@ def generate_supplement(elo_results, chi_results, pairwise, per_pc_chi,
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════
 
-def main():
+def main(dataset_dir=None, state_path=None):
     print("=" * 60)
     print("EPOCH STATISTICAL ANALYSIS — v2.1 (200 games)")
     print("=" * 60)
 
     print("\n1. Loading data...")
-    all_data = load_all_data()
+    all_data = load_all_data(dataset_dir)
     total_games = sum(len(d["games"]) for d in all_data.values())
-    print(f"   Parsed {total_games} valid games from 4 analysis files")
+    print(f"   Loaded {total_games} valid games across {len(all_data)} player counts")
+
+    # Win / head-to-head / Elo tallies; with a state file only new games are folded in
+    sims = list(SIM_TAGS.values())
+    engine = StatsEngine.load(state_path, sims) if state_path else StatsEngine(sims)
+    new_games = engine.update(all_data)
+    if state_path:
+        engine.save(state_path)
+        print(f"   Incremental: {new_games} new games, {len(engine.seen)} in {state_path}")
 
     print("\n2. Computing Elo ratings...")
-    elo, history, labels = compute_elo(all_data)
+    elo, history, labels = compute_elo(all_data, engine=engine)
     sorted_elo = plot_elo(elo, history, labels)
     for name, rating in sorted_elo:
         print(f"   {name}: {rating:.0f}")
@@ -1182,13 +1174,13 @@ def main():
     score_distributions(all_data)
 
     print("\n9. Head-to-head matrix...")
-    h2h_matrix = head_to_head(all_data)
+    h2h_matrix = head_to_head(all_data, engine=engine)
 
     print("\n10. Dimension impact analysis...")
     dimension_impact(all_data)
 
     print("\n11. Bootstrap confidence intervals...")
-    bootstrap_cis = bootstrap_ci(all_data)
+    bootstrap_cis = bootstrap_ci(all_data, engine=engine)
     for sim in sorted(bootstrap_cis.keys(), key=lambda s: bootstrap_cis[s]["mean"], reverse=True):
         ci = bootstrap_cis[sim]
         print(f"   {sim}: {ci['mean']:.1%} [{ci['ci_low']:.1%}, {ci['ci_high']:.1%}]")
@@ -1206,4 +1198,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Epoch statistical analysis")
+    parser.add_argument("--dataset", default=None,
+                        help="Columnar results directory (default: epoch-dataset/, else the markdown reports)")
+    parser.add_argument("--incremental", nargs="?", const=str(OUT / "stats-state.npz"), default=None,
+                        metavar="STATE",
+                        help="Keep Elo / win tallies in STATE (default /tmp/epoch-analysis/stats-state.npz) "
+                             "and only fold in games not seen by an earlier run")
+    args = parser.parse_args()
+    main(args.dataset, args.incremental)
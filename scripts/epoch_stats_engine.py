@@ -0,0 +1,210 @@
+"""
+Vectorized statistics engine for epoch battery analysis.
+========================================================
+Holds the running tallies behind the Elo, head-to-head and bootstrap
+sections of epoch_statistical_analysis.py as NumPy arrays indexed by
+simulation, so folding in a battery is a handful of array ops instead of
+nested Python loops over games:
+
+    appearances[s], wins[s]    games played / won per simulation (all player counts)
+    h2h_wins[a, b]             2P games in which a beat b
+    elo[s], history[t, s]      Elo after every game, in the order games were folded in
+
+``update`` only folds in games it has not seen (keyed by battery, player
+count and game number), and ``save``/``load`` persist the tallies, so an
+incremental run over a growing dataset only pays for the new games.
+
+Elo stays a sequential recurrence — each game's expectation depends on the
+ratings the previous game produced — but runs over pre-built index arrays.
+In incremental mode new games are rated after everything already in the
+state, which is also the order they were played in.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PLAYER_COUNTS = [2, 3, 4, 5]
+
+
+def game_key(game):
+    """Stable identity of a game across analysis runs."""
+    return f"{game.get('battery') or 'md'}/{game['player_count']}P/{game['game_num']}"
+
+
+def wilson_interval(wins, n, z=1.96):
+    """95% Wilson score interval for arrays of win counts; returns (rate, low, high)."""
+    wins = np.asarray(wins, dtype=float)
+    n = np.asarray(n, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = np.where(n > 0, wins / n, 0.0)
+        denom = 1 + z**2 / n
+        center = (p + z**2 / (2 * n)) / denom
+        margin = z * np.sqrt((p * (1 - p) + z**2 / (4 * n)) / n) / denom
+    return p, np.clip(center - margin, 0, 1), np.clip(center + margin, 0, 1)
+
+
+def strategy_frame(all_data, order):
+    """Strategy appearances / wins per player count plus combined totals.
+
+    Returns a DataFrame indexed by strategy (``order``) with columns
+    ``apps_<pc>P``/``wins_<pc>P`` per player count and ``appearances``/``wins``
+    summed across them; strategies never played have zero counts.
+    """
+    frame = pd.DataFrame(index=pd.Index(order, name="strategy"))
+    for pc in PLAYER_COUNTS:
+        strategies = all_data.get(pc, {}).get("strategies", {})
+        counts = pd.DataFrame.from_dict(strategies, orient="index",
+                                        columns=["appearances", "wins"])
+        counts = counts.reindex(order).fillna(0)
+        frame[f"apps_{pc}P"] = counts["appearances"].to_numpy()
+        frame[f"wins_{pc}P"] = counts["wins"].to_numpy()
+    frame["appearances"] = frame[[f"apps_{pc}P" for pc in PLAYER_COUNTS]].sum(axis=1)
+    frame["wins"] = frame[[f"wins_{pc}P" for pc in PLAYER_COUNTS]].sum(axis=1)
+    return frame
+
+
+class StatsEngine:
+    """Running win / head-to-head / Elo tallies over a fixed list of simulations."""
+
+    def __init__(self, sims, k=32, initial=1500):
+        self.sims = list(sims)
+        self.index = {name: i for i, name in enumerate(self.sims)}
+        self.k = k
+        self.initial = initial
+        n = len(self.sims)
+        self.appearances = np.zeros(n, dtype=np.int64)
+        self.wins = np.zeros(n, dtype=np.int64)
+        self.h2h_wins = np.zeros((n, n), dtype=np.int64)
+        self.elo = np.full(n, float(initial))
+        self.history = self.elo[None, :].copy()
+        self.labels = []
+        self.seen = set()
+
+    # ── Ingestion ──────────────────────────────────────────────────────
+
+    def _game_arrays(self, games):
+        """(players, winners): players is games × max seats in seat order, -1 padded."""
+        seats = max(len(g["players"]) for g in games)
+        players = np.full((len(games), seats), -1, dtype=np.int64)
+        for row, game in enumerate(games):
+            players[row, :len(game["players"])] = [self.index[p] for p in game["players"]]
+        winners = np.array([self.index[g["winner"]] for g in games], dtype=np.int64)
+        return players, winners
+
+    def update(self, all_data):
+        """Fold every game not seen before into the tallies; returns how many were new."""
+        games = [g for pc in PLAYER_COUNTS for g in all_data.get(pc, {}).get("games", [])
+                 if game_key(g) not in self.seen]
+        if not games:
+            return 0
+        players, winners = self._game_arrays(games)
+        seated = players >= 0
+        n = len(self.sims)
+
+        self.appearances += np.bincount(players[seated], minlength=n)
+        self.wins += np.bincount(winners, minlength=n)
+
+        two_player = seated.sum(axis=1) == 2
+        if two_player.any():
+            pairs = players[two_player, :2]
+            w = winners[two_player]
+            losers = np.where(pairs[:, 0] == w, pairs[:, 1], pairs[:, 0])
+            np.add.at(self.h2h_wins, (w, losers), 1)
+
+        self._rate(players, winners)
+        self.labels.extend(f"{g['player_count']}P-G{g['game_num']}" for g in games)
+        self.seen.update(game_key(g) for g in games)
+        return len(games)
+
+    def _rate(self, players, winners):
+        # N-player games count as (N-1) winner-vs-loser matchups with K scaled
+        # by 1/(N-1), applied loser by loser in seat order.
+        elo = self.elo.tolist()
+        history = np.empty((len(winners), len(elo)))
+        loser_mask = (players >= 0) & (players != winners[:, None])
+        for t, (seat_row, mask, w) in enumerate(zip(players.tolist(), loser_mask.tolist(),
+                                                     winners.tolist(), strict=True)):
+            losers = [p for p, is_loser in zip(seat_row, mask, strict=True) if is_loser]
+            k_scaled = self.k / len(losers) if losers else 0.0
+            for loser in losers:
+                e_w = 1 / (1 + 10 ** ((elo[loser] - elo[w]) / 400))
+                elo[w] += k_scaled * (1 - e_w)
+                elo[loser] -= k_scaled * (1 - e_w)
+            history[t] = elo
+        self.elo = np.array(elo)
+        self.history = np.vstack([self.history, history])
+
+    # ── Results ────────────────────────────────────────────────────────
+
+    def elo_ratings(self):
+        """(final ratings, per-game history, labels) in compute_elo's dict format."""
+        ratings = {name: float(self.elo[i]) for i, name in enumerate(self.sims)}
+        history = {name: self.history[:, i] for i, name in enumerate(self.sims)}
+        return ratings, history, list(self.labels)
+
+    def head_to_head(self):
+        """(win %, games) DataFrames over simulations seen in 2P games; row beats column."""
+        games = self.h2h_wins + self.h2h_wins.T
+        present = np.flatnonzero(games.sum(axis=1))
+        present = present[np.argsort([self.sims[i] for i in present])]
+        names = [self.sims[i] for i in present]
+        sub_games = games[np.ix_(present, present)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = np.where(sub_games > 0, self.h2h_wins[np.ix_(present, present)] / sub_games * 100, np.nan)
+        np.fill_diagonal(rate, np.nan)
+        return (pd.DataFrame(rate, index=names, columns=names),
+                pd.DataFrame(sub_games, index=names, columns=names))
+
+    def bootstrap_ci(self, n_bootstrap=10000, seed=None):
+        """Bootstrap 95% CIs for every simulation's win rate in one draw.
+
+        Outcomes are 0/1, so the mean of a resample of n outcomes with
+        replacement is Binomial(n, p̂)/n; drawing those directly gives the
+        same bootstrap distribution as resampling index matrices, as one
+        (simulations × n_bootstrap) array, without materialising n per row.
+        """
+        played = np.flatnonzero(self.appearances)
+        n = self.appearances[played]
+        p = self.wins[played] / n
+        rng = np.random.default_rng(seed)
+        boot_means = rng.binomial(n[:, None], p[:, None], size=(len(played), n_bootstrap)) / n[:, None]
+        lows, highs = np.percentile(boot_means, [2.5, 97.5], axis=1)
+        return {
+            self.sims[s]: {"mean": p[i], "ci_low": lows[i], "ci_high": highs[i], "n": int(n[i])}
+            for i, s in sorted(enumerate(played), key=lambda item: self.sims[item[1]])
+        }
+
+    # ── Persistence ────────────────────────────────────────────────────
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, sims=np.array(self.sims), k=self.k, initial=self.initial,
+                     appearances=self.appearances, wins=self.wins, h2h_wins=self.h2h_wins,
+                     elo=self.elo, history=self.history,
+                     labels=np.array(self.labels, dtype=str),
+                     seen=np.array(sorted(self.seen), dtype=str))
+
+    @classmethod
+    def load(cls, path, sims, k=32, initial=1500):
+        """Restore a saved engine; starts fresh if there is no state or it was built differently."""
+        path = Path(path)
+        if not path.exists():
+            return cls(sims, k, initial)
+        with np.load(path) as state:
+            if (state["sims"].tolist() != list(sims) or int(state["k"]) != k
+                    or float(state["initial"]) != initial):
+                print(f"   Ignoring {path}: built with different simulations or Elo parameters")
+                return cls(sims, k, initial)
+            engine = cls(sims, k, initial)
+            engine.appearances = state["appearances"]
+            engine.wins = state["wins"]
+            engine.h2h_wins = state["h2h_wins"]
+            engine.elo = state["elo"]
+            engine.history = state["history"]
+            engine.labels = state["labels"].tolist()
+            engine.seen = set(state["seen"].tolist())
+        return engine
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3.13
+"""Replay a played epoch offline from its seed and per-cycle replay log.
+
+Every resolution pass and scoring run of an epoch is recorded in
+``epoch_cycle_replays`` (migration 085). Fetch an epoch's log once from
+Supabase (service-role key in .env):
+
+    python3.13 scripts/replay_epoch.py fetch <epoch-id> epoch-log.json
+
+Then replay it — re-rolls every mission from the epoch seed and re-scores
+every cycle; exits non-zero if anything differs from what was recorded
+(disputes, resolver regressions):
+
+    python3.13 scripts/replay_epoch.py run epoch-log.json
+
+Benchmark an alternative resolver against the real game with
+``--resolver module:function`` (called as ``function(probability, rng)``,
+returning success/detected/failed); the report lists the outcomes and the
+final scores that would have changed.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.services.epoch_replay import fetch_log, replay_epoch  # noqa: E402
+from backend.services.scoring_engine import DIMENSIONS  # noqa: E402
+
+
+def fetch(epoch_id, output_path):
+    from backend.utils.supabase_pool import get_admin_client
+
+    log = asyncio.run(fetch_log(get_admin_client(), epoch_id))
+    if log["rng_seed"] is None:
+        print(f"Epoch {epoch_id} has no RNG seed — not replayable.")
+    Path(output_path).write_text(json.dumps(log), encoding="utf-8")
+    kinds = [r["kind"] for r in log["records"]]
+    print(f"{kinds.count('resolution')} resolution and {kinds.count('scoring')} scoring records → {output_path}")
+
+
+def _load_resolver(spec):
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def run(log_path, resolver=None):
+    log = json.loads(Path(log_path).read_text(encoding="utf-8"))
+    report = replay_epoch(log, _load_resolver(resolver)) if resolver else replay_epoch(log)
+
+    print(f"Epoch {log.get('epoch_id')}: {report.resolutions} resolution passes, {report.missions} missions, "
+          f"{report.cycles_scored} cycles scored")
+    for cycle, mission_id, logged, replayed in report.outcome_mismatches:
+        print(f"  cycle {cycle:>3}  mission {mission_id}: {logged} → {replayed}")
+    if report.roll_mismatches and not resolver:
+        print(f"  {len(report.roll_mismatches)} missions drew different rolls than recorded")
+    for cycle, sim, logged, replayed in report.score_mismatches:
+        changes = ", ".join(
+            f"{dim} {a:.2f}→{b:.2f}" for dim, a, b in zip([*DIMENSIONS, "composite"], logged[1:], replayed[1:],
+                                                          strict=True) if a != b
+        )
+        print(f"  cycle {cycle:>3}  {sim}: {changes}")
+
+    print("Final composite:")
+    for sim, scores in sorted(report.final_scores.items(), key=lambda item: -item[1][-1]):
+        print(f"  {sim}  {scores[-1]:.2f}")
+    print("IDENTICAL to the recorded epoch" if report.identical else "DIFFERS from the recorded epoch")
+    return 0 if report.identical else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    fet = sub.add_parser("fetch", help="Download an epoch's seed and replay log")
+    fet.add_argument("epoch_id")
+    fet.add_argument("output")
+
+    rep = sub.add_parser("run", help="Replay a fetched log and compare with the recording")
+    rep.add_argument("log")
+    rep.add_argument("--resolver", default=None, help="module:function replacing the production roll")
+
+    args = parser.parse_args()
+    if args.command == "fetch":
+        fetch(args.epoch_id, args.output)
+        return 0
+    return run(args.log, args.resolver)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
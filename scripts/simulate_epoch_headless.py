@@ -0,0 +1,408 @@
+#!/usr/bin/env python3.13
+"""Headless epoch battery — parametric games in-process, no backend or database.
+
+Plays the same parametric games as ``simulate_epoch_all.py`` (same game
+generator, strategies and analysis output) against ``EpochEngine`` instead of
+the HTTP API, so a battery of hundreds of games runs in seconds and is fully
+reproducible from its seed.
+
+The engine starts from exported simulation data. Export it once from a local
+Supabase (service-role key in .env):
+
+    python3.13 scripts/simulate_epoch_headless.py export world.json
+
+Then run batteries against the export. Games are sharded across all cores;
+finished shards are checkpointed, so an interrupted battery resumes where it
+stopped when rerun with the same arguments:
+
+    python3.13 scripts/simulate_epoch_headless.py run world.json --players 3 --games 200 --seed 3000
+    python3.13 scripts/simulate_epoch_headless.py run world.json --players 2 3 4 5 --games 500 --workers 16
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import epoch_results_store as store  # noqa: E402
+import epoch_sim_lib as lib  # noqa: E402
+
+from backend.services.epoch_engine import EngineError, EpochEngine, WorldSeed  # noqa: E402
+
+DIMENSIONS = ["stability", "influence", "sovereignty", "diplomatic", "military"]
+STAT_KEYS = ["deployed", "success", "detected", "failed", "guardians", "ci_sweeps", "rp_spent"]
+
+
+# ── World export ──
+
+
+def export_world(output_path, tags):
+    """Dump the template simulations' game-relevant rows to JSON."""
+    from backend.utils.supabase_pool import get_admin_client
+
+    db = get_admin_client()
+    sim_ids = [lib.ALL_SIMS[t] for t in tags]
+
+    def rows(table, columns, column="simulation_id", values=sim_ids):
+        return db.table(table).select(columns).in_(column, values).execute().data or []
+
+    simulations = rows("simulations", "id, name, slug", column="id")
+    weights = defaultdict(dict)
+    for t in rows("simulation_taxonomies", "simulation_id, value, game_weight"):
+        if t.get("game_weight") is not None:
+            weights[t["simulation_id"]][t["value"]] = float(t["game_weight"])
+    for s in simulations:
+        s["security_weights"] = weights.get(s["id"], {})
+
+    zones = rows("zones", "id, simulation_id, name, security_level")
+    metrics = {z["zone_id"]: z for z in rows("mv_zone_stability", "zone_id, infrastructure_score, total_pressure")}
+    for z in zones:
+        m = metrics.get(z["id"], {})
+        z["infrastructure_score"] = float(m.get("infrastructure_score") or 0.5)
+        z["total_pressure"] = float(m.get("total_pressure") or 0)
+
+    embassies = [
+        e for e in rows("embassies", "id, simulation_a_id, simulation_b_id, status", column="simulation_a_id")
+        if e["simulation_b_id"] in sim_ids
+    ]
+    effectiveness = {
+        (e["simulation_a_id"], e["simulation_b_id"]): float(e.get("effectiveness") or 0)
+        for e in rows("mv_embassy_effectiveness", "simulation_a_id, simulation_b_id, effectiveness",
+                      column="simulation_a_id")
+    }
+    for e in embassies:
+        e["effectiveness"] = effectiveness.get((e["simulation_a_id"], e["simulation_b_id"]), 0.0)
+
+    agents = rows("agents", "id, simulation_id, name")
+    agent_ids = [a["id"] for a in agents]
+    world = WorldSeed(
+        simulations=simulations,
+        agents=agents,
+        agent_aptitudes=rows("agent_aptitudes", "agent_id, simulation_id, operative_type, aptitude_level"),
+        zones=zones,
+        buildings=rows("buildings", "id, simulation_id, name, building_condition"),
+        embassies=embassies,
+        agent_relationships=rows(
+            "agent_relationships", "id, source_agent_id, target_agent_id, intensity",
+            column="source_agent_id", values=agent_ids,
+        ),
+    )
+    Path(output_path).write_text(json.dumps(world.to_export(), indent=1), encoding="utf-8")
+    print(f"Exported {len(simulations)} simulations, {len(agents)} agents, {len(zones)} zones → {output_path}")
+
+
+# ── Headless game ──
+
+
+def _players(engine, tags):
+    """epoch_sim_lib Players over engine state, so pick_op_for_strategy works unchanged."""
+    players = {}
+    for tag in tags:
+        sim_id = lib.ALL_SIMS[tag]
+        p = lib.Player(tag, sim_id, token=None)
+        p.instance_id = sim_id
+        p.agents = [a for a in engine.agents.values() if a["simulation_id"] == sim_id]
+        p.buildings = [b for b in engine.buildings.values() if b["simulation_id"] == sim_id]
+        for row in engine.agent_aptitudes:
+            if row.get("simulation_id") == sim_id:
+                p.aptitudes.setdefault(row["agent_id"], {})[row["operative_type"]] = row["aptitude_level"]
+        for t in tags:
+            embassy = engine.active_embassy(sim_id, lib.ALL_SIMS[t]) if t != tag else None
+            if embassy:
+                p.embassies[lib.ALL_SIMS[t]] = embassy["id"]
+        players[tag] = p
+    return players
+
+
+def play_game(world, game_def, seed):
+    """Play one parametric game definition; returns a result in the ALL_GAME_RESULTS format."""
+    tags = game_def["tags"]
+    engine = EpochEngine(world.subset([lib.ALL_SIMS[t] for t in tags]), game_def["config"], seed=seed)
+    strategy_rng = random.Random(seed + 1)  # noqa: S311
+    players = _players(engine, tags)
+    tag_by_sim = {p.sim_id: tag for tag, p in players.items()}
+    stats = {k: defaultdict(int) for k in STAT_KEYS}
+    scores = {tag: [] for tag in tags}
+
+    for team_name, members in (game_def.get("alliances") or {}).items():
+        team = engine.create_team(players[members[0]].sim_id, team_name)
+        for joiner in members[1:]:
+            engine.join_team(team["id"], players[joiner].sim_id)
+    engine.start()
+
+    def deploy(tag, op, target_tag=None, entity_id=None, entity_type=None):
+        p = players[tag]
+        p.deployed_agents = engine.busy_agent_ids()
+        agent = p.best_agent_for(op)
+        if not agent:
+            return None
+        target = players[target_tag] if target_tag else None
+        try:
+            mission = engine.deploy(
+                p.sim_id, agent["id"], op,
+                target_simulation_id=target.sim_id if target else None,
+                embassy_id=p.embassies.get(target.sim_id) if target else None,
+                target_entity_id=entity_id, target_entity_type=entity_type,
+            )
+        except EngineError:
+            return None
+        stats["deployed"][tag] += 1
+        stats["rp_spent"][tag] += mission["cost_rp"]
+        if op == "guardian":
+            stats["guardians"][tag] += 1
+            p.guardians += 1
+        return mission
+
+    def strategy(cycle):
+        for tag in tags:
+            p = players[tag]
+            p.rp = engine.participants[p.sim_id]["current_rp"]
+            freq = game_def["ci_freq"].get(tag, 0)
+            if freq > 0 and cycle % freq == 0 and p.rp >= 4:
+                engine.counter_intel_sweep(p.sim_id)
+                stats["ci_sweeps"][tag] += 1
+                stats["rp_spent"][tag] += 4
+                p.rp -= 4
+
+            others = [t for t in tags if t != tag]
+            strategy_rng.shuffle(others)
+            target = lib.reachable_target(p, others, players)
+            if not target:
+                continue
+            op = lib.pick_op_for_strategy(game_def["strategies"][tag], cycle, p.rp, players[target])
+            if op is None:
+                continue
+            if p.rp < lib.OP_COSTS.get(op, 3):
+                if p.rp < 3:
+                    continue
+                op = "spy"
+
+            entity_id = entity_type = None
+            buildings = players[target].buildings
+            if op == "saboteur" and buildings:
+                entity_id, entity_type = buildings[cycle % len(buildings)]["id"], "building"
+            elif op == "assassin":
+                busy = engine.busy_agent_ids()
+                free = [a for a in players[target].agents if a["id"] not in busy]
+                if free:
+                    entity_id, entity_type = free[0]["id"], "agent"
+                else:
+                    op = "spy"
+            deploy(tag, op, target, entity_id, entity_type)
+
+    def resolve_and_score(cycle):
+        engine.expedite_missions()
+        for m in engine.resolve_pending_missions():
+            tag = tag_by_sim.get(m["source_simulation_id"])
+            if tag and m["status"] in ("success", "detected", "failed"):
+                stats[m["status"]][tag] += 1
+        for row in engine.compute_cycle_scores(cycle):
+            sd = {d: row[f"{d}_score"] for d in DIMENSIONS}
+            sd["composite"] = row["composite_score"]
+            scores[tag_by_sim[row["simulation_id"]]].append((cycle, sd))
+        engine.resolve_cycle()
+        engine.expire_fortifications()
+
+    def advance_from(status):
+        if engine.status == status:
+            engine.advance_phase()
+
+    for cycle in range(1, game_def["foundation_cycles"] + 1):
+        for tag, count in game_def["guardian_counts"].items():
+            while players[tag].guardians < count and deploy(tag, "guardian"):
+                pass
+        resolve_and_score(cycle)
+    advance_from("foundation")
+
+    for phase, start, end in (
+        ("competition", game_def["foundation_cycles"] + 1, game_def["comp_end"]),
+        ("reckoning", game_def["comp_end"] + 1, game_def["reck_end"]),
+    ):
+        for cycle in range(start, end + 1):
+            if engine.status == "completed":
+                break
+            strategy(cycle)
+            resolve_and_score(cycle)
+        advance_from(phase)
+    while engine.status != "completed":
+        engine.advance_phase()
+
+    leaderboard = engine.leaderboard()
+    for entry in leaderboard:
+        entry["simulation_name"] = lib.ALL_SIM_NAMES[tag_by_sim[entry["simulation_id"]]]
+    return {
+        "name": game_def["name"],
+        "desc": game_def["desc"],
+        "epoch_id": engine.epoch["id"],
+        "seed": seed,
+        "game_def": game_def,
+        "leaderboard": leaderboard,
+        "stats": {k: dict(v) for k, v in stats.items()},
+        "scores": scores,
+        "missions": _mission_rows(engine, tag_by_sim),
+        "actions": [],
+        "tags": tags,
+    }
+
+
+def _mission_rows(engine, tag_by_sim):
+    """One row per deployed operative, with deploy/resolve cycles from the battle log."""
+    deployed, resolved = {}, {}
+    for entry in engine.battle_log:
+        if entry["mission_id"] is None:
+            continue
+        if entry["event_type"] == "operative_deployed":
+            deployed[entry["mission_id"]] = entry["cycle_number"]
+        elif entry["event_type"].startswith("mission_"):
+            resolved[entry["mission_id"]] = entry["cycle_number"]
+    return [
+        {
+            "source": tag_by_sim[m["source_simulation_id"]],
+            "target": tag_by_sim.get(m["target_simulation_id"]),
+            "operative_type": m["operative_type"],
+            "status": m["status"],
+            "success_probability": m["success_probability"],
+            "cost_rp": m["cost_rp"],
+            "deploy_cycle": deployed.get(m["id"]),
+            "resolve_cycle": resolved.get(m["id"]),
+        }
+        for m in engine.operative_missions
+    ]
+
+
+def game_seed(battery_seed, game_num):
+    """Per-game seed derived from the battery seed — independent of which worker plays the game."""
+    return (battery_seed * 1_000_003 + game_num) % 2**63
+
+
+def _checkpoint_dir(md_path):
+    return Path(md_path).with_name(Path(md_path).stem.replace("-analysis", "") + "-shards")
+
+
+def _shard_path(md_path, shard):
+    return _checkpoint_dir(md_path) / f"shard-{shard:04d}.json"
+
+
+_WORKER_WORLD = None
+
+
+def _init_worker(world_path):
+    global _WORKER_WORLD
+    _WORKER_WORLD = WorldSeed.load(world_path)
+
+
+def _run_shard(shard, games, checkpoint):
+    """Play one shard of (game_def, seed) pairs and checkpoint its results atomically."""
+    results = []
+    for game_def, seed in games:
+        random.seed(seed)  # pick_op_for_strategy("random_mix") draws from the module RNG
+        results.append(play_game(_WORKER_WORLD, game_def, seed))
+    tmp = checkpoint.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"shard": shard, "results": results}), encoding="utf-8")
+    os.replace(tmp, checkpoint)
+    return shard, results
+
+
+def _load_shard(checkpoint):
+    try:
+        return json.loads(checkpoint.read_text(encoding="utf-8"))["results"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def run_battery(world_path, title, player_count, num_games, tags, md_path, seed, workers=None, shard_size=25,
+                dataset_dir=None):
+    """Play ``num_games`` parametric games across a process pool, then write the standard analysis.
+
+    Game definitions are generated up front from ``seed`` exactly as the HTTP
+    battery does; each game gets its own seed (``game_seed``), so results do
+    not depend on the worker count. Games are split into shards of
+    ``shard_size``; every finished shard is checkpointed, and a rerun with the
+    same arguments only plays the missing shards. Results are merged in game
+    order, written to the columnar dataset (``epoch_results_store``) and the
+    markdown analysis, and checkpoints are removed afterwards.
+    """
+    lib.set_active_tags(tags)
+    random.seed(seed)  # random_score_weights() draws from the module RNG
+    rng = random.Random(seed)  # noqa: S311
+    games = [
+        (lib.generate_parametric_game(i, player_count, tags, rng), game_seed(seed, i))
+        for i in range(1, num_games + 1)
+    ]
+    shards = [games[i:i + shard_size] for i in range(0, len(games), shard_size)]
+
+    checkpoint_dir = _checkpoint_dir(md_path)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    results_by_shard = {}
+    for shard in range(len(shards)):
+        done = _load_shard(_shard_path(md_path, shard))
+        if done is not None:
+            results_by_shard[shard] = done
+    pending = [shard for shard in range(len(shards)) if shard not in results_by_shard]
+    if results_by_shard:
+        print(f"Resuming: {len(results_by_shard)}/{len(shards)} shards already checkpointed")
+
+    start = time.perf_counter()
+    workers = min(workers or os.cpu_count() or 1, max(len(pending), 1))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(world_path),)) as pool:
+        futures = [pool.submit(_run_shard, shard, shards[shard], _shard_path(md_path, shard)) for shard in pending]
+        for future in as_completed(futures):
+            shard, results = future.result()
+            results_by_shard[shard] = results
+            print(f"  shard {shard + 1}/{len(shards)} done ({len(results_by_shard)}/{len(shards)})")
+    elapsed = time.perf_counter() - start
+
+    lib.ALL_GAME_RESULTS = [r for shard in sorted(results_by_shard) for r in results_by_shard[shard]]
+    lib.generate_analysis(md_path, title, player_count)
+    store.write_dataset(lib.ALL_GAME_RESULTS, dataset_dir or Path(md_path).parent / "epoch-dataset",
+                        player_count, Path(md_path).stem.replace("-analysis", ""))
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
+    played = sum(len(shards[s]) for s in pending)
+    rate = f" ({played / elapsed:.0f} games/s)" if played and elapsed else ""
+    print(f"{played} games played in {elapsed:.1f}s on {workers} workers{rate} → {md_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="Export template simulation data for the engine")
+    exp.add_argument("output")
+    exp.add_argument("--tags", nargs="+", default=list(lib.ALL_SIMS))
+
+    run = sub.add_parser("run", help="Run a headless parametric battery")
+    run.add_argument("world")
+    run.add_argument("--players", type=int, nargs="+", default=[3], help="One battery per player count")
+    run.add_argument("--games", type=int, default=50)
+    run.add_argument("--seed", type=int, default=None, help="Default: 1000 × player count")
+    run.add_argument("--tags", nargs="+", default=None)
+    run.add_argument("--output", default=None, help="Default: epoch-<N>p-headless-analysis.md")
+    run.add_argument("--workers", type=int, default=None, help="Default: all cores")
+    run.add_argument("--shard-size", type=int, default=25, help="Games per checkpointed shard")
+    run.add_argument("--dataset", default=None, help="Columnar results directory (default: ./epoch-dataset)")
+
+    args = parser.parse_args()
+    if args.command == "export":
+        export_world(args.output, args.tags)
+        return
+
+    world = WorldSeed.load(args.world)
+    exported = {s["id"] for s in world.simulations}
+    tags = args.tags or [t for t, sim_id in lib.ALL_SIMS.items() if sim_id in exported]
+    for players in args.players:
+        seed = args.seed if args.seed is not None else 1000 * players
+        output = args.output or f"epoch-{players}p-headless-analysis.md"
+        run_battery(args.world, f"{args.games} Games — {players} Players (headless)",
+                    players, args.games, tags, output, seed, args.workers, args.shard_size, args.dataset)
+
+if __name__ == "__main__":
+    main()
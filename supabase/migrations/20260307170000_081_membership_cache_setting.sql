@@ -0,0 +1,10 @@
+-- ============================================================================
+-- Migration 081: Seed Membership Cache TTL
+-- ============================================================================
+-- TTL (seconds) for the backend's in-process cache of simulation_members
+-- roles and epoch_participants rows used by the role-check dependencies.
+-- ============================================================================
+
+INSERT INTO public.platform_settings (setting_key, setting_value, description) VALUES
+    ('cache_membership_ttl', '30', 'In-process TTL (seconds) for simulation role and epoch participant checks')
+ON CONFLICT (setting_key) DO NOTHING;
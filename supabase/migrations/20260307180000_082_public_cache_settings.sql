@@ -0,0 +1,12 @@
+-- ============================================================================
+-- Migration 082: Seed Public Response Cache TTLs
+-- ============================================================================
+-- TTLs (seconds) for the backend's server-side cache of /api/v1/public
+-- responses. Writes to agents, buildings, events, lore and simulations
+-- invalidate the affected simulation's entries immediately.
+-- ============================================================================
+
+INSERT INTO public.platform_settings (setting_key, setting_value, description) VALUES
+    ('cache_public_simulations_ttl', '30', 'Server-side TTL (seconds) for public simulation list/detail responses'),
+    ('cache_public_entities_ttl', '30', 'Server-side TTL (seconds) for public agent/building/event/lore responses')
+ON CONFLICT (setting_key) DO NOTHING;
@@ -0,0 +1,106 @@
+-- ============================================================================
+-- Migration 083: Deployment Context Loader
+-- ============================================================================
+-- fn_deployment_context returns every input of the mission success
+-- probability formula in one round-trip, for one deploy or for a whole
+-- agents × targets preview matrix:
+--
+--   {
+--     "attacker_pressure_penalty": NUMERIC,
+--     "aptitudes": [{agent_id, operative_type, aptitude_level}, ...],
+--     "zone_security_level": TEXT | null,          -- only with p_target_zone_id
+--     "embassy": {id, infiltration_penalty, infiltration_penalty_expires_at} | null,
+--     "targets": [{
+--       simulation_id, guardian_count, zone_pressure,
+--       resonance_modifiers: {operative_type: NUMERIC},
+--       embassy: {...} | null                     -- only without p_embassy_id
+--     }, ...]
+--   }
+--
+-- p_agent_ids NULL means "all agents with aptitude rows in the source
+-- simulation". p_embassy_id pins the embassy (deploy, top-level "embassy");
+-- otherwise each target gets the first active embassy linking it to the
+-- source (preview).
+-- Composes the existing fn_target_zone_pressure, fn_resonance_operative_modifier
+-- and fn_attacker_pressure_penalty so the formulas stay in one place.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION fn_deployment_context(
+  p_source_simulation_id UUID,
+  p_target_simulation_ids UUID[],
+  p_operative_types TEXT[],
+  p_agent_ids UUID[] DEFAULT NULL,
+  p_target_zone_id UUID DEFAULT NULL,
+  p_embassy_id UUID DEFAULT NULL
+) RETURNS JSONB AS $$
+  SELECT jsonb_build_object(
+    'attacker_pressure_penalty', fn_attacker_pressure_penalty(p_source_simulation_id),
+
+    'aptitudes', COALESCE((
+      SELECT jsonb_agg(jsonb_build_object(
+        'agent_id', aa.agent_id,
+        'operative_type', aa.operative_type,
+        'aptitude_level', aa.aptitude_level
+      ))
+      FROM agent_aptitudes aa
+      WHERE aa.operative_type = ANY(p_operative_types)
+        AND (
+          (p_agent_ids IS NULL AND aa.simulation_id = p_source_simulation_id)
+          OR aa.agent_id = ANY(p_agent_ids)
+        )
+    ), '[]'::jsonb),
+
+    'zone_security_level', (
+      SELECT z.security_level FROM zones z WHERE z.id = p_target_zone_id
+    ),
+
+    'embassy', (
+      SELECT jsonb_build_object(
+        'id', e.id,
+        'infiltration_penalty', e.infiltration_penalty,
+        'infiltration_penalty_expires_at', e.infiltration_penalty_expires_at
+      )
+      FROM embassies e
+      WHERE e.id = p_embassy_id
+    ),
+
+    'targets', COALESCE((
+      SELECT jsonb_agg(jsonb_build_object(
+        'simulation_id', t.sim_id,
+        'guardian_count', (
+          SELECT count(*)
+          FROM operative_missions om
+          WHERE om.operative_type = 'guardian'
+            AND om.source_simulation_id = t.sim_id
+            AND om.status = 'active'
+        ),
+        'zone_pressure', fn_target_zone_pressure(t.sim_id, p_target_zone_id),
+        'resonance_modifiers', (
+          SELECT COALESCE(jsonb_object_agg(op.op_type, fn_resonance_operative_modifier(t.sim_id, op.op_type)), '{}'::jsonb)
+          FROM unnest(p_operative_types) AS op(op_type)
+        ),
+        'embassy', (
+          SELECT jsonb_build_object(
+            'id', e.id,
+            'infiltration_penalty', e.infiltration_penalty,
+            'infiltration_penalty_expires_at', e.infiltration_penalty_expires_at
+          )
+          FROM embassies e
+          WHERE p_embassy_id IS NULL
+            AND e.status = 'active'
+            AND (
+              (e.simulation_a_id = p_source_simulation_id AND e.simulation_b_id = t.sim_id)
+              OR (e.simulation_b_id = p_source_simulation_id AND e.simulation_a_id = t.sim_id)
+            )
+          ORDER BY e.created_at
+          LIMIT 1
+        )
+      ))
+      FROM unnest(p_target_simulation_ids) AS t(sim_id)
+    ), '[]'::jsonb)
+  );
+$$ LANGUAGE sql STABLE;
+
+-- Cross-simulation reads (guardians, embassies) — backend only.
+REVOKE ALL ON FUNCTION fn_deployment_context FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION fn_deployment_context TO service_role;
@@ -0,0 +1,25 @@
+-- ============================================================================
+-- Migration 084: Batch Mission Result Writes
+-- ============================================================================
+-- fn_apply_mission_results writes the outcome of every mission resolved in a
+-- cycle in one statement (the resolver used to issue one UPDATE per mission).
+--
+--   p_results: [{id, status, resolved_at, mission_result}, ...]
+--
+-- Returns the updated operative_missions rows.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION fn_apply_mission_results(p_results JSONB)
+RETURNS SETOF operative_missions AS $$
+  UPDATE operative_missions m
+  SET status = r.status,
+      resolved_at = r.resolved_at,
+      mission_result = r.mission_result
+  FROM jsonb_to_recordset(p_results)
+    AS r(id UUID, status TEXT, resolved_at TIMESTAMPTZ, mission_result JSONB)
+  WHERE m.id = r.id
+  RETURNING m.*;
+$$ LANGUAGE sql;
+
+REVOKE ALL ON FUNCTION fn_apply_mission_results FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION fn_apply_mission_results TO service_role;
@@ -0,0 +1,69 @@
+-- ============================================================================
+-- Migration 085: Seeded Mission Resolution + Cycle Replay Log
+-- ============================================================================
+-- Every epoch gets a secret RNG seed; mission resolution draws from a stream
+-- derived from (seed, cycle, resolved mission ids), so a cycle's outcome can
+-- be reproduced. Each resolution pass and each scoring run appends a compact
+-- record to epoch_cycle_replays, from which scripts/replay_epoch.py re-runs
+-- the epoch offline.
+--
+-- The seed lives in its own table rather than on game_epochs: game_epochs is
+-- readable by anon and published to realtime, and a player who knew the seed
+-- could predict their pending missions' rolls. Both tables are service-role
+-- only (RLS enabled, no policies).
+-- ============================================================================
+
+-- ══════════════════════════════════════════════════════════════
+-- 1. Per-epoch RNG seed
+-- ══════════════════════════════════════════════════════════════
+
+CREATE TABLE IF NOT EXISTS epoch_rng_seeds (
+    epoch_id    UUID PRIMARY KEY REFERENCES game_epochs(id) ON DELETE CASCADE,
+    rng_seed    BIGINT NOT NULL DEFAULT floor(random() * 4611686018427387904)::BIGINT,
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+ALTER TABLE epoch_rng_seeds ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION fn_create_epoch_rng_seed()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO epoch_rng_seeds (epoch_id) VALUES (NEW.id)
+    ON CONFLICT (epoch_id) DO NOTHING;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE ALL ON FUNCTION fn_create_epoch_rng_seed FROM PUBLIC;
+
+DROP TRIGGER IF EXISTS trg_game_epochs_rng_seed ON game_epochs;
+CREATE TRIGGER trg_game_epochs_rng_seed
+    AFTER INSERT ON game_epochs
+    FOR EACH ROW EXECUTE FUNCTION fn_create_epoch_rng_seed();
+
+-- Epochs still in play get a seed from their next resolution on;
+-- earlier cycles were rolled with SystemRandom and are not replayable.
+INSERT INTO epoch_rng_seeds (epoch_id)
+SELECT id FROM game_epochs
+ON CONFLICT (epoch_id) DO NOTHING;
+
+-- ══════════════════════════════════════════════════════════════
+-- 2. Replay log
+-- ══════════════════════════════════════════════════════════════
+-- kind = 'resolution': {missions: [[id, type, source, target, p]], outcomes, rolls}
+-- kind = 'scoring':    {missions, zone_stability, propaganda, echoes,
+--                       embassy_effectiveness, active_embassies, participants,
+--                       weights, scores}
+
+CREATE TABLE IF NOT EXISTS epoch_cycle_replays (
+    id            BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    epoch_id      UUID NOT NULL REFERENCES game_epochs(id) ON DELETE CASCADE,
+    cycle_number  INT NOT NULL,
+    kind          TEXT NOT NULL CHECK (kind IN ('resolution', 'scoring')),
+    payload       JSONB NOT NULL,
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_epoch_cycle_replays_epoch ON epoch_cycle_replays(epoch_id, id);
+
+ALTER TABLE epoch_cycle_replays ENABLE ROW LEVEL SECURITY;
@@ -0,0 +1,81 @@
+-- ============================================================================
+-- Migration 086: Background Cycle Resolution Jobs
+-- ============================================================================
+-- Cycle resolution (RP grant → missions → fortification expiry → bots →
+-- scoring → notifications) runs as a background job instead of inside the
+-- resolve-cycle request. One row per (epoch, cycle being resolved) makes the
+-- trigger idempotent: a second resolve for the same cycle returns the
+-- existing job instead of advancing the epoch twice.
+--
+--   stages: [{name, status, started_at, duration_ms, error}, ...]
+--
+-- Service-role only (RLS enabled, no policies); clients poll the job through
+-- GET /epochs/{id}/cycles/{n}/resolution.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS cycle_resolution_jobs (
+    id            UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    epoch_id      UUID NOT NULL REFERENCES game_epochs(id) ON DELETE CASCADE,
+    cycle_number  INT NOT NULL,
+    status        TEXT NOT NULL DEFAULT 'queued'
+                  CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    stage         TEXT,
+    stages        JSONB NOT NULL DEFAULT '[]'::jsonb,
+    error         TEXT,
+    attempts      INT NOT NULL DEFAULT 1,
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    started_at    TIMESTAMPTZ,
+    finished_at   TIMESTAMPTZ,
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    UNIQUE (epoch_id, cycle_number)
+);
+
+ALTER TABLE cycle_resolution_jobs ENABLE ROW LEVEL SECURITY;
+
+-- ══════════════════════════════════════════════════════════════
+-- Claim
+-- ══════════════════════════════════════════════════════════════
+-- Creates the job for (epoch, cycle), or re-queues it when the previous
+-- attempt failed or went silent for p_stale_after (a worker that died
+-- mid-run). A failed job starts over; a stale one keeps its stage progress
+-- so the runner resumes after the last stage that succeeded. Returns the job
+-- row plus "claimed": true only for the caller that should run it; everyone
+-- else gets the existing job with false.
+
+CREATE OR REPLACE FUNCTION fn_claim_cycle_resolution(
+    p_epoch_id UUID,
+    p_cycle_number INT,
+    p_stages JSONB,
+    p_stale_after INTERVAL
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_job cycle_resolution_jobs;
+BEGIN
+    INSERT INTO cycle_resolution_jobs AS j (epoch_id, cycle_number, stages)
+    VALUES (p_epoch_id, p_cycle_number, p_stages)
+    ON CONFLICT (epoch_id, cycle_number) DO UPDATE
+    SET status = 'queued',
+        stage = NULL,
+        stages = CASE WHEN j.status = 'failed' THEN EXCLUDED.stages ELSE j.stages END,
+        error = NULL,
+        attempts = j.attempts + 1,
+        started_at = NULL,
+        finished_at = NULL,
+        updated_at = now()
+    WHERE j.status = 'failed'
+       OR (j.status IN ('queued', 'running') AND j.updated_at < now() - p_stale_after)
+    RETURNING * INTO v_job;
+
+    IF FOUND THEN
+        RETURN to_jsonb(v_job) || '{"claimed": true}'::jsonb;
+    END IF;
+
+    SELECT * INTO v_job FROM cycle_resolution_jobs
+    WHERE epoch_id = p_epoch_id AND cycle_number = p_cycle_number;
+    RETURN to_jsonb(v_job) || '{"claimed": false}'::jsonb;
+END;
+$$ LANGUAGE plpgsql;
+
+REVOKE ALL ON FUNCTION fn_claim_cycle_resolution FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION fn_claim_cycle_resolution TO service_role;
@@ -0,0 +1,76 @@
+-- ============================================================================
+-- Migration 087: Set-Based Fortification Expiry
+-- ============================================================================
+-- fn_expire_fortifications expires every zone fortification of an epoch whose
+-- expiry cycle has been reached in one statement: the fortifications are
+-- deleted and each affected zone's security_level is moved back down by the
+-- summed security_bonus along the tier order (lawless → fortress). The cycle
+-- resolver used to select, update and delete one fortification at a time,
+-- leaving zones half-reverted if a step failed.
+--
+-- Returns one row per expired fortification for the battle log:
+--   [{id, zone_id, zone_name, source_simulation_id, security_bonus,
+--     old_level, new_level}, ...]
+-- Zones with an unknown security level keep it (old_level = new_level).
+--
+-- Also adds the 'fortification_expired' battle log event type.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION fn_expire_fortifications(p_epoch_id UUID, p_cycle_number INT)
+RETURNS JSONB AS $$
+  WITH tiers(levels) AS (
+    SELECT ARRAY['lawless', 'contested', 'low', 'moderate', 'guarded', 'high', 'maximum', 'fortress']
+  ),
+  expired AS (
+    DELETE FROM zone_fortifications
+    WHERE epoch_id = p_epoch_id
+      AND expires_at_cycle <= p_cycle_number
+    RETURNING id, zone_id, source_simulation_id, security_bonus
+  ),
+  reversion AS (
+    SELECT z.id AS zone_id,
+           z.name AS zone_name,
+           z.security_level AS old_level,
+           CASE WHEN array_position(t.levels, z.security_level) IS NULL THEN z.security_level
+                ELSE t.levels[GREATEST(1, array_position(t.levels, z.security_level) - SUM(e.security_bonus)::INT)]
+           END AS new_level
+    FROM expired e
+    JOIN zones z ON z.id = e.zone_id
+    CROSS JOIN tiers t
+    GROUP BY z.id, z.name, z.security_level, t.levels
+  ),
+  -- Runs to completion although the final SELECT does not read it
+  reverted AS (
+    UPDATE zones z
+    SET security_level = r.new_level
+    FROM reversion r
+    WHERE z.id = r.zone_id
+      AND r.new_level IS DISTINCT FROM r.old_level
+  )
+  SELECT COALESCE(jsonb_agg(jsonb_build_object(
+           'id', e.id,
+           'zone_id', e.zone_id,
+           'zone_name', r.zone_name,
+           'source_simulation_id', e.source_simulation_id,
+           'security_bonus', e.security_bonus,
+           'old_level', r.old_level,
+           'new_level', r.new_level
+         ) ORDER BY e.id), '[]'::jsonb)
+  FROM expired e
+  LEFT JOIN reversion r ON r.zone_id = e.zone_id;
+$$ LANGUAGE sql;
+
+REVOKE ALL ON FUNCTION fn_expire_fortifications FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION fn_expire_fortifications TO service_role;
+
+ALTER TABLE battle_log DROP CONSTRAINT IF EXISTS battle_log_event_type_check;
+ALTER TABLE battle_log ADD CONSTRAINT battle_log_event_type_check CHECK (
+    event_type IN (
+        'operative_deployed', 'mission_success', 'mission_failed',
+        'detected', 'captured', 'sabotage', 'propaganda', 'assassination',
+        'infiltration', 'alliance_formed', 'alliance_dissolved', 'betrayal',
+        'phase_change', 'epoch_start', 'epoch_end', 'rp_allocated',
+        'building_damaged', 'agent_wounded', 'counter_intel', 'intel_report',
+        'zone_fortified', 'fortification_expired'
+    )
+);
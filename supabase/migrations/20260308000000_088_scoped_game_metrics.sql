@@ -0,0 +1,750 @@
+-- ============================================================================
+-- Migration 088: Scoped, Incremental Game Metrics
+-- ============================================================================
+-- refresh_all_game_metrics() rebuilt all four materialized views for every
+-- simulation on the platform, so a cycle resolution that only touched one
+-- epoch's game instances paid for (and waited on) the whole platform.
+--
+-- The four metrics are now ordinary tables under their old names — readers
+-- (services, cascade/resonance functions, dashboards) are unchanged:
+--
+--   mv_building_readiness    one row per building
+--   mv_zone_stability        one row per zone
+--   mv_embassy_effectiveness one row per embassy
+--   mv_simulation_health     one row per simulation
+--
+-- refresh_game_metrics(p_simulation_ids) recomputes the rows of the given
+-- simulations only (same formulas as migrations 031/072), plus the health of
+-- their embassy partners. Rows are replaced inside the caller's transaction,
+-- so readers keep seeing the previous values until it commits, like
+-- REFRESH ... CONCURRENTLY did.
+--
+-- Dirty set: the data-change triggers from migration 031 now also record the
+-- touched simulations in game_metrics_dirty. refresh_dirty_game_metrics()
+-- recomputes only those (optionally restricted to a given set) — the backend
+-- drains it every GAME_METRICS_REFRESH_INTERVAL seconds, so edits outside
+-- scoring and event writes (agents, buildings, embassies, taxonomies) still
+-- reach the dashboards — and refresh_all_game_metrics() remains for a
+-- platform-wide rebuild.
+-- ============================================================================
+
+
+-- ============================================================================
+-- 1. REPLACE THE MATERIALIZED VIEWS WITH TABLES
+-- ============================================================================
+
+DROP MATERIALIZED VIEW IF EXISTS mv_simulation_health CASCADE;
+DROP MATERIALIZED VIEW IF EXISTS mv_zone_stability CASCADE;
+DROP MATERIALIZED VIEW IF EXISTS mv_embassy_effectiveness CASCADE;
+DROP MATERIALIZED VIEW IF EXISTS mv_building_readiness CASCADE;
+
+DROP FUNCTION IF EXISTS refresh_building_readiness();
+DROP FUNCTION IF EXISTS refresh_zone_stability();
+DROP FUNCTION IF EXISTS refresh_embassy_effectiveness();
+
+CREATE TABLE mv_building_readiness (
+  building_id         UUID PRIMARY KEY,
+  simulation_id       UUID NOT NULL,
+  zone_id             UUID,
+  building_name       TEXT,
+  building_type       TEXT,
+  building_condition  TEXT,
+  population_capacity INT,
+  special_type        TEXT,
+  assigned_agents     BIGINT NOT NULL,
+  staffing_ratio      NUMERIC NOT NULL,
+  staffing_status     TEXT NOT NULL,
+  qualification_match NUMERIC NOT NULL,
+  condition_factor    NUMERIC NOT NULL,
+  criticality_weight  NUMERIC NOT NULL,
+  readiness           NUMERIC NOT NULL
+);
+
+CREATE INDEX idx_mv_building_readiness_sim ON mv_building_readiness (simulation_id);
+CREATE INDEX idx_mv_building_readiness_zone ON mv_building_readiness (zone_id);
+
+CREATE TABLE mv_zone_stability (
+  zone_id                     UUID PRIMARY KEY,
+  simulation_id               UUID NOT NULL,
+  city_id                     UUID,
+  zone_name                   TEXT,
+  zone_type                   TEXT,
+  security_level              TEXT,
+  infrastructure_score        NUMERIC NOT NULL,
+  security_factor             NUMERIC NOT NULL,
+  event_pressure              NUMERIC NOT NULL,
+  ambient_pressure            NUMERIC NOT NULL,
+  fortification_reduction     NUMERIC NOT NULL,
+  is_quarantined              BOOLEAN NOT NULL,
+  building_count              BIGINT NOT NULL,
+  total_agents                NUMERIC NOT NULL,
+  total_capacity              BIGINT NOT NULL,
+  critical_understaffed_count BIGINT NOT NULL,
+  avg_readiness               NUMERIC NOT NULL,
+  total_pressure              NUMERIC NOT NULL,
+  stability                   NUMERIC NOT NULL,
+  stability_label             TEXT NOT NULL
+);
+
+CREATE INDEX idx_mv_zone_stability_sim ON mv_zone_stability (simulation_id);
+
+CREATE TABLE mv_embassy_effectiveness (
+  embassy_id          UUID PRIMARY KEY,
+  simulation_a_id     UUID NOT NULL,
+  simulation_b_id     UUID NOT NULL,
+  building_a_id       UUID,
+  building_b_id       UUID,
+  status              TEXT,
+  bleed_vector        TEXT,
+  building_health     NUMERIC NOT NULL,
+  ambassador_quality  NUMERIC NOT NULL,
+  vector_alignment    NUMERIC NOT NULL,
+  effectiveness       NUMERIC NOT NULL,
+  effectiveness_label TEXT NOT NULL
+);
+
+CREATE INDEX idx_mv_embassy_eff_sim_a ON mv_embassy_effectiveness (simulation_a_id);
+CREATE INDEX idx_mv_embassy_eff_sim_b ON mv_embassy_effectiveness (simulation_b_id);
+
+CREATE TABLE mv_simulation_health (
+  simulation_id                     UUID PRIMARY KEY,
+  simulation_name                   TEXT,
+  slug                              TEXT,
+  avg_zone_stability                NUMERIC NOT NULL,
+  zone_count                        BIGINT NOT NULL,
+  critical_zone_count               BIGINT NOT NULL,
+  unstable_zone_count               BIGINT NOT NULL,
+  building_count                    BIGINT NOT NULL,
+  avg_readiness                     NUMERIC NOT NULL,
+  critically_understaffed_buildings BIGINT NOT NULL,
+  overcrowded_buildings             BIGINT NOT NULL,
+  total_agents_assigned             NUMERIC NOT NULL,
+  total_capacity                    NUMERIC NOT NULL,
+  diplomatic_reach                  NUMERIC NOT NULL,
+  active_embassy_count              BIGINT NOT NULL,
+  avg_embassy_effectiveness         NUMERIC NOT NULL,
+  outbound_echoes                   BIGINT NOT NULL,
+  inbound_echoes                    BIGINT NOT NULL,
+  avg_outbound_strength             NUMERIC NOT NULL,
+  bleed_permeability                NUMERIC NOT NULL,
+  overall_health                    NUMERIC NOT NULL,
+  health_label                      TEXT NOT NULL
+);
+
+CREATE INDEX idx_mv_sim_health_slug ON mv_simulation_health (slug);
+
+-- Read-only for clients; written by the SECURITY DEFINER refresh functions
+ALTER TABLE mv_building_readiness ENABLE ROW LEVEL SECURITY;
+ALTER TABLE mv_zone_stability ENABLE ROW LEVEL SECURITY;
+ALTER TABLE mv_embassy_effectiveness ENABLE ROW LEVEL SECURITY;
+ALTER TABLE mv_simulation_health ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "mv_building_readiness_read_all" ON mv_building_readiness FOR SELECT USING (true);
+CREATE POLICY "mv_zone_stability_read_all" ON mv_zone_stability FOR SELECT USING (true);
+CREATE POLICY "mv_embassy_effectiveness_read_all" ON mv_embassy_effectiveness FOR SELECT USING (true);
+CREATE POLICY "mv_simulation_health_read_all" ON mv_simulation_health FOR SELECT USING (true);
+
+GRANT SELECT ON mv_building_readiness TO authenticated, anon;
+GRANT SELECT ON mv_zone_stability TO authenticated, anon;
+GRANT SELECT ON mv_embassy_effectiveness TO authenticated, anon;
+GRANT SELECT ON mv_simulation_health TO authenticated, anon;
+
+
+-- ============================================================================
+-- 2. DIRTY SET
+-- ============================================================================
+-- No FK to simulations: child rows deleted by a simulation's cascade still
+-- mark it, and the next refresh removes its metric rows.
+
+CREATE TABLE game_metrics_dirty (
+  simulation_id UUID PRIMARY KEY,
+  marked_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Service-role only (RLS enabled, no policies)
+ALTER TABLE game_metrics_dirty ENABLE ROW LEVEL SECURITY;
+
+-- Marks every simulation a changed row belongs to (simulation_id, the
+-- embassy/connection pair, or the echo source/target) and keeps the
+-- game_metrics_stale notification from migrations 031/035.
+CREATE OR REPLACE FUNCTION notify_game_metrics_stale()
+RETURNS trigger AS $$
+DECLARE
+  v_sim_ids UUID[];
+BEGIN
+  SELECT array_agg(DISTINCT (r ->> k)::UUID) INTO v_sim_ids
+  FROM unnest(ARRAY[to_jsonb(NEW), to_jsonb(OLD)]) AS r,
+       unnest(ARRAY[
+         'simulation_id', 'simulation_a_id', 'simulation_b_id',
+         'source_simulation_id', 'target_simulation_id'
+       ]) AS k
+  WHERE r ->> k IS NOT NULL;
+
+  IF v_sim_ids IS NOT NULL THEN
+    INSERT INTO game_metrics_dirty (simulation_id)
+    SELECT unnest(v_sim_ids)
+    ON CONFLICT (simulation_id) DO NOTHING;
+  END IF;
+
+  PERFORM pg_notify('game_metrics_stale', json_build_object(
+    'table', TG_TABLE_NAME,
+    'operation', TG_OP,
+    'simulation_id', COALESCE(v_sim_ids[1]::text, '')
+  )::text);
+  RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path TO 'public';
+
+-- Inputs added after migration 031 (security level, zone actions, pressure settings)
+CREATE TRIGGER trg_game_metrics_zones
+  AFTER INSERT OR UPDATE OR DELETE ON zones
+  FOR EACH ROW EXECUTE FUNCTION notify_game_metrics_stale();
+
+CREATE TRIGGER trg_game_metrics_zone_actions
+  AFTER INSERT OR UPDATE OR DELETE ON zone_actions
+  FOR EACH ROW EXECUTE FUNCTION notify_game_metrics_stale();
+
+CREATE TRIGGER trg_game_metrics_simulation_settings
+  AFTER INSERT OR UPDATE OR DELETE ON simulation_settings
+  FOR EACH ROW EXECUTE FUNCTION notify_game_metrics_stale();
+
+
+-- ============================================================================
+-- 3. SCOPED REFRESH
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION refresh_game_metrics(p_simulation_ids UUID[])
+RETURNS UUID[] AS $$
+DECLARE
+  v_ids UUID[] := ARRAY(SELECT DISTINCT id FROM unnest(p_simulation_ids) AS id WHERE id IS NOT NULL ORDER BY id);
+  v_health_ids UUID[];
+  v_id UUID;
+BEGIN
+  IF cardinality(v_ids) = 0 THEN
+    RETURN v_ids;
+  END IF;
+
+  -- Embassy effectiveness feeds the partner's health as well
+  v_health_ids := ARRAY(
+    SELECT unnest(v_ids)
+    UNION
+    SELECT simulation_b_id FROM embassies WHERE simulation_a_id = ANY(v_ids)
+    UNION
+    SELECT simulation_a_id FROM embassies WHERE simulation_b_id = ANY(v_ids)
+    ORDER BY 1
+  );
+
+  -- Serialize refreshes that share a simulation (sorted, so no deadlocks)
+  FOREACH v_id IN ARRAY v_health_ids LOOP
+    PERFORM pg_advisory_xact_lock(hashtext('game_metrics'), hashtext(v_id::text));
+  END LOOP;
+
+  -- Unmark first: changes committed while we recompute stay dirty
+  DELETE FROM game_metrics_dirty WHERE simulation_id = ANY(v_ids);
+
+  -- ── Building readiness: staffing × qualification × condition ──
+  DELETE FROM mv_building_readiness WHERE simulation_id = ANY(v_ids);
+  INSERT INTO mv_building_readiness
+  WITH agent_counts AS (
+    SELECT
+      bar.building_id,
+      COUNT(DISTINCT bar.agent_id) AS assigned_agents
+    FROM building_agent_relations bar
+    JOIN agents a ON a.id = bar.agent_id AND a.deleted_at IS NULL
+    WHERE bar.simulation_id = ANY(v_ids)
+    GROUP BY bar.building_id
+  ),
+  profession_match AS (
+    SELECT
+      bpr.building_id,
+      COALESCE(AVG(
+        CASE
+          WHEN ap.qualification_level >= bpr.min_qualification_level THEN 1.0
+          WHEN ap.qualification_level IS NOT NULL THEN 0.3
+          ELSE 0.3
+        END
+      ), 0.5) AS match_score,
+      COUNT(bpr.id) AS requirement_count
+    FROM building_profession_requirements bpr
+    LEFT JOIN building_agent_relations bar ON bar.building_id = bpr.building_id
+    LEFT JOIN agents a ON a.id = bar.agent_id AND a.deleted_at IS NULL
+    LEFT JOIN agent_professions ap ON ap.agent_id = a.id AND ap.profession = bpr.profession
+    WHERE bpr.simulation_id = ANY(v_ids)
+    GROUP BY bpr.building_id
+  )
+  SELECT
+    b.id,
+    b.simulation_id,
+    b.zone_id,
+    b.name,
+    b.building_type,
+    b.building_condition,
+    b.population_capacity,
+    b.special_type,
+    COALESCE(ac.assigned_agents, 0),
+    CASE
+      WHEN COALESCE(b.population_capacity, 0) = 0 THEN
+        CASE WHEN COALESCE(ac.assigned_agents, 0) > 0 THEN 1.0 ELSE 0.0 END
+      ELSE LEAST(1.5,
+        COALESCE(ac.assigned_agents, 0)::numeric / GREATEST(b.population_capacity, 1)
+      )
+    END,
+    CASE
+      WHEN COALESCE(b.population_capacity, 0) = 0 THEN 'n/a'
+      WHEN COALESCE(ac.assigned_agents, 0)::numeric / GREATEST(b.population_capacity, 1) < 0.5 THEN 'critically_understaffed'
+      WHEN COALESCE(ac.assigned_agents, 0)::numeric / GREATEST(b.population_capacity, 1) < 0.8 THEN 'understaffed'
+      WHEN COALESCE(ac.assigned_agents, 0)::numeric / GREATEST(b.population_capacity, 1) <= 1.2 THEN 'operational'
+      ELSE 'overcrowded'
+    END,
+    CASE
+      WHEN pm.requirement_count IS NULL OR pm.requirement_count = 0 THEN 1.0
+      ELSE COALESCE(pm.match_score, 0.5)
+    END,
+    COALESCE(st_cond.game_weight, game_weight_fallback('building_condition', b.building_condition)),
+    COALESCE(st_type.game_weight, game_weight_fallback('building_type', b.building_type)),
+    LEAST(1.0, GREATEST(0.0,
+      LEAST(1.0,
+        CASE
+          WHEN COALESCE(b.population_capacity, 0) = 0 THEN
+            CASE WHEN COALESCE(ac.assigned_agents, 0) > 0 THEN 1.0 ELSE 0.0 END
+          ELSE COALESCE(ac.assigned_agents, 0)::numeric / GREATEST(b.population_capacity, 1)
+        END
+      )
+      * CASE
+          WHEN pm.requirement_count IS NULL OR pm.requirement_count = 0 THEN 1.0
+          ELSE COALESCE(pm.match_score, 0.5)
+        END
+      * COALESCE(st_cond.game_weight, game_weight_fallback('building_condition', b.building_condition))
+    ))
+  FROM buildings b
+  LEFT JOIN agent_counts ac ON ac.building_id = b.id
+  LEFT JOIN profession_match pm ON pm.building_id = b.id
+  LEFT JOIN simulation_taxonomies st_cond ON
+    st_cond.simulation_id = b.simulation_id
+    AND st_cond.taxonomy_type = 'building_condition'
+    AND st_cond.value = b.building_condition
+  LEFT JOIN simulation_taxonomies st_type ON
+    st_type.simulation_id = b.simulation_id
+    AND st_type.taxonomy_type = 'building_type'
+    AND st_type.value = b.building_type
+  WHERE b.deleted_at IS NULL
+    AND b.simulation_id = ANY(v_ids);
+
+  -- ── Zone stability: infrastructure + security − pressure ──
+  DELETE FROM mv_zone_stability WHERE simulation_id = ANY(v_ids);
+  INSERT INTO mv_zone_stability
+  WITH pressure_config AS (
+    SELECT
+      simulation_id,
+      COALESCE((setting_value #>> '{}')::int, 30) AS window_days
+    FROM simulation_settings
+    WHERE category = 'world' AND setting_key = 'event_pressure_window_days'
+      AND simulation_id = ANY(v_ids)
+  ),
+  spill_config AS (
+    SELECT
+      simulation_id,
+      COALESCE((setting_value #>> '{}')::numeric, 0.3) AS spill_factor
+    FROM simulation_settings
+    WHERE category = 'game_mechanics' AND setting_key = 'pressure_spill_factor'
+      AND simulation_id = ANY(v_ids)
+  ),
+  vulnerability_config AS (
+    SELECT
+      simulation_id,
+      setting_value AS vuln_matrix
+    FROM simulation_settings
+    WHERE category = 'game_mechanics' AND setting_key = 'zone_vulnerability_matrix'
+      AND simulation_id = ANY(v_ids)
+  ),
+  zone_infrastructure AS (
+    SELECT
+      br.zone_id,
+      br.simulation_id,
+      CASE
+        WHEN SUM(br.criticality_weight) = 0 THEN 0.5
+        ELSE SUM(br.readiness * br.criticality_weight) / SUM(br.criticality_weight)
+      END AS infrastructure_score,
+      COUNT(*) AS building_count,
+      SUM(br.assigned_agents) AS total_agents,
+      SUM(br.population_capacity) AS total_capacity,
+      COUNT(*) FILTER (WHERE br.staffing_status = 'critically_understaffed') AS critical_understaffed_count,
+      AVG(br.readiness) AS avg_readiness
+    FROM mv_building_readiness br
+    WHERE br.zone_id IS NOT NULL
+      AND br.simulation_id = ANY(v_ids)
+    GROUP BY br.zone_id, br.simulation_id
+  ),
+  zone_event_pressure AS (
+    SELECT
+      z.id AS zone_id,
+      z.simulation_id,
+      LEAST(1.0,
+        COALESCE(
+          SUM(
+            (
+              POWER(e.impact_level::numeric / 10.0, 1.5)
+              * CASE e.event_status
+                  WHEN 'active'     THEN 1.0
+                  WHEN 'escalating' THEN 1.3
+                  WHEN 'resolving'  THEN 0.5
+                  WHEN 'resolved'   THEN 0.0
+                  WHEN 'archived'   THEN 0.0
+                  ELSE 1.0
+                END
+              * ezl.affinity_weight
+              * COALESCE((vc.vuln_matrix->z.zone_type->>e.event_type)::numeric, 1.0)
+            )
+            + COALESCE((e.metadata->>'reaction_modifier')::numeric, 0.0)
+          ) FILTER (
+            WHERE e.occurred_at >= (now() - interval '1 day' * COALESCE(pc.window_days, 30))
+            AND e.deleted_at IS NULL
+            AND e.event_status NOT IN ('resolved', 'archived')
+          ) / 15.0,
+          0.0
+        )
+      ) AS event_pressure
+    FROM zones z
+    LEFT JOIN pressure_config pc ON pc.simulation_id = z.simulation_id
+    LEFT JOIN vulnerability_config vc ON vc.simulation_id = z.simulation_id
+    LEFT JOIN event_zone_links ezl ON ezl.zone_id = z.id
+    LEFT JOIN events e ON e.id = ezl.event_id
+      AND e.simulation_id = z.simulation_id
+      AND e.deleted_at IS NULL
+    WHERE z.simulation_id = ANY(v_ids)
+    GROUP BY z.id, z.simulation_id, pc.window_days
+  ),
+  ambient_event_pressure AS (
+    SELECT
+      z.id AS zone_id,
+      z.simulation_id,
+      COALESCE(
+        SUM(
+          POWER(e.impact_level::numeric / 10.0, 1.5)
+          * CASE e.event_status
+              WHEN 'active'     THEN 1.0
+              WHEN 'escalating' THEN 1.3
+              WHEN 'resolving'  THEN 0.5
+              WHEN 'resolved'   THEN 0.0
+              WHEN 'archived'   THEN 0.0
+              ELSE 1.0
+            END
+          * COALESCE(sc.spill_factor, 0.3)
+        ) FILTER (
+          WHERE e.occurred_at >= (now() - interval '1 day' * COALESCE(pc.window_days, 30))
+          AND e.deleted_at IS NULL
+          AND e.event_status NOT IN ('resolved', 'archived')
+        ) / 15.0,
+        0.0
+      ) AS ambient_pressure
+    FROM zones z
+    CROSS JOIN events e
+    LEFT JOIN event_zone_links ezl ON ezl.event_id = e.id
+    LEFT JOIN pressure_config pc ON pc.simulation_id = z.simulation_id
+    LEFT JOIN spill_config sc ON sc.simulation_id = z.simulation_id
+    WHERE e.simulation_id = z.simulation_id
+      AND z.simulation_id = ANY(v_ids)
+      AND ezl.id IS NULL  -- only unlinked events
+    GROUP BY z.id, z.simulation_id
+  ),
+  zone_fortification AS (
+    SELECT
+      za.zone_id,
+      SUM(za.effect_value) AS pressure_reduction,
+      bool_or(za.action_type = 'quarantine') AS is_quarantined
+    FROM zone_actions za
+    WHERE za.deleted_at IS NULL
+      AND za.expires_at > now()
+      AND za.simulation_id = ANY(v_ids)
+    GROUP BY za.zone_id
+  ),
+  zone_rows AS (
+    SELECT
+      z.id AS zone_id,
+      z.simulation_id,
+      z.city_id,
+      z.name AS zone_name,
+      z.zone_type,
+      z.security_level,
+      COALESCE(zi.infrastructure_score, 0.0) AS infrastructure_score,
+      COALESCE(st_sec.game_weight, game_weight_fallback('security_level', z.security_level)) AS security_factor,
+      COALESCE(zep.event_pressure, 0.0) AS event_pressure,
+      COALESCE(aep.ambient_pressure, 0.0) AS ambient_pressure,
+      COALESCE(zf.pressure_reduction, 0.0) AS fortification_reduction,
+      COALESCE(zf.is_quarantined, false) AS is_quarantined,
+      COALESCE(zi.building_count, 0) AS building_count,
+      COALESCE(zi.total_agents, 0) AS total_agents,
+      COALESCE(zi.total_capacity, 0) AS total_capacity,
+      COALESCE(zi.critical_understaffed_count, 0) AS critical_understaffed_count,
+      COALESCE(zi.avg_readiness, 0.0) AS avg_readiness,
+      -- Total pressure = event + ambient - fortification (min 0)
+      GREATEST(0.0,
+        COALESCE(zep.event_pressure, 0.0)
+        + COALESCE(aep.ambient_pressure, 0.0)
+        - COALESCE(zf.pressure_reduction, 0.0)
+      ) AS total_pressure
+    FROM zones z
+    LEFT JOIN zone_infrastructure zi ON zi.zone_id = z.id
+    LEFT JOIN zone_event_pressure zep ON zep.zone_id = z.id
+    LEFT JOIN ambient_event_pressure aep ON aep.zone_id = z.id
+    LEFT JOIN zone_fortification zf ON zf.zone_id = z.id
+    LEFT JOIN simulation_taxonomies st_sec ON
+      st_sec.simulation_id = z.simulation_id
+      AND st_sec.taxonomy_type = 'security_level'
+      AND st_sec.value = z.security_level
+    WHERE z.simulation_id = ANY(v_ids)
+  ),
+  zone_scores AS (
+    SELECT
+      zr.*,
+      LEAST(1.0, GREATEST(0.0,
+        (zr.infrastructure_score * 0.5)
+        + (zr.security_factor * 0.3)
+        - (zr.total_pressure * 0.25)
+      )) AS stability
+    FROM zone_rows zr
+  )
+  SELECT
+    zs.*,
+    CASE
+      WHEN zs.stability < 0.3 THEN 'critical'
+      WHEN zs.stability < 0.5 THEN 'unstable'
+      WHEN zs.stability < 0.7 THEN 'functional'
+      WHEN zs.stability < 0.9 THEN 'stable'
+      ELSE 'exemplary'
+    END
+  FROM zone_scores zs;
+
+  -- ── Embassy effectiveness: building health + ambassador + vector alignment ──
+  DELETE FROM mv_embassy_effectiveness
+  WHERE simulation_a_id = ANY(v_ids) OR simulation_b_id = ANY(v_ids);
+  INSERT INTO mv_embassy_effectiveness
+  WITH scoped_embassies AS (
+    SELECT * FROM embassies
+    WHERE simulation_a_id = ANY(v_ids) OR simulation_b_id = ANY(v_ids)
+  ),
+  embassy_building_health AS (
+    SELECT
+      e.id AS embassy_id,
+      (COALESCE(bra.readiness, game_weight_fallback('building_condition', ba.building_condition))
+       + COALESCE(brb.readiness, game_weight_fallback('building_condition', bb.building_condition))) / 2.0 AS avg_building_health
+    FROM scoped_embassies e
+    JOIN buildings ba ON ba.id = e.building_a_id
+    JOIN buildings bb ON bb.id = e.building_b_id
+    LEFT JOIN mv_building_readiness bra ON bra.building_id = e.building_a_id
+    LEFT JOIN mv_building_readiness brb ON brb.building_id = e.building_b_id
+  ),
+  embassy_ambassador_quality AS (
+    SELECT
+      e.id AS embassy_id,
+      CASE
+        WHEN e.embassy_metadata IS NULL THEN 0.3
+        WHEN e.embassy_metadata->'ambassador_a' IS NULL AND e.embassy_metadata->'ambassador_b' IS NULL THEN 0.3
+        ELSE LEAST(1.0,
+          0.4  -- Base: has any ambassador
+          + LEAST(0.2,
+            (COALESCE(length(e.embassy_metadata->'ambassador_a'->>'name'), 0)
+             + COALESCE(length(e.embassy_metadata->'ambassador_b'->>'name'), 0))::numeric / 50.0
+          )
+          + CASE WHEN e.embassy_metadata->'ambassador_a'->>'quirk' IS NOT NULL THEN 0.1 ELSE 0 END
+          + CASE WHEN e.embassy_metadata->'ambassador_b'->>'quirk' IS NOT NULL THEN 0.1 ELSE 0 END
+          + CASE WHEN e.embassy_metadata->'ambassador_a'->>'role' IS NOT NULL THEN 0.05 ELSE 0 END
+          + CASE WHEN e.embassy_metadata->'ambassador_b'->>'role' IS NOT NULL THEN 0.05 ELSE 0 END
+        )
+      END AS ambassador_quality
+    FROM scoped_embassies e
+  ),
+  embassy_vector_alignment AS (
+    SELECT
+      e.id AS embassy_id,
+      CASE
+        WHEN sc.bleed_vectors IS NOT NULL AND e.bleed_vector = ANY(sc.bleed_vectors) THEN 1.0
+        ELSE 0.0
+      END AS vector_alignment
+    FROM scoped_embassies e
+    LEFT JOIN simulation_connections sc ON (
+      (sc.simulation_a_id = e.simulation_a_id AND sc.simulation_b_id = e.simulation_b_id)
+      OR (sc.simulation_a_id = e.simulation_b_id AND sc.simulation_b_id = e.simulation_a_id)
+    ) AND sc.is_active = true
+  ),
+  embassy_scores AS (
+    SELECT
+      e.id AS embassy_id,
+      e.simulation_a_id,
+      e.simulation_b_id,
+      e.building_a_id,
+      e.building_b_id,
+      e.status,
+      e.bleed_vector,
+      LEAST(1.0, COALESCE(ebh.avg_building_health, 0.5)) AS building_health,
+      LEAST(1.0, COALESCE(eaq.ambassador_quality, 0.3)) AS ambassador_quality,
+      COALESCE(eva.vector_alignment, 0.0) AS vector_alignment,
+      LEAST(1.0, GREATEST(0.0,
+        (LEAST(1.0, COALESCE(ebh.avg_building_health, 0.5)) * 0.4)
+        + (LEAST(1.0, COALESCE(eaq.ambassador_quality, 0.3)) * 0.4)
+        + (COALESCE(eva.vector_alignment, 0.0) * 0.2)
+      )) AS score
+    FROM scoped_embassies e
+    LEFT JOIN embassy_building_health ebh ON ebh.embassy_id = e.id
+    LEFT JOIN embassy_ambassador_quality eaq ON eaq.embassy_id = e.id
+    -- One connection may match in both directions; keep the best alignment
+    LEFT JOIN LATERAL (
+      SELECT MAX(v.vector_alignment) AS vector_alignment
+      FROM embassy_vector_alignment v WHERE v.embassy_id = e.id
+    ) eva ON true
+  )
+  SELECT
+    es.embassy_id,
+    es.simulation_a_id,
+    es.simulation_b_id,
+    es.building_a_id,
+    es.building_b_id,
+    es.status,
+    es.bleed_vector,
+    es.building_health,
+    es.ambassador_quality,
+    es.vector_alignment,
+    CASE WHEN es.status != 'active' THEN 0.0 ELSE es.score END,
+    CASE
+      WHEN es.status != 'active' THEN 'dormant'
+      WHEN es.score < 0.3 THEN 'dormant'
+      WHEN es.score < 0.6 THEN 'limited'
+      WHEN es.score < 0.8 THEN 'operational'
+      ELSE 'optimal'
+    END
+  FROM embassy_scores es;
+
+  -- ── Simulation health: zones + readiness + diplomacy + bleed ──
+  DELETE FROM mv_simulation_health WHERE simulation_id = ANY(v_health_ids);
+  INSERT INTO mv_simulation_health
+  WITH sim_zones AS (
+    SELECT zs.simulation_id, AVG(zs.stability) AS avg_zone_stability, COUNT(*) AS zone_count,
+      COUNT(*) FILTER (WHERE zs.stability_label = 'critical') AS critical_zone_count,
+      COUNT(*) FILTER (WHERE zs.stability_label = 'unstable') AS unstable_zone_count,
+      SUM(zs.total_agents) AS total_agents,
+      SUM(zs.total_capacity) AS total_capacity
+    FROM mv_zone_stability zs
+    WHERE zs.simulation_id = ANY(v_health_ids)
+    GROUP BY zs.simulation_id
+  ),
+  sim_buildings AS (
+    SELECT br.simulation_id, COUNT(*) AS building_count, AVG(br.readiness) AS avg_readiness,
+      COUNT(*) FILTER (WHERE br.staffing_status = 'critically_understaffed') AS critically_understaffed,
+      COUNT(*) FILTER (WHERE br.staffing_status = 'overcrowded') AS overcrowded
+    FROM mv_building_readiness br
+    WHERE br.simulation_id = ANY(v_health_ids)
+    GROUP BY br.simulation_id
+  ),
+  sim_diplomacy AS (
+    SELECT sim_id, SUM(eff) AS diplomatic_reach, COUNT(*) AS active_embassy_count, AVG(eff) AS avg_embassy_effectiveness
+    FROM (
+      SELECT ee.simulation_a_id AS sim_id, ee.effectiveness AS eff FROM mv_embassy_effectiveness ee
+      WHERE ee.status = 'active' AND ee.simulation_a_id = ANY(v_health_ids)
+      UNION ALL
+      SELECT ee.simulation_b_id AS sim_id, ee.effectiveness AS eff FROM mv_embassy_effectiveness ee
+      WHERE ee.status = 'active' AND ee.simulation_b_id = ANY(v_health_ids)
+    ) embassy_per_sim GROUP BY sim_id
+  ),
+  sim_bleed AS (
+    SELECT s.id AS simulation_id,
+      COUNT(DISTINCT eo.id) AS outbound_echoes, COUNT(DISTINCT ei.id) AS inbound_echoes,
+      COALESCE(AVG(eo.echo_strength), 0) AS avg_outbound_strength
+    FROM simulations s
+    LEFT JOIN event_echoes eo ON eo.source_simulation_id = s.id AND eo.created_at >= (now() - interval '30 days')
+    LEFT JOIN event_echoes ei ON ei.target_simulation_id = s.id AND ei.created_at >= (now() - interval '30 days')
+    WHERE s.deleted_at IS NULL AND s.id = ANY(v_health_ids)
+    GROUP BY s.id
+  ),
+  sim_scores AS (
+    SELECT
+      s.id AS simulation_id, s.name AS simulation_name, s.slug,
+      COALESCE(sz.avg_zone_stability, 0.0) AS avg_zone_stability,
+      COALESCE(sz.zone_count, 0) AS zone_count,
+      COALESCE(sz.critical_zone_count, 0) AS critical_zone_count,
+      COALESCE(sz.unstable_zone_count, 0) AS unstable_zone_count,
+      COALESCE(sb.building_count, 0) AS building_count,
+      COALESCE(sb.avg_readiness, 0.0) AS avg_readiness,
+      COALESCE(sb.critically_understaffed, 0) AS critically_understaffed_buildings,
+      COALESCE(sb.overcrowded, 0) AS overcrowded_buildings,
+      COALESCE(sz.total_agents, 0) AS total_agents_assigned,
+      COALESCE(sz.total_capacity, 0) AS total_capacity,
+      COALESCE(sd.diplomatic_reach, 0.0) AS diplomatic_reach,
+      COALESCE(sd.active_embassy_count, 0) AS active_embassy_count,
+      COALESCE(sd.avg_embassy_effectiveness, 0.0) AS avg_embassy_effectiveness,
+      COALESCE(sbl.outbound_echoes, 0) AS outbound_echoes,
+      COALESCE(sbl.inbound_echoes, 0) AS inbound_echoes,
+      COALESCE(sbl.avg_outbound_strength, 0.0) AS avg_outbound_strength,
+      LEAST(1.0, GREATEST(0.0,
+        (1.0 - COALESCE(sz.avg_zone_stability, 0.5) * 0.3) * (0.5 + LEAST(0.5, COALESCE(sd.diplomatic_reach, 0.0) / 5.0))
+      )) AS bleed_permeability,
+      LEAST(1.0, GREATEST(0.0,
+        (COALESCE(sz.avg_zone_stability, 0.0) * 0.6) + (COALESCE(sb.avg_readiness, 0.0) * 0.2)
+        + (LEAST(1.0, COALESCE(sd.diplomatic_reach, 0.0) / 3.0) * 0.2)
+      )) AS overall_health
+    FROM simulations s
+    LEFT JOIN sim_zones sz ON sz.simulation_id = s.id
+    LEFT JOIN sim_buildings sb ON sb.simulation_id = s.id
+    LEFT JOIN sim_diplomacy sd ON sd.sim_id = s.id
+    LEFT JOIN sim_bleed sbl ON sbl.simulation_id = s.id
+    WHERE s.deleted_at IS NULL AND s.status IN ('active', 'configuring')
+      AND s.id = ANY(v_health_ids)
+  )
+  SELECT
+    ss.*,
+    CASE
+      WHEN ss.overall_health < 0.3 THEN 'critical'
+      WHEN ss.overall_health < 0.5 THEN 'struggling'
+      WHEN ss.overall_health < 0.7 THEN 'functional'
+      WHEN ss.overall_health < 0.9 THEN 'thriving'
+      ELSE 'exemplary'
+    END
+  FROM sim_scores ss;
+
+  RETURN v_ids;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path TO 'public';
+
+-- Recompute only simulations whose inputs changed since their last refresh
+-- (optionally only those among p_simulation_ids). Returns the refreshed ids.
+-- Every backend worker drains the set periodically; a drain already running
+-- elsewhere makes this call a no-op instead of rebuilding the same rows.
+CREATE OR REPLACE FUNCTION refresh_dirty_game_metrics(p_simulation_ids UUID[] DEFAULT NULL)
+RETURNS UUID[] AS $$
+BEGIN
+  IF NOT pg_try_advisory_xact_lock(hashtext('refresh_dirty_game_metrics')) THEN
+    RETURN '{}'::UUID[];
+  END IF;
+  RETURN refresh_game_metrics(ARRAY(
+    SELECT simulation_id FROM game_metrics_dirty
+    WHERE p_simulation_ids IS NULL OR simulation_id = ANY(p_simulation_ids)
+  ));
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path TO 'public';
+
+-- Platform-wide rebuild (admin, migrations). Also drops rows of deleted simulations.
+CREATE OR REPLACE FUNCTION refresh_all_game_metrics()
+RETURNS void AS $$
+BEGIN
+  PERFORM refresh_game_metrics(ARRAY(
+    SELECT id FROM simulations
+    UNION SELECT simulation_id FROM mv_simulation_health
+    UNION SELECT simulation_id FROM mv_zone_stability
+    UNION SELECT simulation_id FROM mv_building_readiness
+    UNION SELECT simulation_a_id FROM mv_embassy_effectiveness
+    UNION SELECT simulation_b_id FROM mv_embassy_effectiveness
+  ));
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path TO 'public';
+
+REVOKE ALL ON FUNCTION refresh_game_metrics FROM PUBLIC;
+REVOKE ALL ON FUNCTION refresh_dirty_game_metrics FROM PUBLIC;
+REVOKE ALL ON FUNCTION refresh_all_game_metrics FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_game_metrics TO authenticated, service_role;
+GRANT EXECUTE ON FUNCTION refresh_dirty_game_metrics TO authenticated, service_role;
+GRANT EXECUTE ON FUNCTION refresh_all_game_metrics TO service_role;
+
+
+-- ============================================================================
+-- 4. INITIAL FILL
+-- ============================================================================
+SELECT refresh_all_game_metrics();
@@ -0,0 +1,19 @@
+-- ============================================================================
+-- Migration 089: Content-Addressed Embedding Cache
+-- ============================================================================
+-- Shared tier of EmbeddingService's cache: one row per embedded text, keyed by
+-- content_hash = sha256(model || '\n' || text). Identical memory contents,
+-- retrieval queries and reflections across workers are embedded once.
+--
+-- Written and read by the backend with the service-role client only.
+-- ============================================================================
+
+CREATE TABLE public.embedding_cache (
+  content_hash TEXT PRIMARY KEY,
+  model TEXT NOT NULL,
+  embedding extensions.vector(1536) NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Service-role only (RLS enabled, no policies)
+ALTER TABLE embedding_cache ENABLE ROW LEVEL SECURITY;
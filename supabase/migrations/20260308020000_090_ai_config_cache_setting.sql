@@ -0,0 +1,10 @@
+-- ============================================================================
+-- Migration 090: Seed AI Config Cache TTL
+-- ============================================================================
+-- TTL (seconds) for the backend's in-process cache of resolved prompt
+-- templates, simulation content locale and AI model settings.
+-- ============================================================================
+
+INSERT INTO public.platform_settings (setting_key, setting_value, description) VALUES
+    ('cache_ai_config_ttl', '300', 'In-process TTL (seconds) for resolved prompt templates and simulation AI settings')
+ON CONFLICT (setting_key) DO NOTHING;